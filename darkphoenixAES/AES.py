@@ -15,6 +15,7 @@
 
 from enum import Enum, auto
 from .Exception import InvalidArgument, InvalidState
+import numpy as np
 
 _AesInvSBox = [
 0x52, 0x09, 0x6A, 0xD5, 0x30, 0x36, 0xA5, 0x38, 0xBF, 0x40, 0xA3, 0x9E, 0x81, 0xF3, 0xD7, 0xFB,
@@ -184,26 +185,49 @@ None, [
 ], None
 ]
 
+_AesSBoxBytes = bytes(_AesSBox)
+_AesInvSBoxBytes = bytes(_AesInvSBox)
 _AesShiftRow = [0, 5, 10, 15, 4, 9, 14, 3, 8, 13, 2, 7, 12, 1, 6, 11]
 _AesInvShiftRow = [0, 13, 10, 7, 4, 1, 14, 11, 8, 5, 2, 15, 12, 9, 6, 3]
 _MC = [[2, 3, 1, 1], [1, 2, 3, 1], [1, 1, 2, 3], [3, 1, 1, 2]]
 _invMC = [[14, 11, 13, 9], [9,  14, 11, 13], [13, 9, 14, 11], [11, 13, 9, 14]]
 
 
+# MixColumns uses T-tables: _TMC[k][x] is the contribution of the byte x in the
+# row k to its column (the 4 bytes of the column packed in an integer).
+# _TSubMC also applies the SBox before MixColumns.
+
+def _TTable(matrix, table):
+    T = np.zeros((4, 256), dtype=np.uint32)
+    for k in range(4):
+        for j in range(4):
+            T[k] |= np.array([_AesMult[matrix[j][k]][x] for x in table],
+                             dtype=np.uint32) << np.uint32(8 * j)
+    return T
+
+_TMC = _TTable(_MC, range(256))
+_TInvMC = _TTable(_invMC, range(256))
+_TSubMC = _TTable(_MC, _AesSBox)
+
+# the same tables as lists, faster than numpy for a single state
+_TMCList = _TMC.tolist()
+_TInvMCList = _TInvMC.tolist()
+_TSubMCList = _TSubMC.tolist()
+
+def _mixColumnsOne(T, s):
+    T0, T1, T2, T3 = T
+    return ((T0[s[0]] ^ T1[s[1]] ^ T2[s[2]] ^ T3[s[3]]) |
+            (T0[s[4]] ^ T1[s[5]] ^ T2[s[6]] ^ T3[s[7]]) << 32 |
+            (T0[s[8]] ^ T1[s[9]] ^ T2[s[10]] ^ T3[s[11]]) << 64 |
+            (T0[s[12]] ^ T1[s[13]] ^ T2[s[14]] ^ T3[s[15]]) << 96).to_bytes(16, 'little')
+
 def MC(state):
     """
     Applies AES MixColumns on AES state
     :param state: AES state, as 16-byte list
     :returns: new AES state
     """
-    state2 = [0] * 16
-    for i in range(4):
-        for j in range(4):
-            state2[(4*i)+j] = _AesMult[_MC[j][0]][state[(4*i)+0]]^\
-                              _AesMult[_MC[j][1]][state[(4*i)+1]]^\
-                              _AesMult[_MC[j][2]][state[(4*i)+2]]^\
-                              _AesMult[_MC[j][3]][state[(4*i)+3]]
-    return bytes(state2)
+    return _mixColumnsOne(_TMCList, state)
 
 def InvMC(state):
     """
@@ -211,14 +235,7 @@ def InvMC(state):
     :param state: AES state, as 16-byte list
     :returns: new AES state
     """
-    state2 = [0] * 16
-    for i in range(4):
-        for j in range(4):
-            state2[(4*i)+j] = _AesMult[_invMC[j][0]][state[(4*i)+0]]^\
-                              _AesMult[_invMC[j][1]][state[(4*i)+1]]^\
-                              _AesMult[_invMC[j][2]][state[(4*i)+2]]^\
-                              _AesMult[_invMC[j][3]][state[(4*i)+3]]
-    return bytes(state2)
+    return _mixColumnsOne(_TInvMCList, state)
 
 def InvSBox(state):
     """
@@ -226,7 +243,7 @@ def InvSBox(state):
     :param state: AES state, as 16-byte list
     :returns: new AES state
     """
-    return bytes([_AesInvSBox[x] for x in state])
+    return bytes(state).translate(_AesInvSBoxBytes)
 
 def SBox(state):
     """
@@ -234,7 +251,7 @@ def SBox(state):
     :param state: AES state, as 16-byte list
     :returns: new AES state
     """
-    return bytes([_AesSBox[x] for x in state])
+    return bytes(state).translate(_AesSBoxBytes)
 
 def InvShiftRow(state):
     """
@@ -303,6 +320,107 @@ def revertKey(rkey, roundN):
     return extKey[:keySize*4]
 
 
+#################
+# Batch helpers #
+#################
+
+# The batch functions work on arrays (N, 16) of uint8, one AES state by row.
+
+_npAesSBox = np.array(_AesSBox, dtype=np.uint8)
+_npAesInvSBox = np.array(_AesInvSBox, dtype=np.uint8)
+_npShiftRow = np.array(_AesShiftRow, dtype=np.intp)
+_npInvShiftRow = np.array(_AesInvShiftRow, dtype=np.intp)
+
+def toBatch(state):
+    """
+    Converts AES states to a batch
+    :param state: one or many AES states, as bytes, list of bytes or array
+    :returns: array (N, 16) of uint8
+    """
+    if isinstance(state, np.ndarray):
+        return state.reshape(-1, 16).astype(np.uint8, copy=False)
+    if len(state) > 0 and not isinstance(state[0], int):
+        state = b"".join([bytes(x) for x in state])
+    InvalidArgument.check( len(state) % 16 == 0,
+        f"length of state ({len(state)}) must be a multiple of 16")
+    return np.frombuffer(bytes(state), dtype=np.uint8).reshape(-1, 16)
+
+def _mixColumns(T, states):
+    cols = T[0][states[:, 0::4]] ^ T[1][states[:, 1::4]] ^ T[2][states[:, 2::4]] ^ T[3][states[:, 3::4]]
+    return np.ascontiguousarray(cols, dtype='<u4').view(np.uint8).reshape(-1, 16)
+
+def MCBatch(states):
+    return _mixColumns(_TMC, states)
+
+def InvMCBatch(states):
+    return _mixColumns(_TInvMC, states)
+
+def SBoxBatch(states):
+    return _npAesSBox[states]
+
+def InvSBoxBatch(states):
+    return _npAesInvSBox[states]
+
+def ShiftRowBatch(states):
+    return states[:, _npShiftRow]
+
+def InvShiftRowBatch(states):
+    return states[:, _npInvShiftRow]
+
+def SubShiftMixBatch(states):
+    # MC(ShiftRow(SBox(states)))
+    return _mixColumns(_TSubMC, states[:, _npShiftRow])
+
+def ShiftMixBatch(states):
+    # MC(ShiftRow(states))
+    return _mixColumns(_TMC, states[:, _npShiftRow])
+
+# The AES rounds are written once for both representations of the states,
+# with the primitives of _OneState (a state as bytes) or _BatchState.
+
+class _OneState:
+    SBox = staticmethod(SBox)
+    InvSBox = staticmethod(InvSBox)
+    ShiftRow = staticmethod(ShiftRow)
+    InvShiftRow = staticmethod(InvShiftRow)
+    MC = staticmethod(MC)
+    InvMC = staticmethod(InvMC)
+
+    @staticmethod
+    def SubShiftMix(state):
+        return _mixColumnsOne(_TSubMCList, ShiftRow(state))
+
+    @staticmethod
+    def ShiftMix(state):
+        return _mixColumnsOne(_TMCList, ShiftRow(state))
+
+    @staticmethod
+    def xor(state, key):
+        return (int.from_bytes(state, 'little') ^ int.from_bytes(key, 'little')).to_bytes(16, 'little')
+
+    @staticmethod
+    def keys(aes):
+        return aes.expandedKey
+
+class _BatchState:
+    SBox = staticmethod(SBoxBatch)
+    InvSBox = staticmethod(InvSBoxBatch)
+    ShiftRow = staticmethod(ShiftRowBatch)
+    InvShiftRow = staticmethod(InvShiftRowBatch)
+    MC = staticmethod(MCBatch)
+    InvMC = staticmethod(InvMCBatch)
+    SubShiftMix = staticmethod(SubShiftMixBatch)
+    ShiftMix = staticmethod(ShiftMixBatch)
+
+    @staticmethod
+    def xor(state, key):
+        return state ^ key
+
+    @staticmethod
+    def keys(aes):
+        return aes.expandedKeyBatch
+
+
 class RoundType(Enum):
     RoundEncType0 = auto()
     RoundEncType1 = auto()
@@ -329,152 +447,166 @@ class AES:
     def setKey(self, key):
         self.key = key
         self.expandedKey = expandKey(key, self.roundNumber)
+        self.expandedKeyBatch = np.array([list(k) for k in self.expandedKey], dtype=np.uint8)
 
     def encrypt_round(self, state, roundN):
+        return self._encrypt_round(state, roundN, _OneState)
+
+    def encrypt_round_batch(self, state, roundN):
+        return self._encrypt_round(state, roundN, _BatchState)
+
+    def encrypt(self, state):
+        InvalidArgument.check( len(state) == 16,
+            f"length of state ({len(state)}) must be equal to 16")
+        InvalidState.check( len(self.expandedKey) == self.roundNumber + 1,
+            f"expandedKey doesn't match the expected number of round keys")
+
+        for i in range(self.roundNumber):
+            state = self.encrypt_round(state, i)
+        return state
+
+    def encryptBatch(self, state):
+        # [param] state  array (N, 16) of uint8
+        InvalidState.check( len(self.expandedKey) == self.roundNumber + 1,
+            f"expandedKey doesn't match the expected number of round keys")
+
+        for i in range(self.roundNumber):
+            state = self.encrypt_round_batch(state, i)
+        return state
+
+    def decrypt_round(self, state, roundN):
+        return self._decrypt_round(state, roundN, _OneState)
+
+    def decrypt_round_batch(self, state, roundN):
+        return self._decrypt_round(state, roundN, _BatchState)
+
+    def decrypt(self, state):
+        InvalidArgument.check( len(state) == 16,
+            f"length of state ({len(state)}) must be equal to 16")
+        InvalidState.check( len(self.expandedKey) == self.roundNumber + 1,
+            f"expandedKey doesn't match the expected number of round keys")
+
+        for i in reversed(list(range(self.roundNumber))):
+            state = self.decrypt_round(state, i)
+        return state
+
+    def decryptBatch(self, state):
+        # [param] state  array (N, 16) of uint8
+        InvalidState.check( len(self.expandedKey) == self.roundNumber + 1,
+            f"expandedKey doesn't match the expected number of round keys")
+
+        for i in reversed(list(range(self.roundNumber))):
+            state = self.decrypt_round_batch(state, i)
+        return state
+
+    def _encrypt_round(self, state, roundN, op):
         InvalidArgument.check( 0 <= roundN and roundN < self.roundNumber,
             f"roundN ({roundN}) must be between 0 and {self.roundNumber}")
+        key = op.keys(self)
 
         if self.roundType == RoundType.RoundEncType0:
             if roundN == self.roundNumber - 1:
-                state = xor(state, self.expandedKey[roundN])
-                state = SBox(state)
-                state = ShiftRow(state)
+                state = op.xor(state, key[roundN])
+                state = op.ShiftRow(op.SBox(state))
                 if self.addExtraMC:
-                    state = MC(state)
-                state = xor(state, self.expandedKey[self.roundNumber])
+                    state = op.MC(state)
+                state = op.xor(state, key[self.roundNumber])
             else:
-                state = xor(state, self.expandedKey[roundN])
-                state = SBox(state)
-                state = ShiftRow(state)
-                state = MC(state)
+                state = op.xor(state, key[roundN])
+                state = op.SubShiftMix(state)
         elif self.roundType == RoundType.RoundEncType1:
             if roundN == self.roundNumber - 1:
-                state = SBox(state)
-                state = ShiftRow(state)
+                state = op.ShiftRow(op.SBox(state))
                 if self.addExtraMC:
-                    state = MC(state)
-                state = xor(state, self.expandedKey[self.roundNumber])
+                    state = op.MC(state)
+                state = op.xor(state, key[self.roundNumber])
             else:
                 if roundN == 0:
-                    state = xor(state, self.expandedKey[0])
-                state = SBox(state)
-                state = ShiftRow(state)
-                state = MC(state)
-                state = xor(state, self.expandedKey[roundN+1])
+                    state = op.xor(state, key[0])
+                state = op.SubShiftMix(state)
+                state = op.xor(state, key[roundN+1])
         elif self.roundType == RoundType.RoundEncType2:
             if roundN == self.roundNumber - 1:
-                state = ShiftRow(state)
+                state = op.ShiftRow(state)
                 if self.addExtraMC:
-                    state = MC(state)
-                state = xor(state, self.expandedKey[self.roundNumber])
+                    state = op.MC(state)
+                state = op.xor(state, key[self.roundNumber])
             else:
                 if roundN == 0:
-                    state = xor(state, self.expandedKey[0])
-                    state = SBox(state)
-                state = ShiftRow(state)
-                state = MC(state)
-                state = xor(state, self.expandedKey[roundN+1])
-                state = SBox(state)
+                    state = op.SBox(op.xor(state, key[0]))
+                state = op.ShiftMix(state)
+                state = op.SBox(op.xor(state, key[roundN+1]))
         elif self.roundType == RoundType.RoundDecType0:
             if roundN == self.roundNumber - 1:
-                state = MC(state)
-                state = xor(state, self.expandedKey[roundN])
-                state = SBox(state)
-                state = ShiftRow(state)
+                state = op.MC(state)
+                state = op.xor(state, key[roundN])
+                state = op.ShiftRow(op.SBox(state))
                 if self.addExtraMC:
-                    state = MC(state)
-                state = xor(state, self.expandedKey[self.roundNumber])
+                    state = op.MC(state)
+                state = op.xor(state, key[self.roundNumber])
             else:
                 if roundN != 0:
-                    state = MC(state)
-                state = xor(state, self.expandedKey[roundN])
-                state = SBox(state)
-                state = ShiftRow(state)
+                    state = op.MC(state)
+                state = op.xor(state, key[roundN])
+                state = op.ShiftRow(op.SBox(state))
         else:
             raise InvalidArgument("Invalid roundType")
         return state
 
-    def encrypt(self, state):
-        InvalidArgument.check( len(state) == 16,
-            f"length of state ({len(state)}) must be equal to 16")
-        InvalidState.check( len(self.expandedKey) == self.roundNumber + 1,
-            f"expandedKey doesn't match the expected number of round keys")
-
-        for i in range(self.roundNumber):
-            state = self.encrypt_round(state, i)
-        return state
-
-    def decrypt_round(self, state, roundN):
+    def _decrypt_round(self, state, roundN, op):
         InvalidArgument.check( 0 <= roundN and roundN < self.roundNumber,
             f"roundN ({roundN}) must be between 0 and {self.roundNumber}")
+        key = op.keys(self)
 
         if self.roundType == RoundType.RoundEncType0:
             if roundN == self.roundNumber - 1:
-                state = xor(state, self.expandedKey[self.roundNumber])
+                state = op.xor(state, key[self.roundNumber])
                 if self.addExtraMC:
-                    state = InvMC(state)
-                state = InvShiftRow(state)
-                state = InvSBox(state)
-                state = xor(state, self.expandedKey[roundN])
+                    state = op.InvMC(state)
+                state = op.InvSBox(op.InvShiftRow(state))
+                state = op.xor(state, key[roundN])
             else:
-                state = InvMC(state)
-                state = InvShiftRow(state)
-                state = InvSBox(state)
-                state = xor(state, self.expandedKey[roundN])
+                state = op.InvMC(state)
+                state = op.InvSBox(op.InvShiftRow(state))
+                state = op.xor(state, key[roundN])
         elif self.roundType == RoundType.RoundEncType1:
             if roundN == self.roundNumber - 1:
-                state = xor(state, self.expandedKey[self.roundNumber])
+                state = op.xor(state, key[self.roundNumber])
                 if self.addExtraMC:
-                    state = InvMC(state)
-                state = InvShiftRow(state)
-                state = InvSBox(state)
+                    state = op.InvMC(state)
+                state = op.InvSBox(op.InvShiftRow(state))
             else:
-                state = xor(state, self.expandedKey[roundN+1])
-                state = InvMC(state)
-                state = InvShiftRow(state)
-                state = InvSBox(state)
+                state = op.xor(state, key[roundN+1])
+                state = op.InvMC(state)
+                state = op.InvSBox(op.InvShiftRow(state))
                 if roundN == 0:
-                    state = xor(state, self.expandedKey[0])
+                    state = op.xor(state, key[0])
         elif self.roundType == RoundType.RoundEncType2:
             if roundN == self.roundNumber - 1:
-                state = xor(state, self.expandedKey[self.roundNumber])
+                state = op.xor(state, key[self.roundNumber])
                 if self.addExtraMC:
-                    state = InvMC(state)
-                state = InvShiftRow(state)
+                    state = op.InvMC(state)
+                state = op.InvShiftRow(state)
             else:
-                state = InvSBox(state)
-                state = xor(state, self.expandedKey[roundN+1])
-                state = InvMC(state)
-                state = InvShiftRow(state)
+                state = op.InvSBox(state)
+                state = op.xor(state, key[roundN+1])
+                state = op.InvShiftRow(op.InvMC(state))
                 if roundN == 0:
-                    state = InvSBox(state)
-                    state = xor(state, self.expandedKey[0])
+                    state = op.InvSBox(state)
+                    state = op.xor(state, key[0])
         elif self.roundType == RoundType.RoundDecType0:
             if roundN == self.roundNumber - 1:
-                state = xor(state, self.expandedKey[self.roundNumber])
+                state = op.xor(state, key[self.roundNumber])
                 if self.addExtraMC:
-                    state = InvMC(state)
-                state = InvShiftRow(state)
-                state = InvSBox(state)
-                state = xor(state, self.expandedKey[roundN])
-                state = InvMC(state)
+                    state = op.InvMC(state)
+                state = op.InvSBox(op.InvShiftRow(state))
+                state = op.xor(state, key[roundN])
+                state = op.InvMC(state)
             else:
-                state = InvShiftRow(state)
-                state = InvSBox(state)
-                state = xor(state, self.expandedKey[roundN])
+                state = op.InvSBox(op.InvShiftRow(state))
+                state = op.xor(state, key[roundN])
                 if roundN != 0:
-                    state = InvMC(state)
+                    state = op.InvMC(state)
         else:
             raise InvalidArgument("Invalid roundType")
         return state
-
-    def decrypt(self, state):
-        InvalidArgument.check( len(state) == 16,
-            f"length of state ({len(state)}) must be equal to 16")
-        InvalidState.check( len(self.expandedKey) == self.roundNumber + 1,
-            f"expandedKey doesn't match the expected number of round keys")
-
-        for i in reversed(list(range(self.roundNumber))):
-            state = self.decrypt_round(state, i)
-        return state
-
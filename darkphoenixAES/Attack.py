@@ -17,19 +17,21 @@ from .WhiteBoxedAESProxy import WhiteBoxedAESProxy
 from .Encoding import Encoding
 from .AES import revertKey
 from .Exception import InvalidArgument, UnexpectedFailure, InvalidState, DarkPhoenixException
+from .Checkpoint import writeCheckpoint, readCheckpoint, isCheckpoint, atomicWrite
+from .Journal import Journal
+import numpy as np
 import os
 import json
-from . import Step1
-from . import Step2
-from . import Step3
-from . import Step4
-from . import Step5
-from . import ExtractEncoding
+
+# The Step modules (and tqdm, multiprocessing, ...) are imported when a step is
+# used, to keep the import of the package cheap for the worker processes and
+# the short CLI invocations.
 
 class Attack:
 
     # wbAES is an implementation of WhiteBoxedAES for the whitebox to attack
-    def __init__(self, wbAES, nprocess=None, noprogress=None, sageSubProc=True, step1DoubleValue=False):
+    def __init__(self, wbAES, nprocess=None, noprogress=None, sageSubProc=True, step1DoubleValue=False,
+                 prefetch=False):
 
         self.wb = WhiteBoxedAESProxy(wbAES, noprogress)
         self.wb.selfTest()
@@ -42,6 +44,9 @@ class Attack:
         self.noprogress = noprogress
         self.sageSubProc = sageSubProc
         self.step1DoubleValue = step1DoubleValue
+        # collect the faulted outputs of the steps 3 to 5 during the steps 1
+        # and 2, see Prefetch.py
+        self.prefetch = prefetch
 
         # step1 value
         self.mref = self.wb.getRandomInput()
@@ -55,6 +60,9 @@ class Attack:
         self.betaCol = []
         self.keyPart = []
 
+        # progress inside the current step, see Journal.py
+        self.journal = Journal()
+
     @staticmethod
     def detectCPU():
         try:
@@ -67,10 +75,35 @@ class Attack:
         else:
             return 0
 
+    # save writes a binary checkpoint (see Checkpoint.py), export writes the
+    # same state in JSON. restore accepts both formats.
     def save(self, filename):
         if filename is None:
             return
 
+        # only the values computed by the done steps are saved
+        arrays = {
+            "State": np.array(self.state, dtype=np.int64),
+            "Mref": np.frombuffer(self.mref, dtype=np.uint8),
+        }
+        if len(self.r_s) != 0:
+            # r_s is a list of [r] or [r, s], -1 for a missing s
+            arrays["r_s"] = np.array([list(v) + [-1] * (2 - len(v)) for v in self.r_s], dtype=np.int8)
+        if len(self.M) != 0:
+            arrays["M"] = np.frombuffer(b"".join([x for mi in self.M for x in mi]),
+                                        dtype=np.uint8).reshape(len(self.M), -1, 16)
+        for name in ["gtilde_inv", "Gbar_inv"]:
+            encoding = getattr(self, name)
+            if encoding.length != 0:
+                arrays[name] = encoding.table
+                arrays[name + "_inverse"] = encoding.inverse
+        for name in ["roundShift", "C", "lambdaCol", "betaCol", "keyPart"]:
+            if len(getattr(self, name)) != 0:
+                arrays[name] = np.array(getattr(self, name), dtype=np.uint8)
+
+        writeCheckpoint(filename, arrays)
+
+    def export(self, filename):
         data = {
             "State": self.state,
             "Mref": self.mref.hex(),
@@ -85,14 +118,36 @@ class Attack:
             "keyPart": self.keyPart,
         }
 
-        with open(filename, 'w') as f:
-            f.write(json.dumps(data, indent=2))
+        atomicWrite(filename, json.dumps(data, indent=2).encode())
 
     def restore(self, filename):
 
         if not os.path.isfile(filename):
             raise FileNotFoundError(f"File not found : {filename}")
 
+        if isCheckpoint(filename):
+            self._restoreCheckpoint(filename)
+        else:
+            self._restoreJSON(filename)
+
+    def _restoreCheckpoint(self, filename):
+        arrays = readCheckpoint(filename)
+        self.state = int(arrays["State"])
+        self.mref = arrays["Mref"].tobytes()
+        if "r_s" in arrays:
+            self.r_s = [[v for v in row if v >= 0] for row in arrays["r_s"].tolist()]
+        if "M" in arrays:
+            self.M = [[x.tobytes() for x in mi] for mi in arrays["M"]]
+        # the encodings use the arrays of the checkpoint without copy
+        if "gtilde_inv" in arrays:
+            self.gtilde_inv = Encoding.fromArray(arrays["gtilde_inv"], arrays["gtilde_inv_inverse"])
+        if "Gbar_inv" in arrays:
+            self.Gbar_inv = Encoding.fromArray(arrays["Gbar_inv"], arrays["Gbar_inv_inverse"])
+        for name in ["roundShift", "C", "lambdaCol", "betaCol", "keyPart"]:
+            if name in arrays:
+                setattr(self, name, arrays[name].tolist())
+
+    def _restoreJSON(self, filename):
         with open(filename, 'r') as f:
             data = json.loads(f.read())
         self.state = data["State"]
@@ -130,31 +185,67 @@ class Attack:
                     currentRun += 1
                     print(f"{e.__class__.__name__}: {e}: retry... ")
                     self.wb.handleException(e)
+                    # the progress of the failed step may rely on a wrong
+                    # fault position
+                    self.journal.compact(self.journalBase())
         else:
             self.run(backupFile)
 
     def run(self, backupFile=None):
-        if backupFile is not None and os.path.isfile(backupFile):
-            self.restore(backupFile)
-
-        self.step1(backupFile)
-        self.step2(backupFile)
+        if backupFile is not None:
+            if os.path.isfile(backupFile):
+                self.restore(backupFile)
+            else:
+                # the journal is only valid with the mref of the checkpoint
+                self.save(backupFile)
+            self.journal = Journal(backupFile + ".journal")
+            self.journal.replay(self.journalBase())
+
+        if self.state < 3:
+            # Sage is needed by the step 3, start it while the step 1 and 2
+            # are computed
+            from . import Step3
+            Step3.prewarm(self.sageSubProc)
+
+        prefetch = None
+        if self.prefetch and self.state < 2:
+            from .Prefetch import FaultPrefetch
+            prefetch = FaultPrefetch(self.wb, self.mref, self.state, self.nprocess)
+            prefetch.start()
+        try:
+            self.step1(backupFile)
+            self.step2(backupFile)
+        except BaseException:
+            if prefetch is not None:
+                prefetch.terminate()
+            raise
+        if prefetch is not None:
+            prefetch.stop()
         self.step3(backupFile)
         self.step4(backupFile)
         self.step5(backupFile)
 
+    def journalBase(self):
+        # the checkpoint extended by the journal
+        return {"State": self.state, "Mref": self.mref.hex()}
+
+    def compact(self, backupFile=None):
+        # save the result of the step, the journal restarts empty
+        self.save(backupFile)
+        self.journal.compact(self.journalBase())
+
     def step1(self, backupFile=None):
         if self.state == 0:
             self._step1()
             self.state = 1
-            self.save(backupFile)
+            self.compact(backupFile)
 
     def step2(self, backupFile=None):
         if self.state == 1:
             self.verifyStep1()
             self._step2()
             self.state = 2
-            self.save(backupFile)
+            self.compact(backupFile)
         elif self.state < 1:
             raise InvalidState("Cannot perform step2 before step1")
 
@@ -162,7 +253,7 @@ class Attack:
         if self.state == 2:
             self._step3()
             self.state = 3
-            self.save(backupFile)
+            self.compact(backupFile)
         elif self.state < 2:
             raise InvalidState("Cannot perform step3 before step2")
 
@@ -170,7 +261,7 @@ class Attack:
         if self.state == 3:
             self._step4()
             self.state = 4
-            self.save(backupFile)
+            self.compact(backupFile)
         elif self.state < 3:
             raise InvalidState("Cannot perform step4 before step3")
 
@@ -178,7 +269,7 @@ class Attack:
         if self.state == 4:
             self._step5()
             self.state = 5
-            self.save(backupFile)
+            self.compact(backupFile)
         elif self.state < 4:
             raise InvalidState("Cannot perform step5 before step4")
 
@@ -219,6 +310,7 @@ class Attack:
         return key
 
     def externalEncoding(self, keyLen=None, forceOffset=None):
+        from . import ExtractEncoding
         key = self.getKey(keyLen, forceOffset)
         return ExtractEncoding.getExternalEncoding(
                 self.wb, self.gtilde_inv, self.Gbar_inv, self.C,
@@ -244,28 +336,35 @@ class Attack:
                 InvalidState.check( i != r and i != s and r != s, "Invalid Step1 state")
                 InvalidState.check( r // 4 == i // 4, "Invalid Step1 state")
                 InvalidState.check( s // 4 == i // 4, "Invalid Step1 state")
+        from . import Step1
         Step1.verify(self.wb, self.mref, self.M, self.r_s, self.noprogress)
 
     def _step1(self):
+        from . import Step1
         self.M, self.r_s = Step1.compute(self.wb, self.mref, self.nprocess,
-                self.noprogress, self.step1DoubleValue)
+                self.noprogress, self.step1DoubleValue, self.journal)
 
     def _step2(self):
+        from . import Step2
         self.gtilde_inv = Step2.compute(self.wb, self.M, self.r_s, self.nprocess,
-                self.noprogress)
+                self.noprogress, self.journal)
 
     def _step3(self):
+        from . import Step3
         self.Gbar_inv, self.roundShift, self.C = Step3.compute(
-                self.wb, self.gtilde_inv, self.mref,
-                self.noprogress, self.sageSubProc)
+                self.wb, self.gtilde_inv, self.mref, self.nprocess,
+                self.noprogress, self.sageSubProc, self.journal)
 
     def _step4(self):
+        from . import Step4
         self.lambdaCol, self.betaCol = Step4.compute(
                 self.wb, self.gtilde_inv, self.Gbar_inv, self.C, self.mref,
-                self.noprogress)
+                self.nprocess, self.noprogress, self.journal)
 
     def _step5(self):
+        from . import Step5
         self.keyPart = Step5.compute(
                 self.wb, self.gtilde_inv, self.Gbar_inv, self.C,
-                self.lambdaCol, self.betaCol, self.mref, self.noprogress)
+                self.lambdaCol, self.betaCol, self.mref, self.nprocess,
+                self.noprogress, journal=self.journal)
 
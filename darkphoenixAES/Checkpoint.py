@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+from .Exception import InvalidState
+import numpy as np
+import os
+import struct
+import zlib
+
+# Binary checkpoint of the state of the attack.
+#
+# header: magic (8 bytes), version (uint32), crc32 of the payload (uint32),
+#         length of the payload (uint64)
+# payload: a sequence of named arrays, each one is
+#     name length (uint8), name, dtype length (uint8), dtype (numpy str),
+#     ndim (uint8), shape (ndim * uint64), padding to 8 bytes, raw data
+#
+# All integers are little endian. The arrays returned by readCheckpoint are
+# read-only views on the content of the file (no copy and no parsing).
+
+CHECKPOINT_MAGIC = b"DPHXCKPT"
+CHECKPOINT_VERSION = 1
+
+_HEADER = struct.Struct("<8sIIQ")
+_ALIGN = 8
+
+def isCheckpoint(filename):
+    with open(filename, 'rb') as f:
+        return f.read(len(CHECKPOINT_MAGIC)) == CHECKPOINT_MAGIC
+
+def atomicWrite(filename, data):
+    # write in a temporary file of the same directory, then replace the
+    # previous file: a crash leaves either the old or the new file
+    tmpName = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(tmpName, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmpName, filename)
+    except BaseException:
+        if os.path.exists(tmpName):
+            os.unlink(tmpName)
+        raise
+
+def _pad(size):
+    return (-size) % _ALIGN
+
+def encodeCheckpoint(arrays):
+    # arrays: dict name -> numpy array
+    payload = bytearray()
+    for name, array in arrays.items():
+        array = np.asarray(array)
+        dtype = array.dtype.str.encode()
+        name = name.encode()
+        payload += struct.pack("<B", len(name)) + name
+        payload += struct.pack("<B", len(dtype)) + dtype
+        payload += struct.pack(f"<B{array.ndim}Q", array.ndim, *array.shape)
+        payload += bytes(_pad(len(payload)))
+        payload += array.tobytes()
+    header = _HEADER.pack(CHECKPOINT_MAGIC, CHECKPOINT_VERSION, zlib.crc32(payload), len(payload))
+    return header + payload
+
+def decodeCheckpoint(data):
+    InvalidState.check( len(data) >= _HEADER.size, "Truncated checkpoint")
+    magic, version, crc, size = _HEADER.unpack_from(data)
+    InvalidState.check( magic == CHECKPOINT_MAGIC, "Not a checkpoint file")
+    InvalidState.check( version <= CHECKPOINT_VERSION,
+        f"Unsupported checkpoint version {version} (expect {CHECKPOINT_VERSION} or lower)")
+
+    payload = memoryview(data)[_HEADER.size:]
+    InvalidState.check( len(payload) == size, "Truncated checkpoint")
+    InvalidState.check( zlib.crc32(payload) == crc, "Invalid checksum of the checkpoint")
+
+    arrays = {}
+    offset = 0
+    while offset < size:
+        nameLen, = struct.unpack_from("<B", payload, offset)
+        name = bytes(payload[offset + 1:offset + 1 + nameLen]).decode()
+        offset += 1 + nameLen
+        dtypeLen, = struct.unpack_from("<B", payload, offset)
+        dtype = np.dtype(bytes(payload[offset + 1:offset + 1 + dtypeLen]).decode())
+        offset += 1 + dtypeLen
+        ndim, = struct.unpack_from("<B", payload, offset)
+        shape = struct.unpack_from(f"<{ndim}Q", payload, offset + 1)
+        offset += 1 + 8 * ndim
+        offset += _pad(offset)
+
+        count = int(np.prod(shape))
+        InvalidState.check( offset + count * dtype.itemsize <= size, "Truncated checkpoint")
+        arrays[name] = np.frombuffer(payload, dtype=dtype, count=count, offset=offset).reshape(shape)
+        offset += count * dtype.itemsize
+    return arrays
+
+def writeCheckpoint(filename, arrays):
+    atomicWrite(filename, encodeCheckpoint(arrays))
+
+def readCheckpoint(filename):
+    with open(filename, 'rb') as f:
+        return decodeCheckpoint(f.read())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+
+from .Exception import UnexpectedFailure
+from .MeetITM import chooseMidalpha
+
+__all__ = ["ColumnSolver", "FailureRate"]
+
+# Step 4 and Step 5 extract the (lambda, beta) of each column with MeetITM.
+# The columns are independent (once lambda of the column 0 is known in Step 4).
+#
+# The number of faults is adaptive: MeetITM is first solved with a few fault
+# values (depending on the size of the (lambda, beta) space). If several
+# candidates remain, they are narrowed with additional fault values on the same
+# input. If no candidate remains, or if the additional fault values don't
+# remove the ambiguity, the faults of another input are solved and the
+# candidates of both inputs are intersected. At most `retry` inputs are used.
+#
+# The collection of the faults uses the whitebox while the resolution only uses
+# the CPU. When the resolver runs in other processes, both are overlapped:
+# while some columns are solved, the whitebox is used to collect the faults
+# that may be needed next:
+# - the faults of the next columns (nextCols),
+# - the faults of the next retry input of the columns being solved.
+# The faults collected for a retry are discarded if the column is solved
+# without them.
+#
+# When the first input of a column often fails, the retries are speculative:
+# the faults of k inputs are solved at the same time by the resolver workers
+# and the first input that gives a single candidate is kept. k is chosen from
+# the failure rate observed on the previous inputs (see FailureRate). Once the
+# column is solved, the other inputs are cancelled in the resolver.
+
+# fault values in addition to midalpha for the first resolution of an input
+INITIAL_EXTRA_FAULT = 3
+# fault values added on an input to narrow an ambiguity
+NARROW_STEP = 4
+MAX_FAULT_VALUE = 255
+# maximum number of inputs of a column solved at the same time
+MAX_SPECULATION = 4
+# speculate until the probability that all the inputs fail is lower than this
+SPECULATION_TARGET = 0.1
+
+class FailureRate:
+    # Count the inputs that didn't give a single candidate. May be shared by
+    # several ColumnSolver (Step5 uses one ColumnSolver per round).
+
+    def __init__(self):
+        self.attempts = 0
+        self.failures = 0
+
+    def record(self, success):
+        self.attempts += 1
+        if not success:
+            self.failures += 1
+
+    def speculation(self):
+        # number of inputs to solve at the same time
+        if self.failures == 0:
+            return 1
+        # one virtual success, a single failure shouldn't be taken as the rule
+        rate = self.failures / (self.attempts + 1)
+        k = 1
+        while rate ** k > SPECULATION_TARGET and k < MAX_SPECULATION:
+            k += 1
+        return k
+
+class ColumnSolver:
+
+    def __init__(self, resolver, collect, encrypt, retry, failureRate=None, onSolved=None):
+        # [param] resolver     a MeetITMPool
+        # [param] collect      a method collect(col, r, alpha, prev) that returns
+        #                      the faults of the column col for the r-th input
+        #                      with the fault values 1 to alpha. prev is None or
+        #                      the result of a previous call on the same (col, r).
+        # [param] failureRate  a FailureRate shared with other ColumnSolver
+        # [param] onSolved     a method onSolved(col, lambdaCol, betaCol) called
+        #                      as soon as a column is solved
+        self.resolver = resolver
+        self.collect = collect
+        self.encrypt = encrypt
+        self.retry = retry
+        self.failureRate = FailureRate() if failureRate is None else failureRate
+        self.onSolved = onSolved
+
+        # (col, r) -> collected faults not used yet
+        self.faults = {}
+
+    def getFaults(self, col, r, alpha):
+        prev = self.faults.get((col, r))
+        if prev is None or len(prev[1]) < alpha + 1:
+            self.faults[(col, r)] = self.collect(col, r, alpha, prev)
+        return self.faults[(col, r)][1]
+
+    def submit(self, col, r, alpha, midalpha, limitedLambda):
+        fault = self.getFaults(col, r, alpha)
+        return self.resolver.submit(col, fault[:alpha+1], midalpha, self.encrypt, limitedLambda)
+
+    def discard(self, col):
+        for key in [key for key in self.faults if key[0] == col]:
+            self.faults.pop(key)
+
+    def speculation(self):
+        if not self.resolver.isAsync():
+            return 1
+        return self.failureRate.speculation()
+
+    def nextPrefetch(self, pending, nextInput, nextCols):
+        # the collection the most likely to be needed next
+        for col in nextCols:
+            if (col, 0) not in self.faults:
+                return (col, 0)
+        for col in sorted(pending):
+            r = nextInput[col]
+            if r < self.retry and (col, r) not in self.faults:
+                return (col, r)
+        return None
+
+    def narrow(self, col, r, fpos, candidates):
+        # add fault values on the input r until a single candidate remains
+        alpha = len(self.faults[(col, r)][1]) - 1
+        while len(candidates) > 1 and alpha < MAX_FAULT_VALUE:
+            alpha = min(alpha + NARROW_STEP, MAX_FAULT_VALUE)
+            narrowed = self.resolver.narrow(candidates, self.getFaults(col, r, alpha),
+                                            self.encrypt, fpos)
+            if len(narrowed) == len(candidates):
+                # the ambiguity doesn't depend on the fault value
+                break
+            candidates = narrowed
+        return candidates
+
+    def narrowAll(self, col, r, job):
+        # like MeetITM.__call__, the fpos are tried in order until one gives a
+        # single candidate. Otherwise, the candidates of the first fpos that
+        # aren't removed by the narrowing are kept.
+        res = []
+        for fpos, candidates in job.candidates():
+            candidates = self.narrow(col, r, fpos, candidates)
+            if len(candidates) == 1:
+                return candidates
+            if len(res) == 0:
+                res = candidates
+        return res
+
+    def solve(self, cols, limitedLambda, errorMessage, nextCols=()):
+        # return  a dict {col: (lambdaCol, betaCol)}
+
+        midalpha = chooseMidalpha(limitedLambda)
+        alpha = midalpha + INITIAL_EXTRA_FAULT
+
+        # col -> {r: MeetITMResult}
+        pending = {col: {} for col in cols}
+        # col -> next input to solve
+        nextInput = {col: 0 for col in cols}
+
+        def fill(col):
+            # keep k inputs of the column in the resolver
+            k = self.speculation()
+            while len(pending[col]) < k and nextInput[col] < self.retry:
+                r = nextInput[col]
+                pending[col][r] = self.submit(col, r, alpha, midalpha, limitedLambda)
+                nextInput[col] += 1
+            UnexpectedFailure.check(len(pending[col]) != 0,
+                errorMessage.format(col=col, retry=self.retry))
+
+        for col in cols:
+            fill(col)
+
+        # col -> candidates of the previous inputs
+        known = {}
+
+        result = {}
+        while len(pending) > 0:
+            found = False
+            for col in list(pending):
+                for r, job in sorted(pending[col].items()):
+                    if job.ready():
+                        break
+                else:
+                    continue
+                found = True
+                pending[col].pop(r)
+                candidates = self.narrowAll(col, r, job)
+                self.failureRate.record(len(candidates) == 1)
+                if col in known:
+                    common = [c for c in candidates if c in known[col]]
+                    # an empty intersection means that one of the inputs has
+                    # been wrongly solved, keep the last one
+                    if len(common) != 0:
+                        candidates = common
+
+                if len(candidates) == 1:
+                    # the speculative inputs still in the resolver are cancelled
+                    for other in pending.pop(col).values():
+                        other.cancel()
+                    self.discard(col)
+                    lambdaCol, betaCol = candidates[0]
+                    result[col] = (list(lambdaCol), list(betaCol))
+                    if self.onSolved is not None:
+                        self.onSolved(col, *result[col])
+                else:
+                    if len(candidates) != 0:
+                        known[col] = candidates
+                    self.faults.pop((col, r), None)
+                    fill(col)
+            if found:
+                continue
+
+            # the resolver is busy, use the whitebox meanwhile
+            prefetch = self.nextPrefetch(pending, nextInput, nextCols)
+            if prefetch is not None:
+                self.getFaults(*prefetch, alpha)
+            else:
+                next(job for jobs in pending.values() for job in jobs.values()).wait(0.01)
+
+        return result
@@ -15,63 +15,117 @@
 
 from enum import Enum, auto
 from .Exception import InvalidArgument
-from .MultTable import MultTable
+from .GF256 import npMultTable, mul, inv
+import numpy as np
 import random
 
+# The encodings are stored as numpy tables: an array (256,) for Encoding8 and
+# an array (length, 256) for Encoding, with their inverse. encode and decode
+# accept bytes (any multiple of the length) and encodeBatch/decodeBatch work on
+# arrays (N, length) of uint8.
+#
+# An affine encoding (x -> alpha * x ^ beta) is kept as (alpha, beta): the
+# composition and the inverse of affine encodings are computed on the
+# parameters, the tables are only built when a lookup is needed or when the
+# encoding is combined with a non-affine encoding.
+
+_npIdentity = np.arange(256, dtype=np.uint8)
+
 def isPermutation(perm):
     InvalidArgument.check( len(perm) == 256,
         f"length of perm ({len(perm)}) must be equal to 256")
-    s = set()
-    for val in perm:
-        if val in s or val < 0 or val > 255:
-            return False
-        else:
-            s.add(val)
-    return True
+    perm = np.asarray(perm)
+    if np.any(perm < 0) or np.any(perm > 255):
+        return False
+    return bool(np.all(np.bincount(perm.astype(np.intp), minlength=256) == 1))
+
+def inversePermutation(perm):
+    # perm is a permutation (256,) or an array of permutations (length, 256)
+    perm = np.asarray(perm)
+    inv = np.empty(perm.shape, dtype=np.uint8)
+    if perm.ndim == 1:
+        inv[perm] = _npIdentity
+    else:
+        inv[np.arange(len(perm))[:, None], perm] = _npIdentity
+    return inv
 
 class Encoding8:
 
     def __init__(self, permutation):
         InvalidArgument.check( isPermutation(permutation),
             f"provided an invalid permutation")
-        self.encoded = list(permutation)
-        self._genInverse()
+        self._setTable(permutation)
+
+    @classmethod
+    def fromArray(cls, encoded, plain=None):
+        # build an Encoding8 from a valid permutation, without checking it.
+        # An array of uint8 is used without copy.
+        obj = cls.__new__(cls)
+        obj._setTable(encoded, plain)
+        return obj
+
+    def _setTable(self, encoded, plain=None):
+        self._encoded = np.asarray(encoded, dtype=np.uint8)
+        if plain is None:
+            self._plain = inversePermutation(self._encoded)
+        else:
+            self._plain = np.asarray(plain, dtype=np.uint8)
+
+    def _materialize(self):
+        # build the tables of a symbolic encoding
+        raise NotImplementedError("Encoding8 without table")
+
+    @property
+    def encoded(self):
+        if self._encoded is None:
+            self._materialize()
+        return self._encoded
 
-    def _genInverse(self):
-        self.plain = [None for i in range(256)]
-        for i, n in enumerate(self.encoded):
-            self.plain[n] = i
+    @property
+    def plain(self):
+        if self._plain is None:
+            self._materialize()
+        return self._plain
+
+    def isAffine(self):
+        return False
 
     def getInverseEncoding(self):
-        return Encoding8(self.plain)
+        return Encoding8.fromArray(self.plain, self.encoded)
 
     def getEncodeTable(self):
-        return self.encoded
+        return self.encoded.tolist()
 
     def getDecodeTable(self):
-        return self.plain
+        return self.plain.tolist()
 
     def __getitem__(self, x):
-        return self.encoded[x]
+        return int(self.encoded[x])
 
     def encode(self, data):
-        return bytes([self.encoded[x] for x in data])
+        return bytes(data).translate(self.encoded.tobytes())
 
     def decode(self, data):
-        return bytes([self.plain[x] for x in data])
+        return bytes(data).translate(self.plain.tobytes())
+
+    def encodeBatch(self, data):
+        return self.encoded[np.asarray(data, dtype=np.uint8)]
+
+    def decodeBatch(self, data):
+        return self.plain[np.asarray(data, dtype=np.uint8)]
 
     def encodeOne(self, data):
-        return self.encoded[data]
+        return int(self.encoded[data])
 
     def decodeOne(self, data):
-        return self.plain[data]
+        return int(self.plain[data])
 
     # compute the table for  self(other(x))  ( self o other )
     def combine(self, other):
-        return Encoding8(self.encode(other.getEncodeTable()))
+        return Encoding8.fromArray(self.encoded[other.encoded], other.plain[self.plain])
 
     def __eq__(self, other):
-        return all([x == y for x, y in zip(self.encoded, other.getEncodeTable())])
+        return np.array_equal(self.encoded, other.encoded)
 
 class Encoding8Random(Encoding8):
 
@@ -80,9 +134,9 @@ class Encoding8Random(Encoding8):
             state = random.getstate()
             random.seed(seed)
 
-        self.encoded = list(range(256))
-        random.shuffle(self.encoded)
-        self._genInverse()
+        encoded = list(range(256))
+        random.shuffle(encoded)
+        self._setTable(encoded)
 
         if seed is not None:
             random.setstate(state)
@@ -100,28 +154,103 @@ class Encoding8Affine(Encoding8):
         if beta is None:
             beta = random.randrange(0, 256)
 
-        self.encoded = [MultTable[alpha][i] ^ beta for i in range(256)]
-        self._genInverse()
+        InvalidArgument.check( 0 < alpha and alpha < 256 and 0 <= beta and beta < 256,
+            f"invalid affine parameters ({alpha}, {beta})")
+        self.alpha = alpha
+        self.beta = beta
+        self._encoded = None
+        self._plain = None
 
         if seed is not None:
             random.setstate(state)
 
+    def _materialize(self):
+        self._encoded = npMultTable[self.alpha] ^ np.uint8(self.beta)
+        self._plain = npMultTable[inv(self.alpha)][_npIdentity ^ np.uint8(self.beta)]
+
+    def isAffine(self):
+        return True
+
+    def getInverseEncoding(self):
+        # x = alpha^-1 * y ^ alpha^-1 * beta
+        invAlpha = inv(self.alpha)
+        return Encoding8Affine(invAlpha, mul(invAlpha, self.beta))
+
+    def __getitem__(self, x):
+        return mul(self.alpha, x) ^ self.beta
+
+    def encodeOne(self, data):
+        return mul(self.alpha, data) ^ self.beta
+
+    def combine(self, other):
+        if not other.isAffine():
+            return super().combine(other)
+        # alpha * (alpha' * x ^ beta') ^ beta
+        return Encoding8Affine(mul(self.alpha, other.alpha),
+                               mul(self.alpha, other.beta) ^ self.beta)
+
+    def __eq__(self, other):
+        if other.isAffine():
+            return self.alpha == other.alpha and self.beta == other.beta
+        return super().__eq__(other)
+
 class Encoding8Identity(Encoding8):
 
     def __init__(self):
-        self.encoded = list(range(256))
-        self.plain = list(range(256))
+        self._setTable(_npIdentity, _npIdentity)
 
 class Encoding:
 
     def __init__(self, encodingList):
         self.encodingList = encodingList
+        self._stackTable()
+
+    def _stackTable(self):
+        # the tables are stacked on the first lookup
         self.length = len(self.encodingList)
+        self.position = np.arange(self.length, dtype=np.intp)
+        self._table = None
+        self._inverse = None
+
+    @property
+    def table(self):
+        if self._table is None:
+            if self.isAffine():
+                alphas = np.array([e.alpha for e in self.encodingList], dtype=np.intp)
+                betas = np.array([e.beta for e in self.encodingList], dtype=np.uint8)
+                self._table = npMultTable[alphas] ^ betas[:, None]
+            else:
+                self._table = np.array([e.encoded for e in self.encodingList],
+                                       dtype=np.uint8).reshape(-1, 256)
+        return self._table
+
+    @property
+    def inverse(self):
+        if self._inverse is None:
+            self._inverse = np.array([e.plain for e in self.encodingList],
+                                     dtype=np.uint8).reshape(-1, 256)
+        return self._inverse
+
+    def isAffine(self):
+        return all(e.isAffine() for e in self.encodingList)
 
     @classmethod
     def fromTable(cls, tables):
         return cls([Encoding8(e) for e in tables])
 
+    @classmethod
+    def fromArray(cls, table, inverse=None):
+        # build an Encoding from an array (length, 256) of valid permutations,
+        # the rows of an array of uint8 are used without copy
+        table = np.asarray(table, dtype=np.uint8)
+        if inverse is None:
+            inverse = inversePermutation(table)
+        inverse = np.asarray(inverse, dtype=np.uint8)
+        obj = cls([Encoding8.fromArray(e, i) for e, i in zip(table, inverse)])
+        obj._table = table
+        obj._inverse = inverse
+        return obj
+
     @classmethod
     def fromAffinParam(cls, alphas, betas):
         if alphas is None and betas is None:
@@ -133,36 +262,44 @@ class Encoding:
         return cls([Encoding8Affine(a, b) for a, b in zip(alphas, betas)])
 
     def toTable(self):
-        return [x.getEncodeTable() for x in self.encodingList]
+        return self.table.tolist()
 
     def __getitem__(self, x):
         return self.encodingList[x]
 
     # compute the table for  self(other(x))  ( self o other )
     def combine(self, other):
-        return Encoding([x.combine(y) for x, y in zip(self.encodingList, other.encodingList)])
+        if self.isAffine() and other.isAffine():
+            return Encoding([x.combine(y) for x, y in zip(self.encodingList, other.encodingList)])
+        return Encoding.fromArray(self.table[self.position[:, None], other.table],
+                                  other.inverse[other.position[:, None], self.inverse])
 
     def getInverseEncoding(self):
-        return Encoding([e.getInverseEncoding() for e in self.encodingList])
+        if self.isAffine():
+            return Encoding([e.getInverseEncoding() for e in self.encodingList])
+        return Encoding.fromArray(self.inverse, self.table)
 
-    def encode(self, data):
+    def _toBatch(self, data):
         InvalidArgument.check( len(data) % self.length == 0,
             f"data length ({len(data)}) must be a multiple of {self.length}")
-        r = b""
-        for i in range(0, len(data), self.length):
-            r += bytes([t.encodeOne(x) for t, x in zip(self.encodingList, data[i:i+self.length])])
-        return r
+        return np.frombuffer(bytes(data), dtype=np.uint8).reshape(-1, self.length)
+
+    def encodeBatch(self, data):
+        # [param] data  array (N, length) of uint8
+        return self.table[self.position, np.asarray(data, dtype=np.uint8)]
+
+    def decodeBatch(self, data):
+        # [param] data  array (N, length) of uint8
+        return self.inverse[self.position, np.asarray(data, dtype=np.uint8)]
+
+    def encode(self, data):
+        return self.encodeBatch(self._toBatch(data)).tobytes()
 
     def decode(self, data):
-        InvalidArgument.check( len(data) % self.length == 0,
-            f"data length ({len(data)}) must be a multiple of {self.length}")
-        r = b""
-        for i in range(0, len(data), self.length):
-            r += bytes([t.decodeOne(x) for t, x in zip(self.encodingList, data[i:i+self.length])])
-        return r
+        return self.decodeBatch(self._toBatch(data)).tobytes()
 
     def __eq__(self, other):
-        return all([x == y for x, y in zip(self.encodingList, other.encodingList)])
+        return np.array_equal(self.table, other.table)
 
 class EncodeType(Enum):
     RANDOM = auto()
@@ -197,4 +334,5 @@ class EncodingGenerator(Encoding):
             self.encodingList = [c(self.seed+bytes(i)) for i in range(self.length)]
         else:
             self.encodingList = [c(self.seed) for _ in range(self.length)]
+        self._stackTable()
 
@@ -54,6 +54,11 @@ class FaultPositionError(DarkPhoenixException):
         # - a list of integers: if the exact position is not known
         self.byteNumber = byteNumber
 
+    def __reduce__(self):
+        # keep roundNumber and byteNumber when the exception is raised in a
+        # worker process
+        return (self.__class__, (self.roundNumber, self.byteNumber))
+
     @classmethod
     def check(cls, cond, roundNumber, byteNumber=None):
         if not cond:
@@ -13,25 +13,38 @@
 # See LICENSE.txt for the text of the Apache license.
 # -----------------------------------------------------------------------------
 
-from .AES import expandKey, ShiftRow, InvShiftRow, SBox, InvSBox, MC, InvMC
-from .AES import _AesSBox, _AesInvSBox, xor, AES
+from .AES import expandKey, ShiftRowBatch, InvShiftRowBatch, SBoxBatch, InvSBoxBatch
+from .AES import MCBatch, InvMCBatch, toBatch
+from .AES import _AesSBox, _AesInvSBox, AES
 from .Encoding import Encoding8, Encoding
 from .Exception import UnexpectedFailure
+import numpy as np
 
 
 __all__ = ['getExternalEncoding']
 
+# The 256 inputs bytes([i] * 16) are computed together, as a batch (256, 16).
+
 def applyPermut(firstPerm, lambdaBetaPerm, data, encrypt):
     if encrypt:
-        return lambdaBetaPerm.encode(InvShiftRow(InvMC(firstPerm.encode(InvShiftRow(data)))))
+        return lambdaBetaPerm.encodeBatch(InvShiftRowBatch(InvMCBatch(firstPerm.encodeBatch(InvShiftRowBatch(data)))))
     else:
-        return lambdaBetaPerm.encode(ShiftRow(MC(firstPerm.encode(ShiftRow(data)))))
+        return lambdaBetaPerm.encodeBatch(ShiftRowBatch(MCBatch(firstPerm.encodeBatch(ShiftRowBatch(data)))))
 
 def applyLastRound(keyShed, data, encrypt):
     if encrypt:
-        return xor(ShiftRow(SBox(xor(MC(ShiftRow(SBox(data))), keyShed[-2]))), keyShed[-1])
+        return ShiftRowBatch(SBoxBatch(MCBatch(ShiftRowBatch(SBoxBatch(data))) ^ keyShed[-2])) ^ keyShed[-1]
     else:
-        return xor(InvSBox(InvShiftRow(InvMC(xor(InvSBox(InvShiftRow(data)), keyShed[1])))), keyShed[0])
+        return InvSBoxBatch(InvShiftRowBatch(InvMCBatch(InvSBoxBatch(InvShiftRowBatch(data)) ^ keyShed[1]))) ^ keyShed[0]
+
+def invertColumns(d, errorMessage):
+    # d[i][index] is the encoded value of i for the byte index, return the
+    # decoding table of each byte
+    table = np.zeros((16, 256), dtype=np.uint8)
+    for index in range(16):
+        UnexpectedFailure.check( len(np.unique(d[:, index])) == 256, errorMessage)
+        table[index][d[:, index]] = np.arange(256, dtype=np.uint8)
+    return Encoding.fromArray(table)
 
 def getExternalEncoding(wb, gtilde_inv, Gbar_inv, C, LambdaS4, BetaS4, aesKey):
     firstPerm = Encoding.fromAffinParam(C, None).combine(Gbar_inv).combine(gtilde_inv)
@@ -42,34 +55,22 @@ def getExternalEncoding(wb, gtilde_inv, Gbar_inv, C, LambdaS4, BetaS4, aesKey):
         sbox = Encoding.fromTable([_AesSBox for _ in range(16)])
     lambdaBetaPerm = sbox.combine(Encoding.fromAffinParam(LambdaS4, BetaS4))
 
-    keyShed = expandKey(aesKey, wb.getRoundNumber())
-
-    outEncoding = [[None for _ in range(256)] for _ in range(16)]
-
-    for i in range(256):
-        d = applyLastRound(keyShed, applyPermut(firstPerm, lambdaBetaPerm, bytes([i] * 16), wb.isEncrypt()), wb.isEncrypt())
+    keyShed = toBatch(expandKey(aesKey, wb.getRoundNumber()))
 
-        for index, x in enumerate(d):
-            UnexpectedFailure.check( outEncoding[index][x] is None,
-                "fail to compute output external encoding: same encoding value found twice")
-            outEncoding[index][x] = i
+    inputs = np.repeat(np.arange(256, dtype=np.uint8)[:, None], 16, axis=1)
 
-    outEncoding = Encoding.fromTable(outEncoding)
+    d = applyLastRound(keyShed, applyPermut(firstPerm, lambdaBetaPerm, inputs, wb.isEncrypt()), wb.isEncrypt())
+    outEncoding = invertColumns(d,
+        "fail to compute output external encoding: same encoding value found twice")
 
-    inEncoding = [[None for _ in range(256)] for _ in range(16)]
     aes = AES(aesKey, wb.getRoundNumber())
 
-    for i in range(256):
-        if wb.isEncrypt():
-            d = aes.decrypt(outEncoding.decode(wb.apply(bytes([i] * 16), revertLastShift=False)))
-        else:
-            d = aes.encrypt(outEncoding.decode(wb.apply(bytes([i] * 16), revertLastShift=False)))
-
-        for index, x in enumerate(d):
-            UnexpectedFailure.check( inEncoding[index][x] is None,
-                "fail to compute input external encoding: same encoding value found twice")
-            inEncoding[index][x] = i
-
-    inEncoding = Encoding.fromTable(inEncoding)
+    outputs = outEncoding.decodeBatch(toBatch([wb.apply(x.tobytes(), revertLastShift=False) for x in inputs]))
+    if wb.isEncrypt():
+        d = aes.decryptBatch(outputs)
+    else:
+        d = aes.encryptBatch(outputs)
+    inEncoding = invertColumns(d,
+        "fail to compute input external encoding: same encoding value found twice")
 
     return inEncoding, outEncoding
@@ -18,12 +18,15 @@ import random
 
 class FaultPositionValidator:
 
-    def __init__(self, wb, fround, reverseRoundMethod, reverseRoundMethod2, pbarWbIt):
+    def __init__(self, wb, fround, reverseRoundMethod, reverseRoundMethod2, pbarWbIt, faultSweep):
         self.wb = wb
         self.fround = fround
         self.reverseRoundMethod = reverseRoundMethod
         self.reverseRoundMethod2 = reverseRoundMethod2
         self.pbarWbIt = pbarWbIt
+        # a method faultSweep(data, fround, fbytes, values) that returns the
+        # raw output for each fault value (see WhiteBoxedAES.applyFaultSweep)
+        self.faultSweep = faultSweep
 
         self.foundColumn = 0
 
@@ -53,9 +56,12 @@ class FaultPositionValidator:
         else:
             self.commonOutput2 = None
 
-    def get_result(self, fault):
-        output_raw = self.wb.applyFault(self.commonInput, fault)
-        self.pbarWbIt.update(1)
+    def get_results(self, fpos, values):
+        outputs_raw = self.faultSweep(self.commonInput, self.fround, fpos, values)
+        self.pbarWbIt.update(len(outputs_raw))
+        return [self.get_result(output_raw) for output_raw in outputs_raw]
+
+    def get_result(self, output_raw):
         output = self.reverseRoundMethod(output_raw)
 
         faultPosition = [i for i in range(16) if self.commonOutput[i] != output[i] ]
@@ -72,7 +78,9 @@ class FaultPositionValidator:
         InvalidArgument.check(not self.commitedPosition[fpos],
             f"Position {fpos} already committed")
 
-        validOutput, faultPosition, shortOutput = self.get_result([(self.fround, fpos, 1)])
+        # the first value rejects most of the wrong positions, the 254 other
+        # values are only computed for a possible position
+        validOutput, faultPosition, shortOutput = self.get_results(fpos, [1])[0]
 
         # not 4 faults in fround-1 or not 16 faults in fround-2
         if not validOutput:
@@ -97,8 +105,7 @@ class FaultPositionValidator:
 
         faults = set([shortOutput])
 
-        for fvalue in range(2, 256):
-            validOutput, faultPosition2, shortOutput2 = self.get_result([(self.fround, fpos, fvalue)])
+        for validOutput, faultPosition2, shortOutput2 in self.get_results(fpos, range(2, 256)):
 
             if not validOutput:
                 return False
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+from .Exception import InvalidArgument, WhiteBoxError
+from .WhiteBoxedAES import WhiteBoxedAES
+import hashlib
+import os
+import re
+import select
+import signal
+import struct
+import subprocess
+import sys
+import weakref
+
+__all__ = ["ForkServer", "WhiteBoxedAESForkServer"]
+
+# Whitebox interface for an executable, with a forkserver (Linux only).
+#
+# The executable is started once with the library forkserver.c in LD_PRELOAD.
+# The library stops the target before main, once it is loaded and relocated,
+# and forks a new process for each request. The fault is injected in the child
+# before it continues: a list of bytes of the executable (a table, an
+# immediate value, ...) is xored with the fault value.
+#
+# The library is compiled with `cc` on the first use, in
+# $XDG_CACHE_HOME/darkphoenixAES (or ~/.cache/darkphoenixAES). The target must
+# be dynamically linked with the glibc.
+#
+# A forkserver belongs to a process. A forked process (the workers of the
+# steps) starts its own forkserver on its first request.
+
+FORKSERVER_HELLO = 0x58485044
+FORKSERVER_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "forkserver.c")
+# maximum time to wait for the hello of the forkserver, in seconds
+FORKSERVER_START_TIMEOUT = 10
+
+_HEADER = struct.Struct("<III")
+_PATCH = struct.Struct("<QIIB7x")
+_STATUS = struct.Struct("<i")
+
+def getCacheDirectory():
+    cache = os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache"))
+    return os.path.join(cache, "darkphoenixAES")
+
+def buildForkServer(compiler="cc"):
+    # return the path of the compiled library, compile it if needed
+    with open(FORKSERVER_SOURCE, 'rb') as f:
+        source = f.read()
+    directory = getCacheDirectory()
+    library = os.path.join(directory, f"forkserver-{hashlib.sha256(source).hexdigest()[:16]}.so")
+    if os.path.isfile(library):
+        return library
+
+    os.makedirs(directory, exist_ok=True)
+    tmpName = f"{library}.{os.getpid()}.tmp"
+    try:
+        res = subprocess.run([compiler, "-shared", "-fPIC", "-O2", "-o", tmpName, FORKSERVER_SOURCE],
+                             stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    except OSError as e:
+        raise WhiteBoxError(f"Fail to compile the forkserver with {compiler}: {e}")
+    if res.returncode != 0:
+        if os.path.exists(tmpName):
+            os.unlink(tmpName)
+        raise WhiteBoxError(f"Fail to compile the forkserver:\n{res.stdout.decode(errors='replace')}")
+    os.replace(tmpName, library)
+    return library
+
+def _stopServer(pid, proc, fds):
+    # only the process that started the forkserver stops it
+    if os.getpid() != pid:
+        return
+    for fd in fds:
+        os.close(fd)
+    if proc.poll() is None:
+        proc.kill()
+    proc.wait()
+
+class ForkServer:
+
+    def __init__(self, args, env=None, library=None, timeout=None, stderr=subprocess.DEVNULL):
+        # [param] args     the command line of the target (args[0] is the executable)
+        # [param] env      the environment of the target (default: os.environ)
+        # [param] library  a compiled forkserver.c (default: buildForkServer())
+        # [param] timeout  maximum duration of a request in seconds, None to wait
+        #                  without limit
+        # [param] stderr   the stderr of the target (see subprocess.Popen)
+        InvalidArgument.check( sys.platform.startswith("linux"),
+            "ForkServer is only available on Linux")
+        self.args = list(args)
+        self.env = dict(os.environ if env is None else env)
+        self.library = buildForkServer() if library is None else library
+        self.timeout = timeout
+        self.stderr = stderr
+        self.proc = None
+        self.pid = None
+
+    def start(self):
+        controlRead, controlWrite = os.pipe()
+        statusRead, statusWrite = os.pipe()
+        outRead, outWrite = os.pipe()
+
+        env = dict(self.env)
+        env["DPHX_FORKSERVER"] = f"{controlRead},{statusWrite}"
+        env["LD_PRELOAD"] = " ".join([self.library] + ([env["LD_PRELOAD"]] if "LD_PRELOAD" in env else []))
+        try:
+            self.proc = subprocess.Popen(self.args, env=env, stdin=subprocess.DEVNULL,
+                                         stdout=outWrite, stderr=self.stderr,
+                                         pass_fds=(controlRead, statusWrite))
+        finally:
+            for fd in (controlRead, statusWrite, outWrite):
+                os.close(fd)
+        self.pid = os.getpid()
+        self.controlFd = controlWrite
+        self.statusFd = statusRead
+        self.outFd = outRead
+        self.finalizer = weakref.finalize(self, _stopServer, self.pid, self.proc,
+                                          (controlWrite, statusRead, outRead))
+
+        hello = self._readStatus(FORKSERVER_START_TIMEOUT)
+        if hello != FORKSERVER_HELLO:
+            self.close()
+            raise WhiteBoxError("The forkserver didn't start, the target must be dynamically linked")
+
+    def close(self):
+        if self.proc is not None:
+            self.finalizer()
+            self.proc = None
+
+    def detach(self):
+        # in a forked process: forget the forkserver of the parent process
+        if self.proc is not None and self.pid != os.getpid():
+            self.finalizer.detach()
+            for fd in (self.controlFd, self.statusFd, self.outFd):
+                os.close(fd)
+            self.proc = None
+
+    def _readStatus(self, timeout):
+        data = b""
+        while len(data) < _STATUS.size:
+            ready, _, _ = select.select([self.statusFd], [], [], timeout)
+            if len(ready) == 0:
+                return None
+            chunk = os.read(self.statusFd, _STATUS.size - len(data))
+            if len(chunk) == 0:
+                return None
+            data += chunk
+        return _STATUS.unpack(data)[0] & 0xffffffff
+
+    def run(self, data, patches=(), argIndex=0):
+        # run the target with the input data and the patches
+        # [param] data      the input (bytes), on stdin or in argv[argIndex]
+        # [param] patches   a list of (offset, count, stride, value), see forkserver.c
+        # return  (wait status, stdout of the target)
+        self.detach()
+        if self.proc is None:
+            self.start()
+
+        request = _HEADER.pack(argIndex, len(data), len(patches)) + data
+        request += b"".join([_PATCH.pack(*p) for p in patches])
+        try:
+            os.write(self.controlFd, request)
+        except BrokenPipeError:
+            self.close()
+            raise WhiteBoxError("The forkserver has stopped")
+
+        childPid = self._readStatus(FORKSERVER_START_TIMEOUT)
+        WhiteBoxError.check( childPid is not None, "The forkserver has stopped")
+
+        # read the output while waiting for the status of the child
+        output = []
+        status = None
+        while status is None:
+            ready, _, _ = select.select([self.statusFd, self.outFd], [], [], self.timeout)
+            if len(ready) == 0:
+                # the forkserver reports the status of the killed child
+                os.kill(childPid, signal.SIGKILL)
+                self._readStatus(None)
+                raise WhiteBoxError(f"The target doesn't stop after {self.timeout} seconds")
+            if self.outFd in ready:
+                output.append(os.read(self.outFd, 65536))
+            if self.statusFd in ready:
+                status = self._readStatus(None)
+                WhiteBoxError.check( status is not None, "The forkserver has stopped")
+
+        # the output written before the exit of the child
+        while len(select.select([self.outFd], [], [], 0)[0]) != 0:
+            chunk = os.read(self.outFd, 65536)
+            if len(chunk) == 0:
+                break
+            output.append(chunk)
+        return status, b"".join(output)
+
+class WhiteBoxedAESForkServer(WhiteBoxedAES):
+    # WhiteBoxedAES for an executable that reads the input (32 hex digits) on
+    # stdin, or in the argument "{input}" of args, and prints the output in hex.
+    # encodeInput and decodeOutput can be overridden for other formats.
+    #
+    # The fault positions are static: faultPatches maps (fround, fbytes) to the
+    # patches that inject the fault, each patch is
+    #   offset                   a byte at the offset
+    #   (offset, count)          count consecutive bytes
+    #   (offset, count, stride)  count bytes at offset + i * stride
+    # or a list of them. offset is relative to the load address of the
+    # executable (or the address for a non-PIE executable). To fault a byte of
+    # the state, xor the whole table (or the byte lane of a T-table) read with
+    # this byte: the faulted lookup is the original value xored with the
+    # fault value.
+
+    def __init__(self, args, roundNumber, encrypt, faultPatches, env=None,
+                 library=None, timeout=None):
+        self.roundNumber = roundNumber
+        self.encrypt = encrypt
+        self.faultPatches = {}
+        for position, patches in faultPatches.items():
+            if not isinstance(patches, list):
+                patches = [patches]
+            self.faultPatches[position] = [self._normalizePatch(p) for p in patches]
+
+        args = list(args)
+        self.argIndex = 0
+        for index, arg in enumerate(args):
+            if arg == "{input}":
+                InvalidArgument.check( index != 0, "The executable cannot be the input")
+                self.argIndex = index
+                # the input is written in place, reserve its size
+                args[index] = "0" * len(self.encodeInput(bytes(16)))
+        self.inputLength = len(self.encodeInput(bytes(16)))
+        self.server = ForkServer(args, env=env, library=library, timeout=timeout)
+
+    @staticmethod
+    def _normalizePatch(patch):
+        if isinstance(patch, int):
+            patch = (patch,)
+        InvalidArgument.check( 1 <= len(patch) <= 3, f"Invalid fault patch {patch}")
+        offset, count, stride = tuple(patch) + (1, 1)[len(patch) - 1:]
+        return (offset, count, stride)
+
+    def getRoundNumber(self):
+        return self.roundNumber
+
+    def isEncrypt(self):
+        return self.encrypt
+
+    def hasReverse(self):
+        return False
+
+    def newThread(self):
+        self.server.detach()
+
+    def close(self):
+        self.server.close()
+
+    def encodeInput(self, data):
+        if self.argIndex != 0:
+            return data.hex().encode()
+        return data.hex().encode() + b"\n"
+
+    def decodeOutput(self, output):
+        m = re.search(rb"[0-9a-fA-F]{32}", output)
+        WhiteBoxError.check( m is not None, f"No output found in {output[:64]!r}")
+        return bytes.fromhex(m.group(0).decode())
+
+    def run(self, data, patches):
+        encoded = self.encodeInput(data)
+        InvalidArgument.check( self.argIndex == 0 or len(encoded) == self.inputLength,
+            "The input in argv must always have the same length")
+        status, output = self.server.run(encoded, patches, self.argIndex)
+        if os.WIFSIGNALED(status):
+            raise WhiteBoxError(f"The target has been killed by the signal {os.WTERMSIG(status)}")
+        return self.decodeOutput(output)
+
+    def apply(self, data):
+        return self.run(data, [])
+
+    def applyFault(self, data, faults):
+        patches = []
+        for fround, fbytes, fxorval in faults:
+            InvalidArgument.check( (fround, fbytes) in self.faultPatches,
+                f"No fault patch for round {fround} byte {fbytes}")
+            for offset, count, stride in self.faultPatches[(fround, fbytes)]:
+                patches.append((offset, count, stride, fxorval))
+        return self.run(data, patches)
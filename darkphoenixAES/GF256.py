@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+from .Exception import InvalidArgument
+import numpy as np
+
+__all__ = ("ExpTable", "LogTable", "MultFlat", "InvFlat", "npMultTable",
+           "npInvTable", "mul", "inv", "div", "mulArray", "invArray",
+           "divArray")
+
+# Arithmetic in GF(2^8) with the AES polynomial x^8 + x^4 + x^3 + x + 1.
+#
+# The tables are generated at import with the log and antilog tables of the
+# generator 3 (x + 1):
+#
+# ExpTable[i] = 3 ** i                              (255 bytes)
+# LogTable[x] = i such as 3 ** i == x, for x != 0   (256 bytes)
+# MultFlat[(a << 8) | b] = a * b                    (64 KiB)
+# InvFlat[x] = x ** -1, InvFlat[0] = 0              (256 bytes)
+#
+# npMultTable (256, 256) and npInvTable (256,) are read-only numpy views of
+# MultFlat and InvFlat, the *Array functions work on whole numpy arrays (with
+# broadcasting) and the scalar functions on int.
+
+def _generateExpLog():
+    exp = bytearray(255)
+    log = bytearray(256)
+    x = 1
+    for i in range(255):
+        exp[i] = x
+        log[x] = i
+        # x = x * 3 = x * 2 ^ x
+        x ^= ((x << 1) ^ (0x1b if x & 0x80 else 0)) & 0xff
+    return bytes(exp), bytes(log)
+
+ExpTable, LogTable = _generateExpLog()
+
+def _generateMult():
+    # the log of 0 doesn't exist, use 255 as a marker that always gives 0
+    logs = b"\xff" + LogTable[1:]
+    rows = [bytes(256)] * 256
+    for la in range(255):
+        # row[y] = 3 ** (la + log(y))
+        rows[ExpTable[la]] = logs.translate(ExpTable[la:] + ExpTable[:la] + b"\x00")
+    return b"".join(rows)
+
+MultFlat = _generateMult()
+InvFlat = b"\x00" + bytes([ExpTable[(255 - LogTable[x]) % 255] for x in range(1, 256)])
+
+npMultTable = np.frombuffer(MultFlat, dtype=np.uint8).reshape(256, 256)
+npInvTable = np.frombuffer(InvFlat, dtype=np.uint8)
+
+def mul(a, b):
+    return MultFlat[(a << 8) | b]
+
+def inv(a):
+    InvalidArgument.check( a != 0, "0 has no inverse in GF(2^8)")
+    return InvFlat[a]
+
+def div(a, b):
+    # a * (b ** -1)
+    return MultFlat[(a << 8) | inv(b)]
+
+def mulArray(a, b):
+    return npMultTable[a, b]
+
+def invArray(a):
+    # the inverse of 0 is 0
+    return npInvTable[a]
+
+def divArray(a, b):
+    # the result is 0 where b is 0
+    return npMultTable[a, npInvTable[b]]
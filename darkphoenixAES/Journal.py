@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+from .Utils import encodePayload, decodePayload
+import os
+import struct
+import zlib
+
+# Append-only journal of the progress inside a step.
+#
+# The checkpoint of the attack (Attack.save) is only written at the end of a
+# step. During a step, the intermediate results (an input found by Step1, a
+# column of Step2, the faults of a position of Step3, a column solved by Step4
+# or Step5, ...) are appended to the journal. When the attack is restarted,
+# the journal is replayed and the step only computes what is missing.
+#
+# Each record is a frame: length (uint32), crc32 of the payload (uint32) and a
+# JSON payload [kind, key, value]. The first record is the base: the state of
+# the checkpoint that the journal extends. A journal with another base is
+# discarded. A truncated or corrupted record (crash during a write) ends the
+# replay and is removed.
+#
+# At the end of a step, the checkpoint contains the result of the step and the
+# journal is compacted: it restarts empty with the new base.
+#
+# Each record is synced to the disk before record returns, the journal also
+# survives a crash of the system, not only of the process.
+#
+# Without filename, the journal is only kept in memory.
+
+_FRAME = struct.Struct("<II")
+_BASE = "base"
+
+class Journal:
+
+    def __init__(self, filename=None):
+        self.filename = filename
+        self.file = None
+        # kind -> {key: value}
+        self.entries = {}
+
+    def _frame(self, kind, key, value):
+        payload = encodePayload([kind, key, value])
+        return _FRAME.pack(len(payload), zlib.crc32(payload)) + payload
+
+    def _readRecords(self):
+        # return the records and the offset after the last valid record
+        with open(self.filename, 'rb') as f:
+            data = f.read()
+        records = []
+        offset = 0
+        while offset + _FRAME.size <= len(data):
+            size, crc = _FRAME.unpack_from(data, offset)
+            payload = data[offset + _FRAME.size:offset + _FRAME.size + size]
+            if len(payload) != size or zlib.crc32(payload) != crc:
+                break
+            records.append(decodePayload(payload))
+            offset += _FRAME.size + size
+        return records, offset
+
+    def replay(self, base):
+        # load the entries recorded on top of the checkpoint base
+        self.close()
+        self.entries = {}
+        if self.filename is None:
+            return
+        if not os.path.isfile(self.filename):
+            self.compact(base)
+            return
+
+        records, offset = self._readRecords()
+        if len(records) == 0 or records[0] != [_BASE, None, base]:
+            self.compact(base)
+            return
+
+        for kind, key, value in records[1:]:
+            if isinstance(key, list):
+                key = tuple(key)
+            self.entries.setdefault(kind, {})[key] = value
+
+        self.file = open(self.filename, 'ab')
+        self.file.truncate(offset)
+
+    def compact(self, base):
+        # the entries are in the checkpoint base, restart an empty journal
+        self.close()
+        self.entries = {}
+        if self.filename is None:
+            return
+        tmpName = f"{self.filename}.{os.getpid()}.tmp"
+        with open(tmpName, 'wb') as f:
+            f.write(self._frame(_BASE, None, base))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmpName, self.filename)
+        self.file = open(self.filename, 'ab')
+
+    def record(self, kind, key, value):
+        self.entries.setdefault(kind, {})[key] = value
+        if self.file is not None:
+            self.file.write(self._frame(kind, key, value))
+            self.file.flush()
+            os.fsync(self.file.fileno())
+
+    def get(self, kind):
+        # return {key: value} of the recorded entries of a kind
+        return self.entries.get(kind, {})
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
@@ -13,67 +13,65 @@
 # See LICENSE.txt for the text of the Apache license.
 # -----------------------------------------------------------------------------
 
-import sys
-import json
+import functools
+import itertools
+import multiprocessing as mp
+import numpy as np
 from .AES import _AesInvSBox, _AesSBox
-from .MultTable import MultTable, InvTable
+from .GF256 import npMultTable, mulArray, inv, div
 from .Exception import UnexpectedFailure, InvalidArgument
 
+# The meet-in-the-middle is computed on the whole (lambda, beta) space at once.
+# Each candidate is associated with a hash of the faults, the hash of each row
+# is then matched with the hash of the row 0 by sorting.
+
+_npAesInvSBox = np.array(_AesInvSBox, dtype=np.uint8)
+_npAesSBox = np.array(_AesSBox, dtype=np.uint8)
+
+# _npSbXor[x] is the row of Sb[x ^ beta] for every beta
+_npXor = np.arange(256, dtype=np.uint8)[:, None] ^ np.arange(256, dtype=np.uint8)[None, :]
+_npAesInvSBoxXor = _npAesInvSBox[_npXor]
+_npAesSBoxXor = _npAesSBox[_npXor]
+
+# the hash of the first faults is packed in a 64 bits integer
+MAX_MIDALPHA = 8
+
+def chooseMidalpha(limitedLambda=None):
+    # the smallest midalpha for which the hash of the first faults gives about
+    # one false match for each row (the false matches are removed with the
+    # other faults)
+    ncandidate = 255 * 256 if limitedLambda is None else 256
+    midalpha = 2
+    while 256 ** midalpha < ncandidate ** 2:
+        midalpha += 1
+    return midalpha
+
 class MeetITM:
 
     def __init__(self):
+        # coefficient of the fault of each row relative to the fault of row 0
         self.coefEnc = [
-            [
-                None,
-                MultTable[2],
-                MultTable[2],
-                MultTable[MultTable[2][InvTable[3]]],
-            ], [
-                None,
-                MultTable[MultTable[3][InvTable[2]]],
-                MultTable[3],
-                MultTable[3],
-            ], [
-                None,
-                MultTable[InvTable[3]],
-                MultTable[InvTable[2]],
-                MultTable[1],
-            ], [
-                None,
-                MultTable[1],
-                MultTable[InvTable[3]],
-                MultTable[InvTable[2]],
-            ]
+            [None, 2, 2, div(2, 3)],
+            [None, div(3, 2), 3, 3],
+            [None, inv(3), inv(2), 1],
+            [None, 1, inv(3), inv(2)],
         ]
         self.coefDec = [
-            [
-                None,
-                MultTable[MultTable[14][InvTable[9]]],  # p14 * (p9 ** -1))
-                MultTable[MultTable[14][InvTable[13]]], # p14 * (p13 ** -1))
-                MultTable[MultTable[14][InvTable[11]]], # p14 * (p11 ** -1))
-            ], [
-                None,
-                MultTable[MultTable[11][InvTable[14]]],
-                MultTable[MultTable[11][InvTable[9]]],
-                MultTable[MultTable[11][InvTable[13]]],
-            ], [
-                None,
-                MultTable[MultTable[13][InvTable[11]]],
-                MultTable[MultTable[13][InvTable[14]]],
-                MultTable[MultTable[13][InvTable[9]]],
-            ], [
-                None,
-                MultTable[MultTable[9][InvTable[13]]],
-                MultTable[MultTable[9][InvTable[11]]],
-                MultTable[MultTable[9][InvTable[14]]],
-            ]
+            [None, div(14, 9), div(14, 13), div(14, 11)],
+            [None, div(11, 14), div(11, 9), div(11, 13)],
+            [None, div(13, 11), div(13, 14), div(13, 9)],
+            [None, div(9, 13), div(9, 11), div(9, 14)],
         ]
+        # lookup table x -> coef * x
+        self.coefEnc = [[None if c is None else npMultTable[c] for c in row]
+                        for row in self.coefEnc]
+        self.coefDec = [[None if c is None else npMultTable[c] for c in row]
+                        for row in self.coefDec]
 
     def reset_local_var(self, col, fault, midalpha, encrypt, fpos, limitedLambda):
-        self.Rtable = {}
-        self.Rtable2_inv = {}
         self.Lcoef = self.coefEnc[fpos] if encrypt else self.coefDec[fpos]
-        self.Sb = _AesInvSBox if encrypt else _AesSBox
+        self.Sb = _npAesInvSBox if encrypt else _npAesSBox
+        self.SbXor = _npAesInvSBoxXor if encrypt else _npAesSBoxXor
         if limitedLambda is None:
             self.limitedLambda0 = list(range(1, 256))
             self.limitedLambda1 = list(range(1, 256))
@@ -97,98 +95,133 @@ class MeetITM:
 
         InvalidArgument.check( 1 < midalpha and midalpha + 1 < len(fault),
             f"Invalid value of midalpha ({midalpha}), expect a value between 2 and {len(fault)}")
-
-        self.fault0 = fault[:midalpha+1]
-
-        self.fault1 = fault[0:1] + fault[midalpha+1:]
+        InvalidArgument.check( midalpha <= MAX_MIDALPHA,
+            f"Invalid value of midalpha ({midalpha}), expect a value lower or equal to {MAX_MIDALPHA}")
+
+        self.fault0 = np.array([list(x) for x in fault[:midalpha+1]], dtype=np.uint8)
+
+        self.fault1 = np.array([list(x) for x in fault[0:1] + fault[midalpha+1:]], dtype=np.uint8)
+
+    @staticmethod
+    def candidates(limitedLambda):
+        # all the (lambda, beta) candidates, as two flat arrays
+        lambdas = np.repeat(np.array(limitedLambda, dtype=np.uint8), 256)
+        betas = np.tile(np.arange(256, dtype=np.uint8), len(limitedLambda))
+        return lambdas, betas
+
+    def computeHash(self, fault, row, lambdas, betas, coef=None):
+        # for each candidate, compute
+        #   coef[ Sb[lambda * fault[0][row] ^ beta] ^ Sb[lambda * fault[i][row] ^ beta] ]
+        # for each fault i > 0. The result is an array (candidates, len(fault)-1)
+        v = self.Sb[mulArray(lambdas[:, None], fault[None, :, row]) ^ betas[:, None]]
+        h = v[:, :1] ^ v[:, 1:]
+        if coef is not None:
+            h = coef[h]
+        return h
+
+    def computeKeys(self, limitedLambda, row, coef=None):
+        # same hash as computeHash with fault0 for every candidate of
+        # MeetITM.candidates, packed in a 32 or 64 bits integer
+        lambdas = np.array(limitedLambda, dtype=np.uint8)
+        v = self.SbXor[mulArray(lambdas[None, :], self.fault0[:, None, row])]
+
+        dtype = np.uint32 if len(self.fault0) <= 5 else np.uint64
+        keys = np.zeros(len(lambdas) * 256, dtype=dtype)
+        for i in range(1, len(self.fault0)):
+            h = v[0] ^ v[i]
+            if coef is not None:
+                h = coef[h]
+            keys |= h.reshape(-1).astype(dtype) << dtype(8 * (i - 1))
+        return keys
 
     def computeR(self):
+        self.Rlambda, self.Rbeta = self.candidates(self.limitedLambda0)
+        Rkeys = self.computeKeys(self.limitedLambda0, 0)
 
-        for Rlambda in self.limitedLambda0:
-            for beta in range(256):
-
-                RHash = []
-                v0 = self.Sb[MultTable[Rlambda][self.fault0[0][0]] ^ beta]
-
-                for x in self.fault0[1:]:
-                    RHash.append( v0 ^ self.Sb[MultTable[Rlambda][x[0]] ^ beta] )
-                RintHash = int.from_bytes(RHash, 'little')
-
-                # Not sure if a collision is possible
-                if RintHash in self.Rtable.keys():
-                    self.Rtable[RintHash].append((Rlambda, beta))
-                else:
-                    self.Rtable[RintHash] = [(Rlambda, beta)]
-
-    def computeR2(self, Rlambda, Rbeta):
-        if (Rlambda, Rbeta) in self.Rtable2_inv:
-            return self.Rtable2_inv[(Rlambda, Rbeta)]
-
-        RHash = []
-        v0 = self.Sb[MultTable[Rlambda][self.fault1[0][0]] ^ Rbeta]
-
-        for x in self.fault1[1:]:
-            RHash.append( v0 ^ self.Sb[MultTable[Rlambda][x[0]] ^ Rbeta] )
-        RintHash = int.from_bytes(RHash, 'little')
-
-        self.Rtable2_inv[(Rlambda, Rbeta)] = RintHash
-        return RintHash
+        self.Rorder = np.argsort(Rkeys)
+        self.RsortedKeys = Rkeys[self.Rorder]
 
     def computeL(self, row):
-        solutions = []
-
         limitedLambdaN = {1: self.limitedLambda1, 2: self.limitedLambda2, 3: self.limitedLambda3}[row]
         Lncoef = self.Lcoef[row]
 
-        for Llambda in limitedLambdaN:
-            for Lbeta in range(256):
-                v0 = self.Sb[MultTable[Llambda][self.fault0[0][row]] ^ Lbeta]
+        Llambda, Lbeta = self.candidates(limitedLambdaN)
+        Lkeys = self.computeKeys(limitedLambdaN, row, Lncoef)
 
-                LHash = []
-                for x in self.fault0[1:]:
-                    LHash.append( Lncoef[v0 ^ self.Sb[MultTable[Llambda][x[row]] ^ Lbeta]] )
-                LintHash = int.from_bytes(LHash, 'little')
+        # join the L candidates with the R candidates with the same hash
+        # (searchsorted is much faster with sorted keys)
+        Lorder = np.argsort(Lkeys)
+        LsortedKeys = Lkeys[Lorder]
+        lo = np.searchsorted(self.RsortedKeys, LsortedKeys, side='left')
+        found = np.flatnonzero(self.RsortedKeys[np.minimum(lo, len(self.RsortedKeys) - 1)] == LsortedKeys)
+        if len(found) == 0:
+            return []
 
-                if LintHash not in self.Rtable.keys():
-                    continue
+        lo = lo[found]
+        hi = np.searchsorted(self.RsortedKeys, LsortedKeys[found], side='right')
+        counts = hi - lo
+        total = int(counts.sum())
 
-                LHash2 = []
-                for x in self.fault1[1:]:
-                    LHash2.append( Lncoef[v0 ^ self.Sb[MultTable[Llambda][x[row]] ^ Lbeta]] )
-                LintHash2 = int.from_bytes(LHash2, 'little')
+        Lindex = Lorder[np.repeat(found, counts)]
+        groupStart = np.repeat(np.cumsum(counts) - counts, counts)
+        Rindex = self.Rorder[np.repeat(lo, counts) + np.arange(total) - groupStart]
 
-                for Rlambda, Rbeta in self.Rtable[LintHash]:
-                    RintHash2 = self.computeR2(Rlambda, Rbeta)
-                    if RintHash2 == LintHash2:
-                        solutions.append((Rlambda, Rbeta, Llambda, Lbeta))
+        # verify the candidates with the second set of faults
+        LHash2 = self.computeHash(self.fault1, row, Llambda[Lindex], Lbeta[Lindex], Lncoef)
+        RHash2 = self.computeHash(self.fault1, 0, self.Rlambda[Rindex], self.Rbeta[Rindex])
+        match = np.all(LHash2 == RHash2, axis=1)
 
-        return solutions
+        return [(int(self.Rlambda[r]), int(self.Rbeta[r]), int(Llambda[l]), int(Lbeta[l]))
+                    for l, r in zip(Lindex[match], Rindex[match])]
 
-    def resolv(self, col, fault, midalpha, encrypt, fpos, limitedLambda=None):
+    def resolvCandidates(self, col, fault, midalpha, encrypt, fpos, limitedLambda=None):
+        # return the list of (lambdaCol, betaCol) that explain the faults
 
         self.reset_local_var(col, fault, midalpha, encrypt, fpos, limitedLambda)
         self.computeR()
 
-        sol1 = self.computeL(1)
-        if len(sol1) != 1:
-            return False, [], []
-
-        sol2 = self.computeL(2)
-        if len(sol2) != 1:
-            return False, [], []
-
-        sol3 = self.computeL(3)
-        if len(sol3) != 1:
-            return False, [], []
-
-        Rlambda1, Rbeta1, Llambda1, Lbeta1 = sol1[0]
-        Rlambda2, Rbeta2, Llambda2, Lbeta2 = sol2[0]
-        Rlambda3, Rbeta3, Llambda3, Lbeta3 = sol3[0]
+        sols = []
+        for row in range(1, 4):
+            sol = self.computeL(row)
+            if len(sol) == 0:
+                return []
+            sols.append(sol)
+
+        # the three rows must agree on the lambda and beta of the row 0
+        candidates = []
+        for R in sorted(set((Rlambda, Rbeta) for Rlambda, Rbeta, _, _ in sols[0])):
+            Ls = [[(Llambda, Lbeta) for Rlambda, Rbeta, Llambda, Lbeta in sol if (Rlambda, Rbeta) == R]
+                    for sol in sols]
+            for L1, L2, L3 in itertools.product(*Ls):
+                candidates.append(((R[0], L1[0], L2[0], L3[0]), (R[1], L1[1], L2[1], L3[1])))
+        return candidates
+
+    def narrow(self, candidates, fault, encrypt, fpos):
+        # keep the candidates of resolvCandidates that also explain fault.
+        # Used to remove an ambiguity with additional fault values.
+        Lcoef = self.coefEnc[fpos] if encrypt else self.coefDec[fpos]
+        self.Sb = _npAesInvSBox if encrypt else _npAesSBox
+        fault = np.array([list(x) for x in fault], dtype=np.uint8)
+
+        res = []
+        for lambdaCol, betaCol in candidates:
+            h0 = self.computeHash(fault, 0, np.array(lambdaCol[:1], dtype=np.uint8),
+                                  np.array(betaCol[:1], dtype=np.uint8))
+            if all(np.array_equal(h0, self.computeHash(fault, row,
+                                        np.array(lambdaCol[row:row+1], dtype=np.uint8),
+                                        np.array(betaCol[row:row+1], dtype=np.uint8),
+                                        Lcoef[row]))
+                   for row in range(1, 4)):
+                res.append((lambdaCol, betaCol))
+        return res
 
-        if Rlambda1 != Rlambda2 or Rlambda1 != Rlambda3 or Rbeta1 != Rbeta2 or Rbeta1 != Rbeta3:
+    def resolv(self, col, fault, midalpha, encrypt, fpos, limitedLambda=None):
+        candidates = self.resolvCandidates(col, fault, midalpha, encrypt, fpos, limitedLambda)
+        if len(candidates) != 1:
             return False, [], []
 
-        return True, [Rlambda1, Llambda1, Llambda2, Llambda3], [Rbeta1, Lbeta1, Lbeta2, Lbeta3]
+        lambdaCol, betaCol = candidates[0]
+        return True, list(lambdaCol), list(betaCol)
 
     def __call__(self, col, fault, midalpha, encrypt, limitedLambda=None):
         for fpos in range(4):
@@ -198,4 +231,151 @@ class MeetITM:
         return res
 
 
-
+###############################
+# Parallel MeetITM resolution #
+###############################
+
+# number of jobs that can be cancelled independently, the slots are reused
+MEETITM_CANCEL_SLOTS = 4096
+
+localResolver = None
+localCancel = None
+def init_localResolver(cancel):
+    global localCancel
+    localCancel = cancel
+
+def resolvCandidatesProxy(slot, col, fault, midalpha, encrypt, fpos, limitedLambda):
+    global localResolver
+    # the slot MEETITM_CANCEL_SLOTS stops every job
+    if localCancel[slot] or localCancel[MEETITM_CANCEL_SLOTS]:
+        return []
+    if localResolver is None:
+        localResolver = MeetITM()
+    return localResolver.resolvCandidates(col, fault, midalpha, encrypt, fpos, limitedLambda)
+
+class MeetITMSyncJob:
+    # resolv computed in the current process when its result is needed
+
+    def __init__(self, method):
+        self.method = method
+        self.res = None
+
+    def ready(self):
+        return True
+
+    def wait(self, timeout=None):
+        pass
+
+    def get(self):
+        if self.res is None:
+            self.res = self.method()
+        return self.res
+
+class MeetITMResult:
+
+    def __init__(self, jobs, cancel=None):
+        # jobs: one job for each fpos (AsyncResult or MeetITMSyncJob)
+        # cancel: a method that cancels the jobs not started yet
+        self.jobs = jobs
+        self.cancelMethod = cancel
+
+    def ready(self):
+        # the first fpos with a candidate is known
+        for job in self.jobs:
+            if not job.ready():
+                return False
+            if len(job.get()) != 0:
+                return True
+        return True
+
+    def wait(self, timeout=None):
+        for job in self.jobs:
+            if not job.ready():
+                job.wait(timeout)
+                return
+
+    def candidates(self):
+        # like MeetITM.__call__, go through the fpos in order
+        # yield (fpos, candidates) for each fpos with a candidate
+        for fpos, job in enumerate(self.jobs):
+            res = job.get()
+            if len(res) != 0:
+                yield fpos, res
+
+    def cancel(self):
+        # the result will not be used
+        if self.cancelMethod is not None:
+            self.cancelMethod()
+
+class MeetITMPool:
+    # Solve many MeetITM problems at the same time. Each fault row hypothesis
+    # (fpos) of a problem is solved by a different worker.
+    #
+    # A job cancelled (or submitted before close) returns no candidate without
+    # being solved. The workers are only terminated on an exception, a worker
+    # killed while it sends a result can block the pool.
+
+    def __init__(self, nprocess):
+        self.resolver = MeetITM()
+        self.ticket = 0
+        self.outstanding = []
+        if nprocess == 0:
+            self.pool = None
+        else:
+            # one flag by slot, and the flag of close
+            self.cancelFlags = mp.RawArray('B', MEETITM_CANCEL_SLOTS + 1)
+            self.pool = mp.Pool(processes=nprocess, initializer=init_localResolver,
+                                initargs=(self.cancelFlags,))
+
+    def submit(self, col, fault, midalpha, encrypt, limitedLambda=None):
+        if self.pool is None:
+            return MeetITMResult([MeetITMSyncJob(functools.partial(self.resolver.resolvCandidates, col,
+                                        fault, midalpha, encrypt, fpos, limitedLambda))
+                                  for fpos in range(4)])
+
+        slot = self.ticket % MEETITM_CANCEL_SLOTS
+        self.ticket += 1
+        self.cancelFlags[slot] = 0
+
+        jobs = [self.pool.apply_async(resolvCandidatesProxy,
+                                      (slot, col, fault, midalpha, encrypt, fpos, limitedLambda))
+                for fpos in range(4)]
+        self.outstanding = [job for job in self.outstanding if not job.ready()] + jobs
+        return MeetITMResult(jobs, cancel=functools.partial(self.cancel, slot))
+
+    def cancel(self, slot):
+        self.cancelFlags[slot] = 1
+
+    def isAsync(self):
+        return self.pool is not None
+
+    def narrow(self, candidates, fault, encrypt, fpos):
+        # only a few candidates to check, done in the current process
+        return self.resolver.narrow(candidates, fault, encrypt, fpos)
+
+    def close(self):
+        # the jobs not started yet are skipped, wait for the others
+        if self.pool is not None:
+            self.cancelFlags[MEETITM_CANCEL_SLOTS] = 1
+            for job in self.outstanding:
+                job.wait()
+            self.outstanding = []
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def terminate(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+            self.outstanding = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, tb):
+        if type is None:
+            self.close()
+        else:
+            self.terminate()
@@ -45,4635 +45,12 @@ __all__ = ("InvTable", "MultTable")
 #     return sum([int(x) << index for index, x in enumerate(value.list())])
 
 # InvTable = [None] + [binaryToBytesRep(bytesToBinaryRep(1) / bytesToBinaryRep(y)) for x in range(1, 256)]
+# MultTable = [[binaryToBytesRep(bytesToBinaryRep(x) * bytesToBinaryRep(y)) for x in range(256)] for y in range(256)]
 
-InvTable = (
-        None,0x01,0x8d,0xf6,0xcb,0x52,0x7b,0xd1,0xe8,0x4f,0x29,0xc0,0xb0,0xe1,0xe5,0xc7,
-        0x74,0xb4,0xaa,0x4b,0x99,0x2b,0x60,0x5f,0x58,0x3f,0xfd,0xcc,0xff,0x40,0xee,0xb2,
-        0x3a,0x6e,0x5a,0xf1,0x55,0x4d,0xa8,0xc9,0xc1,0x0a,0x98,0x15,0x30,0x44,0xa2,0xc2,
-        0x2c,0x45,0x92,0x6c,0xf3,0x39,0x66,0x42,0xf2,0x35,0x20,0x6f,0x77,0xbb,0x59,0x19,
-        0x1d,0xfe,0x37,0x67,0x2d,0x31,0xf5,0x69,0xa7,0x64,0xab,0x13,0x54,0x25,0xe9,0x09,
-        0xed,0x5c,0x05,0xca,0x4c,0x24,0x87,0xbf,0x18,0x3e,0x22,0xf0,0x51,0xec,0x61,0x17,
-        0x16,0x5e,0xaf,0xd3,0x49,0xa6,0x36,0x43,0xf4,0x47,0x91,0xdf,0x33,0x93,0x21,0x3b,
-        0x79,0xb7,0x97,0x85,0x10,0xb5,0xba,0x3c,0xb6,0x70,0xd0,0x06,0xa1,0xfa,0x81,0x82,
-        0x83,0x7e,0x7f,0x80,0x96,0x73,0xbe,0x56,0x9b,0x9e,0x95,0xd9,0xf7,0x02,0xb9,0xa4,
-        0xde,0x6a,0x32,0x6d,0xd8,0x8a,0x84,0x72,0x2a,0x14,0x9f,0x88,0xf9,0xdc,0x89,0x9a,
-        0xfb,0x7c,0x2e,0xc3,0x8f,0xb8,0x65,0x48,0x26,0xc8,0x12,0x4a,0xce,0xe7,0xd2,0x62,
-        0x0c,0xe0,0x1f,0xef,0x11,0x75,0x78,0x71,0xa5,0x8e,0x76,0x3d,0xbd,0xbc,0x86,0x57,
-        0x0b,0x28,0x2f,0xa3,0xda,0xd4,0xe4,0x0f,0xa9,0x27,0x53,0x04,0x1b,0xfc,0xac,0xe6,
-        0x7a,0x07,0xae,0x63,0xc5,0xdb,0xe2,0xea,0x94,0x8b,0xc4,0xd5,0x9d,0xf8,0x90,0x6b,
-        0xb1,0x0d,0xd6,0xeb,0xc6,0x0e,0xcf,0xad,0x08,0x4e,0xd7,0xe3,0x5d,0x50,0x1e,0xb3,
-        0x5b,0x23,0x38,0x34,0x68,0x46,0x03,0x8c,0xdd,0x9c,0x7d,0xa0,0xcd,0x1a,0x41,0x1c,
-    )
+# The tables are built from the flat tables of GF256, which should be used
+# instead: a lookup in MultFlat is a single index in a bytes.
 
-# MultTable = [[binaryToBytesRep(bytesToBinaryRep(x) * bytesToBinaryRep(y)) for x in range(256)] for y in range(256)]
+from .GF256 import MultFlat, InvFlat
 
-MultTable = (
-    ( # 0
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-        0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,
-    ),
-    ( # 1
-        0x00,0x01,0x02,0x03,0x04,0x05,0x06,0x07,0x08,0x09,0x0a,0x0b,0x0c,0x0d,0x0e,0x0f,
-        0x10,0x11,0x12,0x13,0x14,0x15,0x16,0x17,0x18,0x19,0x1a,0x1b,0x1c,0x1d,0x1e,0x1f,
-        0x20,0x21,0x22,0x23,0x24,0x25,0x26,0x27,0x28,0x29,0x2a,0x2b,0x2c,0x2d,0x2e,0x2f,
-        0x30,0x31,0x32,0x33,0x34,0x35,0x36,0x37,0x38,0x39,0x3a,0x3b,0x3c,0x3d,0x3e,0x3f,
-        0x40,0x41,0x42,0x43,0x44,0x45,0x46,0x47,0x48,0x49,0x4a,0x4b,0x4c,0x4d,0x4e,0x4f,
-        0x50,0x51,0x52,0x53,0x54,0x55,0x56,0x57,0x58,0x59,0x5a,0x5b,0x5c,0x5d,0x5e,0x5f,
-        0x60,0x61,0x62,0x63,0x64,0x65,0x66,0x67,0x68,0x69,0x6a,0x6b,0x6c,0x6d,0x6e,0x6f,
-        0x70,0x71,0x72,0x73,0x74,0x75,0x76,0x77,0x78,0x79,0x7a,0x7b,0x7c,0x7d,0x7e,0x7f,
-        0x80,0x81,0x82,0x83,0x84,0x85,0x86,0x87,0x88,0x89,0x8a,0x8b,0x8c,0x8d,0x8e,0x8f,
-        0x90,0x91,0x92,0x93,0x94,0x95,0x96,0x97,0x98,0x99,0x9a,0x9b,0x9c,0x9d,0x9e,0x9f,
-        0xa0,0xa1,0xa2,0xa3,0xa4,0xa5,0xa6,0xa7,0xa8,0xa9,0xaa,0xab,0xac,0xad,0xae,0xaf,
-        0xb0,0xb1,0xb2,0xb3,0xb4,0xb5,0xb6,0xb7,0xb8,0xb9,0xba,0xbb,0xbc,0xbd,0xbe,0xbf,
-        0xc0,0xc1,0xc2,0xc3,0xc4,0xc5,0xc6,0xc7,0xc8,0xc9,0xca,0xcb,0xcc,0xcd,0xce,0xcf,
-        0xd0,0xd1,0xd2,0xd3,0xd4,0xd5,0xd6,0xd7,0xd8,0xd9,0xda,0xdb,0xdc,0xdd,0xde,0xdf,
-        0xe0,0xe1,0xe2,0xe3,0xe4,0xe5,0xe6,0xe7,0xe8,0xe9,0xea,0xeb,0xec,0xed,0xee,0xef,
-        0xf0,0xf1,0xf2,0xf3,0xf4,0xf5,0xf6,0xf7,0xf8,0xf9,0xfa,0xfb,0xfc,0xfd,0xfe,0xff,
-    ),
-    ( # 2
-        0x00,0x02,0x04,0x06,0x08,0x0a,0x0c,0x0e,0x10,0x12,0x14,0x16,0x18,0x1a,0x1c,0x1e,
-        0x20,0x22,0x24,0x26,0x28,0x2a,0x2c,0x2e,0x30,0x32,0x34,0x36,0x38,0x3a,0x3c,0x3e,
-        0x40,0x42,0x44,0x46,0x48,0x4a,0x4c,0x4e,0x50,0x52,0x54,0x56,0x58,0x5a,0x5c,0x5e,
-        0x60,0x62,0x64,0x66,0x68,0x6a,0x6c,0x6e,0x70,0x72,0x74,0x76,0x78,0x7a,0x7c,0x7e,
-        0x80,0x82,0x84,0x86,0x88,0x8a,0x8c,0x8e,0x90,0x92,0x94,0x96,0x98,0x9a,0x9c,0x9e,
-        0xa0,0xa2,0xa4,0xa6,0xa8,0xaa,0xac,0xae,0xb0,0xb2,0xb4,0xb6,0xb8,0xba,0xbc,0xbe,
-        0xc0,0xc2,0xc4,0xc6,0xc8,0xca,0xcc,0xce,0xd0,0xd2,0xd4,0xd6,0xd8,0xda,0xdc,0xde,
-        0xe0,0xe2,0xe4,0xe6,0xe8,0xea,0xec,0xee,0xf0,0xf2,0xf4,0xf6,0xf8,0xfa,0xfc,0xfe,
-        0x1b,0x19,0x1f,0x1d,0x13,0x11,0x17,0x15,0x0b,0x09,0x0f,0x0d,0x03,0x01,0x07,0x05,
-        0x3b,0x39,0x3f,0x3d,0x33,0x31,0x37,0x35,0x2b,0x29,0x2f,0x2d,0x23,0x21,0x27,0x25,
-        0x5b,0x59,0x5f,0x5d,0x53,0x51,0x57,0x55,0x4b,0x49,0x4f,0x4d,0x43,0x41,0x47,0x45,
-        0x7b,0x79,0x7f,0x7d,0x73,0x71,0x77,0x75,0x6b,0x69,0x6f,0x6d,0x63,0x61,0x67,0x65,
-        0x9b,0x99,0x9f,0x9d,0x93,0x91,0x97,0x95,0x8b,0x89,0x8f,0x8d,0x83,0x81,0x87,0x85,
-        0xbb,0xb9,0xbf,0xbd,0xb3,0xb1,0xb7,0xb5,0xab,0xa9,0xaf,0xad,0xa3,0xa1,0xa7,0xa5,
-        0xdb,0xd9,0xdf,0xdd,0xd3,0xd1,0xd7,0xd5,0xcb,0xc9,0xcf,0xcd,0xc3,0xc1,0xc7,0xc5,
-        0xfb,0xf9,0xff,0xfd,0xf3,0xf1,0xf7,0xf5,0xeb,0xe9,0xef,0xed,0xe3,0xe1,0xe7,0xe5,
-    ),
-    ( # 3
-        0x00,0x03,0x06,0x05,0x0c,0x0f,0x0a,0x09,0x18,0x1b,0x1e,0x1d,0x14,0x17,0x12,0x11,
-        0x30,0x33,0x36,0x35,0x3c,0x3f,0x3a,0x39,0x28,0x2b,0x2e,0x2d,0x24,0x27,0x22,0x21,
-        0x60,0x63,0x66,0x65,0x6c,0x6f,0x6a,0x69,0x78,0x7b,0x7e,0x7d,0x74,0x77,0x72,0x71,
-        0x50,0x53,0x56,0x55,0x5c,0x5f,0x5a,0x59,0x48,0x4b,0x4e,0x4d,0x44,0x47,0x42,0x41,
-        0xc0,0xc3,0xc6,0xc5,0xcc,0xcf,0xca,0xc9,0xd8,0xdb,0xde,0xdd,0xd4,0xd7,0xd2,0xd1,
-        0xf0,0xf3,0xf6,0xf5,0xfc,0xff,0xfa,0xf9,0xe8,0xeb,0xee,0xed,0xe4,0xe7,0xe2,0xe1,
-        0xa0,0xa3,0xa6,0xa5,0xac,0xaf,0xaa,0xa9,0xb8,0xbb,0xbe,0xbd,0xb4,0xb7,0xb2,0xb1,
-        0x90,0x93,0x96,0x95,0x9c,0x9f,0x9a,0x99,0x88,0x8b,0x8e,0x8d,0x84,0x87,0x82,0x81,
-        0x9b,0x98,0x9d,0x9e,0x97,0x94,0x91,0x92,0x83,0x80,0x85,0x86,0x8f,0x8c,0x89,0x8a,
-        0xab,0xa8,0xad,0xae,0xa7,0xa4,0xa1,0xa2,0xb3,0xb0,0xb5,0xb6,0xbf,0xbc,0xb9,0xba,
-        0xfb,0xf8,0xfd,0xfe,0xf7,0xf4,0xf1,0xf2,0xe3,0xe0,0xe5,0xe6,0xef,0xec,0xe9,0xea,
-        0xcb,0xc8,0xcd,0xce,0xc7,0xc4,0xc1,0xc2,0xd3,0xd0,0xd5,0xd6,0xdf,0xdc,0xd9,0xda,
-        0x5b,0x58,0x5d,0x5e,0x57,0x54,0x51,0x52,0x43,0x40,0x45,0x46,0x4f,0x4c,0x49,0x4a,
-        0x6b,0x68,0x6d,0x6e,0x67,0x64,0x61,0x62,0x73,0x70,0x75,0x76,0x7f,0x7c,0x79,0x7a,
-        0x3b,0x38,0x3d,0x3e,0x37,0x34,0x31,0x32,0x23,0x20,0x25,0x26,0x2f,0x2c,0x29,0x2a,
-        0x0b,0x08,0x0d,0x0e,0x07,0x04,0x01,0x02,0x13,0x10,0x15,0x16,0x1f,0x1c,0x19,0x1a,
-    ),
-    ( # 4
-        0x00,0x04,0x08,0x0c,0x10,0x14,0x18,0x1c,0x20,0x24,0x28,0x2c,0x30,0x34,0x38,0x3c,
-        0x40,0x44,0x48,0x4c,0x50,0x54,0x58,0x5c,0x60,0x64,0x68,0x6c,0x70,0x74,0x78,0x7c,
-        0x80,0x84,0x88,0x8c,0x90,0x94,0x98,0x9c,0xa0,0xa4,0xa8,0xac,0xb0,0xb4,0xb8,0xbc,
-        0xc0,0xc4,0xc8,0xcc,0xd0,0xd4,0xd8,0xdc,0xe0,0xe4,0xe8,0xec,0xf0,0xf4,0xf8,0xfc,
-        0x1b,0x1f,0x13,0x17,0x0b,0x0f,0x03,0x07,0x3b,0x3f,0x33,0x37,0x2b,0x2f,0x23,0x27,
-        0x5b,0x5f,0x53,0x57,0x4b,0x4f,0x43,0x47,0x7b,0x7f,0x73,0x77,0x6b,0x6f,0x63,0x67,
-        0x9b,0x9f,0x93,0x97,0x8b,0x8f,0x83,0x87,0xbb,0xbf,0xb3,0xb7,0xab,0xaf,0xa3,0xa7,
-        0xdb,0xdf,0xd3,0xd7,0xcb,0xcf,0xc3,0xc7,0xfb,0xff,0xf3,0xf7,0xeb,0xef,0xe3,0xe7,
-        0x36,0x32,0x3e,0x3a,0x26,0x22,0x2e,0x2a,0x16,0x12,0x1e,0x1a,0x06,0x02,0x0e,0x0a,
-        0x76,0x72,0x7e,0x7a,0x66,0x62,0x6e,0x6a,0x56,0x52,0x5e,0x5a,0x46,0x42,0x4e,0x4a,
-        0xb6,0xb2,0xbe,0xba,0xa6,0xa2,0xae,0xaa,0x96,0x92,0x9e,0x9a,0x86,0x82,0x8e,0x8a,
-        0xf6,0xf2,0xfe,0xfa,0xe6,0xe2,0xee,0xea,0xd6,0xd2,0xde,0xda,0xc6,0xc2,0xce,0xca,
-        0x2d,0x29,0x25,0x21,0x3d,0x39,0x35,0x31,0x0d,0x09,0x05,0x01,0x1d,0x19,0x15,0x11,
-        0x6d,0x69,0x65,0x61,0x7d,0x79,0x75,0x71,0x4d,0x49,0x45,0x41,0x5d,0x59,0x55,0x51,
-        0xad,0xa9,0xa5,0xa1,0xbd,0xb9,0xb5,0xb1,0x8d,0x89,0x85,0x81,0x9d,0x99,0x95,0x91,
-        0xed,0xe9,0xe5,0xe1,0xfd,0xf9,0xf5,0xf1,0xcd,0xc9,0xc5,0xc1,0xdd,0xd9,0xd5,0xd1,
-    ),
-    ( # 5
-        0x00,0x05,0x0a,0x0f,0x14,0x11,0x1e,0x1b,0x28,0x2d,0x22,0x27,0x3c,0x39,0x36,0x33,
-        0x50,0x55,0x5a,0x5f,0x44,0x41,0x4e,0x4b,0x78,0x7d,0x72,0x77,0x6c,0x69,0x66,0x63,
-        0xa0,0xa5,0xaa,0xaf,0xb4,0xb1,0xbe,0xbb,0x88,0x8d,0x82,0x87,0x9c,0x99,0x96,0x93,
-        0xf0,0xf5,0xfa,0xff,0xe4,0xe1,0xee,0xeb,0xd8,0xdd,0xd2,0xd7,0xcc,0xc9,0xc6,0xc3,
-        0x5b,0x5e,0x51,0x54,0x4f,0x4a,0x45,0x40,0x73,0x76,0x79,0x7c,0x67,0x62,0x6d,0x68,
-        0x0b,0x0e,0x01,0x04,0x1f,0x1a,0x15,0x10,0x23,0x26,0x29,0x2c,0x37,0x32,0x3d,0x38,
-        0xfb,0xfe,0xf1,0xf4,0xef,0xea,0xe5,0xe0,0xd3,0xd6,0xd9,0xdc,0xc7,0xc2,0xcd,0xc8,
-        0xab,0xae,0xa1,0xa4,0xbf,0xba,0xb5,0xb0,0x83,0x86,0x89,0x8c,0x97,0x92,0x9d,0x98,
-        0xb6,0xb3,0xbc,0xb9,0xa2,0xa7,0xa8,0xad,0x9e,0x9b,0x94,0x91,0x8a,0x8f,0x80,0x85,
-        0xe6,0xe3,0xec,0xe9,0xf2,0xf7,0xf8,0xfd,0xce,0xcb,0xc4,0xc1,0xda,0xdf,0xd0,0xd5,
-        0x16,0x13,0x1c,0x19,0x02,0x07,0x08,0x0d,0x3e,0x3b,0x34,0x31,0x2a,0x2f,0x20,0x25,
-        0x46,0x43,0x4c,0x49,0x52,0x57,0x58,0x5d,0x6e,0x6b,0x64,0x61,0x7a,0x7f,0x70,0x75,
-        0xed,0xe8,0xe7,0xe2,0xf9,0xfc,0xf3,0xf6,0xc5,0xc0,0xcf,0xca,0xd1,0xd4,0xdb,0xde,
-        0xbd,0xb8,0xb7,0xb2,0xa9,0xac,0xa3,0xa6,0x95,0x90,0x9f,0x9a,0x81,0x84,0x8b,0x8e,
-        0x4d,0x48,0x47,0x42,0x59,0x5c,0x53,0x56,0x65,0x60,0x6f,0x6a,0x71,0x74,0x7b,0x7e,
-        0x1d,0x18,0x17,0x12,0x09,0x0c,0x03,0x06,0x35,0x30,0x3f,0x3a,0x21,0x24,0x2b,0x2e,
-    ),
-    ( # 6
-        0x00,0x06,0x0c,0x0a,0x18,0x1e,0x14,0x12,0x30,0x36,0x3c,0x3a,0x28,0x2e,0x24,0x22,
-        0x60,0x66,0x6c,0x6a,0x78,0x7e,0x74,0x72,0x50,0x56,0x5c,0x5a,0x48,0x4e,0x44,0x42,
-        0xc0,0xc6,0xcc,0xca,0xd8,0xde,0xd4,0xd2,0xf0,0xf6,0xfc,0xfa,0xe8,0xee,0xe4,0xe2,
-        0xa0,0xa6,0xac,0xaa,0xb8,0xbe,0xb4,0xb2,0x90,0x96,0x9c,0x9a,0x88,0x8e,0x84,0x82,
-        0x9b,0x9d,0x97,0x91,0x83,0x85,0x8f,0x89,0xab,0xad,0xa7,0xa1,0xb3,0xb5,0xbf,0xb9,
-        0xfb,0xfd,0xf7,0xf1,0xe3,0xe5,0xef,0xe9,0xcb,0xcd,0xc7,0xc1,0xd3,0xd5,0xdf,0xd9,
-        0x5b,0x5d,0x57,0x51,0x43,0x45,0x4f,0x49,0x6b,0x6d,0x67,0x61,0x73,0x75,0x7f,0x79,
-        0x3b,0x3d,0x37,0x31,0x23,0x25,0x2f,0x29,0x0b,0x0d,0x07,0x01,0x13,0x15,0x1f,0x19,
-        0x2d,0x2b,0x21,0x27,0x35,0x33,0x39,0x3f,0x1d,0x1b,0x11,0x17,0x05,0x03,0x09,0x0f,
-        0x4d,0x4b,0x41,0x47,0x55,0x53,0x59,0x5f,0x7d,0x7b,0x71,0x77,0x65,0x63,0x69,0x6f,
-        0xed,0xeb,0xe1,0xe7,0xf5,0xf3,0xf9,0xff,0xdd,0xdb,0xd1,0xd7,0xc5,0xc3,0xc9,0xcf,
-        0x8d,0x8b,0x81,0x87,0x95,0x93,0x99,0x9f,0xbd,0xbb,0xb1,0xb7,0xa5,0xa3,0xa9,0xaf,
-        0xb6,0xb0,0xba,0xbc,0xae,0xa8,0xa2,0xa4,0x86,0x80,0x8a,0x8c,0x9e,0x98,0x92,0x94,
-        0xd6,0xd0,0xda,0xdc,0xce,0xc8,0xc2,0xc4,0xe6,0xe0,0xea,0xec,0xfe,0xf8,0xf2,0xf4,
-        0x76,0x70,0x7a,0x7c,0x6e,0x68,0x62,0x64,0x46,0x40,0x4a,0x4c,0x5e,0x58,0x52,0x54,
-        0x16,0x10,0x1a,0x1c,0x0e,0x08,0x02,0x04,0x26,0x20,0x2a,0x2c,0x3e,0x38,0x32,0x34,
-    ),
-    ( # 7
-        0x00,0x07,0x0e,0x09,0x1c,0x1b,0x12,0x15,0x38,0x3f,0x36,0x31,0x24,0x23,0x2a,0x2d,
-        0x70,0x77,0x7e,0x79,0x6c,0x6b,0x62,0x65,0x48,0x4f,0x46,0x41,0x54,0x53,0x5a,0x5d,
-        0xe0,0xe7,0xee,0xe9,0xfc,0xfb,0xf2,0xf5,0xd8,0xdf,0xd6,0xd1,0xc4,0xc3,0xca,0xcd,
-        0x90,0x97,0x9e,0x99,0x8c,0x8b,0x82,0x85,0xa8,0xaf,0xa6,0xa1,0xb4,0xb3,0xba,0xbd,
-        0xdb,0xdc,0xd5,0xd2,0xc7,0xc0,0xc9,0xce,0xe3,0xe4,0xed,0xea,0xff,0xf8,0xf1,0xf6,
-        0xab,0xac,0xa5,0xa2,0xb7,0xb0,0xb9,0xbe,0x93,0x94,0x9d,0x9a,0x8f,0x88,0x81,0x86,
-        0x3b,0x3c,0x35,0x32,0x27,0x20,0x29,0x2e,0x03,0x04,0x0d,0x0a,0x1f,0x18,0x11,0x16,
-        0x4b,0x4c,0x45,0x42,0x57,0x50,0x59,0x5e,0x73,0x74,0x7d,0x7a,0x6f,0x68,0x61,0x66,
-        0xad,0xaa,0xa3,0xa4,0xb1,0xb6,0xbf,0xb8,0x95,0x92,0x9b,0x9c,0x89,0x8e,0x87,0x80,
-        0xdd,0xda,0xd3,0xd4,0xc1,0xc6,0xcf,0xc8,0xe5,0xe2,0xeb,0xec,0xf9,0xfe,0xf7,0xf0,
-        0x4d,0x4a,0x43,0x44,0x51,0x56,0x5f,0x58,0x75,0x72,0x7b,0x7c,0x69,0x6e,0x67,0x60,
-        0x3d,0x3a,0x33,0x34,0x21,0x26,0x2f,0x28,0x05,0x02,0x0b,0x0c,0x19,0x1e,0x17,0x10,
-        0x76,0x71,0x78,0x7f,0x6a,0x6d,0x64,0x63,0x4e,0x49,0x40,0x47,0x52,0x55,0x5c,0x5b,
-        0x06,0x01,0x08,0x0f,0x1a,0x1d,0x14,0x13,0x3e,0x39,0x30,0x37,0x22,0x25,0x2c,0x2b,
-        0x96,0x91,0x98,0x9f,0x8a,0x8d,0x84,0x83,0xae,0xa9,0xa0,0xa7,0xb2,0xb5,0xbc,0xbb,
-        0xe6,0xe1,0xe8,0xef,0xfa,0xfd,0xf4,0xf3,0xde,0xd9,0xd0,0xd7,0xc2,0xc5,0xcc,0xcb,
-    ),
-    ( # 8
-        0x00,0x08,0x10,0x18,0x20,0x28,0x30,0x38,0x40,0x48,0x50,0x58,0x60,0x68,0x70,0x78,
-        0x80,0x88,0x90,0x98,0xa0,0xa8,0xb0,0xb8,0xc0,0xc8,0xd0,0xd8,0xe0,0xe8,0xf0,0xf8,
-        0x1b,0x13,0x0b,0x03,0x3b,0x33,0x2b,0x23,0x5b,0x53,0x4b,0x43,0x7b,0x73,0x6b,0x63,
-        0x9b,0x93,0x8b,0x83,0xbb,0xb3,0xab,0xa3,0xdb,0xd3,0xcb,0xc3,0xfb,0xf3,0xeb,0xe3,
-        0x36,0x3e,0x26,0x2e,0x16,0x1e,0x06,0x0e,0x76,0x7e,0x66,0x6e,0x56,0x5e,0x46,0x4e,
-        0xb6,0xbe,0xa6,0xae,0x96,0x9e,0x86,0x8e,0xf6,0xfe,0xe6,0xee,0xd6,0xde,0xc6,0xce,
-        0x2d,0x25,0x3d,0x35,0x0d,0x05,0x1d,0x15,0x6d,0x65,0x7d,0x75,0x4d,0x45,0x5d,0x55,
-        0xad,0xa5,0xbd,0xb5,0x8d,0x85,0x9d,0x95,0xed,0xe5,0xfd,0xf5,0xcd,0xc5,0xdd,0xd5,
-        0x6c,0x64,0x7c,0x74,0x4c,0x44,0x5c,0x54,0x2c,0x24,0x3c,0x34,0x0c,0x04,0x1c,0x14,
-        0xec,0xe4,0xfc,0xf4,0xcc,0xc4,0xdc,0xd4,0xac,0xa4,0xbc,0xb4,0x8c,0x84,0x9c,0x94,
-        0x77,0x7f,0x67,0x6f,0x57,0x5f,0x47,0x4f,0x37,0x3f,0x27,0x2f,0x17,0x1f,0x07,0x0f,
-        0xf7,0xff,0xe7,0xef,0xd7,0xdf,0xc7,0xcf,0xb7,0xbf,0xa7,0xaf,0x97,0x9f,0x87,0x8f,
-        0x5a,0x52,0x4a,0x42,0x7a,0x72,0x6a,0x62,0x1a,0x12,0x0a,0x02,0x3a,0x32,0x2a,0x22,
-        0xda,0xd2,0xca,0xc2,0xfa,0xf2,0xea,0xe2,0x9a,0x92,0x8a,0x82,0xba,0xb2,0xaa,0xa2,
-        0x41,0x49,0x51,0x59,0x61,0x69,0x71,0x79,0x01,0x09,0x11,0x19,0x21,0x29,0x31,0x39,
-        0xc1,0xc9,0xd1,0xd9,0xe1,0xe9,0xf1,0xf9,0x81,0x89,0x91,0x99,0xa1,0xa9,0xb1,0xb9,
-    ),
-    ( # 9
-        0x00,0x09,0x12,0x1b,0x24,0x2d,0x36,0x3f,0x48,0x41,0x5a,0x53,0x6c,0x65,0x7e,0x77,
-        0x90,0x99,0x82,0x8b,0xb4,0xbd,0xa6,0xaf,0xd8,0xd1,0xca,0xc3,0xfc,0xf5,0xee,0xe7,
-        0x3b,0x32,0x29,0x20,0x1f,0x16,0x0d,0x04,0x73,0x7a,0x61,0x68,0x57,0x5e,0x45,0x4c,
-        0xab,0xa2,0xb9,0xb0,0x8f,0x86,0x9d,0x94,0xe3,0xea,0xf1,0xf8,0xc7,0xce,0xd5,0xdc,
-        0x76,0x7f,0x64,0x6d,0x52,0x5b,0x40,0x49,0x3e,0x37,0x2c,0x25,0x1a,0x13,0x08,0x01,
-        0xe6,0xef,0xf4,0xfd,0xc2,0xcb,0xd0,0xd9,0xae,0xa7,0xbc,0xb5,0x8a,0x83,0x98,0x91,
-        0x4d,0x44,0x5f,0x56,0x69,0x60,0x7b,0x72,0x05,0x0c,0x17,0x1e,0x21,0x28,0x33,0x3a,
-        0xdd,0xd4,0xcf,0xc6,0xf9,0xf0,0xeb,0xe2,0x95,0x9c,0x87,0x8e,0xb1,0xb8,0xa3,0xaa,
-        0xec,0xe5,0xfe,0xf7,0xc8,0xc1,0xda,0xd3,0xa4,0xad,0xb6,0xbf,0x80,0x89,0x92,0x9b,
-        0x7c,0x75,0x6e,0x67,0x58,0x51,0x4a,0x43,0x34,0x3d,0x26,0x2f,0x10,0x19,0x02,0x0b,
-        0xd7,0xde,0xc5,0xcc,0xf3,0xfa,0xe1,0xe8,0x9f,0x96,0x8d,0x84,0xbb,0xb2,0xa9,0xa0,
-        0x47,0x4e,0x55,0x5c,0x63,0x6a,0x71,0x78,0x0f,0x06,0x1d,0x14,0x2b,0x22,0x39,0x30,
-        0x9a,0x93,0x88,0x81,0xbe,0xb7,0xac,0xa5,0xd2,0xdb,0xc0,0xc9,0xf6,0xff,0xe4,0xed,
-        0x0a,0x03,0x18,0x11,0x2e,0x27,0x3c,0x35,0x42,0x4b,0x50,0x59,0x66,0x6f,0x74,0x7d,
-        0xa1,0xa8,0xb3,0xba,0x85,0x8c,0x97,0x9e,0xe9,0xe0,0xfb,0xf2,0xcd,0xc4,0xdf,0xd6,
-        0x31,0x38,0x23,0x2a,0x15,0x1c,0x07,0x0e,0x79,0x70,0x6b,0x62,0x5d,0x54,0x4f,0x46,
-    ),
-    ( # 10
-        0x00,0x0a,0x14,0x1e,0x28,0x22,0x3c,0x36,0x50,0x5a,0x44,0x4e,0x78,0x72,0x6c,0x66,
-        0xa0,0xaa,0xb4,0xbe,0x88,0x82,0x9c,0x96,0xf0,0xfa,0xe4,0xee,0xd8,0xd2,0xcc,0xc6,
-        0x5b,0x51,0x4f,0x45,0x73,0x79,0x67,0x6d,0x0b,0x01,0x1f,0x15,0x23,0x29,0x37,0x3d,
-        0xfb,0xf1,0xef,0xe5,0xd3,0xd9,0xc7,0xcd,0xab,0xa1,0xbf,0xb5,0x83,0x89,0x97,0x9d,
-        0xb6,0xbc,0xa2,0xa8,0x9e,0x94,0x8a,0x80,0xe6,0xec,0xf2,0xf8,0xce,0xc4,0xda,0xd0,
-        0x16,0x1c,0x02,0x08,0x3e,0x34,0x2a,0x20,0x46,0x4c,0x52,0x58,0x6e,0x64,0x7a,0x70,
-        0xed,0xe7,0xf9,0xf3,0xc5,0xcf,0xd1,0xdb,0xbd,0xb7,0xa9,0xa3,0x95,0x9f,0x81,0x8b,
-        0x4d,0x47,0x59,0x53,0x65,0x6f,0x71,0x7b,0x1d,0x17,0x09,0x03,0x35,0x3f,0x21,0x2b,
-        0x77,0x7d,0x63,0x69,0x5f,0x55,0x4b,0x41,0x27,0x2d,0x33,0x39,0x0f,0x05,0x1b,0x11,
-        0xd7,0xdd,0xc3,0xc9,0xff,0xf5,0xeb,0xe1,0x87,0x8d,0x93,0x99,0xaf,0xa5,0xbb,0xb1,
-        0x2c,0x26,0x38,0x32,0x04,0x0e,0x10,0x1a,0x7c,0x76,0x68,0x62,0x54,0x5e,0x40,0x4a,
-        0x8c,0x86,0x98,0x92,0xa4,0xae,0xb0,0xba,0xdc,0xd6,0xc8,0xc2,0xf4,0xfe,0xe0,0xea,
-        0xc1,0xcb,0xd5,0xdf,0xe9,0xe3,0xfd,0xf7,0x91,0x9b,0x85,0x8f,0xb9,0xb3,0xad,0xa7,
-        0x61,0x6b,0x75,0x7f,0x49,0x43,0x5d,0x57,0x31,0x3b,0x25,0x2f,0x19,0x13,0x0d,0x07,
-        0x9a,0x90,0x8e,0x84,0xb2,0xb8,0xa6,0xac,0xca,0xc0,0xde,0xd4,0xe2,0xe8,0xf6,0xfc,
-        0x3a,0x30,0x2e,0x24,0x12,0x18,0x06,0x0c,0x6a,0x60,0x7e,0x74,0x42,0x48,0x56,0x5c,
-    ),
-    ( # 11
-        0x00,0x0b,0x16,0x1d,0x2c,0x27,0x3a,0x31,0x58,0x53,0x4e,0x45,0x74,0x7f,0x62,0x69,
-        0xb0,0xbb,0xa6,0xad,0x9c,0x97,0x8a,0x81,0xe8,0xe3,0xfe,0xf5,0xc4,0xcf,0xd2,0xd9,
-        0x7b,0x70,0x6d,0x66,0x57,0x5c,0x41,0x4a,0x23,0x28,0x35,0x3e,0x0f,0x04,0x19,0x12,
-        0xcb,0xc0,0xdd,0xd6,0xe7,0xec,0xf1,0xfa,0x93,0x98,0x85,0x8e,0xbf,0xb4,0xa9,0xa2,
-        0xf6,0xfd,0xe0,0xeb,0xda,0xd1,0xcc,0xc7,0xae,0xa5,0xb8,0xb3,0x82,0x89,0x94,0x9f,
-        0x46,0x4d,0x50,0x5b,0x6a,0x61,0x7c,0x77,0x1e,0x15,0x08,0x03,0x32,0x39,0x24,0x2f,
-        0x8d,0x86,0x9b,0x90,0xa1,0xaa,0xb7,0xbc,0xd5,0xde,0xc3,0xc8,0xf9,0xf2,0xef,0xe4,
-        0x3d,0x36,0x2b,0x20,0x11,0x1a,0x07,0x0c,0x65,0x6e,0x73,0x78,0x49,0x42,0x5f,0x54,
-        0xf7,0xfc,0xe1,0xea,0xdb,0xd0,0xcd,0xc6,0xaf,0xa4,0xb9,0xb2,0x83,0x88,0x95,0x9e,
-        0x47,0x4c,0x51,0x5a,0x6b,0x60,0x7d,0x76,0x1f,0x14,0x09,0x02,0x33,0x38,0x25,0x2e,
-        0x8c,0x87,0x9a,0x91,0xa0,0xab,0xb6,0xbd,0xd4,0xdf,0xc2,0xc9,0xf8,0xf3,0xee,0xe5,
-        0x3c,0x37,0x2a,0x21,0x10,0x1b,0x06,0x0d,0x64,0x6f,0x72,0x79,0x48,0x43,0x5e,0x55,
-        0x01,0x0a,0x17,0x1c,0x2d,0x26,0x3b,0x30,0x59,0x52,0x4f,0x44,0x75,0x7e,0x63,0x68,
-        0xb1,0xba,0xa7,0xac,0x9d,0x96,0x8b,0x80,0xe9,0xe2,0xff,0xf4,0xc5,0xce,0xd3,0xd8,
-        0x7a,0x71,0x6c,0x67,0x56,0x5d,0x40,0x4b,0x22,0x29,0x34,0x3f,0x0e,0x05,0x18,0x13,
-        0xca,0xc1,0xdc,0xd7,0xe6,0xed,0xf0,0xfb,0x92,0x99,0x84,0x8f,0xbe,0xb5,0xa8,0xa3,
-    ),
-    ( # 12
-        0x00,0x0c,0x18,0x14,0x30,0x3c,0x28,0x24,0x60,0x6c,0x78,0x74,0x50,0x5c,0x48,0x44,
-        0xc0,0xcc,0xd8,0xd4,0xf0,0xfc,0xe8,0xe4,0xa0,0xac,0xb8,0xb4,0x90,0x9c,0x88,0x84,
-        0x9b,0x97,0x83,0x8f,0xab,0xa7,0xb3,0xbf,0xfb,0xf7,0xe3,0xef,0xcb,0xc7,0xd3,0xdf,
-        0x5b,0x57,0x43,0x4f,0x6b,0x67,0x73,0x7f,0x3b,0x37,0x23,0x2f,0x0b,0x07,0x13,0x1f,
-        0x2d,0x21,0x35,0x39,0x1d,0x11,0x05,0x09,0x4d,0x41,0x55,0x59,0x7d,0x71,0x65,0x69,
-        0xed,0xe1,0xf5,0xf9,0xdd,0xd1,0xc5,0xc9,0x8d,0x81,0x95,0x99,0xbd,0xb1,0xa5,0xa9,
-        0xb6,0xba,0xae,0xa2,0x86,0x8a,0x9e,0x92,0xd6,0xda,0xce,0xc2,0xe6,0xea,0xfe,0xf2,
-        0x76,0x7a,0x6e,0x62,0x46,0x4a,0x5e,0x52,0x16,0x1a,0x0e,0x02,0x26,0x2a,0x3e,0x32,
-        0x5a,0x56,0x42,0x4e,0x6a,0x66,0x72,0x7e,0x3a,0x36,0x22,0x2e,0x0a,0x06,0x12,0x1e,
-        0x9a,0x96,0x82,0x8e,0xaa,0xa6,0xb2,0xbe,0xfa,0xf6,0xe2,0xee,0xca,0xc6,0xd2,0xde,
-        0xc1,0xcd,0xd9,0xd5,0xf1,0xfd,0xe9,0xe5,0xa1,0xad,0xb9,0xb5,0x91,0x9d,0x89,0x85,
-        0x01,0x0d,0x19,0x15,0x31,0x3d,0x29,0x25,0x61,0x6d,0x79,0x75,0x51,0x5d,0x49,0x45,
-        0x77,0x7b,0x6f,0x63,0x47,0x4b,0x5f,0x53,0x17,0x1b,0x0f,0x03,0x27,0x2b,0x3f,0x33,
-        0xb7,0xbb,0xaf,0xa3,0x87,0x8b,0x9f,0x93,0xd7,0xdb,0xcf,0xc3,0xe7,0xeb,0xff,0xf3,
-        0xec,0xe0,0xf4,0xf8,0xdc,0xd0,0xc4,0xc8,0x8c,0x80,0x94,0x98,0xbc,0xb0,0xa4,0xa8,
-        0x2c,0x20,0x34,0x38,0x1c,0x10,0x04,0x08,0x4c,0x40,0x54,0x58,0x7c,0x70,0x64,0x68,
-    ),
-    ( # 13
-        0x00,0x0d,0x1a,0x17,0x34,0x39,0x2e,0x23,0x68,0x65,0x72,0x7f,0x5c,0x51,0x46,0x4b,
-        0xd0,0xdd,0xca,0xc7,0xe4,0xe9,0xfe,0xf3,0xb8,0xb5,0xa2,0xaf,0x8c,0x81,0x96,0x9b,
-        0xbb,0xb6,0xa1,0xac,0x8f,0x82,0x95,0x98,0xd3,0xde,0xc9,0xc4,0xe7,0xea,0xfd,0xf0,
-        0x6b,0x66,0x71,0x7c,0x5f,0x52,0x45,0x48,0x03,0x0e,0x19,0x14,0x37,0x3a,0x2d,0x20,
-        0x6d,0x60,0x77,0x7a,0x59,0x54,0x43,0x4e,0x05,0x08,0x1f,0x12,0x31,0x3c,0x2b,0x26,
-        0xbd,0xb0,0xa7,0xaa,0x89,0x84,0x93,0x9e,0xd5,0xd8,0xcf,0xc2,0xe1,0xec,0xfb,0xf6,
-        0xd6,0xdb,0xcc,0xc1,0xe2,0xef,0xf8,0xf5,0xbe,0xb3,0xa4,0xa9,0x8a,0x87,0x90,0x9d,
-        0x06,0x0b,0x1c,0x11,0x32,0x3f,0x28,0x25,0x6e,0x63,0x74,0x79,0x5a,0x57,0x40,0x4d,
-        0xda,0xd7,0xc0,0xcd,0xee,0xe3,0xf4,0xf9,0xb2,0xbf,0xa8,0xa5,0x86,0x8b,0x9c,0x91,
-        0x0a,0x07,0x10,0x1d,0x3e,0x33,0x24,0x29,0x62,0x6f,0x78,0x75,0x56,0x5b,0x4c,0x41,
-        0x61,0x6c,0x7b,0x76,0x55,0x58,0x4f,0x42,0x09,0x04,0x13,0x1e,0x3d,0x30,0x27,0x2a,
-        0xb1,0xbc,0xab,0xa6,0x85,0x88,0x9f,0x92,0xd9,0xd4,0xc3,0xce,0xed,0xe0,0xf7,0xfa,
-        0xb7,0xba,0xad,0xa0,0x83,0x8e,0x99,0x94,0xdf,0xd2,0xc5,0xc8,0xeb,0xe6,0xf1,0xfc,
-        0x67,0x6a,0x7d,0x70,0x53,0x5e,0x49,0x44,0x0f,0x02,0x15,0x18,0x3b,0x36,0x21,0x2c,
-        0x0c,0x01,0x16,0x1b,0x38,0x35,0x22,0x2f,0x64,0x69,0x7e,0x73,0x50,0x5d,0x4a,0x47,
-        0xdc,0xd1,0xc6,0xcb,0xe8,0xe5,0xf2,0xff,0xb4,0xb9,0xae,0xa3,0x80,0x8d,0x9a,0x97,
-    ),
-    ( # 14
-        0x00,0x0e,0x1c,0x12,0x38,0x36,0x24,0x2a,0x70,0x7e,0x6c,0x62,0x48,0x46,0x54,0x5a,
-        0xe0,0xee,0xfc,0xf2,0xd8,0xd6,0xc4,0xca,0x90,0x9e,0x8c,0x82,0xa8,0xa6,0xb4,0xba,
-        0xdb,0xd5,0xc7,0xc9,0xe3,0xed,0xff,0xf1,0xab,0xa5,0xb7,0xb9,0x93,0x9d,0x8f,0x81,
-        0x3b,0x35,0x27,0x29,0x03,0x0d,0x1f,0x11,0x4b,0x45,0x57,0x59,0x73,0x7d,0x6f,0x61,
-        0xad,0xa3,0xb1,0xbf,0x95,0x9b,0x89,0x87,0xdd,0xd3,0xc1,0xcf,0xe5,0xeb,0xf9,0xf7,
-        0x4d,0x43,0x51,0x5f,0x75,0x7b,0x69,0x67,0x3d,0x33,0x21,0x2f,0x05,0x0b,0x19,0x17,
-        0x76,0x78,0x6a,0x64,0x4e,0x40,0x52,0x5c,0x06,0x08,0x1a,0x14,0x3e,0x30,0x22,0x2c,
-        0x96,0x98,0x8a,0x84,0xae,0xa0,0xb2,0xbc,0xe6,0xe8,0xfa,0xf4,0xde,0xd0,0xc2,0xcc,
-        0x41,0x4f,0x5d,0x53,0x79,0x77,0x65,0x6b,0x31,0x3f,0x2d,0x23,0x09,0x07,0x15,0x1b,
-        0xa1,0xaf,0xbd,0xb3,0x99,0x97,0x85,0x8b,0xd1,0xdf,0xcd,0xc3,0xe9,0xe7,0xf5,0xfb,
-        0x9a,0x94,0x86,0x88,0xa2,0xac,0xbe,0xb0,0xea,0xe4,0xf6,0xf8,0xd2,0xdc,0xce,0xc0,
-        0x7a,0x74,0x66,0x68,0x42,0x4c,0x5e,0x50,0x0a,0x04,0x16,0x18,0x32,0x3c,0x2e,0x20,
-        0xec,0xe2,0xf0,0xfe,0xd4,0xda,0xc8,0xc6,0x9c,0x92,0x80,0x8e,0xa4,0xaa,0xb8,0xb6,
-        0x0c,0x02,0x10,0x1e,0x34,0x3a,0x28,0x26,0x7c,0x72,0x60,0x6e,0x44,0x4a,0x58,0x56,
-        0x37,0x39,0x2b,0x25,0x0f,0x01,0x13,0x1d,0x47,0x49,0x5b,0x55,0x7f,0x71,0x63,0x6d,
-        0xd7,0xd9,0xcb,0xc5,0xef,0xe1,0xf3,0xfd,0xa7,0xa9,0xbb,0xb5,0x9f,0x91,0x83,0x8d,
-    ),
-    ( # 15
-        0x00,0x0f,0x1e,0x11,0x3c,0x33,0x22,0x2d,0x78,0x77,0x66,0x69,0x44,0x4b,0x5a,0x55,
-        0xf0,0xff,0xee,0xe1,0xcc,0xc3,0xd2,0xdd,0x88,0x87,0x96,0x99,0xb4,0xbb,0xaa,0xa5,
-        0xfb,0xf4,0xe5,0xea,0xc7,0xc8,0xd9,0xd6,0x83,0x8c,0x9d,0x92,0xbf,0xb0,0xa1,0xae,
-        0x0b,0x04,0x15,0x1a,0x37,0x38,0x29,0x26,0x73,0x7c,0x6d,0x62,0x4f,0x40,0x51,0x5e,
-        0xed,0xe2,0xf3,0xfc,0xd1,0xde,0xcf,0xc0,0x95,0x9a,0x8b,0x84,0xa9,0xa6,0xb7,0xb8,
-        0x1d,0x12,0x03,0x0c,0x21,0x2e,0x3f,0x30,0x65,0x6a,0x7b,0x74,0x59,0x56,0x47,0x48,
-        0x16,0x19,0x08,0x07,0x2a,0x25,0x34,0x3b,0x6e,0x61,0x70,0x7f,0x52,0x5d,0x4c,0x43,
-        0xe6,0xe9,0xf8,0xf7,0xda,0xd5,0xc4,0xcb,0x9e,0x91,0x80,0x8f,0xa2,0xad,0xbc,0xb3,
-        0xc1,0xce,0xdf,0xd0,0xfd,0xf2,0xe3,0xec,0xb9,0xb6,0xa7,0xa8,0x85,0x8a,0x9b,0x94,
-        0x31,0x3e,0x2f,0x20,0x0d,0x02,0x13,0x1c,0x49,0x46,0x57,0x58,0x75,0x7a,0x6b,0x64,
-        0x3a,0x35,0x24,0x2b,0x06,0x09,0x18,0x17,0x42,0x4d,0x5c,0x53,0x7e,0x71,0x60,0x6f,
-        0xca,0xc5,0xd4,0xdb,0xf6,0xf9,0xe8,0xe7,0xb2,0xbd,0xac,0xa3,0x8e,0x81,0x90,0x9f,
-        0x2c,0x23,0x32,0x3d,0x10,0x1f,0x0e,0x01,0x54,0x5b,0x4a,0x45,0x68,0x67,0x76,0x79,
-        0xdc,0xd3,0xc2,0xcd,0xe0,0xef,0xfe,0xf1,0xa4,0xab,0xba,0xb5,0x98,0x97,0x86,0x89,
-        0xd7,0xd8,0xc9,0xc6,0xeb,0xe4,0xf5,0xfa,0xaf,0xa0,0xb1,0xbe,0x93,0x9c,0x8d,0x82,
-        0x27,0x28,0x39,0x36,0x1b,0x14,0x05,0x0a,0x5f,0x50,0x41,0x4e,0x63,0x6c,0x7d,0x72,
-    ),
-    ( # 16
-        0x00,0x10,0x20,0x30,0x40,0x50,0x60,0x70,0x80,0x90,0xa0,0xb0,0xc0,0xd0,0xe0,0xf0,
-        0x1b,0x0b,0x3b,0x2b,0x5b,0x4b,0x7b,0x6b,0x9b,0x8b,0xbb,0xab,0xdb,0xcb,0xfb,0xeb,
-        0x36,0x26,0x16,0x06,0x76,0x66,0x56,0x46,0xb6,0xa6,0x96,0x86,0xf6,0xe6,0xd6,0xc6,
-        0x2d,0x3d,0x0d,0x1d,0x6d,0x7d,0x4d,0x5d,0xad,0xbd,0x8d,0x9d,0xed,0xfd,0xcd,0xdd,
-        0x6c,0x7c,0x4c,0x5c,0x2c,0x3c,0x0c,0x1c,0xec,0xfc,0xcc,0xdc,0xac,0xbc,0x8c,0x9c,
-        0x77,0x67,0x57,0x47,0x37,0x27,0x17,0x07,0xf7,0xe7,0xd7,0xc7,0xb7,0xa7,0x97,0x87,
-        0x5a,0x4a,0x7a,0x6a,0x1a,0x0a,0x3a,0x2a,0xda,0xca,0xfa,0xea,0x9a,0x8a,0xba,0xaa,
-        0x41,0x51,0x61,0x71,0x01,0x11,0x21,0x31,0xc1,0xd1,0xe1,0xf1,0x81,0x91,0xa1,0xb1,
-        0xd8,0xc8,0xf8,0xe8,0x98,0x88,0xb8,0xa8,0x58,0x48,0x78,0x68,0x18,0x08,0x38,0x28,
-        0xc3,0xd3,0xe3,0xf3,0x83,0x93,0xa3,0xb3,0x43,0x53,0x63,0x73,0x03,0x13,0x23,0x33,
-        0xee,0xfe,0xce,0xde,0xae,0xbe,0x8e,0x9e,0x6e,0x7e,0x4e,0x5e,0x2e,0x3e,0x0e,0x1e,
-        0xf5,0xe5,0xd5,0xc5,0xb5,0xa5,0x95,0x85,0x75,0x65,0x55,0x45,0x35,0x25,0x15,0x05,
-        0xb4,0xa4,0x94,0x84,0xf4,0xe4,0xd4,0xc4,0x34,0x24,0x14,0x04,0x74,0x64,0x54,0x44,
-        0xaf,0xbf,0x8f,0x9f,0xef,0xff,0xcf,0xdf,0x2f,0x3f,0x0f,0x1f,0x6f,0x7f,0x4f,0x5f,
-        0x82,0x92,0xa2,0xb2,0xc2,0xd2,0xe2,0xf2,0x02,0x12,0x22,0x32,0x42,0x52,0x62,0x72,
-        0x99,0x89,0xb9,0xa9,0xd9,0xc9,0xf9,0xe9,0x19,0x09,0x39,0x29,0x59,0x49,0x79,0x69,
-    ),
-    ( # 17
-        0x00,0x11,0x22,0x33,0x44,0x55,0x66,0x77,0x88,0x99,0xaa,0xbb,0xcc,0xdd,0xee,0xff,
-        0x0b,0x1a,0x29,0x38,0x4f,0x5e,0x6d,0x7c,0x83,0x92,0xa1,0xb0,0xc7,0xd6,0xe5,0xf4,
-        0x16,0x07,0x34,0x25,0x52,0x43,0x70,0x61,0x9e,0x8f,0xbc,0xad,0xda,0xcb,0xf8,0xe9,
-        0x1d,0x0c,0x3f,0x2e,0x59,0x48,0x7b,0x6a,0x95,0x84,0xb7,0xa6,0xd1,0xc0,0xf3,0xe2,
-        0x2c,0x3d,0x0e,0x1f,0x68,0x79,0x4a,0x5b,0xa4,0xb5,0x86,0x97,0xe0,0xf1,0xc2,0xd3,
-        0x27,0x36,0x05,0x14,0x63,0x72,0x41,0x50,0xaf,0xbe,0x8d,0x9c,0xeb,0xfa,0xc9,0xd8,
-        0x3a,0x2b,0x18,0x09,0x7e,0x6f,0x5c,0x4d,0xb2,0xa3,0x90,0x81,0xf6,0xe7,0xd4,0xc5,
-        0x31,0x20,0x13,0x02,0x75,0x64,0x57,0x46,0xb9,0xa8,0x9b,0x8a,0xfd,0xec,0xdf,0xce,
-        0x58,0x49,0x7a,0x6b,0x1c,0x0d,0x3e,0x2f,0xd0,0xc1,0xf2,0xe3,0x94,0x85,0xb6,0xa7,
-        0x53,0x42,0x71,0x60,0x17,0x06,0x35,0x24,0xdb,0xca,0xf9,0xe8,0x9f,0x8e,0xbd,0xac,
-        0x4e,0x5f,0x6c,0x7d,0x0a,0x1b,0x28,0x39,0xc6,0xd7,0xe4,0xf5,0x82,0x93,0xa0,0xb1,
-        0x45,0x54,0x67,0x76,0x01,0x10,0x23,0x32,0xcd,0xdc,0xef,0xfe,0x89,0x98,0xab,0xba,
-        0x74,0x65,0x56,0x47,0x30,0x21,0x12,0x03,0xfc,0xed,0xde,0xcf,0xb8,0xa9,0x9a,0x8b,
-        0x7f,0x6e,0x5d,0x4c,0x3b,0x2a,0x19,0x08,0xf7,0xe6,0xd5,0xc4,0xb3,0xa2,0x91,0x80,
-        0x62,0x73,0x40,0x51,0x26,0x37,0x04,0x15,0xea,0xfb,0xc8,0xd9,0xae,0xbf,0x8c,0x9d,
-        0x69,0x78,0x4b,0x5a,0x2d,0x3c,0x0f,0x1e,0xe1,0xf0,0xc3,0xd2,0xa5,0xb4,0x87,0x96,
-    ),
-    ( # 18
-        0x00,0x12,0x24,0x36,0x48,0x5a,0x6c,0x7e,0x90,0x82,0xb4,0xa6,0xd8,0xca,0xfc,0xee,
-        0x3b,0x29,0x1f,0x0d,0x73,0x61,0x57,0x45,0xab,0xb9,0x8f,0x9d,0xe3,0xf1,0xc7,0xd5,
-        0x76,0x64,0x52,0x40,0x3e,0x2c,0x1a,0x08,0xe6,0xf4,0xc2,0xd0,0xae,0xbc,0x8a,0x98,
-        0x4d,0x5f,0x69,0x7b,0x05,0x17,0x21,0x33,0xdd,0xcf,0xf9,0xeb,0x95,0x87,0xb1,0xa3,
-        0xec,0xfe,0xc8,0xda,0xa4,0xb6,0x80,0x92,0x7c,0x6e,0x58,0x4a,0x34,0x26,0x10,0x02,
-        0xd7,0xc5,0xf3,0xe1,0x9f,0x8d,0xbb,0xa9,0x47,0x55,0x63,0x71,0x0f,0x1d,0x2b,0x39,
-        0x9a,0x88,0xbe,0xac,0xd2,0xc0,0xf6,0xe4,0x0a,0x18,0x2e,0x3c,0x42,0x50,0x66,0x74,
-        0xa1,0xb3,0x85,0x97,0xe9,0xfb,0xcd,0xdf,0x31,0x23,0x15,0x07,0x79,0x6b,0x5d,0x4f,
-        0xc3,0xd1,0xe7,0xf5,0x8b,0x99,0xaf,0xbd,0x53,0x41,0x77,0x65,0x1b,0x09,0x3f,0x2d,
-        0xf8,0xea,0xdc,0xce,0xb0,0xa2,0x94,0x86,0x68,0x7a,0x4c,0x5e,0x20,0x32,0x04,0x16,
-        0xb5,0xa7,0x91,0x83,0xfd,0xef,0xd9,0xcb,0x25,0x37,0x01,0x13,0x6d,0x7f,0x49,0x5b,
-        0x8e,0x9c,0xaa,0xb8,0xc6,0xd4,0xe2,0xf0,0x1e,0x0c,0x3a,0x28,0x56,0x44,0x72,0x60,
-        0x2f,0x3d,0x0b,0x19,0x67,0x75,0x43,0x51,0xbf,0xad,0x9b,0x89,0xf7,0xe5,0xd3,0xc1,
-        0x14,0x06,0x30,0x22,0x5c,0x4e,0x78,0x6a,0x84,0x96,0xa0,0xb2,0xcc,0xde,0xe8,0xfa,
-        0x59,0x4b,0x7d,0x6f,0x11,0x03,0x35,0x27,0xc9,0xdb,0xed,0xff,0x81,0x93,0xa5,0xb7,
-        0x62,0x70,0x46,0x54,0x2a,0x38,0x0e,0x1c,0xf2,0xe0,0xd6,0xc4,0xba,0xa8,0x9e,0x8c,
-    ),
-    ( # 19
-        0x00,0x13,0x26,0x35,0x4c,0x5f,0x6a,0x79,0x98,0x8b,0xbe,0xad,0xd4,0xc7,0xf2,0xe1,
-        0x2b,0x38,0x0d,0x1e,0x67,0x74,0x41,0x52,0xb3,0xa0,0x95,0x86,0xff,0xec,0xd9,0xca,
-        0x56,0x45,0x70,0x63,0x1a,0x09,0x3c,0x2f,0xce,0xdd,0xe8,0xfb,0x82,0x91,0xa4,0xb7,
-        0x7d,0x6e,0x5b,0x48,0x31,0x22,0x17,0x04,0xe5,0xf6,0xc3,0xd0,0xa9,0xba,0x8f,0x9c,
-        0xac,0xbf,0x8a,0x99,0xe0,0xf3,0xc6,0xd5,0x34,0x27,0x12,0x01,0x78,0x6b,0x5e,0x4d,
-        0x87,0x94,0xa1,0xb2,0xcb,0xd8,0xed,0xfe,0x1f,0x0c,0x39,0x2a,0x53,0x40,0x75,0x66,
-        0xfa,0xe9,0xdc,0xcf,0xb6,0xa5,0x90,0x83,0x62,0x71,0x44,0x57,0x2e,0x3d,0x08,0x1b,
-        0xd1,0xc2,0xf7,0xe4,0x9d,0x8e,0xbb,0xa8,0x49,0x5a,0x6f,0x7c,0x05,0x16,0x23,0x30,
-        0x43,0x50,0x65,0x76,0x0f,0x1c,0x29,0x3a,0xdb,0xc8,0xfd,0xee,0x97,0x84,0xb1,0xa2,
-        0x68,0x7b,0x4e,0x5d,0x24,0x37,0x02,0x11,0xf0,0xe3,0xd6,0xc5,0xbc,0xaf,0x9a,0x89,
-        0x15,0x06,0x33,0x20,0x59,0x4a,0x7f,0x6c,0x8d,0x9e,0xab,0xb8,0xc1,0xd2,0xe7,0xf4,
-        0x3e,0x2d,0x18,0x0b,0x72,0x61,0x54,0x47,0xa6,0xb5,0x80,0x93,0xea,0xf9,0xcc,0xdf,
-        0xef,0xfc,0xc9,0xda,0xa3,0xb0,0x85,0x96,0x77,0x64,0x51,0x42,0x3b,0x28,0x1d,0x0e,
-        0xc4,0xd7,0xe2,0xf1,0x88,0x9b,0xae,0xbd,0x5c,0x4f,0x7a,0x69,0x10,0x03,0x36,0x25,
-        0xb9,0xaa,0x9f,0x8c,0xf5,0xe6,0xd3,0xc0,0x21,0x32,0x07,0x14,0x6d,0x7e,0x4b,0x58,
-        0x92,0x81,0xb4,0xa7,0xde,0xcd,0xf8,0xeb,0x0a,0x19,0x2c,0x3f,0x46,0x55,0x60,0x73,
-    ),
-    ( # 20
-        0x00,0x14,0x28,0x3c,0x50,0x44,0x78,0x6c,0xa0,0xb4,0x88,0x9c,0xf0,0xe4,0xd8,0xcc,
-        0x5b,0x4f,0x73,0x67,0x0b,0x1f,0x23,0x37,0xfb,0xef,0xd3,0xc7,0xab,0xbf,0x83,0x97,
-        0xb6,0xa2,0x9e,0x8a,0xe6,0xf2,0xce,0xda,0x16,0x02,0x3e,0x2a,0x46,0x52,0x6e,0x7a,
-        0xed,0xf9,0xc5,0xd1,0xbd,0xa9,0x95,0x81,0x4d,0x59,0x65,0x71,0x1d,0x09,0x35,0x21,
-        0x77,0x63,0x5f,0x4b,0x27,0x33,0x0f,0x1b,0xd7,0xc3,0xff,0xeb,0x87,0x93,0xaf,0xbb,
-        0x2c,0x38,0x04,0x10,0x7c,0x68,0x54,0x40,0x8c,0x98,0xa4,0xb0,0xdc,0xc8,0xf4,0xe0,
-        0xc1,0xd5,0xe9,0xfd,0x91,0x85,0xb9,0xad,0x61,0x75,0x49,0x5d,0x31,0x25,0x19,0x0d,
-        0x9a,0x8e,0xb2,0xa6,0xca,0xde,0xe2,0xf6,0x3a,0x2e,0x12,0x06,0x6a,0x7e,0x42,0x56,
-        0xee,0xfa,0xc6,0xd2,0xbe,0xaa,0x96,0x82,0x4e,0x5a,0x66,0x72,0x1e,0x0a,0x36,0x22,
-        0xb5,0xa1,0x9d,0x89,0xe5,0xf1,0xcd,0xd9,0x15,0x01,0x3d,0x29,0x45,0x51,0x6d,0x79,
-        0x58,0x4c,0x70,0x64,0x08,0x1c,0x20,0x34,0xf8,0xec,0xd0,0xc4,0xa8,0xbc,0x80,0x94,
-        0x03,0x17,0x2b,0x3f,0x53,0x47,0x7b,0x6f,0xa3,0xb7,0x8b,0x9f,0xf3,0xe7,0xdb,0xcf,
-        0x99,0x8d,0xb1,0xa5,0xc9,0xdd,0xe1,0xf5,0x39,0x2d,0x11,0x05,0x69,0x7d,0x41,0x55,
-        0xc2,0xd6,0xea,0xfe,0x92,0x86,0xba,0xae,0x62,0x76,0x4a,0x5e,0x32,0x26,0x1a,0x0e,
-        0x2f,0x3b,0x07,0x13,0x7f,0x6b,0x57,0x43,0x8f,0x9b,0xa7,0xb3,0xdf,0xcb,0xf7,0xe3,
-        0x74,0x60,0x5c,0x48,0x24,0x30,0x0c,0x18,0xd4,0xc0,0xfc,0xe8,0x84,0x90,0xac,0xb8,
-    ),
-    ( # 21
-        0x00,0x15,0x2a,0x3f,0x54,0x41,0x7e,0x6b,0xa8,0xbd,0x82,0x97,0xfc,0xe9,0xd6,0xc3,
-        0x4b,0x5e,0x61,0x74,0x1f,0x0a,0x35,0x20,0xe3,0xf6,0xc9,0xdc,0xb7,0xa2,0x9d,0x88,
-        0x96,0x83,0xbc,0xa9,0xc2,0xd7,0xe8,0xfd,0x3e,0x2b,0x14,0x01,0x6a,0x7f,0x40,0x55,
-        0xdd,0xc8,0xf7,0xe2,0x89,0x9c,0xa3,0xb6,0x75,0x60,0x5f,0x4a,0x21,0x34,0x0b,0x1e,
-        0x37,0x22,0x1d,0x08,0x63,0x76,0x49,0x5c,0x9f,0x8a,0xb5,0xa0,0xcb,0xde,0xe1,0xf4,
-        0x7c,0x69,0x56,0x43,0x28,0x3d,0x02,0x17,0xd4,0xc1,0xfe,0xeb,0x80,0x95,0xaa,0xbf,
-        0xa1,0xb4,0x8b,0x9e,0xf5,0xe0,0xdf,0xca,0x09,0x1c,0x23,0x36,0x5d,0x48,0x77,0x62,
-        0xea,0xff,0xc0,0xd5,0xbe,0xab,0x94,0x81,0x42,0x57,0x68,0x7d,0x16,0x03,0x3c,0x29,
-        0x6e,0x7b,0x44,0x51,0x3a,0x2f,0x10,0x05,0xc6,0xd3,0xec,0xf9,0x92,0x87,0xb8,0xad,
-        0x25,0x30,0x0f,0x1a,0x71,0x64,0x5b,0x4e,0x8d,0x98,0xa7,0xb2,0xd9,0xcc,0xf3,0xe6,
-        0xf8,0xed,0xd2,0xc7,0xac,0xb9,0x86,0x93,0x50,0x45,0x7a,0x6f,0x04,0x11,0x2e,0x3b,
-        0xb3,0xa6,0x99,0x8c,0xe7,0xf2,0xcd,0xd8,0x1b,0x0e,0x31,0x24,0x4f,0x5a,0x65,0x70,
-        0x59,0x4c,0x73,0x66,0x0d,0x18,0x27,0x32,0xf1,0xe4,0xdb,0xce,0xa5,0xb0,0x8f,0x9a,
-        0x12,0x07,0x38,0x2d,0x46,0x53,0x6c,0x79,0xba,0xaf,0x90,0x85,0xee,0xfb,0xc4,0xd1,
-        0xcf,0xda,0xe5,0xf0,0x9b,0x8e,0xb1,0xa4,0x67,0x72,0x4d,0x58,0x33,0x26,0x19,0x0c,
-        0x84,0x91,0xae,0xbb,0xd0,0xc5,0xfa,0xef,0x2c,0x39,0x06,0x13,0x78,0x6d,0x52,0x47,
-    ),
-    ( # 22
-        0x00,0x16,0x2c,0x3a,0x58,0x4e,0x74,0x62,0xb0,0xa6,0x9c,0x8a,0xe8,0xfe,0xc4,0xd2,
-        0x7b,0x6d,0x57,0x41,0x23,0x35,0x0f,0x19,0xcb,0xdd,0xe7,0xf1,0x93,0x85,0xbf,0xa9,
-        0xf6,0xe0,0xda,0xcc,0xae,0xb8,0x82,0x94,0x46,0x50,0x6a,0x7c,0x1e,0x08,0x32,0x24,
-        0x8d,0x9b,0xa1,0xb7,0xd5,0xc3,0xf9,0xef,0x3d,0x2b,0x11,0x07,0x65,0x73,0x49,0x5f,
-        0xf7,0xe1,0xdb,0xcd,0xaf,0xb9,0x83,0x95,0x47,0x51,0x6b,0x7d,0x1f,0x09,0x33,0x25,
-        0x8c,0x9a,0xa0,0xb6,0xd4,0xc2,0xf8,0xee,0x3c,0x2a,0x10,0x06,0x64,0x72,0x48,0x5e,
-        0x01,0x17,0x2d,0x3b,0x59,0x4f,0x75,0x63,0xb1,0xa7,0x9d,0x8b,0xe9,0xff,0xc5,0xd3,
-        0x7a,0x6c,0x56,0x40,0x22,0x34,0x0e,0x18,0xca,0xdc,0xe6,0xf0,0x92,0x84,0xbe,0xa8,
-        0xf5,0xe3,0xd9,0xcf,0xad,0xbb,0x81,0x97,0x45,0x53,0x69,0x7f,0x1d,0x0b,0x31,0x27,
-        0x8e,0x98,0xa2,0xb4,0xd6,0xc0,0xfa,0xec,0x3e,0x28,0x12,0x04,0x66,0x70,0x4a,0x5c,
-        0x03,0x15,0x2f,0x39,0x5b,0x4d,0x77,0x61,0xb3,0xa5,0x9f,0x89,0xeb,0xfd,0xc7,0xd1,
-        0x78,0x6e,0x54,0x42,0x20,0x36,0x0c,0x1a,0xc8,0xde,0xe4,0xf2,0x90,0x86,0xbc,0xaa,
-        0x02,0x14,0x2e,0x38,0x5a,0x4c,0x76,0x60,0xb2,0xa4,0x9e,0x88,0xea,0xfc,0xc6,0xd0,
-        0x79,0x6f,0x55,0x43,0x21,0x37,0x0d,0x1b,0xc9,0xdf,0xe5,0xf3,0x91,0x87,0xbd,0xab,
-        0xf4,0xe2,0xd8,0xce,0xac,0xba,0x80,0x96,0x44,0x52,0x68,0x7e,0x1c,0x0a,0x30,0x26,
-        0x8f,0x99,0xa3,0xb5,0xd7,0xc1,0xfb,0xed,0x3f,0x29,0x13,0x05,0x67,0x71,0x4b,0x5d,
-    ),
-    ( # 23
-        0x00,0x17,0x2e,0x39,0x5c,0x4b,0x72,0x65,0xb8,0xaf,0x96,0x81,0xe4,0xf3,0xca,0xdd,
-        0x6b,0x7c,0x45,0x52,0x37,0x20,0x19,0x0e,0xd3,0xc4,0xfd,0xea,0x8f,0x98,0xa1,0xb6,
-        0xd6,0xc1,0xf8,0xef,0x8a,0x9d,0xa4,0xb3,0x6e,0x79,0x40,0x57,0x32,0x25,0x1c,0x0b,
-        0xbd,0xaa,0x93,0x84,0xe1,0xf6,0xcf,0xd8,0x05,0x12,0x2b,0x3c,0x59,0x4e,0x77,0x60,
-        0xb7,0xa0,0x99,0x8e,0xeb,0xfc,0xc5,0xd2,0x0f,0x18,0x21,0x36,0x53,0x44,0x7d,0x6a,
-        0xdc,0xcb,0xf2,0xe5,0x80,0x97,0xae,0xb9,0x64,0x73,0x4a,0x5d,0x38,0x2f,0x16,0x01,
-        0x61,0x76,0x4f,0x58,0x3d,0x2a,0x13,0x04,0xd9,0xce,0xf7,0xe0,0x85,0x92,0xab,0xbc,
-        0x0a,0x1d,0x24,0x33,0x56,0x41,0x78,0x6f,0xb2,0xa5,0x9c,0x8b,0xee,0xf9,0xc0,0xd7,
-        0x75,0x62,0x5b,0x4c,0x29,0x3e,0x07,0x10,0xcd,0xda,0xe3,0xf4,0x91,0x86,0xbf,0xa8,
-        0x1e,0x09,0x30,0x27,0x42,0x55,0x6c,0x7b,0xa6,0xb1,0x88,0x9f,0xfa,0xed,0xd4,0xc3,
-        0xa3,0xb4,0x8d,0x9a,0xff,0xe8,0xd1,0xc6,0x1b,0x0c,0x35,0x22,0x47,0x50,0x69,0x7e,
-        0xc8,0xdf,0xe6,0xf1,0x94,0x83,0xba,0xad,0x70,0x67,0x5e,0x49,0x2c,0x3b,0x02,0x15,
-        0xc2,0xd5,0xec,0xfb,0x9e,0x89,0xb0,0xa7,0x7a,0x6d,0x54,0x43,0x26,0x31,0x08,0x1f,
-        0xa9,0xbe,0x87,0x90,0xf5,0xe2,0xdb,0xcc,0x11,0x06,0x3f,0x28,0x4d,0x5a,0x63,0x74,
-        0x14,0x03,0x3a,0x2d,0x48,0x5f,0x66,0x71,0xac,0xbb,0x82,0x95,0xf0,0xe7,0xde,0xc9,
-        0x7f,0x68,0x51,0x46,0x23,0x34,0x0d,0x1a,0xc7,0xd0,0xe9,0xfe,0x9b,0x8c,0xb5,0xa2,
-    ),
-    ( # 24
-        0x00,0x18,0x30,0x28,0x60,0x78,0x50,0x48,0xc0,0xd8,0xf0,0xe8,0xa0,0xb8,0x90,0x88,
-        0x9b,0x83,0xab,0xb3,0xfb,0xe3,0xcb,0xd3,0x5b,0x43,0x6b,0x73,0x3b,0x23,0x0b,0x13,
-        0x2d,0x35,0x1d,0x05,0x4d,0x55,0x7d,0x65,0xed,0xf5,0xdd,0xc5,0x8d,0x95,0xbd,0xa5,
-        0xb6,0xae,0x86,0x9e,0xd6,0xce,0xe6,0xfe,0x76,0x6e,0x46,0x5e,0x16,0x0e,0x26,0x3e,
-        0x5a,0x42,0x6a,0x72,0x3a,0x22,0x0a,0x12,0x9a,0x82,0xaa,0xb2,0xfa,0xe2,0xca,0xd2,
-        0xc1,0xd9,0xf1,0xe9,0xa1,0xb9,0x91,0x89,0x01,0x19,0x31,0x29,0x61,0x79,0x51,0x49,
-        0x77,0x6f,0x47,0x5f,0x17,0x0f,0x27,0x3f,0xb7,0xaf,0x87,0x9f,0xd7,0xcf,0xe7,0xff,
-        0xec,0xf4,0xdc,0xc4,0x8c,0x94,0xbc,0xa4,0x2c,0x34,0x1c,0x04,0x4c,0x54,0x7c,0x64,
-        0xb4,0xac,0x84,0x9c,0xd4,0xcc,0xe4,0xfc,0x74,0x6c,0x44,0x5c,0x14,0x0c,0x24,0x3c,
-        0x2f,0x37,0x1f,0x07,0x4f,0x57,0x7f,0x67,0xef,0xf7,0xdf,0xc7,0x8f,0x97,0xbf,0xa7,
-        0x99,0x81,0xa9,0xb1,0xf9,0xe1,0xc9,0xd1,0x59,0x41,0x69,0x71,0x39,0x21,0x09,0x11,
-        0x02,0x1a,0x32,0x2a,0x62,0x7a,0x52,0x4a,0xc2,0xda,0xf2,0xea,0xa2,0xba,0x92,0x8a,
-        0xee,0xf6,0xde,0xc6,0x8e,0x96,0xbe,0xa6,0x2e,0x36,0x1e,0x06,0x4e,0x56,0x7e,0x66,
-        0x75,0x6d,0x45,0x5d,0x15,0x0d,0x25,0x3d,0xb5,0xad,0x85,0x9d,0xd5,0xcd,0xe5,0xfd,
-        0xc3,0xdb,0xf3,0xeb,0xa3,0xbb,0x93,0x8b,0x03,0x1b,0x33,0x2b,0x63,0x7b,0x53,0x4b,
-        0x58,0x40,0x68,0x70,0x38,0x20,0x08,0x10,0x98,0x80,0xa8,0xb0,0xf8,0xe0,0xc8,0xd0,
-    ),
-    ( # 25
-        0x00,0x19,0x32,0x2b,0x64,0x7d,0x56,0x4f,0xc8,0xd1,0xfa,0xe3,0xac,0xb5,0x9e,0x87,
-        0x8b,0x92,0xb9,0xa0,0xef,0xf6,0xdd,0xc4,0x43,0x5a,0x71,0x68,0x27,0x3e,0x15,0x0c,
-        0x0d,0x14,0x3f,0x26,0x69,0x70,0x5b,0x42,0xc5,0xdc,0xf7,0xee,0xa1,0xb8,0x93,0x8a,
-        0x86,0x9f,0xb4,0xad,0xe2,0xfb,0xd0,0xc9,0x4e,0x57,0x7c,0x65,0x2a,0x33,0x18,0x01,
-        0x1a,0x03,0x28,0x31,0x7e,0x67,0x4c,0x55,0xd2,0xcb,0xe0,0xf9,0xb6,0xaf,0x84,0x9d,
-        0x91,0x88,0xa3,0xba,0xf5,0xec,0xc7,0xde,0x59,0x40,0x6b,0x72,0x3d,0x24,0x0f,0x16,
-        0x17,0x0e,0x25,0x3c,0x73,0x6a,0x41,0x58,0xdf,0xc6,0xed,0xf4,0xbb,0xa2,0x89,0x90,
-        0x9c,0x85,0xae,0xb7,0xf8,0xe1,0xca,0xd3,0x54,0x4d,0x66,0x7f,0x30,0x29,0x02,0x1b,
-        0x34,0x2d,0x06,0x1f,0x50,0x49,0x62,0x7b,0xfc,0xe5,0xce,0xd7,0x98,0x81,0xaa,0xb3,
-        0xbf,0xa6,0x8d,0x94,0xdb,0xc2,0xe9,0xf0,0x77,0x6e,0x45,0x5c,0x13,0x0a,0x21,0x38,
-        0x39,0x20,0x0b,0x12,0x5d,0x44,0x6f,0x76,0xf1,0xe8,0xc3,0xda,0x95,0x8c,0xa7,0xbe,
-        0xb2,0xab,0x80,0x99,0xd6,0xcf,0xe4,0xfd,0x7a,0x63,0x48,0x51,0x1e,0x07,0x2c,0x35,
-        0x2e,0x37,0x1c,0x05,0x4a,0x53,0x78,0x61,0xe6,0xff,0xd4,0xcd,0x82,0x9b,0xb0,0xa9,
-        0xa5,0xbc,0x97,0x8e,0xc1,0xd8,0xf3,0xea,0x6d,0x74,0x5f,0x46,0x09,0x10,0x3b,0x22,
-        0x23,0x3a,0x11,0x08,0x47,0x5e,0x75,0x6c,0xeb,0xf2,0xd9,0xc0,0x8f,0x96,0xbd,0xa4,
-        0xa8,0xb1,0x9a,0x83,0xcc,0xd5,0xfe,0xe7,0x60,0x79,0x52,0x4b,0x04,0x1d,0x36,0x2f,
-    ),
-    ( # 26
-        0x00,0x1a,0x34,0x2e,0x68,0x72,0x5c,0x46,0xd0,0xca,0xe4,0xfe,0xb8,0xa2,0x8c,0x96,
-        0xbb,0xa1,0x8f,0x95,0xd3,0xc9,0xe7,0xfd,0x6b,0x71,0x5f,0x45,0x03,0x19,0x37,0x2d,
-        0x6d,0x77,0x59,0x43,0x05,0x1f,0x31,0x2b,0xbd,0xa7,0x89,0x93,0xd5,0xcf,0xe1,0xfb,
-        0xd6,0xcc,0xe2,0xf8,0xbe,0xa4,0x8a,0x90,0x06,0x1c,0x32,0x28,0x6e,0x74,0x5a,0x40,
-        0xda,0xc0,0xee,0xf4,0xb2,0xa8,0x86,0x9c,0x0a,0x10,0x3e,0x24,0x62,0x78,0x56,0x4c,
-        0x61,0x7b,0x55,0x4f,0x09,0x13,0x3d,0x27,0xb1,0xab,0x85,0x9f,0xd9,0xc3,0xed,0xf7,
-        0xb7,0xad,0x83,0x99,0xdf,0xc5,0xeb,0xf1,0x67,0x7d,0x53,0x49,0x0f,0x15,0x3b,0x21,
-        0x0c,0x16,0x38,0x22,0x64,0x7e,0x50,0x4a,0xdc,0xc6,0xe8,0xf2,0xb4,0xae,0x80,0x9a,
-        0xaf,0xb5,0x9b,0x81,0xc7,0xdd,0xf3,0xe9,0x7f,0x65,0x4b,0x51,0x17,0x0d,0x23,0x39,
-        0x14,0x0e,0x20,0x3a,0x7c,0x66,0x48,0x52,0xc4,0xde,0xf0,0xea,0xac,0xb6,0x98,0x82,
-        0xc2,0xd8,0xf6,0xec,0xaa,0xb0,0x9e,0x84,0x12,0x08,0x26,0x3c,0x7a,0x60,0x4e,0x54,
-        0x79,0x63,0x4d,0x57,0x11,0x0b,0x25,0x3f,0xa9,0xb3,0x9d,0x87,0xc1,0xdb,0xf5,0xef,
-        0x75,0x6f,0x41,0x5b,0x1d,0x07,0x29,0x33,0xa5,0xbf,0x91,0x8b,0xcd,0xd7,0xf9,0xe3,
-        0xce,0xd4,0xfa,0xe0,0xa6,0xbc,0x92,0x88,0x1e,0x04,0x2a,0x30,0x76,0x6c,0x42,0x58,
-        0x18,0x02,0x2c,0x36,0x70,0x6a,0x44,0x5e,0xc8,0xd2,0xfc,0xe6,0xa0,0xba,0x94,0x8e,
-        0xa3,0xb9,0x97,0x8d,0xcb,0xd1,0xff,0xe5,0x73,0x69,0x47,0x5d,0x1b,0x01,0x2f,0x35,
-    ),
-    ( # 27
-        0x00,0x1b,0x36,0x2d,0x6c,0x77,0x5a,0x41,0xd8,0xc3,0xee,0xf5,0xb4,0xaf,0x82,0x99,
-        0xab,0xb0,0x9d,0x86,0xc7,0xdc,0xf1,0xea,0x73,0x68,0x45,0x5e,0x1f,0x04,0x29,0x32,
-        0x4d,0x56,0x7b,0x60,0x21,0x3a,0x17,0x0c,0x95,0x8e,0xa3,0xb8,0xf9,0xe2,0xcf,0xd4,
-        0xe6,0xfd,0xd0,0xcb,0x8a,0x91,0xbc,0xa7,0x3e,0x25,0x08,0x13,0x52,0x49,0x64,0x7f,
-        0x9a,0x81,0xac,0xb7,0xf6,0xed,0xc0,0xdb,0x42,0x59,0x74,0x6f,0x2e,0x35,0x18,0x03,
-        0x31,0x2a,0x07,0x1c,0x5d,0x46,0x6b,0x70,0xe9,0xf2,0xdf,0xc4,0x85,0x9e,0xb3,0xa8,
-        0xd7,0xcc,0xe1,0xfa,0xbb,0xa0,0x8d,0x96,0x0f,0x14,0x39,0x22,0x63,0x78,0x55,0x4e,
-        0x7c,0x67,0x4a,0x51,0x10,0x0b,0x26,0x3d,0xa4,0xbf,0x92,0x89,0xc8,0xd3,0xfe,0xe5,
-        0x2f,0x34,0x19,0x02,0x43,0x58,0x75,0x6e,0xf7,0xec,0xc1,0xda,0x9b,0x80,0xad,0xb6,
-        0x84,0x9f,0xb2,0xa9,0xe8,0xf3,0xde,0xc5,0x5c,0x47,0x6a,0x71,0x30,0x2b,0x06,0x1d,
-        0x62,0x79,0x54,0x4f,0x0e,0x15,0x38,0x23,0xba,0xa1,0x8c,0x97,0xd6,0xcd,0xe0,0xfb,
-        0xc9,0xd2,0xff,0xe4,0xa5,0xbe,0x93,0x88,0x11,0x0a,0x27,0x3c,0x7d,0x66,0x4b,0x50,
-        0xb5,0xae,0x83,0x98,0xd9,0xc2,0xef,0xf4,0x6d,0x76,0x5b,0x40,0x01,0x1a,0x37,0x2c,
-        0x1e,0x05,0x28,0x33,0x72,0x69,0x44,0x5f,0xc6,0xdd,0xf0,0xeb,0xaa,0xb1,0x9c,0x87,
-        0xf8,0xe3,0xce,0xd5,0x94,0x8f,0xa2,0xb9,0x20,0x3b,0x16,0x0d,0x4c,0x57,0x7a,0x61,
-        0x53,0x48,0x65,0x7e,0x3f,0x24,0x09,0x12,0x8b,0x90,0xbd,0xa6,0xe7,0xfc,0xd1,0xca,
-    ),
-    ( # 28
-        0x00,0x1c,0x38,0x24,0x70,0x6c,0x48,0x54,0xe0,0xfc,0xd8,0xc4,0x90,0x8c,0xa8,0xb4,
-        0xdb,0xc7,0xe3,0xff,0xab,0xb7,0x93,0x8f,0x3b,0x27,0x03,0x1f,0x4b,0x57,0x73,0x6f,
-        0xad,0xb1,0x95,0x89,0xdd,0xc1,0xe5,0xf9,0x4d,0x51,0x75,0x69,0x3d,0x21,0x05,0x19,
-        0x76,0x6a,0x4e,0x52,0x06,0x1a,0x3e,0x22,0x96,0x8a,0xae,0xb2,0xe6,0xfa,0xde,0xc2,
-        0x41,0x5d,0x79,0x65,0x31,0x2d,0x09,0x15,0xa1,0xbd,0x99,0x85,0xd1,0xcd,0xe9,0xf5,
-        0x9a,0x86,0xa2,0xbe,0xea,0xf6,0xd2,0xce,0x7a,0x66,0x42,0x5e,0x0a,0x16,0x32,0x2e,
-        0xec,0xf0,0xd4,0xc8,0x9c,0x80,0xa4,0xb8,0x0c,0x10,0x34,0x28,0x7c,0x60,0x44,0x58,
-        0x37,0x2b,0x0f,0x13,0x47,0x5b,0x7f,0x63,0xd7,0xcb,0xef,0xf3,0xa7,0xbb,0x9f,0x83,
-        0x82,0x9e,0xba,0xa6,0xf2,0xee,0xca,0xd6,0x62,0x7e,0x5a,0x46,0x12,0x0e,0x2a,0x36,
-        0x59,0x45,0x61,0x7d,0x29,0x35,0x11,0x0d,0xb9,0xa5,0x81,0x9d,0xc9,0xd5,0xf1,0xed,
-        0x2f,0x33,0x17,0x0b,0x5f,0x43,0x67,0x7b,0xcf,0xd3,0xf7,0xeb,0xbf,0xa3,0x87,0x9b,
-        0xf4,0xe8,0xcc,0xd0,0x84,0x98,0xbc,0xa0,0x14,0x08,0x2c,0x30,0x64,0x78,0x5c,0x40,
-        0xc3,0xdf,0xfb,0xe7,0xb3,0xaf,0x8b,0x97,0x23,0x3f,0x1b,0x07,0x53,0x4f,0x6b,0x77,
-        0x18,0x04,0x20,0x3c,0x68,0x74,0x50,0x4c,0xf8,0xe4,0xc0,0xdc,0x88,0x94,0xb0,0xac,
-        0x6e,0x72,0x56,0x4a,0x1e,0x02,0x26,0x3a,0x8e,0x92,0xb6,0xaa,0xfe,0xe2,0xc6,0xda,
-        0xb5,0xa9,0x8d,0x91,0xc5,0xd9,0xfd,0xe1,0x55,0x49,0x6d,0x71,0x25,0x39,0x1d,0x01,
-    ),
-    ( # 29
-        0x00,0x1d,0x3a,0x27,0x74,0x69,0x4e,0x53,0xe8,0xf5,0xd2,0xcf,0x9c,0x81,0xa6,0xbb,
-        0xcb,0xd6,0xf1,0xec,0xbf,0xa2,0x85,0x98,0x23,0x3e,0x19,0x04,0x57,0x4a,0x6d,0x70,
-        0x8d,0x90,0xb7,0xaa,0xf9,0xe4,0xc3,0xde,0x65,0x78,0x5f,0x42,0x11,0x0c,0x2b,0x36,
-        0x46,0x5b,0x7c,0x61,0x32,0x2f,0x08,0x15,0xae,0xb3,0x94,0x89,0xda,0xc7,0xe0,0xfd,
-        0x01,0x1c,0x3b,0x26,0x75,0x68,0x4f,0x52,0xe9,0xf4,0xd3,0xce,0x9d,0x80,0xa7,0xba,
-        0xca,0xd7,0xf0,0xed,0xbe,0xa3,0x84,0x99,0x22,0x3f,0x18,0x05,0x56,0x4b,0x6c,0x71,
-        0x8c,0x91,0xb6,0xab,0xf8,0xe5,0xc2,0xdf,0x64,0x79,0x5e,0x43,0x10,0x0d,0x2a,0x37,
-        0x47,0x5a,0x7d,0x60,0x33,0x2e,0x09,0x14,0xaf,0xb2,0x95,0x88,0xdb,0xc6,0xe1,0xfc,
-        0x02,0x1f,0x38,0x25,0x76,0x6b,0x4c,0x51,0xea,0xf7,0xd0,0xcd,0x9e,0x83,0xa4,0xb9,
-        0xc9,0xd4,0xf3,0xee,0xbd,0xa0,0x87,0x9a,0x21,0x3c,0x1b,0x06,0x55,0x48,0x6f,0x72,
-        0x8f,0x92,0xb5,0xa8,0xfb,0xe6,0xc1,0xdc,0x67,0x7a,0x5d,0x40,0x13,0x0e,0x29,0x34,
-        0x44,0x59,0x7e,0x63,0x30,0x2d,0x0a,0x17,0xac,0xb1,0x96,0x8b,0xd8,0xc5,0xe2,0xff,
-        0x03,0x1e,0x39,0x24,0x77,0x6a,0x4d,0x50,0xeb,0xf6,0xd1,0xcc,0x9f,0x82,0xa5,0xb8,
-        0xc8,0xd5,0xf2,0xef,0xbc,0xa1,0x86,0x9b,0x20,0x3d,0x1a,0x07,0x54,0x49,0x6e,0x73,
-        0x8e,0x93,0xb4,0xa9,0xfa,0xe7,0xc0,0xdd,0x66,0x7b,0x5c,0x41,0x12,0x0f,0x28,0x35,
-        0x45,0x58,0x7f,0x62,0x31,0x2c,0x0b,0x16,0xad,0xb0,0x97,0x8a,0xd9,0xc4,0xe3,0xfe,
-    ),
-    ( # 30
-        0x00,0x1e,0x3c,0x22,0x78,0x66,0x44,0x5a,0xf0,0xee,0xcc,0xd2,0x88,0x96,0xb4,0xaa,
-        0xfb,0xe5,0xc7,0xd9,0x83,0x9d,0xbf,0xa1,0x0b,0x15,0x37,0x29,0x73,0x6d,0x4f,0x51,
-        0xed,0xf3,0xd1,0xcf,0x95,0x8b,0xa9,0xb7,0x1d,0x03,0x21,0x3f,0x65,0x7b,0x59,0x47,
-        0x16,0x08,0x2a,0x34,0x6e,0x70,0x52,0x4c,0xe6,0xf8,0xda,0xc4,0x9e,0x80,0xa2,0xbc,
-        0xc1,0xdf,0xfd,0xe3,0xb9,0xa7,0x85,0x9b,0x31,0x2f,0x0d,0x13,0x49,0x57,0x75,0x6b,
-        0x3a,0x24,0x06,0x18,0x42,0x5c,0x7e,0x60,0xca,0xd4,0xf6,0xe8,0xb2,0xac,0x8e,0x90,
-        0x2c,0x32,0x10,0x0e,0x54,0x4a,0x68,0x76,0xdc,0xc2,0xe0,0xfe,0xa4,0xba,0x98,0x86,
-        0xd7,0xc9,0xeb,0xf5,0xaf,0xb1,0x93,0x8d,0x27,0x39,0x1b,0x05,0x5f,0x41,0x63,0x7d,
-        0x99,0x87,0xa5,0xbb,0xe1,0xff,0xdd,0xc3,0x69,0x77,0x55,0x4b,0x11,0x0f,0x2d,0x33,
-        0x62,0x7c,0x5e,0x40,0x1a,0x04,0x26,0x38,0x92,0x8c,0xae,0xb0,0xea,0xf4,0xd6,0xc8,
-        0x74,0x6a,0x48,0x56,0x0c,0x12,0x30,0x2e,0x84,0x9a,0xb8,0xa6,0xfc,0xe2,0xc0,0xde,
-        0x8f,0x91,0xb3,0xad,0xf7,0xe9,0xcb,0xd5,0x7f,0x61,0x43,0x5d,0x07,0x19,0x3b,0x25,
-        0x58,0x46,0x64,0x7a,0x20,0x3e,0x1c,0x02,0xa8,0xb6,0x94,0x8a,0xd0,0xce,0xec,0xf2,
-        0xa3,0xbd,0x9f,0x81,0xdb,0xc5,0xe7,0xf9,0x53,0x4d,0x6f,0x71,0x2b,0x35,0x17,0x09,
-        0xb5,0xab,0x89,0x97,0xcd,0xd3,0xf1,0xef,0x45,0x5b,0x79,0x67,0x3d,0x23,0x01,0x1f,
-        0x4e,0x50,0x72,0x6c,0x36,0x28,0x0a,0x14,0xbe,0xa0,0x82,0x9c,0xc6,0xd8,0xfa,0xe4,
-    ),
-    ( # 31
-        0x00,0x1f,0x3e,0x21,0x7c,0x63,0x42,0x5d,0xf8,0xe7,0xc6,0xd9,0x84,0x9b,0xba,0xa5,
-        0xeb,0xf4,0xd5,0xca,0x97,0x88,0xa9,0xb6,0x13,0x0c,0x2d,0x32,0x6f,0x70,0x51,0x4e,
-        0xcd,0xd2,0xf3,0xec,0xb1,0xae,0x8f,0x90,0x35,0x2a,0x0b,0x14,0x49,0x56,0x77,0x68,
-        0x26,0x39,0x18,0x07,0x5a,0x45,0x64,0x7b,0xde,0xc1,0xe0,0xff,0xa2,0xbd,0x9c,0x83,
-        0x81,0x9e,0xbf,0xa0,0xfd,0xe2,0xc3,0xdc,0x79,0x66,0x47,0x58,0x05,0x1a,0x3b,0x24,
-        0x6a,0x75,0x54,0x4b,0x16,0x09,0x28,0x37,0x92,0x8d,0xac,0xb3,0xee,0xf1,0xd0,0xcf,
-        0x4c,0x53,0x72,0x6d,0x30,0x2f,0x0e,0x11,0xb4,0xab,0x8a,0x95,0xc8,0xd7,0xf6,0xe9,
-        0xa7,0xb8,0x99,0x86,0xdb,0xc4,0xe5,0xfa,0x5f,0x40,0x61,0x7e,0x23,0x3c,0x1d,0x02,
-        0x19,0x06,0x27,0x38,0x65,0x7a,0x5b,0x44,0xe1,0xfe,0xdf,0xc0,0x9d,0x82,0xa3,0xbc,
-        0xf2,0xed,0xcc,0xd3,0x8e,0x91,0xb0,0xaf,0x0a,0x15,0x34,0x2b,0x76,0x69,0x48,0x57,
-        0xd4,0xcb,0xea,0xf5,0xa8,0xb7,0x96,0x89,0x2c,0x33,0x12,0x0d,0x50,0x4f,0x6e,0x71,
-        0x3f,0x20,0x01,0x1e,0x43,0x5c,0x7d,0x62,0xc7,0xd8,0xf9,0xe6,0xbb,0xa4,0x85,0x9a,
-        0x98,0x87,0xa6,0xb9,0xe4,0xfb,0xda,0xc5,0x60,0x7f,0x5e,0x41,0x1c,0x03,0x22,0x3d,
-        0x73,0x6c,0x4d,0x52,0x0f,0x10,0x31,0x2e,0x8b,0x94,0xb5,0xaa,0xf7,0xe8,0xc9,0xd6,
-        0x55,0x4a,0x6b,0x74,0x29,0x36,0x17,0x08,0xad,0xb2,0x93,0x8c,0xd1,0xce,0xef,0xf0,
-        0xbe,0xa1,0x80,0x9f,0xc2,0xdd,0xfc,0xe3,0x46,0x59,0x78,0x67,0x3a,0x25,0x04,0x1b,
-    ),
-    ( # 32
-        0x00,0x20,0x40,0x60,0x80,0xa0,0xc0,0xe0,0x1b,0x3b,0x5b,0x7b,0x9b,0xbb,0xdb,0xfb,
-        0x36,0x16,0x76,0x56,0xb6,0x96,0xf6,0xd6,0x2d,0x0d,0x6d,0x4d,0xad,0x8d,0xed,0xcd,
-        0x6c,0x4c,0x2c,0x0c,0xec,0xcc,0xac,0x8c,0x77,0x57,0x37,0x17,0xf7,0xd7,0xb7,0x97,
-        0x5a,0x7a,0x1a,0x3a,0xda,0xfa,0x9a,0xba,0x41,0x61,0x01,0x21,0xc1,0xe1,0x81,0xa1,
-        0xd8,0xf8,0x98,0xb8,0x58,0x78,0x18,0x38,0xc3,0xe3,0x83,0xa3,0x43,0x63,0x03,0x23,
-        0xee,0xce,0xae,0x8e,0x6e,0x4e,0x2e,0x0e,0xf5,0xd5,0xb5,0x95,0x75,0x55,0x35,0x15,
-        0xb4,0x94,0xf4,0xd4,0x34,0x14,0x74,0x54,0xaf,0x8f,0xef,0xcf,0x2f,0x0f,0x6f,0x4f,
-        0x82,0xa2,0xc2,0xe2,0x02,0x22,0x42,0x62,0x99,0xb9,0xd9,0xf9,0x19,0x39,0x59,0x79,
-        0xab,0x8b,0xeb,0xcb,0x2b,0x0b,0x6b,0x4b,0xb0,0x90,0xf0,0xd0,0x30,0x10,0x70,0x50,
-        0x9d,0xbd,0xdd,0xfd,0x1d,0x3d,0x5d,0x7d,0x86,0xa6,0xc6,0xe6,0x06,0x26,0x46,0x66,
-        0xc7,0xe7,0x87,0xa7,0x47,0x67,0x07,0x27,0xdc,0xfc,0x9c,0xbc,0x5c,0x7c,0x1c,0x3c,
-        0xf1,0xd1,0xb1,0x91,0x71,0x51,0x31,0x11,0xea,0xca,0xaa,0x8a,0x6a,0x4a,0x2a,0x0a,
-        0x73,0x53,0x33,0x13,0xf3,0xd3,0xb3,0x93,0x68,0x48,0x28,0x08,0xe8,0xc8,0xa8,0x88,
-        0x45,0x65,0x05,0x25,0xc5,0xe5,0x85,0xa5,0x5e,0x7e,0x1e,0x3e,0xde,0xfe,0x9e,0xbe,
-        0x1f,0x3f,0x5f,0x7f,0x9f,0xbf,0xdf,0xff,0x04,0x24,0x44,0x64,0x84,0xa4,0xc4,0xe4,
-        0x29,0x09,0x69,0x49,0xa9,0x89,0xe9,0xc9,0x32,0x12,0x72,0x52,0xb2,0x92,0xf2,0xd2,
-    ),
-    ( # 33
-        0x00,0x21,0x42,0x63,0x84,0xa5,0xc6,0xe7,0x13,0x32,0x51,0x70,0x97,0xb6,0xd5,0xf4,
-        0x26,0x07,0x64,0x45,0xa2,0x83,0xe0,0xc1,0x35,0x14,0x77,0x56,0xb1,0x90,0xf3,0xd2,
-        0x4c,0x6d,0x0e,0x2f,0xc8,0xe9,0x8a,0xab,0x5f,0x7e,0x1d,0x3c,0xdb,0xfa,0x99,0xb8,
-        0x6a,0x4b,0x28,0x09,0xee,0xcf,0xac,0x8d,0x79,0x58,0x3b,0x1a,0xfd,0xdc,0xbf,0x9e,
-        0x98,0xb9,0xda,0xfb,0x1c,0x3d,0x5e,0x7f,0x8b,0xaa,0xc9,0xe8,0x0f,0x2e,0x4d,0x6c,
-        0xbe,0x9f,0xfc,0xdd,0x3a,0x1b,0x78,0x59,0xad,0x8c,0xef,0xce,0x29,0x08,0x6b,0x4a,
-        0xd4,0xf5,0x96,0xb7,0x50,0x71,0x12,0x33,0xc7,0xe6,0x85,0xa4,0x43,0x62,0x01,0x20,
-        0xf2,0xd3,0xb0,0x91,0x76,0x57,0x34,0x15,0xe1,0xc0,0xa3,0x82,0x65,0x44,0x27,0x06,
-        0x2b,0x0a,0x69,0x48,0xaf,0x8e,0xed,0xcc,0x38,0x19,0x7a,0x5b,0xbc,0x9d,0xfe,0xdf,
-        0x0d,0x2c,0x4f,0x6e,0x89,0xa8,0xcb,0xea,0x1e,0x3f,0x5c,0x7d,0x9a,0xbb,0xd8,0xf9,
-        0x67,0x46,0x25,0x04,0xe3,0xc2,0xa1,0x80,0x74,0x55,0x36,0x17,0xf0,0xd1,0xb2,0x93,
-        0x41,0x60,0x03,0x22,0xc5,0xe4,0x87,0xa6,0x52,0x73,0x10,0x31,0xd6,0xf7,0x94,0xb5,
-        0xb3,0x92,0xf1,0xd0,0x37,0x16,0x75,0x54,0xa0,0x81,0xe2,0xc3,0x24,0x05,0x66,0x47,
-        0x95,0xb4,0xd7,0xf6,0x11,0x30,0x53,0x72,0x86,0xa7,0xc4,0xe5,0x02,0x23,0x40,0x61,
-        0xff,0xde,0xbd,0x9c,0x7b,0x5a,0x39,0x18,0xec,0xcd,0xae,0x8f,0x68,0x49,0x2a,0x0b,
-        0xd9,0xf8,0x9b,0xba,0x5d,0x7c,0x1f,0x3e,0xca,0xeb,0x88,0xa9,0x4e,0x6f,0x0c,0x2d,
-    ),
-    ( # 34
-        0x00,0x22,0x44,0x66,0x88,0xaa,0xcc,0xee,0x0b,0x29,0x4f,0x6d,0x83,0xa1,0xc7,0xe5,
-        0x16,0x34,0x52,0x70,0x9e,0xbc,0xda,0xf8,0x1d,0x3f,0x59,0x7b,0x95,0xb7,0xd1,0xf3,
-        0x2c,0x0e,0x68,0x4a,0xa4,0x86,0xe0,0xc2,0x27,0x05,0x63,0x41,0xaf,0x8d,0xeb,0xc9,
-        0x3a,0x18,0x7e,0x5c,0xb2,0x90,0xf6,0xd4,0x31,0x13,0x75,0x57,0xb9,0x9b,0xfd,0xdf,
-        0x58,0x7a,0x1c,0x3e,0xd0,0xf2,0x94,0xb6,0x53,0x71,0x17,0x35,0xdb,0xf9,0x9f,0xbd,
-        0x4e,0x6c,0x0a,0x28,0xc6,0xe4,0x82,0xa0,0x45,0x67,0x01,0x23,0xcd,0xef,0x89,0xab,
-        0x74,0x56,0x30,0x12,0xfc,0xde,0xb8,0x9a,0x7f,0x5d,0x3b,0x19,0xf7,0xd5,0xb3,0x91,
-        0x62,0x40,0x26,0x04,0xea,0xc8,0xae,0x8c,0x69,0x4b,0x2d,0x0f,0xe1,0xc3,0xa5,0x87,
-        0xb0,0x92,0xf4,0xd6,0x38,0x1a,0x7c,0x5e,0xbb,0x99,0xff,0xdd,0x33,0x11,0x77,0x55,
-        0xa6,0x84,0xe2,0xc0,0x2e,0x0c,0x6a,0x48,0xad,0x8f,0xe9,0xcb,0x25,0x07,0x61,0x43,
-        0x9c,0xbe,0xd8,0xfa,0x14,0x36,0x50,0x72,0x97,0xb5,0xd3,0xf1,0x1f,0x3d,0x5b,0x79,
-        0x8a,0xa8,0xce,0xec,0x02,0x20,0x46,0x64,0x81,0xa3,0xc5,0xe7,0x09,0x2b,0x4d,0x6f,
-        0xe8,0xca,0xac,0x8e,0x60,0x42,0x24,0x06,0xe3,0xc1,0xa7,0x85,0x6b,0x49,0x2f,0x0d,
-        0xfe,0xdc,0xba,0x98,0x76,0x54,0x32,0x10,0xf5,0xd7,0xb1,0x93,0x7d,0x5f,0x39,0x1b,
-        0xc4,0xe6,0x80,0xa2,0x4c,0x6e,0x08,0x2a,0xcf,0xed,0x8b,0xa9,0x47,0x65,0x03,0x21,
-        0xd2,0xf0,0x96,0xb4,0x5a,0x78,0x1e,0x3c,0xd9,0xfb,0x9d,0xbf,0x51,0x73,0x15,0x37,
-    ),
-    ( # 35
-        0x00,0x23,0x46,0x65,0x8c,0xaf,0xca,0xe9,0x03,0x20,0x45,0x66,0x8f,0xac,0xc9,0xea,
-        0x06,0x25,0x40,0x63,0x8a,0xa9,0xcc,0xef,0x05,0x26,0x43,0x60,0x89,0xaa,0xcf,0xec,
-        0x0c,0x2f,0x4a,0x69,0x80,0xa3,0xc6,0xe5,0x0f,0x2c,0x49,0x6a,0x83,0xa0,0xc5,0xe6,
-        0x0a,0x29,0x4c,0x6f,0x86,0xa5,0xc0,0xe3,0x09,0x2a,0x4f,0x6c,0x85,0xa6,0xc3,0xe0,
-        0x18,0x3b,0x5e,0x7d,0x94,0xb7,0xd2,0xf1,0x1b,0x38,0x5d,0x7e,0x97,0xb4,0xd1,0xf2,
-        0x1e,0x3d,0x58,0x7b,0x92,0xb1,0xd4,0xf7,0x1d,0x3e,0x5b,0x78,0x91,0xb2,0xd7,0xf4,
-        0x14,0x37,0x52,0x71,0x98,0xbb,0xde,0xfd,0x17,0x34,0x51,0x72,0x9b,0xb8,0xdd,0xfe,
-        0x12,0x31,0x54,0x77,0x9e,0xbd,0xd8,0xfb,0x11,0x32,0x57,0x74,0x9d,0xbe,0xdb,0xf8,
-        0x30,0x13,0x76,0x55,0xbc,0x9f,0xfa,0xd9,0x33,0x10,0x75,0x56,0xbf,0x9c,0xf9,0xda,
-        0x36,0x15,0x70,0x53,0xba,0x99,0xfc,0xdf,0x35,0x16,0x73,0x50,0xb9,0x9a,0xff,0xdc,
-        0x3c,0x1f,0x7a,0x59,0xb0,0x93,0xf6,0xd5,0x3f,0x1c,0x79,0x5a,0xb3,0x90,0xf5,0xd6,
-        0x3a,0x19,0x7c,0x5f,0xb6,0x95,0xf0,0xd3,0x39,0x1a,0x7f,0x5c,0xb5,0x96,0xf3,0xd0,
-        0x28,0x0b,0x6e,0x4d,0xa4,0x87,0xe2,0xc1,0x2b,0x08,0x6d,0x4e,0xa7,0x84,0xe1,0xc2,
-        0x2e,0x0d,0x68,0x4b,0xa2,0x81,0xe4,0xc7,0x2d,0x0e,0x6b,0x48,0xa1,0x82,0xe7,0xc4,
-        0x24,0x07,0x62,0x41,0xa8,0x8b,0xee,0xcd,0x27,0x04,0x61,0x42,0xab,0x88,0xed,0xce,
-        0x22,0x01,0x64,0x47,0xae,0x8d,0xe8,0xcb,0x21,0x02,0x67,0x44,0xad,0x8e,0xeb,0xc8,
-    ),
-    ( # 36
-        0x00,0x24,0x48,0x6c,0x90,0xb4,0xd8,0xfc,0x3b,0x1f,0x73,0x57,0xab,0x8f,0xe3,0xc7,
-        0x76,0x52,0x3e,0x1a,0xe6,0xc2,0xae,0x8a,0x4d,0x69,0x05,0x21,0xdd,0xf9,0x95,0xb1,
-        0xec,0xc8,0xa4,0x80,0x7c,0x58,0x34,0x10,0xd7,0xf3,0x9f,0xbb,0x47,0x63,0x0f,0x2b,
-        0x9a,0xbe,0xd2,0xf6,0x0a,0x2e,0x42,0x66,0xa1,0x85,0xe9,0xcd,0x31,0x15,0x79,0x5d,
-        0xc3,0xe7,0x8b,0xaf,0x53,0x77,0x1b,0x3f,0xf8,0xdc,0xb0,0x94,0x68,0x4c,0x20,0x04,
-        0xb5,0x91,0xfd,0xd9,0x25,0x01,0x6d,0x49,0x8e,0xaa,0xc6,0xe2,0x1e,0x3a,0x56,0x72,
-        0x2f,0x0b,0x67,0x43,0xbf,0x9b,0xf7,0xd3,0x14,0x30,0x5c,0x78,0x84,0xa0,0xcc,0xe8,
-        0x59,0x7d,0x11,0x35,0xc9,0xed,0x81,0xa5,0x62,0x46,0x2a,0x0e,0xf2,0xd6,0xba,0x9e,
-        0x9d,0xb9,0xd5,0xf1,0x0d,0x29,0x45,0x61,0xa6,0x82,0xee,0xca,0x36,0x12,0x7e,0x5a,
-        0xeb,0xcf,0xa3,0x87,0x7b,0x5f,0x33,0x17,0xd0,0xf4,0x98,0xbc,0x40,0x64,0x08,0x2c,
-        0x71,0x55,0x39,0x1d,0xe1,0xc5,0xa9,0x8d,0x4a,0x6e,0x02,0x26,0xda,0xfe,0x92,0xb6,
-        0x07,0x23,0x4f,0x6b,0x97,0xb3,0xdf,0xfb,0x3c,0x18,0x74,0x50,0xac,0x88,0xe4,0xc0,
-        0x5e,0x7a,0x16,0x32,0xce,0xea,0x86,0xa2,0x65,0x41,0x2d,0x09,0xf5,0xd1,0xbd,0x99,
-        0x28,0x0c,0x60,0x44,0xb8,0x9c,0xf0,0xd4,0x13,0x37,0x5b,0x7f,0x83,0xa7,0xcb,0xef,
-        0xb2,0x96,0xfa,0xde,0x22,0x06,0x6a,0x4e,0x89,0xad,0xc1,0xe5,0x19,0x3d,0x51,0x75,
-        0xc4,0xe0,0x8c,0xa8,0x54,0x70,0x1c,0x38,0xff,0xdb,0xb7,0x93,0x6f,0x4b,0x27,0x03,
-    ),
-    ( # 37
-        0x00,0x25,0x4a,0x6f,0x94,0xb1,0xde,0xfb,0x33,0x16,0x79,0x5c,0xa7,0x82,0xed,0xc8,
-        0x66,0x43,0x2c,0x09,0xf2,0xd7,0xb8,0x9d,0x55,0x70,0x1f,0x3a,0xc1,0xe4,0x8b,0xae,
-        0xcc,0xe9,0x86,0xa3,0x58,0x7d,0x12,0x37,0xff,0xda,0xb5,0x90,0x6b,0x4e,0x21,0x04,
-        0xaa,0x8f,0xe0,0xc5,0x3e,0x1b,0x74,0x51,0x99,0xbc,0xd3,0xf6,0x0d,0x28,0x47,0x62,
-        0x83,0xa6,0xc9,0xec,0x17,0x32,0x5d,0x78,0xb0,0x95,0xfa,0xdf,0x24,0x01,0x6e,0x4b,
-        0xe5,0xc0,0xaf,0x8a,0x71,0x54,0x3b,0x1e,0xd6,0xf3,0x9c,0xb9,0x42,0x67,0x08,0x2d,
-        0x4f,0x6a,0x05,0x20,0xdb,0xfe,0x91,0xb4,0x7c,0x59,0x36,0x13,0xe8,0xcd,0xa2,0x87,
-        0x29,0x0c,0x63,0x46,0xbd,0x98,0xf7,0xd2,0x1a,0x3f,0x50,0x75,0x8e,0xab,0xc4,0xe1,
-        0x1d,0x38,0x57,0x72,0x89,0xac,0xc3,0xe6,0x2e,0x0b,0x64,0x41,0xba,0x9f,0xf0,0xd5,
-        0x7b,0x5e,0x31,0x14,0xef,0xca,0xa5,0x80,0x48,0x6d,0x02,0x27,0xdc,0xf9,0x96,0xb3,
-        0xd1,0xf4,0x9b,0xbe,0x45,0x60,0x0f,0x2a,0xe2,0xc7,0xa8,0x8d,0x76,0x53,0x3c,0x19,
-        0xb7,0x92,0xfd,0xd8,0x23,0x06,0x69,0x4c,0x84,0xa1,0xce,0xeb,0x10,0x35,0x5a,0x7f,
-        0x9e,0xbb,0xd4,0xf1,0x0a,0x2f,0x40,0x65,0xad,0x88,0xe7,0xc2,0x39,0x1c,0x73,0x56,
-        0xf8,0xdd,0xb2,0x97,0x6c,0x49,0x26,0x03,0xcb,0xee,0x81,0xa4,0x5f,0x7a,0x15,0x30,
-        0x52,0x77,0x18,0x3d,0xc6,0xe3,0x8c,0xa9,0x61,0x44,0x2b,0x0e,0xf5,0xd0,0xbf,0x9a,
-        0x34,0x11,0x7e,0x5b,0xa0,0x85,0xea,0xcf,0x07,0x22,0x4d,0x68,0x93,0xb6,0xd9,0xfc,
-    ),
-    ( # 38
-        0x00,0x26,0x4c,0x6a,0x98,0xbe,0xd4,0xf2,0x2b,0x0d,0x67,0x41,0xb3,0x95,0xff,0xd9,
-        0x56,0x70,0x1a,0x3c,0xce,0xe8,0x82,0xa4,0x7d,0x5b,0x31,0x17,0xe5,0xc3,0xa9,0x8f,
-        0xac,0x8a,0xe0,0xc6,0x34,0x12,0x78,0x5e,0x87,0xa1,0xcb,0xed,0x1f,0x39,0x53,0x75,
-        0xfa,0xdc,0xb6,0x90,0x62,0x44,0x2e,0x08,0xd1,0xf7,0x9d,0xbb,0x49,0x6f,0x05,0x23,
-        0x43,0x65,0x0f,0x29,0xdb,0xfd,0x97,0xb1,0x68,0x4e,0x24,0x02,0xf0,0xd6,0xbc,0x9a,
-        0x15,0x33,0x59,0x7f,0x8d,0xab,0xc1,0xe7,0x3e,0x18,0x72,0x54,0xa6,0x80,0xea,0xcc,
-        0xef,0xc9,0xa3,0x85,0x77,0x51,0x3b,0x1d,0xc4,0xe2,0x88,0xae,0x5c,0x7a,0x10,0x36,
-        0xb9,0x9f,0xf5,0xd3,0x21,0x07,0x6d,0x4b,0x92,0xb4,0xde,0xf8,0x0a,0x2c,0x46,0x60,
-        0x86,0xa0,0xca,0xec,0x1e,0x38,0x52,0x74,0xad,0x8b,0xe1,0xc7,0x35,0x13,0x79,0x5f,
-        0xd0,0xf6,0x9c,0xba,0x48,0x6e,0x04,0x22,0xfb,0xdd,0xb7,0x91,0x63,0x45,0x2f,0x09,
-        0x2a,0x0c,0x66,0x40,0xb2,0x94,0xfe,0xd8,0x01,0x27,0x4d,0x6b,0x99,0xbf,0xd5,0xf3,
-        0x7c,0x5a,0x30,0x16,0xe4,0xc2,0xa8,0x8e,0x57,0x71,0x1b,0x3d,0xcf,0xe9,0x83,0xa5,
-        0xc5,0xe3,0x89,0xaf,0x5d,0x7b,0x11,0x37,0xee,0xc8,0xa2,0x84,0x76,0x50,0x3a,0x1c,
-        0x93,0xb5,0xdf,0xf9,0x0b,0x2d,0x47,0x61,0xb8,0x9e,0xf4,0xd2,0x20,0x06,0x6c,0x4a,
-        0x69,0x4f,0x25,0x03,0xf1,0xd7,0xbd,0x9b,0x42,0x64,0x0e,0x28,0xda,0xfc,0x96,0xb0,
-        0x3f,0x19,0x73,0x55,0xa7,0x81,0xeb,0xcd,0x14,0x32,0x58,0x7e,0x8c,0xaa,0xc0,0xe6,
-    ),
-    ( # 39
-        0x00,0x27,0x4e,0x69,0x9c,0xbb,0xd2,0xf5,0x23,0x04,0x6d,0x4a,0xbf,0x98,0xf1,0xd6,
-        0x46,0x61,0x08,0x2f,0xda,0xfd,0x94,0xb3,0x65,0x42,0x2b,0x0c,0xf9,0xde,0xb7,0x90,
-        0x8c,0xab,0xc2,0xe5,0x10,0x37,0x5e,0x79,0xaf,0x88,0xe1,0xc6,0x33,0x14,0x7d,0x5a,
-        0xca,0xed,0x84,0xa3,0x56,0x71,0x18,0x3f,0xe9,0xce,0xa7,0x80,0x75,0x52,0x3b,0x1c,
-        0x03,0x24,0x4d,0x6a,0x9f,0xb8,0xd1,0xf6,0x20,0x07,0x6e,0x49,0xbc,0x9b,0xf2,0xd5,
-        0x45,0x62,0x0b,0x2c,0xd9,0xfe,0x97,0xb0,0x66,0x41,0x28,0x0f,0xfa,0xdd,0xb4,0x93,
-        0x8f,0xa8,0xc1,0xe6,0x13,0x34,0x5d,0x7a,0xac,0x8b,0xe2,0xc5,0x30,0x17,0x7e,0x59,
-        0xc9,0xee,0x87,0xa0,0x55,0x72,0x1b,0x3c,0xea,0xcd,0xa4,0x83,0x76,0x51,0x38,0x1f,
-        0x06,0x21,0x48,0x6f,0x9a,0xbd,0xd4,0xf3,0x25,0x02,0x6b,0x4c,0xb9,0x9e,0xf7,0xd0,
-        0x40,0x67,0x0e,0x29,0xdc,0xfb,0x92,0xb5,0x63,0x44,0x2d,0x0a,0xff,0xd8,0xb1,0x96,
-        0x8a,0xad,0xc4,0xe3,0x16,0x31,0x58,0x7f,0xa9,0x8e,0xe7,0xc0,0x35,0x12,0x7b,0x5c,
-        0xcc,0xeb,0x82,0xa5,0x50,0x77,0x1e,0x39,0xef,0xc8,0xa1,0x86,0x73,0x54,0x3d,0x1a,
-        0x05,0x22,0x4b,0x6c,0x99,0xbe,0xd7,0xf0,0x26,0x01,0x68,0x4f,0xba,0x9d,0xf4,0xd3,
-        0x43,0x64,0x0d,0x2a,0xdf,0xf8,0x91,0xb6,0x60,0x47,0x2e,0x09,0xfc,0xdb,0xb2,0x95,
-        0x89,0xae,0xc7,0xe0,0x15,0x32,0x5b,0x7c,0xaa,0x8d,0xe4,0xc3,0x36,0x11,0x78,0x5f,
-        0xcf,0xe8,0x81,0xa6,0x53,0x74,0x1d,0x3a,0xec,0xcb,0xa2,0x85,0x70,0x57,0x3e,0x19,
-    ),
-    ( # 40
-        0x00,0x28,0x50,0x78,0xa0,0x88,0xf0,0xd8,0x5b,0x73,0x0b,0x23,0xfb,0xd3,0xab,0x83,
-        0xb6,0x9e,0xe6,0xce,0x16,0x3e,0x46,0x6e,0xed,0xc5,0xbd,0x95,0x4d,0x65,0x1d,0x35,
-        0x77,0x5f,0x27,0x0f,0xd7,0xff,0x87,0xaf,0x2c,0x04,0x7c,0x54,0x8c,0xa4,0xdc,0xf4,
-        0xc1,0xe9,0x91,0xb9,0x61,0x49,0x31,0x19,0x9a,0xb2,0xca,0xe2,0x3a,0x12,0x6a,0x42,
-        0xee,0xc6,0xbe,0x96,0x4e,0x66,0x1e,0x36,0xb5,0x9d,0xe5,0xcd,0x15,0x3d,0x45,0x6d,
-        0x58,0x70,0x08,0x20,0xf8,0xd0,0xa8,0x80,0x03,0x2b,0x53,0x7b,0xa3,0x8b,0xf3,0xdb,
-        0x99,0xb1,0xc9,0xe1,0x39,0x11,0x69,0x41,0xc2,0xea,0x92,0xba,0x62,0x4a,0x32,0x1a,
-        0x2f,0x07,0x7f,0x57,0x8f,0xa7,0xdf,0xf7,0x74,0x5c,0x24,0x0c,0xd4,0xfc,0x84,0xac,
-        0xc7,0xef,0x97,0xbf,0x67,0x4f,0x37,0x1f,0x9c,0xb4,0xcc,0xe4,0x3c,0x14,0x6c,0x44,
-        0x71,0x59,0x21,0x09,0xd1,0xf9,0x81,0xa9,0x2a,0x02,0x7a,0x52,0x8a,0xa2,0xda,0xf2,
-        0xb0,0x98,0xe0,0xc8,0x10,0x38,0x40,0x68,0xeb,0xc3,0xbb,0x93,0x4b,0x63,0x1b,0x33,
-        0x06,0x2e,0x56,0x7e,0xa6,0x8e,0xf6,0xde,0x5d,0x75,0x0d,0x25,0xfd,0xd5,0xad,0x85,
-        0x29,0x01,0x79,0x51,0x89,0xa1,0xd9,0xf1,0x72,0x5a,0x22,0x0a,0xd2,0xfa,0x82,0xaa,
-        0x9f,0xb7,0xcf,0xe7,0x3f,0x17,0x6f,0x47,0xc4,0xec,0x94,0xbc,0x64,0x4c,0x34,0x1c,
-        0x5e,0x76,0x0e,0x26,0xfe,0xd6,0xae,0x86,0x05,0x2d,0x55,0x7d,0xa5,0x8d,0xf5,0xdd,
-        0xe8,0xc0,0xb8,0x90,0x48,0x60,0x18,0x30,0xb3,0x9b,0xe3,0xcb,0x13,0x3b,0x43,0x6b,
-    ),
-    ( # 41
-        0x00,0x29,0x52,0x7b,0xa4,0x8d,0xf6,0xdf,0x53,0x7a,0x01,0x28,0xf7,0xde,0xa5,0x8c,
-        0xa6,0x8f,0xf4,0xdd,0x02,0x2b,0x50,0x79,0xf5,0xdc,0xa7,0x8e,0x51,0x78,0x03,0x2a,
-        0x57,0x7e,0x05,0x2c,0xf3,0xda,0xa1,0x88,0x04,0x2d,0x56,0x7f,0xa0,0x89,0xf2,0xdb,
-        0xf1,0xd8,0xa3,0x8a,0x55,0x7c,0x07,0x2e,0xa2,0x8b,0xf0,0xd9,0x06,0x2f,0x54,0x7d,
-        0xae,0x87,0xfc,0xd5,0x0a,0x23,0x58,0x71,0xfd,0xd4,0xaf,0x86,0x59,0x70,0x0b,0x22,
-        0x08,0x21,0x5a,0x73,0xac,0x85,0xfe,0xd7,0x5b,0x72,0x09,0x20,0xff,0xd6,0xad,0x84,
-        0xf9,0xd0,0xab,0x82,0x5d,0x74,0x0f,0x26,0xaa,0x83,0xf8,0xd1,0x0e,0x27,0x5c,0x75,
-        0x5f,0x76,0x0d,0x24,0xfb,0xd2,0xa9,0x80,0x0c,0x25,0x5e,0x77,0xa8,0x81,0xfa,0xd3,
-        0x47,0x6e,0x15,0x3c,0xe3,0xca,0xb1,0x98,0x14,0x3d,0x46,0x6f,0xb0,0x99,0xe2,0xcb,
-        0xe1,0xc8,0xb3,0x9a,0x45,0x6c,0x17,0x3e,0xb2,0x9b,0xe0,0xc9,0x16,0x3f,0x44,0x6d,
-        0x10,0x39,0x42,0x6b,0xb4,0x9d,0xe6,0xcf,0x43,0x6a,0x11,0x38,0xe7,0xce,0xb5,0x9c,
-        0xb6,0x9f,0xe4,0xcd,0x12,0x3b,0x40,0x69,0xe5,0xcc,0xb7,0x9e,0x41,0x68,0x13,0x3a,
-        0xe9,0xc0,0xbb,0x92,0x4d,0x64,0x1f,0x36,0xba,0x93,0xe8,0xc1,0x1e,0x37,0x4c,0x65,
-        0x4f,0x66,0x1d,0x34,0xeb,0xc2,0xb9,0x90,0x1c,0x35,0x4e,0x67,0xb8,0x91,0xea,0xc3,
-        0xbe,0x97,0xec,0xc5,0x1a,0x33,0x48,0x61,0xed,0xc4,0xbf,0x96,0x49,0x60,0x1b,0x32,
-        0x18,0x31,0x4a,0x63,0xbc,0x95,0xee,0xc7,0x4b,0x62,0x19,0x30,0xef,0xc6,0xbd,0x94,
-    ),
-    ( # 42
-        0x00,0x2a,0x54,0x7e,0xa8,0x82,0xfc,0xd6,0x4b,0x61,0x1f,0x35,0xe3,0xc9,0xb7,0x9d,
-        0x96,0xbc,0xc2,0xe8,0x3e,0x14,0x6a,0x40,0xdd,0xf7,0x89,0xa3,0x75,0x5f,0x21,0x0b,
-        0x37,0x1d,0x63,0x49,0x9f,0xb5,0xcb,0xe1,0x7c,0x56,0x28,0x02,0xd4,0xfe,0x80,0xaa,
-        0xa1,0x8b,0xf5,0xdf,0x09,0x23,0x5d,0x77,0xea,0xc0,0xbe,0x94,0x42,0x68,0x16,0x3c,
-        0x6e,0x44,0x3a,0x10,0xc6,0xec,0x92,0xb8,0x25,0x0f,0x71,0x5b,0x8d,0xa7,0xd9,0xf3,
-        0xf8,0xd2,0xac,0x86,0x50,0x7a,0x04,0x2e,0xb3,0x99,0xe7,0xcd,0x1b,0x31,0x4f,0x65,
-        0x59,0x73,0x0d,0x27,0xf1,0xdb,0xa5,0x8f,0x12,0x38,0x46,0x6c,0xba,0x90,0xee,0xc4,
-        0xcf,0xe5,0x9b,0xb1,0x67,0x4d,0x33,0x19,0x84,0xae,0xd0,0xfa,0x2c,0x06,0x78,0x52,
-        0xdc,0xf6,0x88,0xa2,0x74,0x5e,0x20,0x0a,0x97,0xbd,0xc3,0xe9,0x3f,0x15,0x6b,0x41,
-        0x4a,0x60,0x1e,0x34,0xe2,0xc8,0xb6,0x9c,0x01,0x2b,0x55,0x7f,0xa9,0x83,0xfd,0xd7,
-        0xeb,0xc1,0xbf,0x95,0x43,0x69,0x17,0x3d,0xa0,0x8a,0xf4,0xde,0x08,0x22,0x5c,0x76,
-        0x7d,0x57,0x29,0x03,0xd5,0xff,0x81,0xab,0x36,0x1c,0x62,0x48,0x9e,0xb4,0xca,0xe0,
-        0xb2,0x98,0xe6,0xcc,0x1a,0x30,0x4e,0x64,0xf9,0xd3,0xad,0x87,0x51,0x7b,0x05,0x2f,
-        0x24,0x0e,0x70,0x5a,0x8c,0xa6,0xd8,0xf2,0x6f,0x45,0x3b,0x11,0xc7,0xed,0x93,0xb9,
-        0x85,0xaf,0xd1,0xfb,0x2d,0x07,0x79,0x53,0xce,0xe4,0x9a,0xb0,0x66,0x4c,0x32,0x18,
-        0x13,0x39,0x47,0x6d,0xbb,0x91,0xef,0xc5,0x58,0x72,0x0c,0x26,0xf0,0xda,0xa4,0x8e,
-    ),
-    ( # 43
-        0x00,0x2b,0x56,0x7d,0xac,0x87,0xfa,0xd1,0x43,0x68,0x15,0x3e,0xef,0xc4,0xb9,0x92,
-        0x86,0xad,0xd0,0xfb,0x2a,0x01,0x7c,0x57,0xc5,0xee,0x93,0xb8,0x69,0x42,0x3f,0x14,
-        0x17,0x3c,0x41,0x6a,0xbb,0x90,0xed,0xc6,0x54,0x7f,0x02,0x29,0xf8,0xd3,0xae,0x85,
-        0x91,0xba,0xc7,0xec,0x3d,0x16,0x6b,0x40,0xd2,0xf9,0x84,0xaf,0x7e,0x55,0x28,0x03,
-        0x2e,0x05,0x78,0x53,0x82,0xa9,0xd4,0xff,0x6d,0x46,0x3b,0x10,0xc1,0xea,0x97,0xbc,
-        0xa8,0x83,0xfe,0xd5,0x04,0x2f,0x52,0x79,0xeb,0xc0,0xbd,0x96,0x47,0x6c,0x11,0x3a,
-        0x39,0x12,0x6f,0x44,0x95,0xbe,0xc3,0xe8,0x7a,0x51,0x2c,0x07,0xd6,0xfd,0x80,0xab,
-        0xbf,0x94,0xe9,0xc2,0x13,0x38,0x45,0x6e,0xfc,0xd7,0xaa,0x81,0x50,0x7b,0x06,0x2d,
-        0x5c,0x77,0x0a,0x21,0xf0,0xdb,0xa6,0x8d,0x1f,0x34,0x49,0x62,0xb3,0x98,0xe5,0xce,
-        0xda,0xf1,0x8c,0xa7,0x76,0x5d,0x20,0x0b,0x99,0xb2,0xcf,0xe4,0x35,0x1e,0x63,0x48,
-        0x4b,0x60,0x1d,0x36,0xe7,0xcc,0xb1,0x9a,0x08,0x23,0x5e,0x75,0xa4,0x8f,0xf2,0xd9,
-        0xcd,0xe6,0x9b,0xb0,0x61,0x4a,0x37,0x1c,0x8e,0xa5,0xd8,0xf3,0x22,0x09,0x74,0x5f,
-        0x72,0x59,0x24,0x0f,0xde,0xf5,0x88,0xa3,0x31,0x1a,0x67,0x4c,0x9d,0xb6,0xcb,0xe0,
-        0xf4,0xdf,0xa2,0x89,0x58,0x73,0x0e,0x25,0xb7,0x9c,0xe1,0xca,0x1b,0x30,0x4d,0x66,
-        0x65,0x4e,0x33,0x18,0xc9,0xe2,0x9f,0xb4,0x26,0x0d,0x70,0x5b,0x8a,0xa1,0xdc,0xf7,
-        0xe3,0xc8,0xb5,0x9e,0x4f,0x64,0x19,0x32,0xa0,0x8b,0xf6,0xdd,0x0c,0x27,0x5a,0x71,
-    ),
-    ( # 44
-        0x00,0x2c,0x58,0x74,0xb0,0x9c,0xe8,0xc4,0x7b,0x57,0x23,0x0f,0xcb,0xe7,0x93,0xbf,
-        0xf6,0xda,0xae,0x82,0x46,0x6a,0x1e,0x32,0x8d,0xa1,0xd5,0xf9,0x3d,0x11,0x65,0x49,
-        0xf7,0xdb,0xaf,0x83,0x47,0x6b,0x1f,0x33,0x8c,0xa0,0xd4,0xf8,0x3c,0x10,0x64,0x48,
-        0x01,0x2d,0x59,0x75,0xb1,0x9d,0xe9,0xc5,0x7a,0x56,0x22,0x0e,0xca,0xe6,0x92,0xbe,
-        0xf5,0xd9,0xad,0x81,0x45,0x69,0x1d,0x31,0x8e,0xa2,0xd6,0xfa,0x3e,0x12,0x66,0x4a,
-        0x03,0x2f,0x5b,0x77,0xb3,0x9f,0xeb,0xc7,0x78,0x54,0x20,0x0c,0xc8,0xe4,0x90,0xbc,
-        0x02,0x2e,0x5a,0x76,0xb2,0x9e,0xea,0xc6,0x79,0x55,0x21,0x0d,0xc9,0xe5,0x91,0xbd,
-        0xf4,0xd8,0xac,0x80,0x44,0x68,0x1c,0x30,0x8f,0xa3,0xd7,0xfb,0x3f,0x13,0x67,0x4b,
-        0xf1,0xdd,0xa9,0x85,0x41,0x6d,0x19,0x35,0x8a,0xa6,0xd2,0xfe,0x3a,0x16,0x62,0x4e,
-        0x07,0x2b,0x5f,0x73,0xb7,0x9b,0xef,0xc3,0x7c,0x50,0x24,0x08,0xcc,0xe0,0x94,0xb8,
-        0x06,0x2a,0x5e,0x72,0xb6,0x9a,0xee,0xc2,0x7d,0x51,0x25,0x09,0xcd,0xe1,0x95,0xb9,
-        0xf0,0xdc,0xa8,0x84,0x40,0x6c,0x18,0x34,0x8b,0xa7,0xd3,0xff,0x3b,0x17,0x63,0x4f,
-        0x04,0x28,0x5c,0x70,0xb4,0x98,0xec,0xc0,0x7f,0x53,0x27,0x0b,0xcf,0xe3,0x97,0xbb,
-        0xf2,0xde,0xaa,0x86,0x42,0x6e,0x1a,0x36,0x89,0xa5,0xd1,0xfd,0x39,0x15,0x61,0x4d,
-        0xf3,0xdf,0xab,0x87,0x43,0x6f,0x1b,0x37,0x88,0xa4,0xd0,0xfc,0x38,0x14,0x60,0x4c,
-        0x05,0x29,0x5d,0x71,0xb5,0x99,0xed,0xc1,0x7e,0x52,0x26,0x0a,0xce,0xe2,0x96,0xba,
-    ),
-    ( # 45
-        0x00,0x2d,0x5a,0x77,0xb4,0x99,0xee,0xc3,0x73,0x5e,0x29,0x04,0xc7,0xea,0x9d,0xb0,
-        0xe6,0xcb,0xbc,0x91,0x52,0x7f,0x08,0x25,0x95,0xb8,0xcf,0xe2,0x21,0x0c,0x7b,0x56,
-        0xd7,0xfa,0x8d,0xa0,0x63,0x4e,0x39,0x14,0xa4,0x89,0xfe,0xd3,0x10,0x3d,0x4a,0x67,
-        0x31,0x1c,0x6b,0x46,0x85,0xa8,0xdf,0xf2,0x42,0x6f,0x18,0x35,0xf6,0xdb,0xac,0x81,
-        0xb5,0x98,0xef,0xc2,0x01,0x2c,0x5b,0x76,0xc6,0xeb,0x9c,0xb1,0x72,0x5f,0x28,0x05,
-        0x53,0x7e,0x09,0x24,0xe7,0xca,0xbd,0x90,0x20,0x0d,0x7a,0x57,0x94,0xb9,0xce,0xe3,
-        0x62,0x4f,0x38,0x15,0xd6,0xfb,0x8c,0xa1,0x11,0x3c,0x4b,0x66,0xa5,0x88,0xff,0xd2,
-        0x84,0xa9,0xde,0xf3,0x30,0x1d,0x6a,0x47,0xf7,0xda,0xad,0x80,0x43,0x6e,0x19,0x34,
-        0x71,0x5c,0x2b,0x06,0xc5,0xe8,0x9f,0xb2,0x02,0x2f,0x58,0x75,0xb6,0x9b,0xec,0xc1,
-        0x97,0xba,0xcd,0xe0,0x23,0x0e,0x79,0x54,0xe4,0xc9,0xbe,0x93,0x50,0x7d,0x0a,0x27,
-        0xa6,0x8b,0xfc,0xd1,0x12,0x3f,0x48,0x65,0xd5,0xf8,0x8f,0xa2,0x61,0x4c,0x3b,0x16,
-        0x40,0x6d,0x1a,0x37,0xf4,0xd9,0xae,0x83,0x33,0x1e,0x69,0x44,0x87,0xaa,0xdd,0xf0,
-        0xc4,0xe9,0x9e,0xb3,0x70,0x5d,0x2a,0x07,0xb7,0x9a,0xed,0xc0,0x03,0x2e,0x59,0x74,
-        0x22,0x0f,0x78,0x55,0x96,0xbb,0xcc,0xe1,0x51,0x7c,0x0b,0x26,0xe5,0xc8,0xbf,0x92,
-        0x13,0x3e,0x49,0x64,0xa7,0x8a,0xfd,0xd0,0x60,0x4d,0x3a,0x17,0xd4,0xf9,0x8e,0xa3,
-        0xf5,0xd8,0xaf,0x82,0x41,0x6c,0x1b,0x36,0x86,0xab,0xdc,0xf1,0x32,0x1f,0x68,0x45,
-    ),
-    ( # 46
-        0x00,0x2e,0x5c,0x72,0xb8,0x96,0xe4,0xca,0x6b,0x45,0x37,0x19,0xd3,0xfd,0x8f,0xa1,
-        0xd6,0xf8,0x8a,0xa4,0x6e,0x40,0x32,0x1c,0xbd,0x93,0xe1,0xcf,0x05,0x2b,0x59,0x77,
-        0xb7,0x99,0xeb,0xc5,0x0f,0x21,0x53,0x7d,0xdc,0xf2,0x80,0xae,0x64,0x4a,0x38,0x16,
-        0x61,0x4f,0x3d,0x13,0xd9,0xf7,0x85,0xab,0x0a,0x24,0x56,0x78,0xb2,0x9c,0xee,0xc0,
-        0x75,0x5b,0x29,0x07,0xcd,0xe3,0x91,0xbf,0x1e,0x30,0x42,0x6c,0xa6,0x88,0xfa,0xd4,
-        0xa3,0x8d,0xff,0xd1,0x1b,0x35,0x47,0x69,0xc8,0xe6,0x94,0xba,0x70,0x5e,0x2c,0x02,
-        0xc2,0xec,0x9e,0xb0,0x7a,0x54,0x26,0x08,0xa9,0x87,0xf5,0xdb,0x11,0x3f,0x4d,0x63,
-        0x14,0x3a,0x48,0x66,0xac,0x82,0xf0,0xde,0x7f,0x51,0x23,0x0d,0xc7,0xe9,0x9b,0xb5,
-        0xea,0xc4,0xb6,0x98,0x52,0x7c,0x0e,0x20,0x81,0xaf,0xdd,0xf3,0x39,0x17,0x65,0x4b,
-        0x3c,0x12,0x60,0x4e,0x84,0xaa,0xd8,0xf6,0x57,0x79,0x0b,0x25,0xef,0xc1,0xb3,0x9d,
-        0x5d,0x73,0x01,0x2f,0xe5,0xcb,0xb9,0x97,0x36,0x18,0x6a,0x44,0x8e,0xa0,0xd2,0xfc,
-        0x8b,0xa5,0xd7,0xf9,0x33,0x1d,0x6f,0x41,0xe0,0xce,0xbc,0x92,0x58,0x76,0x04,0x2a,
-        0x9f,0xb1,0xc3,0xed,0x27,0x09,0x7b,0x55,0xf4,0xda,0xa8,0x86,0x4c,0x62,0x10,0x3e,
-        0x49,0x67,0x15,0x3b,0xf1,0xdf,0xad,0x83,0x22,0x0c,0x7e,0x50,0x9a,0xb4,0xc6,0xe8,
-        0x28,0x06,0x74,0x5a,0x90,0xbe,0xcc,0xe2,0x43,0x6d,0x1f,0x31,0xfb,0xd5,0xa7,0x89,
-        0xfe,0xd0,0xa2,0x8c,0x46,0x68,0x1a,0x34,0x95,0xbb,0xc9,0xe7,0x2d,0x03,0x71,0x5f,
-    ),
-    ( # 47
-        0x00,0x2f,0x5e,0x71,0xbc,0x93,0xe2,0xcd,0x63,0x4c,0x3d,0x12,0xdf,0xf0,0x81,0xae,
-        0xc6,0xe9,0x98,0xb7,0x7a,0x55,0x24,0x0b,0xa5,0x8a,0xfb,0xd4,0x19,0x36,0x47,0x68,
-        0x97,0xb8,0xc9,0xe6,0x2b,0x04,0x75,0x5a,0xf4,0xdb,0xaa,0x85,0x48,0x67,0x16,0x39,
-        0x51,0x7e,0x0f,0x20,0xed,0xc2,0xb3,0x9c,0x32,0x1d,0x6c,0x43,0x8e,0xa1,0xd0,0xff,
-        0x35,0x1a,0x6b,0x44,0x89,0xa6,0xd7,0xf8,0x56,0x79,0x08,0x27,0xea,0xc5,0xb4,0x9b,
-        0xf3,0xdc,0xad,0x82,0x4f,0x60,0x11,0x3e,0x90,0xbf,0xce,0xe1,0x2c,0x03,0x72,0x5d,
-        0xa2,0x8d,0xfc,0xd3,0x1e,0x31,0x40,0x6f,0xc1,0xee,0x9f,0xb0,0x7d,0x52,0x23,0x0c,
-        0x64,0x4b,0x3a,0x15,0xd8,0xf7,0x86,0xa9,0x07,0x28,0x59,0x76,0xbb,0x94,0xe5,0xca,
-        0x6a,0x45,0x34,0x1b,0xd6,0xf9,0x88,0xa7,0x09,0x26,0x57,0x78,0xb5,0x9a,0xeb,0xc4,
-        0xac,0x83,0xf2,0xdd,0x10,0x3f,0x4e,0x61,0xcf,0xe0,0x91,0xbe,0x73,0x5c,0x2d,0x02,
-        0xfd,0xd2,0xa3,0x8c,0x41,0x6e,0x1f,0x30,0x9e,0xb1,0xc0,0xef,0x22,0x0d,0x7c,0x53,
-        0x3b,0x14,0x65,0x4a,0x87,0xa8,0xd9,0xf6,0x58,0x77,0x06,0x29,0xe4,0xcb,0xba,0x95,
-        0x5f,0x70,0x01,0x2e,0xe3,0xcc,0xbd,0x92,0x3c,0x13,0x62,0x4d,0x80,0xaf,0xde,0xf1,
-        0x99,0xb6,0xc7,0xe8,0x25,0x0a,0x7b,0x54,0xfa,0xd5,0xa4,0x8b,0x46,0x69,0x18,0x37,
-        0xc8,0xe7,0x96,0xb9,0x74,0x5b,0x2a,0x05,0xab,0x84,0xf5,0xda,0x17,0x38,0x49,0x66,
-        0x0e,0x21,0x50,0x7f,0xb2,0x9d,0xec,0xc3,0x6d,0x42,0x33,0x1c,0xd1,0xfe,0x8f,0xa0,
-    ),
-    ( # 48
-        0x00,0x30,0x60,0x50,0xc0,0xf0,0xa0,0x90,0x9b,0xab,0xfb,0xcb,0x5b,0x6b,0x3b,0x0b,
-        0x2d,0x1d,0x4d,0x7d,0xed,0xdd,0x8d,0xbd,0xb6,0x86,0xd6,0xe6,0x76,0x46,0x16,0x26,
-        0x5a,0x6a,0x3a,0x0a,0x9a,0xaa,0xfa,0xca,0xc1,0xf1,0xa1,0x91,0x01,0x31,0x61,0x51,
-        0x77,0x47,0x17,0x27,0xb7,0x87,0xd7,0xe7,0xec,0xdc,0x8c,0xbc,0x2c,0x1c,0x4c,0x7c,
-        0xb4,0x84,0xd4,0xe4,0x74,0x44,0x14,0x24,0x2f,0x1f,0x4f,0x7f,0xef,0xdf,0x8f,0xbf,
-        0x99,0xa9,0xf9,0xc9,0x59,0x69,0x39,0x09,0x02,0x32,0x62,0x52,0xc2,0xf2,0xa2,0x92,
-        0xee,0xde,0x8e,0xbe,0x2e,0x1e,0x4e,0x7e,0x75,0x45,0x15,0x25,0xb5,0x85,0xd5,0xe5,
-        0xc3,0xf3,0xa3,0x93,0x03,0x33,0x63,0x53,0x58,0x68,0x38,0x08,0x98,0xa8,0xf8,0xc8,
-        0x73,0x43,0x13,0x23,0xb3,0x83,0xd3,0xe3,0xe8,0xd8,0x88,0xb8,0x28,0x18,0x48,0x78,
-        0x5e,0x6e,0x3e,0x0e,0x9e,0xae,0xfe,0xce,0xc5,0xf5,0xa5,0x95,0x05,0x35,0x65,0x55,
-        0x29,0x19,0x49,0x79,0xe9,0xd9,0x89,0xb9,0xb2,0x82,0xd2,0xe2,0x72,0x42,0x12,0x22,
-        0x04,0x34,0x64,0x54,0xc4,0xf4,0xa4,0x94,0x9f,0xaf,0xff,0xcf,0x5f,0x6f,0x3f,0x0f,
-        0xc7,0xf7,0xa7,0x97,0x07,0x37,0x67,0x57,0x5c,0x6c,0x3c,0x0c,0x9c,0xac,0xfc,0xcc,
-        0xea,0xda,0x8a,0xba,0x2a,0x1a,0x4a,0x7a,0x71,0x41,0x11,0x21,0xb1,0x81,0xd1,0xe1,
-        0x9d,0xad,0xfd,0xcd,0x5d,0x6d,0x3d,0x0d,0x06,0x36,0x66,0x56,0xc6,0xf6,0xa6,0x96,
-        0xb0,0x80,0xd0,0xe0,0x70,0x40,0x10,0x20,0x2b,0x1b,0x4b,0x7b,0xeb,0xdb,0x8b,0xbb,
-    ),
-    ( # 49
-        0x00,0x31,0x62,0x53,0xc4,0xf5,0xa6,0x97,0x93,0xa2,0xf1,0xc0,0x57,0x66,0x35,0x04,
-        0x3d,0x0c,0x5f,0x6e,0xf9,0xc8,0x9b,0xaa,0xae,0x9f,0xcc,0xfd,0x6a,0x5b,0x08,0x39,
-        0x7a,0x4b,0x18,0x29,0xbe,0x8f,0xdc,0xed,0xe9,0xd8,0x8b,0xba,0x2d,0x1c,0x4f,0x7e,
-        0x47,0x76,0x25,0x14,0x83,0xb2,0xe1,0xd0,0xd4,0xe5,0xb6,0x87,0x10,0x21,0x72,0x43,
-        0xf4,0xc5,0x96,0xa7,0x30,0x01,0x52,0x63,0x67,0x56,0x05,0x34,0xa3,0x92,0xc1,0xf0,
-        0xc9,0xf8,0xab,0x9a,0x0d,0x3c,0x6f,0x5e,0x5a,0x6b,0x38,0x09,0x9e,0xaf,0xfc,0xcd,
-        0x8e,0xbf,0xec,0xdd,0x4a,0x7b,0x28,0x19,0x1d,0x2c,0x7f,0x4e,0xd9,0xe8,0xbb,0x8a,
-        0xb3,0x82,0xd1,0xe0,0x77,0x46,0x15,0x24,0x20,0x11,0x42,0x73,0xe4,0xd5,0x86,0xb7,
-        0xf3,0xc2,0x91,0xa0,0x37,0x06,0x55,0x64,0x60,0x51,0x02,0x33,0xa4,0x95,0xc6,0xf7,
-        0xce,0xff,0xac,0x9d,0x0a,0x3b,0x68,0x59,0x5d,0x6c,0x3f,0x0e,0x99,0xa8,0xfb,0xca,
-        0x89,0xb8,0xeb,0xda,0x4d,0x7c,0x2f,0x1e,0x1a,0x2b,0x78,0x49,0xde,0xef,0xbc,0x8d,
-        0xb4,0x85,0xd6,0xe7,0x70,0x41,0x12,0x23,0x27,0x16,0x45,0x74,0xe3,0xd2,0x81,0xb0,
-        0x07,0x36,0x65,0x54,0xc3,0xf2,0xa1,0x90,0x94,0xa5,0xf6,0xc7,0x50,0x61,0x32,0x03,
-        0x3a,0x0b,0x58,0x69,0xfe,0xcf,0x9c,0xad,0xa9,0x98,0xcb,0xfa,0x6d,0x5c,0x0f,0x3e,
-        0x7d,0x4c,0x1f,0x2e,0xb9,0x88,0xdb,0xea,0xee,0xdf,0x8c,0xbd,0x2a,0x1b,0x48,0x79,
-        0x40,0x71,0x22,0x13,0x84,0xb5,0xe6,0xd7,0xd3,0xe2,0xb1,0x80,0x17,0x26,0x75,0x44,
-    ),
-    ( # 50
-        0x00,0x32,0x64,0x56,0xc8,0xfa,0xac,0x9e,0x8b,0xb9,0xef,0xdd,0x43,0x71,0x27,0x15,
-        0x0d,0x3f,0x69,0x5b,0xc5,0xf7,0xa1,0x93,0x86,0xb4,0xe2,0xd0,0x4e,0x7c,0x2a,0x18,
-        0x1a,0x28,0x7e,0x4c,0xd2,0xe0,0xb6,0x84,0x91,0xa3,0xf5,0xc7,0x59,0x6b,0x3d,0x0f,
-        0x17,0x25,0x73,0x41,0xdf,0xed,0xbb,0x89,0x9c,0xae,0xf8,0xca,0x54,0x66,0x30,0x02,
-        0x34,0x06,0x50,0x62,0xfc,0xce,0x98,0xaa,0xbf,0x8d,0xdb,0xe9,0x77,0x45,0x13,0x21,
-        0x39,0x0b,0x5d,0x6f,0xf1,0xc3,0x95,0xa7,0xb2,0x80,0xd6,0xe4,0x7a,0x48,0x1e,0x2c,
-        0x2e,0x1c,0x4a,0x78,0xe6,0xd4,0x82,0xb0,0xa5,0x97,0xc1,0xf3,0x6d,0x5f,0x09,0x3b,
-        0x23,0x11,0x47,0x75,0xeb,0xd9,0x8f,0xbd,0xa8,0x9a,0xcc,0xfe,0x60,0x52,0x04,0x36,
-        0x68,0x5a,0x0c,0x3e,0xa0,0x92,0xc4,0xf6,0xe3,0xd1,0x87,0xb5,0x2b,0x19,0x4f,0x7d,
-        0x65,0x57,0x01,0x33,0xad,0x9f,0xc9,0xfb,0xee,0xdc,0x8a,0xb8,0x26,0x14,0x42,0x70,
-        0x72,0x40,0x16,0x24,0xba,0x88,0xde,0xec,0xf9,0xcb,0x9d,0xaf,0x31,0x03,0x55,0x67,
-        0x7f,0x4d,0x1b,0x29,0xb7,0x85,0xd3,0xe1,0xf4,0xc6,0x90,0xa2,0x3c,0x0e,0x58,0x6a,
-        0x5c,0x6e,0x38,0x0a,0x94,0xa6,0xf0,0xc2,0xd7,0xe5,0xb3,0x81,0x1f,0x2d,0x7b,0x49,
-        0x51,0x63,0x35,0x07,0x99,0xab,0xfd,0xcf,0xda,0xe8,0xbe,0x8c,0x12,0x20,0x76,0x44,
-        0x46,0x74,0x22,0x10,0x8e,0xbc,0xea,0xd8,0xcd,0xff,0xa9,0x9b,0x05,0x37,0x61,0x53,
-        0x4b,0x79,0x2f,0x1d,0x83,0xb1,0xe7,0xd5,0xc0,0xf2,0xa4,0x96,0x08,0x3a,0x6c,0x5e,
-    ),
-    ( # 51
-        0x00,0x33,0x66,0x55,0xcc,0xff,0xaa,0x99,0x83,0xb0,0xe5,0xd6,0x4f,0x7c,0x29,0x1a,
-        0x1d,0x2e,0x7b,0x48,0xd1,0xe2,0xb7,0x84,0x9e,0xad,0xf8,0xcb,0x52,0x61,0x34,0x07,
-        0x3a,0x09,0x5c,0x6f,0xf6,0xc5,0x90,0xa3,0xb9,0x8a,0xdf,0xec,0x75,0x46,0x13,0x20,
-        0x27,0x14,0x41,0x72,0xeb,0xd8,0x8d,0xbe,0xa4,0x97,0xc2,0xf1,0x68,0x5b,0x0e,0x3d,
-        0x74,0x47,0x12,0x21,0xb8,0x8b,0xde,0xed,0xf7,0xc4,0x91,0xa2,0x3b,0x08,0x5d,0x6e,
-        0x69,0x5a,0x0f,0x3c,0xa5,0x96,0xc3,0xf0,0xea,0xd9,0x8c,0xbf,0x26,0x15,0x40,0x73,
-        0x4e,0x7d,0x28,0x1b,0x82,0xb1,0xe4,0xd7,0xcd,0xfe,0xab,0x98,0x01,0x32,0x67,0x54,
-        0x53,0x60,0x35,0x06,0x9f,0xac,0xf9,0xca,0xd0,0xe3,0xb6,0x85,0x1c,0x2f,0x7a,0x49,
-        0xe8,0xdb,0x8e,0xbd,0x24,0x17,0x42,0x71,0x6b,0x58,0x0d,0x3e,0xa7,0x94,0xc1,0xf2,
-        0xf5,0xc6,0x93,0xa0,0x39,0x0a,0x5f,0x6c,0x76,0x45,0x10,0x23,0xba,0x89,0xdc,0xef,
-        0xd2,0xe1,0xb4,0x87,0x1e,0x2d,0x78,0x4b,0x51,0x62,0x37,0x04,0x9d,0xae,0xfb,0xc8,
-        0xcf,0xfc,0xa9,0x9a,0x03,0x30,0x65,0x56,0x4c,0x7f,0x2a,0x19,0x80,0xb3,0xe6,0xd5,
-        0x9c,0xaf,0xfa,0xc9,0x50,0x63,0x36,0x05,0x1f,0x2c,0x79,0x4a,0xd3,0xe0,0xb5,0x86,
-        0x81,0xb2,0xe7,0xd4,0x4d,0x7e,0x2b,0x18,0x02,0x31,0x64,0x57,0xce,0xfd,0xa8,0x9b,
-        0xa6,0x95,0xc0,0xf3,0x6a,0x59,0x0c,0x3f,0x25,0x16,0x43,0x70,0xe9,0xda,0x8f,0xbc,
-        0xbb,0x88,0xdd,0xee,0x77,0x44,0x11,0x22,0x38,0x0b,0x5e,0x6d,0xf4,0xc7,0x92,0xa1,
-    ),
-    ( # 52
-        0x00,0x34,0x68,0x5c,0xd0,0xe4,0xb8,0x8c,0xbb,0x8f,0xd3,0xe7,0x6b,0x5f,0x03,0x37,
-        0x6d,0x59,0x05,0x31,0xbd,0x89,0xd5,0xe1,0xd6,0xe2,0xbe,0x8a,0x06,0x32,0x6e,0x5a,
-        0xda,0xee,0xb2,0x86,0x0a,0x3e,0x62,0x56,0x61,0x55,0x09,0x3d,0xb1,0x85,0xd9,0xed,
-        0xb7,0x83,0xdf,0xeb,0x67,0x53,0x0f,0x3b,0x0c,0x38,0x64,0x50,0xdc,0xe8,0xb4,0x80,
-        0xaf,0x9b,0xc7,0xf3,0x7f,0x4b,0x17,0x23,0x14,0x20,0x7c,0x48,0xc4,0xf0,0xac,0x98,
-        0xc2,0xf6,0xaa,0x9e,0x12,0x26,0x7a,0x4e,0x79,0x4d,0x11,0x25,0xa9,0x9d,0xc1,0xf5,
-        0x75,0x41,0x1d,0x29,0xa5,0x91,0xcd,0xf9,0xce,0xfa,0xa6,0x92,0x1e,0x2a,0x76,0x42,
-        0x18,0x2c,0x70,0x44,0xc8,0xfc,0xa0,0x94,0xa3,0x97,0xcb,0xff,0x73,0x47,0x1b,0x2f,
-        0x45,0x71,0x2d,0x19,0x95,0xa1,0xfd,0xc9,0xfe,0xca,0x96,0xa2,0x2e,0x1a,0x46,0x72,
-        0x28,0x1c,0x40,0x74,0xf8,0xcc,0x90,0xa4,0x93,0xa7,0xfb,0xcf,0x43,0x77,0x2b,0x1f,
-        0x9f,0xab,0xf7,0xc3,0x4f,0x7b,0x27,0x13,0x24,0x10,0x4c,0x78,0xf4,0xc0,0x9c,0xa8,
-        0xf2,0xc6,0x9a,0xae,0x22,0x16,0x4a,0x7e,0x49,0x7d,0x21,0x15,0x99,0xad,0xf1,0xc5,
-        0xea,0xde,0x82,0xb6,0x3a,0x0e,0x52,0x66,0x51,0x65,0x39,0x0d,0x81,0xb5,0xe9,0xdd,
-        0x87,0xb3,0xef,0xdb,0x57,0x63,0x3f,0x0b,0x3c,0x08,0x54,0x60,0xec,0xd8,0x84,0xb0,
-        0x30,0x04,0x58,0x6c,0xe0,0xd4,0x88,0xbc,0x8b,0xbf,0xe3,0xd7,0x5b,0x6f,0x33,0x07,
-        0x5d,0x69,0x35,0x01,0x8d,0xb9,0xe5,0xd1,0xe6,0xd2,0x8e,0xba,0x36,0x02,0x5e,0x6a,
-    ),
-    ( # 53
-        0x00,0x35,0x6a,0x5f,0xd4,0xe1,0xbe,0x8b,0xb3,0x86,0xd9,0xec,0x67,0x52,0x0d,0x38,
-        0x7d,0x48,0x17,0x22,0xa9,0x9c,0xc3,0xf6,0xce,0xfb,0xa4,0x91,0x1a,0x2f,0x70,0x45,
-        0xfa,0xcf,0x90,0xa5,0x2e,0x1b,0x44,0x71,0x49,0x7c,0x23,0x16,0x9d,0xa8,0xf7,0xc2,
-        0x87,0xb2,0xed,0xd8,0x53,0x66,0x39,0x0c,0x34,0x01,0x5e,0x6b,0xe0,0xd5,0x8a,0xbf,
-        0xef,0xda,0x85,0xb0,0x3b,0x0e,0x51,0x64,0x5c,0x69,0x36,0x03,0x88,0xbd,0xe2,0xd7,
-        0x92,0xa7,0xf8,0xcd,0x46,0x73,0x2c,0x19,0x21,0x14,0x4b,0x7e,0xf5,0xc0,0x9f,0xaa,
-        0x15,0x20,0x7f,0x4a,0xc1,0xf4,0xab,0x9e,0xa6,0x93,0xcc,0xf9,0x72,0x47,0x18,0x2d,
-        0x68,0x5d,0x02,0x37,0xbc,0x89,0xd6,0xe3,0xdb,0xee,0xb1,0x84,0x0f,0x3a,0x65,0x50,
-        0xc5,0xf0,0xaf,0x9a,0x11,0x24,0x7b,0x4e,0x76,0x43,0x1c,0x29,0xa2,0x97,0xc8,0xfd,
-        0xb8,0x8d,0xd2,0xe7,0x6c,0x59,0x06,0x33,0x0b,0x3e,0x61,0x54,0xdf,0xea,0xb5,0x80,
-        0x3f,0x0a,0x55,0x60,0xeb,0xde,0x81,0xb4,0x8c,0xb9,0xe6,0xd3,0x58,0x6d,0x32,0x07,
-        0x42,0x77,0x28,0x1d,0x96,0xa3,0xfc,0xc9,0xf1,0xc4,0x9b,0xae,0x25,0x10,0x4f,0x7a,
-        0x2a,0x1f,0x40,0x75,0xfe,0xcb,0x94,0xa1,0x99,0xac,0xf3,0xc6,0x4d,0x78,0x27,0x12,
-        0x57,0x62,0x3d,0x08,0x83,0xb6,0xe9,0xdc,0xe4,0xd1,0x8e,0xbb,0x30,0x05,0x5a,0x6f,
-        0xd0,0xe5,0xba,0x8f,0x04,0x31,0x6e,0x5b,0x63,0x56,0x09,0x3c,0xb7,0x82,0xdd,0xe8,
-        0xad,0x98,0xc7,0xf2,0x79,0x4c,0x13,0x26,0x1e,0x2b,0x74,0x41,0xca,0xff,0xa0,0x95,
-    ),
-    ( # 54
-        0x00,0x36,0x6c,0x5a,0xd8,0xee,0xb4,0x82,0xab,0x9d,0xc7,0xf1,0x73,0x45,0x1f,0x29,
-        0x4d,0x7b,0x21,0x17,0x95,0xa3,0xf9,0xcf,0xe6,0xd0,0x8a,0xbc,0x3e,0x08,0x52,0x64,
-        0x9a,0xac,0xf6,0xc0,0x42,0x74,0x2e,0x18,0x31,0x07,0x5d,0x6b,0xe9,0xdf,0x85,0xb3,
-        0xd7,0xe1,0xbb,0x8d,0x0f,0x39,0x63,0x55,0x7c,0x4a,0x10,0x26,0xa4,0x92,0xc8,0xfe,
-        0x2f,0x19,0x43,0x75,0xf7,0xc1,0x9b,0xad,0x84,0xb2,0xe8,0xde,0x5c,0x6a,0x30,0x06,
-        0x62,0x54,0x0e,0x38,0xba,0x8c,0xd6,0xe0,0xc9,0xff,0xa5,0x93,0x11,0x27,0x7d,0x4b,
-        0xb5,0x83,0xd9,0xef,0x6d,0x5b,0x01,0x37,0x1e,0x28,0x72,0x44,0xc6,0xf0,0xaa,0x9c,
-        0xf8,0xce,0x94,0xa2,0x20,0x16,0x4c,0x7a,0x53,0x65,0x3f,0x09,0x8b,0xbd,0xe7,0xd1,
-        0x5e,0x68,0x32,0x04,0x86,0xb0,0xea,0xdc,0xf5,0xc3,0x99,0xaf,0x2d,0x1b,0x41,0x77,
-        0x13,0x25,0x7f,0x49,0xcb,0xfd,0xa7,0x91,0xb8,0x8e,0xd4,0xe2,0x60,0x56,0x0c,0x3a,
-        0xc4,0xf2,0xa8,0x9e,0x1c,0x2a,0x70,0x46,0x6f,0x59,0x03,0x35,0xb7,0x81,0xdb,0xed,
-        0x89,0xbf,0xe5,0xd3,0x51,0x67,0x3d,0x0b,0x22,0x14,0x4e,0x78,0xfa,0xcc,0x96,0xa0,
-        0x71,0x47,0x1d,0x2b,0xa9,0x9f,0xc5,0xf3,0xda,0xec,0xb6,0x80,0x02,0x34,0x6e,0x58,
-        0x3c,0x0a,0x50,0x66,0xe4,0xd2,0x88,0xbe,0x97,0xa1,0xfb,0xcd,0x4f,0x79,0x23,0x15,
-        0xeb,0xdd,0x87,0xb1,0x33,0x05,0x5f,0x69,0x40,0x76,0x2c,0x1a,0x98,0xae,0xf4,0xc2,
-        0xa6,0x90,0xca,0xfc,0x7e,0x48,0x12,0x24,0x0d,0x3b,0x61,0x57,0xd5,0xe3,0xb9,0x8f,
-    ),
-    ( # 55
-        0x00,0x37,0x6e,0x59,0xdc,0xeb,0xb2,0x85,0xa3,0x94,0xcd,0xfa,0x7f,0x48,0x11,0x26,
-        0x5d,0x6a,0x33,0x04,0x81,0xb6,0xef,0xd8,0xfe,0xc9,0x90,0xa7,0x22,0x15,0x4c,0x7b,
-        0xba,0x8d,0xd4,0xe3,0x66,0x51,0x08,0x3f,0x19,0x2e,0x77,0x40,0xc5,0xf2,0xab,0x9c,
-        0xe7,0xd0,0x89,0xbe,0x3b,0x0c,0x55,0x62,0x44,0x73,0x2a,0x1d,0x98,0xaf,0xf6,0xc1,
-        0x6f,0x58,0x01,0x36,0xb3,0x84,0xdd,0xea,0xcc,0xfb,0xa2,0x95,0x10,0x27,0x7e,0x49,
-        0x32,0x05,0x5c,0x6b,0xee,0xd9,0x80,0xb7,0x91,0xa6,0xff,0xc8,0x4d,0x7a,0x23,0x14,
-        0xd5,0xe2,0xbb,0x8c,0x09,0x3e,0x67,0x50,0x76,0x41,0x18,0x2f,0xaa,0x9d,0xc4,0xf3,
-        0x88,0xbf,0xe6,0xd1,0x54,0x63,0x3a,0x0d,0x2b,0x1c,0x45,0x72,0xf7,0xc0,0x99,0xae,
-        0xde,0xe9,0xb0,0x87,0x02,0x35,0x6c,0x5b,0x7d,0x4a,0x13,0x24,0xa1,0x96,0xcf,0xf8,
-        0x83,0xb4,0xed,0xda,0x5f,0x68,0x31,0x06,0x20,0x17,0x4e,0x79,0xfc,0xcb,0x92,0xa5,
-        0x64,0x53,0x0a,0x3d,0xb8,0x8f,0xd6,0xe1,0xc7,0xf0,0xa9,0x9e,0x1b,0x2c,0x75,0x42,
-        0x39,0x0e,0x57,0x60,0xe5,0xd2,0x8b,0xbc,0x9a,0xad,0xf4,0xc3,0x46,0x71,0x28,0x1f,
-        0xb1,0x86,0xdf,0xe8,0x6d,0x5a,0x03,0x34,0x12,0x25,0x7c,0x4b,0xce,0xf9,0xa0,0x97,
-        0xec,0xdb,0x82,0xb5,0x30,0x07,0x5e,0x69,0x4f,0x78,0x21,0x16,0x93,0xa4,0xfd,0xca,
-        0x0b,0x3c,0x65,0x52,0xd7,0xe0,0xb9,0x8e,0xa8,0x9f,0xc6,0xf1,0x74,0x43,0x1a,0x2d,
-        0x56,0x61,0x38,0x0f,0x8a,0xbd,0xe4,0xd3,0xf5,0xc2,0x9b,0xac,0x29,0x1e,0x47,0x70,
-    ),
-    ( # 56
-        0x00,0x38,0x70,0x48,0xe0,0xd8,0x90,0xa8,0xdb,0xe3,0xab,0x93,0x3b,0x03,0x4b,0x73,
-        0xad,0x95,0xdd,0xe5,0x4d,0x75,0x3d,0x05,0x76,0x4e,0x06,0x3e,0x96,0xae,0xe6,0xde,
-        0x41,0x79,0x31,0x09,0xa1,0x99,0xd1,0xe9,0x9a,0xa2,0xea,0xd2,0x7a,0x42,0x0a,0x32,
-        0xec,0xd4,0x9c,0xa4,0x0c,0x34,0x7c,0x44,0x37,0x0f,0x47,0x7f,0xd7,0xef,0xa7,0x9f,
-        0x82,0xba,0xf2,0xca,0x62,0x5a,0x12,0x2a,0x59,0x61,0x29,0x11,0xb9,0x81,0xc9,0xf1,
-        0x2f,0x17,0x5f,0x67,0xcf,0xf7,0xbf,0x87,0xf4,0xcc,0x84,0xbc,0x14,0x2c,0x64,0x5c,
-        0xc3,0xfb,0xb3,0x8b,0x23,0x1b,0x53,0x6b,0x18,0x20,0x68,0x50,0xf8,0xc0,0x88,0xb0,
-        0x6e,0x56,0x1e,0x26,0x8e,0xb6,0xfe,0xc6,0xb5,0x8d,0xc5,0xfd,0x55,0x6d,0x25,0x1d,
-        0x1f,0x27,0x6f,0x57,0xff,0xc7,0x8f,0xb7,0xc4,0xfc,0xb4,0x8c,0x24,0x1c,0x54,0x6c,
-        0xb2,0x8a,0xc2,0xfa,0x52,0x6a,0x22,0x1a,0x69,0x51,0x19,0x21,0x89,0xb1,0xf9,0xc1,
-        0x5e,0x66,0x2e,0x16,0xbe,0x86,0xce,0xf6,0x85,0xbd,0xf5,0xcd,0x65,0x5d,0x15,0x2d,
-        0xf3,0xcb,0x83,0xbb,0x13,0x2b,0x63,0x5b,0x28,0x10,0x58,0x60,0xc8,0xf0,0xb8,0x80,
-        0x9d,0xa5,0xed,0xd5,0x7d,0x45,0x0d,0x35,0x46,0x7e,0x36,0x0e,0xa6,0x9e,0xd6,0xee,
-        0x30,0x08,0x40,0x78,0xd0,0xe8,0xa0,0x98,0xeb,0xd3,0x9b,0xa3,0x0b,0x33,0x7b,0x43,
-        0xdc,0xe4,0xac,0x94,0x3c,0x04,0x4c,0x74,0x07,0x3f,0x77,0x4f,0xe7,0xdf,0x97,0xaf,
-        0x71,0x49,0x01,0x39,0x91,0xa9,0xe1,0xd9,0xaa,0x92,0xda,0xe2,0x4a,0x72,0x3a,0x02,
-    ),
-    ( # 57
-        0x00,0x39,0x72,0x4b,0xe4,0xdd,0x96,0xaf,0xd3,0xea,0xa1,0x98,0x37,0x0e,0x45,0x7c,
-        0xbd,0x84,0xcf,0xf6,0x59,0x60,0x2b,0x12,0x6e,0x57,0x1c,0x25,0x8a,0xb3,0xf8,0xc1,
-        0x61,0x58,0x13,0x2a,0x85,0xbc,0xf7,0xce,0xb2,0x8b,0xc0,0xf9,0x56,0x6f,0x24,0x1d,
-        0xdc,0xe5,0xae,0x97,0x38,0x01,0x4a,0x73,0x0f,0x36,0x7d,0x44,0xeb,0xd2,0x99,0xa0,
-        0xc2,0xfb,0xb0,0x89,0x26,0x1f,0x54,0x6d,0x11,0x28,0x63,0x5a,0xf5,0xcc,0x87,0xbe,
-        0x7f,0x46,0x0d,0x34,0x9b,0xa2,0xe9,0xd0,0xac,0x95,0xde,0xe7,0x48,0x71,0x3a,0x03,
-        0xa3,0x9a,0xd1,0xe8,0x47,0x7e,0x35,0x0c,0x70,0x49,0x02,0x3b,0x94,0xad,0xe6,0xdf,
-        0x1e,0x27,0x6c,0x55,0xfa,0xc3,0x88,0xb1,0xcd,0xf4,0xbf,0x86,0x29,0x10,0x5b,0x62,
-        0x9f,0xa6,0xed,0xd4,0x7b,0x42,0x09,0x30,0x4c,0x75,0x3e,0x07,0xa8,0x91,0xda,0xe3,
-        0x22,0x1b,0x50,0x69,0xc6,0xff,0xb4,0x8d,0xf1,0xc8,0x83,0xba,0x15,0x2c,0x67,0x5e,
-        0xfe,0xc7,0x8c,0xb5,0x1a,0x23,0x68,0x51,0x2d,0x14,0x5f,0x66,0xc9,0xf0,0xbb,0x82,
-        0x43,0x7a,0x31,0x08,0xa7,0x9e,0xd5,0xec,0x90,0xa9,0xe2,0xdb,0x74,0x4d,0x06,0x3f,
-        0x5d,0x64,0x2f,0x16,0xb9,0x80,0xcb,0xf2,0x8e,0xb7,0xfc,0xc5,0x6a,0x53,0x18,0x21,
-        0xe0,0xd9,0x92,0xab,0x04,0x3d,0x76,0x4f,0x33,0x0a,0x41,0x78,0xd7,0xee,0xa5,0x9c,
-        0x3c,0x05,0x4e,0x77,0xd8,0xe1,0xaa,0x93,0xef,0xd6,0x9d,0xa4,0x0b,0x32,0x79,0x40,
-        0x81,0xb8,0xf3,0xca,0x65,0x5c,0x17,0x2e,0x52,0x6b,0x20,0x19,0xb6,0x8f,0xc4,0xfd,
-    ),
-    ( # 58
-        0x00,0x3a,0x74,0x4e,0xe8,0xd2,0x9c,0xa6,0xcb,0xf1,0xbf,0x85,0x23,0x19,0x57,0x6d,
-        0x8d,0xb7,0xf9,0xc3,0x65,0x5f,0x11,0x2b,0x46,0x7c,0x32,0x08,0xae,0x94,0xda,0xe0,
-        0x01,0x3b,0x75,0x4f,0xe9,0xd3,0x9d,0xa7,0xca,0xf0,0xbe,0x84,0x22,0x18,0x56,0x6c,
-        0x8c,0xb6,0xf8,0xc2,0x64,0x5e,0x10,0x2a,0x47,0x7d,0x33,0x09,0xaf,0x95,0xdb,0xe1,
-        0x02,0x38,0x76,0x4c,0xea,0xd0,0x9e,0xa4,0xc9,0xf3,0xbd,0x87,0x21,0x1b,0x55,0x6f,
-        0x8f,0xb5,0xfb,0xc1,0x67,0x5d,0x13,0x29,0x44,0x7e,0x30,0x0a,0xac,0x96,0xd8,0xe2,
-        0x03,0x39,0x77,0x4d,0xeb,0xd1,0x9f,0xa5,0xc8,0xf2,0xbc,0x86,0x20,0x1a,0x54,0x6e,
-        0x8e,0xb4,0xfa,0xc0,0x66,0x5c,0x12,0x28,0x45,0x7f,0x31,0x0b,0xad,0x97,0xd9,0xe3,
-        0x04,0x3e,0x70,0x4a,0xec,0xd6,0x98,0xa2,0xcf,0xf5,0xbb,0x81,0x27,0x1d,0x53,0x69,
-        0x89,0xb3,0xfd,0xc7,0x61,0x5b,0x15,0x2f,0x42,0x78,0x36,0x0c,0xaa,0x90,0xde,0xe4,
-        0x05,0x3f,0x71,0x4b,0xed,0xd7,0x99,0xa3,0xce,0xf4,0xba,0x80,0x26,0x1c,0x52,0x68,
-        0x88,0xb2,0xfc,0xc6,0x60,0x5a,0x14,0x2e,0x43,0x79,0x37,0x0d,0xab,0x91,0xdf,0xe5,
-        0x06,0x3c,0x72,0x48,0xee,0xd4,0x9a,0xa0,0xcd,0xf7,0xb9,0x83,0x25,0x1f,0x51,0x6b,
-        0x8b,0xb1,0xff,0xc5,0x63,0x59,0x17,0x2d,0x40,0x7a,0x34,0x0e,0xa8,0x92,0xdc,0xe6,
-        0x07,0x3d,0x73,0x49,0xef,0xd5,0x9b,0xa1,0xcc,0xf6,0xb8,0x82,0x24,0x1e,0x50,0x6a,
-        0x8a,0xb0,0xfe,0xc4,0x62,0x58,0x16,0x2c,0x41,0x7b,0x35,0x0f,0xa9,0x93,0xdd,0xe7,
-    ),
-    ( # 59
-        0x00,0x3b,0x76,0x4d,0xec,0xd7,0x9a,0xa1,0xc3,0xf8,0xb5,0x8e,0x2f,0x14,0x59,0x62,
-        0x9d,0xa6,0xeb,0xd0,0x71,0x4a,0x07,0x3c,0x5e,0x65,0x28,0x13,0xb2,0x89,0xc4,0xff,
-        0x21,0x1a,0x57,0x6c,0xcd,0xf6,0xbb,0x80,0xe2,0xd9,0x94,0xaf,0x0e,0x35,0x78,0x43,
-        0xbc,0x87,0xca,0xf1,0x50,0x6b,0x26,0x1d,0x7f,0x44,0x09,0x32,0x93,0xa8,0xe5,0xde,
-        0x42,0x79,0x34,0x0f,0xae,0x95,0xd8,0xe3,0x81,0xba,0xf7,0xcc,0x6d,0x56,0x1b,0x20,
-        0xdf,0xe4,0xa9,0x92,0x33,0x08,0x45,0x7e,0x1c,0x27,0x6a,0x51,0xf0,0xcb,0x86,0xbd,
-        0x63,0x58,0x15,0x2e,0x8f,0xb4,0xf9,0xc2,0xa0,0x9b,0xd6,0xed,0x4c,0x77,0x3a,0x01,
-        0xfe,0xc5,0x88,0xb3,0x12,0x29,0x64,0x5f,0x3d,0x06,0x4b,0x70,0xd1,0xea,0xa7,0x9c,
-        0x84,0xbf,0xf2,0xc9,0x68,0x53,0x1e,0x25,0x47,0x7c,0x31,0x0a,0xab,0x90,0xdd,0xe6,
-        0x19,0x22,0x6f,0x54,0xf5,0xce,0x83,0xb8,0xda,0xe1,0xac,0x97,0x36,0x0d,0x40,0x7b,
-        0xa5,0x9e,0xd3,0xe8,0x49,0x72,0x3f,0x04,0x66,0x5d,0x10,0x2b,0x8a,0xb1,0xfc,0xc7,
-        0x38,0x03,0x4e,0x75,0xd4,0xef,0xa2,0x99,0xfb,0xc0,0x8d,0xb6,0x17,0x2c,0x61,0x5a,
-        0xc6,0xfd,0xb0,0x8b,0x2a,0x11,0x5c,0x67,0x05,0x3e,0x73,0x48,0xe9,0xd2,0x9f,0xa4,
-        0x5b,0x60,0x2d,0x16,0xb7,0x8c,0xc1,0xfa,0x98,0xa3,0xee,0xd5,0x74,0x4f,0x02,0x39,
-        0xe7,0xdc,0x91,0xaa,0x0b,0x30,0x7d,0x46,0x24,0x1f,0x52,0x69,0xc8,0xf3,0xbe,0x85,
-        0x7a,0x41,0x0c,0x37,0x96,0xad,0xe0,0xdb,0xb9,0x82,0xcf,0xf4,0x55,0x6e,0x23,0x18,
-    ),
-    ( # 60
-        0x00,0x3c,0x78,0x44,0xf0,0xcc,0x88,0xb4,0xfb,0xc7,0x83,0xbf,0x0b,0x37,0x73,0x4f,
-        0xed,0xd1,0x95,0xa9,0x1d,0x21,0x65,0x59,0x16,0x2a,0x6e,0x52,0xe6,0xda,0x9e,0xa2,
-        0xc1,0xfd,0xb9,0x85,0x31,0x0d,0x49,0x75,0x3a,0x06,0x42,0x7e,0xca,0xf6,0xb2,0x8e,
-        0x2c,0x10,0x54,0x68,0xdc,0xe0,0xa4,0x98,0xd7,0xeb,0xaf,0x93,0x27,0x1b,0x5f,0x63,
-        0x99,0xa5,0xe1,0xdd,0x69,0x55,0x11,0x2d,0x62,0x5e,0x1a,0x26,0x92,0xae,0xea,0xd6,
-        0x74,0x48,0x0c,0x30,0x84,0xb8,0xfc,0xc0,0x8f,0xb3,0xf7,0xcb,0x7f,0x43,0x07,0x3b,
-        0x58,0x64,0x20,0x1c,0xa8,0x94,0xd0,0xec,0xa3,0x9f,0xdb,0xe7,0x53,0x6f,0x2b,0x17,
-        0xb5,0x89,0xcd,0xf1,0x45,0x79,0x3d,0x01,0x4e,0x72,0x36,0x0a,0xbe,0x82,0xc6,0xfa,
-        0x29,0x15,0x51,0x6d,0xd9,0xe5,0xa1,0x9d,0xd2,0xee,0xaa,0x96,0x22,0x1e,0x5a,0x66,
-        0xc4,0xf8,0xbc,0x80,0x34,0x08,0x4c,0x70,0x3f,0x03,0x47,0x7b,0xcf,0xf3,0xb7,0x8b,
-        0xe8,0xd4,0x90,0xac,0x18,0x24,0x60,0x5c,0x13,0x2f,0x6b,0x57,0xe3,0xdf,0x9b,0xa7,
-        0x05,0x39,0x7d,0x41,0xf5,0xc9,0x8d,0xb1,0xfe,0xc2,0x86,0xba,0x0e,0x32,0x76,0x4a,
-        0xb0,0x8c,0xc8,0xf4,0x40,0x7c,0x38,0x04,0x4b,0x77,0x33,0x0f,0xbb,0x87,0xc3,0xff,
-        0x5d,0x61,0x25,0x19,0xad,0x91,0xd5,0xe9,0xa6,0x9a,0xde,0xe2,0x56,0x6a,0x2e,0x12,
-        0x71,0x4d,0x09,0x35,0x81,0xbd,0xf9,0xc5,0x8a,0xb6,0xf2,0xce,0x7a,0x46,0x02,0x3e,
-        0x9c,0xa0,0xe4,0xd8,0x6c,0x50,0x14,0x28,0x67,0x5b,0x1f,0x23,0x97,0xab,0xef,0xd3,
-    ),
-    ( # 61
-        0x00,0x3d,0x7a,0x47,0xf4,0xc9,0x8e,0xb3,0xf3,0xce,0x89,0xb4,0x07,0x3a,0x7d,0x40,
-        0xfd,0xc0,0x87,0xba,0x09,0x34,0x73,0x4e,0x0e,0x33,0x74,0x49,0xfa,0xc7,0x80,0xbd,
-        0xe1,0xdc,0x9b,0xa6,0x15,0x28,0x6f,0x52,0x12,0x2f,0x68,0x55,0xe6,0xdb,0x9c,0xa1,
-        0x1c,0x21,0x66,0x5b,0xe8,0xd5,0x92,0xaf,0xef,0xd2,0x95,0xa8,0x1b,0x26,0x61,0x5c,
-        0xd9,0xe4,0xa3,0x9e,0x2d,0x10,0x57,0x6a,0x2a,0x17,0x50,0x6d,0xde,0xe3,0xa4,0x99,
-        0x24,0x19,0x5e,0x63,0xd0,0xed,0xaa,0x97,0xd7,0xea,0xad,0x90,0x23,0x1e,0x59,0x64,
-        0x38,0x05,0x42,0x7f,0xcc,0xf1,0xb6,0x8b,0xcb,0xf6,0xb1,0x8c,0x3f,0x02,0x45,0x78,
-        0xc5,0xf8,0xbf,0x82,0x31,0x0c,0x4b,0x76,0x36,0x0b,0x4c,0x71,0xc2,0xff,0xb8,0x85,
-        0xa9,0x94,0xd3,0xee,0x5d,0x60,0x27,0x1a,0x5a,0x67,0x20,0x1d,0xae,0x93,0xd4,0xe9,
-        0x54,0x69,0x2e,0x13,0xa0,0x9d,0xda,0xe7,0xa7,0x9a,0xdd,0xe0,0x53,0x6e,0x29,0x14,
-        0x48,0x75,0x32,0x0f,0xbc,0x81,0xc6,0xfb,0xbb,0x86,0xc1,0xfc,0x4f,0x72,0x35,0x08,
-        0xb5,0x88,0xcf,0xf2,0x41,0x7c,0x3b,0x06,0x46,0x7b,0x3c,0x01,0xb2,0x8f,0xc8,0xf5,
-        0x70,0x4d,0x0a,0x37,0x84,0xb9,0xfe,0xc3,0x83,0xbe,0xf9,0xc4,0x77,0x4a,0x0d,0x30,
-        0x8d,0xb0,0xf7,0xca,0x79,0x44,0x03,0x3e,0x7e,0x43,0x04,0x39,0x8a,0xb7,0xf0,0xcd,
-        0x91,0xac,0xeb,0xd6,0x65,0x58,0x1f,0x22,0x62,0x5f,0x18,0x25,0x96,0xab,0xec,0xd1,
-        0x6c,0x51,0x16,0x2b,0x98,0xa5,0xe2,0xdf,0x9f,0xa2,0xe5,0xd8,0x6b,0x56,0x11,0x2c,
-    ),
-    ( # 62
-        0x00,0x3e,0x7c,0x42,0xf8,0xc6,0x84,0xba,0xeb,0xd5,0x97,0xa9,0x13,0x2d,0x6f,0x51,
-        0xcd,0xf3,0xb1,0x8f,0x35,0x0b,0x49,0x77,0x26,0x18,0x5a,0x64,0xde,0xe0,0xa2,0x9c,
-        0x81,0xbf,0xfd,0xc3,0x79,0x47,0x05,0x3b,0x6a,0x54,0x16,0x28,0x92,0xac,0xee,0xd0,
-        0x4c,0x72,0x30,0x0e,0xb4,0x8a,0xc8,0xf6,0xa7,0x99,0xdb,0xe5,0x5f,0x61,0x23,0x1d,
-        0x19,0x27,0x65,0x5b,0xe1,0xdf,0x9d,0xa3,0xf2,0xcc,0x8e,0xb0,0x0a,0x34,0x76,0x48,
-        0xd4,0xea,0xa8,0x96,0x2c,0x12,0x50,0x6e,0x3f,0x01,0x43,0x7d,0xc7,0xf9,0xbb,0x85,
-        0x98,0xa6,0xe4,0xda,0x60,0x5e,0x1c,0x22,0x73,0x4d,0x0f,0x31,0x8b,0xb5,0xf7,0xc9,
-        0x55,0x6b,0x29,0x17,0xad,0x93,0xd1,0xef,0xbe,0x80,0xc2,0xfc,0x46,0x78,0x3a,0x04,
-        0x32,0x0c,0x4e,0x70,0xca,0xf4,0xb6,0x88,0xd9,0xe7,0xa5,0x9b,0x21,0x1f,0x5d,0x63,
-        0xff,0xc1,0x83,0xbd,0x07,0x39,0x7b,0x45,0x14,0x2a,0x68,0x56,0xec,0xd2,0x90,0xae,
-        0xb3,0x8d,0xcf,0xf1,0x4b,0x75,0x37,0x09,0x58,0x66,0x24,0x1a,0xa0,0x9e,0xdc,0xe2,
-        0x7e,0x40,0x02,0x3c,0x86,0xb8,0xfa,0xc4,0x95,0xab,0xe9,0xd7,0x6d,0x53,0x11,0x2f,
-        0x2b,0x15,0x57,0x69,0xd3,0xed,0xaf,0x91,0xc0,0xfe,0xbc,0x82,0x38,0x06,0x44,0x7a,
-        0xe6,0xd8,0x9a,0xa4,0x1e,0x20,0x62,0x5c,0x0d,0x33,0x71,0x4f,0xf5,0xcb,0x89,0xb7,
-        0xaa,0x94,0xd6,0xe8,0x52,0x6c,0x2e,0x10,0x41,0x7f,0x3d,0x03,0xb9,0x87,0xc5,0xfb,
-        0x67,0x59,0x1b,0x25,0x9f,0xa1,0xe3,0xdd,0x8c,0xb2,0xf0,0xce,0x74,0x4a,0x08,0x36,
-    ),
-    ( # 63
-        0x00,0x3f,0x7e,0x41,0xfc,0xc3,0x82,0xbd,0xe3,0xdc,0x9d,0xa2,0x1f,0x20,0x61,0x5e,
-        0xdd,0xe2,0xa3,0x9c,0x21,0x1e,0x5f,0x60,0x3e,0x01,0x40,0x7f,0xc2,0xfd,0xbc,0x83,
-        0xa1,0x9e,0xdf,0xe0,0x5d,0x62,0x23,0x1c,0x42,0x7d,0x3c,0x03,0xbe,0x81,0xc0,0xff,
-        0x7c,0x43,0x02,0x3d,0x80,0xbf,0xfe,0xc1,0x9f,0xa0,0xe1,0xde,0x63,0x5c,0x1d,0x22,
-        0x59,0x66,0x27,0x18,0xa5,0x9a,0xdb,0xe4,0xba,0x85,0xc4,0xfb,0x46,0x79,0x38,0x07,
-        0x84,0xbb,0xfa,0xc5,0x78,0x47,0x06,0x39,0x67,0x58,0x19,0x26,0x9b,0xa4,0xe5,0xda,
-        0xf8,0xc7,0x86,0xb9,0x04,0x3b,0x7a,0x45,0x1b,0x24,0x65,0x5a,0xe7,0xd8,0x99,0xa6,
-        0x25,0x1a,0x5b,0x64,0xd9,0xe6,0xa7,0x98,0xc6,0xf9,0xb8,0x87,0x3a,0x05,0x44,0x7b,
-        0xb2,0x8d,0xcc,0xf3,0x4e,0x71,0x30,0x0f,0x51,0x6e,0x2f,0x10,0xad,0x92,0xd3,0xec,
-        0x6f,0x50,0x11,0x2e,0x93,0xac,0xed,0xd2,0x8c,0xb3,0xf2,0xcd,0x70,0x4f,0x0e,0x31,
-        0x13,0x2c,0x6d,0x52,0xef,0xd0,0x91,0xae,0xf0,0xcf,0x8e,0xb1,0x0c,0x33,0x72,0x4d,
-        0xce,0xf1,0xb0,0x8f,0x32,0x0d,0x4c,0x73,0x2d,0x12,0x53,0x6c,0xd1,0xee,0xaf,0x90,
-        0xeb,0xd4,0x95,0xaa,0x17,0x28,0x69,0x56,0x08,0x37,0x76,0x49,0xf4,0xcb,0x8a,0xb5,
-        0x36,0x09,0x48,0x77,0xca,0xf5,0xb4,0x8b,0xd5,0xea,0xab,0x94,0x29,0x16,0x57,0x68,
-        0x4a,0x75,0x34,0x0b,0xb6,0x89,0xc8,0xf7,0xa9,0x96,0xd7,0xe8,0x55,0x6a,0x2b,0x14,
-        0x97,0xa8,0xe9,0xd6,0x6b,0x54,0x15,0x2a,0x74,0x4b,0x0a,0x35,0x88,0xb7,0xf6,0xc9,
-    ),
-    ( # 64
-        0x00,0x40,0x80,0xc0,0x1b,0x5b,0x9b,0xdb,0x36,0x76,0xb6,0xf6,0x2d,0x6d,0xad,0xed,
-        0x6c,0x2c,0xec,0xac,0x77,0x37,0xf7,0xb7,0x5a,0x1a,0xda,0x9a,0x41,0x01,0xc1,0x81,
-        0xd8,0x98,0x58,0x18,0xc3,0x83,0x43,0x03,0xee,0xae,0x6e,0x2e,0xf5,0xb5,0x75,0x35,
-        0xb4,0xf4,0x34,0x74,0xaf,0xef,0x2f,0x6f,0x82,0xc2,0x02,0x42,0x99,0xd9,0x19,0x59,
-        0xab,0xeb,0x2b,0x6b,0xb0,0xf0,0x30,0x70,0x9d,0xdd,0x1d,0x5d,0x86,0xc6,0x06,0x46,
-        0xc7,0x87,0x47,0x07,0xdc,0x9c,0x5c,0x1c,0xf1,0xb1,0x71,0x31,0xea,0xaa,0x6a,0x2a,
-        0x73,0x33,0xf3,0xb3,0x68,0x28,0xe8,0xa8,0x45,0x05,0xc5,0x85,0x5e,0x1e,0xde,0x9e,
-        0x1f,0x5f,0x9f,0xdf,0x04,0x44,0x84,0xc4,0x29,0x69,0xa9,0xe9,0x32,0x72,0xb2,0xf2,
-        0x4d,0x0d,0xcd,0x8d,0x56,0x16,0xd6,0x96,0x7b,0x3b,0xfb,0xbb,0x60,0x20,0xe0,0xa0,
-        0x21,0x61,0xa1,0xe1,0x3a,0x7a,0xba,0xfa,0x17,0x57,0x97,0xd7,0x0c,0x4c,0x8c,0xcc,
-        0x95,0xd5,0x15,0x55,0x8e,0xce,0x0e,0x4e,0xa3,0xe3,0x23,0x63,0xb8,0xf8,0x38,0x78,
-        0xf9,0xb9,0x79,0x39,0xe2,0xa2,0x62,0x22,0xcf,0x8f,0x4f,0x0f,0xd4,0x94,0x54,0x14,
-        0xe6,0xa6,0x66,0x26,0xfd,0xbd,0x7d,0x3d,0xd0,0x90,0x50,0x10,0xcb,0x8b,0x4b,0x0b,
-        0x8a,0xca,0x0a,0x4a,0x91,0xd1,0x11,0x51,0xbc,0xfc,0x3c,0x7c,0xa7,0xe7,0x27,0x67,
-        0x3e,0x7e,0xbe,0xfe,0x25,0x65,0xa5,0xe5,0x08,0x48,0x88,0xc8,0x13,0x53,0x93,0xd3,
-        0x52,0x12,0xd2,0x92,0x49,0x09,0xc9,0x89,0x64,0x24,0xe4,0xa4,0x7f,0x3f,0xff,0xbf,
-    ),
-    ( # 65
-        0x00,0x41,0x82,0xc3,0x1f,0x5e,0x9d,0xdc,0x3e,0x7f,0xbc,0xfd,0x21,0x60,0xa3,0xe2,
-        0x7c,0x3d,0xfe,0xbf,0x63,0x22,0xe1,0xa0,0x42,0x03,0xc0,0x81,0x5d,0x1c,0xdf,0x9e,
-        0xf8,0xb9,0x7a,0x3b,0xe7,0xa6,0x65,0x24,0xc6,0x87,0x44,0x05,0xd9,0x98,0x5b,0x1a,
-        0x84,0xc5,0x06,0x47,0x9b,0xda,0x19,0x58,0xba,0xfb,0x38,0x79,0xa5,0xe4,0x27,0x66,
-        0xeb,0xaa,0x69,0x28,0xf4,0xb5,0x76,0x37,0xd5,0x94,0x57,0x16,0xca,0x8b,0x48,0x09,
-        0x97,0xd6,0x15,0x54,0x88,0xc9,0x0a,0x4b,0xa9,0xe8,0x2b,0x6a,0xb6,0xf7,0x34,0x75,
-        0x13,0x52,0x91,0xd0,0x0c,0x4d,0x8e,0xcf,0x2d,0x6c,0xaf,0xee,0x32,0x73,0xb0,0xf1,
-        0x6f,0x2e,0xed,0xac,0x70,0x31,0xf2,0xb3,0x51,0x10,0xd3,0x92,0x4e,0x0f,0xcc,0x8d,
-        0xcd,0x8c,0x4f,0x0e,0xd2,0x93,0x50,0x11,0xf3,0xb2,0x71,0x30,0xec,0xad,0x6e,0x2f,
-        0xb1,0xf0,0x33,0x72,0xae,0xef,0x2c,0x6d,0x8f,0xce,0x0d,0x4c,0x90,0xd1,0x12,0x53,
-        0x35,0x74,0xb7,0xf6,0x2a,0x6b,0xa8,0xe9,0x0b,0x4a,0x89,0xc8,0x14,0x55,0x96,0xd7,
-        0x49,0x08,0xcb,0x8a,0x56,0x17,0xd4,0x95,0x77,0x36,0xf5,0xb4,0x68,0x29,0xea,0xab,
-        0x26,0x67,0xa4,0xe5,0x39,0x78,0xbb,0xfa,0x18,0x59,0x9a,0xdb,0x07,0x46,0x85,0xc4,
-        0x5a,0x1b,0xd8,0x99,0x45,0x04,0xc7,0x86,0x64,0x25,0xe6,0xa7,0x7b,0x3a,0xf9,0xb8,
-        0xde,0x9f,0x5c,0x1d,0xc1,0x80,0x43,0x02,0xe0,0xa1,0x62,0x23,0xff,0xbe,0x7d,0x3c,
-        0xa2,0xe3,0x20,0x61,0xbd,0xfc,0x3f,0x7e,0x9c,0xdd,0x1e,0x5f,0x83,0xc2,0x01,0x40,
-    ),
-    ( # 66
-        0x00,0x42,0x84,0xc6,0x13,0x51,0x97,0xd5,0x26,0x64,0xa2,0xe0,0x35,0x77,0xb1,0xf3,
-        0x4c,0x0e,0xc8,0x8a,0x5f,0x1d,0xdb,0x99,0x6a,0x28,0xee,0xac,0x79,0x3b,0xfd,0xbf,
-        0x98,0xda,0x1c,0x5e,0x8b,0xc9,0x0f,0x4d,0xbe,0xfc,0x3a,0x78,0xad,0xef,0x29,0x6b,
-        0xd4,0x96,0x50,0x12,0xc7,0x85,0x43,0x01,0xf2,0xb0,0x76,0x34,0xe1,0xa3,0x65,0x27,
-        0x2b,0x69,0xaf,0xed,0x38,0x7a,0xbc,0xfe,0x0d,0x4f,0x89,0xcb,0x1e,0x5c,0x9a,0xd8,
-        0x67,0x25,0xe3,0xa1,0x74,0x36,0xf0,0xb2,0x41,0x03,0xc5,0x87,0x52,0x10,0xd6,0x94,
-        0xb3,0xf1,0x37,0x75,0xa0,0xe2,0x24,0x66,0x95,0xd7,0x11,0x53,0x86,0xc4,0x02,0x40,
-        0xff,0xbd,0x7b,0x39,0xec,0xae,0x68,0x2a,0xd9,0x9b,0x5d,0x1f,0xca,0x88,0x4e,0x0c,
-        0x56,0x14,0xd2,0x90,0x45,0x07,0xc1,0x83,0x70,0x32,0xf4,0xb6,0x63,0x21,0xe7,0xa5,
-        0x1a,0x58,0x9e,0xdc,0x09,0x4b,0x8d,0xcf,0x3c,0x7e,0xb8,0xfa,0x2f,0x6d,0xab,0xe9,
-        0xce,0x8c,0x4a,0x08,0xdd,0x9f,0x59,0x1b,0xe8,0xaa,0x6c,0x2e,0xfb,0xb9,0x7f,0x3d,
-        0x82,0xc0,0x06,0x44,0x91,0xd3,0x15,0x57,0xa4,0xe6,0x20,0x62,0xb7,0xf5,0x33,0x71,
-        0x7d,0x3f,0xf9,0xbb,0x6e,0x2c,0xea,0xa8,0x5b,0x19,0xdf,0x9d,0x48,0x0a,0xcc,0x8e,
-        0x31,0x73,0xb5,0xf7,0x22,0x60,0xa6,0xe4,0x17,0x55,0x93,0xd1,0x04,0x46,0x80,0xc2,
-        0xe5,0xa7,0x61,0x23,0xf6,0xb4,0x72,0x30,0xc3,0x81,0x47,0x05,0xd0,0x92,0x54,0x16,
-        0xa9,0xeb,0x2d,0x6f,0xba,0xf8,0x3e,0x7c,0x8f,0xcd,0x0b,0x49,0x9c,0xde,0x18,0x5a,
-    ),
-    ( # 67
-        0x00,0x43,0x86,0xc5,0x17,0x54,0x91,0xd2,0x2e,0x6d,0xa8,0xeb,0x39,0x7a,0xbf,0xfc,
-        0x5c,0x1f,0xda,0x99,0x4b,0x08,0xcd,0x8e,0x72,0x31,0xf4,0xb7,0x65,0x26,0xe3,0xa0,
-        0xb8,0xfb,0x3e,0x7d,0xaf,0xec,0x29,0x6a,0x96,0xd5,0x10,0x53,0x81,0xc2,0x07,0x44,
-        0xe4,0xa7,0x62,0x21,0xf3,0xb0,0x75,0x36,0xca,0x89,0x4c,0x0f,0xdd,0x9e,0x5b,0x18,
-        0x6b,0x28,0xed,0xae,0x7c,0x3f,0xfa,0xb9,0x45,0x06,0xc3,0x80,0x52,0x11,0xd4,0x97,
-        0x37,0x74,0xb1,0xf2,0x20,0x63,0xa6,0xe5,0x19,0x5a,0x9f,0xdc,0x0e,0x4d,0x88,0xcb,
-        0xd3,0x90,0x55,0x16,0xc4,0x87,0x42,0x01,0xfd,0xbe,0x7b,0x38,0xea,0xa9,0x6c,0x2f,
-        0x8f,0xcc,0x09,0x4a,0x98,0xdb,0x1e,0x5d,0xa1,0xe2,0x27,0x64,0xb6,0xf5,0x30,0x73,
-        0xd6,0x95,0x50,0x13,0xc1,0x82,0x47,0x04,0xf8,0xbb,0x7e,0x3d,0xef,0xac,0x69,0x2a,
-        0x8a,0xc9,0x0c,0x4f,0x9d,0xde,0x1b,0x58,0xa4,0xe7,0x22,0x61,0xb3,0xf0,0x35,0x76,
-        0x6e,0x2d,0xe8,0xab,0x79,0x3a,0xff,0xbc,0x40,0x03,0xc6,0x85,0x57,0x14,0xd1,0x92,
-        0x32,0x71,0xb4,0xf7,0x25,0x66,0xa3,0xe0,0x1c,0x5f,0x9a,0xd9,0x0b,0x48,0x8d,0xce,
-        0xbd,0xfe,0x3b,0x78,0xaa,0xe9,0x2c,0x6f,0x93,0xd0,0x15,0x56,0x84,0xc7,0x02,0x41,
-        0xe1,0xa2,0x67,0x24,0xf6,0xb5,0x70,0x33,0xcf,0x8c,0x49,0x0a,0xd8,0x9b,0x5e,0x1d,
-        0x05,0x46,0x83,0xc0,0x12,0x51,0x94,0xd7,0x2b,0x68,0xad,0xee,0x3c,0x7f,0xba,0xf9,
-        0x59,0x1a,0xdf,0x9c,0x4e,0x0d,0xc8,0x8b,0x77,0x34,0xf1,0xb2,0x60,0x23,0xe6,0xa5,
-    ),
-    ( # 68
-        0x00,0x44,0x88,0xcc,0x0b,0x4f,0x83,0xc7,0x16,0x52,0x9e,0xda,0x1d,0x59,0x95,0xd1,
-        0x2c,0x68,0xa4,0xe0,0x27,0x63,0xaf,0xeb,0x3a,0x7e,0xb2,0xf6,0x31,0x75,0xb9,0xfd,
-        0x58,0x1c,0xd0,0x94,0x53,0x17,0xdb,0x9f,0x4e,0x0a,0xc6,0x82,0x45,0x01,0xcd,0x89,
-        0x74,0x30,0xfc,0xb8,0x7f,0x3b,0xf7,0xb3,0x62,0x26,0xea,0xae,0x69,0x2d,0xe1,0xa5,
-        0xb0,0xf4,0x38,0x7c,0xbb,0xff,0x33,0x77,0xa6,0xe2,0x2e,0x6a,0xad,0xe9,0x25,0x61,
-        0x9c,0xd8,0x14,0x50,0x97,0xd3,0x1f,0x5b,0x8a,0xce,0x02,0x46,0x81,0xc5,0x09,0x4d,
-        0xe8,0xac,0x60,0x24,0xe3,0xa7,0x6b,0x2f,0xfe,0xba,0x76,0x32,0xf5,0xb1,0x7d,0x39,
-        0xc4,0x80,0x4c,0x08,0xcf,0x8b,0x47,0x03,0xd2,0x96,0x5a,0x1e,0xd9,0x9d,0x51,0x15,
-        0x7b,0x3f,0xf3,0xb7,0x70,0x34,0xf8,0xbc,0x6d,0x29,0xe5,0xa1,0x66,0x22,0xee,0xaa,
-        0x57,0x13,0xdf,0x9b,0x5c,0x18,0xd4,0x90,0x41,0x05,0xc9,0x8d,0x4a,0x0e,0xc2,0x86,
-        0x23,0x67,0xab,0xef,0x28,0x6c,0xa0,0xe4,0x35,0x71,0xbd,0xf9,0x3e,0x7a,0xb6,0xf2,
-        0x0f,0x4b,0x87,0xc3,0x04,0x40,0x8c,0xc8,0x19,0x5d,0x91,0xd5,0x12,0x56,0x9a,0xde,
-        0xcb,0x8f,0x43,0x07,0xc0,0x84,0x48,0x0c,0xdd,0x99,0x55,0x11,0xd6,0x92,0x5e,0x1a,
-        0xe7,0xa3,0x6f,0x2b,0xec,0xa8,0x64,0x20,0xf1,0xb5,0x79,0x3d,0xfa,0xbe,0x72,0x36,
-        0x93,0xd7,0x1b,0x5f,0x98,0xdc,0x10,0x54,0x85,0xc1,0x0d,0x49,0x8e,0xca,0x06,0x42,
-        0xbf,0xfb,0x37,0x73,0xb4,0xf0,0x3c,0x78,0xa9,0xed,0x21,0x65,0xa2,0xe6,0x2a,0x6e,
-    ),
-    ( # 69
-        0x00,0x45,0x8a,0xcf,0x0f,0x4a,0x85,0xc0,0x1e,0x5b,0x94,0xd1,0x11,0x54,0x9b,0xde,
-        0x3c,0x79,0xb6,0xf3,0x33,0x76,0xb9,0xfc,0x22,0x67,0xa8,0xed,0x2d,0x68,0xa7,0xe2,
-        0x78,0x3d,0xf2,0xb7,0x77,0x32,0xfd,0xb8,0x66,0x23,0xec,0xa9,0x69,0x2c,0xe3,0xa6,
-        0x44,0x01,0xce,0x8b,0x4b,0x0e,0xc1,0x84,0x5a,0x1f,0xd0,0x95,0x55,0x10,0xdf,0x9a,
-        0xf0,0xb5,0x7a,0x3f,0xff,0xba,0x75,0x30,0xee,0xab,0x64,0x21,0xe1,0xa4,0x6b,0x2e,
-        0xcc,0x89,0x46,0x03,0xc3,0x86,0x49,0x0c,0xd2,0x97,0x58,0x1d,0xdd,0x98,0x57,0x12,
-        0x88,0xcd,0x02,0x47,0x87,0xc2,0x0d,0x48,0x96,0xd3,0x1c,0x59,0x99,0xdc,0x13,0x56,
-        0xb4,0xf1,0x3e,0x7b,0xbb,0xfe,0x31,0x74,0xaa,0xef,0x20,0x65,0xa5,0xe0,0x2f,0x6a,
-        0xfb,0xbe,0x71,0x34,0xf4,0xb1,0x7e,0x3b,0xe5,0xa0,0x6f,0x2a,0xea,0xaf,0x60,0x25,
-        0xc7,0x82,0x4d,0x08,0xc8,0x8d,0x42,0x07,0xd9,0x9c,0x53,0x16,0xd6,0x93,0x5c,0x19,
-        0x83,0xc6,0x09,0x4c,0x8c,0xc9,0x06,0x43,0x9d,0xd8,0x17,0x52,0x92,0xd7,0x18,0x5d,
-        0xbf,0xfa,0x35,0x70,0xb0,0xf5,0x3a,0x7f,0xa1,0xe4,0x2b,0x6e,0xae,0xeb,0x24,0x61,
-        0x0b,0x4e,0x81,0xc4,0x04,0x41,0x8e,0xcb,0x15,0x50,0x9f,0xda,0x1a,0x5f,0x90,0xd5,
-        0x37,0x72,0xbd,0xf8,0x38,0x7d,0xb2,0xf7,0x29,0x6c,0xa3,0xe6,0x26,0x63,0xac,0xe9,
-        0x73,0x36,0xf9,0xbc,0x7c,0x39,0xf6,0xb3,0x6d,0x28,0xe7,0xa2,0x62,0x27,0xe8,0xad,
-        0x4f,0x0a,0xc5,0x80,0x40,0x05,0xca,0x8f,0x51,0x14,0xdb,0x9e,0x5e,0x1b,0xd4,0x91,
-    ),
-    ( # 70
-        0x00,0x46,0x8c,0xca,0x03,0x45,0x8f,0xc9,0x06,0x40,0x8a,0xcc,0x05,0x43,0x89,0xcf,
-        0x0c,0x4a,0x80,0xc6,0x0f,0x49,0x83,0xc5,0x0a,0x4c,0x86,0xc0,0x09,0x4f,0x85,0xc3,
-        0x18,0x5e,0x94,0xd2,0x1b,0x5d,0x97,0xd1,0x1e,0x58,0x92,0xd4,0x1d,0x5b,0x91,0xd7,
-        0x14,0x52,0x98,0xde,0x17,0x51,0x9b,0xdd,0x12,0x54,0x9e,0xd8,0x11,0x57,0x9d,0xdb,
-        0x30,0x76,0xbc,0xfa,0x33,0x75,0xbf,0xf9,0x36,0x70,0xba,0xfc,0x35,0x73,0xb9,0xff,
-        0x3c,0x7a,0xb0,0xf6,0x3f,0x79,0xb3,0xf5,0x3a,0x7c,0xb6,0xf0,0x39,0x7f,0xb5,0xf3,
-        0x28,0x6e,0xa4,0xe2,0x2b,0x6d,0xa7,0xe1,0x2e,0x68,0xa2,0xe4,0x2d,0x6b,0xa1,0xe7,
-        0x24,0x62,0xa8,0xee,0x27,0x61,0xab,0xed,0x22,0x64,0xae,0xe8,0x21,0x67,0xad,0xeb,
-        0x60,0x26,0xec,0xaa,0x63,0x25,0xef,0xa9,0x66,0x20,0xea,0xac,0x65,0x23,0xe9,0xaf,
-        0x6c,0x2a,0xe0,0xa6,0x6f,0x29,0xe3,0xa5,0x6a,0x2c,0xe6,0xa0,0x69,0x2f,0xe5,0xa3,
-        0x78,0x3e,0xf4,0xb2,0x7b,0x3d,0xf7,0xb1,0x7e,0x38,0xf2,0xb4,0x7d,0x3b,0xf1,0xb7,
-        0x74,0x32,0xf8,0xbe,0x77,0x31,0xfb,0xbd,0x72,0x34,0xfe,0xb8,0x71,0x37,0xfd,0xbb,
-        0x50,0x16,0xdc,0x9a,0x53,0x15,0xdf,0x99,0x56,0x10,0xda,0x9c,0x55,0x13,0xd9,0x9f,
-        0x5c,0x1a,0xd0,0x96,0x5f,0x19,0xd3,0x95,0x5a,0x1c,0xd6,0x90,0x59,0x1f,0xd5,0x93,
-        0x48,0x0e,0xc4,0x82,0x4b,0x0d,0xc7,0x81,0x4e,0x08,0xc2,0x84,0x4d,0x0b,0xc1,0x87,
-        0x44,0x02,0xc8,0x8e,0x47,0x01,0xcb,0x8d,0x42,0x04,0xce,0x88,0x41,0x07,0xcd,0x8b,
-    ),
-    ( # 71
-        0x00,0x47,0x8e,0xc9,0x07,0x40,0x89,0xce,0x0e,0x49,0x80,0xc7,0x09,0x4e,0x87,0xc0,
-        0x1c,0x5b,0x92,0xd5,0x1b,0x5c,0x95,0xd2,0x12,0x55,0x9c,0xdb,0x15,0x52,0x9b,0xdc,
-        0x38,0x7f,0xb6,0xf1,0x3f,0x78,0xb1,0xf6,0x36,0x71,0xb8,0xff,0x31,0x76,0xbf,0xf8,
-        0x24,0x63,0xaa,0xed,0x23,0x64,0xad,0xea,0x2a,0x6d,0xa4,0xe3,0x2d,0x6a,0xa3,0xe4,
-        0x70,0x37,0xfe,0xb9,0x77,0x30,0xf9,0xbe,0x7e,0x39,0xf0,0xb7,0x79,0x3e,0xf7,0xb0,
-        0x6c,0x2b,0xe2,0xa5,0x6b,0x2c,0xe5,0xa2,0x62,0x25,0xec,0xab,0x65,0x22,0xeb,0xac,
-        0x48,0x0f,0xc6,0x81,0x4f,0x08,0xc1,0x86,0x46,0x01,0xc8,0x8f,0x41,0x06,0xcf,0x88,
-        0x54,0x13,0xda,0x9d,0x53,0x14,0xdd,0x9a,0x5a,0x1d,0xd4,0x93,0x5d,0x1a,0xd3,0x94,
-        0xe0,0xa7,0x6e,0x29,0xe7,0xa0,0x69,0x2e,0xee,0xa9,0x60,0x27,0xe9,0xae,0x67,0x20,
-        0xfc,0xbb,0x72,0x35,0xfb,0xbc,0x75,0x32,0xf2,0xb5,0x7c,0x3b,0xf5,0xb2,0x7b,0x3c,
-        0xd8,0x9f,0x56,0x11,0xdf,0x98,0x51,0x16,0xd6,0x91,0x58,0x1f,0xd1,0x96,0x5f,0x18,
-        0xc4,0x83,0x4a,0x0d,0xc3,0x84,0x4d,0x0a,0xca,0x8d,0x44,0x03,0xcd,0x8a,0x43,0x04,
-        0x90,0xd7,0x1e,0x59,0x97,0xd0,0x19,0x5e,0x9e,0xd9,0x10,0x57,0x99,0xde,0x17,0x50,
-        0x8c,0xcb,0x02,0x45,0x8b,0xcc,0x05,0x42,0x82,0xc5,0x0c,0x4b,0x85,0xc2,0x0b,0x4c,
-        0xa8,0xef,0x26,0x61,0xaf,0xe8,0x21,0x66,0xa6,0xe1,0x28,0x6f,0xa1,0xe6,0x2f,0x68,
-        0xb4,0xf3,0x3a,0x7d,0xb3,0xf4,0x3d,0x7a,0xba,0xfd,0x34,0x73,0xbd,0xfa,0x33,0x74,
-    ),
-    ( # 72
-        0x00,0x48,0x90,0xd8,0x3b,0x73,0xab,0xe3,0x76,0x3e,0xe6,0xae,0x4d,0x05,0xdd,0x95,
-        0xec,0xa4,0x7c,0x34,0xd7,0x9f,0x47,0x0f,0x9a,0xd2,0x0a,0x42,0xa1,0xe9,0x31,0x79,
-        0xc3,0x8b,0x53,0x1b,0xf8,0xb0,0x68,0x20,0xb5,0xfd,0x25,0x6d,0x8e,0xc6,0x1e,0x56,
-        0x2f,0x67,0xbf,0xf7,0x14,0x5c,0x84,0xcc,0x59,0x11,0xc9,0x81,0x62,0x2a,0xf2,0xba,
-        0x9d,0xd5,0x0d,0x45,0xa6,0xee,0x36,0x7e,0xeb,0xa3,0x7b,0x33,0xd0,0x98,0x40,0x08,
-        0x71,0x39,0xe1,0xa9,0x4a,0x02,0xda,0x92,0x07,0x4f,0x97,0xdf,0x3c,0x74,0xac,0xe4,
-        0x5e,0x16,0xce,0x86,0x65,0x2d,0xf5,0xbd,0x28,0x60,0xb8,0xf0,0x13,0x5b,0x83,0xcb,
-        0xb2,0xfa,0x22,0x6a,0x89,0xc1,0x19,0x51,0xc4,0x8c,0x54,0x1c,0xff,0xb7,0x6f,0x27,
-        0x21,0x69,0xb1,0xf9,0x1a,0x52,0x8a,0xc2,0x57,0x1f,0xc7,0x8f,0x6c,0x24,0xfc,0xb4,
-        0xcd,0x85,0x5d,0x15,0xf6,0xbe,0x66,0x2e,0xbb,0xf3,0x2b,0x63,0x80,0xc8,0x10,0x58,
-        0xe2,0xaa,0x72,0x3a,0xd9,0x91,0x49,0x01,0x94,0xdc,0x04,0x4c,0xaf,0xe7,0x3f,0x77,
-        0x0e,0x46,0x9e,0xd6,0x35,0x7d,0xa5,0xed,0x78,0x30,0xe8,0xa0,0x43,0x0b,0xd3,0x9b,
-        0xbc,0xf4,0x2c,0x64,0x87,0xcf,0x17,0x5f,0xca,0x82,0x5a,0x12,0xf1,0xb9,0x61,0x29,
-        0x50,0x18,0xc0,0x88,0x6b,0x23,0xfb,0xb3,0x26,0x6e,0xb6,0xfe,0x1d,0x55,0x8d,0xc5,
-        0x7f,0x37,0xef,0xa7,0x44,0x0c,0xd4,0x9c,0x09,0x41,0x99,0xd1,0x32,0x7a,0xa2,0xea,
-        0x93,0xdb,0x03,0x4b,0xa8,0xe0,0x38,0x70,0xe5,0xad,0x75,0x3d,0xde,0x96,0x4e,0x06,
-    ),
-    ( # 73
-        0x00,0x49,0x92,0xdb,0x3f,0x76,0xad,0xe4,0x7e,0x37,0xec,0xa5,0x41,0x08,0xd3,0x9a,
-        0xfc,0xb5,0x6e,0x27,0xc3,0x8a,0x51,0x18,0x82,0xcb,0x10,0x59,0xbd,0xf4,0x2f,0x66,
-        0xe3,0xaa,0x71,0x38,0xdc,0x95,0x4e,0x07,0x9d,0xd4,0x0f,0x46,0xa2,0xeb,0x30,0x79,
-        0x1f,0x56,0x8d,0xc4,0x20,0x69,0xb2,0xfb,0x61,0x28,0xf3,0xba,0x5e,0x17,0xcc,0x85,
-        0xdd,0x94,0x4f,0x06,0xe2,0xab,0x70,0x39,0xa3,0xea,0x31,0x78,0x9c,0xd5,0x0e,0x47,
-        0x21,0x68,0xb3,0xfa,0x1e,0x57,0x8c,0xc5,0x5f,0x16,0xcd,0x84,0x60,0x29,0xf2,0xbb,
-        0x3e,0x77,0xac,0xe5,0x01,0x48,0x93,0xda,0x40,0x09,0xd2,0x9b,0x7f,0x36,0xed,0xa4,
-        0xc2,0x8b,0x50,0x19,0xfd,0xb4,0x6f,0x26,0xbc,0xf5,0x2e,0x67,0x83,0xca,0x11,0x58,
-        0xa1,0xe8,0x33,0x7a,0x9e,0xd7,0x0c,0x45,0xdf,0x96,0x4d,0x04,0xe0,0xa9,0x72,0x3b,
-        0x5d,0x14,0xcf,0x86,0x62,0x2b,0xf0,0xb9,0x23,0x6a,0xb1,0xf8,0x1c,0x55,0x8e,0xc7,
-        0x42,0x0b,0xd0,0x99,0x7d,0x34,0xef,0xa6,0x3c,0x75,0xae,0xe7,0x03,0x4a,0x91,0xd8,
-        0xbe,0xf7,0x2c,0x65,0x81,0xc8,0x13,0x5a,0xc0,0x89,0x52,0x1b,0xff,0xb6,0x6d,0x24,
-        0x7c,0x35,0xee,0xa7,0x43,0x0a,0xd1,0x98,0x02,0x4b,0x90,0xd9,0x3d,0x74,0xaf,0xe6,
-        0x80,0xc9,0x12,0x5b,0xbf,0xf6,0x2d,0x64,0xfe,0xb7,0x6c,0x25,0xc1,0x88,0x53,0x1a,
-        0x9f,0xd6,0x0d,0x44,0xa0,0xe9,0x32,0x7b,0xe1,0xa8,0x73,0x3a,0xde,0x97,0x4c,0x05,
-        0x63,0x2a,0xf1,0xb8,0x5c,0x15,0xce,0x87,0x1d,0x54,0x8f,0xc6,0x22,0x6b,0xb0,0xf9,
-    ),
-    ( # 74
-        0x00,0x4a,0x94,0xde,0x33,0x79,0xa7,0xed,0x66,0x2c,0xf2,0xb8,0x55,0x1f,0xc1,0x8b,
-        0xcc,0x86,0x58,0x12,0xff,0xb5,0x6b,0x21,0xaa,0xe0,0x3e,0x74,0x99,0xd3,0x0d,0x47,
-        0x83,0xc9,0x17,0x5d,0xb0,0xfa,0x24,0x6e,0xe5,0xaf,0x71,0x3b,0xd6,0x9c,0x42,0x08,
-        0x4f,0x05,0xdb,0x91,0x7c,0x36,0xe8,0xa2,0x29,0x63,0xbd,0xf7,0x1a,0x50,0x8e,0xc4,
-        0x1d,0x57,0x89,0xc3,0x2e,0x64,0xba,0xf0,0x7b,0x31,0xef,0xa5,0x48,0x02,0xdc,0x96,
-        0xd1,0x9b,0x45,0x0f,0xe2,0xa8,0x76,0x3c,0xb7,0xfd,0x23,0x69,0x84,0xce,0x10,0x5a,
-        0x9e,0xd4,0x0a,0x40,0xad,0xe7,0x39,0x73,0xf8,0xb2,0x6c,0x26,0xcb,0x81,0x5f,0x15,
-        0x52,0x18,0xc6,0x8c,0x61,0x2b,0xf5,0xbf,0x34,0x7e,0xa0,0xea,0x07,0x4d,0x93,0xd9,
-        0x3a,0x70,0xae,0xe4,0x09,0x43,0x9d,0xd7,0x5c,0x16,0xc8,0x82,0x6f,0x25,0xfb,0xb1,
-        0xf6,0xbc,0x62,0x28,0xc5,0x8f,0x51,0x1b,0x90,0xda,0x04,0x4e,0xa3,0xe9,0x37,0x7d,
-        0xb9,0xf3,0x2d,0x67,0x8a,0xc0,0x1e,0x54,0xdf,0x95,0x4b,0x01,0xec,0xa6,0x78,0x32,
-        0x75,0x3f,0xe1,0xab,0x46,0x0c,0xd2,0x98,0x13,0x59,0x87,0xcd,0x20,0x6a,0xb4,0xfe,
-        0x27,0x6d,0xb3,0xf9,0x14,0x5e,0x80,0xca,0x41,0x0b,0xd5,0x9f,0x72,0x38,0xe6,0xac,
-        0xeb,0xa1,0x7f,0x35,0xd8,0x92,0x4c,0x06,0x8d,0xc7,0x19,0x53,0xbe,0xf4,0x2a,0x60,
-        0xa4,0xee,0x30,0x7a,0x97,0xdd,0x03,0x49,0xc2,0x88,0x56,0x1c,0xf1,0xbb,0x65,0x2f,
-        0x68,0x22,0xfc,0xb6,0x5b,0x11,0xcf,0x85,0x0e,0x44,0x9a,0xd0,0x3d,0x77,0xa9,0xe3,
-    ),
-    ( # 75
-        0x00,0x4b,0x96,0xdd,0x37,0x7c,0xa1,0xea,0x6e,0x25,0xf8,0xb3,0x59,0x12,0xcf,0x84,
-        0xdc,0x97,0x4a,0x01,0xeb,0xa0,0x7d,0x36,0xb2,0xf9,0x24,0x6f,0x85,0xce,0x13,0x58,
-        0xa3,0xe8,0x35,0x7e,0x94,0xdf,0x02,0x49,0xcd,0x86,0x5b,0x10,0xfa,0xb1,0x6c,0x27,
-        0x7f,0x34,0xe9,0xa2,0x48,0x03,0xde,0x95,0x11,0x5a,0x87,0xcc,0x26,0x6d,0xb0,0xfb,
-        0x5d,0x16,0xcb,0x80,0x6a,0x21,0xfc,0xb7,0x33,0x78,0xa5,0xee,0x04,0x4f,0x92,0xd9,
-        0x81,0xca,0x17,0x5c,0xb6,0xfd,0x20,0x6b,0xef,0xa4,0x79,0x32,0xd8,0x93,0x4e,0x05,
-        0xfe,0xb5,0x68,0x23,0xc9,0x82,0x5f,0x14,0x90,0xdb,0x06,0x4d,0xa7,0xec,0x31,0x7a,
-        0x22,0x69,0xb4,0xff,0x15,0x5e,0x83,0xc8,0x4c,0x07,0xda,0x91,0x7b,0x30,0xed,0xa6,
-        0xba,0xf1,0x2c,0x67,0x8d,0xc6,0x1b,0x50,0xd4,0x9f,0x42,0x09,0xe3,0xa8,0x75,0x3e,
-        0x66,0x2d,0xf0,0xbb,0x51,0x1a,0xc7,0x8c,0x08,0x43,0x9e,0xd5,0x3f,0x74,0xa9,0xe2,
-        0x19,0x52,0x8f,0xc4,0x2e,0x65,0xb8,0xf3,0x77,0x3c,0xe1,0xaa,0x40,0x0b,0xd6,0x9d,
-        0xc5,0x8e,0x53,0x18,0xf2,0xb9,0x64,0x2f,0xab,0xe0,0x3d,0x76,0x9c,0xd7,0x0a,0x41,
-        0xe7,0xac,0x71,0x3a,0xd0,0x9b,0x46,0x0d,0x89,0xc2,0x1f,0x54,0xbe,0xf5,0x28,0x63,
-        0x3b,0x70,0xad,0xe6,0x0c,0x47,0x9a,0xd1,0x55,0x1e,0xc3,0x88,0x62,0x29,0xf4,0xbf,
-        0x44,0x0f,0xd2,0x99,0x73,0x38,0xe5,0xae,0x2a,0x61,0xbc,0xf7,0x1d,0x56,0x8b,0xc0,
-        0x98,0xd3,0x0e,0x45,0xaf,0xe4,0x39,0x72,0xf6,0xbd,0x60,0x2b,0xc1,0x8a,0x57,0x1c,
-    ),
-    ( # 76
-        0x00,0x4c,0x98,0xd4,0x2b,0x67,0xb3,0xff,0x56,0x1a,0xce,0x82,0x7d,0x31,0xe5,0xa9,
-        0xac,0xe0,0x34,0x78,0x87,0xcb,0x1f,0x53,0xfa,0xb6,0x62,0x2e,0xd1,0x9d,0x49,0x05,
-        0x43,0x0f,0xdb,0x97,0x68,0x24,0xf0,0xbc,0x15,0x59,0x8d,0xc1,0x3e,0x72,0xa6,0xea,
-        0xef,0xa3,0x77,0x3b,0xc4,0x88,0x5c,0x10,0xb9,0xf5,0x21,0x6d,0x92,0xde,0x0a,0x46,
-        0x86,0xca,0x1e,0x52,0xad,0xe1,0x35,0x79,0xd0,0x9c,0x48,0x04,0xfb,0xb7,0x63,0x2f,
-        0x2a,0x66,0xb2,0xfe,0x01,0x4d,0x99,0xd5,0x7c,0x30,0xe4,0xa8,0x57,0x1b,0xcf,0x83,
-        0xc5,0x89,0x5d,0x11,0xee,0xa2,0x76,0x3a,0x93,0xdf,0x0b,0x47,0xb8,0xf4,0x20,0x6c,
-        0x69,0x25,0xf1,0xbd,0x42,0x0e,0xda,0x96,0x3f,0x73,0xa7,0xeb,0x14,0x58,0x8c,0xc0,
-        0x17,0x5b,0x8f,0xc3,0x3c,0x70,0xa4,0xe8,0x41,0x0d,0xd9,0x95,0x6a,0x26,0xf2,0xbe,
-        0xbb,0xf7,0x23,0x6f,0x90,0xdc,0x08,0x44,0xed,0xa1,0x75,0x39,0xc6,0x8a,0x5e,0x12,
-        0x54,0x18,0xcc,0x80,0x7f,0x33,0xe7,0xab,0x02,0x4e,0x9a,0xd6,0x29,0x65,0xb1,0xfd,
-        0xf8,0xb4,0x60,0x2c,0xd3,0x9f,0x4b,0x07,0xae,0xe2,0x36,0x7a,0x85,0xc9,0x1d,0x51,
-        0x91,0xdd,0x09,0x45,0xba,0xf6,0x22,0x6e,0xc7,0x8b,0x5f,0x13,0xec,0xa0,0x74,0x38,
-        0x3d,0x71,0xa5,0xe9,0x16,0x5a,0x8e,0xc2,0x6b,0x27,0xf3,0xbf,0x40,0x0c,0xd8,0x94,
-        0xd2,0x9e,0x4a,0x06,0xf9,0xb5,0x61,0x2d,0x84,0xc8,0x1c,0x50,0xaf,0xe3,0x37,0x7b,
-        0x7e,0x32,0xe6,0xaa,0x55,0x19,0xcd,0x81,0x28,0x64,0xb0,0xfc,0x03,0x4f,0x9b,0xd7,
-    ),
-    ( # 77
-        0x00,0x4d,0x9a,0xd7,0x2f,0x62,0xb5,0xf8,0x5e,0x13,0xc4,0x89,0x71,0x3c,0xeb,0xa6,
-        0xbc,0xf1,0x26,0x6b,0x93,0xde,0x09,0x44,0xe2,0xaf,0x78,0x35,0xcd,0x80,0x57,0x1a,
-        0x63,0x2e,0xf9,0xb4,0x4c,0x01,0xd6,0x9b,0x3d,0x70,0xa7,0xea,0x12,0x5f,0x88,0xc5,
-        0xdf,0x92,0x45,0x08,0xf0,0xbd,0x6a,0x27,0x81,0xcc,0x1b,0x56,0xae,0xe3,0x34,0x79,
-        0xc6,0x8b,0x5c,0x11,0xe9,0xa4,0x73,0x3e,0x98,0xd5,0x02,0x4f,0xb7,0xfa,0x2d,0x60,
-        0x7a,0x37,0xe0,0xad,0x55,0x18,0xcf,0x82,0x24,0x69,0xbe,0xf3,0x0b,0x46,0x91,0xdc,
-        0xa5,0xe8,0x3f,0x72,0x8a,0xc7,0x10,0x5d,0xfb,0xb6,0x61,0x2c,0xd4,0x99,0x4e,0x03,
-        0x19,0x54,0x83,0xce,0x36,0x7b,0xac,0xe1,0x47,0x0a,0xdd,0x90,0x68,0x25,0xf2,0xbf,
-        0x97,0xda,0x0d,0x40,0xb8,0xf5,0x22,0x6f,0xc9,0x84,0x53,0x1e,0xe6,0xab,0x7c,0x31,
-        0x2b,0x66,0xb1,0xfc,0x04,0x49,0x9e,0xd3,0x75,0x38,0xef,0xa2,0x5a,0x17,0xc0,0x8d,
-        0xf4,0xb9,0x6e,0x23,0xdb,0x96,0x41,0x0c,0xaa,0xe7,0x30,0x7d,0x85,0xc8,0x1f,0x52,
-        0x48,0x05,0xd2,0x9f,0x67,0x2a,0xfd,0xb0,0x16,0x5b,0x8c,0xc1,0x39,0x74,0xa3,0xee,
-        0x51,0x1c,0xcb,0x86,0x7e,0x33,0xe4,0xa9,0x0f,0x42,0x95,0xd8,0x20,0x6d,0xba,0xf7,
-        0xed,0xa0,0x77,0x3a,0xc2,0x8f,0x58,0x15,0xb3,0xfe,0x29,0x64,0x9c,0xd1,0x06,0x4b,
-        0x32,0x7f,0xa8,0xe5,0x1d,0x50,0x87,0xca,0x6c,0x21,0xf6,0xbb,0x43,0x0e,0xd9,0x94,
-        0x8e,0xc3,0x14,0x59,0xa1,0xec,0x3b,0x76,0xd0,0x9d,0x4a,0x07,0xff,0xb2,0x65,0x28,
-    ),
-    ( # 78
-        0x00,0x4e,0x9c,0xd2,0x23,0x6d,0xbf,0xf1,0x46,0x08,0xda,0x94,0x65,0x2b,0xf9,0xb7,
-        0x8c,0xc2,0x10,0x5e,0xaf,0xe1,0x33,0x7d,0xca,0x84,0x56,0x18,0xe9,0xa7,0x75,0x3b,
-        0x03,0x4d,0x9f,0xd1,0x20,0x6e,0xbc,0xf2,0x45,0x0b,0xd9,0x97,0x66,0x28,0xfa,0xb4,
-        0x8f,0xc1,0x13,0x5d,0xac,0xe2,0x30,0x7e,0xc9,0x87,0x55,0x1b,0xea,0xa4,0x76,0x38,
-        0x06,0x48,0x9a,0xd4,0x25,0x6b,0xb9,0xf7,0x40,0x0e,0xdc,0x92,0x63,0x2d,0xff,0xb1,
-        0x8a,0xc4,0x16,0x58,0xa9,0xe7,0x35,0x7b,0xcc,0x82,0x50,0x1e,0xef,0xa1,0x73,0x3d,
-        0x05,0x4b,0x99,0xd7,0x26,0x68,0xba,0xf4,0x43,0x0d,0xdf,0x91,0x60,0x2e,0xfc,0xb2,
-        0x89,0xc7,0x15,0x5b,0xaa,0xe4,0x36,0x78,0xcf,0x81,0x53,0x1d,0xec,0xa2,0x70,0x3e,
-        0x0c,0x42,0x90,0xde,0x2f,0x61,0xb3,0xfd,0x4a,0x04,0xd6,0x98,0x69,0x27,0xf5,0xbb,
-        0x80,0xce,0x1c,0x52,0xa3,0xed,0x3f,0x71,0xc6,0x88,0x5a,0x14,0xe5,0xab,0x79,0x37,
-        0x0f,0x41,0x93,0xdd,0x2c,0x62,0xb0,0xfe,0x49,0x07,0xd5,0x9b,0x6a,0x24,0xf6,0xb8,
-        0x83,0xcd,0x1f,0x51,0xa0,0xee,0x3c,0x72,0xc5,0x8b,0x59,0x17,0xe6,0xa8,0x7a,0x34,
-        0x0a,0x44,0x96,0xd8,0x29,0x67,0xb5,0xfb,0x4c,0x02,0xd0,0x9e,0x6f,0x21,0xf3,0xbd,
-        0x86,0xc8,0x1a,0x54,0xa5,0xeb,0x39,0x77,0xc0,0x8e,0x5c,0x12,0xe3,0xad,0x7f,0x31,
-        0x09,0x47,0x95,0xdb,0x2a,0x64,0xb6,0xf8,0x4f,0x01,0xd3,0x9d,0x6c,0x22,0xf0,0xbe,
-        0x85,0xcb,0x19,0x57,0xa6,0xe8,0x3a,0x74,0xc3,0x8d,0x5f,0x11,0xe0,0xae,0x7c,0x32,
-    ),
-    ( # 79
-        0x00,0x4f,0x9e,0xd1,0x27,0x68,0xb9,0xf6,0x4e,0x01,0xd0,0x9f,0x69,0x26,0xf7,0xb8,
-        0x9c,0xd3,0x02,0x4d,0xbb,0xf4,0x25,0x6a,0xd2,0x9d,0x4c,0x03,0xf5,0xba,0x6b,0x24,
-        0x23,0x6c,0xbd,0xf2,0x04,0x4b,0x9a,0xd5,0x6d,0x22,0xf3,0xbc,0x4a,0x05,0xd4,0x9b,
-        0xbf,0xf0,0x21,0x6e,0x98,0xd7,0x06,0x49,0xf1,0xbe,0x6f,0x20,0xd6,0x99,0x48,0x07,
-        0x46,0x09,0xd8,0x97,0x61,0x2e,0xff,0xb0,0x08,0x47,0x96,0xd9,0x2f,0x60,0xb1,0xfe,
-        0xda,0x95,0x44,0x0b,0xfd,0xb2,0x63,0x2c,0x94,0xdb,0x0a,0x45,0xb3,0xfc,0x2d,0x62,
-        0x65,0x2a,0xfb,0xb4,0x42,0x0d,0xdc,0x93,0x2b,0x64,0xb5,0xfa,0x0c,0x43,0x92,0xdd,
-        0xf9,0xb6,0x67,0x28,0xde,0x91,0x40,0x0f,0xb7,0xf8,0x29,0x66,0x90,0xdf,0x0e,0x41,
-        0x8c,0xc3,0x12,0x5d,0xab,0xe4,0x35,0x7a,0xc2,0x8d,0x5c,0x13,0xe5,0xaa,0x7b,0x34,
-        0x10,0x5f,0x8e,0xc1,0x37,0x78,0xa9,0xe6,0x5e,0x11,0xc0,0x8f,0x79,0x36,0xe7,0xa8,
-        0xaf,0xe0,0x31,0x7e,0x88,0xc7,0x16,0x59,0xe1,0xae,0x7f,0x30,0xc6,0x89,0x58,0x17,
-        0x33,0x7c,0xad,0xe2,0x14,0x5b,0x8a,0xc5,0x7d,0x32,0xe3,0xac,0x5a,0x15,0xc4,0x8b,
-        0xca,0x85,0x54,0x1b,0xed,0xa2,0x73,0x3c,0x84,0xcb,0x1a,0x55,0xa3,0xec,0x3d,0x72,
-        0x56,0x19,0xc8,0x87,0x71,0x3e,0xef,0xa0,0x18,0x57,0x86,0xc9,0x3f,0x70,0xa1,0xee,
-        0xe9,0xa6,0x77,0x38,0xce,0x81,0x50,0x1f,0xa7,0xe8,0x39,0x76,0x80,0xcf,0x1e,0x51,
-        0x75,0x3a,0xeb,0xa4,0x52,0x1d,0xcc,0x83,0x3b,0x74,0xa5,0xea,0x1c,0x53,0x82,0xcd,
-    ),
-    ( # 80
-        0x00,0x50,0xa0,0xf0,0x5b,0x0b,0xfb,0xab,0xb6,0xe6,0x16,0x46,0xed,0xbd,0x4d,0x1d,
-        0x77,0x27,0xd7,0x87,0x2c,0x7c,0x8c,0xdc,0xc1,0x91,0x61,0x31,0x9a,0xca,0x3a,0x6a,
-        0xee,0xbe,0x4e,0x1e,0xb5,0xe5,0x15,0x45,0x58,0x08,0xf8,0xa8,0x03,0x53,0xa3,0xf3,
-        0x99,0xc9,0x39,0x69,0xc2,0x92,0x62,0x32,0x2f,0x7f,0x8f,0xdf,0x74,0x24,0xd4,0x84,
-        0xc7,0x97,0x67,0x37,0x9c,0xcc,0x3c,0x6c,0x71,0x21,0xd1,0x81,0x2a,0x7a,0x8a,0xda,
-        0xb0,0xe0,0x10,0x40,0xeb,0xbb,0x4b,0x1b,0x06,0x56,0xa6,0xf6,0x5d,0x0d,0xfd,0xad,
-        0x29,0x79,0x89,0xd9,0x72,0x22,0xd2,0x82,0x9f,0xcf,0x3f,0x6f,0xc4,0x94,0x64,0x34,
-        0x5e,0x0e,0xfe,0xae,0x05,0x55,0xa5,0xf5,0xe8,0xb8,0x48,0x18,0xb3,0xe3,0x13,0x43,
-        0x95,0xc5,0x35,0x65,0xce,0x9e,0x6e,0x3e,0x23,0x73,0x83,0xd3,0x78,0x28,0xd8,0x88,
-        0xe2,0xb2,0x42,0x12,0xb9,0xe9,0x19,0x49,0x54,0x04,0xf4,0xa4,0x0f,0x5f,0xaf,0xff,
-        0x7b,0x2b,0xdb,0x8b,0x20,0x70,0x80,0xd0,0xcd,0x9d,0x6d,0x3d,0x96,0xc6,0x36,0x66,
-        0x0c,0x5c,0xac,0xfc,0x57,0x07,0xf7,0xa7,0xba,0xea,0x1a,0x4a,0xe1,0xb1,0x41,0x11,
-        0x52,0x02,0xf2,0xa2,0x09,0x59,0xa9,0xf9,0xe4,0xb4,0x44,0x14,0xbf,0xef,0x1f,0x4f,
-        0x25,0x75,0x85,0xd5,0x7e,0x2e,0xde,0x8e,0x93,0xc3,0x33,0x63,0xc8,0x98,0x68,0x38,
-        0xbc,0xec,0x1c,0x4c,0xe7,0xb7,0x47,0x17,0x0a,0x5a,0xaa,0xfa,0x51,0x01,0xf1,0xa1,
-        0xcb,0x9b,0x6b,0x3b,0x90,0xc0,0x30,0x60,0x7d,0x2d,0xdd,0x8d,0x26,0x76,0x86,0xd6,
-    ),
-    ( # 81
-        0x00,0x51,0xa2,0xf3,0x5f,0x0e,0xfd,0xac,0xbe,0xef,0x1c,0x4d,0xe1,0xb0,0x43,0x12,
-        0x67,0x36,0xc5,0x94,0x38,0x69,0x9a,0xcb,0xd9,0x88,0x7b,0x2a,0x86,0xd7,0x24,0x75,
-        0xce,0x9f,0x6c,0x3d,0x91,0xc0,0x33,0x62,0x70,0x21,0xd2,0x83,0x2f,0x7e,0x8d,0xdc,
-        0xa9,0xf8,0x0b,0x5a,0xf6,0xa7,0x54,0x05,0x17,0x46,0xb5,0xe4,0x48,0x19,0xea,0xbb,
-        0x87,0xd6,0x25,0x74,0xd8,0x89,0x7a,0x2b,0x39,0x68,0x9b,0xca,0x66,0x37,0xc4,0x95,
-        0xe0,0xb1,0x42,0x13,0xbf,0xee,0x1d,0x4c,0x5e,0x0f,0xfc,0xad,0x01,0x50,0xa3,0xf2,
-        0x49,0x18,0xeb,0xba,0x16,0x47,0xb4,0xe5,0xf7,0xa6,0x55,0x04,0xa8,0xf9,0x0a,0x5b,
-        0x2e,0x7f,0x8c,0xdd,0x71,0x20,0xd3,0x82,0x90,0xc1,0x32,0x63,0xcf,0x9e,0x6d,0x3c,
-        0x15,0x44,0xb7,0xe6,0x4a,0x1b,0xe8,0xb9,0xab,0xfa,0x09,0x58,0xf4,0xa5,0x56,0x07,
-        0x72,0x23,0xd0,0x81,0x2d,0x7c,0x8f,0xde,0xcc,0x9d,0x6e,0x3f,0x93,0xc2,0x31,0x60,
-        0xdb,0x8a,0x79,0x28,0x84,0xd5,0x26,0x77,0x65,0x34,0xc7,0x96,0x3a,0x6b,0x98,0xc9,
-        0xbc,0xed,0x1e,0x4f,0xe3,0xb2,0x41,0x10,0x02,0x53,0xa0,0xf1,0x5d,0x0c,0xff,0xae,
-        0x92,0xc3,0x30,0x61,0xcd,0x9c,0x6f,0x3e,0x2c,0x7d,0x8e,0xdf,0x73,0x22,0xd1,0x80,
-        0xf5,0xa4,0x57,0x06,0xaa,0xfb,0x08,0x59,0x4b,0x1a,0xe9,0xb8,0x14,0x45,0xb6,0xe7,
-        0x5c,0x0d,0xfe,0xaf,0x03,0x52,0xa1,0xf0,0xe2,0xb3,0x40,0x11,0xbd,0xec,0x1f,0x4e,
-        0x3b,0x6a,0x99,0xc8,0x64,0x35,0xc6,0x97,0x85,0xd4,0x27,0x76,0xda,0x8b,0x78,0x29,
-    ),
-    ( # 82
-        0x00,0x52,0xa4,0xf6,0x53,0x01,0xf7,0xa5,0xa6,0xf4,0x02,0x50,0xf5,0xa7,0x51,0x03,
-        0x57,0x05,0xf3,0xa1,0x04,0x56,0xa0,0xf2,0xf1,0xa3,0x55,0x07,0xa2,0xf0,0x06,0x54,
-        0xae,0xfc,0x0a,0x58,0xfd,0xaf,0x59,0x0b,0x08,0x5a,0xac,0xfe,0x5b,0x09,0xff,0xad,
-        0xf9,0xab,0x5d,0x0f,0xaa,0xf8,0x0e,0x5c,0x5f,0x0d,0xfb,0xa9,0x0c,0x5e,0xa8,0xfa,
-        0x47,0x15,0xe3,0xb1,0x14,0x46,0xb0,0xe2,0xe1,0xb3,0x45,0x17,0xb2,0xe0,0x16,0x44,
-        0x10,0x42,0xb4,0xe6,0x43,0x11,0xe7,0xb5,0xb6,0xe4,0x12,0x40,0xe5,0xb7,0x41,0x13,
-        0xe9,0xbb,0x4d,0x1f,0xba,0xe8,0x1e,0x4c,0x4f,0x1d,0xeb,0xb9,0x1c,0x4e,0xb8,0xea,
-        0xbe,0xec,0x1a,0x48,0xed,0xbf,0x49,0x1b,0x18,0x4a,0xbc,0xee,0x4b,0x19,0xef,0xbd,
-        0x8e,0xdc,0x2a,0x78,0xdd,0x8f,0x79,0x2b,0x28,0x7a,0x8c,0xde,0x7b,0x29,0xdf,0x8d,
-        0xd9,0x8b,0x7d,0x2f,0x8a,0xd8,0x2e,0x7c,0x7f,0x2d,0xdb,0x89,0x2c,0x7e,0x88,0xda,
-        0x20,0x72,0x84,0xd6,0x73,0x21,0xd7,0x85,0x86,0xd4,0x22,0x70,0xd5,0x87,0x71,0x23,
-        0x77,0x25,0xd3,0x81,0x24,0x76,0x80,0xd2,0xd1,0x83,0x75,0x27,0x82,0xd0,0x26,0x74,
-        0xc9,0x9b,0x6d,0x3f,0x9a,0xc8,0x3e,0x6c,0x6f,0x3d,0xcb,0x99,0x3c,0x6e,0x98,0xca,
-        0x9e,0xcc,0x3a,0x68,0xcd,0x9f,0x69,0x3b,0x38,0x6a,0x9c,0xce,0x6b,0x39,0xcf,0x9d,
-        0x67,0x35,0xc3,0x91,0x34,0x66,0x90,0xc2,0xc1,0x93,0x65,0x37,0x92,0xc0,0x36,0x64,
-        0x30,0x62,0x94,0xc6,0x63,0x31,0xc7,0x95,0x96,0xc4,0x32,0x60,0xc5,0x97,0x61,0x33,
-    ),
-    ( # 83
-        0x00,0x53,0xa6,0xf5,0x57,0x04,0xf1,0xa2,0xae,0xfd,0x08,0x5b,0xf9,0xaa,0x5f,0x0c,
-        0x47,0x14,0xe1,0xb2,0x10,0x43,0xb6,0xe5,0xe9,0xba,0x4f,0x1c,0xbe,0xed,0x18,0x4b,
-        0x8e,0xdd,0x28,0x7b,0xd9,0x8a,0x7f,0x2c,0x20,0x73,0x86,0xd5,0x77,0x24,0xd1,0x82,
-        0xc9,0x9a,0x6f,0x3c,0x9e,0xcd,0x38,0x6b,0x67,0x34,0xc1,0x92,0x30,0x63,0x96,0xc5,
-        0x07,0x54,0xa1,0xf2,0x50,0x03,0xf6,0xa5,0xa9,0xfa,0x0f,0x5c,0xfe,0xad,0x58,0x0b,
-        0x40,0x13,0xe6,0xb5,0x17,0x44,0xb1,0xe2,0xee,0xbd,0x48,0x1b,0xb9,0xea,0x1f,0x4c,
-        0x89,0xda,0x2f,0x7c,0xde,0x8d,0x78,0x2b,0x27,0x74,0x81,0xd2,0x70,0x23,0xd6,0x85,
-        0xce,0x9d,0x68,0x3b,0x99,0xca,0x3f,0x6c,0x60,0x33,0xc6,0x95,0x37,0x64,0x91,0xc2,
-        0x0e,0x5d,0xa8,0xfb,0x59,0x0a,0xff,0xac,0xa0,0xf3,0x06,0x55,0xf7,0xa4,0x51,0x02,
-        0x49,0x1a,0xef,0xbc,0x1e,0x4d,0xb8,0xeb,0xe7,0xb4,0x41,0x12,0xb0,0xe3,0x16,0x45,
-        0x80,0xd3,0x26,0x75,0xd7,0x84,0x71,0x22,0x2e,0x7d,0x88,0xdb,0x79,0x2a,0xdf,0x8c,
-        0xc7,0x94,0x61,0x32,0x90,0xc3,0x36,0x65,0x69,0x3a,0xcf,0x9c,0x3e,0x6d,0x98,0xcb,
-        0x09,0x5a,0xaf,0xfc,0x5e,0x0d,0xf8,0xab,0xa7,0xf4,0x01,0x52,0xf0,0xa3,0x56,0x05,
-        0x4e,0x1d,0xe8,0xbb,0x19,0x4a,0xbf,0xec,0xe0,0xb3,0x46,0x15,0xb7,0xe4,0x11,0x42,
-        0x87,0xd4,0x21,0x72,0xd0,0x83,0x76,0x25,0x29,0x7a,0x8f,0xdc,0x7e,0x2d,0xd8,0x8b,
-        0xc0,0x93,0x66,0x35,0x97,0xc4,0x31,0x62,0x6e,0x3d,0xc8,0x9b,0x39,0x6a,0x9f,0xcc,
-    ),
-    ( # 84
-        0x00,0x54,0xa8,0xfc,0x4b,0x1f,0xe3,0xb7,0x96,0xc2,0x3e,0x6a,0xdd,0x89,0x75,0x21,
-        0x37,0x63,0x9f,0xcb,0x7c,0x28,0xd4,0x80,0xa1,0xf5,0x09,0x5d,0xea,0xbe,0x42,0x16,
-        0x6e,0x3a,0xc6,0x92,0x25,0x71,0x8d,0xd9,0xf8,0xac,0x50,0x04,0xb3,0xe7,0x1b,0x4f,
-        0x59,0x0d,0xf1,0xa5,0x12,0x46,0xba,0xee,0xcf,0x9b,0x67,0x33,0x84,0xd0,0x2c,0x78,
-        0xdc,0x88,0x74,0x20,0x97,0xc3,0x3f,0x6b,0x4a,0x1e,0xe2,0xb6,0x01,0x55,0xa9,0xfd,
-        0xeb,0xbf,0x43,0x17,0xa0,0xf4,0x08,0x5c,0x7d,0x29,0xd5,0x81,0x36,0x62,0x9e,0xca,
-        0xb2,0xe6,0x1a,0x4e,0xf9,0xad,0x51,0x05,0x24,0x70,0x8c,0xd8,0x6f,0x3b,0xc7,0x93,
-        0x85,0xd1,0x2d,0x79,0xce,0x9a,0x66,0x32,0x13,0x47,0xbb,0xef,0x58,0x0c,0xf0,0xa4,
-        0xa3,0xf7,0x0b,0x5f,0xe8,0xbc,0x40,0x14,0x35,0x61,0x9d,0xc9,0x7e,0x2a,0xd6,0x82,
-        0x94,0xc0,0x3c,0x68,0xdf,0x8b,0x77,0x23,0x02,0x56,0xaa,0xfe,0x49,0x1d,0xe1,0xb5,
-        0xcd,0x99,0x65,0x31,0x86,0xd2,0x2e,0x7a,0x5b,0x0f,0xf3,0xa7,0x10,0x44,0xb8,0xec,
-        0xfa,0xae,0x52,0x06,0xb1,0xe5,0x19,0x4d,0x6c,0x38,0xc4,0x90,0x27,0x73,0x8f,0xdb,
-        0x7f,0x2b,0xd7,0x83,0x34,0x60,0x9c,0xc8,0xe9,0xbd,0x41,0x15,0xa2,0xf6,0x0a,0x5e,
-        0x48,0x1c,0xe0,0xb4,0x03,0x57,0xab,0xff,0xde,0x8a,0x76,0x22,0x95,0xc1,0x3d,0x69,
-        0x11,0x45,0xb9,0xed,0x5a,0x0e,0xf2,0xa6,0x87,0xd3,0x2f,0x7b,0xcc,0x98,0x64,0x30,
-        0x26,0x72,0x8e,0xda,0x6d,0x39,0xc5,0x91,0xb0,0xe4,0x18,0x4c,0xfb,0xaf,0x53,0x07,
-    ),
-    ( # 85
-        0x00,0x55,0xaa,0xff,0x4f,0x1a,0xe5,0xb0,0x9e,0xcb,0x34,0x61,0xd1,0x84,0x7b,0x2e,
-        0x27,0x72,0x8d,0xd8,0x68,0x3d,0xc2,0x97,0xb9,0xec,0x13,0x46,0xf6,0xa3,0x5c,0x09,
-        0x4e,0x1b,0xe4,0xb1,0x01,0x54,0xab,0xfe,0xd0,0x85,0x7a,0x2f,0x9f,0xca,0x35,0x60,
-        0x69,0x3c,0xc3,0x96,0x26,0x73,0x8c,0xd9,0xf7,0xa2,0x5d,0x08,0xb8,0xed,0x12,0x47,
-        0x9c,0xc9,0x36,0x63,0xd3,0x86,0x79,0x2c,0x02,0x57,0xa8,0xfd,0x4d,0x18,0xe7,0xb2,
-        0xbb,0xee,0x11,0x44,0xf4,0xa1,0x5e,0x0b,0x25,0x70,0x8f,0xda,0x6a,0x3f,0xc0,0x95,
-        0xd2,0x87,0x78,0x2d,0x9d,0xc8,0x37,0x62,0x4c,0x19,0xe6,0xb3,0x03,0x56,0xa9,0xfc,
-        0xf5,0xa0,0x5f,0x0a,0xba,0xef,0x10,0x45,0x6b,0x3e,0xc1,0x94,0x24,0x71,0x8e,0xdb,
-        0x23,0x76,0x89,0xdc,0x6c,0x39,0xc6,0x93,0xbd,0xe8,0x17,0x42,0xf2,0xa7,0x58,0x0d,
-        0x04,0x51,0xae,0xfb,0x4b,0x1e,0xe1,0xb4,0x9a,0xcf,0x30,0x65,0xd5,0x80,0x7f,0x2a,
-        0x6d,0x38,0xc7,0x92,0x22,0x77,0x88,0xdd,0xf3,0xa6,0x59,0x0c,0xbc,0xe9,0x16,0x43,
-        0x4a,0x1f,0xe0,0xb5,0x05,0x50,0xaf,0xfa,0xd4,0x81,0x7e,0x2b,0x9b,0xce,0x31,0x64,
-        0xbf,0xea,0x15,0x40,0xf0,0xa5,0x5a,0x0f,0x21,0x74,0x8b,0xde,0x6e,0x3b,0xc4,0x91,
-        0x98,0xcd,0x32,0x67,0xd7,0x82,0x7d,0x28,0x06,0x53,0xac,0xf9,0x49,0x1c,0xe3,0xb6,
-        0xf1,0xa4,0x5b,0x0e,0xbe,0xeb,0x14,0x41,0x6f,0x3a,0xc5,0x90,0x20,0x75,0x8a,0xdf,
-        0xd6,0x83,0x7c,0x29,0x99,0xcc,0x33,0x66,0x48,0x1d,0xe2,0xb7,0x07,0x52,0xad,0xf8,
-    ),
-    ( # 86
-        0x00,0x56,0xac,0xfa,0x43,0x15,0xef,0xb9,0x86,0xd0,0x2a,0x7c,0xc5,0x93,0x69,0x3f,
-        0x17,0x41,0xbb,0xed,0x54,0x02,0xf8,0xae,0x91,0xc7,0x3d,0x6b,0xd2,0x84,0x7e,0x28,
-        0x2e,0x78,0x82,0xd4,0x6d,0x3b,0xc1,0x97,0xa8,0xfe,0x04,0x52,0xeb,0xbd,0x47,0x11,
-        0x39,0x6f,0x95,0xc3,0x7a,0x2c,0xd6,0x80,0xbf,0xe9,0x13,0x45,0xfc,0xaa,0x50,0x06,
-        0x5c,0x0a,0xf0,0xa6,0x1f,0x49,0xb3,0xe5,0xda,0x8c,0x76,0x20,0x99,0xcf,0x35,0x63,
-        0x4b,0x1d,0xe7,0xb1,0x08,0x5e,0xa4,0xf2,0xcd,0x9b,0x61,0x37,0x8e,0xd8,0x22,0x74,
-        0x72,0x24,0xde,0x88,0x31,0x67,0x9d,0xcb,0xf4,0xa2,0x58,0x0e,0xb7,0xe1,0x1b,0x4d,
-        0x65,0x33,0xc9,0x9f,0x26,0x70,0x8a,0xdc,0xe3,0xb5,0x4f,0x19,0xa0,0xf6,0x0c,0x5a,
-        0xb8,0xee,0x14,0x42,0xfb,0xad,0x57,0x01,0x3e,0x68,0x92,0xc4,0x7d,0x2b,0xd1,0x87,
-        0xaf,0xf9,0x03,0x55,0xec,0xba,0x40,0x16,0x29,0x7f,0x85,0xd3,0x6a,0x3c,0xc6,0x90,
-        0x96,0xc0,0x3a,0x6c,0xd5,0x83,0x79,0x2f,0x10,0x46,0xbc,0xea,0x53,0x05,0xff,0xa9,
-        0x81,0xd7,0x2d,0x7b,0xc2,0x94,0x6e,0x38,0x07,0x51,0xab,0xfd,0x44,0x12,0xe8,0xbe,
-        0xe4,0xb2,0x48,0x1e,0xa7,0xf1,0x0b,0x5d,0x62,0x34,0xce,0x98,0x21,0x77,0x8d,0xdb,
-        0xf3,0xa5,0x5f,0x09,0xb0,0xe6,0x1c,0x4a,0x75,0x23,0xd9,0x8f,0x36,0x60,0x9a,0xcc,
-        0xca,0x9c,0x66,0x30,0x89,0xdf,0x25,0x73,0x4c,0x1a,0xe0,0xb6,0x0f,0x59,0xa3,0xf5,
-        0xdd,0x8b,0x71,0x27,0x9e,0xc8,0x32,0x64,0x5b,0x0d,0xf7,0xa1,0x18,0x4e,0xb4,0xe2,
-    ),
-    ( # 87
-        0x00,0x57,0xae,0xf9,0x47,0x10,0xe9,0xbe,0x8e,0xd9,0x20,0x77,0xc9,0x9e,0x67,0x30,
-        0x07,0x50,0xa9,0xfe,0x40,0x17,0xee,0xb9,0x89,0xde,0x27,0x70,0xce,0x99,0x60,0x37,
-        0x0e,0x59,0xa0,0xf7,0x49,0x1e,0xe7,0xb0,0x80,0xd7,0x2e,0x79,0xc7,0x90,0x69,0x3e,
-        0x09,0x5e,0xa7,0xf0,0x4e,0x19,0xe0,0xb7,0x87,0xd0,0x29,0x7e,0xc0,0x97,0x6e,0x39,
-        0x1c,0x4b,0xb2,0xe5,0x5b,0x0c,0xf5,0xa2,0x92,0xc5,0x3c,0x6b,0xd5,0x82,0x7b,0x2c,
-        0x1b,0x4c,0xb5,0xe2,0x5c,0x0b,0xf2,0xa5,0x95,0xc2,0x3b,0x6c,0xd2,0x85,0x7c,0x2b,
-        0x12,0x45,0xbc,0xeb,0x55,0x02,0xfb,0xac,0x9c,0xcb,0x32,0x65,0xdb,0x8c,0x75,0x22,
-        0x15,0x42,0xbb,0xec,0x52,0x05,0xfc,0xab,0x9b,0xcc,0x35,0x62,0xdc,0x8b,0x72,0x25,
-        0x38,0x6f,0x96,0xc1,0x7f,0x28,0xd1,0x86,0xb6,0xe1,0x18,0x4f,0xf1,0xa6,0x5f,0x08,
-        0x3f,0x68,0x91,0xc6,0x78,0x2f,0xd6,0x81,0xb1,0xe6,0x1f,0x48,0xf6,0xa1,0x58,0x0f,
-        0x36,0x61,0x98,0xcf,0x71,0x26,0xdf,0x88,0xb8,0xef,0x16,0x41,0xff,0xa8,0x51,0x06,
-        0x31,0x66,0x9f,0xc8,0x76,0x21,0xd8,0x8f,0xbf,0xe8,0x11,0x46,0xf8,0xaf,0x56,0x01,
-        0x24,0x73,0x8a,0xdd,0x63,0x34,0xcd,0x9a,0xaa,0xfd,0x04,0x53,0xed,0xba,0x43,0x14,
-        0x23,0x74,0x8d,0xda,0x64,0x33,0xca,0x9d,0xad,0xfa,0x03,0x54,0xea,0xbd,0x44,0x13,
-        0x2a,0x7d,0x84,0xd3,0x6d,0x3a,0xc3,0x94,0xa4,0xf3,0x0a,0x5d,0xe3,0xb4,0x4d,0x1a,
-        0x2d,0x7a,0x83,0xd4,0x6a,0x3d,0xc4,0x93,0xa3,0xf4,0x0d,0x5a,0xe4,0xb3,0x4a,0x1d,
-    ),
-    ( # 88
-        0x00,0x58,0xb0,0xe8,0x7b,0x23,0xcb,0x93,0xf6,0xae,0x46,0x1e,0x8d,0xd5,0x3d,0x65,
-        0xf7,0xaf,0x47,0x1f,0x8c,0xd4,0x3c,0x64,0x01,0x59,0xb1,0xe9,0x7a,0x22,0xca,0x92,
-        0xf5,0xad,0x45,0x1d,0x8e,0xd6,0x3e,0x66,0x03,0x5b,0xb3,0xeb,0x78,0x20,0xc8,0x90,
-        0x02,0x5a,0xb2,0xea,0x79,0x21,0xc9,0x91,0xf4,0xac,0x44,0x1c,0x8f,0xd7,0x3f,0x67,
-        0xf1,0xa9,0x41,0x19,0x8a,0xd2,0x3a,0x62,0x07,0x5f,0xb7,0xef,0x7c,0x24,0xcc,0x94,
-        0x06,0x5e,0xb6,0xee,0x7d,0x25,0xcd,0x95,0xf0,0xa8,0x40,0x18,0x8b,0xd3,0x3b,0x63,
-        0x04,0x5c,0xb4,0xec,0x7f,0x27,0xcf,0x97,0xf2,0xaa,0x42,0x1a,0x89,0xd1,0x39,0x61,
-        0xf3,0xab,0x43,0x1b,0x88,0xd0,0x38,0x60,0x05,0x5d,0xb5,0xed,0x7e,0x26,0xce,0x96,
-        0xf9,0xa1,0x49,0x11,0x82,0xda,0x32,0x6a,0x0f,0x57,0xbf,0xe7,0x74,0x2c,0xc4,0x9c,
-        0x0e,0x56,0xbe,0xe6,0x75,0x2d,0xc5,0x9d,0xf8,0xa0,0x48,0x10,0x83,0xdb,0x33,0x6b,
-        0x0c,0x54,0xbc,0xe4,0x77,0x2f,0xc7,0x9f,0xfa,0xa2,0x4a,0x12,0x81,0xd9,0x31,0x69,
-        0xfb,0xa3,0x4b,0x13,0x80,0xd8,0x30,0x68,0x0d,0x55,0xbd,0xe5,0x76,0x2e,0xc6,0x9e,
-        0x08,0x50,0xb8,0xe0,0x73,0x2b,0xc3,0x9b,0xfe,0xa6,0x4e,0x16,0x85,0xdd,0x35,0x6d,
-        0xff,0xa7,0x4f,0x17,0x84,0xdc,0x34,0x6c,0x09,0x51,0xb9,0xe1,0x72,0x2a,0xc2,0x9a,
-        0xfd,0xa5,0x4d,0x15,0x86,0xde,0x36,0x6e,0x0b,0x53,0xbb,0xe3,0x70,0x28,0xc0,0x98,
-        0x0a,0x52,0xba,0xe2,0x71,0x29,0xc1,0x99,0xfc,0xa4,0x4c,0x14,0x87,0xdf,0x37,0x6f,
-    ),
-    ( # 89
-        0x00,0x59,0xb2,0xeb,0x7f,0x26,0xcd,0x94,0xfe,0xa7,0x4c,0x15,0x81,0xd8,0x33,0x6a,
-        0xe7,0xbe,0x55,0x0c,0x98,0xc1,0x2a,0x73,0x19,0x40,0xab,0xf2,0x66,0x3f,0xd4,0x8d,
-        0xd5,0x8c,0x67,0x3e,0xaa,0xf3,0x18,0x41,0x2b,0x72,0x99,0xc0,0x54,0x0d,0xe6,0xbf,
-        0x32,0x6b,0x80,0xd9,0x4d,0x14,0xff,0xa6,0xcc,0x95,0x7e,0x27,0xb3,0xea,0x01,0x58,
-        0xb1,0xe8,0x03,0x5a,0xce,0x97,0x7c,0x25,0x4f,0x16,0xfd,0xa4,0x30,0x69,0x82,0xdb,
-        0x56,0x0f,0xe4,0xbd,0x29,0x70,0x9b,0xc2,0xa8,0xf1,0x1a,0x43,0xd7,0x8e,0x65,0x3c,
-        0x64,0x3d,0xd6,0x8f,0x1b,0x42,0xa9,0xf0,0x9a,0xc3,0x28,0x71,0xe5,0xbc,0x57,0x0e,
-        0x83,0xda,0x31,0x68,0xfc,0xa5,0x4e,0x17,0x7d,0x24,0xcf,0x96,0x02,0x5b,0xb0,0xe9,
-        0x79,0x20,0xcb,0x92,0x06,0x5f,0xb4,0xed,0x87,0xde,0x35,0x6c,0xf8,0xa1,0x4a,0x13,
-        0x9e,0xc7,0x2c,0x75,0xe1,0xb8,0x53,0x0a,0x60,0x39,0xd2,0x8b,0x1f,0x46,0xad,0xf4,
-        0xac,0xf5,0x1e,0x47,0xd3,0x8a,0x61,0x38,0x52,0x0b,0xe0,0xb9,0x2d,0x74,0x9f,0xc6,
-        0x4b,0x12,0xf9,0xa0,0x34,0x6d,0x86,0xdf,0xb5,0xec,0x07,0x5e,0xca,0x93,0x78,0x21,
-        0xc8,0x91,0x7a,0x23,0xb7,0xee,0x05,0x5c,0x36,0x6f,0x84,0xdd,0x49,0x10,0xfb,0xa2,
-        0x2f,0x76,0x9d,0xc4,0x50,0x09,0xe2,0xbb,0xd1,0x88,0x63,0x3a,0xae,0xf7,0x1c,0x45,
-        0x1d,0x44,0xaf,0xf6,0x62,0x3b,0xd0,0x89,0xe3,0xba,0x51,0x08,0x9c,0xc5,0x2e,0x77,
-        0xfa,0xa3,0x48,0x11,0x85,0xdc,0x37,0x6e,0x04,0x5d,0xb6,0xef,0x7b,0x22,0xc9,0x90,
-    ),
-    ( # 90
-        0x00,0x5a,0xb4,0xee,0x73,0x29,0xc7,0x9d,0xe6,0xbc,0x52,0x08,0x95,0xcf,0x21,0x7b,
-        0xd7,0x8d,0x63,0x39,0xa4,0xfe,0x10,0x4a,0x31,0x6b,0x85,0xdf,0x42,0x18,0xf6,0xac,
-        0xb5,0xef,0x01,0x5b,0xc6,0x9c,0x72,0x28,0x53,0x09,0xe7,0xbd,0x20,0x7a,0x94,0xce,
-        0x62,0x38,0xd6,0x8c,0x11,0x4b,0xa5,0xff,0x84,0xde,0x30,0x6a,0xf7,0xad,0x43,0x19,
-        0x71,0x2b,0xc5,0x9f,0x02,0x58,0xb6,0xec,0x97,0xcd,0x23,0x79,0xe4,0xbe,0x50,0x0a,
-        0xa6,0xfc,0x12,0x48,0xd5,0x8f,0x61,0x3b,0x40,0x1a,0xf4,0xae,0x33,0x69,0x87,0xdd,
-        0xc4,0x9e,0x70,0x2a,0xb7,0xed,0x03,0x59,0x22,0x78,0x96,0xcc,0x51,0x0b,0xe5,0xbf,
-        0x13,0x49,0xa7,0xfd,0x60,0x3a,0xd4,0x8e,0xf5,0xaf,0x41,0x1b,0x86,0xdc,0x32,0x68,
-        0xe2,0xb8,0x56,0x0c,0x91,0xcb,0x25,0x7f,0x04,0x5e,0xb0,0xea,0x77,0x2d,0xc3,0x99,
-        0x35,0x6f,0x81,0xdb,0x46,0x1c,0xf2,0xa8,0xd3,0x89,0x67,0x3d,0xa0,0xfa,0x14,0x4e,
-        0x57,0x0d,0xe3,0xb9,0x24,0x7e,0x90,0xca,0xb1,0xeb,0x05,0x5f,0xc2,0x98,0x76,0x2c,
-        0x80,0xda,0x34,0x6e,0xf3,0xa9,0x47,0x1d,0x66,0x3c,0xd2,0x88,0x15,0x4f,0xa1,0xfb,
-        0x93,0xc9,0x27,0x7d,0xe0,0xba,0x54,0x0e,0x75,0x2f,0xc1,0x9b,0x06,0x5c,0xb2,0xe8,
-        0x44,0x1e,0xf0,0xaa,0x37,0x6d,0x83,0xd9,0xa2,0xf8,0x16,0x4c,0xd1,0x8b,0x65,0x3f,
-        0x26,0x7c,0x92,0xc8,0x55,0x0f,0xe1,0xbb,0xc0,0x9a,0x74,0x2e,0xb3,0xe9,0x07,0x5d,
-        0xf1,0xab,0x45,0x1f,0x82,0xd8,0x36,0x6c,0x17,0x4d,0xa3,0xf9,0x64,0x3e,0xd0,0x8a,
-    ),
-    ( # 91
-        0x00,0x5b,0xb6,0xed,0x77,0x2c,0xc1,0x9a,0xee,0xb5,0x58,0x03,0x99,0xc2,0x2f,0x74,
-        0xc7,0x9c,0x71,0x2a,0xb0,0xeb,0x06,0x5d,0x29,0x72,0x9f,0xc4,0x5e,0x05,0xe8,0xb3,
-        0x95,0xce,0x23,0x78,0xe2,0xb9,0x54,0x0f,0x7b,0x20,0xcd,0x96,0x0c,0x57,0xba,0xe1,
-        0x52,0x09,0xe4,0xbf,0x25,0x7e,0x93,0xc8,0xbc,0xe7,0x0a,0x51,0xcb,0x90,0x7d,0x26,
-        0x31,0x6a,0x87,0xdc,0x46,0x1d,0xf0,0xab,0xdf,0x84,0x69,0x32,0xa8,0xf3,0x1e,0x45,
-        0xf6,0xad,0x40,0x1b,0x81,0xda,0x37,0x6c,0x18,0x43,0xae,0xf5,0x6f,0x34,0xd9,0x82,
-        0xa4,0xff,0x12,0x49,0xd3,0x88,0x65,0x3e,0x4a,0x11,0xfc,0xa7,0x3d,0x66,0x8b,0xd0,
-        0x63,0x38,0xd5,0x8e,0x14,0x4f,0xa2,0xf9,0x8d,0xd6,0x3b,0x60,0xfa,0xa1,0x4c,0x17,
-        0x62,0x39,0xd4,0x8f,0x15,0x4e,0xa3,0xf8,0x8c,0xd7,0x3a,0x61,0xfb,0xa0,0x4d,0x16,
-        0xa5,0xfe,0x13,0x48,0xd2,0x89,0x64,0x3f,0x4b,0x10,0xfd,0xa6,0x3c,0x67,0x8a,0xd1,
-        0xf7,0xac,0x41,0x1a,0x80,0xdb,0x36,0x6d,0x19,0x42,0xaf,0xf4,0x6e,0x35,0xd8,0x83,
-        0x30,0x6b,0x86,0xdd,0x47,0x1c,0xf1,0xaa,0xde,0x85,0x68,0x33,0xa9,0xf2,0x1f,0x44,
-        0x53,0x08,0xe5,0xbe,0x24,0x7f,0x92,0xc9,0xbd,0xe6,0x0b,0x50,0xca,0x91,0x7c,0x27,
-        0x94,0xcf,0x22,0x79,0xe3,0xb8,0x55,0x0e,0x7a,0x21,0xcc,0x97,0x0d,0x56,0xbb,0xe0,
-        0xc6,0x9d,0x70,0x2b,0xb1,0xea,0x07,0x5c,0x28,0x73,0x9e,0xc5,0x5f,0x04,0xe9,0xb2,
-        0x01,0x5a,0xb7,0xec,0x76,0x2d,0xc0,0x9b,0xef,0xb4,0x59,0x02,0x98,0xc3,0x2e,0x75,
-    ),
-    ( # 92
-        0x00,0x5c,0xb8,0xe4,0x6b,0x37,0xd3,0x8f,0xd6,0x8a,0x6e,0x32,0xbd,0xe1,0x05,0x59,
-        0xb7,0xeb,0x0f,0x53,0xdc,0x80,0x64,0x38,0x61,0x3d,0xd9,0x85,0x0a,0x56,0xb2,0xee,
-        0x75,0x29,0xcd,0x91,0x1e,0x42,0xa6,0xfa,0xa3,0xff,0x1b,0x47,0xc8,0x94,0x70,0x2c,
-        0xc2,0x9e,0x7a,0x26,0xa9,0xf5,0x11,0x4d,0x14,0x48,0xac,0xf0,0x7f,0x23,0xc7,0x9b,
-        0xea,0xb6,0x52,0x0e,0x81,0xdd,0x39,0x65,0x3c,0x60,0x84,0xd8,0x57,0x0b,0xef,0xb3,
-        0x5d,0x01,0xe5,0xb9,0x36,0x6a,0x8e,0xd2,0x8b,0xd7,0x33,0x6f,0xe0,0xbc,0x58,0x04,
-        0x9f,0xc3,0x27,0x7b,0xf4,0xa8,0x4c,0x10,0x49,0x15,0xf1,0xad,0x22,0x7e,0x9a,0xc6,
-        0x28,0x74,0x90,0xcc,0x43,0x1f,0xfb,0xa7,0xfe,0xa2,0x46,0x1a,0x95,0xc9,0x2d,0x71,
-        0xcf,0x93,0x77,0x2b,0xa4,0xf8,0x1c,0x40,0x19,0x45,0xa1,0xfd,0x72,0x2e,0xca,0x96,
-        0x78,0x24,0xc0,0x9c,0x13,0x4f,0xab,0xf7,0xae,0xf2,0x16,0x4a,0xc5,0x99,0x7d,0x21,
-        0xba,0xe6,0x02,0x5e,0xd1,0x8d,0x69,0x35,0x6c,0x30,0xd4,0x88,0x07,0x5b,0xbf,0xe3,
-        0x0d,0x51,0xb5,0xe9,0x66,0x3a,0xde,0x82,0xdb,0x87,0x63,0x3f,0xb0,0xec,0x08,0x54,
-        0x25,0x79,0x9d,0xc1,0x4e,0x12,0xf6,0xaa,0xf3,0xaf,0x4b,0x17,0x98,0xc4,0x20,0x7c,
-        0x92,0xce,0x2a,0x76,0xf9,0xa5,0x41,0x1d,0x44,0x18,0xfc,0xa0,0x2f,0x73,0x97,0xcb,
-        0x50,0x0c,0xe8,0xb4,0x3b,0x67,0x83,0xdf,0x86,0xda,0x3e,0x62,0xed,0xb1,0x55,0x09,
-        0xe7,0xbb,0x5f,0x03,0x8c,0xd0,0x34,0x68,0x31,0x6d,0x89,0xd5,0x5a,0x06,0xe2,0xbe,
-    ),
-    ( # 93
-        0x00,0x5d,0xba,0xe7,0x6f,0x32,0xd5,0x88,0xde,0x83,0x64,0x39,0xb1,0xec,0x0b,0x56,
-        0xa7,0xfa,0x1d,0x40,0xc8,0x95,0x72,0x2f,0x79,0x24,0xc3,0x9e,0x16,0x4b,0xac,0xf1,
-        0x55,0x08,0xef,0xb2,0x3a,0x67,0x80,0xdd,0x8b,0xd6,0x31,0x6c,0xe4,0xb9,0x5e,0x03,
-        0xf2,0xaf,0x48,0x15,0x9d,0xc0,0x27,0x7a,0x2c,0x71,0x96,0xcb,0x43,0x1e,0xf9,0xa4,
-        0xaa,0xf7,0x10,0x4d,0xc5,0x98,0x7f,0x22,0x74,0x29,0xce,0x93,0x1b,0x46,0xa1,0xfc,
-        0x0d,0x50,0xb7,0xea,0x62,0x3f,0xd8,0x85,0xd3,0x8e,0x69,0x34,0xbc,0xe1,0x06,0x5b,
-        0xff,0xa2,0x45,0x18,0x90,0xcd,0x2a,0x77,0x21,0x7c,0x9b,0xc6,0x4e,0x13,0xf4,0xa9,
-        0x58,0x05,0xe2,0xbf,0x37,0x6a,0x8d,0xd0,0x86,0xdb,0x3c,0x61,0xe9,0xb4,0x53,0x0e,
-        0x4f,0x12,0xf5,0xa8,0x20,0x7d,0x9a,0xc7,0x91,0xcc,0x2b,0x76,0xfe,0xa3,0x44,0x19,
-        0xe8,0xb5,0x52,0x0f,0x87,0xda,0x3d,0x60,0x36,0x6b,0x8c,0xd1,0x59,0x04,0xe3,0xbe,
-        0x1a,0x47,0xa0,0xfd,0x75,0x28,0xcf,0x92,0xc4,0x99,0x7e,0x23,0xab,0xf6,0x11,0x4c,
-        0xbd,0xe0,0x07,0x5a,0xd2,0x8f,0x68,0x35,0x63,0x3e,0xd9,0x84,0x0c,0x51,0xb6,0xeb,
-        0xe5,0xb8,0x5f,0x02,0x8a,0xd7,0x30,0x6d,0x3b,0x66,0x81,0xdc,0x54,0x09,0xee,0xb3,
-        0x42,0x1f,0xf8,0xa5,0x2d,0x70,0x97,0xca,0x9c,0xc1,0x26,0x7b,0xf3,0xae,0x49,0x14,
-        0xb0,0xed,0x0a,0x57,0xdf,0x82,0x65,0x38,0x6e,0x33,0xd4,0x89,0x01,0x5c,0xbb,0xe6,
-        0x17,0x4a,0xad,0xf0,0x78,0x25,0xc2,0x9f,0xc9,0x94,0x73,0x2e,0xa6,0xfb,0x1c,0x41,
-    ),
-    ( # 94
-        0x00,0x5e,0xbc,0xe2,0x63,0x3d,0xdf,0x81,0xc6,0x98,0x7a,0x24,0xa5,0xfb,0x19,0x47,
-        0x97,0xc9,0x2b,0x75,0xf4,0xaa,0x48,0x16,0x51,0x0f,0xed,0xb3,0x32,0x6c,0x8e,0xd0,
-        0x35,0x6b,0x89,0xd7,0x56,0x08,0xea,0xb4,0xf3,0xad,0x4f,0x11,0x90,0xce,0x2c,0x72,
-        0xa2,0xfc,0x1e,0x40,0xc1,0x9f,0x7d,0x23,0x64,0x3a,0xd8,0x86,0x07,0x59,0xbb,0xe5,
-        0x6a,0x34,0xd6,0x88,0x09,0x57,0xb5,0xeb,0xac,0xf2,0x10,0x4e,0xcf,0x91,0x73,0x2d,
-        0xfd,0xa3,0x41,0x1f,0x9e,0xc0,0x22,0x7c,0x3b,0x65,0x87,0xd9,0x58,0x06,0xe4,0xba,
-        0x5f,0x01,0xe3,0xbd,0x3c,0x62,0x80,0xde,0x99,0xc7,0x25,0x7b,0xfa,0xa4,0x46,0x18,
-        0xc8,0x96,0x74,0x2a,0xab,0xf5,0x17,0x49,0x0e,0x50,0xb2,0xec,0x6d,0x33,0xd1,0x8f,
-        0xd4,0x8a,0x68,0x36,0xb7,0xe9,0x0b,0x55,0x12,0x4c,0xae,0xf0,0x71,0x2f,0xcd,0x93,
-        0x43,0x1d,0xff,0xa1,0x20,0x7e,0x9c,0xc2,0x85,0xdb,0x39,0x67,0xe6,0xb8,0x5a,0x04,
-        0xe1,0xbf,0x5d,0x03,0x82,0xdc,0x3e,0x60,0x27,0x79,0x9b,0xc5,0x44,0x1a,0xf8,0xa6,
-        0x76,0x28,0xca,0x94,0x15,0x4b,0xa9,0xf7,0xb0,0xee,0x0c,0x52,0xd3,0x8d,0x6f,0x31,
-        0xbe,0xe0,0x02,0x5c,0xdd,0x83,0x61,0x3f,0x78,0x26,0xc4,0x9a,0x1b,0x45,0xa7,0xf9,
-        0x29,0x77,0x95,0xcb,0x4a,0x14,0xf6,0xa8,0xef,0xb1,0x53,0x0d,0x8c,0xd2,0x30,0x6e,
-        0x8b,0xd5,0x37,0x69,0xe8,0xb6,0x54,0x0a,0x4d,0x13,0xf1,0xaf,0x2e,0x70,0x92,0xcc,
-        0x1c,0x42,0xa0,0xfe,0x7f,0x21,0xc3,0x9d,0xda,0x84,0x66,0x38,0xb9,0xe7,0x05,0x5b,
-    ),
-    ( # 95
-        0x00,0x5f,0xbe,0xe1,0x67,0x38,0xd9,0x86,0xce,0x91,0x70,0x2f,0xa9,0xf6,0x17,0x48,
-        0x87,0xd8,0x39,0x66,0xe0,0xbf,0x5e,0x01,0x49,0x16,0xf7,0xa8,0x2e,0x71,0x90,0xcf,
-        0x15,0x4a,0xab,0xf4,0x72,0x2d,0xcc,0x93,0xdb,0x84,0x65,0x3a,0xbc,0xe3,0x02,0x5d,
-        0x92,0xcd,0x2c,0x73,0xf5,0xaa,0x4b,0x14,0x5c,0x03,0xe2,0xbd,0x3b,0x64,0x85,0xda,
-        0x2a,0x75,0x94,0xcb,0x4d,0x12,0xf3,0xac,0xe4,0xbb,0x5a,0x05,0x83,0xdc,0x3d,0x62,
-        0xad,0xf2,0x13,0x4c,0xca,0x95,0x74,0x2b,0x63,0x3c,0xdd,0x82,0x04,0x5b,0xba,0xe5,
-        0x3f,0x60,0x81,0xde,0x58,0x07,0xe6,0xb9,0xf1,0xae,0x4f,0x10,0x96,0xc9,0x28,0x77,
-        0xb8,0xe7,0x06,0x59,0xdf,0x80,0x61,0x3e,0x76,0x29,0xc8,0x97,0x11,0x4e,0xaf,0xf0,
-        0x54,0x0b,0xea,0xb5,0x33,0x6c,0x8d,0xd2,0x9a,0xc5,0x24,0x7b,0xfd,0xa2,0x43,0x1c,
-        0xd3,0x8c,0x6d,0x32,0xb4,0xeb,0x0a,0x55,0x1d,0x42,0xa3,0xfc,0x7a,0x25,0xc4,0x9b,
-        0x41,0x1e,0xff,0xa0,0x26,0x79,0x98,0xc7,0x8f,0xd0,0x31,0x6e,0xe8,0xb7,0x56,0x09,
-        0xc6,0x99,0x78,0x27,0xa1,0xfe,0x1f,0x40,0x08,0x57,0xb6,0xe9,0x6f,0x30,0xd1,0x8e,
-        0x7e,0x21,0xc0,0x9f,0x19,0x46,0xa7,0xf8,0xb0,0xef,0x0e,0x51,0xd7,0x88,0x69,0x36,
-        0xf9,0xa6,0x47,0x18,0x9e,0xc1,0x20,0x7f,0x37,0x68,0x89,0xd6,0x50,0x0f,0xee,0xb1,
-        0x6b,0x34,0xd5,0x8a,0x0c,0x53,0xb2,0xed,0xa5,0xfa,0x1b,0x44,0xc2,0x9d,0x7c,0x23,
-        0xec,0xb3,0x52,0x0d,0x8b,0xd4,0x35,0x6a,0x22,0x7d,0x9c,0xc3,0x45,0x1a,0xfb,0xa4,
-    ),
-    ( # 96
-        0x00,0x60,0xc0,0xa0,0x9b,0xfb,0x5b,0x3b,0x2d,0x4d,0xed,0x8d,0xb6,0xd6,0x76,0x16,
-        0x5a,0x3a,0x9a,0xfa,0xc1,0xa1,0x01,0x61,0x77,0x17,0xb7,0xd7,0xec,0x8c,0x2c,0x4c,
-        0xb4,0xd4,0x74,0x14,0x2f,0x4f,0xef,0x8f,0x99,0xf9,0x59,0x39,0x02,0x62,0xc2,0xa2,
-        0xee,0x8e,0x2e,0x4e,0x75,0x15,0xb5,0xd5,0xc3,0xa3,0x03,0x63,0x58,0x38,0x98,0xf8,
-        0x73,0x13,0xb3,0xd3,0xe8,0x88,0x28,0x48,0x5e,0x3e,0x9e,0xfe,0xc5,0xa5,0x05,0x65,
-        0x29,0x49,0xe9,0x89,0xb2,0xd2,0x72,0x12,0x04,0x64,0xc4,0xa4,0x9f,0xff,0x5f,0x3f,
-        0xc7,0xa7,0x07,0x67,0x5c,0x3c,0x9c,0xfc,0xea,0x8a,0x2a,0x4a,0x71,0x11,0xb1,0xd1,
-        0x9d,0xfd,0x5d,0x3d,0x06,0x66,0xc6,0xa6,0xb0,0xd0,0x70,0x10,0x2b,0x4b,0xeb,0x8b,
-        0xe6,0x86,0x26,0x46,0x7d,0x1d,0xbd,0xdd,0xcb,0xab,0x0b,0x6b,0x50,0x30,0x90,0xf0,
-        0xbc,0xdc,0x7c,0x1c,0x27,0x47,0xe7,0x87,0x91,0xf1,0x51,0x31,0x0a,0x6a,0xca,0xaa,
-        0x52,0x32,0x92,0xf2,0xc9,0xa9,0x09,0x69,0x7f,0x1f,0xbf,0xdf,0xe4,0x84,0x24,0x44,
-        0x08,0x68,0xc8,0xa8,0x93,0xf3,0x53,0x33,0x25,0x45,0xe5,0x85,0xbe,0xde,0x7e,0x1e,
-        0x95,0xf5,0x55,0x35,0x0e,0x6e,0xce,0xae,0xb8,0xd8,0x78,0x18,0x23,0x43,0xe3,0x83,
-        0xcf,0xaf,0x0f,0x6f,0x54,0x34,0x94,0xf4,0xe2,0x82,0x22,0x42,0x79,0x19,0xb9,0xd9,
-        0x21,0x41,0xe1,0x81,0xba,0xda,0x7a,0x1a,0x0c,0x6c,0xcc,0xac,0x97,0xf7,0x57,0x37,
-        0x7b,0x1b,0xbb,0xdb,0xe0,0x80,0x20,0x40,0x56,0x36,0x96,0xf6,0xcd,0xad,0x0d,0x6d,
-    ),
-    ( # 97
-        0x00,0x61,0xc2,0xa3,0x9f,0xfe,0x5d,0x3c,0x25,0x44,0xe7,0x86,0xba,0xdb,0x78,0x19,
-        0x4a,0x2b,0x88,0xe9,0xd5,0xb4,0x17,0x76,0x6f,0x0e,0xad,0xcc,0xf0,0x91,0x32,0x53,
-        0x94,0xf5,0x56,0x37,0x0b,0x6a,0xc9,0xa8,0xb1,0xd0,0x73,0x12,0x2e,0x4f,0xec,0x8d,
-        0xde,0xbf,0x1c,0x7d,0x41,0x20,0x83,0xe2,0xfb,0x9a,0x39,0x58,0x64,0x05,0xa6,0xc7,
-        0x33,0x52,0xf1,0x90,0xac,0xcd,0x6e,0x0f,0x16,0x77,0xd4,0xb5,0x89,0xe8,0x4b,0x2a,
-        0x79,0x18,0xbb,0xda,0xe6,0x87,0x24,0x45,0x5c,0x3d,0x9e,0xff,0xc3,0xa2,0x01,0x60,
-        0xa7,0xc6,0x65,0x04,0x38,0x59,0xfa,0x9b,0x82,0xe3,0x40,0x21,0x1d,0x7c,0xdf,0xbe,
-        0xed,0x8c,0x2f,0x4e,0x72,0x13,0xb0,0xd1,0xc8,0xa9,0x0a,0x6b,0x57,0x36,0x95,0xf4,
-        0x66,0x07,0xa4,0xc5,0xf9,0x98,0x3b,0x5a,0x43,0x22,0x81,0xe0,0xdc,0xbd,0x1e,0x7f,
-        0x2c,0x4d,0xee,0x8f,0xb3,0xd2,0x71,0x10,0x09,0x68,0xcb,0xaa,0x96,0xf7,0x54,0x35,
-        0xf2,0x93,0x30,0x51,0x6d,0x0c,0xaf,0xce,0xd7,0xb6,0x15,0x74,0x48,0x29,0x8a,0xeb,
-        0xb8,0xd9,0x7a,0x1b,0x27,0x46,0xe5,0x84,0x9d,0xfc,0x5f,0x3e,0x02,0x63,0xc0,0xa1,
-        0x55,0x34,0x97,0xf6,0xca,0xab,0x08,0x69,0x70,0x11,0xb2,0xd3,0xef,0x8e,0x2d,0x4c,
-        0x1f,0x7e,0xdd,0xbc,0x80,0xe1,0x42,0x23,0x3a,0x5b,0xf8,0x99,0xa5,0xc4,0x67,0x06,
-        0xc1,0xa0,0x03,0x62,0x5e,0x3f,0x9c,0xfd,0xe4,0x85,0x26,0x47,0x7b,0x1a,0xb9,0xd8,
-        0x8b,0xea,0x49,0x28,0x14,0x75,0xd6,0xb7,0xae,0xcf,0x6c,0x0d,0x31,0x50,0xf3,0x92,
-    ),
-    ( # 98
-        0x00,0x62,0xc4,0xa6,0x93,0xf1,0x57,0x35,0x3d,0x5f,0xf9,0x9b,0xae,0xcc,0x6a,0x08,
-        0x7a,0x18,0xbe,0xdc,0xe9,0x8b,0x2d,0x4f,0x47,0x25,0x83,0xe1,0xd4,0xb6,0x10,0x72,
-        0xf4,0x96,0x30,0x52,0x67,0x05,0xa3,0xc1,0xc9,0xab,0x0d,0x6f,0x5a,0x38,0x9e,0xfc,
-        0x8e,0xec,0x4a,0x28,0x1d,0x7f,0xd9,0xbb,0xb3,0xd1,0x77,0x15,0x20,0x42,0xe4,0x86,
-        0xf3,0x91,0x37,0x55,0x60,0x02,0xa4,0xc6,0xce,0xac,0x0a,0x68,0x5d,0x3f,0x99,0xfb,
-        0x89,0xeb,0x4d,0x2f,0x1a,0x78,0xde,0xbc,0xb4,0xd6,0x70,0x12,0x27,0x45,0xe3,0x81,
-        0x07,0x65,0xc3,0xa1,0x94,0xf6,0x50,0x32,0x3a,0x58,0xfe,0x9c,0xa9,0xcb,0x6d,0x0f,
-        0x7d,0x1f,0xb9,0xdb,0xee,0x8c,0x2a,0x48,0x40,0x22,0x84,0xe6,0xd3,0xb1,0x17,0x75,
-        0xfd,0x9f,0x39,0x5b,0x6e,0x0c,0xaa,0xc8,0xc0,0xa2,0x04,0x66,0x53,0x31,0x97,0xf5,
-        0x87,0xe5,0x43,0x21,0x14,0x76,0xd0,0xb2,0xba,0xd8,0x7e,0x1c,0x29,0x4b,0xed,0x8f,
-        0x09,0x6b,0xcd,0xaf,0x9a,0xf8,0x5e,0x3c,0x34,0x56,0xf0,0x92,0xa7,0xc5,0x63,0x01,
-        0x73,0x11,0xb7,0xd5,0xe0,0x82,0x24,0x46,0x4e,0x2c,0x8a,0xe8,0xdd,0xbf,0x19,0x7b,
-        0x0e,0x6c,0xca,0xa8,0x9d,0xff,0x59,0x3b,0x33,0x51,0xf7,0x95,0xa0,0xc2,0x64,0x06,
-        0x74,0x16,0xb0,0xd2,0xe7,0x85,0x23,0x41,0x49,0x2b,0x8d,0xef,0xda,0xb8,0x1e,0x7c,
-        0xfa,0x98,0x3e,0x5c,0x69,0x0b,0xad,0xcf,0xc7,0xa5,0x03,0x61,0x54,0x36,0x90,0xf2,
-        0x80,0xe2,0x44,0x26,0x13,0x71,0xd7,0xb5,0xbd,0xdf,0x79,0x1b,0x2e,0x4c,0xea,0x88,
-    ),
-    ( # 99
-        0x00,0x63,0xc6,0xa5,0x97,0xf4,0x51,0x32,0x35,0x56,0xf3,0x90,0xa2,0xc1,0x64,0x07,
-        0x6a,0x09,0xac,0xcf,0xfd,0x9e,0x3b,0x58,0x5f,0x3c,0x99,0xfa,0xc8,0xab,0x0e,0x6d,
-        0xd4,0xb7,0x12,0x71,0x43,0x20,0x85,0xe6,0xe1,0x82,0x27,0x44,0x76,0x15,0xb0,0xd3,
-        0xbe,0xdd,0x78,0x1b,0x29,0x4a,0xef,0x8c,0x8b,0xe8,0x4d,0x2e,0x1c,0x7f,0xda,0xb9,
-        0xb3,0xd0,0x75,0x16,0x24,0x47,0xe2,0x81,0x86,0xe5,0x40,0x23,0x11,0x72,0xd7,0xb4,
-        0xd9,0xba,0x1f,0x7c,0x4e,0x2d,0x88,0xeb,0xec,0x8f,0x2a,0x49,0x7b,0x18,0xbd,0xde,
-        0x67,0x04,0xa1,0xc2,0xf0,0x93,0x36,0x55,0x52,0x31,0x94,0xf7,0xc5,0xa6,0x03,0x60,
-        0x0d,0x6e,0xcb,0xa8,0x9a,0xf9,0x5c,0x3f,0x38,0x5b,0xfe,0x9d,0xaf,0xcc,0x69,0x0a,
-        0x7d,0x1e,0xbb,0xd8,0xea,0x89,0x2c,0x4f,0x48,0x2b,0x8e,0xed,0xdf,0xbc,0x19,0x7a,
-        0x17,0x74,0xd1,0xb2,0x80,0xe3,0x46,0x25,0x22,0x41,0xe4,0x87,0xb5,0xd6,0x73,0x10,
-        0xa9,0xca,0x6f,0x0c,0x3e,0x5d,0xf8,0x9b,0x9c,0xff,0x5a,0x39,0x0b,0x68,0xcd,0xae,
-        0xc3,0xa0,0x05,0x66,0x54,0x37,0x92,0xf1,0xf6,0x95,0x30,0x53,0x61,0x02,0xa7,0xc4,
-        0xce,0xad,0x08,0x6b,0x59,0x3a,0x9f,0xfc,0xfb,0x98,0x3d,0x5e,0x6c,0x0f,0xaa,0xc9,
-        0xa4,0xc7,0x62,0x01,0x33,0x50,0xf5,0x96,0x91,0xf2,0x57,0x34,0x06,0x65,0xc0,0xa3,
-        0x1a,0x79,0xdc,0xbf,0x8d,0xee,0x4b,0x28,0x2f,0x4c,0xe9,0x8a,0xb8,0xdb,0x7e,0x1d,
-        0x70,0x13,0xb6,0xd5,0xe7,0x84,0x21,0x42,0x45,0x26,0x83,0xe0,0xd2,0xb1,0x14,0x77,
-    ),
-    ( # 100
-        0x00,0x64,0xc8,0xac,0x8b,0xef,0x43,0x27,0x0d,0x69,0xc5,0xa1,0x86,0xe2,0x4e,0x2a,
-        0x1a,0x7e,0xd2,0xb6,0x91,0xf5,0x59,0x3d,0x17,0x73,0xdf,0xbb,0x9c,0xf8,0x54,0x30,
-        0x34,0x50,0xfc,0x98,0xbf,0xdb,0x77,0x13,0x39,0x5d,0xf1,0x95,0xb2,0xd6,0x7a,0x1e,
-        0x2e,0x4a,0xe6,0x82,0xa5,0xc1,0x6d,0x09,0x23,0x47,0xeb,0x8f,0xa8,0xcc,0x60,0x04,
-        0x68,0x0c,0xa0,0xc4,0xe3,0x87,0x2b,0x4f,0x65,0x01,0xad,0xc9,0xee,0x8a,0x26,0x42,
-        0x72,0x16,0xba,0xde,0xf9,0x9d,0x31,0x55,0x7f,0x1b,0xb7,0xd3,0xf4,0x90,0x3c,0x58,
-        0x5c,0x38,0x94,0xf0,0xd7,0xb3,0x1f,0x7b,0x51,0x35,0x99,0xfd,0xda,0xbe,0x12,0x76,
-        0x46,0x22,0x8e,0xea,0xcd,0xa9,0x05,0x61,0x4b,0x2f,0x83,0xe7,0xc0,0xa4,0x08,0x6c,
-        0xd0,0xb4,0x18,0x7c,0x5b,0x3f,0x93,0xf7,0xdd,0xb9,0x15,0x71,0x56,0x32,0x9e,0xfa,
-        0xca,0xae,0x02,0x66,0x41,0x25,0x89,0xed,0xc7,0xa3,0x0f,0x6b,0x4c,0x28,0x84,0xe0,
-        0xe4,0x80,0x2c,0x48,0x6f,0x0b,0xa7,0xc3,0xe9,0x8d,0x21,0x45,0x62,0x06,0xaa,0xce,
-        0xfe,0x9a,0x36,0x52,0x75,0x11,0xbd,0xd9,0xf3,0x97,0x3b,0x5f,0x78,0x1c,0xb0,0xd4,
-        0xb8,0xdc,0x70,0x14,0x33,0x57,0xfb,0x9f,0xb5,0xd1,0x7d,0x19,0x3e,0x5a,0xf6,0x92,
-        0xa2,0xc6,0x6a,0x0e,0x29,0x4d,0xe1,0x85,0xaf,0xcb,0x67,0x03,0x24,0x40,0xec,0x88,
-        0x8c,0xe8,0x44,0x20,0x07,0x63,0xcf,0xab,0x81,0xe5,0x49,0x2d,0x0a,0x6e,0xc2,0xa6,
-        0x96,0xf2,0x5e,0x3a,0x1d,0x79,0xd5,0xb1,0x9b,0xff,0x53,0x37,0x10,0x74,0xd8,0xbc,
-    ),
-    ( # 101
-        0x00,0x65,0xca,0xaf,0x8f,0xea,0x45,0x20,0x05,0x60,0xcf,0xaa,0x8a,0xef,0x40,0x25,
-        0x0a,0x6f,0xc0,0xa5,0x85,0xe0,0x4f,0x2a,0x0f,0x6a,0xc5,0xa0,0x80,0xe5,0x4a,0x2f,
-        0x14,0x71,0xde,0xbb,0x9b,0xfe,0x51,0x34,0x11,0x74,0xdb,0xbe,0x9e,0xfb,0x54,0x31,
-        0x1e,0x7b,0xd4,0xb1,0x91,0xf4,0x5b,0x3e,0x1b,0x7e,0xd1,0xb4,0x94,0xf1,0x5e,0x3b,
-        0x28,0x4d,0xe2,0x87,0xa7,0xc2,0x6d,0x08,0x2d,0x48,0xe7,0x82,0xa2,0xc7,0x68,0x0d,
-        0x22,0x47,0xe8,0x8d,0xad,0xc8,0x67,0x02,0x27,0x42,0xed,0x88,0xa8,0xcd,0x62,0x07,
-        0x3c,0x59,0xf6,0x93,0xb3,0xd6,0x79,0x1c,0x39,0x5c,0xf3,0x96,0xb6,0xd3,0x7c,0x19,
-        0x36,0x53,0xfc,0x99,0xb9,0xdc,0x73,0x16,0x33,0x56,0xf9,0x9c,0xbc,0xd9,0x76,0x13,
-        0x50,0x35,0x9a,0xff,0xdf,0xba,0x15,0x70,0x55,0x30,0x9f,0xfa,0xda,0xbf,0x10,0x75,
-        0x5a,0x3f,0x90,0xf5,0xd5,0xb0,0x1f,0x7a,0x5f,0x3a,0x95,0xf0,0xd0,0xb5,0x1a,0x7f,
-        0x44,0x21,0x8e,0xeb,0xcb,0xae,0x01,0x64,0x41,0x24,0x8b,0xee,0xce,0xab,0x04,0x61,
-        0x4e,0x2b,0x84,0xe1,0xc1,0xa4,0x0b,0x6e,0x4b,0x2e,0x81,0xe4,0xc4,0xa1,0x0e,0x6b,
-        0x78,0x1d,0xb2,0xd7,0xf7,0x92,0x3d,0x58,0x7d,0x18,0xb7,0xd2,0xf2,0x97,0x38,0x5d,
-        0x72,0x17,0xb8,0xdd,0xfd,0x98,0x37,0x52,0x77,0x12,0xbd,0xd8,0xf8,0x9d,0x32,0x57,
-        0x6c,0x09,0xa6,0xc3,0xe3,0x86,0x29,0x4c,0x69,0x0c,0xa3,0xc6,0xe6,0x83,0x2c,0x49,
-        0x66,0x03,0xac,0xc9,0xe9,0x8c,0x23,0x46,0x63,0x06,0xa9,0xcc,0xec,0x89,0x26,0x43,
-    ),
-    ( # 102
-        0x00,0x66,0xcc,0xaa,0x83,0xe5,0x4f,0x29,0x1d,0x7b,0xd1,0xb7,0x9e,0xf8,0x52,0x34,
-        0x3a,0x5c,0xf6,0x90,0xb9,0xdf,0x75,0x13,0x27,0x41,0xeb,0x8d,0xa4,0xc2,0x68,0x0e,
-        0x74,0x12,0xb8,0xde,0xf7,0x91,0x3b,0x5d,0x69,0x0f,0xa5,0xc3,0xea,0x8c,0x26,0x40,
-        0x4e,0x28,0x82,0xe4,0xcd,0xab,0x01,0x67,0x53,0x35,0x9f,0xf9,0xd0,0xb6,0x1c,0x7a,
-        0xe8,0x8e,0x24,0x42,0x6b,0x0d,0xa7,0xc1,0xf5,0x93,0x39,0x5f,0x76,0x10,0xba,0xdc,
-        0xd2,0xb4,0x1e,0x78,0x51,0x37,0x9d,0xfb,0xcf,0xa9,0x03,0x65,0x4c,0x2a,0x80,0xe6,
-        0x9c,0xfa,0x50,0x36,0x1f,0x79,0xd3,0xb5,0x81,0xe7,0x4d,0x2b,0x02,0x64,0xce,0xa8,
-        0xa6,0xc0,0x6a,0x0c,0x25,0x43,0xe9,0x8f,0xbb,0xdd,0x77,0x11,0x38,0x5e,0xf4,0x92,
-        0xcb,0xad,0x07,0x61,0x48,0x2e,0x84,0xe2,0xd6,0xb0,0x1a,0x7c,0x55,0x33,0x99,0xff,
-        0xf1,0x97,0x3d,0x5b,0x72,0x14,0xbe,0xd8,0xec,0x8a,0x20,0x46,0x6f,0x09,0xa3,0xc5,
-        0xbf,0xd9,0x73,0x15,0x3c,0x5a,0xf0,0x96,0xa2,0xc4,0x6e,0x08,0x21,0x47,0xed,0x8b,
-        0x85,0xe3,0x49,0x2f,0x06,0x60,0xca,0xac,0x98,0xfe,0x54,0x32,0x1b,0x7d,0xd7,0xb1,
-        0x23,0x45,0xef,0x89,0xa0,0xc6,0x6c,0x0a,0x3e,0x58,0xf2,0x94,0xbd,0xdb,0x71,0x17,
-        0x19,0x7f,0xd5,0xb3,0x9a,0xfc,0x56,0x30,0x04,0x62,0xc8,0xae,0x87,0xe1,0x4b,0x2d,
-        0x57,0x31,0x9b,0xfd,0xd4,0xb2,0x18,0x7e,0x4a,0x2c,0x86,0xe0,0xc9,0xaf,0x05,0x63,
-        0x6d,0x0b,0xa1,0xc7,0xee,0x88,0x22,0x44,0x70,0x16,0xbc,0xda,0xf3,0x95,0x3f,0x59,
-    ),
-    ( # 103
-        0x00,0x67,0xce,0xa9,0x87,0xe0,0x49,0x2e,0x15,0x72,0xdb,0xbc,0x92,0xf5,0x5c,0x3b,
-        0x2a,0x4d,0xe4,0x83,0xad,0xca,0x63,0x04,0x3f,0x58,0xf1,0x96,0xb8,0xdf,0x76,0x11,
-        0x54,0x33,0x9a,0xfd,0xd3,0xb4,0x1d,0x7a,0x41,0x26,0x8f,0xe8,0xc6,0xa1,0x08,0x6f,
-        0x7e,0x19,0xb0,0xd7,0xf9,0x9e,0x37,0x50,0x6b,0x0c,0xa5,0xc2,0xec,0x8b,0x22,0x45,
-        0xa8,0xcf,0x66,0x01,0x2f,0x48,0xe1,0x86,0xbd,0xda,0x73,0x14,0x3a,0x5d,0xf4,0x93,
-        0x82,0xe5,0x4c,0x2b,0x05,0x62,0xcb,0xac,0x97,0xf0,0x59,0x3e,0x10,0x77,0xde,0xb9,
-        0xfc,0x9b,0x32,0x55,0x7b,0x1c,0xb5,0xd2,0xe9,0x8e,0x27,0x40,0x6e,0x09,0xa0,0xc7,
-        0xd6,0xb1,0x18,0x7f,0x51,0x36,0x9f,0xf8,0xc3,0xa4,0x0d,0x6a,0x44,0x23,0x8a,0xed,
-        0x4b,0x2c,0x85,0xe2,0xcc,0xab,0x02,0x65,0x5e,0x39,0x90,0xf7,0xd9,0xbe,0x17,0x70,
-        0x61,0x06,0xaf,0xc8,0xe6,0x81,0x28,0x4f,0x74,0x13,0xba,0xdd,0xf3,0x94,0x3d,0x5a,
-        0x1f,0x78,0xd1,0xb6,0x98,0xff,0x56,0x31,0x0a,0x6d,0xc4,0xa3,0x8d,0xea,0x43,0x24,
-        0x35,0x52,0xfb,0x9c,0xb2,0xd5,0x7c,0x1b,0x20,0x47,0xee,0x89,0xa7,0xc0,0x69,0x0e,
-        0xe3,0x84,0x2d,0x4a,0x64,0x03,0xaa,0xcd,0xf6,0x91,0x38,0x5f,0x71,0x16,0xbf,0xd8,
-        0xc9,0xae,0x07,0x60,0x4e,0x29,0x80,0xe7,0xdc,0xbb,0x12,0x75,0x5b,0x3c,0x95,0xf2,
-        0xb7,0xd0,0x79,0x1e,0x30,0x57,0xfe,0x99,0xa2,0xc5,0x6c,0x0b,0x25,0x42,0xeb,0x8c,
-        0x9d,0xfa,0x53,0x34,0x1a,0x7d,0xd4,0xb3,0x88,0xef,0x46,0x21,0x0f,0x68,0xc1,0xa6,
-    ),
-    ( # 104
-        0x00,0x68,0xd0,0xb8,0xbb,0xd3,0x6b,0x03,0x6d,0x05,0xbd,0xd5,0xd6,0xbe,0x06,0x6e,
-        0xda,0xb2,0x0a,0x62,0x61,0x09,0xb1,0xd9,0xb7,0xdf,0x67,0x0f,0x0c,0x64,0xdc,0xb4,
-        0xaf,0xc7,0x7f,0x17,0x14,0x7c,0xc4,0xac,0xc2,0xaa,0x12,0x7a,0x79,0x11,0xa9,0xc1,
-        0x75,0x1d,0xa5,0xcd,0xce,0xa6,0x1e,0x76,0x18,0x70,0xc8,0xa0,0xa3,0xcb,0x73,0x1b,
-        0x45,0x2d,0x95,0xfd,0xfe,0x96,0x2e,0x46,0x28,0x40,0xf8,0x90,0x93,0xfb,0x43,0x2b,
-        0x9f,0xf7,0x4f,0x27,0x24,0x4c,0xf4,0x9c,0xf2,0x9a,0x22,0x4a,0x49,0x21,0x99,0xf1,
-        0xea,0x82,0x3a,0x52,0x51,0x39,0x81,0xe9,0x87,0xef,0x57,0x3f,0x3c,0x54,0xec,0x84,
-        0x30,0x58,0xe0,0x88,0x8b,0xe3,0x5b,0x33,0x5d,0x35,0x8d,0xe5,0xe6,0x8e,0x36,0x5e,
-        0x8a,0xe2,0x5a,0x32,0x31,0x59,0xe1,0x89,0xe7,0x8f,0x37,0x5f,0x5c,0x34,0x8c,0xe4,
-        0x50,0x38,0x80,0xe8,0xeb,0x83,0x3b,0x53,0x3d,0x55,0xed,0x85,0x86,0xee,0x56,0x3e,
-        0x25,0x4d,0xf5,0x9d,0x9e,0xf6,0x4e,0x26,0x48,0x20,0x98,0xf0,0xf3,0x9b,0x23,0x4b,
-        0xff,0x97,0x2f,0x47,0x44,0x2c,0x94,0xfc,0x92,0xfa,0x42,0x2a,0x29,0x41,0xf9,0x91,
-        0xcf,0xa7,0x1f,0x77,0x74,0x1c,0xa4,0xcc,0xa2,0xca,0x72,0x1a,0x19,0x71,0xc9,0xa1,
-        0x15,0x7d,0xc5,0xad,0xae,0xc6,0x7e,0x16,0x78,0x10,0xa8,0xc0,0xc3,0xab,0x13,0x7b,
-        0x60,0x08,0xb0,0xd8,0xdb,0xb3,0x0b,0x63,0x0d,0x65,0xdd,0xb5,0xb6,0xde,0x66,0x0e,
-        0xba,0xd2,0x6a,0x02,0x01,0x69,0xd1,0xb9,0xd7,0xbf,0x07,0x6f,0x6c,0x04,0xbc,0xd4,
-    ),
-    ( # 105
-        0x00,0x69,0xd2,0xbb,0xbf,0xd6,0x6d,0x04,0x65,0x0c,0xb7,0xde,0xda,0xb3,0x08,0x61,
-        0xca,0xa3,0x18,0x71,0x75,0x1c,0xa7,0xce,0xaf,0xc6,0x7d,0x14,0x10,0x79,0xc2,0xab,
-        0x8f,0xe6,0x5d,0x34,0x30,0x59,0xe2,0x8b,0xea,0x83,0x38,0x51,0x55,0x3c,0x87,0xee,
-        0x45,0x2c,0x97,0xfe,0xfa,0x93,0x28,0x41,0x20,0x49,0xf2,0x9b,0x9f,0xf6,0x4d,0x24,
-        0x05,0x6c,0xd7,0xbe,0xba,0xd3,0x68,0x01,0x60,0x09,0xb2,0xdb,0xdf,0xb6,0x0d,0x64,
-        0xcf,0xa6,0x1d,0x74,0x70,0x19,0xa2,0xcb,0xaa,0xc3,0x78,0x11,0x15,0x7c,0xc7,0xae,
-        0x8a,0xe3,0x58,0x31,0x35,0x5c,0xe7,0x8e,0xef,0x86,0x3d,0x54,0x50,0x39,0x82,0xeb,
-        0x40,0x29,0x92,0xfb,0xff,0x96,0x2d,0x44,0x25,0x4c,0xf7,0x9e,0x9a,0xf3,0x48,0x21,
-        0x0a,0x63,0xd8,0xb1,0xb5,0xdc,0x67,0x0e,0x6f,0x06,0xbd,0xd4,0xd0,0xb9,0x02,0x6b,
-        0xc0,0xa9,0x12,0x7b,0x7f,0x16,0xad,0xc4,0xa5,0xcc,0x77,0x1e,0x1a,0x73,0xc8,0xa1,
-        0x85,0xec,0x57,0x3e,0x3a,0x53,0xe8,0x81,0xe0,0x89,0x32,0x5b,0x5f,0x36,0x8d,0xe4,
-        0x4f,0x26,0x9d,0xf4,0xf0,0x99,0x22,0x4b,0x2a,0x43,0xf8,0x91,0x95,0xfc,0x47,0x2e,
-        0x0f,0x66,0xdd,0xb4,0xb0,0xd9,0x62,0x0b,0x6a,0x03,0xb8,0xd1,0xd5,0xbc,0x07,0x6e,
-        0xc5,0xac,0x17,0x7e,0x7a,0x13,0xa8,0xc1,0xa0,0xc9,0x72,0x1b,0x1f,0x76,0xcd,0xa4,
-        0x80,0xe9,0x52,0x3b,0x3f,0x56,0xed,0x84,0xe5,0x8c,0x37,0x5e,0x5a,0x33,0x88,0xe1,
-        0x4a,0x23,0x98,0xf1,0xf5,0x9c,0x27,0x4e,0x2f,0x46,0xfd,0x94,0x90,0xf9,0x42,0x2b,
-    ),
-    ( # 106
-        0x00,0x6a,0xd4,0xbe,0xb3,0xd9,0x67,0x0d,0x7d,0x17,0xa9,0xc3,0xce,0xa4,0x1a,0x70,
-        0xfa,0x90,0x2e,0x44,0x49,0x23,0x9d,0xf7,0x87,0xed,0x53,0x39,0x34,0x5e,0xe0,0x8a,
-        0xef,0x85,0x3b,0x51,0x5c,0x36,0x88,0xe2,0x92,0xf8,0x46,0x2c,0x21,0x4b,0xf5,0x9f,
-        0x15,0x7f,0xc1,0xab,0xa6,0xcc,0x72,0x18,0x68,0x02,0xbc,0xd6,0xdb,0xb1,0x0f,0x65,
-        0xc5,0xaf,0x11,0x7b,0x76,0x1c,0xa2,0xc8,0xb8,0xd2,0x6c,0x06,0x0b,0x61,0xdf,0xb5,
-        0x3f,0x55,0xeb,0x81,0x8c,0xe6,0x58,0x32,0x42,0x28,0x96,0xfc,0xf1,0x9b,0x25,0x4f,
-        0x2a,0x40,0xfe,0x94,0x99,0xf3,0x4d,0x27,0x57,0x3d,0x83,0xe9,0xe4,0x8e,0x30,0x5a,
-        0xd0,0xba,0x04,0x6e,0x63,0x09,0xb7,0xdd,0xad,0xc7,0x79,0x13,0x1e,0x74,0xca,0xa0,
-        0x91,0xfb,0x45,0x2f,0x22,0x48,0xf6,0x9c,0xec,0x86,0x38,0x52,0x5f,0x35,0x8b,0xe1,
-        0x6b,0x01,0xbf,0xd5,0xd8,0xb2,0x0c,0x66,0x16,0x7c,0xc2,0xa8,0xa5,0xcf,0x71,0x1b,
-        0x7e,0x14,0xaa,0xc0,0xcd,0xa7,0x19,0x73,0x03,0x69,0xd7,0xbd,0xb0,0xda,0x64,0x0e,
-        0x84,0xee,0x50,0x3a,0x37,0x5d,0xe3,0x89,0xf9,0x93,0x2d,0x47,0x4a,0x20,0x9e,0xf4,
-        0x54,0x3e,0x80,0xea,0xe7,0x8d,0x33,0x59,0x29,0x43,0xfd,0x97,0x9a,0xf0,0x4e,0x24,
-        0xae,0xc4,0x7a,0x10,0x1d,0x77,0xc9,0xa3,0xd3,0xb9,0x07,0x6d,0x60,0x0a,0xb4,0xde,
-        0xbb,0xd1,0x6f,0x05,0x08,0x62,0xdc,0xb6,0xc6,0xac,0x12,0x78,0x75,0x1f,0xa1,0xcb,
-        0x41,0x2b,0x95,0xff,0xf2,0x98,0x26,0x4c,0x3c,0x56,0xe8,0x82,0x8f,0xe5,0x5b,0x31,
-    ),
-    ( # 107
-        0x00,0x6b,0xd6,0xbd,0xb7,0xdc,0x61,0x0a,0x75,0x1e,0xa3,0xc8,0xc2,0xa9,0x14,0x7f,
-        0xea,0x81,0x3c,0x57,0x5d,0x36,0x8b,0xe0,0x9f,0xf4,0x49,0x22,0x28,0x43,0xfe,0x95,
-        0xcf,0xa4,0x19,0x72,0x78,0x13,0xae,0xc5,0xba,0xd1,0x6c,0x07,0x0d,0x66,0xdb,0xb0,
-        0x25,0x4e,0xf3,0x98,0x92,0xf9,0x44,0x2f,0x50,0x3b,0x86,0xed,0xe7,0x8c,0x31,0x5a,
-        0x85,0xee,0x53,0x38,0x32,0x59,0xe4,0x8f,0xf0,0x9b,0x26,0x4d,0x47,0x2c,0x91,0xfa,
-        0x6f,0x04,0xb9,0xd2,0xd8,0xb3,0x0e,0x65,0x1a,0x71,0xcc,0xa7,0xad,0xc6,0x7b,0x10,
-        0x4a,0x21,0x9c,0xf7,0xfd,0x96,0x2b,0x40,0x3f,0x54,0xe9,0x82,0x88,0xe3,0x5e,0x35,
-        0xa0,0xcb,0x76,0x1d,0x17,0x7c,0xc1,0xaa,0xd5,0xbe,0x03,0x68,0x62,0x09,0xb4,0xdf,
-        0x11,0x7a,0xc7,0xac,0xa6,0xcd,0x70,0x1b,0x64,0x0f,0xb2,0xd9,0xd3,0xb8,0x05,0x6e,
-        0xfb,0x90,0x2d,0x46,0x4c,0x27,0x9a,0xf1,0x8e,0xe5,0x58,0x33,0x39,0x52,0xef,0x84,
-        0xde,0xb5,0x08,0x63,0x69,0x02,0xbf,0xd4,0xab,0xc0,0x7d,0x16,0x1c,0x77,0xca,0xa1,
-        0x34,0x5f,0xe2,0x89,0x83,0xe8,0x55,0x3e,0x41,0x2a,0x97,0xfc,0xf6,0x9d,0x20,0x4b,
-        0x94,0xff,0x42,0x29,0x23,0x48,0xf5,0x9e,0xe1,0x8a,0x37,0x5c,0x56,0x3d,0x80,0xeb,
-        0x7e,0x15,0xa8,0xc3,0xc9,0xa2,0x1f,0x74,0x0b,0x60,0xdd,0xb6,0xbc,0xd7,0x6a,0x01,
-        0x5b,0x30,0x8d,0xe6,0xec,0x87,0x3a,0x51,0x2e,0x45,0xf8,0x93,0x99,0xf2,0x4f,0x24,
-        0xb1,0xda,0x67,0x0c,0x06,0x6d,0xd0,0xbb,0xc4,0xaf,0x12,0x79,0x73,0x18,0xa5,0xce,
-    ),
-    ( # 108
-        0x00,0x6c,0xd8,0xb4,0xab,0xc7,0x73,0x1f,0x4d,0x21,0x95,0xf9,0xe6,0x8a,0x3e,0x52,
-        0x9a,0xf6,0x42,0x2e,0x31,0x5d,0xe9,0x85,0xd7,0xbb,0x0f,0x63,0x7c,0x10,0xa4,0xc8,
-        0x2f,0x43,0xf7,0x9b,0x84,0xe8,0x5c,0x30,0x62,0x0e,0xba,0xd6,0xc9,0xa5,0x11,0x7d,
-        0xb5,0xd9,0x6d,0x01,0x1e,0x72,0xc6,0xaa,0xf8,0x94,0x20,0x4c,0x53,0x3f,0x8b,0xe7,
-        0x5e,0x32,0x86,0xea,0xf5,0x99,0x2d,0x41,0x13,0x7f,0xcb,0xa7,0xb8,0xd4,0x60,0x0c,
-        0xc4,0xa8,0x1c,0x70,0x6f,0x03,0xb7,0xdb,0x89,0xe5,0x51,0x3d,0x22,0x4e,0xfa,0x96,
-        0x71,0x1d,0xa9,0xc5,0xda,0xb6,0x02,0x6e,0x3c,0x50,0xe4,0x88,0x97,0xfb,0x4f,0x23,
-        0xeb,0x87,0x33,0x5f,0x40,0x2c,0x98,0xf4,0xa6,0xca,0x7e,0x12,0x0d,0x61,0xd5,0xb9,
-        0xbc,0xd0,0x64,0x08,0x17,0x7b,0xcf,0xa3,0xf1,0x9d,0x29,0x45,0x5a,0x36,0x82,0xee,
-        0x26,0x4a,0xfe,0x92,0x8d,0xe1,0x55,0x39,0x6b,0x07,0xb3,0xdf,0xc0,0xac,0x18,0x74,
-        0x93,0xff,0x4b,0x27,0x38,0x54,0xe0,0x8c,0xde,0xb2,0x06,0x6a,0x75,0x19,0xad,0xc1,
-        0x09,0x65,0xd1,0xbd,0xa2,0xce,0x7a,0x16,0x44,0x28,0x9c,0xf0,0xef,0x83,0x37,0x5b,
-        0xe2,0x8e,0x3a,0x56,0x49,0x25,0x91,0xfd,0xaf,0xc3,0x77,0x1b,0x04,0x68,0xdc,0xb0,
-        0x78,0x14,0xa0,0xcc,0xd3,0xbf,0x0b,0x67,0x35,0x59,0xed,0x81,0x9e,0xf2,0x46,0x2a,
-        0xcd,0xa1,0x15,0x79,0x66,0x0a,0xbe,0xd2,0x80,0xec,0x58,0x34,0x2b,0x47,0xf3,0x9f,
-        0x57,0x3b,0x8f,0xe3,0xfc,0x90,0x24,0x48,0x1a,0x76,0xc2,0xae,0xb1,0xdd,0x69,0x05,
-    ),
-    ( # 109
-        0x00,0x6d,0xda,0xb7,0xaf,0xc2,0x75,0x18,0x45,0x28,0x9f,0xf2,0xea,0x87,0x30,0x5d,
-        0x8a,0xe7,0x50,0x3d,0x25,0x48,0xff,0x92,0xcf,0xa2,0x15,0x78,0x60,0x0d,0xba,0xd7,
-        0x0f,0x62,0xd5,0xb8,0xa0,0xcd,0x7a,0x17,0x4a,0x27,0x90,0xfd,0xe5,0x88,0x3f,0x52,
-        0x85,0xe8,0x5f,0x32,0x2a,0x47,0xf0,0x9d,0xc0,0xad,0x1a,0x77,0x6f,0x02,0xb5,0xd8,
-        0x1e,0x73,0xc4,0xa9,0xb1,0xdc,0x6b,0x06,0x5b,0x36,0x81,0xec,0xf4,0x99,0x2e,0x43,
-        0x94,0xf9,0x4e,0x23,0x3b,0x56,0xe1,0x8c,0xd1,0xbc,0x0b,0x66,0x7e,0x13,0xa4,0xc9,
-        0x11,0x7c,0xcb,0xa6,0xbe,0xd3,0x64,0x09,0x54,0x39,0x8e,0xe3,0xfb,0x96,0x21,0x4c,
-        0x9b,0xf6,0x41,0x2c,0x34,0x59,0xee,0x83,0xde,0xb3,0x04,0x69,0x71,0x1c,0xab,0xc6,
-        0x3c,0x51,0xe6,0x8b,0x93,0xfe,0x49,0x24,0x79,0x14,0xa3,0xce,0xd6,0xbb,0x0c,0x61,
-        0xb6,0xdb,0x6c,0x01,0x19,0x74,0xc3,0xae,0xf3,0x9e,0x29,0x44,0x5c,0x31,0x86,0xeb,
-        0x33,0x5e,0xe9,0x84,0x9c,0xf1,0x46,0x2b,0x76,0x1b,0xac,0xc1,0xd9,0xb4,0x03,0x6e,
-        0xb9,0xd4,0x63,0x0e,0x16,0x7b,0xcc,0xa1,0xfc,0x91,0x26,0x4b,0x53,0x3e,0x89,0xe4,
-        0x22,0x4f,0xf8,0x95,0x8d,0xe0,0x57,0x3a,0x67,0x0a,0xbd,0xd0,0xc8,0xa5,0x12,0x7f,
-        0xa8,0xc5,0x72,0x1f,0x07,0x6a,0xdd,0xb0,0xed,0x80,0x37,0x5a,0x42,0x2f,0x98,0xf5,
-        0x2d,0x40,0xf7,0x9a,0x82,0xef,0x58,0x35,0x68,0x05,0xb2,0xdf,0xc7,0xaa,0x1d,0x70,
-        0xa7,0xca,0x7d,0x10,0x08,0x65,0xd2,0xbf,0xe2,0x8f,0x38,0x55,0x4d,0x20,0x97,0xfa,
-    ),
-    ( # 110
-        0x00,0x6e,0xdc,0xb2,0xa3,0xcd,0x7f,0x11,0x5d,0x33,0x81,0xef,0xfe,0x90,0x22,0x4c,
-        0xba,0xd4,0x66,0x08,0x19,0x77,0xc5,0xab,0xe7,0x89,0x3b,0x55,0x44,0x2a,0x98,0xf6,
-        0x6f,0x01,0xb3,0xdd,0xcc,0xa2,0x10,0x7e,0x32,0x5c,0xee,0x80,0x91,0xff,0x4d,0x23,
-        0xd5,0xbb,0x09,0x67,0x76,0x18,0xaa,0xc4,0x88,0xe6,0x54,0x3a,0x2b,0x45,0xf7,0x99,
-        0xde,0xb0,0x02,0x6c,0x7d,0x13,0xa1,0xcf,0x83,0xed,0x5f,0x31,0x20,0x4e,0xfc,0x92,
-        0x64,0x0a,0xb8,0xd6,0xc7,0xa9,0x1b,0x75,0x39,0x57,0xe5,0x8b,0x9a,0xf4,0x46,0x28,
-        0xb1,0xdf,0x6d,0x03,0x12,0x7c,0xce,0xa0,0xec,0x82,0x30,0x5e,0x4f,0x21,0x93,0xfd,
-        0x0b,0x65,0xd7,0xb9,0xa8,0xc6,0x74,0x1a,0x56,0x38,0x8a,0xe4,0xf5,0x9b,0x29,0x47,
-        0xa7,0xc9,0x7b,0x15,0x04,0x6a,0xd8,0xb6,0xfa,0x94,0x26,0x48,0x59,0x37,0x85,0xeb,
-        0x1d,0x73,0xc1,0xaf,0xbe,0xd0,0x62,0x0c,0x40,0x2e,0x9c,0xf2,0xe3,0x8d,0x3f,0x51,
-        0xc8,0xa6,0x14,0x7a,0x6b,0x05,0xb7,0xd9,0x95,0xfb,0x49,0x27,0x36,0x58,0xea,0x84,
-        0x72,0x1c,0xae,0xc0,0xd1,0xbf,0x0d,0x63,0x2f,0x41,0xf3,0x9d,0x8c,0xe2,0x50,0x3e,
-        0x79,0x17,0xa5,0xcb,0xda,0xb4,0x06,0x68,0x24,0x4a,0xf8,0x96,0x87,0xe9,0x5b,0x35,
-        0xc3,0xad,0x1f,0x71,0x60,0x0e,0xbc,0xd2,0x9e,0xf0,0x42,0x2c,0x3d,0x53,0xe1,0x8f,
-        0x16,0x78,0xca,0xa4,0xb5,0xdb,0x69,0x07,0x4b,0x25,0x97,0xf9,0xe8,0x86,0x34,0x5a,
-        0xac,0xc2,0x70,0x1e,0x0f,0x61,0xd3,0xbd,0xf1,0x9f,0x2d,0x43,0x52,0x3c,0x8e,0xe0,
-    ),
-    ( # 111
-        0x00,0x6f,0xde,0xb1,0xa7,0xc8,0x79,0x16,0x55,0x3a,0x8b,0xe4,0xf2,0x9d,0x2c,0x43,
-        0xaa,0xc5,0x74,0x1b,0x0d,0x62,0xd3,0xbc,0xff,0x90,0x21,0x4e,0x58,0x37,0x86,0xe9,
-        0x4f,0x20,0x91,0xfe,0xe8,0x87,0x36,0x59,0x1a,0x75,0xc4,0xab,0xbd,0xd2,0x63,0x0c,
-        0xe5,0x8a,0x3b,0x54,0x42,0x2d,0x9c,0xf3,0xb0,0xdf,0x6e,0x01,0x17,0x78,0xc9,0xa6,
-        0x9e,0xf1,0x40,0x2f,0x39,0x56,0xe7,0x88,0xcb,0xa4,0x15,0x7a,0x6c,0x03,0xb2,0xdd,
-        0x34,0x5b,0xea,0x85,0x93,0xfc,0x4d,0x22,0x61,0x0e,0xbf,0xd0,0xc6,0xa9,0x18,0x77,
-        0xd1,0xbe,0x0f,0x60,0x76,0x19,0xa8,0xc7,0x84,0xeb,0x5a,0x35,0x23,0x4c,0xfd,0x92,
-        0x7b,0x14,0xa5,0xca,0xdc,0xb3,0x02,0x6d,0x2e,0x41,0xf0,0x9f,0x89,0xe6,0x57,0x38,
-        0x27,0x48,0xf9,0x96,0x80,0xef,0x5e,0x31,0x72,0x1d,0xac,0xc3,0xd5,0xba,0x0b,0x64,
-        0x8d,0xe2,0x53,0x3c,0x2a,0x45,0xf4,0x9b,0xd8,0xb7,0x06,0x69,0x7f,0x10,0xa1,0xce,
-        0x68,0x07,0xb6,0xd9,0xcf,0xa0,0x11,0x7e,0x3d,0x52,0xe3,0x8c,0x9a,0xf5,0x44,0x2b,
-        0xc2,0xad,0x1c,0x73,0x65,0x0a,0xbb,0xd4,0x97,0xf8,0x49,0x26,0x30,0x5f,0xee,0x81,
-        0xb9,0xd6,0x67,0x08,0x1e,0x71,0xc0,0xaf,0xec,0x83,0x32,0x5d,0x4b,0x24,0x95,0xfa,
-        0x13,0x7c,0xcd,0xa2,0xb4,0xdb,0x6a,0x05,0x46,0x29,0x98,0xf7,0xe1,0x8e,0x3f,0x50,
-        0xf6,0x99,0x28,0x47,0x51,0x3e,0x8f,0xe0,0xa3,0xcc,0x7d,0x12,0x04,0x6b,0xda,0xb5,
-        0x5c,0x33,0x82,0xed,0xfb,0x94,0x25,0x4a,0x09,0x66,0xd7,0xb8,0xae,0xc1,0x70,0x1f,
-    ),
-    ( # 112
-        0x00,0x70,0xe0,0x90,0xdb,0xab,0x3b,0x4b,0xad,0xdd,0x4d,0x3d,0x76,0x06,0x96,0xe6,
-        0x41,0x31,0xa1,0xd1,0x9a,0xea,0x7a,0x0a,0xec,0x9c,0x0c,0x7c,0x37,0x47,0xd7,0xa7,
-        0x82,0xf2,0x62,0x12,0x59,0x29,0xb9,0xc9,0x2f,0x5f,0xcf,0xbf,0xf4,0x84,0x14,0x64,
-        0xc3,0xb3,0x23,0x53,0x18,0x68,0xf8,0x88,0x6e,0x1e,0x8e,0xfe,0xb5,0xc5,0x55,0x25,
-        0x1f,0x6f,0xff,0x8f,0xc4,0xb4,0x24,0x54,0xb2,0xc2,0x52,0x22,0x69,0x19,0x89,0xf9,
-        0x5e,0x2e,0xbe,0xce,0x85,0xf5,0x65,0x15,0xf3,0x83,0x13,0x63,0x28,0x58,0xc8,0xb8,
-        0x9d,0xed,0x7d,0x0d,0x46,0x36,0xa6,0xd6,0x30,0x40,0xd0,0xa0,0xeb,0x9b,0x0b,0x7b,
-        0xdc,0xac,0x3c,0x4c,0x07,0x77,0xe7,0x97,0x71,0x01,0x91,0xe1,0xaa,0xda,0x4a,0x3a,
-        0x3e,0x4e,0xde,0xae,0xe5,0x95,0x05,0x75,0x93,0xe3,0x73,0x03,0x48,0x38,0xa8,0xd8,
-        0x7f,0x0f,0x9f,0xef,0xa4,0xd4,0x44,0x34,0xd2,0xa2,0x32,0x42,0x09,0x79,0xe9,0x99,
-        0xbc,0xcc,0x5c,0x2c,0x67,0x17,0x87,0xf7,0x11,0x61,0xf1,0x81,0xca,0xba,0x2a,0x5a,
-        0xfd,0x8d,0x1d,0x6d,0x26,0x56,0xc6,0xb6,0x50,0x20,0xb0,0xc0,0x8b,0xfb,0x6b,0x1b,
-        0x21,0x51,0xc1,0xb1,0xfa,0x8a,0x1a,0x6a,0x8c,0xfc,0x6c,0x1c,0x57,0x27,0xb7,0xc7,
-        0x60,0x10,0x80,0xf0,0xbb,0xcb,0x5b,0x2b,0xcd,0xbd,0x2d,0x5d,0x16,0x66,0xf6,0x86,
-        0xa3,0xd3,0x43,0x33,0x78,0x08,0x98,0xe8,0x0e,0x7e,0xee,0x9e,0xd5,0xa5,0x35,0x45,
-        0xe2,0x92,0x02,0x72,0x39,0x49,0xd9,0xa9,0x4f,0x3f,0xaf,0xdf,0x94,0xe4,0x74,0x04,
-    ),
-    ( # 113
-        0x00,0x71,0xe2,0x93,0xdf,0xae,0x3d,0x4c,0xa5,0xd4,0x47,0x36,0x7a,0x0b,0x98,0xe9,
-        0x51,0x20,0xb3,0xc2,0x8e,0xff,0x6c,0x1d,0xf4,0x85,0x16,0x67,0x2b,0x5a,0xc9,0xb8,
-        0xa2,0xd3,0x40,0x31,0x7d,0x0c,0x9f,0xee,0x07,0x76,0xe5,0x94,0xd8,0xa9,0x3a,0x4b,
-        0xf3,0x82,0x11,0x60,0x2c,0x5d,0xce,0xbf,0x56,0x27,0xb4,0xc5,0x89,0xf8,0x6b,0x1a,
-        0x5f,0x2e,0xbd,0xcc,0x80,0xf1,0x62,0x13,0xfa,0x8b,0x18,0x69,0x25,0x54,0xc7,0xb6,
-        0x0e,0x7f,0xec,0x9d,0xd1,0xa0,0x33,0x42,0xab,0xda,0x49,0x38,0x74,0x05,0x96,0xe7,
-        0xfd,0x8c,0x1f,0x6e,0x22,0x53,0xc0,0xb1,0x58,0x29,0xba,0xcb,0x87,0xf6,0x65,0x14,
-        0xac,0xdd,0x4e,0x3f,0x73,0x02,0x91,0xe0,0x09,0x78,0xeb,0x9a,0xd6,0xa7,0x34,0x45,
-        0xbe,0xcf,0x5c,0x2d,0x61,0x10,0x83,0xf2,0x1b,0x6a,0xf9,0x88,0xc4,0xb5,0x26,0x57,
-        0xef,0x9e,0x0d,0x7c,0x30,0x41,0xd2,0xa3,0x4a,0x3b,0xa8,0xd9,0x95,0xe4,0x77,0x06,
-        0x1c,0x6d,0xfe,0x8f,0xc3,0xb2,0x21,0x50,0xb9,0xc8,0x5b,0x2a,0x66,0x17,0x84,0xf5,
-        0x4d,0x3c,0xaf,0xde,0x92,0xe3,0x70,0x01,0xe8,0x99,0x0a,0x7b,0x37,0x46,0xd5,0xa4,
-        0xe1,0x90,0x03,0x72,0x3e,0x4f,0xdc,0xad,0x44,0x35,0xa6,0xd7,0x9b,0xea,0x79,0x08,
-        0xb0,0xc1,0x52,0x23,0x6f,0x1e,0x8d,0xfc,0x15,0x64,0xf7,0x86,0xca,0xbb,0x28,0x59,
-        0x43,0x32,0xa1,0xd0,0x9c,0xed,0x7e,0x0f,0xe6,0x97,0x04,0x75,0x39,0x48,0xdb,0xaa,
-        0x12,0x63,0xf0,0x81,0xcd,0xbc,0x2f,0x5e,0xb7,0xc6,0x55,0x24,0x68,0x19,0x8a,0xfb,
-    ),
-    ( # 114
-        0x00,0x72,0xe4,0x96,0xd3,0xa1,0x37,0x45,0xbd,0xcf,0x59,0x2b,0x6e,0x1c,0x8a,0xf8,
-        0x61,0x13,0x85,0xf7,0xb2,0xc0,0x56,0x24,0xdc,0xae,0x38,0x4a,0x0f,0x7d,0xeb,0x99,
-        0xc2,0xb0,0x26,0x54,0x11,0x63,0xf5,0x87,0x7f,0x0d,0x9b,0xe9,0xac,0xde,0x48,0x3a,
-        0xa3,0xd1,0x47,0x35,0x70,0x02,0x94,0xe6,0x1e,0x6c,0xfa,0x88,0xcd,0xbf,0x29,0x5b,
-        0x9f,0xed,0x7b,0x09,0x4c,0x3e,0xa8,0xda,0x22,0x50,0xc6,0xb4,0xf1,0x83,0x15,0x67,
-        0xfe,0x8c,0x1a,0x68,0x2d,0x5f,0xc9,0xbb,0x43,0x31,0xa7,0xd5,0x90,0xe2,0x74,0x06,
-        0x5d,0x2f,0xb9,0xcb,0x8e,0xfc,0x6a,0x18,0xe0,0x92,0x04,0x76,0x33,0x41,0xd7,0xa5,
-        0x3c,0x4e,0xd8,0xaa,0xef,0x9d,0x0b,0x79,0x81,0xf3,0x65,0x17,0x52,0x20,0xb6,0xc4,
-        0x25,0x57,0xc1,0xb3,0xf6,0x84,0x12,0x60,0x98,0xea,0x7c,0x0e,0x4b,0x39,0xaf,0xdd,
-        0x44,0x36,0xa0,0xd2,0x97,0xe5,0x73,0x01,0xf9,0x8b,0x1d,0x6f,0x2a,0x58,0xce,0xbc,
-        0xe7,0x95,0x03,0x71,0x34,0x46,0xd0,0xa2,0x5a,0x28,0xbe,0xcc,0x89,0xfb,0x6d,0x1f,
-        0x86,0xf4,0x62,0x10,0x55,0x27,0xb1,0xc3,0x3b,0x49,0xdf,0xad,0xe8,0x9a,0x0c,0x7e,
-        0xba,0xc8,0x5e,0x2c,0x69,0x1b,0x8d,0xff,0x07,0x75,0xe3,0x91,0xd4,0xa6,0x30,0x42,
-        0xdb,0xa9,0x3f,0x4d,0x08,0x7a,0xec,0x9e,0x66,0x14,0x82,0xf0,0xb5,0xc7,0x51,0x23,
-        0x78,0x0a,0x9c,0xee,0xab,0xd9,0x4f,0x3d,0xc5,0xb7,0x21,0x53,0x16,0x64,0xf2,0x80,
-        0x19,0x6b,0xfd,0x8f,0xca,0xb8,0x2e,0x5c,0xa4,0xd6,0x40,0x32,0x77,0x05,0x93,0xe1,
-    ),
-    ( # 115
-        0x00,0x73,0xe6,0x95,0xd7,0xa4,0x31,0x42,0xb5,0xc6,0x53,0x20,0x62,0x11,0x84,0xf7,
-        0x71,0x02,0x97,0xe4,0xa6,0xd5,0x40,0x33,0xc4,0xb7,0x22,0x51,0x13,0x60,0xf5,0x86,
-        0xe2,0x91,0x04,0x77,0x35,0x46,0xd3,0xa0,0x57,0x24,0xb1,0xc2,0x80,0xf3,0x66,0x15,
-        0x93,0xe0,0x75,0x06,0x44,0x37,0xa2,0xd1,0x26,0x55,0xc0,0xb3,0xf1,0x82,0x17,0x64,
-        0xdf,0xac,0x39,0x4a,0x08,0x7b,0xee,0x9d,0x6a,0x19,0x8c,0xff,0xbd,0xce,0x5b,0x28,
-        0xae,0xdd,0x48,0x3b,0x79,0x0a,0x9f,0xec,0x1b,0x68,0xfd,0x8e,0xcc,0xbf,0x2a,0x59,
-        0x3d,0x4e,0xdb,0xa8,0xea,0x99,0x0c,0x7f,0x88,0xfb,0x6e,0x1d,0x5f,0x2c,0xb9,0xca,
-        0x4c,0x3f,0xaa,0xd9,0x9b,0xe8,0x7d,0x0e,0xf9,0x8a,0x1f,0x6c,0x2e,0x5d,0xc8,0xbb,
-        0xa5,0xd6,0x43,0x30,0x72,0x01,0x94,0xe7,0x10,0x63,0xf6,0x85,0xc7,0xb4,0x21,0x52,
-        0xd4,0xa7,0x32,0x41,0x03,0x70,0xe5,0x96,0x61,0x12,0x87,0xf4,0xb6,0xc5,0x50,0x23,
-        0x47,0x34,0xa1,0xd2,0x90,0xe3,0x76,0x05,0xf2,0x81,0x14,0x67,0x25,0x56,0xc3,0xb0,
-        0x36,0x45,0xd0,0xa3,0xe1,0x92,0x07,0x74,0x83,0xf0,0x65,0x16,0x54,0x27,0xb2,0xc1,
-        0x7a,0x09,0x9c,0xef,0xad,0xde,0x4b,0x38,0xcf,0xbc,0x29,0x5a,0x18,0x6b,0xfe,0x8d,
-        0x0b,0x78,0xed,0x9e,0xdc,0xaf,0x3a,0x49,0xbe,0xcd,0x58,0x2b,0x69,0x1a,0x8f,0xfc,
-        0x98,0xeb,0x7e,0x0d,0x4f,0x3c,0xa9,0xda,0x2d,0x5e,0xcb,0xb8,0xfa,0x89,0x1c,0x6f,
-        0xe9,0x9a,0x0f,0x7c,0x3e,0x4d,0xd8,0xab,0x5c,0x2f,0xba,0xc9,0x8b,0xf8,0x6d,0x1e,
-    ),
-    ( # 116
-        0x00,0x74,0xe8,0x9c,0xcb,0xbf,0x23,0x57,0x8d,0xf9,0x65,0x11,0x46,0x32,0xae,0xda,
-        0x01,0x75,0xe9,0x9d,0xca,0xbe,0x22,0x56,0x8c,0xf8,0x64,0x10,0x47,0x33,0xaf,0xdb,
-        0x02,0x76,0xea,0x9e,0xc9,0xbd,0x21,0x55,0x8f,0xfb,0x67,0x13,0x44,0x30,0xac,0xd8,
-        0x03,0x77,0xeb,0x9f,0xc8,0xbc,0x20,0x54,0x8e,0xfa,0x66,0x12,0x45,0x31,0xad,0xd9,
-        0x04,0x70,0xec,0x98,0xcf,0xbb,0x27,0x53,0x89,0xfd,0x61,0x15,0x42,0x36,0xaa,0xde,
-        0x05,0x71,0xed,0x99,0xce,0xba,0x26,0x52,0x88,0xfc,0x60,0x14,0x43,0x37,0xab,0xdf,
-        0x06,0x72,0xee,0x9a,0xcd,0xb9,0x25,0x51,0x8b,0xff,0x63,0x17,0x40,0x34,0xa8,0xdc,
-        0x07,0x73,0xef,0x9b,0xcc,0xb8,0x24,0x50,0x8a,0xfe,0x62,0x16,0x41,0x35,0xa9,0xdd,
-        0x08,0x7c,0xe0,0x94,0xc3,0xb7,0x2b,0x5f,0x85,0xf1,0x6d,0x19,0x4e,0x3a,0xa6,0xd2,
-        0x09,0x7d,0xe1,0x95,0xc2,0xb6,0x2a,0x5e,0x84,0xf0,0x6c,0x18,0x4f,0x3b,0xa7,0xd3,
-        0x0a,0x7e,0xe2,0x96,0xc1,0xb5,0x29,0x5d,0x87,0xf3,0x6f,0x1b,0x4c,0x38,0xa4,0xd0,
-        0x0b,0x7f,0xe3,0x97,0xc0,0xb4,0x28,0x5c,0x86,0xf2,0x6e,0x1a,0x4d,0x39,0xa5,0xd1,
-        0x0c,0x78,0xe4,0x90,0xc7,0xb3,0x2f,0x5b,0x81,0xf5,0x69,0x1d,0x4a,0x3e,0xa2,0xd6,
-        0x0d,0x79,0xe5,0x91,0xc6,0xb2,0x2e,0x5a,0x80,0xf4,0x68,0x1c,0x4b,0x3f,0xa3,0xd7,
-        0x0e,0x7a,0xe6,0x92,0xc5,0xb1,0x2d,0x59,0x83,0xf7,0x6b,0x1f,0x48,0x3c,0xa0,0xd4,
-        0x0f,0x7b,0xe7,0x93,0xc4,0xb0,0x2c,0x58,0x82,0xf6,0x6a,0x1e,0x49,0x3d,0xa1,0xd5,
-    ),
-    ( # 117
-        0x00,0x75,0xea,0x9f,0xcf,0xba,0x25,0x50,0x85,0xf0,0x6f,0x1a,0x4a,0x3f,0xa0,0xd5,
-        0x11,0x64,0xfb,0x8e,0xde,0xab,0x34,0x41,0x94,0xe1,0x7e,0x0b,0x5b,0x2e,0xb1,0xc4,
-        0x22,0x57,0xc8,0xbd,0xed,0x98,0x07,0x72,0xa7,0xd2,0x4d,0x38,0x68,0x1d,0x82,0xf7,
-        0x33,0x46,0xd9,0xac,0xfc,0x89,0x16,0x63,0xb6,0xc3,0x5c,0x29,0x79,0x0c,0x93,0xe6,
-        0x44,0x31,0xae,0xdb,0x8b,0xfe,0x61,0x14,0xc1,0xb4,0x2b,0x5e,0x0e,0x7b,0xe4,0x91,
-        0x55,0x20,0xbf,0xca,0x9a,0xef,0x70,0x05,0xd0,0xa5,0x3a,0x4f,0x1f,0x6a,0xf5,0x80,
-        0x66,0x13,0x8c,0xf9,0xa9,0xdc,0x43,0x36,0xe3,0x96,0x09,0x7c,0x2c,0x59,0xc6,0xb3,
-        0x77,0x02,0x9d,0xe8,0xb8,0xcd,0x52,0x27,0xf2,0x87,0x18,0x6d,0x3d,0x48,0xd7,0xa2,
-        0x88,0xfd,0x62,0x17,0x47,0x32,0xad,0xd8,0x0d,0x78,0xe7,0x92,0xc2,0xb7,0x28,0x5d,
-        0x99,0xec,0x73,0x06,0x56,0x23,0xbc,0xc9,0x1c,0x69,0xf6,0x83,0xd3,0xa6,0x39,0x4c,
-        0xaa,0xdf,0x40,0x35,0x65,0x10,0x8f,0xfa,0x2f,0x5a,0xc5,0xb0,0xe0,0x95,0x0a,0x7f,
-        0xbb,0xce,0x51,0x24,0x74,0x01,0x9e,0xeb,0x3e,0x4b,0xd4,0xa1,0xf1,0x84,0x1b,0x6e,
-        0xcc,0xb9,0x26,0x53,0x03,0x76,0xe9,0x9c,0x49,0x3c,0xa3,0xd6,0x86,0xf3,0x6c,0x19,
-        0xdd,0xa8,0x37,0x42,0x12,0x67,0xf8,0x8d,0x58,0x2d,0xb2,0xc7,0x97,0xe2,0x7d,0x08,
-        0xee,0x9b,0x04,0x71,0x21,0x54,0xcb,0xbe,0x6b,0x1e,0x81,0xf4,0xa4,0xd1,0x4e,0x3b,
-        0xff,0x8a,0x15,0x60,0x30,0x45,0xda,0xaf,0x7a,0x0f,0x90,0xe5,0xb5,0xc0,0x5f,0x2a,
-    ),
-    ( # 118
-        0x00,0x76,0xec,0x9a,0xc3,0xb5,0x2f,0x59,0x9d,0xeb,0x71,0x07,0x5e,0x28,0xb2,0xc4,
-        0x21,0x57,0xcd,0xbb,0xe2,0x94,0x0e,0x78,0xbc,0xca,0x50,0x26,0x7f,0x09,0x93,0xe5,
-        0x42,0x34,0xae,0xd8,0x81,0xf7,0x6d,0x1b,0xdf,0xa9,0x33,0x45,0x1c,0x6a,0xf0,0x86,
-        0x63,0x15,0x8f,0xf9,0xa0,0xd6,0x4c,0x3a,0xfe,0x88,0x12,0x64,0x3d,0x4b,0xd1,0xa7,
-        0x84,0xf2,0x68,0x1e,0x47,0x31,0xab,0xdd,0x19,0x6f,0xf5,0x83,0xda,0xac,0x36,0x40,
-        0xa5,0xd3,0x49,0x3f,0x66,0x10,0x8a,0xfc,0x38,0x4e,0xd4,0xa2,0xfb,0x8d,0x17,0x61,
-        0xc6,0xb0,0x2a,0x5c,0x05,0x73,0xe9,0x9f,0x5b,0x2d,0xb7,0xc1,0x98,0xee,0x74,0x02,
-        0xe7,0x91,0x0b,0x7d,0x24,0x52,0xc8,0xbe,0x7a,0x0c,0x96,0xe0,0xb9,0xcf,0x55,0x23,
-        0x13,0x65,0xff,0x89,0xd0,0xa6,0x3c,0x4a,0x8e,0xf8,0x62,0x14,0x4d,0x3b,0xa1,0xd7,
-        0x32,0x44,0xde,0xa8,0xf1,0x87,0x1d,0x6b,0xaf,0xd9,0x43,0x35,0x6c,0x1a,0x80,0xf6,
-        0x51,0x27,0xbd,0xcb,0x92,0xe4,0x7e,0x08,0xcc,0xba,0x20,0x56,0x0f,0x79,0xe3,0x95,
-        0x70,0x06,0x9c,0xea,0xb3,0xc5,0x5f,0x29,0xed,0x9b,0x01,0x77,0x2e,0x58,0xc2,0xb4,
-        0x97,0xe1,0x7b,0x0d,0x54,0x22,0xb8,0xce,0x0a,0x7c,0xe6,0x90,0xc9,0xbf,0x25,0x53,
-        0xb6,0xc0,0x5a,0x2c,0x75,0x03,0x99,0xef,0x2b,0x5d,0xc7,0xb1,0xe8,0x9e,0x04,0x72,
-        0xd5,0xa3,0x39,0x4f,0x16,0x60,0xfa,0x8c,0x48,0x3e,0xa4,0xd2,0x8b,0xfd,0x67,0x11,
-        0xf4,0x82,0x18,0x6e,0x37,0x41,0xdb,0xad,0x69,0x1f,0x85,0xf3,0xaa,0xdc,0x46,0x30,
-    ),
-    ( # 119
-        0x00,0x77,0xee,0x99,0xc7,0xb0,0x29,0x5e,0x95,0xe2,0x7b,0x0c,0x52,0x25,0xbc,0xcb,
-        0x31,0x46,0xdf,0xa8,0xf6,0x81,0x18,0x6f,0xa4,0xd3,0x4a,0x3d,0x63,0x14,0x8d,0xfa,
-        0x62,0x15,0x8c,0xfb,0xa5,0xd2,0x4b,0x3c,0xf7,0x80,0x19,0x6e,0x30,0x47,0xde,0xa9,
-        0x53,0x24,0xbd,0xca,0x94,0xe3,0x7a,0x0d,0xc6,0xb1,0x28,0x5f,0x01,0x76,0xef,0x98,
-        0xc4,0xb3,0x2a,0x5d,0x03,0x74,0xed,0x9a,0x51,0x26,0xbf,0xc8,0x96,0xe1,0x78,0x0f,
-        0xf5,0x82,0x1b,0x6c,0x32,0x45,0xdc,0xab,0x60,0x17,0x8e,0xf9,0xa7,0xd0,0x49,0x3e,
-        0xa6,0xd1,0x48,0x3f,0x61,0x16,0x8f,0xf8,0x33,0x44,0xdd,0xaa,0xf4,0x83,0x1a,0x6d,
-        0x97,0xe0,0x79,0x0e,0x50,0x27,0xbe,0xc9,0x02,0x75,0xec,0x9b,0xc5,0xb2,0x2b,0x5c,
-        0x93,0xe4,0x7d,0x0a,0x54,0x23,0xba,0xcd,0x06,0x71,0xe8,0x9f,0xc1,0xb6,0x2f,0x58,
-        0xa2,0xd5,0x4c,0x3b,0x65,0x12,0x8b,0xfc,0x37,0x40,0xd9,0xae,0xf0,0x87,0x1e,0x69,
-        0xf1,0x86,0x1f,0x68,0x36,0x41,0xd8,0xaf,0x64,0x13,0x8a,0xfd,0xa3,0xd4,0x4d,0x3a,
-        0xc0,0xb7,0x2e,0x59,0x07,0x70,0xe9,0x9e,0x55,0x22,0xbb,0xcc,0x92,0xe5,0x7c,0x0b,
-        0x57,0x20,0xb9,0xce,0x90,0xe7,0x7e,0x09,0xc2,0xb5,0x2c,0x5b,0x05,0x72,0xeb,0x9c,
-        0x66,0x11,0x88,0xff,0xa1,0xd6,0x4f,0x38,0xf3,0x84,0x1d,0x6a,0x34,0x43,0xda,0xad,
-        0x35,0x42,0xdb,0xac,0xf2,0x85,0x1c,0x6b,0xa0,0xd7,0x4e,0x39,0x67,0x10,0x89,0xfe,
-        0x04,0x73,0xea,0x9d,0xc3,0xb4,0x2d,0x5a,0x91,0xe6,0x7f,0x08,0x56,0x21,0xb8,0xcf,
-    ),
-    ( # 120
-        0x00,0x78,0xf0,0x88,0xfb,0x83,0x0b,0x73,0xed,0x95,0x1d,0x65,0x16,0x6e,0xe6,0x9e,
-        0xc1,0xb9,0x31,0x49,0x3a,0x42,0xca,0xb2,0x2c,0x54,0xdc,0xa4,0xd7,0xaf,0x27,0x5f,
-        0x99,0xe1,0x69,0x11,0x62,0x1a,0x92,0xea,0x74,0x0c,0x84,0xfc,0x8f,0xf7,0x7f,0x07,
-        0x58,0x20,0xa8,0xd0,0xa3,0xdb,0x53,0x2b,0xb5,0xcd,0x45,0x3d,0x4e,0x36,0xbe,0xc6,
-        0x29,0x51,0xd9,0xa1,0xd2,0xaa,0x22,0x5a,0xc4,0xbc,0x34,0x4c,0x3f,0x47,0xcf,0xb7,
-        0xe8,0x90,0x18,0x60,0x13,0x6b,0xe3,0x9b,0x05,0x7d,0xf5,0x8d,0xfe,0x86,0x0e,0x76,
-        0xb0,0xc8,0x40,0x38,0x4b,0x33,0xbb,0xc3,0x5d,0x25,0xad,0xd5,0xa6,0xde,0x56,0x2e,
-        0x71,0x09,0x81,0xf9,0x8a,0xf2,0x7a,0x02,0x9c,0xe4,0x6c,0x14,0x67,0x1f,0x97,0xef,
-        0x52,0x2a,0xa2,0xda,0xa9,0xd1,0x59,0x21,0xbf,0xc7,0x4f,0x37,0x44,0x3c,0xb4,0xcc,
-        0x93,0xeb,0x63,0x1b,0x68,0x10,0x98,0xe0,0x7e,0x06,0x8e,0xf6,0x85,0xfd,0x75,0x0d,
-        0xcb,0xb3,0x3b,0x43,0x30,0x48,0xc0,0xb8,0x26,0x5e,0xd6,0xae,0xdd,0xa5,0x2d,0x55,
-        0x0a,0x72,0xfa,0x82,0xf1,0x89,0x01,0x79,0xe7,0x9f,0x17,0x6f,0x1c,0x64,0xec,0x94,
-        0x7b,0x03,0x8b,0xf3,0x80,0xf8,0x70,0x08,0x96,0xee,0x66,0x1e,0x6d,0x15,0x9d,0xe5,
-        0xba,0xc2,0x4a,0x32,0x41,0x39,0xb1,0xc9,0x57,0x2f,0xa7,0xdf,0xac,0xd4,0x5c,0x24,
-        0xe2,0x9a,0x12,0x6a,0x19,0x61,0xe9,0x91,0x0f,0x77,0xff,0x87,0xf4,0x8c,0x04,0x7c,
-        0x23,0x5b,0xd3,0xab,0xd8,0xa0,0x28,0x50,0xce,0xb6,0x3e,0x46,0x35,0x4d,0xc5,0xbd,
-    ),
-    ( # 121
-        0x00,0x79,0xf2,0x8b,0xff,0x86,0x0d,0x74,0xe5,0x9c,0x17,0x6e,0x1a,0x63,0xe8,0x91,
-        0xd1,0xa8,0x23,0x5a,0x2e,0x57,0xdc,0xa5,0x34,0x4d,0xc6,0xbf,0xcb,0xb2,0x39,0x40,
-        0xb9,0xc0,0x4b,0x32,0x46,0x3f,0xb4,0xcd,0x5c,0x25,0xae,0xd7,0xa3,0xda,0x51,0x28,
-        0x68,0x11,0x9a,0xe3,0x97,0xee,0x65,0x1c,0x8d,0xf4,0x7f,0x06,0x72,0x0b,0x80,0xf9,
-        0x69,0x10,0x9b,0xe2,0x96,0xef,0x64,0x1d,0x8c,0xf5,0x7e,0x07,0x73,0x0a,0x81,0xf8,
-        0xb8,0xc1,0x4a,0x33,0x47,0x3e,0xb5,0xcc,0x5d,0x24,0xaf,0xd6,0xa2,0xdb,0x50,0x29,
-        0xd0,0xa9,0x22,0x5b,0x2f,0x56,0xdd,0xa4,0x35,0x4c,0xc7,0xbe,0xca,0xb3,0x38,0x41,
-        0x01,0x78,0xf3,0x8a,0xfe,0x87,0x0c,0x75,0xe4,0x9d,0x16,0x6f,0x1b,0x62,0xe9,0x90,
-        0xd2,0xab,0x20,0x59,0x2d,0x54,0xdf,0xa6,0x37,0x4e,0xc5,0xbc,0xc8,0xb1,0x3a,0x43,
-        0x03,0x7a,0xf1,0x88,0xfc,0x85,0x0e,0x77,0xe6,0x9f,0x14,0x6d,0x19,0x60,0xeb,0x92,
-        0x6b,0x12,0x99,0xe0,0x94,0xed,0x66,0x1f,0x8e,0xf7,0x7c,0x05,0x71,0x08,0x83,0xfa,
-        0xba,0xc3,0x48,0x31,0x45,0x3c,0xb7,0xce,0x5f,0x26,0xad,0xd4,0xa0,0xd9,0x52,0x2b,
-        0xbb,0xc2,0x49,0x30,0x44,0x3d,0xb6,0xcf,0x5e,0x27,0xac,0xd5,0xa1,0xd8,0x53,0x2a,
-        0x6a,0x13,0x98,0xe1,0x95,0xec,0x67,0x1e,0x8f,0xf6,0x7d,0x04,0x70,0x09,0x82,0xfb,
-        0x02,0x7b,0xf0,0x89,0xfd,0x84,0x0f,0x76,0xe7,0x9e,0x15,0x6c,0x18,0x61,0xea,0x93,
-        0xd3,0xaa,0x21,0x58,0x2c,0x55,0xde,0xa7,0x36,0x4f,0xc4,0xbd,0xc9,0xb0,0x3b,0x42,
-    ),
-    ( # 122
-        0x00,0x7a,0xf4,0x8e,0xf3,0x89,0x07,0x7d,0xfd,0x87,0x09,0x73,0x0e,0x74,0xfa,0x80,
-        0xe1,0x9b,0x15,0x6f,0x12,0x68,0xe6,0x9c,0x1c,0x66,0xe8,0x92,0xef,0x95,0x1b,0x61,
-        0xd9,0xa3,0x2d,0x57,0x2a,0x50,0xde,0xa4,0x24,0x5e,0xd0,0xaa,0xd7,0xad,0x23,0x59,
-        0x38,0x42,0xcc,0xb6,0xcb,0xb1,0x3f,0x45,0xc5,0xbf,0x31,0x4b,0x36,0x4c,0xc2,0xb8,
-        0xa9,0xd3,0x5d,0x27,0x5a,0x20,0xae,0xd4,0x54,0x2e,0xa0,0xda,0xa7,0xdd,0x53,0x29,
-        0x48,0x32,0xbc,0xc6,0xbb,0xc1,0x4f,0x35,0xb5,0xcf,0x41,0x3b,0x46,0x3c,0xb2,0xc8,
-        0x70,0x0a,0x84,0xfe,0x83,0xf9,0x77,0x0d,0x8d,0xf7,0x79,0x03,0x7e,0x04,0x8a,0xf0,
-        0x91,0xeb,0x65,0x1f,0x62,0x18,0x96,0xec,0x6c,0x16,0x98,0xe2,0x9f,0xe5,0x6b,0x11,
-        0x49,0x33,0xbd,0xc7,0xba,0xc0,0x4e,0x34,0xb4,0xce,0x40,0x3a,0x47,0x3d,0xb3,0xc9,
-        0xa8,0xd2,0x5c,0x26,0x5b,0x21,0xaf,0xd5,0x55,0x2f,0xa1,0xdb,0xa6,0xdc,0x52,0x28,
-        0x90,0xea,0x64,0x1e,0x63,0x19,0x97,0xed,0x6d,0x17,0x99,0xe3,0x9e,0xe4,0x6a,0x10,
-        0x71,0x0b,0x85,0xff,0x82,0xf8,0x76,0x0c,0x8c,0xf6,0x78,0x02,0x7f,0x05,0x8b,0xf1,
-        0xe0,0x9a,0x14,0x6e,0x13,0x69,0xe7,0x9d,0x1d,0x67,0xe9,0x93,0xee,0x94,0x1a,0x60,
-        0x01,0x7b,0xf5,0x8f,0xf2,0x88,0x06,0x7c,0xfc,0x86,0x08,0x72,0x0f,0x75,0xfb,0x81,
-        0x39,0x43,0xcd,0xb7,0xca,0xb0,0x3e,0x44,0xc4,0xbe,0x30,0x4a,0x37,0x4d,0xc3,0xb9,
-        0xd8,0xa2,0x2c,0x56,0x2b,0x51,0xdf,0xa5,0x25,0x5f,0xd1,0xab,0xd6,0xac,0x22,0x58,
-    ),
-    ( # 123
-        0x00,0x7b,0xf6,0x8d,0xf7,0x8c,0x01,0x7a,0xf5,0x8e,0x03,0x78,0x02,0x79,0xf4,0x8f,
-        0xf1,0x8a,0x07,0x7c,0x06,0x7d,0xf0,0x8b,0x04,0x7f,0xf2,0x89,0xf3,0x88,0x05,0x7e,
-        0xf9,0x82,0x0f,0x74,0x0e,0x75,0xf8,0x83,0x0c,0x77,0xfa,0x81,0xfb,0x80,0x0d,0x76,
-        0x08,0x73,0xfe,0x85,0xff,0x84,0x09,0x72,0xfd,0x86,0x0b,0x70,0x0a,0x71,0xfc,0x87,
-        0xe9,0x92,0x1f,0x64,0x1e,0x65,0xe8,0x93,0x1c,0x67,0xea,0x91,0xeb,0x90,0x1d,0x66,
-        0x18,0x63,0xee,0x95,0xef,0x94,0x19,0x62,0xed,0x96,0x1b,0x60,0x1a,0x61,0xec,0x97,
-        0x10,0x6b,0xe6,0x9d,0xe7,0x9c,0x11,0x6a,0xe5,0x9e,0x13,0x68,0x12,0x69,0xe4,0x9f,
-        0xe1,0x9a,0x17,0x6c,0x16,0x6d,0xe0,0x9b,0x14,0x6f,0xe2,0x99,0xe3,0x98,0x15,0x6e,
-        0xc9,0xb2,0x3f,0x44,0x3e,0x45,0xc8,0xb3,0x3c,0x47,0xca,0xb1,0xcb,0xb0,0x3d,0x46,
-        0x38,0x43,0xce,0xb5,0xcf,0xb4,0x39,0x42,0xcd,0xb6,0x3b,0x40,0x3a,0x41,0xcc,0xb7,
-        0x30,0x4b,0xc6,0xbd,0xc7,0xbc,0x31,0x4a,0xc5,0xbe,0x33,0x48,0x32,0x49,0xc4,0xbf,
-        0xc1,0xba,0x37,0x4c,0x36,0x4d,0xc0,0xbb,0x34,0x4f,0xc2,0xb9,0xc3,0xb8,0x35,0x4e,
-        0x20,0x5b,0xd6,0xad,0xd7,0xac,0x21,0x5a,0xd5,0xae,0x23,0x58,0x22,0x59,0xd4,0xaf,
-        0xd1,0xaa,0x27,0x5c,0x26,0x5d,0xd0,0xab,0x24,0x5f,0xd2,0xa9,0xd3,0xa8,0x25,0x5e,
-        0xd9,0xa2,0x2f,0x54,0x2e,0x55,0xd8,0xa3,0x2c,0x57,0xda,0xa1,0xdb,0xa0,0x2d,0x56,
-        0x28,0x53,0xde,0xa5,0xdf,0xa4,0x29,0x52,0xdd,0xa6,0x2b,0x50,0x2a,0x51,0xdc,0xa7,
-    ),
-    ( # 124
-        0x00,0x7c,0xf8,0x84,0xeb,0x97,0x13,0x6f,0xcd,0xb1,0x35,0x49,0x26,0x5a,0xde,0xa2,
-        0x81,0xfd,0x79,0x05,0x6a,0x16,0x92,0xee,0x4c,0x30,0xb4,0xc8,0xa7,0xdb,0x5f,0x23,
-        0x19,0x65,0xe1,0x9d,0xf2,0x8e,0x0a,0x76,0xd4,0xa8,0x2c,0x50,0x3f,0x43,0xc7,0xbb,
-        0x98,0xe4,0x60,0x1c,0x73,0x0f,0x8b,0xf7,0x55,0x29,0xad,0xd1,0xbe,0xc2,0x46,0x3a,
-        0x32,0x4e,0xca,0xb6,0xd9,0xa5,0x21,0x5d,0xff,0x83,0x07,0x7b,0x14,0x68,0xec,0x90,
-        0xb3,0xcf,0x4b,0x37,0x58,0x24,0xa0,0xdc,0x7e,0x02,0x86,0xfa,0x95,0xe9,0x6d,0x11,
-        0x2b,0x57,0xd3,0xaf,0xc0,0xbc,0x38,0x44,0xe6,0x9a,0x1e,0x62,0x0d,0x71,0xf5,0x89,
-        0xaa,0xd6,0x52,0x2e,0x41,0x3d,0xb9,0xc5,0x67,0x1b,0x9f,0xe3,0x8c,0xf0,0x74,0x08,
-        0x64,0x18,0x9c,0xe0,0x8f,0xf3,0x77,0x0b,0xa9,0xd5,0x51,0x2d,0x42,0x3e,0xba,0xc6,
-        0xe5,0x99,0x1d,0x61,0x0e,0x72,0xf6,0x8a,0x28,0x54,0xd0,0xac,0xc3,0xbf,0x3b,0x47,
-        0x7d,0x01,0x85,0xf9,0x96,0xea,0x6e,0x12,0xb0,0xcc,0x48,0x34,0x5b,0x27,0xa3,0xdf,
-        0xfc,0x80,0x04,0x78,0x17,0x6b,0xef,0x93,0x31,0x4d,0xc9,0xb5,0xda,0xa6,0x22,0x5e,
-        0x56,0x2a,0xae,0xd2,0xbd,0xc1,0x45,0x39,0x9b,0xe7,0x63,0x1f,0x70,0x0c,0x88,0xf4,
-        0xd7,0xab,0x2f,0x53,0x3c,0x40,0xc4,0xb8,0x1a,0x66,0xe2,0x9e,0xf1,0x8d,0x09,0x75,
-        0x4f,0x33,0xb7,0xcb,0xa4,0xd8,0x5c,0x20,0x82,0xfe,0x7a,0x06,0x69,0x15,0x91,0xed,
-        0xce,0xb2,0x36,0x4a,0x25,0x59,0xdd,0xa1,0x03,0x7f,0xfb,0x87,0xe8,0x94,0x10,0x6c,
-    ),
-    ( # 125
-        0x00,0x7d,0xfa,0x87,0xef,0x92,0x15,0x68,0xc5,0xb8,0x3f,0x42,0x2a,0x57,0xd0,0xad,
-        0x91,0xec,0x6b,0x16,0x7e,0x03,0x84,0xf9,0x54,0x29,0xae,0xd3,0xbb,0xc6,0x41,0x3c,
-        0x39,0x44,0xc3,0xbe,0xd6,0xab,0x2c,0x51,0xfc,0x81,0x06,0x7b,0x13,0x6e,0xe9,0x94,
-        0xa8,0xd5,0x52,0x2f,0x47,0x3a,0xbd,0xc0,0x6d,0x10,0x97,0xea,0x82,0xff,0x78,0x05,
-        0x72,0x0f,0x88,0xf5,0x9d,0xe0,0x67,0x1a,0xb7,0xca,0x4d,0x30,0x58,0x25,0xa2,0xdf,
-        0xe3,0x9e,0x19,0x64,0x0c,0x71,0xf6,0x8b,0x26,0x5b,0xdc,0xa1,0xc9,0xb4,0x33,0x4e,
-        0x4b,0x36,0xb1,0xcc,0xa4,0xd9,0x5e,0x23,0x8e,0xf3,0x74,0x09,0x61,0x1c,0x9b,0xe6,
-        0xda,0xa7,0x20,0x5d,0x35,0x48,0xcf,0xb2,0x1f,0x62,0xe5,0x98,0xf0,0x8d,0x0a,0x77,
-        0xe4,0x99,0x1e,0x63,0x0b,0x76,0xf1,0x8c,0x21,0x5c,0xdb,0xa6,0xce,0xb3,0x34,0x49,
-        0x75,0x08,0x8f,0xf2,0x9a,0xe7,0x60,0x1d,0xb0,0xcd,0x4a,0x37,0x5f,0x22,0xa5,0xd8,
-        0xdd,0xa0,0x27,0x5a,0x32,0x4f,0xc8,0xb5,0x18,0x65,0xe2,0x9f,0xf7,0x8a,0x0d,0x70,
-        0x4c,0x31,0xb6,0xcb,0xa3,0xde,0x59,0x24,0x89,0xf4,0x73,0x0e,0x66,0x1b,0x9c,0xe1,
-        0x96,0xeb,0x6c,0x11,0x79,0x04,0x83,0xfe,0x53,0x2e,0xa9,0xd4,0xbc,0xc1,0x46,0x3b,
-        0x07,0x7a,0xfd,0x80,0xe8,0x95,0x12,0x6f,0xc2,0xbf,0x38,0x45,0x2d,0x50,0xd7,0xaa,
-        0xaf,0xd2,0x55,0x28,0x40,0x3d,0xba,0xc7,0x6a,0x17,0x90,0xed,0x85,0xf8,0x7f,0x02,
-        0x3e,0x43,0xc4,0xb9,0xd1,0xac,0x2b,0x56,0xfb,0x86,0x01,0x7c,0x14,0x69,0xee,0x93,
-    ),
-    ( # 126
-        0x00,0x7e,0xfc,0x82,0xe3,0x9d,0x1f,0x61,0xdd,0xa3,0x21,0x5f,0x3e,0x40,0xc2,0xbc,
-        0xa1,0xdf,0x5d,0x23,0x42,0x3c,0xbe,0xc0,0x7c,0x02,0x80,0xfe,0x9f,0xe1,0x63,0x1d,
-        0x59,0x27,0xa5,0xdb,0xba,0xc4,0x46,0x38,0x84,0xfa,0x78,0x06,0x67,0x19,0x9b,0xe5,
-        0xf8,0x86,0x04,0x7a,0x1b,0x65,0xe7,0x99,0x25,0x5b,0xd9,0xa7,0xc6,0xb8,0x3a,0x44,
-        0xb2,0xcc,0x4e,0x30,0x51,0x2f,0xad,0xd3,0x6f,0x11,0x93,0xed,0x8c,0xf2,0x70,0x0e,
-        0x13,0x6d,0xef,0x91,0xf0,0x8e,0x0c,0x72,0xce,0xb0,0x32,0x4c,0x2d,0x53,0xd1,0xaf,
-        0xeb,0x95,0x17,0x69,0x08,0x76,0xf4,0x8a,0x36,0x48,0xca,0xb4,0xd5,0xab,0x29,0x57,
-        0x4a,0x34,0xb6,0xc8,0xa9,0xd7,0x55,0x2b,0x97,0xe9,0x6b,0x15,0x74,0x0a,0x88,0xf6,
-        0x7f,0x01,0x83,0xfd,0x9c,0xe2,0x60,0x1e,0xa2,0xdc,0x5e,0x20,0x41,0x3f,0xbd,0xc3,
-        0xde,0xa0,0x22,0x5c,0x3d,0x43,0xc1,0xbf,0x03,0x7d,0xff,0x81,0xe0,0x9e,0x1c,0x62,
-        0x26,0x58,0xda,0xa4,0xc5,0xbb,0x39,0x47,0xfb,0x85,0x07,0x79,0x18,0x66,0xe4,0x9a,
-        0x87,0xf9,0x7b,0x05,0x64,0x1a,0x98,0xe6,0x5a,0x24,0xa6,0xd8,0xb9,0xc7,0x45,0x3b,
-        0xcd,0xb3,0x31,0x4f,0x2e,0x50,0xd2,0xac,0x10,0x6e,0xec,0x92,0xf3,0x8d,0x0f,0x71,
-        0x6c,0x12,0x90,0xee,0x8f,0xf1,0x73,0x0d,0xb1,0xcf,0x4d,0x33,0x52,0x2c,0xae,0xd0,
-        0x94,0xea,0x68,0x16,0x77,0x09,0x8b,0xf5,0x49,0x37,0xb5,0xcb,0xaa,0xd4,0x56,0x28,
-        0x35,0x4b,0xc9,0xb7,0xd6,0xa8,0x2a,0x54,0xe8,0x96,0x14,0x6a,0x0b,0x75,0xf7,0x89,
-    ),
-    ( # 127
-        0x00,0x7f,0xfe,0x81,0xe7,0x98,0x19,0x66,0xd5,0xaa,0x2b,0x54,0x32,0x4d,0xcc,0xb3,
-        0xb1,0xce,0x4f,0x30,0x56,0x29,0xa8,0xd7,0x64,0x1b,0x9a,0xe5,0x83,0xfc,0x7d,0x02,
-        0x79,0x06,0x87,0xf8,0x9e,0xe1,0x60,0x1f,0xac,0xd3,0x52,0x2d,0x4b,0x34,0xb5,0xca,
-        0xc8,0xb7,0x36,0x49,0x2f,0x50,0xd1,0xae,0x1d,0x62,0xe3,0x9c,0xfa,0x85,0x04,0x7b,
-        0xf2,0x8d,0x0c,0x73,0x15,0x6a,0xeb,0x94,0x27,0x58,0xd9,0xa6,0xc0,0xbf,0x3e,0x41,
-        0x43,0x3c,0xbd,0xc2,0xa4,0xdb,0x5a,0x25,0x96,0xe9,0x68,0x17,0x71,0x0e,0x8f,0xf0,
-        0x8b,0xf4,0x75,0x0a,0x6c,0x13,0x92,0xed,0x5e,0x21,0xa0,0xdf,0xb9,0xc6,0x47,0x38,
-        0x3a,0x45,0xc4,0xbb,0xdd,0xa2,0x23,0x5c,0xef,0x90,0x11,0x6e,0x08,0x77,0xf6,0x89,
-        0xff,0x80,0x01,0x7e,0x18,0x67,0xe6,0x99,0x2a,0x55,0xd4,0xab,0xcd,0xb2,0x33,0x4c,
-        0x4e,0x31,0xb0,0xcf,0xa9,0xd6,0x57,0x28,0x9b,0xe4,0x65,0x1a,0x7c,0x03,0x82,0xfd,
-        0x86,0xf9,0x78,0x07,0x61,0x1e,0x9f,0xe0,0x53,0x2c,0xad,0xd2,0xb4,0xcb,0x4a,0x35,
-        0x37,0x48,0xc9,0xb6,0xd0,0xaf,0x2e,0x51,0xe2,0x9d,0x1c,0x63,0x05,0x7a,0xfb,0x84,
-        0x0d,0x72,0xf3,0x8c,0xea,0x95,0x14,0x6b,0xd8,0xa7,0x26,0x59,0x3f,0x40,0xc1,0xbe,
-        0xbc,0xc3,0x42,0x3d,0x5b,0x24,0xa5,0xda,0x69,0x16,0x97,0xe8,0x8e,0xf1,0x70,0x0f,
-        0x74,0x0b,0x8a,0xf5,0x93,0xec,0x6d,0x12,0xa1,0xde,0x5f,0x20,0x46,0x39,0xb8,0xc7,
-        0xc5,0xba,0x3b,0x44,0x22,0x5d,0xdc,0xa3,0x10,0x6f,0xee,0x91,0xf7,0x88,0x09,0x76,
-    ),
-    ( # 128
-        0x00,0x80,0x1b,0x9b,0x36,0xb6,0x2d,0xad,0x6c,0xec,0x77,0xf7,0x5a,0xda,0x41,0xc1,
-        0xd8,0x58,0xc3,0x43,0xee,0x6e,0xf5,0x75,0xb4,0x34,0xaf,0x2f,0x82,0x02,0x99,0x19,
-        0xab,0x2b,0xb0,0x30,0x9d,0x1d,0x86,0x06,0xc7,0x47,0xdc,0x5c,0xf1,0x71,0xea,0x6a,
-        0x73,0xf3,0x68,0xe8,0x45,0xc5,0x5e,0xde,0x1f,0x9f,0x04,0x84,0x29,0xa9,0x32,0xb2,
-        0x4d,0xcd,0x56,0xd6,0x7b,0xfb,0x60,0xe0,0x21,0xa1,0x3a,0xba,0x17,0x97,0x0c,0x8c,
-        0x95,0x15,0x8e,0x0e,0xa3,0x23,0xb8,0x38,0xf9,0x79,0xe2,0x62,0xcf,0x4f,0xd4,0x54,
-        0xe6,0x66,0xfd,0x7d,0xd0,0x50,0xcb,0x4b,0x8a,0x0a,0x91,0x11,0xbc,0x3c,0xa7,0x27,
-        0x3e,0xbe,0x25,0xa5,0x08,0x88,0x13,0x93,0x52,0xd2,0x49,0xc9,0x64,0xe4,0x7f,0xff,
-        0x9a,0x1a,0x81,0x01,0xac,0x2c,0xb7,0x37,0xf6,0x76,0xed,0x6d,0xc0,0x40,0xdb,0x5b,
-        0x42,0xc2,0x59,0xd9,0x74,0xf4,0x6f,0xef,0x2e,0xae,0x35,0xb5,0x18,0x98,0x03,0x83,
-        0x31,0xb1,0x2a,0xaa,0x07,0x87,0x1c,0x9c,0x5d,0xdd,0x46,0xc6,0x6b,0xeb,0x70,0xf0,
-        0xe9,0x69,0xf2,0x72,0xdf,0x5f,0xc4,0x44,0x85,0x05,0x9e,0x1e,0xb3,0x33,0xa8,0x28,
-        0xd7,0x57,0xcc,0x4c,0xe1,0x61,0xfa,0x7a,0xbb,0x3b,0xa0,0x20,0x8d,0x0d,0x96,0x16,
-        0x0f,0x8f,0x14,0x94,0x39,0xb9,0x22,0xa2,0x63,0xe3,0x78,0xf8,0x55,0xd5,0x4e,0xce,
-        0x7c,0xfc,0x67,0xe7,0x4a,0xca,0x51,0xd1,0x10,0x90,0x0b,0x8b,0x26,0xa6,0x3d,0xbd,
-        0xa4,0x24,0xbf,0x3f,0x92,0x12,0x89,0x09,0xc8,0x48,0xd3,0x53,0xfe,0x7e,0xe5,0x65,
-    ),
-    ( # 129
-        0x00,0x81,0x19,0x98,0x32,0xb3,0x2b,0xaa,0x64,0xe5,0x7d,0xfc,0x56,0xd7,0x4f,0xce,
-        0xc8,0x49,0xd1,0x50,0xfa,0x7b,0xe3,0x62,0xac,0x2d,0xb5,0x34,0x9e,0x1f,0x87,0x06,
-        0x8b,0x0a,0x92,0x13,0xb9,0x38,0xa0,0x21,0xef,0x6e,0xf6,0x77,0xdd,0x5c,0xc4,0x45,
-        0x43,0xc2,0x5a,0xdb,0x71,0xf0,0x68,0xe9,0x27,0xa6,0x3e,0xbf,0x15,0x94,0x0c,0x8d,
-        0x0d,0x8c,0x14,0x95,0x3f,0xbe,0x26,0xa7,0x69,0xe8,0x70,0xf1,0x5b,0xda,0x42,0xc3,
-        0xc5,0x44,0xdc,0x5d,0xf7,0x76,0xee,0x6f,0xa1,0x20,0xb8,0x39,0x93,0x12,0x8a,0x0b,
-        0x86,0x07,0x9f,0x1e,0xb4,0x35,0xad,0x2c,0xe2,0x63,0xfb,0x7a,0xd0,0x51,0xc9,0x48,
-        0x4e,0xcf,0x57,0xd6,0x7c,0xfd,0x65,0xe4,0x2a,0xab,0x33,0xb2,0x18,0x99,0x01,0x80,
-        0x1a,0x9b,0x03,0x82,0x28,0xa9,0x31,0xb0,0x7e,0xff,0x67,0xe6,0x4c,0xcd,0x55,0xd4,
-        0xd2,0x53,0xcb,0x4a,0xe0,0x61,0xf9,0x78,0xb6,0x37,0xaf,0x2e,0x84,0x05,0x9d,0x1c,
-        0x91,0x10,0x88,0x09,0xa3,0x22,0xba,0x3b,0xf5,0x74,0xec,0x6d,0xc7,0x46,0xde,0x5f,
-        0x59,0xd8,0x40,0xc1,0x6b,0xea,0x72,0xf3,0x3d,0xbc,0x24,0xa5,0x0f,0x8e,0x16,0x97,
-        0x17,0x96,0x0e,0x8f,0x25,0xa4,0x3c,0xbd,0x73,0xf2,0x6a,0xeb,0x41,0xc0,0x58,0xd9,
-        0xdf,0x5e,0xc6,0x47,0xed,0x6c,0xf4,0x75,0xbb,0x3a,0xa2,0x23,0x89,0x08,0x90,0x11,
-        0x9c,0x1d,0x85,0x04,0xae,0x2f,0xb7,0x36,0xf8,0x79,0xe1,0x60,0xca,0x4b,0xd3,0x52,
-        0x54,0xd5,0x4d,0xcc,0x66,0xe7,0x7f,0xfe,0x30,0xb1,0x29,0xa8,0x02,0x83,0x1b,0x9a,
-    ),
-    ( # 130
-        0x00,0x82,0x1f,0x9d,0x3e,0xbc,0x21,0xa3,0x7c,0xfe,0x63,0xe1,0x42,0xc0,0x5d,0xdf,
-        0xf8,0x7a,0xe7,0x65,0xc6,0x44,0xd9,0x5b,0x84,0x06,0x9b,0x19,0xba,0x38,0xa5,0x27,
-        0xeb,0x69,0xf4,0x76,0xd5,0x57,0xca,0x48,0x97,0x15,0x88,0x0a,0xa9,0x2b,0xb6,0x34,
-        0x13,0x91,0x0c,0x8e,0x2d,0xaf,0x32,0xb0,0x6f,0xed,0x70,0xf2,0x51,0xd3,0x4e,0xcc,
-        0xcd,0x4f,0xd2,0x50,0xf3,0x71,0xec,0x6e,0xb1,0x33,0xae,0x2c,0x8f,0x0d,0x90,0x12,
-        0x35,0xb7,0x2a,0xa8,0x0b,0x89,0x14,0x96,0x49,0xcb,0x56,0xd4,0x77,0xf5,0x68,0xea,
-        0x26,0xa4,0x39,0xbb,0x18,0x9a,0x07,0x85,0x5a,0xd8,0x45,0xc7,0x64,0xe6,0x7b,0xf9,
-        0xde,0x5c,0xc1,0x43,0xe0,0x62,0xff,0x7d,0xa2,0x20,0xbd,0x3f,0x9c,0x1e,0x83,0x01,
-        0x81,0x03,0x9e,0x1c,0xbf,0x3d,0xa0,0x22,0xfd,0x7f,0xe2,0x60,0xc3,0x41,0xdc,0x5e,
-        0x79,0xfb,0x66,0xe4,0x47,0xc5,0x58,0xda,0x05,0x87,0x1a,0x98,0x3b,0xb9,0x24,0xa6,
-        0x6a,0xe8,0x75,0xf7,0x54,0xd6,0x4b,0xc9,0x16,0x94,0x09,0x8b,0x28,0xaa,0x37,0xb5,
-        0x92,0x10,0x8d,0x0f,0xac,0x2e,0xb3,0x31,0xee,0x6c,0xf1,0x73,0xd0,0x52,0xcf,0x4d,
-        0x4c,0xce,0x53,0xd1,0x72,0xf0,0x6d,0xef,0x30,0xb2,0x2f,0xad,0x0e,0x8c,0x11,0x93,
-        0xb4,0x36,0xab,0x29,0x8a,0x08,0x95,0x17,0xc8,0x4a,0xd7,0x55,0xf6,0x74,0xe9,0x6b,
-        0xa7,0x25,0xb8,0x3a,0x99,0x1b,0x86,0x04,0xdb,0x59,0xc4,0x46,0xe5,0x67,0xfa,0x78,
-        0x5f,0xdd,0x40,0xc2,0x61,0xe3,0x7e,0xfc,0x23,0xa1,0x3c,0xbe,0x1d,0x9f,0x02,0x80,
-    ),
-    ( # 131
-        0x00,0x83,0x1d,0x9e,0x3a,0xb9,0x27,0xa4,0x74,0xf7,0x69,0xea,0x4e,0xcd,0x53,0xd0,
-        0xe8,0x6b,0xf5,0x76,0xd2,0x51,0xcf,0x4c,0x9c,0x1f,0x81,0x02,0xa6,0x25,0xbb,0x38,
-        0xcb,0x48,0xd6,0x55,0xf1,0x72,0xec,0x6f,0xbf,0x3c,0xa2,0x21,0x85,0x06,0x98,0x1b,
-        0x23,0xa0,0x3e,0xbd,0x19,0x9a,0x04,0x87,0x57,0xd4,0x4a,0xc9,0x6d,0xee,0x70,0xf3,
-        0x8d,0x0e,0x90,0x13,0xb7,0x34,0xaa,0x29,0xf9,0x7a,0xe4,0x67,0xc3,0x40,0xde,0x5d,
-        0x65,0xe6,0x78,0xfb,0x5f,0xdc,0x42,0xc1,0x11,0x92,0x0c,0x8f,0x2b,0xa8,0x36,0xb5,
-        0x46,0xc5,0x5b,0xd8,0x7c,0xff,0x61,0xe2,0x32,0xb1,0x2f,0xac,0x08,0x8b,0x15,0x96,
-        0xae,0x2d,0xb3,0x30,0x94,0x17,0x89,0x0a,0xda,0x59,0xc7,0x44,0xe0,0x63,0xfd,0x7e,
-        0x01,0x82,0x1c,0x9f,0x3b,0xb8,0x26,0xa5,0x75,0xf6,0x68,0xeb,0x4f,0xcc,0x52,0xd1,
-        0xe9,0x6a,0xf4,0x77,0xd3,0x50,0xce,0x4d,0x9d,0x1e,0x80,0x03,0xa7,0x24,0xba,0x39,
-        0xca,0x49,0xd7,0x54,0xf0,0x73,0xed,0x6e,0xbe,0x3d,0xa3,0x20,0x84,0x07,0x99,0x1a,
-        0x22,0xa1,0x3f,0xbc,0x18,0x9b,0x05,0x86,0x56,0xd5,0x4b,0xc8,0x6c,0xef,0x71,0xf2,
-        0x8c,0x0f,0x91,0x12,0xb6,0x35,0xab,0x28,0xf8,0x7b,0xe5,0x66,0xc2,0x41,0xdf,0x5c,
-        0x64,0xe7,0x79,0xfa,0x5e,0xdd,0x43,0xc0,0x10,0x93,0x0d,0x8e,0x2a,0xa9,0x37,0xb4,
-        0x47,0xc4,0x5a,0xd9,0x7d,0xfe,0x60,0xe3,0x33,0xb0,0x2e,0xad,0x09,0x8a,0x14,0x97,
-        0xaf,0x2c,0xb2,0x31,0x95,0x16,0x88,0x0b,0xdb,0x58,0xc6,0x45,0xe1,0x62,0xfc,0x7f,
-    ),
-    ( # 132
-        0x00,0x84,0x13,0x97,0x26,0xa2,0x35,0xb1,0x4c,0xc8,0x5f,0xdb,0x6a,0xee,0x79,0xfd,
-        0x98,0x1c,0x8b,0x0f,0xbe,0x3a,0xad,0x29,0xd4,0x50,0xc7,0x43,0xf2,0x76,0xe1,0x65,
-        0x2b,0xaf,0x38,0xbc,0x0d,0x89,0x1e,0x9a,0x67,0xe3,0x74,0xf0,0x41,0xc5,0x52,0xd6,
-        0xb3,0x37,0xa0,0x24,0x95,0x11,0x86,0x02,0xff,0x7b,0xec,0x68,0xd9,0x5d,0xca,0x4e,
-        0x56,0xd2,0x45,0xc1,0x70,0xf4,0x63,0xe7,0x1a,0x9e,0x09,0x8d,0x3c,0xb8,0x2f,0xab,
-        0xce,0x4a,0xdd,0x59,0xe8,0x6c,0xfb,0x7f,0x82,0x06,0x91,0x15,0xa4,0x20,0xb7,0x33,
-        0x7d,0xf9,0x6e,0xea,0x5b,0xdf,0x48,0xcc,0x31,0xb5,0x22,0xa6,0x17,0x93,0x04,0x80,
-        0xe5,0x61,0xf6,0x72,0xc3,0x47,0xd0,0x54,0xa9,0x2d,0xba,0x3e,0x8f,0x0b,0x9c,0x18,
-        0xac,0x28,0xbf,0x3b,0x8a,0x0e,0x99,0x1d,0xe0,0x64,0xf3,0x77,0xc6,0x42,0xd5,0x51,
-        0x34,0xb0,0x27,0xa3,0x12,0x96,0x01,0x85,0x78,0xfc,0x6b,0xef,0x5e,0xda,0x4d,0xc9,
-        0x87,0x03,0x94,0x10,0xa1,0x25,0xb2,0x36,0xcb,0x4f,0xd8,0x5c,0xed,0x69,0xfe,0x7a,
-        0x1f,0x9b,0x0c,0x88,0x39,0xbd,0x2a,0xae,0x53,0xd7,0x40,0xc4,0x75,0xf1,0x66,0xe2,
-        0xfa,0x7e,0xe9,0x6d,0xdc,0x58,0xcf,0x4b,0xb6,0x32,0xa5,0x21,0x90,0x14,0x83,0x07,
-        0x62,0xe6,0x71,0xf5,0x44,0xc0,0x57,0xd3,0x2e,0xaa,0x3d,0xb9,0x08,0x8c,0x1b,0x9f,
-        0xd1,0x55,0xc2,0x46,0xf7,0x73,0xe4,0x60,0x9d,0x19,0x8e,0x0a,0xbb,0x3f,0xa8,0x2c,
-        0x49,0xcd,0x5a,0xde,0x6f,0xeb,0x7c,0xf8,0x05,0x81,0x16,0x92,0x23,0xa7,0x30,0xb4,
-    ),
-    ( # 133
-        0x00,0x85,0x11,0x94,0x22,0xa7,0x33,0xb6,0x44,0xc1,0x55,0xd0,0x66,0xe3,0x77,0xf2,
-        0x88,0x0d,0x99,0x1c,0xaa,0x2f,0xbb,0x3e,0xcc,0x49,0xdd,0x58,0xee,0x6b,0xff,0x7a,
-        0x0b,0x8e,0x1a,0x9f,0x29,0xac,0x38,0xbd,0x4f,0xca,0x5e,0xdb,0x6d,0xe8,0x7c,0xf9,
-        0x83,0x06,0x92,0x17,0xa1,0x24,0xb0,0x35,0xc7,0x42,0xd6,0x53,0xe5,0x60,0xf4,0x71,
-        0x16,0x93,0x07,0x82,0x34,0xb1,0x25,0xa0,0x52,0xd7,0x43,0xc6,0x70,0xf5,0x61,0xe4,
-        0x9e,0x1b,0x8f,0x0a,0xbc,0x39,0xad,0x28,0xda,0x5f,0xcb,0x4e,0xf8,0x7d,0xe9,0x6c,
-        0x1d,0x98,0x0c,0x89,0x3f,0xba,0x2e,0xab,0x59,0xdc,0x48,0xcd,0x7b,0xfe,0x6a,0xef,
-        0x95,0x10,0x84,0x01,0xb7,0x32,0xa6,0x23,0xd1,0x54,0xc0,0x45,0xf3,0x76,0xe2,0x67,
-        0x2c,0xa9,0x3d,0xb8,0x0e,0x8b,0x1f,0x9a,0x68,0xed,0x79,0xfc,0x4a,0xcf,0x5b,0xde,
-        0xa4,0x21,0xb5,0x30,0x86,0x03,0x97,0x12,0xe0,0x65,0xf1,0x74,0xc2,0x47,0xd3,0x56,
-        0x27,0xa2,0x36,0xb3,0x05,0x80,0x14,0x91,0x63,0xe6,0x72,0xf7,0x41,0xc4,0x50,0xd5,
-        0xaf,0x2a,0xbe,0x3b,0x8d,0x08,0x9c,0x19,0xeb,0x6e,0xfa,0x7f,0xc9,0x4c,0xd8,0x5d,
-        0x3a,0xbf,0x2b,0xae,0x18,0x9d,0x09,0x8c,0x7e,0xfb,0x6f,0xea,0x5c,0xd9,0x4d,0xc8,
-        0xb2,0x37,0xa3,0x26,0x90,0x15,0x81,0x04,0xf6,0x73,0xe7,0x62,0xd4,0x51,0xc5,0x40,
-        0x31,0xb4,0x20,0xa5,0x13,0x96,0x02,0x87,0x75,0xf0,0x64,0xe1,0x57,0xd2,0x46,0xc3,
-        0xb9,0x3c,0xa8,0x2d,0x9b,0x1e,0x8a,0x0f,0xfd,0x78,0xec,0x69,0xdf,0x5a,0xce,0x4b,
-    ),
-    ( # 134
-        0x00,0x86,0x17,0x91,0x2e,0xa8,0x39,0xbf,0x5c,0xda,0x4b,0xcd,0x72,0xf4,0x65,0xe3,
-        0xb8,0x3e,0xaf,0x29,0x96,0x10,0x81,0x07,0xe4,0x62,0xf3,0x75,0xca,0x4c,0xdd,0x5b,
-        0x6b,0xed,0x7c,0xfa,0x45,0xc3,0x52,0xd4,0x37,0xb1,0x20,0xa6,0x19,0x9f,0x0e,0x88,
-        0xd3,0x55,0xc4,0x42,0xfd,0x7b,0xea,0x6c,0x8f,0x09,0x98,0x1e,0xa1,0x27,0xb6,0x30,
-        0xd6,0x50,0xc1,0x47,0xf8,0x7e,0xef,0x69,0x8a,0x0c,0x9d,0x1b,0xa4,0x22,0xb3,0x35,
-        0x6e,0xe8,0x79,0xff,0x40,0xc6,0x57,0xd1,0x32,0xb4,0x25,0xa3,0x1c,0x9a,0x0b,0x8d,
-        0xbd,0x3b,0xaa,0x2c,0x93,0x15,0x84,0x02,0xe1,0x67,0xf6,0x70,0xcf,0x49,0xd8,0x5e,
-        0x05,0x83,0x12,0x94,0x2b,0xad,0x3c,0xba,0x59,0xdf,0x4e,0xc8,0x77,0xf1,0x60,0xe6,
-        0xb7,0x31,0xa0,0x26,0x99,0x1f,0x8e,0x08,0xeb,0x6d,0xfc,0x7a,0xc5,0x43,0xd2,0x54,
-        0x0f,0x89,0x18,0x9e,0x21,0xa7,0x36,0xb0,0x53,0xd5,0x44,0xc2,0x7d,0xfb,0x6a,0xec,
-        0xdc,0x5a,0xcb,0x4d,0xf2,0x74,0xe5,0x63,0x80,0x06,0x97,0x11,0xae,0x28,0xb9,0x3f,
-        0x64,0xe2,0x73,0xf5,0x4a,0xcc,0x5d,0xdb,0x38,0xbe,0x2f,0xa9,0x16,0x90,0x01,0x87,
-        0x61,0xe7,0x76,0xf0,0x4f,0xc9,0x58,0xde,0x3d,0xbb,0x2a,0xac,0x13,0x95,0x04,0x82,
-        0xd9,0x5f,0xce,0x48,0xf7,0x71,0xe0,0x66,0x85,0x03,0x92,0x14,0xab,0x2d,0xbc,0x3a,
-        0x0a,0x8c,0x1d,0x9b,0x24,0xa2,0x33,0xb5,0x56,0xd0,0x41,0xc7,0x78,0xfe,0x6f,0xe9,
-        0xb2,0x34,0xa5,0x23,0x9c,0x1a,0x8b,0x0d,0xee,0x68,0xf9,0x7f,0xc0,0x46,0xd7,0x51,
-    ),
-    ( # 135
-        0x00,0x87,0x15,0x92,0x2a,0xad,0x3f,0xb8,0x54,0xd3,0x41,0xc6,0x7e,0xf9,0x6b,0xec,
-        0xa8,0x2f,0xbd,0x3a,0x82,0x05,0x97,0x10,0xfc,0x7b,0xe9,0x6e,0xd6,0x51,0xc3,0x44,
-        0x4b,0xcc,0x5e,0xd9,0x61,0xe6,0x74,0xf3,0x1f,0x98,0x0a,0x8d,0x35,0xb2,0x20,0xa7,
-        0xe3,0x64,0xf6,0x71,0xc9,0x4e,0xdc,0x5b,0xb7,0x30,0xa2,0x25,0x9d,0x1a,0x88,0x0f,
-        0x96,0x11,0x83,0x04,0xbc,0x3b,0xa9,0x2e,0xc2,0x45,0xd7,0x50,0xe8,0x6f,0xfd,0x7a,
-        0x3e,0xb9,0x2b,0xac,0x14,0x93,0x01,0x86,0x6a,0xed,0x7f,0xf8,0x40,0xc7,0x55,0xd2,
-        0xdd,0x5a,0xc8,0x4f,0xf7,0x70,0xe2,0x65,0x89,0x0e,0x9c,0x1b,0xa3,0x24,0xb6,0x31,
-        0x75,0xf2,0x60,0xe7,0x5f,0xd8,0x4a,0xcd,0x21,0xa6,0x34,0xb3,0x0b,0x8c,0x1e,0x99,
-        0x37,0xb0,0x22,0xa5,0x1d,0x9a,0x08,0x8f,0x63,0xe4,0x76,0xf1,0x49,0xce,0x5c,0xdb,
-        0x9f,0x18,0x8a,0x0d,0xb5,0x32,0xa0,0x27,0xcb,0x4c,0xde,0x59,0xe1,0x66,0xf4,0x73,
-        0x7c,0xfb,0x69,0xee,0x56,0xd1,0x43,0xc4,0x28,0xaf,0x3d,0xba,0x02,0x85,0x17,0x90,
-        0xd4,0x53,0xc1,0x46,0xfe,0x79,0xeb,0x6c,0x80,0x07,0x95,0x12,0xaa,0x2d,0xbf,0x38,
-        0xa1,0x26,0xb4,0x33,0x8b,0x0c,0x9e,0x19,0xf5,0x72,0xe0,0x67,0xdf,0x58,0xca,0x4d,
-        0x09,0x8e,0x1c,0x9b,0x23,0xa4,0x36,0xb1,0x5d,0xda,0x48,0xcf,0x77,0xf0,0x62,0xe5,
-        0xea,0x6d,0xff,0x78,0xc0,0x47,0xd5,0x52,0xbe,0x39,0xab,0x2c,0x94,0x13,0x81,0x06,
-        0x42,0xc5,0x57,0xd0,0x68,0xef,0x7d,0xfa,0x16,0x91,0x03,0x84,0x3c,0xbb,0x29,0xae,
-    ),
-    ( # 136
-        0x00,0x88,0x0b,0x83,0x16,0x9e,0x1d,0x95,0x2c,0xa4,0x27,0xaf,0x3a,0xb2,0x31,0xb9,
-        0x58,0xd0,0x53,0xdb,0x4e,0xc6,0x45,0xcd,0x74,0xfc,0x7f,0xf7,0x62,0xea,0x69,0xe1,
-        0xb0,0x38,0xbb,0x33,0xa6,0x2e,0xad,0x25,0x9c,0x14,0x97,0x1f,0x8a,0x02,0x81,0x09,
-        0xe8,0x60,0xe3,0x6b,0xfe,0x76,0xf5,0x7d,0xc4,0x4c,0xcf,0x47,0xd2,0x5a,0xd9,0x51,
-        0x7b,0xf3,0x70,0xf8,0x6d,0xe5,0x66,0xee,0x57,0xdf,0x5c,0xd4,0x41,0xc9,0x4a,0xc2,
-        0x23,0xab,0x28,0xa0,0x35,0xbd,0x3e,0xb6,0x0f,0x87,0x04,0x8c,0x19,0x91,0x12,0x9a,
-        0xcb,0x43,0xc0,0x48,0xdd,0x55,0xd6,0x5e,0xe7,0x6f,0xec,0x64,0xf1,0x79,0xfa,0x72,
-        0x93,0x1b,0x98,0x10,0x85,0x0d,0x8e,0x06,0xbf,0x37,0xb4,0x3c,0xa9,0x21,0xa2,0x2a,
-        0xf6,0x7e,0xfd,0x75,0xe0,0x68,0xeb,0x63,0xda,0x52,0xd1,0x59,0xcc,0x44,0xc7,0x4f,
-        0xae,0x26,0xa5,0x2d,0xb8,0x30,0xb3,0x3b,0x82,0x0a,0x89,0x01,0x94,0x1c,0x9f,0x17,
-        0x46,0xce,0x4d,0xc5,0x50,0xd8,0x5b,0xd3,0x6a,0xe2,0x61,0xe9,0x7c,0xf4,0x77,0xff,
-        0x1e,0x96,0x15,0x9d,0x08,0x80,0x03,0x8b,0x32,0xba,0x39,0xb1,0x24,0xac,0x2f,0xa7,
-        0x8d,0x05,0x86,0x0e,0x9b,0x13,0x90,0x18,0xa1,0x29,0xaa,0x22,0xb7,0x3f,0xbc,0x34,
-        0xd5,0x5d,0xde,0x56,0xc3,0x4b,0xc8,0x40,0xf9,0x71,0xf2,0x7a,0xef,0x67,0xe4,0x6c,
-        0x3d,0xb5,0x36,0xbe,0x2b,0xa3,0x20,0xa8,0x11,0x99,0x1a,0x92,0x07,0x8f,0x0c,0x84,
-        0x65,0xed,0x6e,0xe6,0x73,0xfb,0x78,0xf0,0x49,0xc1,0x42,0xca,0x5f,0xd7,0x54,0xdc,
-    ),
-    ( # 137
-        0x00,0x89,0x09,0x80,0x12,0x9b,0x1b,0x92,0x24,0xad,0x2d,0xa4,0x36,0xbf,0x3f,0xb6,
-        0x48,0xc1,0x41,0xc8,0x5a,0xd3,0x53,0xda,0x6c,0xe5,0x65,0xec,0x7e,0xf7,0x77,0xfe,
-        0x90,0x19,0x99,0x10,0x82,0x0b,0x8b,0x02,0xb4,0x3d,0xbd,0x34,0xa6,0x2f,0xaf,0x26,
-        0xd8,0x51,0xd1,0x58,0xca,0x43,0xc3,0x4a,0xfc,0x75,0xf5,0x7c,0xee,0x67,0xe7,0x6e,
-        0x3b,0xb2,0x32,0xbb,0x29,0xa0,0x20,0xa9,0x1f,0x96,0x16,0x9f,0x0d,0x84,0x04,0x8d,
-        0x73,0xfa,0x7a,0xf3,0x61,0xe8,0x68,0xe1,0x57,0xde,0x5e,0xd7,0x45,0xcc,0x4c,0xc5,
-        0xab,0x22,0xa2,0x2b,0xb9,0x30,0xb0,0x39,0x8f,0x06,0x86,0x0f,0x9d,0x14,0x94,0x1d,
-        0xe3,0x6a,0xea,0x63,0xf1,0x78,0xf8,0x71,0xc7,0x4e,0xce,0x47,0xd5,0x5c,0xdc,0x55,
-        0x76,0xff,0x7f,0xf6,0x64,0xed,0x6d,0xe4,0x52,0xdb,0x5b,0xd2,0x40,0xc9,0x49,0xc0,
-        0x3e,0xb7,0x37,0xbe,0x2c,0xa5,0x25,0xac,0x1a,0x93,0x13,0x9a,0x08,0x81,0x01,0x88,
-        0xe6,0x6f,0xef,0x66,0xf4,0x7d,0xfd,0x74,0xc2,0x4b,0xcb,0x42,0xd0,0x59,0xd9,0x50,
-        0xae,0x27,0xa7,0x2e,0xbc,0x35,0xb5,0x3c,0x8a,0x03,0x83,0x0a,0x98,0x11,0x91,0x18,
-        0x4d,0xc4,0x44,0xcd,0x5f,0xd6,0x56,0xdf,0x69,0xe0,0x60,0xe9,0x7b,0xf2,0x72,0xfb,
-        0x05,0x8c,0x0c,0x85,0x17,0x9e,0x1e,0x97,0x21,0xa8,0x28,0xa1,0x33,0xba,0x3a,0xb3,
-        0xdd,0x54,0xd4,0x5d,0xcf,0x46,0xc6,0x4f,0xf9,0x70,0xf0,0x79,0xeb,0x62,0xe2,0x6b,
-        0x95,0x1c,0x9c,0x15,0x87,0x0e,0x8e,0x07,0xb1,0x38,0xb8,0x31,0xa3,0x2a,0xaa,0x23,
-    ),
-    ( # 138
-        0x00,0x8a,0x0f,0x85,0x1e,0x94,0x11,0x9b,0x3c,0xb6,0x33,0xb9,0x22,0xa8,0x2d,0xa7,
-        0x78,0xf2,0x77,0xfd,0x66,0xec,0x69,0xe3,0x44,0xce,0x4b,0xc1,0x5a,0xd0,0x55,0xdf,
-        0xf0,0x7a,0xff,0x75,0xee,0x64,0xe1,0x6b,0xcc,0x46,0xc3,0x49,0xd2,0x58,0xdd,0x57,
-        0x88,0x02,0x87,0x0d,0x96,0x1c,0x99,0x13,0xb4,0x3e,0xbb,0x31,0xaa,0x20,0xa5,0x2f,
-        0xfb,0x71,0xf4,0x7e,0xe5,0x6f,0xea,0x60,0xc7,0x4d,0xc8,0x42,0xd9,0x53,0xd6,0x5c,
-        0x83,0x09,0x8c,0x06,0x9d,0x17,0x92,0x18,0xbf,0x35,0xb0,0x3a,0xa1,0x2b,0xae,0x24,
-        0x0b,0x81,0x04,0x8e,0x15,0x9f,0x1a,0x90,0x37,0xbd,0x38,0xb2,0x29,0xa3,0x26,0xac,
-        0x73,0xf9,0x7c,0xf6,0x6d,0xe7,0x62,0xe8,0x4f,0xc5,0x40,0xca,0x51,0xdb,0x5e,0xd4,
-        0xed,0x67,0xe2,0x68,0xf3,0x79,0xfc,0x76,0xd1,0x5b,0xde,0x54,0xcf,0x45,0xc0,0x4a,
-        0x95,0x1f,0x9a,0x10,0x8b,0x01,0x84,0x0e,0xa9,0x23,0xa6,0x2c,0xb7,0x3d,0xb8,0x32,
-        0x1d,0x97,0x12,0x98,0x03,0x89,0x0c,0x86,0x21,0xab,0x2e,0xa4,0x3f,0xb5,0x30,0xba,
-        0x65,0xef,0x6a,0xe0,0x7b,0xf1,0x74,0xfe,0x59,0xd3,0x56,0xdc,0x47,0xcd,0x48,0xc2,
-        0x16,0x9c,0x19,0x93,0x08,0x82,0x07,0x8d,0x2a,0xa0,0x25,0xaf,0x34,0xbe,0x3b,0xb1,
-        0x6e,0xe4,0x61,0xeb,0x70,0xfa,0x7f,0xf5,0x52,0xd8,0x5d,0xd7,0x4c,0xc6,0x43,0xc9,
-        0xe6,0x6c,0xe9,0x63,0xf8,0x72,0xf7,0x7d,0xda,0x50,0xd5,0x5f,0xc4,0x4e,0xcb,0x41,
-        0x9e,0x14,0x91,0x1b,0x80,0x0a,0x8f,0x05,0xa2,0x28,0xad,0x27,0xbc,0x36,0xb3,0x39,
-    ),
-    ( # 139
-        0x00,0x8b,0x0d,0x86,0x1a,0x91,0x17,0x9c,0x34,0xbf,0x39,0xb2,0x2e,0xa5,0x23,0xa8,
-        0x68,0xe3,0x65,0xee,0x72,0xf9,0x7f,0xf4,0x5c,0xd7,0x51,0xda,0x46,0xcd,0x4b,0xc0,
-        0xd0,0x5b,0xdd,0x56,0xca,0x41,0xc7,0x4c,0xe4,0x6f,0xe9,0x62,0xfe,0x75,0xf3,0x78,
-        0xb8,0x33,0xb5,0x3e,0xa2,0x29,0xaf,0x24,0x8c,0x07,0x81,0x0a,0x96,0x1d,0x9b,0x10,
-        0xbb,0x30,0xb6,0x3d,0xa1,0x2a,0xac,0x27,0x8f,0x04,0x82,0x09,0x95,0x1e,0x98,0x13,
-        0xd3,0x58,0xde,0x55,0xc9,0x42,0xc4,0x4f,0xe7,0x6c,0xea,0x61,0xfd,0x76,0xf0,0x7b,
-        0x6b,0xe0,0x66,0xed,0x71,0xfa,0x7c,0xf7,0x5f,0xd4,0x52,0xd9,0x45,0xce,0x48,0xc3,
-        0x03,0x88,0x0e,0x85,0x19,0x92,0x14,0x9f,0x37,0xbc,0x3a,0xb1,0x2d,0xa6,0x20,0xab,
-        0x6d,0xe6,0x60,0xeb,0x77,0xfc,0x7a,0xf1,0x59,0xd2,0x54,0xdf,0x43,0xc8,0x4e,0xc5,
-        0x05,0x8e,0x08,0x83,0x1f,0x94,0x12,0x99,0x31,0xba,0x3c,0xb7,0x2b,0xa0,0x26,0xad,
-        0xbd,0x36,0xb0,0x3b,0xa7,0x2c,0xaa,0x21,0x89,0x02,0x84,0x0f,0x93,0x18,0x9e,0x15,
-        0xd5,0x5e,0xd8,0x53,0xcf,0x44,0xc2,0x49,0xe1,0x6a,0xec,0x67,0xfb,0x70,0xf6,0x7d,
-        0xd6,0x5d,0xdb,0x50,0xcc,0x47,0xc1,0x4a,0xe2,0x69,0xef,0x64,0xf8,0x73,0xf5,0x7e,
-        0xbe,0x35,0xb3,0x38,0xa4,0x2f,0xa9,0x22,0x8a,0x01,0x87,0x0c,0x90,0x1b,0x9d,0x16,
-        0x06,0x8d,0x0b,0x80,0x1c,0x97,0x11,0x9a,0x32,0xb9,0x3f,0xb4,0x28,0xa3,0x25,0xae,
-        0x6e,0xe5,0x63,0xe8,0x74,0xff,0x79,0xf2,0x5a,0xd1,0x57,0xdc,0x40,0xcb,0x4d,0xc6,
-    ),
-    ( # 140
-        0x00,0x8c,0x03,0x8f,0x06,0x8a,0x05,0x89,0x0c,0x80,0x0f,0x83,0x0a,0x86,0x09,0x85,
-        0x18,0x94,0x1b,0x97,0x1e,0x92,0x1d,0x91,0x14,0x98,0x17,0x9b,0x12,0x9e,0x11,0x9d,
-        0x30,0xbc,0x33,0xbf,0x36,0xba,0x35,0xb9,0x3c,0xb0,0x3f,0xb3,0x3a,0xb6,0x39,0xb5,
-        0x28,0xa4,0x2b,0xa7,0x2e,0xa2,0x2d,0xa1,0x24,0xa8,0x27,0xab,0x22,0xae,0x21,0xad,
-        0x60,0xec,0x63,0xef,0x66,0xea,0x65,0xe9,0x6c,0xe0,0x6f,0xe3,0x6a,0xe6,0x69,0xe5,
-        0x78,0xf4,0x7b,0xf7,0x7e,0xf2,0x7d,0xf1,0x74,0xf8,0x77,0xfb,0x72,0xfe,0x71,0xfd,
-        0x50,0xdc,0x53,0xdf,0x56,0xda,0x55,0xd9,0x5c,0xd0,0x5f,0xd3,0x5a,0xd6,0x59,0xd5,
-        0x48,0xc4,0x4b,0xc7,0x4e,0xc2,0x4d,0xc1,0x44,0xc8,0x47,0xcb,0x42,0xce,0x41,0xcd,
-        0xc0,0x4c,0xc3,0x4f,0xc6,0x4a,0xc5,0x49,0xcc,0x40,0xcf,0x43,0xca,0x46,0xc9,0x45,
-        0xd8,0x54,0xdb,0x57,0xde,0x52,0xdd,0x51,0xd4,0x58,0xd7,0x5b,0xd2,0x5e,0xd1,0x5d,
-        0xf0,0x7c,0xf3,0x7f,0xf6,0x7a,0xf5,0x79,0xfc,0x70,0xff,0x73,0xfa,0x76,0xf9,0x75,
-        0xe8,0x64,0xeb,0x67,0xee,0x62,0xed,0x61,0xe4,0x68,0xe7,0x6b,0xe2,0x6e,0xe1,0x6d,
-        0xa0,0x2c,0xa3,0x2f,0xa6,0x2a,0xa5,0x29,0xac,0x20,0xaf,0x23,0xaa,0x26,0xa9,0x25,
-        0xb8,0x34,0xbb,0x37,0xbe,0x32,0xbd,0x31,0xb4,0x38,0xb7,0x3b,0xb2,0x3e,0xb1,0x3d,
-        0x90,0x1c,0x93,0x1f,0x96,0x1a,0x95,0x19,0x9c,0x10,0x9f,0x13,0x9a,0x16,0x99,0x15,
-        0x88,0x04,0x8b,0x07,0x8e,0x02,0x8d,0x01,0x84,0x08,0x87,0x0b,0x82,0x0e,0x81,0x0d,
-    ),
-    ( # 141
-        0x00,0x8d,0x01,0x8c,0x02,0x8f,0x03,0x8e,0x04,0x89,0x05,0x88,0x06,0x8b,0x07,0x8a,
-        0x08,0x85,0x09,0x84,0x0a,0x87,0x0b,0x86,0x0c,0x81,0x0d,0x80,0x0e,0x83,0x0f,0x82,
-        0x10,0x9d,0x11,0x9c,0x12,0x9f,0x13,0x9e,0x14,0x99,0x15,0x98,0x16,0x9b,0x17,0x9a,
-        0x18,0x95,0x19,0x94,0x1a,0x97,0x1b,0x96,0x1c,0x91,0x1d,0x90,0x1e,0x93,0x1f,0x92,
-        0x20,0xad,0x21,0xac,0x22,0xaf,0x23,0xae,0x24,0xa9,0x25,0xa8,0x26,0xab,0x27,0xaa,
-        0x28,0xa5,0x29,0xa4,0x2a,0xa7,0x2b,0xa6,0x2c,0xa1,0x2d,0xa0,0x2e,0xa3,0x2f,0xa2,
-        0x30,0xbd,0x31,0xbc,0x32,0xbf,0x33,0xbe,0x34,0xb9,0x35,0xb8,0x36,0xbb,0x37,0xba,
-        0x38,0xb5,0x39,0xb4,0x3a,0xb7,0x3b,0xb6,0x3c,0xb1,0x3d,0xb0,0x3e,0xb3,0x3f,0xb2,
-        0x40,0xcd,0x41,0xcc,0x42,0xcf,0x43,0xce,0x44,0xc9,0x45,0xc8,0x46,0xcb,0x47,0xca,
-        0x48,0xc5,0x49,0xc4,0x4a,0xc7,0x4b,0xc6,0x4c,0xc1,0x4d,0xc0,0x4e,0xc3,0x4f,0xc2,
-        0x50,0xdd,0x51,0xdc,0x52,0xdf,0x53,0xde,0x54,0xd9,0x55,0xd8,0x56,0xdb,0x57,0xda,
-        0x58,0xd5,0x59,0xd4,0x5a,0xd7,0x5b,0xd6,0x5c,0xd1,0x5d,0xd0,0x5e,0xd3,0x5f,0xd2,
-        0x60,0xed,0x61,0xec,0x62,0xef,0x63,0xee,0x64,0xe9,0x65,0xe8,0x66,0xeb,0x67,0xea,
-        0x68,0xe5,0x69,0xe4,0x6a,0xe7,0x6b,0xe6,0x6c,0xe1,0x6d,0xe0,0x6e,0xe3,0x6f,0xe2,
-        0x70,0xfd,0x71,0xfc,0x72,0xff,0x73,0xfe,0x74,0xf9,0x75,0xf8,0x76,0xfb,0x77,0xfa,
-        0x78,0xf5,0x79,0xf4,0x7a,0xf7,0x7b,0xf6,0x7c,0xf1,0x7d,0xf0,0x7e,0xf3,0x7f,0xf2,
-    ),
-    ( # 142
-        0x00,0x8e,0x07,0x89,0x0e,0x80,0x09,0x87,0x1c,0x92,0x1b,0x95,0x12,0x9c,0x15,0x9b,
-        0x38,0xb6,0x3f,0xb1,0x36,0xb8,0x31,0xbf,0x24,0xaa,0x23,0xad,0x2a,0xa4,0x2d,0xa3,
-        0x70,0xfe,0x77,0xf9,0x7e,0xf0,0x79,0xf7,0x6c,0xe2,0x6b,0xe5,0x62,0xec,0x65,0xeb,
-        0x48,0xc6,0x4f,0xc1,0x46,0xc8,0x41,0xcf,0x54,0xda,0x53,0xdd,0x5a,0xd4,0x5d,0xd3,
-        0xe0,0x6e,0xe7,0x69,0xee,0x60,0xe9,0x67,0xfc,0x72,0xfb,0x75,0xf2,0x7c,0xf5,0x7b,
-        0xd8,0x56,0xdf,0x51,0xd6,0x58,0xd1,0x5f,0xc4,0x4a,0xc3,0x4d,0xca,0x44,0xcd,0x43,
-        0x90,0x1e,0x97,0x19,0x9e,0x10,0x99,0x17,0x8c,0x02,0x8b,0x05,0x82,0x0c,0x85,0x0b,
-        0xa8,0x26,0xaf,0x21,0xa6,0x28,0xa1,0x2f,0xb4,0x3a,0xb3,0x3d,0xba,0x34,0xbd,0x33,
-        0xdb,0x55,0xdc,0x52,0xd5,0x5b,0xd2,0x5c,0xc7,0x49,0xc0,0x4e,0xc9,0x47,0xce,0x40,
-        0xe3,0x6d,0xe4,0x6a,0xed,0x63,0xea,0x64,0xff,0x71,0xf8,0x76,0xf1,0x7f,0xf6,0x78,
-        0xab,0x25,0xac,0x22,0xa5,0x2b,0xa2,0x2c,0xb7,0x39,0xb0,0x3e,0xb9,0x37,0xbe,0x30,
-        0x93,0x1d,0x94,0x1a,0x9d,0x13,0x9a,0x14,0x8f,0x01,0x88,0x06,0x81,0x0f,0x86,0x08,
-        0x3b,0xb5,0x3c,0xb2,0x35,0xbb,0x32,0xbc,0x27,0xa9,0x20,0xae,0x29,0xa7,0x2e,0xa0,
-        0x03,0x8d,0x04,0x8a,0x0d,0x83,0x0a,0x84,0x1f,0x91,0x18,0x96,0x11,0x9f,0x16,0x98,
-        0x4b,0xc5,0x4c,0xc2,0x45,0xcb,0x42,0xcc,0x57,0xd9,0x50,0xde,0x59,0xd7,0x5e,0xd0,
-        0x73,0xfd,0x74,0xfa,0x7d,0xf3,0x7a,0xf4,0x6f,0xe1,0x68,0xe6,0x61,0xef,0x66,0xe8,
-    ),
-    ( # 143
-        0x00,0x8f,0x05,0x8a,0x0a,0x85,0x0f,0x80,0x14,0x9b,0x11,0x9e,0x1e,0x91,0x1b,0x94,
-        0x28,0xa7,0x2d,0xa2,0x22,0xad,0x27,0xa8,0x3c,0xb3,0x39,0xb6,0x36,0xb9,0x33,0xbc,
-        0x50,0xdf,0x55,0xda,0x5a,0xd5,0x5f,0xd0,0x44,0xcb,0x41,0xce,0x4e,0xc1,0x4b,0xc4,
-        0x78,0xf7,0x7d,0xf2,0x72,0xfd,0x77,0xf8,0x6c,0xe3,0x69,0xe6,0x66,0xe9,0x63,0xec,
-        0xa0,0x2f,0xa5,0x2a,0xaa,0x25,0xaf,0x20,0xb4,0x3b,0xb1,0x3e,0xbe,0x31,0xbb,0x34,
-        0x88,0x07,0x8d,0x02,0x82,0x0d,0x87,0x08,0x9c,0x13,0x99,0x16,0x96,0x19,0x93,0x1c,
-        0xf0,0x7f,0xf5,0x7a,0xfa,0x75,0xff,0x70,0xe4,0x6b,0xe1,0x6e,0xee,0x61,0xeb,0x64,
-        0xd8,0x57,0xdd,0x52,0xd2,0x5d,0xd7,0x58,0xcc,0x43,0xc9,0x46,0xc6,0x49,0xc3,0x4c,
-        0x5b,0xd4,0x5e,0xd1,0x51,0xde,0x54,0xdb,0x4f,0xc0,0x4a,0xc5,0x45,0xca,0x40,0xcf,
-        0x73,0xfc,0x76,0xf9,0x79,0xf6,0x7c,0xf3,0x67,0xe8,0x62,0xed,0x6d,0xe2,0x68,0xe7,
-        0x0b,0x84,0x0e,0x81,0x01,0x8e,0x04,0x8b,0x1f,0x90,0x1a,0x95,0x15,0x9a,0x10,0x9f,
-        0x23,0xac,0x26,0xa9,0x29,0xa6,0x2c,0xa3,0x37,0xb8,0x32,0xbd,0x3d,0xb2,0x38,0xb7,
-        0xfb,0x74,0xfe,0x71,0xf1,0x7e,0xf4,0x7b,0xef,0x60,0xea,0x65,0xe5,0x6a,0xe0,0x6f,
-        0xd3,0x5c,0xd6,0x59,0xd9,0x56,0xdc,0x53,0xc7,0x48,0xc2,0x4d,0xcd,0x42,0xc8,0x47,
-        0xab,0x24,0xae,0x21,0xa1,0x2e,0xa4,0x2b,0xbf,0x30,0xba,0x35,0xb5,0x3a,0xb0,0x3f,
-        0x83,0x0c,0x86,0x09,0x89,0x06,0x8c,0x03,0x97,0x18,0x92,0x1d,0x9d,0x12,0x98,0x17,
-    ),
-    ( # 144
-        0x00,0x90,0x3b,0xab,0x76,0xe6,0x4d,0xdd,0xec,0x7c,0xd7,0x47,0x9a,0x0a,0xa1,0x31,
-        0xc3,0x53,0xf8,0x68,0xb5,0x25,0x8e,0x1e,0x2f,0xbf,0x14,0x84,0x59,0xc9,0x62,0xf2,
-        0x9d,0x0d,0xa6,0x36,0xeb,0x7b,0xd0,0x40,0x71,0xe1,0x4a,0xda,0x07,0x97,0x3c,0xac,
-        0x5e,0xce,0x65,0xf5,0x28,0xb8,0x13,0x83,0xb2,0x22,0x89,0x19,0xc4,0x54,0xff,0x6f,
-        0x21,0xb1,0x1a,0x8a,0x57,0xc7,0x6c,0xfc,0xcd,0x5d,0xf6,0x66,0xbb,0x2b,0x80,0x10,
-        0xe2,0x72,0xd9,0x49,0x94,0x04,0xaf,0x3f,0x0e,0x9e,0x35,0xa5,0x78,0xe8,0x43,0xd3,
-        0xbc,0x2c,0x87,0x17,0xca,0x5a,0xf1,0x61,0x50,0xc0,0x6b,0xfb,0x26,0xb6,0x1d,0x8d,
-        0x7f,0xef,0x44,0xd4,0x09,0x99,0x32,0xa2,0x93,0x03,0xa8,0x38,0xe5,0x75,0xde,0x4e,
-        0x42,0xd2,0x79,0xe9,0x34,0xa4,0x0f,0x9f,0xae,0x3e,0x95,0x05,0xd8,0x48,0xe3,0x73,
-        0x81,0x11,0xba,0x2a,0xf7,0x67,0xcc,0x5c,0x6d,0xfd,0x56,0xc6,0x1b,0x8b,0x20,0xb0,
-        0xdf,0x4f,0xe4,0x74,0xa9,0x39,0x92,0x02,0x33,0xa3,0x08,0x98,0x45,0xd5,0x7e,0xee,
-        0x1c,0x8c,0x27,0xb7,0x6a,0xfa,0x51,0xc1,0xf0,0x60,0xcb,0x5b,0x86,0x16,0xbd,0x2d,
-        0x63,0xf3,0x58,0xc8,0x15,0x85,0x2e,0xbe,0x8f,0x1f,0xb4,0x24,0xf9,0x69,0xc2,0x52,
-        0xa0,0x30,0x9b,0x0b,0xd6,0x46,0xed,0x7d,0x4c,0xdc,0x77,0xe7,0x3a,0xaa,0x01,0x91,
-        0xfe,0x6e,0xc5,0x55,0x88,0x18,0xb3,0x23,0x12,0x82,0x29,0xb9,0x64,0xf4,0x5f,0xcf,
-        0x3d,0xad,0x06,0x96,0x4b,0xdb,0x70,0xe0,0xd1,0x41,0xea,0x7a,0xa7,0x37,0x9c,0x0c,
-    ),
-    ( # 145
-        0x00,0x91,0x39,0xa8,0x72,0xe3,0x4b,0xda,0xe4,0x75,0xdd,0x4c,0x96,0x07,0xaf,0x3e,
-        0xd3,0x42,0xea,0x7b,0xa1,0x30,0x98,0x09,0x37,0xa6,0x0e,0x9f,0x45,0xd4,0x7c,0xed,
-        0xbd,0x2c,0x84,0x15,0xcf,0x5e,0xf6,0x67,0x59,0xc8,0x60,0xf1,0x2b,0xba,0x12,0x83,
-        0x6e,0xff,0x57,0xc6,0x1c,0x8d,0x25,0xb4,0x8a,0x1b,0xb3,0x22,0xf8,0x69,0xc1,0x50,
-        0x61,0xf0,0x58,0xc9,0x13,0x82,0x2a,0xbb,0x85,0x14,0xbc,0x2d,0xf7,0x66,0xce,0x5f,
-        0xb2,0x23,0x8b,0x1a,0xc0,0x51,0xf9,0x68,0x56,0xc7,0x6f,0xfe,0x24,0xb5,0x1d,0x8c,
-        0xdc,0x4d,0xe5,0x74,0xae,0x3f,0x97,0x06,0x38,0xa9,0x01,0x90,0x4a,0xdb,0x73,0xe2,
-        0x0f,0x9e,0x36,0xa7,0x7d,0xec,0x44,0xd5,0xeb,0x7a,0xd2,0x43,0x99,0x08,0xa0,0x31,
-        0xc2,0x53,0xfb,0x6a,0xb0,0x21,0x89,0x18,0x26,0xb7,0x1f,0x8e,0x54,0xc5,0x6d,0xfc,
-        0x11,0x80,0x28,0xb9,0x63,0xf2,0x5a,0xcb,0xf5,0x64,0xcc,0x5d,0x87,0x16,0xbe,0x2f,
-        0x7f,0xee,0x46,0xd7,0x0d,0x9c,0x34,0xa5,0x9b,0x0a,0xa2,0x33,0xe9,0x78,0xd0,0x41,
-        0xac,0x3d,0x95,0x04,0xde,0x4f,0xe7,0x76,0x48,0xd9,0x71,0xe0,0x3a,0xab,0x03,0x92,
-        0xa3,0x32,0x9a,0x0b,0xd1,0x40,0xe8,0x79,0x47,0xd6,0x7e,0xef,0x35,0xa4,0x0c,0x9d,
-        0x70,0xe1,0x49,0xd8,0x02,0x93,0x3b,0xaa,0x94,0x05,0xad,0x3c,0xe6,0x77,0xdf,0x4e,
-        0x1e,0x8f,0x27,0xb6,0x6c,0xfd,0x55,0xc4,0xfa,0x6b,0xc3,0x52,0x88,0x19,0xb1,0x20,
-        0xcd,0x5c,0xf4,0x65,0xbf,0x2e,0x86,0x17,0x29,0xb8,0x10,0x81,0x5b,0xca,0x62,0xf3,
-    ),
-    ( # 146
-        0x00,0x92,0x3f,0xad,0x7e,0xec,0x41,0xd3,0xfc,0x6e,0xc3,0x51,0x82,0x10,0xbd,0x2f,
-        0xe3,0x71,0xdc,0x4e,0x9d,0x0f,0xa2,0x30,0x1f,0x8d,0x20,0xb2,0x61,0xf3,0x5e,0xcc,
-        0xdd,0x4f,0xe2,0x70,0xa3,0x31,0x9c,0x0e,0x21,0xb3,0x1e,0x8c,0x5f,0xcd,0x60,0xf2,
-        0x3e,0xac,0x01,0x93,0x40,0xd2,0x7f,0xed,0xc2,0x50,0xfd,0x6f,0xbc,0x2e,0x83,0x11,
-        0xa1,0x33,0x9e,0x0c,0xdf,0x4d,0xe0,0x72,0x5d,0xcf,0x62,0xf0,0x23,0xb1,0x1c,0x8e,
-        0x42,0xd0,0x7d,0xef,0x3c,0xae,0x03,0x91,0xbe,0x2c,0x81,0x13,0xc0,0x52,0xff,0x6d,
-        0x7c,0xee,0x43,0xd1,0x02,0x90,0x3d,0xaf,0x80,0x12,0xbf,0x2d,0xfe,0x6c,0xc1,0x53,
-        0x9f,0x0d,0xa0,0x32,0xe1,0x73,0xde,0x4c,0x63,0xf1,0x5c,0xce,0x1d,0x8f,0x22,0xb0,
-        0x59,0xcb,0x66,0xf4,0x27,0xb5,0x18,0x8a,0xa5,0x37,0x9a,0x08,0xdb,0x49,0xe4,0x76,
-        0xba,0x28,0x85,0x17,0xc4,0x56,0xfb,0x69,0x46,0xd4,0x79,0xeb,0x38,0xaa,0x07,0x95,
-        0x84,0x16,0xbb,0x29,0xfa,0x68,0xc5,0x57,0x78,0xea,0x47,0xd5,0x06,0x94,0x39,0xab,
-        0x67,0xf5,0x58,0xca,0x19,0x8b,0x26,0xb4,0x9b,0x09,0xa4,0x36,0xe5,0x77,0xda,0x48,
-        0xf8,0x6a,0xc7,0x55,0x86,0x14,0xb9,0x2b,0x04,0x96,0x3b,0xa9,0x7a,0xe8,0x45,0xd7,
-        0x1b,0x89,0x24,0xb6,0x65,0xf7,0x5a,0xc8,0xe7,0x75,0xd8,0x4a,0x99,0x0b,0xa6,0x34,
-        0x25,0xb7,0x1a,0x88,0x5b,0xc9,0x64,0xf6,0xd9,0x4b,0xe6,0x74,0xa7,0x35,0x98,0x0a,
-        0xc6,0x54,0xf9,0x6b,0xb8,0x2a,0x87,0x15,0x3a,0xa8,0x05,0x97,0x44,0xd6,0x7b,0xe9,
-    ),
-    ( # 147
-        0x00,0x93,0x3d,0xae,0x7a,0xe9,0x47,0xd4,0xf4,0x67,0xc9,0x5a,0x8e,0x1d,0xb3,0x20,
-        0xf3,0x60,0xce,0x5d,0x89,0x1a,0xb4,0x27,0x07,0x94,0x3a,0xa9,0x7d,0xee,0x40,0xd3,
-        0xfd,0x6e,0xc0,0x53,0x87,0x14,0xba,0x29,0x09,0x9a,0x34,0xa7,0x73,0xe0,0x4e,0xdd,
-        0x0e,0x9d,0x33,0xa0,0x74,0xe7,0x49,0xda,0xfa,0x69,0xc7,0x54,0x80,0x13,0xbd,0x2e,
-        0xe1,0x72,0xdc,0x4f,0x9b,0x08,0xa6,0x35,0x15,0x86,0x28,0xbb,0x6f,0xfc,0x52,0xc1,
-        0x12,0x81,0x2f,0xbc,0x68,0xfb,0x55,0xc6,0xe6,0x75,0xdb,0x48,0x9c,0x0f,0xa1,0x32,
-        0x1c,0x8f,0x21,0xb2,0x66,0xf5,0x5b,0xc8,0xe8,0x7b,0xd5,0x46,0x92,0x01,0xaf,0x3c,
-        0xef,0x7c,0xd2,0x41,0x95,0x06,0xa8,0x3b,0x1b,0x88,0x26,0xb5,0x61,0xf2,0x5c,0xcf,
-        0xd9,0x4a,0xe4,0x77,0xa3,0x30,0x9e,0x0d,0x2d,0xbe,0x10,0x83,0x57,0xc4,0x6a,0xf9,
-        0x2a,0xb9,0x17,0x84,0x50,0xc3,0x6d,0xfe,0xde,0x4d,0xe3,0x70,0xa4,0x37,0x99,0x0a,
-        0x24,0xb7,0x19,0x8a,0x5e,0xcd,0x63,0xf0,0xd0,0x43,0xed,0x7e,0xaa,0x39,0x97,0x04,
-        0xd7,0x44,0xea,0x79,0xad,0x3e,0x90,0x03,0x23,0xb0,0x1e,0x8d,0x59,0xca,0x64,0xf7,
-        0x38,0xab,0x05,0x96,0x42,0xd1,0x7f,0xec,0xcc,0x5f,0xf1,0x62,0xb6,0x25,0x8b,0x18,
-        0xcb,0x58,0xf6,0x65,0xb1,0x22,0x8c,0x1f,0x3f,0xac,0x02,0x91,0x45,0xd6,0x78,0xeb,
-        0xc5,0x56,0xf8,0x6b,0xbf,0x2c,0x82,0x11,0x31,0xa2,0x0c,0x9f,0x4b,0xd8,0x76,0xe5,
-        0x36,0xa5,0x0b,0x98,0x4c,0xdf,0x71,0xe2,0xc2,0x51,0xff,0x6c,0xb8,0x2b,0x85,0x16,
-    ),
-    ( # 148
-        0x00,0x94,0x33,0xa7,0x66,0xf2,0x55,0xc1,0xcc,0x58,0xff,0x6b,0xaa,0x3e,0x99,0x0d,
-        0x83,0x17,0xb0,0x24,0xe5,0x71,0xd6,0x42,0x4f,0xdb,0x7c,0xe8,0x29,0xbd,0x1a,0x8e,
-        0x1d,0x89,0x2e,0xba,0x7b,0xef,0x48,0xdc,0xd1,0x45,0xe2,0x76,0xb7,0x23,0x84,0x10,
-        0x9e,0x0a,0xad,0x39,0xf8,0x6c,0xcb,0x5f,0x52,0xc6,0x61,0xf5,0x34,0xa0,0x07,0x93,
-        0x3a,0xae,0x09,0x9d,0x5c,0xc8,0x6f,0xfb,0xf6,0x62,0xc5,0x51,0x90,0x04,0xa3,0x37,
-        0xb9,0x2d,0x8a,0x1e,0xdf,0x4b,0xec,0x78,0x75,0xe1,0x46,0xd2,0x13,0x87,0x20,0xb4,
-        0x27,0xb3,0x14,0x80,0x41,0xd5,0x72,0xe6,0xeb,0x7f,0xd8,0x4c,0x8d,0x19,0xbe,0x2a,
-        0xa4,0x30,0x97,0x03,0xc2,0x56,0xf1,0x65,0x68,0xfc,0x5b,0xcf,0x0e,0x9a,0x3d,0xa9,
-        0x74,0xe0,0x47,0xd3,0x12,0x86,0x21,0xb5,0xb8,0x2c,0x8b,0x1f,0xde,0x4a,0xed,0x79,
-        0xf7,0x63,0xc4,0x50,0x91,0x05,0xa2,0x36,0x3b,0xaf,0x08,0x9c,0x5d,0xc9,0x6e,0xfa,
-        0x69,0xfd,0x5a,0xce,0x0f,0x9b,0x3c,0xa8,0xa5,0x31,0x96,0x02,0xc3,0x57,0xf0,0x64,
-        0xea,0x7e,0xd9,0x4d,0x8c,0x18,0xbf,0x2b,0x26,0xb2,0x15,0x81,0x40,0xd4,0x73,0xe7,
-        0x4e,0xda,0x7d,0xe9,0x28,0xbc,0x1b,0x8f,0x82,0x16,0xb1,0x25,0xe4,0x70,0xd7,0x43,
-        0xcd,0x59,0xfe,0x6a,0xab,0x3f,0x98,0x0c,0x01,0x95,0x32,0xa6,0x67,0xf3,0x54,0xc0,
-        0x53,0xc7,0x60,0xf4,0x35,0xa1,0x06,0x92,0x9f,0x0b,0xac,0x38,0xf9,0x6d,0xca,0x5e,
-        0xd0,0x44,0xe3,0x77,0xb6,0x22,0x85,0x11,0x1c,0x88,0x2f,0xbb,0x7a,0xee,0x49,0xdd,
-    ),
-    ( # 149
-        0x00,0x95,0x31,0xa4,0x62,0xf7,0x53,0xc6,0xc4,0x51,0xf5,0x60,0xa6,0x33,0x97,0x02,
-        0x93,0x06,0xa2,0x37,0xf1,0x64,0xc0,0x55,0x57,0xc2,0x66,0xf3,0x35,0xa0,0x04,0x91,
-        0x3d,0xa8,0x0c,0x99,0x5f,0xca,0x6e,0xfb,0xf9,0x6c,0xc8,0x5d,0x9b,0x0e,0xaa,0x3f,
-        0xae,0x3b,0x9f,0x0a,0xcc,0x59,0xfd,0x68,0x6a,0xff,0x5b,0xce,0x08,0x9d,0x39,0xac,
-        0x7a,0xef,0x4b,0xde,0x18,0x8d,0x29,0xbc,0xbe,0x2b,0x8f,0x1a,0xdc,0x49,0xed,0x78,
-        0xe9,0x7c,0xd8,0x4d,0x8b,0x1e,0xba,0x2f,0x2d,0xb8,0x1c,0x89,0x4f,0xda,0x7e,0xeb,
-        0x47,0xd2,0x76,0xe3,0x25,0xb0,0x14,0x81,0x83,0x16,0xb2,0x27,0xe1,0x74,0xd0,0x45,
-        0xd4,0x41,0xe5,0x70,0xb6,0x23,0x87,0x12,0x10,0x85,0x21,0xb4,0x72,0xe7,0x43,0xd6,
-        0xf4,0x61,0xc5,0x50,0x96,0x03,0xa7,0x32,0x30,0xa5,0x01,0x94,0x52,0xc7,0x63,0xf6,
-        0x67,0xf2,0x56,0xc3,0x05,0x90,0x34,0xa1,0xa3,0x36,0x92,0x07,0xc1,0x54,0xf0,0x65,
-        0xc9,0x5c,0xf8,0x6d,0xab,0x3e,0x9a,0x0f,0x0d,0x98,0x3c,0xa9,0x6f,0xfa,0x5e,0xcb,
-        0x5a,0xcf,0x6b,0xfe,0x38,0xad,0x09,0x9c,0x9e,0x0b,0xaf,0x3a,0xfc,0x69,0xcd,0x58,
-        0x8e,0x1b,0xbf,0x2a,0xec,0x79,0xdd,0x48,0x4a,0xdf,0x7b,0xee,0x28,0xbd,0x19,0x8c,
-        0x1d,0x88,0x2c,0xb9,0x7f,0xea,0x4e,0xdb,0xd9,0x4c,0xe8,0x7d,0xbb,0x2e,0x8a,0x1f,
-        0xb3,0x26,0x82,0x17,0xd1,0x44,0xe0,0x75,0x77,0xe2,0x46,0xd3,0x15,0x80,0x24,0xb1,
-        0x20,0xb5,0x11,0x84,0x42,0xd7,0x73,0xe6,0xe4,0x71,0xd5,0x40,0x86,0x13,0xb7,0x22,
-    ),
-    ( # 150
-        0x00,0x96,0x37,0xa1,0x6e,0xf8,0x59,0xcf,0xdc,0x4a,0xeb,0x7d,0xb2,0x24,0x85,0x13,
-        0xa3,0x35,0x94,0x02,0xcd,0x5b,0xfa,0x6c,0x7f,0xe9,0x48,0xde,0x11,0x87,0x26,0xb0,
-        0x5d,0xcb,0x6a,0xfc,0x33,0xa5,0x04,0x92,0x81,0x17,0xb6,0x20,0xef,0x79,0xd8,0x4e,
-        0xfe,0x68,0xc9,0x5f,0x90,0x06,0xa7,0x31,0x22,0xb4,0x15,0x83,0x4c,0xda,0x7b,0xed,
-        0xba,0x2c,0x8d,0x1b,0xd4,0x42,0xe3,0x75,0x66,0xf0,0x51,0xc7,0x08,0x9e,0x3f,0xa9,
-        0x19,0x8f,0x2e,0xb8,0x77,0xe1,0x40,0xd6,0xc5,0x53,0xf2,0x64,0xab,0x3d,0x9c,0x0a,
-        0xe7,0x71,0xd0,0x46,0x89,0x1f,0xbe,0x28,0x3b,0xad,0x0c,0x9a,0x55,0xc3,0x62,0xf4,
-        0x44,0xd2,0x73,0xe5,0x2a,0xbc,0x1d,0x8b,0x98,0x0e,0xaf,0x39,0xf6,0x60,0xc1,0x57,
-        0x6f,0xf9,0x58,0xce,0x01,0x97,0x36,0xa0,0xb3,0x25,0x84,0x12,0xdd,0x4b,0xea,0x7c,
-        0xcc,0x5a,0xfb,0x6d,0xa2,0x34,0x95,0x03,0x10,0x86,0x27,0xb1,0x7e,0xe8,0x49,0xdf,
-        0x32,0xa4,0x05,0x93,0x5c,0xca,0x6b,0xfd,0xee,0x78,0xd9,0x4f,0x80,0x16,0xb7,0x21,
-        0x91,0x07,0xa6,0x30,0xff,0x69,0xc8,0x5e,0x4d,0xdb,0x7a,0xec,0x23,0xb5,0x14,0x82,
-        0xd5,0x43,0xe2,0x74,0xbb,0x2d,0x8c,0x1a,0x09,0x9f,0x3e,0xa8,0x67,0xf1,0x50,0xc6,
-        0x76,0xe0,0x41,0xd7,0x18,0x8e,0x2f,0xb9,0xaa,0x3c,0x9d,0x0b,0xc4,0x52,0xf3,0x65,
-        0x88,0x1e,0xbf,0x29,0xe6,0x70,0xd1,0x47,0x54,0xc2,0x63,0xf5,0x3a,0xac,0x0d,0x9b,
-        0x2b,0xbd,0x1c,0x8a,0x45,0xd3,0x72,0xe4,0xf7,0x61,0xc0,0x56,0x99,0x0f,0xae,0x38,
-    ),
-    ( # 151
-        0x00,0x97,0x35,0xa2,0x6a,0xfd,0x5f,0xc8,0xd4,0x43,0xe1,0x76,0xbe,0x29,0x8b,0x1c,
-        0xb3,0x24,0x86,0x11,0xd9,0x4e,0xec,0x7b,0x67,0xf0,0x52,0xc5,0x0d,0x9a,0x38,0xaf,
-        0x7d,0xea,0x48,0xdf,0x17,0x80,0x22,0xb5,0xa9,0x3e,0x9c,0x0b,0xc3,0x54,0xf6,0x61,
-        0xce,0x59,0xfb,0x6c,0xa4,0x33,0x91,0x06,0x1a,0x8d,0x2f,0xb8,0x70,0xe7,0x45,0xd2,
-        0xfa,0x6d,0xcf,0x58,0x90,0x07,0xa5,0x32,0x2e,0xb9,0x1b,0x8c,0x44,0xd3,0x71,0xe6,
-        0x49,0xde,0x7c,0xeb,0x23,0xb4,0x16,0x81,0x9d,0x0a,0xa8,0x3f,0xf7,0x60,0xc2,0x55,
-        0x87,0x10,0xb2,0x25,0xed,0x7a,0xd8,0x4f,0x53,0xc4,0x66,0xf1,0x39,0xae,0x0c,0x9b,
-        0x34,0xa3,0x01,0x96,0x5e,0xc9,0x6b,0xfc,0xe0,0x77,0xd5,0x42,0x8a,0x1d,0xbf,0x28,
-        0xef,0x78,0xda,0x4d,0x85,0x12,0xb0,0x27,0x3b,0xac,0x0e,0x99,0x51,0xc6,0x64,0xf3,
-        0x5c,0xcb,0x69,0xfe,0x36,0xa1,0x03,0x94,0x88,0x1f,0xbd,0x2a,0xe2,0x75,0xd7,0x40,
-        0x92,0x05,0xa7,0x30,0xf8,0x6f,0xcd,0x5a,0x46,0xd1,0x73,0xe4,0x2c,0xbb,0x19,0x8e,
-        0x21,0xb6,0x14,0x83,0x4b,0xdc,0x7e,0xe9,0xf5,0x62,0xc0,0x57,0x9f,0x08,0xaa,0x3d,
-        0x15,0x82,0x20,0xb7,0x7f,0xe8,0x4a,0xdd,0xc1,0x56,0xf4,0x63,0xab,0x3c,0x9e,0x09,
-        0xa6,0x31,0x93,0x04,0xcc,0x5b,0xf9,0x6e,0x72,0xe5,0x47,0xd0,0x18,0x8f,0x2d,0xba,
-        0x68,0xff,0x5d,0xca,0x02,0x95,0x37,0xa0,0xbc,0x2b,0x89,0x1e,0xd6,0x41,0xe3,0x74,
-        0xdb,0x4c,0xee,0x79,0xb1,0x26,0x84,0x13,0x0f,0x98,0x3a,0xad,0x65,0xf2,0x50,0xc7,
-    ),
-    ( # 152
-        0x00,0x98,0x2b,0xb3,0x56,0xce,0x7d,0xe5,0xac,0x34,0x87,0x1f,0xfa,0x62,0xd1,0x49,
-        0x43,0xdb,0x68,0xf0,0x15,0x8d,0x3e,0xa6,0xef,0x77,0xc4,0x5c,0xb9,0x21,0x92,0x0a,
-        0x86,0x1e,0xad,0x35,0xd0,0x48,0xfb,0x63,0x2a,0xb2,0x01,0x99,0x7c,0xe4,0x57,0xcf,
-        0xc5,0x5d,0xee,0x76,0x93,0x0b,0xb8,0x20,0x69,0xf1,0x42,0xda,0x3f,0xa7,0x14,0x8c,
-        0x17,0x8f,0x3c,0xa4,0x41,0xd9,0x6a,0xf2,0xbb,0x23,0x90,0x08,0xed,0x75,0xc6,0x5e,
-        0x54,0xcc,0x7f,0xe7,0x02,0x9a,0x29,0xb1,0xf8,0x60,0xd3,0x4b,0xae,0x36,0x85,0x1d,
-        0x91,0x09,0xba,0x22,0xc7,0x5f,0xec,0x74,0x3d,0xa5,0x16,0x8e,0x6b,0xf3,0x40,0xd8,
-        0xd2,0x4a,0xf9,0x61,0x84,0x1c,0xaf,0x37,0x7e,0xe6,0x55,0xcd,0x28,0xb0,0x03,0x9b,
-        0x2e,0xb6,0x05,0x9d,0x78,0xe0,0x53,0xcb,0x82,0x1a,0xa9,0x31,0xd4,0x4c,0xff,0x67,
-        0x6d,0xf5,0x46,0xde,0x3b,0xa3,0x10,0x88,0xc1,0x59,0xea,0x72,0x97,0x0f,0xbc,0x24,
-        0xa8,0x30,0x83,0x1b,0xfe,0x66,0xd5,0x4d,0x04,0x9c,0x2f,0xb7,0x52,0xca,0x79,0xe1,
-        0xeb,0x73,0xc0,0x58,0xbd,0x25,0x96,0x0e,0x47,0xdf,0x6c,0xf4,0x11,0x89,0x3a,0xa2,
-        0x39,0xa1,0x12,0x8a,0x6f,0xf7,0x44,0xdc,0x95,0x0d,0xbe,0x26,0xc3,0x5b,0xe8,0x70,
-        0x7a,0xe2,0x51,0xc9,0x2c,0xb4,0x07,0x9f,0xd6,0x4e,0xfd,0x65,0x80,0x18,0xab,0x33,
-        0xbf,0x27,0x94,0x0c,0xe9,0x71,0xc2,0x5a,0x13,0x8b,0x38,0xa0,0x45,0xdd,0x6e,0xf6,
-        0xfc,0x64,0xd7,0x4f,0xaa,0x32,0x81,0x19,0x50,0xc8,0x7b,0xe3,0x06,0x9e,0x2d,0xb5,
-    ),
-    ( # 153
-        0x00,0x99,0x29,0xb0,0x52,0xcb,0x7b,0xe2,0xa4,0x3d,0x8d,0x14,0xf6,0x6f,0xdf,0x46,
-        0x53,0xca,0x7a,0xe3,0x01,0x98,0x28,0xb1,0xf7,0x6e,0xde,0x47,0xa5,0x3c,0x8c,0x15,
-        0xa6,0x3f,0x8f,0x16,0xf4,0x6d,0xdd,0x44,0x02,0x9b,0x2b,0xb2,0x50,0xc9,0x79,0xe0,
-        0xf5,0x6c,0xdc,0x45,0xa7,0x3e,0x8e,0x17,0x51,0xc8,0x78,0xe1,0x03,0x9a,0x2a,0xb3,
-        0x57,0xce,0x7e,0xe7,0x05,0x9c,0x2c,0xb5,0xf3,0x6a,0xda,0x43,0xa1,0x38,0x88,0x11,
-        0x04,0x9d,0x2d,0xb4,0x56,0xcf,0x7f,0xe6,0xa0,0x39,0x89,0x10,0xf2,0x6b,0xdb,0x42,
-        0xf1,0x68,0xd8,0x41,0xa3,0x3a,0x8a,0x13,0x55,0xcc,0x7c,0xe5,0x07,0x9e,0x2e,0xb7,
-        0xa2,0x3b,0x8b,0x12,0xf0,0x69,0xd9,0x40,0x06,0x9f,0x2f,0xb6,0x54,0xcd,0x7d,0xe4,
-        0xae,0x37,0x87,0x1e,0xfc,0x65,0xd5,0x4c,0x0a,0x93,0x23,0xba,0x58,0xc1,0x71,0xe8,
-        0xfd,0x64,0xd4,0x4d,0xaf,0x36,0x86,0x1f,0x59,0xc0,0x70,0xe9,0x0b,0x92,0x22,0xbb,
-        0x08,0x91,0x21,0xb8,0x5a,0xc3,0x73,0xea,0xac,0x35,0x85,0x1c,0xfe,0x67,0xd7,0x4e,
-        0x5b,0xc2,0x72,0xeb,0x09,0x90,0x20,0xb9,0xff,0x66,0xd6,0x4f,0xad,0x34,0x84,0x1d,
-        0xf9,0x60,0xd0,0x49,0xab,0x32,0x82,0x1b,0x5d,0xc4,0x74,0xed,0x0f,0x96,0x26,0xbf,
-        0xaa,0x33,0x83,0x1a,0xf8,0x61,0xd1,0x48,0x0e,0x97,0x27,0xbe,0x5c,0xc5,0x75,0xec,
-        0x5f,0xc6,0x76,0xef,0x0d,0x94,0x24,0xbd,0xfb,0x62,0xd2,0x4b,0xa9,0x30,0x80,0x19,
-        0x0c,0x95,0x25,0xbc,0x5e,0xc7,0x77,0xee,0xa8,0x31,0x81,0x18,0xfa,0x63,0xd3,0x4a,
-    ),
-    ( # 154
-        0x00,0x9a,0x2f,0xb5,0x5e,0xc4,0x71,0xeb,0xbc,0x26,0x93,0x09,0xe2,0x78,0xcd,0x57,
-        0x63,0xf9,0x4c,0xd6,0x3d,0xa7,0x12,0x88,0xdf,0x45,0xf0,0x6a,0x81,0x1b,0xae,0x34,
-        0xc6,0x5c,0xe9,0x73,0x98,0x02,0xb7,0x2d,0x7a,0xe0,0x55,0xcf,0x24,0xbe,0x0b,0x91,
-        0xa5,0x3f,0x8a,0x10,0xfb,0x61,0xd4,0x4e,0x19,0x83,0x36,0xac,0x47,0xdd,0x68,0xf2,
-        0x97,0x0d,0xb8,0x22,0xc9,0x53,0xe6,0x7c,0x2b,0xb1,0x04,0x9e,0x75,0xef,0x5a,0xc0,
-        0xf4,0x6e,0xdb,0x41,0xaa,0x30,0x85,0x1f,0x48,0xd2,0x67,0xfd,0x16,0x8c,0x39,0xa3,
-        0x51,0xcb,0x7e,0xe4,0x0f,0x95,0x20,0xba,0xed,0x77,0xc2,0x58,0xb3,0x29,0x9c,0x06,
-        0x32,0xa8,0x1d,0x87,0x6c,0xf6,0x43,0xd9,0x8e,0x14,0xa1,0x3b,0xd0,0x4a,0xff,0x65,
-        0x35,0xaf,0x1a,0x80,0x6b,0xf1,0x44,0xde,0x89,0x13,0xa6,0x3c,0xd7,0x4d,0xf8,0x62,
-        0x56,0xcc,0x79,0xe3,0x08,0x92,0x27,0xbd,0xea,0x70,0xc5,0x5f,0xb4,0x2e,0x9b,0x01,
-        0xf3,0x69,0xdc,0x46,0xad,0x37,0x82,0x18,0x4f,0xd5,0x60,0xfa,0x11,0x8b,0x3e,0xa4,
-        0x90,0x0a,0xbf,0x25,0xce,0x54,0xe1,0x7b,0x2c,0xb6,0x03,0x99,0x72,0xe8,0x5d,0xc7,
-        0xa2,0x38,0x8d,0x17,0xfc,0x66,0xd3,0x49,0x1e,0x84,0x31,0xab,0x40,0xda,0x6f,0xf5,
-        0xc1,0x5b,0xee,0x74,0x9f,0x05,0xb0,0x2a,0x7d,0xe7,0x52,0xc8,0x23,0xb9,0x0c,0x96,
-        0x64,0xfe,0x4b,0xd1,0x3a,0xa0,0x15,0x8f,0xd8,0x42,0xf7,0x6d,0x86,0x1c,0xa9,0x33,
-        0x07,0x9d,0x28,0xb2,0x59,0xc3,0x76,0xec,0xbb,0x21,0x94,0x0e,0xe5,0x7f,0xca,0x50,
-    ),
-    ( # 155
-        0x00,0x9b,0x2d,0xb6,0x5a,0xc1,0x77,0xec,0xb4,0x2f,0x99,0x02,0xee,0x75,0xc3,0x58,
-        0x73,0xe8,0x5e,0xc5,0x29,0xb2,0x04,0x9f,0xc7,0x5c,0xea,0x71,0x9d,0x06,0xb0,0x2b,
-        0xe6,0x7d,0xcb,0x50,0xbc,0x27,0x91,0x0a,0x52,0xc9,0x7f,0xe4,0x08,0x93,0x25,0xbe,
-        0x95,0x0e,0xb8,0x23,0xcf,0x54,0xe2,0x79,0x21,0xba,0x0c,0x97,0x7b,0xe0,0x56,0xcd,
-        0xd7,0x4c,0xfa,0x61,0x8d,0x16,0xa0,0x3b,0x63,0xf8,0x4e,0xd5,0x39,0xa2,0x14,0x8f,
-        0xa4,0x3f,0x89,0x12,0xfe,0x65,0xd3,0x48,0x10,0x8b,0x3d,0xa6,0x4a,0xd1,0x67,0xfc,
-        0x31,0xaa,0x1c,0x87,0x6b,0xf0,0x46,0xdd,0x85,0x1e,0xa8,0x33,0xdf,0x44,0xf2,0x69,
-        0x42,0xd9,0x6f,0xf4,0x18,0x83,0x35,0xae,0xf6,0x6d,0xdb,0x40,0xac,0x37,0x81,0x1a,
-        0xb5,0x2e,0x98,0x03,0xef,0x74,0xc2,0x59,0x01,0x9a,0x2c,0xb7,0x5b,0xc0,0x76,0xed,
-        0xc6,0x5d,0xeb,0x70,0x9c,0x07,0xb1,0x2a,0x72,0xe9,0x5f,0xc4,0x28,0xb3,0x05,0x9e,
-        0x53,0xc8,0x7e,0xe5,0x09,0x92,0x24,0xbf,0xe7,0x7c,0xca,0x51,0xbd,0x26,0x90,0x0b,
-        0x20,0xbb,0x0d,0x96,0x7a,0xe1,0x57,0xcc,0x94,0x0f,0xb9,0x22,0xce,0x55,0xe3,0x78,
-        0x62,0xf9,0x4f,0xd4,0x38,0xa3,0x15,0x8e,0xd6,0x4d,0xfb,0x60,0x8c,0x17,0xa1,0x3a,
-        0x11,0x8a,0x3c,0xa7,0x4b,0xd0,0x66,0xfd,0xa5,0x3e,0x88,0x13,0xff,0x64,0xd2,0x49,
-        0x84,0x1f,0xa9,0x32,0xde,0x45,0xf3,0x68,0x30,0xab,0x1d,0x86,0x6a,0xf1,0x47,0xdc,
-        0xf7,0x6c,0xda,0x41,0xad,0x36,0x80,0x1b,0x43,0xd8,0x6e,0xf5,0x19,0x82,0x34,0xaf,
-    ),
-    ( # 156
-        0x00,0x9c,0x23,0xbf,0x46,0xda,0x65,0xf9,0x8c,0x10,0xaf,0x33,0xca,0x56,0xe9,0x75,
-        0x03,0x9f,0x20,0xbc,0x45,0xd9,0x66,0xfa,0x8f,0x13,0xac,0x30,0xc9,0x55,0xea,0x76,
-        0x06,0x9a,0x25,0xb9,0x40,0xdc,0x63,0xff,0x8a,0x16,0xa9,0x35,0xcc,0x50,0xef,0x73,
-        0x05,0x99,0x26,0xba,0x43,0xdf,0x60,0xfc,0x89,0x15,0xaa,0x36,0xcf,0x53,0xec,0x70,
-        0x0c,0x90,0x2f,0xb3,0x4a,0xd6,0x69,0xf5,0x80,0x1c,0xa3,0x3f,0xc6,0x5a,0xe5,0x79,
-        0x0f,0x93,0x2c,0xb0,0x49,0xd5,0x6a,0xf6,0x83,0x1f,0xa0,0x3c,0xc5,0x59,0xe6,0x7a,
-        0x0a,0x96,0x29,0xb5,0x4c,0xd0,0x6f,0xf3,0x86,0x1a,0xa5,0x39,0xc0,0x5c,0xe3,0x7f,
-        0x09,0x95,0x2a,0xb6,0x4f,0xd3,0x6c,0xf0,0x85,0x19,0xa6,0x3a,0xc3,0x5f,0xe0,0x7c,
-        0x18,0x84,0x3b,0xa7,0x5e,0xc2,0x7d,0xe1,0x94,0x08,0xb7,0x2b,0xd2,0x4e,0xf1,0x6d,
-        0x1b,0x87,0x38,0xa4,0x5d,0xc1,0x7e,0xe2,0x97,0x0b,0xb4,0x28,0xd1,0x4d,0xf2,0x6e,
-        0x1e,0x82,0x3d,0xa1,0x58,0xc4,0x7b,0xe7,0x92,0x0e,0xb1,0x2d,0xd4,0x48,0xf7,0x6b,
-        0x1d,0x81,0x3e,0xa2,0x5b,0xc7,0x78,0xe4,0x91,0x0d,0xb2,0x2e,0xd7,0x4b,0xf4,0x68,
-        0x14,0x88,0x37,0xab,0x52,0xce,0x71,0xed,0x98,0x04,0xbb,0x27,0xde,0x42,0xfd,0x61,
-        0x17,0x8b,0x34,0xa8,0x51,0xcd,0x72,0xee,0x9b,0x07,0xb8,0x24,0xdd,0x41,0xfe,0x62,
-        0x12,0x8e,0x31,0xad,0x54,0xc8,0x77,0xeb,0x9e,0x02,0xbd,0x21,0xd8,0x44,0xfb,0x67,
-        0x11,0x8d,0x32,0xae,0x57,0xcb,0x74,0xe8,0x9d,0x01,0xbe,0x22,0xdb,0x47,0xf8,0x64,
-    ),
-    ( # 157
-        0x00,0x9d,0x21,0xbc,0x42,0xdf,0x63,0xfe,0x84,0x19,0xa5,0x38,0xc6,0x5b,0xe7,0x7a,
-        0x13,0x8e,0x32,0xaf,0x51,0xcc,0x70,0xed,0x97,0x0a,0xb6,0x2b,0xd5,0x48,0xf4,0x69,
-        0x26,0xbb,0x07,0x9a,0x64,0xf9,0x45,0xd8,0xa2,0x3f,0x83,0x1e,0xe0,0x7d,0xc1,0x5c,
-        0x35,0xa8,0x14,0x89,0x77,0xea,0x56,0xcb,0xb1,0x2c,0x90,0x0d,0xf3,0x6e,0xd2,0x4f,
-        0x4c,0xd1,0x6d,0xf0,0x0e,0x93,0x2f,0xb2,0xc8,0x55,0xe9,0x74,0x8a,0x17,0xab,0x36,
-        0x5f,0xc2,0x7e,0xe3,0x1d,0x80,0x3c,0xa1,0xdb,0x46,0xfa,0x67,0x99,0x04,0xb8,0x25,
-        0x6a,0xf7,0x4b,0xd6,0x28,0xb5,0x09,0x94,0xee,0x73,0xcf,0x52,0xac,0x31,0x8d,0x10,
-        0x79,0xe4,0x58,0xc5,0x3b,0xa6,0x1a,0x87,0xfd,0x60,0xdc,0x41,0xbf,0x22,0x9e,0x03,
-        0x98,0x05,0xb9,0x24,0xda,0x47,0xfb,0x66,0x1c,0x81,0x3d,0xa0,0x5e,0xc3,0x7f,0xe2,
-        0x8b,0x16,0xaa,0x37,0xc9,0x54,0xe8,0x75,0x0f,0x92,0x2e,0xb3,0x4d,0xd0,0x6c,0xf1,
-        0xbe,0x23,0x9f,0x02,0xfc,0x61,0xdd,0x40,0x3a,0xa7,0x1b,0x86,0x78,0xe5,0x59,0xc4,
-        0xad,0x30,0x8c,0x11,0xef,0x72,0xce,0x53,0x29,0xb4,0x08,0x95,0x6b,0xf6,0x4a,0xd7,
-        0xd4,0x49,0xf5,0x68,0x96,0x0b,0xb7,0x2a,0x50,0xcd,0x71,0xec,0x12,0x8f,0x33,0xae,
-        0xc7,0x5a,0xe6,0x7b,0x85,0x18,0xa4,0x39,0x43,0xde,0x62,0xff,0x01,0x9c,0x20,0xbd,
-        0xf2,0x6f,0xd3,0x4e,0xb0,0x2d,0x91,0x0c,0x76,0xeb,0x57,0xca,0x34,0xa9,0x15,0x88,
-        0xe1,0x7c,0xc0,0x5d,0xa3,0x3e,0x82,0x1f,0x65,0xf8,0x44,0xd9,0x27,0xba,0x06,0x9b,
-    ),
-    ( # 158
-        0x00,0x9e,0x27,0xb9,0x4e,0xd0,0x69,0xf7,0x9c,0x02,0xbb,0x25,0xd2,0x4c,0xf5,0x6b,
-        0x23,0xbd,0x04,0x9a,0x6d,0xf3,0x4a,0xd4,0xbf,0x21,0x98,0x06,0xf1,0x6f,0xd6,0x48,
-        0x46,0xd8,0x61,0xff,0x08,0x96,0x2f,0xb1,0xda,0x44,0xfd,0x63,0x94,0x0a,0xb3,0x2d,
-        0x65,0xfb,0x42,0xdc,0x2b,0xb5,0x0c,0x92,0xf9,0x67,0xde,0x40,0xb7,0x29,0x90,0x0e,
-        0x8c,0x12,0xab,0x35,0xc2,0x5c,0xe5,0x7b,0x10,0x8e,0x37,0xa9,0x5e,0xc0,0x79,0xe7,
-        0xaf,0x31,0x88,0x16,0xe1,0x7f,0xc6,0x58,0x33,0xad,0x14,0x8a,0x7d,0xe3,0x5a,0xc4,
-        0xca,0x54,0xed,0x73,0x84,0x1a,0xa3,0x3d,0x56,0xc8,0x71,0xef,0x18,0x86,0x3f,0xa1,
-        0xe9,0x77,0xce,0x50,0xa7,0x39,0x80,0x1e,0x75,0xeb,0x52,0xcc,0x3b,0xa5,0x1c,0x82,
-        0x03,0x9d,0x24,0xba,0x4d,0xd3,0x6a,0xf4,0x9f,0x01,0xb8,0x26,0xd1,0x4f,0xf6,0x68,
-        0x20,0xbe,0x07,0x99,0x6e,0xf0,0x49,0xd7,0xbc,0x22,0x9b,0x05,0xf2,0x6c,0xd5,0x4b,
-        0x45,0xdb,0x62,0xfc,0x0b,0x95,0x2c,0xb2,0xd9,0x47,0xfe,0x60,0x97,0x09,0xb0,0x2e,
-        0x66,0xf8,0x41,0xdf,0x28,0xb6,0x0f,0x91,0xfa,0x64,0xdd,0x43,0xb4,0x2a,0x93,0x0d,
-        0x8f,0x11,0xa8,0x36,0xc1,0x5f,0xe6,0x78,0x13,0x8d,0x34,0xaa,0x5d,0xc3,0x7a,0xe4,
-        0xac,0x32,0x8b,0x15,0xe2,0x7c,0xc5,0x5b,0x30,0xae,0x17,0x89,0x7e,0xe0,0x59,0xc7,
-        0xc9,0x57,0xee,0x70,0x87,0x19,0xa0,0x3e,0x55,0xcb,0x72,0xec,0x1b,0x85,0x3c,0xa2,
-        0xea,0x74,0xcd,0x53,0xa4,0x3a,0x83,0x1d,0x76,0xe8,0x51,0xcf,0x38,0xa6,0x1f,0x81,
-    ),
-    ( # 159
-        0x00,0x9f,0x25,0xba,0x4a,0xd5,0x6f,0xf0,0x94,0x0b,0xb1,0x2e,0xde,0x41,0xfb,0x64,
-        0x33,0xac,0x16,0x89,0x79,0xe6,0x5c,0xc3,0xa7,0x38,0x82,0x1d,0xed,0x72,0xc8,0x57,
-        0x66,0xf9,0x43,0xdc,0x2c,0xb3,0x09,0x96,0xf2,0x6d,0xd7,0x48,0xb8,0x27,0x9d,0x02,
-        0x55,0xca,0x70,0xef,0x1f,0x80,0x3a,0xa5,0xc1,0x5e,0xe4,0x7b,0x8b,0x14,0xae,0x31,
-        0xcc,0x53,0xe9,0x76,0x86,0x19,0xa3,0x3c,0x58,0xc7,0x7d,0xe2,0x12,0x8d,0x37,0xa8,
-        0xff,0x60,0xda,0x45,0xb5,0x2a,0x90,0x0f,0x6b,0xf4,0x4e,0xd1,0x21,0xbe,0x04,0x9b,
-        0xaa,0x35,0x8f,0x10,0xe0,0x7f,0xc5,0x5a,0x3e,0xa1,0x1b,0x84,0x74,0xeb,0x51,0xce,
-        0x99,0x06,0xbc,0x23,0xd3,0x4c,0xf6,0x69,0x0d,0x92,0x28,0xb7,0x47,0xd8,0x62,0xfd,
-        0x83,0x1c,0xa6,0x39,0xc9,0x56,0xec,0x73,0x17,0x88,0x32,0xad,0x5d,0xc2,0x78,0xe7,
-        0xb0,0x2f,0x95,0x0a,0xfa,0x65,0xdf,0x40,0x24,0xbb,0x01,0x9e,0x6e,0xf1,0x4b,0xd4,
-        0xe5,0x7a,0xc0,0x5f,0xaf,0x30,0x8a,0x15,0x71,0xee,0x54,0xcb,0x3b,0xa4,0x1e,0x81,
-        0xd6,0x49,0xf3,0x6c,0x9c,0x03,0xb9,0x26,0x42,0xdd,0x67,0xf8,0x08,0x97,0x2d,0xb2,
-        0x4f,0xd0,0x6a,0xf5,0x05,0x9a,0x20,0xbf,0xdb,0x44,0xfe,0x61,0x91,0x0e,0xb4,0x2b,
-        0x7c,0xe3,0x59,0xc6,0x36,0xa9,0x13,0x8c,0xe8,0x77,0xcd,0x52,0xa2,0x3d,0x87,0x18,
-        0x29,0xb6,0x0c,0x93,0x63,0xfc,0x46,0xd9,0xbd,0x22,0x98,0x07,0xf7,0x68,0xd2,0x4d,
-        0x1a,0x85,0x3f,0xa0,0x50,0xcf,0x75,0xea,0x8e,0x11,0xab,0x34,0xc4,0x5b,0xe1,0x7e,
-    ),
-    ( # 160
-        0x00,0xa0,0x5b,0xfb,0xb6,0x16,0xed,0x4d,0x77,0xd7,0x2c,0x8c,0xc1,0x61,0x9a,0x3a,
-        0xee,0x4e,0xb5,0x15,0x58,0xf8,0x03,0xa3,0x99,0x39,0xc2,0x62,0x2f,0x8f,0x74,0xd4,
-        0xc7,0x67,0x9c,0x3c,0x71,0xd1,0x2a,0x8a,0xb0,0x10,0xeb,0x4b,0x06,0xa6,0x5d,0xfd,
-        0x29,0x89,0x72,0xd2,0x9f,0x3f,0xc4,0x64,0x5e,0xfe,0x05,0xa5,0xe8,0x48,0xb3,0x13,
-        0x95,0x35,0xce,0x6e,0x23,0x83,0x78,0xd8,0xe2,0x42,0xb9,0x19,0x54,0xf4,0x0f,0xaf,
-        0x7b,0xdb,0x20,0x80,0xcd,0x6d,0x96,0x36,0x0c,0xac,0x57,0xf7,0xba,0x1a,0xe1,0x41,
-        0x52,0xf2,0x09,0xa9,0xe4,0x44,0xbf,0x1f,0x25,0x85,0x7e,0xde,0x93,0x33,0xc8,0x68,
-        0xbc,0x1c,0xe7,0x47,0x0a,0xaa,0x51,0xf1,0xcb,0x6b,0x90,0x30,0x7d,0xdd,0x26,0x86,
-        0x31,0x91,0x6a,0xca,0x87,0x27,0xdc,0x7c,0x46,0xe6,0x1d,0xbd,0xf0,0x50,0xab,0x0b,
-        0xdf,0x7f,0x84,0x24,0x69,0xc9,0x32,0x92,0xa8,0x08,0xf3,0x53,0x1e,0xbe,0x45,0xe5,
-        0xf6,0x56,0xad,0x0d,0x40,0xe0,0x1b,0xbb,0x81,0x21,0xda,0x7a,0x37,0x97,0x6c,0xcc,
-        0x18,0xb8,0x43,0xe3,0xae,0x0e,0xf5,0x55,0x6f,0xcf,0x34,0x94,0xd9,0x79,0x82,0x22,
-        0xa4,0x04,0xff,0x5f,0x12,0xb2,0x49,0xe9,0xd3,0x73,0x88,0x28,0x65,0xc5,0x3e,0x9e,
-        0x4a,0xea,0x11,0xb1,0xfc,0x5c,0xa7,0x07,0x3d,0x9d,0x66,0xc6,0x8b,0x2b,0xd0,0x70,
-        0x63,0xc3,0x38,0x98,0xd5,0x75,0x8e,0x2e,0x14,0xb4,0x4f,0xef,0xa2,0x02,0xf9,0x59,
-        0x8d,0x2d,0xd6,0x76,0x3b,0x9b,0x60,0xc0,0xfa,0x5a,0xa1,0x01,0x4c,0xec,0x17,0xb7,
-    ),
-    ( # 161
-        0x00,0xa1,0x59,0xf8,0xb2,0x13,0xeb,0x4a,0x7f,0xde,0x26,0x87,0xcd,0x6c,0x94,0x35,
-        0xfe,0x5f,0xa7,0x06,0x4c,0xed,0x15,0xb4,0x81,0x20,0xd8,0x79,0x33,0x92,0x6a,0xcb,
-        0xe7,0x46,0xbe,0x1f,0x55,0xf4,0x0c,0xad,0x98,0x39,0xc1,0x60,0x2a,0x8b,0x73,0xd2,
-        0x19,0xb8,0x40,0xe1,0xab,0x0a,0xf2,0x53,0x66,0xc7,0x3f,0x9e,0xd4,0x75,0x8d,0x2c,
-        0xd5,0x74,0x8c,0x2d,0x67,0xc6,0x3e,0x9f,0xaa,0x0b,0xf3,0x52,0x18,0xb9,0x41,0xe0,
-        0x2b,0x8a,0x72,0xd3,0x99,0x38,0xc0,0x61,0x54,0xf5,0x0d,0xac,0xe6,0x47,0xbf,0x1e,
-        0x32,0x93,0x6b,0xca,0x80,0x21,0xd9,0x78,0x4d,0xec,0x14,0xb5,0xff,0x5e,0xa6,0x07,
-        0xcc,0x6d,0x95,0x34,0x7e,0xdf,0x27,0x86,0xb3,0x12,0xea,0x4b,0x01,0xa0,0x58,0xf9,
-        0xb1,0x10,0xe8,0x49,0x03,0xa2,0x5a,0xfb,0xce,0x6f,0x97,0x36,0x7c,0xdd,0x25,0x84,
-        0x4f,0xee,0x16,0xb7,0xfd,0x5c,0xa4,0x05,0x30,0x91,0x69,0xc8,0x82,0x23,0xdb,0x7a,
-        0x56,0xf7,0x0f,0xae,0xe4,0x45,0xbd,0x1c,0x29,0x88,0x70,0xd1,0x9b,0x3a,0xc2,0x63,
-        0xa8,0x09,0xf1,0x50,0x1a,0xbb,0x43,0xe2,0xd7,0x76,0x8e,0x2f,0x65,0xc4,0x3c,0x9d,
-        0x64,0xc5,0x3d,0x9c,0xd6,0x77,0x8f,0x2e,0x1b,0xba,0x42,0xe3,0xa9,0x08,0xf0,0x51,
-        0x9a,0x3b,0xc3,0x62,0x28,0x89,0x71,0xd0,0xe5,0x44,0xbc,0x1d,0x57,0xf6,0x0e,0xaf,
-        0x83,0x22,0xda,0x7b,0x31,0x90,0x68,0xc9,0xfc,0x5d,0xa5,0x04,0x4e,0xef,0x17,0xb6,
-        0x7d,0xdc,0x24,0x85,0xcf,0x6e,0x96,0x37,0x02,0xa3,0x5b,0xfa,0xb0,0x11,0xe9,0x48,
-    ),
-    ( # 162
-        0x00,0xa2,0x5f,0xfd,0xbe,0x1c,0xe1,0x43,0x67,0xc5,0x38,0x9a,0xd9,0x7b,0x86,0x24,
-        0xce,0x6c,0x91,0x33,0x70,0xd2,0x2f,0x8d,0xa9,0x0b,0xf6,0x54,0x17,0xb5,0x48,0xea,
-        0x87,0x25,0xd8,0x7a,0x39,0x9b,0x66,0xc4,0xe0,0x42,0xbf,0x1d,0x5e,0xfc,0x01,0xa3,
-        0x49,0xeb,0x16,0xb4,0xf7,0x55,0xa8,0x0a,0x2e,0x8c,0x71,0xd3,0x90,0x32,0xcf,0x6d,
-        0x15,0xb7,0x4a,0xe8,0xab,0x09,0xf4,0x56,0x72,0xd0,0x2d,0x8f,0xcc,0x6e,0x93,0x31,
-        0xdb,0x79,0x84,0x26,0x65,0xc7,0x3a,0x98,0xbc,0x1e,0xe3,0x41,0x02,0xa0,0x5d,0xff,
-        0x92,0x30,0xcd,0x6f,0x2c,0x8e,0x73,0xd1,0xf5,0x57,0xaa,0x08,0x4b,0xe9,0x14,0xb6,
-        0x5c,0xfe,0x03,0xa1,0xe2,0x40,0xbd,0x1f,0x3b,0x99,0x64,0xc6,0x85,0x27,0xda,0x78,
-        0x2a,0x88,0x75,0xd7,0x94,0x36,0xcb,0x69,0x4d,0xef,0x12,0xb0,0xf3,0x51,0xac,0x0e,
-        0xe4,0x46,0xbb,0x19,0x5a,0xf8,0x05,0xa7,0x83,0x21,0xdc,0x7e,0x3d,0x9f,0x62,0xc0,
-        0xad,0x0f,0xf2,0x50,0x13,0xb1,0x4c,0xee,0xca,0x68,0x95,0x37,0x74,0xd6,0x2b,0x89,
-        0x63,0xc1,0x3c,0x9e,0xdd,0x7f,0x82,0x20,0x04,0xa6,0x5b,0xf9,0xba,0x18,0xe5,0x47,
-        0x3f,0x9d,0x60,0xc2,0x81,0x23,0xde,0x7c,0x58,0xfa,0x07,0xa5,0xe6,0x44,0xb9,0x1b,
-        0xf1,0x53,0xae,0x0c,0x4f,0xed,0x10,0xb2,0x96,0x34,0xc9,0x6b,0x28,0x8a,0x77,0xd5,
-        0xb8,0x1a,0xe7,0x45,0x06,0xa4,0x59,0xfb,0xdf,0x7d,0x80,0x22,0x61,0xc3,0x3e,0x9c,
-        0x76,0xd4,0x29,0x8b,0xc8,0x6a,0x97,0x35,0x11,0xb3,0x4e,0xec,0xaf,0x0d,0xf0,0x52,
-    ),
-    ( # 163
-        0x00,0xa3,0x5d,0xfe,0xba,0x19,0xe7,0x44,0x6f,0xcc,0x32,0x91,0xd5,0x76,0x88,0x2b,
-        0xde,0x7d,0x83,0x20,0x64,0xc7,0x39,0x9a,0xb1,0x12,0xec,0x4f,0x0b,0xa8,0x56,0xf5,
-        0xa7,0x04,0xfa,0x59,0x1d,0xbe,0x40,0xe3,0xc8,0x6b,0x95,0x36,0x72,0xd1,0x2f,0x8c,
-        0x79,0xda,0x24,0x87,0xc3,0x60,0x9e,0x3d,0x16,0xb5,0x4b,0xe8,0xac,0x0f,0xf1,0x52,
-        0x55,0xf6,0x08,0xab,0xef,0x4c,0xb2,0x11,0x3a,0x99,0x67,0xc4,0x80,0x23,0xdd,0x7e,
-        0x8b,0x28,0xd6,0x75,0x31,0x92,0x6c,0xcf,0xe4,0x47,0xb9,0x1a,0x5e,0xfd,0x03,0xa0,
-        0xf2,0x51,0xaf,0x0c,0x48,0xeb,0x15,0xb6,0x9d,0x3e,0xc0,0x63,0x27,0x84,0x7a,0xd9,
-        0x2c,0x8f,0x71,0xd2,0x96,0x35,0xcb,0x68,0x43,0xe0,0x1e,0xbd,0xf9,0x5a,0xa4,0x07,
-        0xaa,0x09,0xf7,0x54,0x10,0xb3,0x4d,0xee,0xc5,0x66,0x98,0x3b,0x7f,0xdc,0x22,0x81,
-        0x74,0xd7,0x29,0x8a,0xce,0x6d,0x93,0x30,0x1b,0xb8,0x46,0xe5,0xa1,0x02,0xfc,0x5f,
-        0x0d,0xae,0x50,0xf3,0xb7,0x14,0xea,0x49,0x62,0xc1,0x3f,0x9c,0xd8,0x7b,0x85,0x26,
-        0xd3,0x70,0x8e,0x2d,0x69,0xca,0x34,0x97,0xbc,0x1f,0xe1,0x42,0x06,0xa5,0x5b,0xf8,
-        0xff,0x5c,0xa2,0x01,0x45,0xe6,0x18,0xbb,0x90,0x33,0xcd,0x6e,0x2a,0x89,0x77,0xd4,
-        0x21,0x82,0x7c,0xdf,0x9b,0x38,0xc6,0x65,0x4e,0xed,0x13,0xb0,0xf4,0x57,0xa9,0x0a,
-        0x58,0xfb,0x05,0xa6,0xe2,0x41,0xbf,0x1c,0x37,0x94,0x6a,0xc9,0x8d,0x2e,0xd0,0x73,
-        0x86,0x25,0xdb,0x78,0x3c,0x9f,0x61,0xc2,0xe9,0x4a,0xb4,0x17,0x53,0xf0,0x0e,0xad,
-    ),
-    ( # 164
-        0x00,0xa4,0x53,0xf7,0xa6,0x02,0xf5,0x51,0x57,0xf3,0x04,0xa0,0xf1,0x55,0xa2,0x06,
-        0xae,0x0a,0xfd,0x59,0x08,0xac,0x5b,0xff,0xf9,0x5d,0xaa,0x0e,0x5f,0xfb,0x0c,0xa8,
-        0x47,0xe3,0x14,0xb0,0xe1,0x45,0xb2,0x16,0x10,0xb4,0x43,0xe7,0xb6,0x12,0xe5,0x41,
-        0xe9,0x4d,0xba,0x1e,0x4f,0xeb,0x1c,0xb8,0xbe,0x1a,0xed,0x49,0x18,0xbc,0x4b,0xef,
-        0x8e,0x2a,0xdd,0x79,0x28,0x8c,0x7b,0xdf,0xd9,0x7d,0x8a,0x2e,0x7f,0xdb,0x2c,0x88,
-        0x20,0x84,0x73,0xd7,0x86,0x22,0xd5,0x71,0x77,0xd3,0x24,0x80,0xd1,0x75,0x82,0x26,
-        0xc9,0x6d,0x9a,0x3e,0x6f,0xcb,0x3c,0x98,0x9e,0x3a,0xcd,0x69,0x38,0x9c,0x6b,0xcf,
-        0x67,0xc3,0x34,0x90,0xc1,0x65,0x92,0x36,0x30,0x94,0x63,0xc7,0x96,0x32,0xc5,0x61,
-        0x07,0xa3,0x54,0xf0,0xa1,0x05,0xf2,0x56,0x50,0xf4,0x03,0xa7,0xf6,0x52,0xa5,0x01,
-        0xa9,0x0d,0xfa,0x5e,0x0f,0xab,0x5c,0xf8,0xfe,0x5a,0xad,0x09,0x58,0xfc,0x0b,0xaf,
-        0x40,0xe4,0x13,0xb7,0xe6,0x42,0xb5,0x11,0x17,0xb3,0x44,0xe0,0xb1,0x15,0xe2,0x46,
-        0xee,0x4a,0xbd,0x19,0x48,0xec,0x1b,0xbf,0xb9,0x1d,0xea,0x4e,0x1f,0xbb,0x4c,0xe8,
-        0x89,0x2d,0xda,0x7e,0x2f,0x8b,0x7c,0xd8,0xde,0x7a,0x8d,0x29,0x78,0xdc,0x2b,0x8f,
-        0x27,0x83,0x74,0xd0,0x81,0x25,0xd2,0x76,0x70,0xd4,0x23,0x87,0xd6,0x72,0x85,0x21,
-        0xce,0x6a,0x9d,0x39,0x68,0xcc,0x3b,0x9f,0x99,0x3d,0xca,0x6e,0x3f,0x9b,0x6c,0xc8,
-        0x60,0xc4,0x33,0x97,0xc6,0x62,0x95,0x31,0x37,0x93,0x64,0xc0,0x91,0x35,0xc2,0x66,
-    ),
-    ( # 165
-        0x00,0xa5,0x51,0xf4,0xa2,0x07,0xf3,0x56,0x5f,0xfa,0x0e,0xab,0xfd,0x58,0xac,0x09,
-        0xbe,0x1b,0xef,0x4a,0x1c,0xb9,0x4d,0xe8,0xe1,0x44,0xb0,0x15,0x43,0xe6,0x12,0xb7,
-        0x67,0xc2,0x36,0x93,0xc5,0x60,0x94,0x31,0x38,0x9d,0x69,0xcc,0x9a,0x3f,0xcb,0x6e,
-        0xd9,0x7c,0x88,0x2d,0x7b,0xde,0x2a,0x8f,0x86,0x23,0xd7,0x72,0x24,0x81,0x75,0xd0,
-        0xce,0x6b,0x9f,0x3a,0x6c,0xc9,0x3d,0x98,0x91,0x34,0xc0,0x65,0x33,0x96,0x62,0xc7,
-        0x70,0xd5,0x21,0x84,0xd2,0x77,0x83,0x26,0x2f,0x8a,0x7e,0xdb,0x8d,0x28,0xdc,0x79,
-        0xa9,0x0c,0xf8,0x5d,0x0b,0xae,0x5a,0xff,0xf6,0x53,0xa7,0x02,0x54,0xf1,0x05,0xa0,
-        0x17,0xb2,0x46,0xe3,0xb5,0x10,0xe4,0x41,0x48,0xed,0x19,0xbc,0xea,0x4f,0xbb,0x1e,
-        0x87,0x22,0xd6,0x73,0x25,0x80,0x74,0xd1,0xd8,0x7d,0x89,0x2c,0x7a,0xdf,0x2b,0x8e,
-        0x39,0x9c,0x68,0xcd,0x9b,0x3e,0xca,0x6f,0x66,0xc3,0x37,0x92,0xc4,0x61,0x95,0x30,
-        0xe0,0x45,0xb1,0x14,0x42,0xe7,0x13,0xb6,0xbf,0x1a,0xee,0x4b,0x1d,0xb8,0x4c,0xe9,
-        0x5e,0xfb,0x0f,0xaa,0xfc,0x59,0xad,0x08,0x01,0xa4,0x50,0xf5,0xa3,0x06,0xf2,0x57,
-        0x49,0xec,0x18,0xbd,0xeb,0x4e,0xba,0x1f,0x16,0xb3,0x47,0xe2,0xb4,0x11,0xe5,0x40,
-        0xf7,0x52,0xa6,0x03,0x55,0xf0,0x04,0xa1,0xa8,0x0d,0xf9,0x5c,0x0a,0xaf,0x5b,0xfe,
-        0x2e,0x8b,0x7f,0xda,0x8c,0x29,0xdd,0x78,0x71,0xd4,0x20,0x85,0xd3,0x76,0x82,0x27,
-        0x90,0x35,0xc1,0x64,0x32,0x97,0x63,0xc6,0xcf,0x6a,0x9e,0x3b,0x6d,0xc8,0x3c,0x99,
-    ),
-    ( # 166
-        0x00,0xa6,0x57,0xf1,0xae,0x08,0xf9,0x5f,0x47,0xe1,0x10,0xb6,0xe9,0x4f,0xbe,0x18,
-        0x8e,0x28,0xd9,0x7f,0x20,0x86,0x77,0xd1,0xc9,0x6f,0x9e,0x38,0x67,0xc1,0x30,0x96,
-        0x07,0xa1,0x50,0xf6,0xa9,0x0f,0xfe,0x58,0x40,0xe6,0x17,0xb1,0xee,0x48,0xb9,0x1f,
-        0x89,0x2f,0xde,0x78,0x27,0x81,0x70,0xd6,0xce,0x68,0x99,0x3f,0x60,0xc6,0x37,0x91,
-        0x0e,0xa8,0x59,0xff,0xa0,0x06,0xf7,0x51,0x49,0xef,0x1e,0xb8,0xe7,0x41,0xb0,0x16,
-        0x80,0x26,0xd7,0x71,0x2e,0x88,0x79,0xdf,0xc7,0x61,0x90,0x36,0x69,0xcf,0x3e,0x98,
-        0x09,0xaf,0x5e,0xf8,0xa7,0x01,0xf0,0x56,0x4e,0xe8,0x19,0xbf,0xe0,0x46,0xb7,0x11,
-        0x87,0x21,0xd0,0x76,0x29,0x8f,0x7e,0xd8,0xc0,0x66,0x97,0x31,0x6e,0xc8,0x39,0x9f,
-        0x1c,0xba,0x4b,0xed,0xb2,0x14,0xe5,0x43,0x5b,0xfd,0x0c,0xaa,0xf5,0x53,0xa2,0x04,
-        0x92,0x34,0xc5,0x63,0x3c,0x9a,0x6b,0xcd,0xd5,0x73,0x82,0x24,0x7b,0xdd,0x2c,0x8a,
-        0x1b,0xbd,0x4c,0xea,0xb5,0x13,0xe2,0x44,0x5c,0xfa,0x0b,0xad,0xf2,0x54,0xa5,0x03,
-        0x95,0x33,0xc2,0x64,0x3b,0x9d,0x6c,0xca,0xd2,0x74,0x85,0x23,0x7c,0xda,0x2b,0x8d,
-        0x12,0xb4,0x45,0xe3,0xbc,0x1a,0xeb,0x4d,0x55,0xf3,0x02,0xa4,0xfb,0x5d,0xac,0x0a,
-        0x9c,0x3a,0xcb,0x6d,0x32,0x94,0x65,0xc3,0xdb,0x7d,0x8c,0x2a,0x75,0xd3,0x22,0x84,
-        0x15,0xb3,0x42,0xe4,0xbb,0x1d,0xec,0x4a,0x52,0xf4,0x05,0xa3,0xfc,0x5a,0xab,0x0d,
-        0x9b,0x3d,0xcc,0x6a,0x35,0x93,0x62,0xc4,0xdc,0x7a,0x8b,0x2d,0x72,0xd4,0x25,0x83,
-    ),
-    ( # 167
-        0x00,0xa7,0x55,0xf2,0xaa,0x0d,0xff,0x58,0x4f,0xe8,0x1a,0xbd,0xe5,0x42,0xb0,0x17,
-        0x9e,0x39,0xcb,0x6c,0x34,0x93,0x61,0xc6,0xd1,0x76,0x84,0x23,0x7b,0xdc,0x2e,0x89,
-        0x27,0x80,0x72,0xd5,0x8d,0x2a,0xd8,0x7f,0x68,0xcf,0x3d,0x9a,0xc2,0x65,0x97,0x30,
-        0xb9,0x1e,0xec,0x4b,0x13,0xb4,0x46,0xe1,0xf6,0x51,0xa3,0x04,0x5c,0xfb,0x09,0xae,
-        0x4e,0xe9,0x1b,0xbc,0xe4,0x43,0xb1,0x16,0x01,0xa6,0x54,0xf3,0xab,0x0c,0xfe,0x59,
-        0xd0,0x77,0x85,0x22,0x7a,0xdd,0x2f,0x88,0x9f,0x38,0xca,0x6d,0x35,0x92,0x60,0xc7,
-        0x69,0xce,0x3c,0x9b,0xc3,0x64,0x96,0x31,0x26,0x81,0x73,0xd4,0x8c,0x2b,0xd9,0x7e,
-        0xf7,0x50,0xa2,0x05,0x5d,0xfa,0x08,0xaf,0xb8,0x1f,0xed,0x4a,0x12,0xb5,0x47,0xe0,
-        0x9c,0x3b,0xc9,0x6e,0x36,0x91,0x63,0xc4,0xd3,0x74,0x86,0x21,0x79,0xde,0x2c,0x8b,
-        0x02,0xa5,0x57,0xf0,0xa8,0x0f,0xfd,0x5a,0x4d,0xea,0x18,0xbf,0xe7,0x40,0xb2,0x15,
-        0xbb,0x1c,0xee,0x49,0x11,0xb6,0x44,0xe3,0xf4,0x53,0xa1,0x06,0x5e,0xf9,0x0b,0xac,
-        0x25,0x82,0x70,0xd7,0x8f,0x28,0xda,0x7d,0x6a,0xcd,0x3f,0x98,0xc0,0x67,0x95,0x32,
-        0xd2,0x75,0x87,0x20,0x78,0xdf,0x2d,0x8a,0x9d,0x3a,0xc8,0x6f,0x37,0x90,0x62,0xc5,
-        0x4c,0xeb,0x19,0xbe,0xe6,0x41,0xb3,0x14,0x03,0xa4,0x56,0xf1,0xa9,0x0e,0xfc,0x5b,
-        0xf5,0x52,0xa0,0x07,0x5f,0xf8,0x0a,0xad,0xba,0x1d,0xef,0x48,0x10,0xb7,0x45,0xe2,
-        0x6b,0xcc,0x3e,0x99,0xc1,0x66,0x94,0x33,0x24,0x83,0x71,0xd6,0x8e,0x29,0xdb,0x7c,
-    ),
-    ( # 168
-        0x00,0xa8,0x4b,0xe3,0x96,0x3e,0xdd,0x75,0x37,0x9f,0x7c,0xd4,0xa1,0x09,0xea,0x42,
-        0x6e,0xc6,0x25,0x8d,0xf8,0x50,0xb3,0x1b,0x59,0xf1,0x12,0xba,0xcf,0x67,0x84,0x2c,
-        0xdc,0x74,0x97,0x3f,0x4a,0xe2,0x01,0xa9,0xeb,0x43,0xa0,0x08,0x7d,0xd5,0x36,0x9e,
-        0xb2,0x1a,0xf9,0x51,0x24,0x8c,0x6f,0xc7,0x85,0x2d,0xce,0x66,0x13,0xbb,0x58,0xf0,
-        0xa3,0x0b,0xe8,0x40,0x35,0x9d,0x7e,0xd6,0x94,0x3c,0xdf,0x77,0x02,0xaa,0x49,0xe1,
-        0xcd,0x65,0x86,0x2e,0x5b,0xf3,0x10,0xb8,0xfa,0x52,0xb1,0x19,0x6c,0xc4,0x27,0x8f,
-        0x7f,0xd7,0x34,0x9c,0xe9,0x41,0xa2,0x0a,0x48,0xe0,0x03,0xab,0xde,0x76,0x95,0x3d,
-        0x11,0xb9,0x5a,0xf2,0x87,0x2f,0xcc,0x64,0x26,0x8e,0x6d,0xc5,0xb0,0x18,0xfb,0x53,
-        0x5d,0xf5,0x16,0xbe,0xcb,0x63,0x80,0x28,0x6a,0xc2,0x21,0x89,0xfc,0x54,0xb7,0x1f,
-        0x33,0x9b,0x78,0xd0,0xa5,0x0d,0xee,0x46,0x04,0xac,0x4f,0xe7,0x92,0x3a,0xd9,0x71,
-        0x81,0x29,0xca,0x62,0x17,0xbf,0x5c,0xf4,0xb6,0x1e,0xfd,0x55,0x20,0x88,0x6b,0xc3,
-        0xef,0x47,0xa4,0x0c,0x79,0xd1,0x32,0x9a,0xd8,0x70,0x93,0x3b,0x4e,0xe6,0x05,0xad,
-        0xfe,0x56,0xb5,0x1d,0x68,0xc0,0x23,0x8b,0xc9,0x61,0x82,0x2a,0x5f,0xf7,0x14,0xbc,
-        0x90,0x38,0xdb,0x73,0x06,0xae,0x4d,0xe5,0xa7,0x0f,0xec,0x44,0x31,0x99,0x7a,0xd2,
-        0x22,0x8a,0x69,0xc1,0xb4,0x1c,0xff,0x57,0x15,0xbd,0x5e,0xf6,0x83,0x2b,0xc8,0x60,
-        0x4c,0xe4,0x07,0xaf,0xda,0x72,0x91,0x39,0x7b,0xd3,0x30,0x98,0xed,0x45,0xa6,0x0e,
-    ),
-    ( # 169
-        0x00,0xa9,0x49,0xe0,0x92,0x3b,0xdb,0x72,0x3f,0x96,0x76,0xdf,0xad,0x04,0xe4,0x4d,
-        0x7e,0xd7,0x37,0x9e,0xec,0x45,0xa5,0x0c,0x41,0xe8,0x08,0xa1,0xd3,0x7a,0x9a,0x33,
-        0xfc,0x55,0xb5,0x1c,0x6e,0xc7,0x27,0x8e,0xc3,0x6a,0x8a,0x23,0x51,0xf8,0x18,0xb1,
-        0x82,0x2b,0xcb,0x62,0x10,0xb9,0x59,0xf0,0xbd,0x14,0xf4,0x5d,0x2f,0x86,0x66,0xcf,
-        0xe3,0x4a,0xaa,0x03,0x71,0xd8,0x38,0x91,0xdc,0x75,0x95,0x3c,0x4e,0xe7,0x07,0xae,
-        0x9d,0x34,0xd4,0x7d,0x0f,0xa6,0x46,0xef,0xa2,0x0b,0xeb,0x42,0x30,0x99,0x79,0xd0,
-        0x1f,0xb6,0x56,0xff,0x8d,0x24,0xc4,0x6d,0x20,0x89,0x69,0xc0,0xb2,0x1b,0xfb,0x52,
-        0x61,0xc8,0x28,0x81,0xf3,0x5a,0xba,0x13,0x5e,0xf7,0x17,0xbe,0xcc,0x65,0x85,0x2c,
-        0xdd,0x74,0x94,0x3d,0x4f,0xe6,0x06,0xaf,0xe2,0x4b,0xab,0x02,0x70,0xd9,0x39,0x90,
-        0xa3,0x0a,0xea,0x43,0x31,0x98,0x78,0xd1,0x9c,0x35,0xd5,0x7c,0x0e,0xa7,0x47,0xee,
-        0x21,0x88,0x68,0xc1,0xb3,0x1a,0xfa,0x53,0x1e,0xb7,0x57,0xfe,0x8c,0x25,0xc5,0x6c,
-        0x5f,0xf6,0x16,0xbf,0xcd,0x64,0x84,0x2d,0x60,0xc9,0x29,0x80,0xf2,0x5b,0xbb,0x12,
-        0x3e,0x97,0x77,0xde,0xac,0x05,0xe5,0x4c,0x01,0xa8,0x48,0xe1,0x93,0x3a,0xda,0x73,
-        0x40,0xe9,0x09,0xa0,0xd2,0x7b,0x9b,0x32,0x7f,0xd6,0x36,0x9f,0xed,0x44,0xa4,0x0d,
-        0xc2,0x6b,0x8b,0x22,0x50,0xf9,0x19,0xb0,0xfd,0x54,0xb4,0x1d,0x6f,0xc6,0x26,0x8f,
-        0xbc,0x15,0xf5,0x5c,0x2e,0x87,0x67,0xce,0x83,0x2a,0xca,0x63,0x11,0xb8,0x58,0xf1,
-    ),
-    ( # 170
-        0x00,0xaa,0x4f,0xe5,0x9e,0x34,0xd1,0x7b,0x27,0x8d,0x68,0xc2,0xb9,0x13,0xf6,0x5c,
-        0x4e,0xe4,0x01,0xab,0xd0,0x7a,0x9f,0x35,0x69,0xc3,0x26,0x8c,0xf7,0x5d,0xb8,0x12,
-        0x9c,0x36,0xd3,0x79,0x02,0xa8,0x4d,0xe7,0xbb,0x11,0xf4,0x5e,0x25,0x8f,0x6a,0xc0,
-        0xd2,0x78,0x9d,0x37,0x4c,0xe6,0x03,0xa9,0xf5,0x5f,0xba,0x10,0x6b,0xc1,0x24,0x8e,
-        0x23,0x89,0x6c,0xc6,0xbd,0x17,0xf2,0x58,0x04,0xae,0x4b,0xe1,0x9a,0x30,0xd5,0x7f,
-        0x6d,0xc7,0x22,0x88,0xf3,0x59,0xbc,0x16,0x4a,0xe0,0x05,0xaf,0xd4,0x7e,0x9b,0x31,
-        0xbf,0x15,0xf0,0x5a,0x21,0x8b,0x6e,0xc4,0x98,0x32,0xd7,0x7d,0x06,0xac,0x49,0xe3,
-        0xf1,0x5b,0xbe,0x14,0x6f,0xc5,0x20,0x8a,0xd6,0x7c,0x99,0x33,0x48,0xe2,0x07,0xad,
-        0x46,0xec,0x09,0xa3,0xd8,0x72,0x97,0x3d,0x61,0xcb,0x2e,0x84,0xff,0x55,0xb0,0x1a,
-        0x08,0xa2,0x47,0xed,0x96,0x3c,0xd9,0x73,0x2f,0x85,0x60,0xca,0xb1,0x1b,0xfe,0x54,
-        0xda,0x70,0x95,0x3f,0x44,0xee,0x0b,0xa1,0xfd,0x57,0xb2,0x18,0x63,0xc9,0x2c,0x86,
-        0x94,0x3e,0xdb,0x71,0x0a,0xa0,0x45,0xef,0xb3,0x19,0xfc,0x56,0x2d,0x87,0x62,0xc8,
-        0x65,0xcf,0x2a,0x80,0xfb,0x51,0xb4,0x1e,0x42,0xe8,0x0d,0xa7,0xdc,0x76,0x93,0x39,
-        0x2b,0x81,0x64,0xce,0xb5,0x1f,0xfa,0x50,0x0c,0xa6,0x43,0xe9,0x92,0x38,0xdd,0x77,
-        0xf9,0x53,0xb6,0x1c,0x67,0xcd,0x28,0x82,0xde,0x74,0x91,0x3b,0x40,0xea,0x0f,0xa5,
-        0xb7,0x1d,0xf8,0x52,0x29,0x83,0x66,0xcc,0x90,0x3a,0xdf,0x75,0x0e,0xa4,0x41,0xeb,
-    ),
-    ( # 171
-        0x00,0xab,0x4d,0xe6,0x9a,0x31,0xd7,0x7c,0x2f,0x84,0x62,0xc9,0xb5,0x1e,0xf8,0x53,
-        0x5e,0xf5,0x13,0xb8,0xc4,0x6f,0x89,0x22,0x71,0xda,0x3c,0x97,0xeb,0x40,0xa6,0x0d,
-        0xbc,0x17,0xf1,0x5a,0x26,0x8d,0x6b,0xc0,0x93,0x38,0xde,0x75,0x09,0xa2,0x44,0xef,
-        0xe2,0x49,0xaf,0x04,0x78,0xd3,0x35,0x9e,0xcd,0x66,0x80,0x2b,0x57,0xfc,0x1a,0xb1,
-        0x63,0xc8,0x2e,0x85,0xf9,0x52,0xb4,0x1f,0x4c,0xe7,0x01,0xaa,0xd6,0x7d,0x9b,0x30,
-        0x3d,0x96,0x70,0xdb,0xa7,0x0c,0xea,0x41,0x12,0xb9,0x5f,0xf4,0x88,0x23,0xc5,0x6e,
-        0xdf,0x74,0x92,0x39,0x45,0xee,0x08,0xa3,0xf0,0x5b,0xbd,0x16,0x6a,0xc1,0x27,0x8c,
-        0x81,0x2a,0xcc,0x67,0x1b,0xb0,0x56,0xfd,0xae,0x05,0xe3,0x48,0x34,0x9f,0x79,0xd2,
-        0xc6,0x6d,0x8b,0x20,0x5c,0xf7,0x11,0xba,0xe9,0x42,0xa4,0x0f,0x73,0xd8,0x3e,0x95,
-        0x98,0x33,0xd5,0x7e,0x02,0xa9,0x4f,0xe4,0xb7,0x1c,0xfa,0x51,0x2d,0x86,0x60,0xcb,
-        0x7a,0xd1,0x37,0x9c,0xe0,0x4b,0xad,0x06,0x55,0xfe,0x18,0xb3,0xcf,0x64,0x82,0x29,
-        0x24,0x8f,0x69,0xc2,0xbe,0x15,0xf3,0x58,0x0b,0xa0,0x46,0xed,0x91,0x3a,0xdc,0x77,
-        0xa5,0x0e,0xe8,0x43,0x3f,0x94,0x72,0xd9,0x8a,0x21,0xc7,0x6c,0x10,0xbb,0x5d,0xf6,
-        0xfb,0x50,0xb6,0x1d,0x61,0xca,0x2c,0x87,0xd4,0x7f,0x99,0x32,0x4e,0xe5,0x03,0xa8,
-        0x19,0xb2,0x54,0xff,0x83,0x28,0xce,0x65,0x36,0x9d,0x7b,0xd0,0xac,0x07,0xe1,0x4a,
-        0x47,0xec,0x0a,0xa1,0xdd,0x76,0x90,0x3b,0x68,0xc3,0x25,0x8e,0xf2,0x59,0xbf,0x14,
-    ),
-    ( # 172
-        0x00,0xac,0x43,0xef,0x86,0x2a,0xc5,0x69,0x17,0xbb,0x54,0xf8,0x91,0x3d,0xd2,0x7e,
-        0x2e,0x82,0x6d,0xc1,0xa8,0x04,0xeb,0x47,0x39,0x95,0x7a,0xd6,0xbf,0x13,0xfc,0x50,
-        0x5c,0xf0,0x1f,0xb3,0xda,0x76,0x99,0x35,0x4b,0xe7,0x08,0xa4,0xcd,0x61,0x8e,0x22,
-        0x72,0xde,0x31,0x9d,0xf4,0x58,0xb7,0x1b,0x65,0xc9,0x26,0x8a,0xe3,0x4f,0xa0,0x0c,
-        0xb8,0x14,0xfb,0x57,0x3e,0x92,0x7d,0xd1,0xaf,0x03,0xec,0x40,0x29,0x85,0x6a,0xc6,
-        0x96,0x3a,0xd5,0x79,0x10,0xbc,0x53,0xff,0x81,0x2d,0xc2,0x6e,0x07,0xab,0x44,0xe8,
-        0xe4,0x48,0xa7,0x0b,0x62,0xce,0x21,0x8d,0xf3,0x5f,0xb0,0x1c,0x75,0xd9,0x36,0x9a,
-        0xca,0x66,0x89,0x25,0x4c,0xe0,0x0f,0xa3,0xdd,0x71,0x9e,0x32,0x5b,0xf7,0x18,0xb4,
-        0x6b,0xc7,0x28,0x84,0xed,0x41,0xae,0x02,0x7c,0xd0,0x3f,0x93,0xfa,0x56,0xb9,0x15,
-        0x45,0xe9,0x06,0xaa,0xc3,0x6f,0x80,0x2c,0x52,0xfe,0x11,0xbd,0xd4,0x78,0x97,0x3b,
-        0x37,0x9b,0x74,0xd8,0xb1,0x1d,0xf2,0x5e,0x20,0x8c,0x63,0xcf,0xa6,0x0a,0xe5,0x49,
-        0x19,0xb5,0x5a,0xf6,0x9f,0x33,0xdc,0x70,0x0e,0xa2,0x4d,0xe1,0x88,0x24,0xcb,0x67,
-        0xd3,0x7f,0x90,0x3c,0x55,0xf9,0x16,0xba,0xc4,0x68,0x87,0x2b,0x42,0xee,0x01,0xad,
-        0xfd,0x51,0xbe,0x12,0x7b,0xd7,0x38,0x94,0xea,0x46,0xa9,0x05,0x6c,0xc0,0x2f,0x83,
-        0x8f,0x23,0xcc,0x60,0x09,0xa5,0x4a,0xe6,0x98,0x34,0xdb,0x77,0x1e,0xb2,0x5d,0xf1,
-        0xa1,0x0d,0xe2,0x4e,0x27,0x8b,0x64,0xc8,0xb6,0x1a,0xf5,0x59,0x30,0x9c,0x73,0xdf,
-    ),
-    ( # 173
-        0x00,0xad,0x41,0xec,0x82,0x2f,0xc3,0x6e,0x1f,0xb2,0x5e,0xf3,0x9d,0x30,0xdc,0x71,
-        0x3e,0x93,0x7f,0xd2,0xbc,0x11,0xfd,0x50,0x21,0x8c,0x60,0xcd,0xa3,0x0e,0xe2,0x4f,
-        0x7c,0xd1,0x3d,0x90,0xfe,0x53,0xbf,0x12,0x63,0xce,0x22,0x8f,0xe1,0x4c,0xa0,0x0d,
-        0x42,0xef,0x03,0xae,0xc0,0x6d,0x81,0x2c,0x5d,0xf0,0x1c,0xb1,0xdf,0x72,0x9e,0x33,
-        0xf8,0x55,0xb9,0x14,0x7a,0xd7,0x3b,0x96,0xe7,0x4a,0xa6,0x0b,0x65,0xc8,0x24,0x89,
-        0xc6,0x6b,0x87,0x2a,0x44,0xe9,0x05,0xa8,0xd9,0x74,0x98,0x35,0x5b,0xf6,0x1a,0xb7,
-        0x84,0x29,0xc5,0x68,0x06,0xab,0x47,0xea,0x9b,0x36,0xda,0x77,0x19,0xb4,0x58,0xf5,
-        0xba,0x17,0xfb,0x56,0x38,0x95,0x79,0xd4,0xa5,0x08,0xe4,0x49,0x27,0x8a,0x66,0xcb,
-        0xeb,0x46,0xaa,0x07,0x69,0xc4,0x28,0x85,0xf4,0x59,0xb5,0x18,0x76,0xdb,0x37,0x9a,
-        0xd5,0x78,0x94,0x39,0x57,0xfa,0x16,0xbb,0xca,0x67,0x8b,0x26,0x48,0xe5,0x09,0xa4,
-        0x97,0x3a,0xd6,0x7b,0x15,0xb8,0x54,0xf9,0x88,0x25,0xc9,0x64,0x0a,0xa7,0x4b,0xe6,
-        0xa9,0x04,0xe8,0x45,0x2b,0x86,0x6a,0xc7,0xb6,0x1b,0xf7,0x5a,0x34,0x99,0x75,0xd8,
-        0x13,0xbe,0x52,0xff,0x91,0x3c,0xd0,0x7d,0x0c,0xa1,0x4d,0xe0,0x8e,0x23,0xcf,0x62,
-        0x2d,0x80,0x6c,0xc1,0xaf,0x02,0xee,0x43,0x32,0x9f,0x73,0xde,0xb0,0x1d,0xf1,0x5c,
-        0x6f,0xc2,0x2e,0x83,0xed,0x40,0xac,0x01,0x70,0xdd,0x31,0x9c,0xf2,0x5f,0xb3,0x1e,
-        0x51,0xfc,0x10,0xbd,0xd3,0x7e,0x92,0x3f,0x4e,0xe3,0x0f,0xa2,0xcc,0x61,0x8d,0x20,
-    ),
-    ( # 174
-        0x00,0xae,0x47,0xe9,0x8e,0x20,0xc9,0x67,0x07,0xa9,0x40,0xee,0x89,0x27,0xce,0x60,
-        0x0e,0xa0,0x49,0xe7,0x80,0x2e,0xc7,0x69,0x09,0xa7,0x4e,0xe0,0x87,0x29,0xc0,0x6e,
-        0x1c,0xb2,0x5b,0xf5,0x92,0x3c,0xd5,0x7b,0x1b,0xb5,0x5c,0xf2,0x95,0x3b,0xd2,0x7c,
-        0x12,0xbc,0x55,0xfb,0x9c,0x32,0xdb,0x75,0x15,0xbb,0x52,0xfc,0x9b,0x35,0xdc,0x72,
-        0x38,0x96,0x7f,0xd1,0xb6,0x18,0xf1,0x5f,0x3f,0x91,0x78,0xd6,0xb1,0x1f,0xf6,0x58,
-        0x36,0x98,0x71,0xdf,0xb8,0x16,0xff,0x51,0x31,0x9f,0x76,0xd8,0xbf,0x11,0xf8,0x56,
-        0x24,0x8a,0x63,0xcd,0xaa,0x04,0xed,0x43,0x23,0x8d,0x64,0xca,0xad,0x03,0xea,0x44,
-        0x2a,0x84,0x6d,0xc3,0xa4,0x0a,0xe3,0x4d,0x2d,0x83,0x6a,0xc4,0xa3,0x0d,0xe4,0x4a,
-        0x70,0xde,0x37,0x99,0xfe,0x50,0xb9,0x17,0x77,0xd9,0x30,0x9e,0xf9,0x57,0xbe,0x10,
-        0x7e,0xd0,0x39,0x97,0xf0,0x5e,0xb7,0x19,0x79,0xd7,0x3e,0x90,0xf7,0x59,0xb0,0x1e,
-        0x6c,0xc2,0x2b,0x85,0xe2,0x4c,0xa5,0x0b,0x6b,0xc5,0x2c,0x82,0xe5,0x4b,0xa2,0x0c,
-        0x62,0xcc,0x25,0x8b,0xec,0x42,0xab,0x05,0x65,0xcb,0x22,0x8c,0xeb,0x45,0xac,0x02,
-        0x48,0xe6,0x0f,0xa1,0xc6,0x68,0x81,0x2f,0x4f,0xe1,0x08,0xa6,0xc1,0x6f,0x86,0x28,
-        0x46,0xe8,0x01,0xaf,0xc8,0x66,0x8f,0x21,0x41,0xef,0x06,0xa8,0xcf,0x61,0x88,0x26,
-        0x54,0xfa,0x13,0xbd,0xda,0x74,0x9d,0x33,0x53,0xfd,0x14,0xba,0xdd,0x73,0x9a,0x34,
-        0x5a,0xf4,0x1d,0xb3,0xd4,0x7a,0x93,0x3d,0x5d,0xf3,0x1a,0xb4,0xd3,0x7d,0x94,0x3a,
-    ),
-    ( # 175
-        0x00,0xaf,0x45,0xea,0x8a,0x25,0xcf,0x60,0x0f,0xa0,0x4a,0xe5,0x85,0x2a,0xc0,0x6f,
-        0x1e,0xb1,0x5b,0xf4,0x94,0x3b,0xd1,0x7e,0x11,0xbe,0x54,0xfb,0x9b,0x34,0xde,0x71,
-        0x3c,0x93,0x79,0xd6,0xb6,0x19,0xf3,0x5c,0x33,0x9c,0x76,0xd9,0xb9,0x16,0xfc,0x53,
-        0x22,0x8d,0x67,0xc8,0xa8,0x07,0xed,0x42,0x2d,0x82,0x68,0xc7,0xa7,0x08,0xe2,0x4d,
-        0x78,0xd7,0x3d,0x92,0xf2,0x5d,0xb7,0x18,0x77,0xd8,0x32,0x9d,0xfd,0x52,0xb8,0x17,
-        0x66,0xc9,0x23,0x8c,0xec,0x43,0xa9,0x06,0x69,0xc6,0x2c,0x83,0xe3,0x4c,0xa6,0x09,
-        0x44,0xeb,0x01,0xae,0xce,0x61,0x8b,0x24,0x4b,0xe4,0x0e,0xa1,0xc1,0x6e,0x84,0x2b,
-        0x5a,0xf5,0x1f,0xb0,0xd0,0x7f,0x95,0x3a,0x55,0xfa,0x10,0xbf,0xdf,0x70,0x9a,0x35,
-        0xf0,0x5f,0xb5,0x1a,0x7a,0xd5,0x3f,0x90,0xff,0x50,0xba,0x15,0x75,0xda,0x30,0x9f,
-        0xee,0x41,0xab,0x04,0x64,0xcb,0x21,0x8e,0xe1,0x4e,0xa4,0x0b,0x6b,0xc4,0x2e,0x81,
-        0xcc,0x63,0x89,0x26,0x46,0xe9,0x03,0xac,0xc3,0x6c,0x86,0x29,0x49,0xe6,0x0c,0xa3,
-        0xd2,0x7d,0x97,0x38,0x58,0xf7,0x1d,0xb2,0xdd,0x72,0x98,0x37,0x57,0xf8,0x12,0xbd,
-        0x88,0x27,0xcd,0x62,0x02,0xad,0x47,0xe8,0x87,0x28,0xc2,0x6d,0x0d,0xa2,0x48,0xe7,
-        0x96,0x39,0xd3,0x7c,0x1c,0xb3,0x59,0xf6,0x99,0x36,0xdc,0x73,0x13,0xbc,0x56,0xf9,
-        0xb4,0x1b,0xf1,0x5e,0x3e,0x91,0x7b,0xd4,0xbb,0x14,0xfe,0x51,0x31,0x9e,0x74,0xdb,
-        0xaa,0x05,0xef,0x40,0x20,0x8f,0x65,0xca,0xa5,0x0a,0xe0,0x4f,0x2f,0x80,0x6a,0xc5,
-    ),
-    ( # 176
-        0x00,0xb0,0x7b,0xcb,0xf6,0x46,0x8d,0x3d,0xf7,0x47,0x8c,0x3c,0x01,0xb1,0x7a,0xca,
-        0xf5,0x45,0x8e,0x3e,0x03,0xb3,0x78,0xc8,0x02,0xb2,0x79,0xc9,0xf4,0x44,0x8f,0x3f,
-        0xf1,0x41,0x8a,0x3a,0x07,0xb7,0x7c,0xcc,0x06,0xb6,0x7d,0xcd,0xf0,0x40,0x8b,0x3b,
-        0x04,0xb4,0x7f,0xcf,0xf2,0x42,0x89,0x39,0xf3,0x43,0x88,0x38,0x05,0xb5,0x7e,0xce,
-        0xf9,0x49,0x82,0x32,0x0f,0xbf,0x74,0xc4,0x0e,0xbe,0x75,0xc5,0xf8,0x48,0x83,0x33,
-        0x0c,0xbc,0x77,0xc7,0xfa,0x4a,0x81,0x31,0xfb,0x4b,0x80,0x30,0x0d,0xbd,0x76,0xc6,
-        0x08,0xb8,0x73,0xc3,0xfe,0x4e,0x85,0x35,0xff,0x4f,0x84,0x34,0x09,0xb9,0x72,0xc2,
-        0xfd,0x4d,0x86,0x36,0x0b,0xbb,0x70,0xc0,0x0a,0xba,0x71,0xc1,0xfc,0x4c,0x87,0x37,
-        0xe9,0x59,0x92,0x22,0x1f,0xaf,0x64,0xd4,0x1e,0xae,0x65,0xd5,0xe8,0x58,0x93,0x23,
-        0x1c,0xac,0x67,0xd7,0xea,0x5a,0x91,0x21,0xeb,0x5b,0x90,0x20,0x1d,0xad,0x66,0xd6,
-        0x18,0xa8,0x63,0xd3,0xee,0x5e,0x95,0x25,0xef,0x5f,0x94,0x24,0x19,0xa9,0x62,0xd2,
-        0xed,0x5d,0x96,0x26,0x1b,0xab,0x60,0xd0,0x1a,0xaa,0x61,0xd1,0xec,0x5c,0x97,0x27,
-        0x10,0xa0,0x6b,0xdb,0xe6,0x56,0x9d,0x2d,0xe7,0x57,0x9c,0x2c,0x11,0xa1,0x6a,0xda,
-        0xe5,0x55,0x9e,0x2e,0x13,0xa3,0x68,0xd8,0x12,0xa2,0x69,0xd9,0xe4,0x54,0x9f,0x2f,
-        0xe1,0x51,0x9a,0x2a,0x17,0xa7,0x6c,0xdc,0x16,0xa6,0x6d,0xdd,0xe0,0x50,0x9b,0x2b,
-        0x14,0xa4,0x6f,0xdf,0xe2,0x52,0x99,0x29,0xe3,0x53,0x98,0x28,0x15,0xa5,0x6e,0xde,
-    ),
-    ( # 177
-        0x00,0xb1,0x79,0xc8,0xf2,0x43,0x8b,0x3a,0xff,0x4e,0x86,0x37,0x0d,0xbc,0x74,0xc5,
-        0xe5,0x54,0x9c,0x2d,0x17,0xa6,0x6e,0xdf,0x1a,0xab,0x63,0xd2,0xe8,0x59,0x91,0x20,
-        0xd1,0x60,0xa8,0x19,0x23,0x92,0x5a,0xeb,0x2e,0x9f,0x57,0xe6,0xdc,0x6d,0xa5,0x14,
-        0x34,0x85,0x4d,0xfc,0xc6,0x77,0xbf,0x0e,0xcb,0x7a,0xb2,0x03,0x39,0x88,0x40,0xf1,
-        0xb9,0x08,0xc0,0x71,0x4b,0xfa,0x32,0x83,0x46,0xf7,0x3f,0x8e,0xb4,0x05,0xcd,0x7c,
-        0x5c,0xed,0x25,0x94,0xae,0x1f,0xd7,0x66,0xa3,0x12,0xda,0x6b,0x51,0xe0,0x28,0x99,
-        0x68,0xd9,0x11,0xa0,0x9a,0x2b,0xe3,0x52,0x97,0x26,0xee,0x5f,0x65,0xd4,0x1c,0xad,
-        0x8d,0x3c,0xf4,0x45,0x7f,0xce,0x06,0xb7,0x72,0xc3,0x0b,0xba,0x80,0x31,0xf9,0x48,
-        0x69,0xd8,0x10,0xa1,0x9b,0x2a,0xe2,0x53,0x96,0x27,0xef,0x5e,0x64,0xd5,0x1d,0xac,
-        0x8c,0x3d,0xf5,0x44,0x7e,0xcf,0x07,0xb6,0x73,0xc2,0x0a,0xbb,0x81,0x30,0xf8,0x49,
-        0xb8,0x09,0xc1,0x70,0x4a,0xfb,0x33,0x82,0x47,0xf6,0x3e,0x8f,0xb5,0x04,0xcc,0x7d,
-        0x5d,0xec,0x24,0x95,0xaf,0x1e,0xd6,0x67,0xa2,0x13,0xdb,0x6a,0x50,0xe1,0x29,0x98,
-        0xd0,0x61,0xa9,0x18,0x22,0x93,0x5b,0xea,0x2f,0x9e,0x56,0xe7,0xdd,0x6c,0xa4,0x15,
-        0x35,0x84,0x4c,0xfd,0xc7,0x76,0xbe,0x0f,0xca,0x7b,0xb3,0x02,0x38,0x89,0x41,0xf0,
-        0x01,0xb0,0x78,0xc9,0xf3,0x42,0x8a,0x3b,0xfe,0x4f,0x87,0x36,0x0c,0xbd,0x75,0xc4,
-        0xe4,0x55,0x9d,0x2c,0x16,0xa7,0x6f,0xde,0x1b,0xaa,0x62,0xd3,0xe9,0x58,0x90,0x21,
-    ),
-    ( # 178
-        0x00,0xb2,0x7f,0xcd,0xfe,0x4c,0x81,0x33,0xe7,0x55,0x98,0x2a,0x19,0xab,0x66,0xd4,
-        0xd5,0x67,0xaa,0x18,0x2b,0x99,0x54,0xe6,0x32,0x80,0x4d,0xff,0xcc,0x7e,0xb3,0x01,
-        0xb1,0x03,0xce,0x7c,0x4f,0xfd,0x30,0x82,0x56,0xe4,0x29,0x9b,0xa8,0x1a,0xd7,0x65,
-        0x64,0xd6,0x1b,0xa9,0x9a,0x28,0xe5,0x57,0x83,0x31,0xfc,0x4e,0x7d,0xcf,0x02,0xb0,
-        0x79,0xcb,0x06,0xb4,0x87,0x35,0xf8,0x4a,0x9e,0x2c,0xe1,0x53,0x60,0xd2,0x1f,0xad,
-        0xac,0x1e,0xd3,0x61,0x52,0xe0,0x2d,0x9f,0x4b,0xf9,0x34,0x86,0xb5,0x07,0xca,0x78,
-        0xc8,0x7a,0xb7,0x05,0x36,0x84,0x49,0xfb,0x2f,0x9d,0x50,0xe2,0xd1,0x63,0xae,0x1c,
-        0x1d,0xaf,0x62,0xd0,0xe3,0x51,0x9c,0x2e,0xfa,0x48,0x85,0x37,0x04,0xb6,0x7b,0xc9,
-        0xf2,0x40,0x8d,0x3f,0x0c,0xbe,0x73,0xc1,0x15,0xa7,0x6a,0xd8,0xeb,0x59,0x94,0x26,
-        0x27,0x95,0x58,0xea,0xd9,0x6b,0xa6,0x14,0xc0,0x72,0xbf,0x0d,0x3e,0x8c,0x41,0xf3,
-        0x43,0xf1,0x3c,0x8e,0xbd,0x0f,0xc2,0x70,0xa4,0x16,0xdb,0x69,0x5a,0xe8,0x25,0x97,
-        0x96,0x24,0xe9,0x5b,0x68,0xda,0x17,0xa5,0x71,0xc3,0x0e,0xbc,0x8f,0x3d,0xf0,0x42,
-        0x8b,0x39,0xf4,0x46,0x75,0xc7,0x0a,0xb8,0x6c,0xde,0x13,0xa1,0x92,0x20,0xed,0x5f,
-        0x5e,0xec,0x21,0x93,0xa0,0x12,0xdf,0x6d,0xb9,0x0b,0xc6,0x74,0x47,0xf5,0x38,0x8a,
-        0x3a,0x88,0x45,0xf7,0xc4,0x76,0xbb,0x09,0xdd,0x6f,0xa2,0x10,0x23,0x91,0x5c,0xee,
-        0xef,0x5d,0x90,0x22,0x11,0xa3,0x6e,0xdc,0x08,0xba,0x77,0xc5,0xf6,0x44,0x89,0x3b,
-    ),
-    ( # 179
-        0x00,0xb3,0x7d,0xce,0xfa,0x49,0x87,0x34,0xef,0x5c,0x92,0x21,0x15,0xa6,0x68,0xdb,
-        0xc5,0x76,0xb8,0x0b,0x3f,0x8c,0x42,0xf1,0x2a,0x99,0x57,0xe4,0xd0,0x63,0xad,0x1e,
-        0x91,0x22,0xec,0x5f,0x6b,0xd8,0x16,0xa5,0x7e,0xcd,0x03,0xb0,0x84,0x37,0xf9,0x4a,
-        0x54,0xe7,0x29,0x9a,0xae,0x1d,0xd3,0x60,0xbb,0x08,0xc6,0x75,0x41,0xf2,0x3c,0x8f,
-        0x39,0x8a,0x44,0xf7,0xc3,0x70,0xbe,0x0d,0xd6,0x65,0xab,0x18,0x2c,0x9f,0x51,0xe2,
-        0xfc,0x4f,0x81,0x32,0x06,0xb5,0x7b,0xc8,0x13,0xa0,0x6e,0xdd,0xe9,0x5a,0x94,0x27,
-        0xa8,0x1b,0xd5,0x66,0x52,0xe1,0x2f,0x9c,0x47,0xf4,0x3a,0x89,0xbd,0x0e,0xc0,0x73,
-        0x6d,0xde,0x10,0xa3,0x97,0x24,0xea,0x59,0x82,0x31,0xff,0x4c,0x78,0xcb,0x05,0xb6,
-        0x72,0xc1,0x0f,0xbc,0x88,0x3b,0xf5,0x46,0x9d,0x2e,0xe0,0x53,0x67,0xd4,0x1a,0xa9,
-        0xb7,0x04,0xca,0x79,0x4d,0xfe,0x30,0x83,0x58,0xeb,0x25,0x96,0xa2,0x11,0xdf,0x6c,
-        0xe3,0x50,0x9e,0x2d,0x19,0xaa,0x64,0xd7,0x0c,0xbf,0x71,0xc2,0xf6,0x45,0x8b,0x38,
-        0x26,0x95,0x5b,0xe8,0xdc,0x6f,0xa1,0x12,0xc9,0x7a,0xb4,0x07,0x33,0x80,0x4e,0xfd,
-        0x4b,0xf8,0x36,0x85,0xb1,0x02,0xcc,0x7f,0xa4,0x17,0xd9,0x6a,0x5e,0xed,0x23,0x90,
-        0x8e,0x3d,0xf3,0x40,0x74,0xc7,0x09,0xba,0x61,0xd2,0x1c,0xaf,0x9b,0x28,0xe6,0x55,
-        0xda,0x69,0xa7,0x14,0x20,0x93,0x5d,0xee,0x35,0x86,0x48,0xfb,0xcf,0x7c,0xb2,0x01,
-        0x1f,0xac,0x62,0xd1,0xe5,0x56,0x98,0x2b,0xf0,0x43,0x8d,0x3e,0x0a,0xb9,0x77,0xc4,
-    ),
-    ( # 180
-        0x00,0xb4,0x73,0xc7,0xe6,0x52,0x95,0x21,0xd7,0x63,0xa4,0x10,0x31,0x85,0x42,0xf6,
-        0xb5,0x01,0xc6,0x72,0x53,0xe7,0x20,0x94,0x62,0xd6,0x11,0xa5,0x84,0x30,0xf7,0x43,
-        0x71,0xc5,0x02,0xb6,0x97,0x23,0xe4,0x50,0xa6,0x12,0xd5,0x61,0x40,0xf4,0x33,0x87,
-        0xc4,0x70,0xb7,0x03,0x22,0x96,0x51,0xe5,0x13,0xa7,0x60,0xd4,0xf5,0x41,0x86,0x32,
-        0xe2,0x56,0x91,0x25,0x04,0xb0,0x77,0xc3,0x35,0x81,0x46,0xf2,0xd3,0x67,0xa0,0x14,
-        0x57,0xe3,0x24,0x90,0xb1,0x05,0xc2,0x76,0x80,0x34,0xf3,0x47,0x66,0xd2,0x15,0xa1,
-        0x93,0x27,0xe0,0x54,0x75,0xc1,0x06,0xb2,0x44,0xf0,0x37,0x83,0xa2,0x16,0xd1,0x65,
-        0x26,0x92,0x55,0xe1,0xc0,0x74,0xb3,0x07,0xf1,0x45,0x82,0x36,0x17,0xa3,0x64,0xd0,
-        0xdf,0x6b,0xac,0x18,0x39,0x8d,0x4a,0xfe,0x08,0xbc,0x7b,0xcf,0xee,0x5a,0x9d,0x29,
-        0x6a,0xde,0x19,0xad,0x8c,0x38,0xff,0x4b,0xbd,0x09,0xce,0x7a,0x5b,0xef,0x28,0x9c,
-        0xae,0x1a,0xdd,0x69,0x48,0xfc,0x3b,0x8f,0x79,0xcd,0x0a,0xbe,0x9f,0x2b,0xec,0x58,
-        0x1b,0xaf,0x68,0xdc,0xfd,0x49,0x8e,0x3a,0xcc,0x78,0xbf,0x0b,0x2a,0x9e,0x59,0xed,
-        0x3d,0x89,0x4e,0xfa,0xdb,0x6f,0xa8,0x1c,0xea,0x5e,0x99,0x2d,0x0c,0xb8,0x7f,0xcb,
-        0x88,0x3c,0xfb,0x4f,0x6e,0xda,0x1d,0xa9,0x5f,0xeb,0x2c,0x98,0xb9,0x0d,0xca,0x7e,
-        0x4c,0xf8,0x3f,0x8b,0xaa,0x1e,0xd9,0x6d,0x9b,0x2f,0xe8,0x5c,0x7d,0xc9,0x0e,0xba,
-        0xf9,0x4d,0x8a,0x3e,0x1f,0xab,0x6c,0xd8,0x2e,0x9a,0x5d,0xe9,0xc8,0x7c,0xbb,0x0f,
-    ),
-    ( # 181
-        0x00,0xb5,0x71,0xc4,0xe2,0x57,0x93,0x26,0xdf,0x6a,0xae,0x1b,0x3d,0x88,0x4c,0xf9,
-        0xa5,0x10,0xd4,0x61,0x47,0xf2,0x36,0x83,0x7a,0xcf,0x0b,0xbe,0x98,0x2d,0xe9,0x5c,
-        0x51,0xe4,0x20,0x95,0xb3,0x06,0xc2,0x77,0x8e,0x3b,0xff,0x4a,0x6c,0xd9,0x1d,0xa8,
-        0xf4,0x41,0x85,0x30,0x16,0xa3,0x67,0xd2,0x2b,0x9e,0x5a,0xef,0xc9,0x7c,0xb8,0x0d,
-        0xa2,0x17,0xd3,0x66,0x40,0xf5,0x31,0x84,0x7d,0xc8,0x0c,0xb9,0x9f,0x2a,0xee,0x5b,
-        0x07,0xb2,0x76,0xc3,0xe5,0x50,0x94,0x21,0xd8,0x6d,0xa9,0x1c,0x3a,0x8f,0x4b,0xfe,
-        0xf3,0x46,0x82,0x37,0x11,0xa4,0x60,0xd5,0x2c,0x99,0x5d,0xe8,0xce,0x7b,0xbf,0x0a,
-        0x56,0xe3,0x27,0x92,0xb4,0x01,0xc5,0x70,0x89,0x3c,0xf8,0x4d,0x6b,0xde,0x1a,0xaf,
-        0x5f,0xea,0x2e,0x9b,0xbd,0x08,0xcc,0x79,0x80,0x35,0xf1,0x44,0x62,0xd7,0x13,0xa6,
-        0xfa,0x4f,0x8b,0x3e,0x18,0xad,0x69,0xdc,0x25,0x90,0x54,0xe1,0xc7,0x72,0xb6,0x03,
-        0x0e,0xbb,0x7f,0xca,0xec,0x59,0x9d,0x28,0xd1,0x64,0xa0,0x15,0x33,0x86,0x42,0xf7,
-        0xab,0x1e,0xda,0x6f,0x49,0xfc,0x38,0x8d,0x74,0xc1,0x05,0xb0,0x96,0x23,0xe7,0x52,
-        0xfd,0x48,0x8c,0x39,0x1f,0xaa,0x6e,0xdb,0x22,0x97,0x53,0xe6,0xc0,0x75,0xb1,0x04,
-        0x58,0xed,0x29,0x9c,0xba,0x0f,0xcb,0x7e,0x87,0x32,0xf6,0x43,0x65,0xd0,0x14,0xa1,
-        0xac,0x19,0xdd,0x68,0x4e,0xfb,0x3f,0x8a,0x73,0xc6,0x02,0xb7,0x91,0x24,0xe0,0x55,
-        0x09,0xbc,0x78,0xcd,0xeb,0x5e,0x9a,0x2f,0xd6,0x63,0xa7,0x12,0x34,0x81,0x45,0xf0,
-    ),
-    ( # 182
-        0x00,0xb6,0x77,0xc1,0xee,0x58,0x99,0x2f,0xc7,0x71,0xb0,0x06,0x29,0x9f,0x5e,0xe8,
-        0x95,0x23,0xe2,0x54,0x7b,0xcd,0x0c,0xba,0x52,0xe4,0x25,0x93,0xbc,0x0a,0xcb,0x7d,
-        0x31,0x87,0x46,0xf0,0xdf,0x69,0xa8,0x1e,0xf6,0x40,0x81,0x37,0x18,0xae,0x6f,0xd9,
-        0xa4,0x12,0xd3,0x65,0x4a,0xfc,0x3d,0x8b,0x63,0xd5,0x14,0xa2,0x8d,0x3b,0xfa,0x4c,
-        0x62,0xd4,0x15,0xa3,0x8c,0x3a,0xfb,0x4d,0xa5,0x13,0xd2,0x64,0x4b,0xfd,0x3c,0x8a,
-        0xf7,0x41,0x80,0x36,0x19,0xaf,0x6e,0xd8,0x30,0x86,0x47,0xf1,0xde,0x68,0xa9,0x1f,
-        0x53,0xe5,0x24,0x92,0xbd,0x0b,0xca,0x7c,0x94,0x22,0xe3,0x55,0x7a,0xcc,0x0d,0xbb,
-        0xc6,0x70,0xb1,0x07,0x28,0x9e,0x5f,0xe9,0x01,0xb7,0x76,0xc0,0xef,0x59,0x98,0x2e,
-        0xc4,0x72,0xb3,0x05,0x2a,0x9c,0x5d,0xeb,0x03,0xb5,0x74,0xc2,0xed,0x5b,0x9a,0x2c,
-        0x51,0xe7,0x26,0x90,0xbf,0x09,0xc8,0x7e,0x96,0x20,0xe1,0x57,0x78,0xce,0x0f,0xb9,
-        0xf5,0x43,0x82,0x34,0x1b,0xad,0x6c,0xda,0x32,0x84,0x45,0xf3,0xdc,0x6a,0xab,0x1d,
-        0x60,0xd6,0x17,0xa1,0x8e,0x38,0xf9,0x4f,0xa7,0x11,0xd0,0x66,0x49,0xff,0x3e,0x88,
-        0xa6,0x10,0xd1,0x67,0x48,0xfe,0x3f,0x89,0x61,0xd7,0x16,0xa0,0x8f,0x39,0xf8,0x4e,
-        0x33,0x85,0x44,0xf2,0xdd,0x6b,0xaa,0x1c,0xf4,0x42,0x83,0x35,0x1a,0xac,0x6d,0xdb,
-        0x97,0x21,0xe0,0x56,0x79,0xcf,0x0e,0xb8,0x50,0xe6,0x27,0x91,0xbe,0x08,0xc9,0x7f,
-        0x02,0xb4,0x75,0xc3,0xec,0x5a,0x9b,0x2d,0xc5,0x73,0xb2,0x04,0x2b,0x9d,0x5c,0xea,
-    ),
-    ( # 183
-        0x00,0xb7,0x75,0xc2,0xea,0x5d,0x9f,0x28,0xcf,0x78,0xba,0x0d,0x25,0x92,0x50,0xe7,
-        0x85,0x32,0xf0,0x47,0x6f,0xd8,0x1a,0xad,0x4a,0xfd,0x3f,0x88,0xa0,0x17,0xd5,0x62,
-        0x11,0xa6,0x64,0xd3,0xfb,0x4c,0x8e,0x39,0xde,0x69,0xab,0x1c,0x34,0x83,0x41,0xf6,
-        0x94,0x23,0xe1,0x56,0x7e,0xc9,0x0b,0xbc,0x5b,0xec,0x2e,0x99,0xb1,0x06,0xc4,0x73,
-        0x22,0x95,0x57,0xe0,0xc8,0x7f,0xbd,0x0a,0xed,0x5a,0x98,0x2f,0x07,0xb0,0x72,0xc5,
-        0xa7,0x10,0xd2,0x65,0x4d,0xfa,0x38,0x8f,0x68,0xdf,0x1d,0xaa,0x82,0x35,0xf7,0x40,
-        0x33,0x84,0x46,0xf1,0xd9,0x6e,0xac,0x1b,0xfc,0x4b,0x89,0x3e,0x16,0xa1,0x63,0xd4,
-        0xb6,0x01,0xc3,0x74,0x5c,0xeb,0x29,0x9e,0x79,0xce,0x0c,0xbb,0x93,0x24,0xe6,0x51,
-        0x44,0xf3,0x31,0x86,0xae,0x19,0xdb,0x6c,0x8b,0x3c,0xfe,0x49,0x61,0xd6,0x14,0xa3,
-        0xc1,0x76,0xb4,0x03,0x2b,0x9c,0x5e,0xe9,0x0e,0xb9,0x7b,0xcc,0xe4,0x53,0x91,0x26,
-        0x55,0xe2,0x20,0x97,0xbf,0x08,0xca,0x7d,0x9a,0x2d,0xef,0x58,0x70,0xc7,0x05,0xb2,
-        0xd0,0x67,0xa5,0x12,0x3a,0x8d,0x4f,0xf8,0x1f,0xa8,0x6a,0xdd,0xf5,0x42,0x80,0x37,
-        0x66,0xd1,0x13,0xa4,0x8c,0x3b,0xf9,0x4e,0xa9,0x1e,0xdc,0x6b,0x43,0xf4,0x36,0x81,
-        0xe3,0x54,0x96,0x21,0x09,0xbe,0x7c,0xcb,0x2c,0x9b,0x59,0xee,0xc6,0x71,0xb3,0x04,
-        0x77,0xc0,0x02,0xb5,0x9d,0x2a,0xe8,0x5f,0xb8,0x0f,0xcd,0x7a,0x52,0xe5,0x27,0x90,
-        0xf2,0x45,0x87,0x30,0x18,0xaf,0x6d,0xda,0x3d,0x8a,0x48,0xff,0xd7,0x60,0xa2,0x15,
-    ),
-    ( # 184
-        0x00,0xb8,0x6b,0xd3,0xd6,0x6e,0xbd,0x05,0xb7,0x0f,0xdc,0x64,0x61,0xd9,0x0a,0xb2,
-        0x75,0xcd,0x1e,0xa6,0xa3,0x1b,0xc8,0x70,0xc2,0x7a,0xa9,0x11,0x14,0xac,0x7f,0xc7,
-        0xea,0x52,0x81,0x39,0x3c,0x84,0x57,0xef,0x5d,0xe5,0x36,0x8e,0x8b,0x33,0xe0,0x58,
-        0x9f,0x27,0xf4,0x4c,0x49,0xf1,0x22,0x9a,0x28,0x90,0x43,0xfb,0xfe,0x46,0x95,0x2d,
-        0xcf,0x77,0xa4,0x1c,0x19,0xa1,0x72,0xca,0x78,0xc0,0x13,0xab,0xae,0x16,0xc5,0x7d,
-        0xba,0x02,0xd1,0x69,0x6c,0xd4,0x07,0xbf,0x0d,0xb5,0x66,0xde,0xdb,0x63,0xb0,0x08,
-        0x25,0x9d,0x4e,0xf6,0xf3,0x4b,0x98,0x20,0x92,0x2a,0xf9,0x41,0x44,0xfc,0x2f,0x97,
-        0x50,0xe8,0x3b,0x83,0x86,0x3e,0xed,0x55,0xe7,0x5f,0x8c,0x34,0x31,0x89,0x5a,0xe2,
-        0x85,0x3d,0xee,0x56,0x53,0xeb,0x38,0x80,0x32,0x8a,0x59,0xe1,0xe4,0x5c,0x8f,0x37,
-        0xf0,0x48,0x9b,0x23,0x26,0x9e,0x4d,0xf5,0x47,0xff,0x2c,0x94,0x91,0x29,0xfa,0x42,
-        0x6f,0xd7,0x04,0xbc,0xb9,0x01,0xd2,0x6a,0xd8,0x60,0xb3,0x0b,0x0e,0xb6,0x65,0xdd,
-        0x1a,0xa2,0x71,0xc9,0xcc,0x74,0xa7,0x1f,0xad,0x15,0xc6,0x7e,0x7b,0xc3,0x10,0xa8,
-        0x4a,0xf2,0x21,0x99,0x9c,0x24,0xf7,0x4f,0xfd,0x45,0x96,0x2e,0x2b,0x93,0x40,0xf8,
-        0x3f,0x87,0x54,0xec,0xe9,0x51,0x82,0x3a,0x88,0x30,0xe3,0x5b,0x5e,0xe6,0x35,0x8d,
-        0xa0,0x18,0xcb,0x73,0x76,0xce,0x1d,0xa5,0x17,0xaf,0x7c,0xc4,0xc1,0x79,0xaa,0x12,
-        0xd5,0x6d,0xbe,0x06,0x03,0xbb,0x68,0xd0,0x62,0xda,0x09,0xb1,0xb4,0x0c,0xdf,0x67,
-    ),
-    ( # 185
-        0x00,0xb9,0x69,0xd0,0xd2,0x6b,0xbb,0x02,0xbf,0x06,0xd6,0x6f,0x6d,0xd4,0x04,0xbd,
-        0x65,0xdc,0x0c,0xb5,0xb7,0x0e,0xde,0x67,0xda,0x63,0xb3,0x0a,0x08,0xb1,0x61,0xd8,
-        0xca,0x73,0xa3,0x1a,0x18,0xa1,0x71,0xc8,0x75,0xcc,0x1c,0xa5,0xa7,0x1e,0xce,0x77,
-        0xaf,0x16,0xc6,0x7f,0x7d,0xc4,0x14,0xad,0x10,0xa9,0x79,0xc0,0xc2,0x7b,0xab,0x12,
-        0x8f,0x36,0xe6,0x5f,0x5d,0xe4,0x34,0x8d,0x30,0x89,0x59,0xe0,0xe2,0x5b,0x8b,0x32,
-        0xea,0x53,0x83,0x3a,0x38,0x81,0x51,0xe8,0x55,0xec,0x3c,0x85,0x87,0x3e,0xee,0x57,
-        0x45,0xfc,0x2c,0x95,0x97,0x2e,0xfe,0x47,0xfa,0x43,0x93,0x2a,0x28,0x91,0x41,0xf8,
-        0x20,0x99,0x49,0xf0,0xf2,0x4b,0x9b,0x22,0x9f,0x26,0xf6,0x4f,0x4d,0xf4,0x24,0x9d,
-        0x05,0xbc,0x6c,0xd5,0xd7,0x6e,0xbe,0x07,0xba,0x03,0xd3,0x6a,0x68,0xd1,0x01,0xb8,
-        0x60,0xd9,0x09,0xb0,0xb2,0x0b,0xdb,0x62,0xdf,0x66,0xb6,0x0f,0x0d,0xb4,0x64,0xdd,
-        0xcf,0x76,0xa6,0x1f,0x1d,0xa4,0x74,0xcd,0x70,0xc9,0x19,0xa0,0xa2,0x1b,0xcb,0x72,
-        0xaa,0x13,0xc3,0x7a,0x78,0xc1,0x11,0xa8,0x15,0xac,0x7c,0xc5,0xc7,0x7e,0xae,0x17,
-        0x8a,0x33,0xe3,0x5a,0x58,0xe1,0x31,0x88,0x35,0x8c,0x5c,0xe5,0xe7,0x5e,0x8e,0x37,
-        0xef,0x56,0x86,0x3f,0x3d,0x84,0x54,0xed,0x50,0xe9,0x39,0x80,0x82,0x3b,0xeb,0x52,
-        0x40,0xf9,0x29,0x90,0x92,0x2b,0xfb,0x42,0xff,0x46,0x96,0x2f,0x2d,0x94,0x44,0xfd,
-        0x25,0x9c,0x4c,0xf5,0xf7,0x4e,0x9e,0x27,0x9a,0x23,0xf3,0x4a,0x48,0xf1,0x21,0x98,
-    ),
-    ( # 186
-        0x00,0xba,0x6f,0xd5,0xde,0x64,0xb1,0x0b,0xa7,0x1d,0xc8,0x72,0x79,0xc3,0x16,0xac,
-        0x55,0xef,0x3a,0x80,0x8b,0x31,0xe4,0x5e,0xf2,0x48,0x9d,0x27,0x2c,0x96,0x43,0xf9,
-        0xaa,0x10,0xc5,0x7f,0x74,0xce,0x1b,0xa1,0x0d,0xb7,0x62,0xd8,0xd3,0x69,0xbc,0x06,
-        0xff,0x45,0x90,0x2a,0x21,0x9b,0x4e,0xf4,0x58,0xe2,0x37,0x8d,0x86,0x3c,0xe9,0x53,
-        0x4f,0xf5,0x20,0x9a,0x91,0x2b,0xfe,0x44,0xe8,0x52,0x87,0x3d,0x36,0x8c,0x59,0xe3,
-        0x1a,0xa0,0x75,0xcf,0xc4,0x7e,0xab,0x11,0xbd,0x07,0xd2,0x68,0x63,0xd9,0x0c,0xb6,
-        0xe5,0x5f,0x8a,0x30,0x3b,0x81,0x54,0xee,0x42,0xf8,0x2d,0x97,0x9c,0x26,0xf3,0x49,
-        0xb0,0x0a,0xdf,0x65,0x6e,0xd4,0x01,0xbb,0x17,0xad,0x78,0xc2,0xc9,0x73,0xa6,0x1c,
-        0x9e,0x24,0xf1,0x4b,0x40,0xfa,0x2f,0x95,0x39,0x83,0x56,0xec,0xe7,0x5d,0x88,0x32,
-        0xcb,0x71,0xa4,0x1e,0x15,0xaf,0x7a,0xc0,0x6c,0xd6,0x03,0xb9,0xb2,0x08,0xdd,0x67,
-        0x34,0x8e,0x5b,0xe1,0xea,0x50,0x85,0x3f,0x93,0x29,0xfc,0x46,0x4d,0xf7,0x22,0x98,
-        0x61,0xdb,0x0e,0xb4,0xbf,0x05,0xd0,0x6a,0xc6,0x7c,0xa9,0x13,0x18,0xa2,0x77,0xcd,
-        0xd1,0x6b,0xbe,0x04,0x0f,0xb5,0x60,0xda,0x76,0xcc,0x19,0xa3,0xa8,0x12,0xc7,0x7d,
-        0x84,0x3e,0xeb,0x51,0x5a,0xe0,0x35,0x8f,0x23,0x99,0x4c,0xf6,0xfd,0x47,0x92,0x28,
-        0x7b,0xc1,0x14,0xae,0xa5,0x1f,0xca,0x70,0xdc,0x66,0xb3,0x09,0x02,0xb8,0x6d,0xd7,
-        0x2e,0x94,0x41,0xfb,0xf0,0x4a,0x9f,0x25,0x89,0x33,0xe6,0x5c,0x57,0xed,0x38,0x82,
-    ),
-    ( # 187
-        0x00,0xbb,0x6d,0xd6,0xda,0x61,0xb7,0x0c,0xaf,0x14,0xc2,0x79,0x75,0xce,0x18,0xa3,
-        0x45,0xfe,0x28,0x93,0x9f,0x24,0xf2,0x49,0xea,0x51,0x87,0x3c,0x30,0x8b,0x5d,0xe6,
-        0x8a,0x31,0xe7,0x5c,0x50,0xeb,0x3d,0x86,0x25,0x9e,0x48,0xf3,0xff,0x44,0x92,0x29,
-        0xcf,0x74,0xa2,0x19,0x15,0xae,0x78,0xc3,0x60,0xdb,0x0d,0xb6,0xba,0x01,0xd7,0x6c,
-        0x0f,0xb4,0x62,0xd9,0xd5,0x6e,0xb8,0x03,0xa0,0x1b,0xcd,0x76,0x7a,0xc1,0x17,0xac,
-        0x4a,0xf1,0x27,0x9c,0x90,0x2b,0xfd,0x46,0xe5,0x5e,0x88,0x33,0x3f,0x84,0x52,0xe9,
-        0x85,0x3e,0xe8,0x53,0x5f,0xe4,0x32,0x89,0x2a,0x91,0x47,0xfc,0xf0,0x4b,0x9d,0x26,
-        0xc0,0x7b,0xad,0x16,0x1a,0xa1,0x77,0xcc,0x6f,0xd4,0x02,0xb9,0xb5,0x0e,0xd8,0x63,
-        0x1e,0xa5,0x73,0xc8,0xc4,0x7f,0xa9,0x12,0xb1,0x0a,0xdc,0x67,0x6b,0xd0,0x06,0xbd,
-        0x5b,0xe0,0x36,0x8d,0x81,0x3a,0xec,0x57,0xf4,0x4f,0x99,0x22,0x2e,0x95,0x43,0xf8,
-        0x94,0x2f,0xf9,0x42,0x4e,0xf5,0x23,0x98,0x3b,0x80,0x56,0xed,0xe1,0x5a,0x8c,0x37,
-        0xd1,0x6a,0xbc,0x07,0x0b,0xb0,0x66,0xdd,0x7e,0xc5,0x13,0xa8,0xa4,0x1f,0xc9,0x72,
-        0x11,0xaa,0x7c,0xc7,0xcb,0x70,0xa6,0x1d,0xbe,0x05,0xd3,0x68,0x64,0xdf,0x09,0xb2,
-        0x54,0xef,0x39,0x82,0x8e,0x35,0xe3,0x58,0xfb,0x40,0x96,0x2d,0x21,0x9a,0x4c,0xf7,
-        0x9b,0x20,0xf6,0x4d,0x41,0xfa,0x2c,0x97,0x34,0x8f,0x59,0xe2,0xee,0x55,0x83,0x38,
-        0xde,0x65,0xb3,0x08,0x04,0xbf,0x69,0xd2,0x71,0xca,0x1c,0xa7,0xab,0x10,0xc6,0x7d,
-    ),
-    ( # 188
-        0x00,0xbc,0x63,0xdf,0xc6,0x7a,0xa5,0x19,0x97,0x2b,0xf4,0x48,0x51,0xed,0x32,0x8e,
-        0x35,0x89,0x56,0xea,0xf3,0x4f,0x90,0x2c,0xa2,0x1e,0xc1,0x7d,0x64,0xd8,0x07,0xbb,
-        0x6a,0xd6,0x09,0xb5,0xac,0x10,0xcf,0x73,0xfd,0x41,0x9e,0x22,0x3b,0x87,0x58,0xe4,
-        0x5f,0xe3,0x3c,0x80,0x99,0x25,0xfa,0x46,0xc8,0x74,0xab,0x17,0x0e,0xb2,0x6d,0xd1,
-        0xd4,0x68,0xb7,0x0b,0x12,0xae,0x71,0xcd,0x43,0xff,0x20,0x9c,0x85,0x39,0xe6,0x5a,
-        0xe1,0x5d,0x82,0x3e,0x27,0x9b,0x44,0xf8,0x76,0xca,0x15,0xa9,0xb0,0x0c,0xd3,0x6f,
-        0xbe,0x02,0xdd,0x61,0x78,0xc4,0x1b,0xa7,0x29,0x95,0x4a,0xf6,0xef,0x53,0x8c,0x30,
-        0x8b,0x37,0xe8,0x54,0x4d,0xf1,0x2e,0x92,0x1c,0xa0,0x7f,0xc3,0xda,0x66,0xb9,0x05,
-        0xb3,0x0f,0xd0,0x6c,0x75,0xc9,0x16,0xaa,0x24,0x98,0x47,0xfb,0xe2,0x5e,0x81,0x3d,
-        0x86,0x3a,0xe5,0x59,0x40,0xfc,0x23,0x9f,0x11,0xad,0x72,0xce,0xd7,0x6b,0xb4,0x08,
-        0xd9,0x65,0xba,0x06,0x1f,0xa3,0x7c,0xc0,0x4e,0xf2,0x2d,0x91,0x88,0x34,0xeb,0x57,
-        0xec,0x50,0x8f,0x33,0x2a,0x96,0x49,0xf5,0x7b,0xc7,0x18,0xa4,0xbd,0x01,0xde,0x62,
-        0x67,0xdb,0x04,0xb8,0xa1,0x1d,0xc2,0x7e,0xf0,0x4c,0x93,0x2f,0x36,0x8a,0x55,0xe9,
-        0x52,0xee,0x31,0x8d,0x94,0x28,0xf7,0x4b,0xc5,0x79,0xa6,0x1a,0x03,0xbf,0x60,0xdc,
-        0x0d,0xb1,0x6e,0xd2,0xcb,0x77,0xa8,0x14,0x9a,0x26,0xf9,0x45,0x5c,0xe0,0x3f,0x83,
-        0x38,0x84,0x5b,0xe7,0xfe,0x42,0x9d,0x21,0xaf,0x13,0xcc,0x70,0x69,0xd5,0x0a,0xb6,
-    ),
-    ( # 189
-        0x00,0xbd,0x61,0xdc,0xc2,0x7f,0xa3,0x1e,0x9f,0x22,0xfe,0x43,0x5d,0xe0,0x3c,0x81,
-        0x25,0x98,0x44,0xf9,0xe7,0x5a,0x86,0x3b,0xba,0x07,0xdb,0x66,0x78,0xc5,0x19,0xa4,
-        0x4a,0xf7,0x2b,0x96,0x88,0x35,0xe9,0x54,0xd5,0x68,0xb4,0x09,0x17,0xaa,0x76,0xcb,
-        0x6f,0xd2,0x0e,0xb3,0xad,0x10,0xcc,0x71,0xf0,0x4d,0x91,0x2c,0x32,0x8f,0x53,0xee,
-        0x94,0x29,0xf5,0x48,0x56,0xeb,0x37,0x8a,0x0b,0xb6,0x6a,0xd7,0xc9,0x74,0xa8,0x15,
-        0xb1,0x0c,0xd0,0x6d,0x73,0xce,0x12,0xaf,0x2e,0x93,0x4f,0xf2,0xec,0x51,0x8d,0x30,
-        0xde,0x63,0xbf,0x02,0x1c,0xa1,0x7d,0xc0,0x41,0xfc,0x20,0x9d,0x83,0x3e,0xe2,0x5f,
-        0xfb,0x46,0x9a,0x27,0x39,0x84,0x58,0xe5,0x64,0xd9,0x05,0xb8,0xa6,0x1b,0xc7,0x7a,
-        0x33,0x8e,0x52,0xef,0xf1,0x4c,0x90,0x2d,0xac,0x11,0xcd,0x70,0x6e,0xd3,0x0f,0xb2,
-        0x16,0xab,0x77,0xca,0xd4,0x69,0xb5,0x08,0x89,0x34,0xe8,0x55,0x4b,0xf6,0x2a,0x97,
-        0x79,0xc4,0x18,0xa5,0xbb,0x06,0xda,0x67,0xe6,0x5b,0x87,0x3a,0x24,0x99,0x45,0xf8,
-        0x5c,0xe1,0x3d,0x80,0x9e,0x23,0xff,0x42,0xc3,0x7e,0xa2,0x1f,0x01,0xbc,0x60,0xdd,
-        0xa7,0x1a,0xc6,0x7b,0x65,0xd8,0x04,0xb9,0x38,0x85,0x59,0xe4,0xfa,0x47,0x9b,0x26,
-        0x82,0x3f,0xe3,0x5e,0x40,0xfd,0x21,0x9c,0x1d,0xa0,0x7c,0xc1,0xdf,0x62,0xbe,0x03,
-        0xed,0x50,0x8c,0x31,0x2f,0x92,0x4e,0xf3,0x72,0xcf,0x13,0xae,0xb0,0x0d,0xd1,0x6c,
-        0xc8,0x75,0xa9,0x14,0x0a,0xb7,0x6b,0xd6,0x57,0xea,0x36,0x8b,0x95,0x28,0xf4,0x49,
-    ),
-    ( # 190
-        0x00,0xbe,0x67,0xd9,0xce,0x70,0xa9,0x17,0x87,0x39,0xe0,0x5e,0x49,0xf7,0x2e,0x90,
-        0x15,0xab,0x72,0xcc,0xdb,0x65,0xbc,0x02,0x92,0x2c,0xf5,0x4b,0x5c,0xe2,0x3b,0x85,
-        0x2a,0x94,0x4d,0xf3,0xe4,0x5a,0x83,0x3d,0xad,0x13,0xca,0x74,0x63,0xdd,0x04,0xba,
-        0x3f,0x81,0x58,0xe6,0xf1,0x4f,0x96,0x28,0xb8,0x06,0xdf,0x61,0x76,0xc8,0x11,0xaf,
-        0x54,0xea,0x33,0x8d,0x9a,0x24,0xfd,0x43,0xd3,0x6d,0xb4,0x0a,0x1d,0xa3,0x7a,0xc4,
-        0x41,0xff,0x26,0x98,0x8f,0x31,0xe8,0x56,0xc6,0x78,0xa1,0x1f,0x08,0xb6,0x6f,0xd1,
-        0x7e,0xc0,0x19,0xa7,0xb0,0x0e,0xd7,0x69,0xf9,0x47,0x9e,0x20,0x37,0x89,0x50,0xee,
-        0x6b,0xd5,0x0c,0xb2,0xa5,0x1b,0xc2,0x7c,0xec,0x52,0x8b,0x35,0x22,0x9c,0x45,0xfb,
-        0xa8,0x16,0xcf,0x71,0x66,0xd8,0x01,0xbf,0x2f,0x91,0x48,0xf6,0xe1,0x5f,0x86,0x38,
-        0xbd,0x03,0xda,0x64,0x73,0xcd,0x14,0xaa,0x3a,0x84,0x5d,0xe3,0xf4,0x4a,0x93,0x2d,
-        0x82,0x3c,0xe5,0x5b,0x4c,0xf2,0x2b,0x95,0x05,0xbb,0x62,0xdc,0xcb,0x75,0xac,0x12,
-        0x97,0x29,0xf0,0x4e,0x59,0xe7,0x3e,0x80,0x10,0xae,0x77,0xc9,0xde,0x60,0xb9,0x07,
-        0xfc,0x42,0x9b,0x25,0x32,0x8c,0x55,0xeb,0x7b,0xc5,0x1c,0xa2,0xb5,0x0b,0xd2,0x6c,
-        0xe9,0x57,0x8e,0x30,0x27,0x99,0x40,0xfe,0x6e,0xd0,0x09,0xb7,0xa0,0x1e,0xc7,0x79,
-        0xd6,0x68,0xb1,0x0f,0x18,0xa6,0x7f,0xc1,0x51,0xef,0x36,0x88,0x9f,0x21,0xf8,0x46,
-        0xc3,0x7d,0xa4,0x1a,0x0d,0xb3,0x6a,0xd4,0x44,0xfa,0x23,0x9d,0x8a,0x34,0xed,0x53,
-    ),
-    ( # 191
-        0x00,0xbf,0x65,0xda,0xca,0x75,0xaf,0x10,0x8f,0x30,0xea,0x55,0x45,0xfa,0x20,0x9f,
-        0x05,0xba,0x60,0xdf,0xcf,0x70,0xaa,0x15,0x8a,0x35,0xef,0x50,0x40,0xff,0x25,0x9a,
-        0x0a,0xb5,0x6f,0xd0,0xc0,0x7f,0xa5,0x1a,0x85,0x3a,0xe0,0x5f,0x4f,0xf0,0x2a,0x95,
-        0x0f,0xb0,0x6a,0xd5,0xc5,0x7a,0xa0,0x1f,0x80,0x3f,0xe5,0x5a,0x4a,0xf5,0x2f,0x90,
-        0x14,0xab,0x71,0xce,0xde,0x61,0xbb,0x04,0x9b,0x24,0xfe,0x41,0x51,0xee,0x34,0x8b,
-        0x11,0xae,0x74,0xcb,0xdb,0x64,0xbe,0x01,0x9e,0x21,0xfb,0x44,0x54,0xeb,0x31,0x8e,
-        0x1e,0xa1,0x7b,0xc4,0xd4,0x6b,0xb1,0x0e,0x91,0x2e,0xf4,0x4b,0x5b,0xe4,0x3e,0x81,
-        0x1b,0xa4,0x7e,0xc1,0xd1,0x6e,0xb4,0x0b,0x94,0x2b,0xf1,0x4e,0x5e,0xe1,0x3b,0x84,
-        0x28,0x97,0x4d,0xf2,0xe2,0x5d,0x87,0x38,0xa7,0x18,0xc2,0x7d,0x6d,0xd2,0x08,0xb7,
-        0x2d,0x92,0x48,0xf7,0xe7,0x58,0x82,0x3d,0xa2,0x1d,0xc7,0x78,0x68,0xd7,0x0d,0xb2,
-        0x22,0x9d,0x47,0xf8,0xe8,0x57,0x8d,0x32,0xad,0x12,0xc8,0x77,0x67,0xd8,0x02,0xbd,
-        0x27,0x98,0x42,0xfd,0xed,0x52,0x88,0x37,0xa8,0x17,0xcd,0x72,0x62,0xdd,0x07,0xb8,
-        0x3c,0x83,0x59,0xe6,0xf6,0x49,0x93,0x2c,0xb3,0x0c,0xd6,0x69,0x79,0xc6,0x1c,0xa3,
-        0x39,0x86,0x5c,0xe3,0xf3,0x4c,0x96,0x29,0xb6,0x09,0xd3,0x6c,0x7c,0xc3,0x19,0xa6,
-        0x36,0x89,0x53,0xec,0xfc,0x43,0x99,0x26,0xb9,0x06,0xdc,0x63,0x73,0xcc,0x16,0xa9,
-        0x33,0x8c,0x56,0xe9,0xf9,0x46,0x9c,0x23,0xbc,0x03,0xd9,0x66,0x76,0xc9,0x13,0xac,
-    ),
-    ( # 192
-        0x00,0xc0,0x9b,0x5b,0x2d,0xed,0xb6,0x76,0x5a,0x9a,0xc1,0x01,0x77,0xb7,0xec,0x2c,
-        0xb4,0x74,0x2f,0xef,0x99,0x59,0x02,0xc2,0xee,0x2e,0x75,0xb5,0xc3,0x03,0x58,0x98,
-        0x73,0xb3,0xe8,0x28,0x5e,0x9e,0xc5,0x05,0x29,0xe9,0xb2,0x72,0x04,0xc4,0x9f,0x5f,
-        0xc7,0x07,0x5c,0x9c,0xea,0x2a,0x71,0xb1,0x9d,0x5d,0x06,0xc6,0xb0,0x70,0x2b,0xeb,
-        0xe6,0x26,0x7d,0xbd,0xcb,0x0b,0x50,0x90,0xbc,0x7c,0x27,0xe7,0x91,0x51,0x0a,0xca,
-        0x52,0x92,0xc9,0x09,0x7f,0xbf,0xe4,0x24,0x08,0xc8,0x93,0x53,0x25,0xe5,0xbe,0x7e,
-        0x95,0x55,0x0e,0xce,0xb8,0x78,0x23,0xe3,0xcf,0x0f,0x54,0x94,0xe2,0x22,0x79,0xb9,
-        0x21,0xe1,0xba,0x7a,0x0c,0xcc,0x97,0x57,0x7b,0xbb,0xe0,0x20,0x56,0x96,0xcd,0x0d,
-        0xd7,0x17,0x4c,0x8c,0xfa,0x3a,0x61,0xa1,0x8d,0x4d,0x16,0xd6,0xa0,0x60,0x3b,0xfb,
-        0x63,0xa3,0xf8,0x38,0x4e,0x8e,0xd5,0x15,0x39,0xf9,0xa2,0x62,0x14,0xd4,0x8f,0x4f,
-        0xa4,0x64,0x3f,0xff,0x89,0x49,0x12,0xd2,0xfe,0x3e,0x65,0xa5,0xd3,0x13,0x48,0x88,
-        0x10,0xd0,0x8b,0x4b,0x3d,0xfd,0xa6,0x66,0x4a,0x8a,0xd1,0x11,0x67,0xa7,0xfc,0x3c,
-        0x31,0xf1,0xaa,0x6a,0x1c,0xdc,0x87,0x47,0x6b,0xab,0xf0,0x30,0x46,0x86,0xdd,0x1d,
-        0x85,0x45,0x1e,0xde,0xa8,0x68,0x33,0xf3,0xdf,0x1f,0x44,0x84,0xf2,0x32,0x69,0xa9,
-        0x42,0x82,0xd9,0x19,0x6f,0xaf,0xf4,0x34,0x18,0xd8,0x83,0x43,0x35,0xf5,0xae,0x6e,
-        0xf6,0x36,0x6d,0xad,0xdb,0x1b,0x40,0x80,0xac,0x6c,0x37,0xf7,0x81,0x41,0x1a,0xda,
-    ),
-    ( # 193
-        0x00,0xc1,0x99,0x58,0x29,0xe8,0xb0,0x71,0x52,0x93,0xcb,0x0a,0x7b,0xba,0xe2,0x23,
-        0xa4,0x65,0x3d,0xfc,0x8d,0x4c,0x14,0xd5,0xf6,0x37,0x6f,0xae,0xdf,0x1e,0x46,0x87,
-        0x53,0x92,0xca,0x0b,0x7a,0xbb,0xe3,0x22,0x01,0xc0,0x98,0x59,0x28,0xe9,0xb1,0x70,
-        0xf7,0x36,0x6e,0xaf,0xde,0x1f,0x47,0x86,0xa5,0x64,0x3c,0xfd,0x8c,0x4d,0x15,0xd4,
-        0xa6,0x67,0x3f,0xfe,0x8f,0x4e,0x16,0xd7,0xf4,0x35,0x6d,0xac,0xdd,0x1c,0x44,0x85,
-        0x02,0xc3,0x9b,0x5a,0x2b,0xea,0xb2,0x73,0x50,0x91,0xc9,0x08,0x79,0xb8,0xe0,0x21,
-        0xf5,0x34,0x6c,0xad,0xdc,0x1d,0x45,0x84,0xa7,0x66,0x3e,0xff,0x8e,0x4f,0x17,0xd6,
-        0x51,0x90,0xc8,0x09,0x78,0xb9,0xe1,0x20,0x03,0xc2,0x9a,0x5b,0x2a,0xeb,0xb3,0x72,
-        0x57,0x96,0xce,0x0f,0x7e,0xbf,0xe7,0x26,0x05,0xc4,0x9c,0x5d,0x2c,0xed,0xb5,0x74,
-        0xf3,0x32,0x6a,0xab,0xda,0x1b,0x43,0x82,0xa1,0x60,0x38,0xf9,0x88,0x49,0x11,0xd0,
-        0x04,0xc5,0x9d,0x5c,0x2d,0xec,0xb4,0x75,0x56,0x97,0xcf,0x0e,0x7f,0xbe,0xe6,0x27,
-        0xa0,0x61,0x39,0xf8,0x89,0x48,0x10,0xd1,0xf2,0x33,0x6b,0xaa,0xdb,0x1a,0x42,0x83,
-        0xf1,0x30,0x68,0xa9,0xd8,0x19,0x41,0x80,0xa3,0x62,0x3a,0xfb,0x8a,0x4b,0x13,0xd2,
-        0x55,0x94,0xcc,0x0d,0x7c,0xbd,0xe5,0x24,0x07,0xc6,0x9e,0x5f,0x2e,0xef,0xb7,0x76,
-        0xa2,0x63,0x3b,0xfa,0x8b,0x4a,0x12,0xd3,0xf0,0x31,0x69,0xa8,0xd9,0x18,0x40,0x81,
-        0x06,0xc7,0x9f,0x5e,0x2f,0xee,0xb6,0x77,0x54,0x95,0xcd,0x0c,0x7d,0xbc,0xe4,0x25,
-    ),
-    ( # 194
-        0x00,0xc2,0x9f,0x5d,0x25,0xe7,0xba,0x78,0x4a,0x88,0xd5,0x17,0x6f,0xad,0xf0,0x32,
-        0x94,0x56,0x0b,0xc9,0xb1,0x73,0x2e,0xec,0xde,0x1c,0x41,0x83,0xfb,0x39,0x64,0xa6,
-        0x33,0xf1,0xac,0x6e,0x16,0xd4,0x89,0x4b,0x79,0xbb,0xe6,0x24,0x5c,0x9e,0xc3,0x01,
-        0xa7,0x65,0x38,0xfa,0x82,0x40,0x1d,0xdf,0xed,0x2f,0x72,0xb0,0xc8,0x0a,0x57,0x95,
-        0x66,0xa4,0xf9,0x3b,0x43,0x81,0xdc,0x1e,0x2c,0xee,0xb3,0x71,0x09,0xcb,0x96,0x54,
-        0xf2,0x30,0x6d,0xaf,0xd7,0x15,0x48,0x8a,0xb8,0x7a,0x27,0xe5,0x9d,0x5f,0x02,0xc0,
-        0x55,0x97,0xca,0x08,0x70,0xb2,0xef,0x2d,0x1f,0xdd,0x80,0x42,0x3a,0xf8,0xa5,0x67,
-        0xc1,0x03,0x5e,0x9c,0xe4,0x26,0x7b,0xb9,0x8b,0x49,0x14,0xd6,0xae,0x6c,0x31,0xf3,
-        0xcc,0x0e,0x53,0x91,0xe9,0x2b,0x76,0xb4,0x86,0x44,0x19,0xdb,0xa3,0x61,0x3c,0xfe,
-        0x58,0x9a,0xc7,0x05,0x7d,0xbf,0xe2,0x20,0x12,0xd0,0x8d,0x4f,0x37,0xf5,0xa8,0x6a,
-        0xff,0x3d,0x60,0xa2,0xda,0x18,0x45,0x87,0xb5,0x77,0x2a,0xe8,0x90,0x52,0x0f,0xcd,
-        0x6b,0xa9,0xf4,0x36,0x4e,0x8c,0xd1,0x13,0x21,0xe3,0xbe,0x7c,0x04,0xc6,0x9b,0x59,
-        0xaa,0x68,0x35,0xf7,0x8f,0x4d,0x10,0xd2,0xe0,0x22,0x7f,0xbd,0xc5,0x07,0x5a,0x98,
-        0x3e,0xfc,0xa1,0x63,0x1b,0xd9,0x84,0x46,0x74,0xb6,0xeb,0x29,0x51,0x93,0xce,0x0c,
-        0x99,0x5b,0x06,0xc4,0xbc,0x7e,0x23,0xe1,0xd3,0x11,0x4c,0x8e,0xf6,0x34,0x69,0xab,
-        0x0d,0xcf,0x92,0x50,0x28,0xea,0xb7,0x75,0x47,0x85,0xd8,0x1a,0x62,0xa0,0xfd,0x3f,
-    ),
-    ( # 195
-        0x00,0xc3,0x9d,0x5e,0x21,0xe2,0xbc,0x7f,0x42,0x81,0xdf,0x1c,0x63,0xa0,0xfe,0x3d,
-        0x84,0x47,0x19,0xda,0xa5,0x66,0x38,0xfb,0xc6,0x05,0x5b,0x98,0xe7,0x24,0x7a,0xb9,
-        0x13,0xd0,0x8e,0x4d,0x32,0xf1,0xaf,0x6c,0x51,0x92,0xcc,0x0f,0x70,0xb3,0xed,0x2e,
-        0x97,0x54,0x0a,0xc9,0xb6,0x75,0x2b,0xe8,0xd5,0x16,0x48,0x8b,0xf4,0x37,0x69,0xaa,
-        0x26,0xe5,0xbb,0x78,0x07,0xc4,0x9a,0x59,0x64,0xa7,0xf9,0x3a,0x45,0x86,0xd8,0x1b,
-        0xa2,0x61,0x3f,0xfc,0x83,0x40,0x1e,0xdd,0xe0,0x23,0x7d,0xbe,0xc1,0x02,0x5c,0x9f,
-        0x35,0xf6,0xa8,0x6b,0x14,0xd7,0x89,0x4a,0x77,0xb4,0xea,0x29,0x56,0x95,0xcb,0x08,
-        0xb1,0x72,0x2c,0xef,0x90,0x53,0x0d,0xce,0xf3,0x30,0x6e,0xad,0xd2,0x11,0x4f,0x8c,
-        0x4c,0x8f,0xd1,0x12,0x6d,0xae,0xf0,0x33,0x0e,0xcd,0x93,0x50,0x2f,0xec,0xb2,0x71,
-        0xc8,0x0b,0x55,0x96,0xe9,0x2a,0x74,0xb7,0x8a,0x49,0x17,0xd4,0xab,0x68,0x36,0xf5,
-        0x5f,0x9c,0xc2,0x01,0x7e,0xbd,0xe3,0x20,0x1d,0xde,0x80,0x43,0x3c,0xff,0xa1,0x62,
-        0xdb,0x18,0x46,0x85,0xfa,0x39,0x67,0xa4,0x99,0x5a,0x04,0xc7,0xb8,0x7b,0x25,0xe6,
-        0x6a,0xa9,0xf7,0x34,0x4b,0x88,0xd6,0x15,0x28,0xeb,0xb5,0x76,0x09,0xca,0x94,0x57,
-        0xee,0x2d,0x73,0xb0,0xcf,0x0c,0x52,0x91,0xac,0x6f,0x31,0xf2,0x8d,0x4e,0x10,0xd3,
-        0x79,0xba,0xe4,0x27,0x58,0x9b,0xc5,0x06,0x3b,0xf8,0xa6,0x65,0x1a,0xd9,0x87,0x44,
-        0xfd,0x3e,0x60,0xa3,0xdc,0x1f,0x41,0x82,0xbf,0x7c,0x22,0xe1,0x9e,0x5d,0x03,0xc0,
-    ),
-    ( # 196
-        0x00,0xc4,0x93,0x57,0x3d,0xf9,0xae,0x6a,0x7a,0xbe,0xe9,0x2d,0x47,0x83,0xd4,0x10,
-        0xf4,0x30,0x67,0xa3,0xc9,0x0d,0x5a,0x9e,0x8e,0x4a,0x1d,0xd9,0xb3,0x77,0x20,0xe4,
-        0xf3,0x37,0x60,0xa4,0xce,0x0a,0x5d,0x99,0x89,0x4d,0x1a,0xde,0xb4,0x70,0x27,0xe3,
-        0x07,0xc3,0x94,0x50,0x3a,0xfe,0xa9,0x6d,0x7d,0xb9,0xee,0x2a,0x40,0x84,0xd3,0x17,
-        0xfd,0x39,0x6e,0xaa,0xc0,0x04,0x53,0x97,0x87,0x43,0x14,0xd0,0xba,0x7e,0x29,0xed,
-        0x09,0xcd,0x9a,0x5e,0x34,0xf0,0xa7,0x63,0x73,0xb7,0xe0,0x24,0x4e,0x8a,0xdd,0x19,
-        0x0e,0xca,0x9d,0x59,0x33,0xf7,0xa0,0x64,0x74,0xb0,0xe7,0x23,0x49,0x8d,0xda,0x1e,
-        0xfa,0x3e,0x69,0xad,0xc7,0x03,0x54,0x90,0x80,0x44,0x13,0xd7,0xbd,0x79,0x2e,0xea,
-        0xe1,0x25,0x72,0xb6,0xdc,0x18,0x4f,0x8b,0x9b,0x5f,0x08,0xcc,0xa6,0x62,0x35,0xf1,
-        0x15,0xd1,0x86,0x42,0x28,0xec,0xbb,0x7f,0x6f,0xab,0xfc,0x38,0x52,0x96,0xc1,0x05,
-        0x12,0xd6,0x81,0x45,0x2f,0xeb,0xbc,0x78,0x68,0xac,0xfb,0x3f,0x55,0x91,0xc6,0x02,
-        0xe6,0x22,0x75,0xb1,0xdb,0x1f,0x48,0x8c,0x9c,0x58,0x0f,0xcb,0xa1,0x65,0x32,0xf6,
-        0x1c,0xd8,0x8f,0x4b,0x21,0xe5,0xb2,0x76,0x66,0xa2,0xf5,0x31,0x5b,0x9f,0xc8,0x0c,
-        0xe8,0x2c,0x7b,0xbf,0xd5,0x11,0x46,0x82,0x92,0x56,0x01,0xc5,0xaf,0x6b,0x3c,0xf8,
-        0xef,0x2b,0x7c,0xb8,0xd2,0x16,0x41,0x85,0x95,0x51,0x06,0xc2,0xa8,0x6c,0x3b,0xff,
-        0x1b,0xdf,0x88,0x4c,0x26,0xe2,0xb5,0x71,0x61,0xa5,0xf2,0x36,0x5c,0x98,0xcf,0x0b,
-    ),
-    ( # 197
-        0x00,0xc5,0x91,0x54,0x39,0xfc,0xa8,0x6d,0x72,0xb7,0xe3,0x26,0x4b,0x8e,0xda,0x1f,
-        0xe4,0x21,0x75,0xb0,0xdd,0x18,0x4c,0x89,0x96,0x53,0x07,0xc2,0xaf,0x6a,0x3e,0xfb,
-        0xd3,0x16,0x42,0x87,0xea,0x2f,0x7b,0xbe,0xa1,0x64,0x30,0xf5,0x98,0x5d,0x09,0xcc,
-        0x37,0xf2,0xa6,0x63,0x0e,0xcb,0x9f,0x5a,0x45,0x80,0xd4,0x11,0x7c,0xb9,0xed,0x28,
-        0xbd,0x78,0x2c,0xe9,0x84,0x41,0x15,0xd0,0xcf,0x0a,0x5e,0x9b,0xf6,0x33,0x67,0xa2,
-        0x59,0x9c,0xc8,0x0d,0x60,0xa5,0xf1,0x34,0x2b,0xee,0xba,0x7f,0x12,0xd7,0x83,0x46,
-        0x6e,0xab,0xff,0x3a,0x57,0x92,0xc6,0x03,0x1c,0xd9,0x8d,0x48,0x25,0xe0,0xb4,0x71,
-        0x8a,0x4f,0x1b,0xde,0xb3,0x76,0x22,0xe7,0xf8,0x3d,0x69,0xac,0xc1,0x04,0x50,0x95,
-        0x61,0xa4,0xf0,0x35,0x58,0x9d,0xc9,0x0c,0x13,0xd6,0x82,0x47,0x2a,0xef,0xbb,0x7e,
-        0x85,0x40,0x14,0xd1,0xbc,0x79,0x2d,0xe8,0xf7,0x32,0x66,0xa3,0xce,0x0b,0x5f,0x9a,
-        0xb2,0x77,0x23,0xe6,0x8b,0x4e,0x1a,0xdf,0xc0,0x05,0x51,0x94,0xf9,0x3c,0x68,0xad,
-        0x56,0x93,0xc7,0x02,0x6f,0xaa,0xfe,0x3b,0x24,0xe1,0xb5,0x70,0x1d,0xd8,0x8c,0x49,
-        0xdc,0x19,0x4d,0x88,0xe5,0x20,0x74,0xb1,0xae,0x6b,0x3f,0xfa,0x97,0x52,0x06,0xc3,
-        0x38,0xfd,0xa9,0x6c,0x01,0xc4,0x90,0x55,0x4a,0x8f,0xdb,0x1e,0x73,0xb6,0xe2,0x27,
-        0x0f,0xca,0x9e,0x5b,0x36,0xf3,0xa7,0x62,0x7d,0xb8,0xec,0x29,0x44,0x81,0xd5,0x10,
-        0xeb,0x2e,0x7a,0xbf,0xd2,0x17,0x43,0x86,0x99,0x5c,0x08,0xcd,0xa0,0x65,0x31,0xf4,
-    ),
-    ( # 198
-        0x00,0xc6,0x97,0x51,0x35,0xf3,0xa2,0x64,0x6a,0xac,0xfd,0x3b,0x5f,0x99,0xc8,0x0e,
-        0xd4,0x12,0x43,0x85,0xe1,0x27,0x76,0xb0,0xbe,0x78,0x29,0xef,0x8b,0x4d,0x1c,0xda,
-        0xb3,0x75,0x24,0xe2,0x86,0x40,0x11,0xd7,0xd9,0x1f,0x4e,0x88,0xec,0x2a,0x7b,0xbd,
-        0x67,0xa1,0xf0,0x36,0x52,0x94,0xc5,0x03,0x0d,0xcb,0x9a,0x5c,0x38,0xfe,0xaf,0x69,
-        0x7d,0xbb,0xea,0x2c,0x48,0x8e,0xdf,0x19,0x17,0xd1,0x80,0x46,0x22,0xe4,0xb5,0x73,
-        0xa9,0x6f,0x3e,0xf8,0x9c,0x5a,0x0b,0xcd,0xc3,0x05,0x54,0x92,0xf6,0x30,0x61,0xa7,
-        0xce,0x08,0x59,0x9f,0xfb,0x3d,0x6c,0xaa,0xa4,0x62,0x33,0xf5,0x91,0x57,0x06,0xc0,
-        0x1a,0xdc,0x8d,0x4b,0x2f,0xe9,0xb8,0x7e,0x70,0xb6,0xe7,0x21,0x45,0x83,0xd2,0x14,
-        0xfa,0x3c,0x6d,0xab,0xcf,0x09,0x58,0x9e,0x90,0x56,0x07,0xc1,0xa5,0x63,0x32,0xf4,
-        0x2e,0xe8,0xb9,0x7f,0x1b,0xdd,0x8c,0x4a,0x44,0x82,0xd3,0x15,0x71,0xb7,0xe6,0x20,
-        0x49,0x8f,0xde,0x18,0x7c,0xba,0xeb,0x2d,0x23,0xe5,0xb4,0x72,0x16,0xd0,0x81,0x47,
-        0x9d,0x5b,0x0a,0xcc,0xa8,0x6e,0x3f,0xf9,0xf7,0x31,0x60,0xa6,0xc2,0x04,0x55,0x93,
-        0x87,0x41,0x10,0xd6,0xb2,0x74,0x25,0xe3,0xed,0x2b,0x7a,0xbc,0xd8,0x1e,0x4f,0x89,
-        0x53,0x95,0xc4,0x02,0x66,0xa0,0xf1,0x37,0x39,0xff,0xae,0x68,0x0c,0xca,0x9b,0x5d,
-        0x34,0xf2,0xa3,0x65,0x01,0xc7,0x96,0x50,0x5e,0x98,0xc9,0x0f,0x6b,0xad,0xfc,0x3a,
-        0xe0,0x26,0x77,0xb1,0xd5,0x13,0x42,0x84,0x8a,0x4c,0x1d,0xdb,0xbf,0x79,0x28,0xee,
-    ),
-    ( # 199
-        0x00,0xc7,0x95,0x52,0x31,0xf6,0xa4,0x63,0x62,0xa5,0xf7,0x30,0x53,0x94,0xc6,0x01,
-        0xc4,0x03,0x51,0x96,0xf5,0x32,0x60,0xa7,0xa6,0x61,0x33,0xf4,0x97,0x50,0x02,0xc5,
-        0x93,0x54,0x06,0xc1,0xa2,0x65,0x37,0xf0,0xf1,0x36,0x64,0xa3,0xc0,0x07,0x55,0x92,
-        0x57,0x90,0xc2,0x05,0x66,0xa1,0xf3,0x34,0x35,0xf2,0xa0,0x67,0x04,0xc3,0x91,0x56,
-        0x3d,0xfa,0xa8,0x6f,0x0c,0xcb,0x99,0x5e,0x5f,0x98,0xca,0x0d,0x6e,0xa9,0xfb,0x3c,
-        0xf9,0x3e,0x6c,0xab,0xc8,0x0f,0x5d,0x9a,0x9b,0x5c,0x0e,0xc9,0xaa,0x6d,0x3f,0xf8,
-        0xae,0x69,0x3b,0xfc,0x9f,0x58,0x0a,0xcd,0xcc,0x0b,0x59,0x9e,0xfd,0x3a,0x68,0xaf,
-        0x6a,0xad,0xff,0x38,0x5b,0x9c,0xce,0x09,0x08,0xcf,0x9d,0x5a,0x39,0xfe,0xac,0x6b,
-        0x7a,0xbd,0xef,0x28,0x4b,0x8c,0xde,0x19,0x18,0xdf,0x8d,0x4a,0x29,0xee,0xbc,0x7b,
-        0xbe,0x79,0x2b,0xec,0x8f,0x48,0x1a,0xdd,0xdc,0x1b,0x49,0x8e,0xed,0x2a,0x78,0xbf,
-        0xe9,0x2e,0x7c,0xbb,0xd8,0x1f,0x4d,0x8a,0x8b,0x4c,0x1e,0xd9,0xba,0x7d,0x2f,0xe8,
-        0x2d,0xea,0xb8,0x7f,0x1c,0xdb,0x89,0x4e,0x4f,0x88,0xda,0x1d,0x7e,0xb9,0xeb,0x2c,
-        0x47,0x80,0xd2,0x15,0x76,0xb1,0xe3,0x24,0x25,0xe2,0xb0,0x77,0x14,0xd3,0x81,0x46,
-        0x83,0x44,0x16,0xd1,0xb2,0x75,0x27,0xe0,0xe1,0x26,0x74,0xb3,0xd0,0x17,0x45,0x82,
-        0xd4,0x13,0x41,0x86,0xe5,0x22,0x70,0xb7,0xb6,0x71,0x23,0xe4,0x87,0x40,0x12,0xd5,
-        0x10,0xd7,0x85,0x42,0x21,0xe6,0xb4,0x73,0x72,0xb5,0xe7,0x20,0x43,0x84,0xd6,0x11,
-    ),
-    ( # 200
-        0x00,0xc8,0x8b,0x43,0x0d,0xc5,0x86,0x4e,0x1a,0xd2,0x91,0x59,0x17,0xdf,0x9c,0x54,
-        0x34,0xfc,0xbf,0x77,0x39,0xf1,0xb2,0x7a,0x2e,0xe6,0xa5,0x6d,0x23,0xeb,0xa8,0x60,
-        0x68,0xa0,0xe3,0x2b,0x65,0xad,0xee,0x26,0x72,0xba,0xf9,0x31,0x7f,0xb7,0xf4,0x3c,
-        0x5c,0x94,0xd7,0x1f,0x51,0x99,0xda,0x12,0x46,0x8e,0xcd,0x05,0x4b,0x83,0xc0,0x08,
-        0xd0,0x18,0x5b,0x93,0xdd,0x15,0x56,0x9e,0xca,0x02,0x41,0x89,0xc7,0x0f,0x4c,0x84,
-        0xe4,0x2c,0x6f,0xa7,0xe9,0x21,0x62,0xaa,0xfe,0x36,0x75,0xbd,0xf3,0x3b,0x78,0xb0,
-        0xb8,0x70,0x33,0xfb,0xb5,0x7d,0x3e,0xf6,0xa2,0x6a,0x29,0xe1,0xaf,0x67,0x24,0xec,
-        0x8c,0x44,0x07,0xcf,0x81,0x49,0x0a,0xc2,0x96,0x5e,0x1d,0xd5,0x9b,0x53,0x10,0xd8,
-        0xbb,0x73,0x30,0xf8,0xb6,0x7e,0x3d,0xf5,0xa1,0x69,0x2a,0xe2,0xac,0x64,0x27,0xef,
-        0x8f,0x47,0x04,0xcc,0x82,0x4a,0x09,0xc1,0x95,0x5d,0x1e,0xd6,0x98,0x50,0x13,0xdb,
-        0xd3,0x1b,0x58,0x90,0xde,0x16,0x55,0x9d,0xc9,0x01,0x42,0x8a,0xc4,0x0c,0x4f,0x87,
-        0xe7,0x2f,0x6c,0xa4,0xea,0x22,0x61,0xa9,0xfd,0x35,0x76,0xbe,0xf0,0x38,0x7b,0xb3,
-        0x6b,0xa3,0xe0,0x28,0x66,0xae,0xed,0x25,0x71,0xb9,0xfa,0x32,0x7c,0xb4,0xf7,0x3f,
-        0x5f,0x97,0xd4,0x1c,0x52,0x9a,0xd9,0x11,0x45,0x8d,0xce,0x06,0x48,0x80,0xc3,0x0b,
-        0x03,0xcb,0x88,0x40,0x0e,0xc6,0x85,0x4d,0x19,0xd1,0x92,0x5a,0x14,0xdc,0x9f,0x57,
-        0x37,0xff,0xbc,0x74,0x3a,0xf2,0xb1,0x79,0x2d,0xe5,0xa6,0x6e,0x20,0xe8,0xab,0x63,
-    ),
-    ( # 201
-        0x00,0xc9,0x89,0x40,0x09,0xc0,0x80,0x49,0x12,0xdb,0x9b,0x52,0x1b,0xd2,0x92,0x5b,
-        0x24,0xed,0xad,0x64,0x2d,0xe4,0xa4,0x6d,0x36,0xff,0xbf,0x76,0x3f,0xf6,0xb6,0x7f,
-        0x48,0x81,0xc1,0x08,0x41,0x88,0xc8,0x01,0x5a,0x93,0xd3,0x1a,0x53,0x9a,0xda,0x13,
-        0x6c,0xa5,0xe5,0x2c,0x65,0xac,0xec,0x25,0x7e,0xb7,0xf7,0x3e,0x77,0xbe,0xfe,0x37,
-        0x90,0x59,0x19,0xd0,0x99,0x50,0x10,0xd9,0x82,0x4b,0x0b,0xc2,0x8b,0x42,0x02,0xcb,
-        0xb4,0x7d,0x3d,0xf4,0xbd,0x74,0x34,0xfd,0xa6,0x6f,0x2f,0xe6,0xaf,0x66,0x26,0xef,
-        0xd8,0x11,0x51,0x98,0xd1,0x18,0x58,0x91,0xca,0x03,0x43,0x8a,0xc3,0x0a,0x4a,0x83,
-        0xfc,0x35,0x75,0xbc,0xf5,0x3c,0x7c,0xb5,0xee,0x27,0x67,0xae,0xe7,0x2e,0x6e,0xa7,
-        0x3b,0xf2,0xb2,0x7b,0x32,0xfb,0xbb,0x72,0x29,0xe0,0xa0,0x69,0x20,0xe9,0xa9,0x60,
-        0x1f,0xd6,0x96,0x5f,0x16,0xdf,0x9f,0x56,0x0d,0xc4,0x84,0x4d,0x04,0xcd,0x8d,0x44,
-        0x73,0xba,0xfa,0x33,0x7a,0xb3,0xf3,0x3a,0x61,0xa8,0xe8,0x21,0x68,0xa1,0xe1,0x28,
-        0x57,0x9e,0xde,0x17,0x5e,0x97,0xd7,0x1e,0x45,0x8c,0xcc,0x05,0x4c,0x85,0xc5,0x0c,
-        0xab,0x62,0x22,0xeb,0xa2,0x6b,0x2b,0xe2,0xb9,0x70,0x30,0xf9,0xb0,0x79,0x39,0xf0,
-        0x8f,0x46,0x06,0xcf,0x86,0x4f,0x0f,0xc6,0x9d,0x54,0x14,0xdd,0x94,0x5d,0x1d,0xd4,
-        0xe3,0x2a,0x6a,0xa3,0xea,0x23,0x63,0xaa,0xf1,0x38,0x78,0xb1,0xf8,0x31,0x71,0xb8,
-        0xc7,0x0e,0x4e,0x87,0xce,0x07,0x47,0x8e,0xd5,0x1c,0x5c,0x95,0xdc,0x15,0x55,0x9c,
-    ),
-    ( # 202
-        0x00,0xca,0x8f,0x45,0x05,0xcf,0x8a,0x40,0x0a,0xc0,0x85,0x4f,0x0f,0xc5,0x80,0x4a,
-        0x14,0xde,0x9b,0x51,0x11,0xdb,0x9e,0x54,0x1e,0xd4,0x91,0x5b,0x1b,0xd1,0x94,0x5e,
-        0x28,0xe2,0xa7,0x6d,0x2d,0xe7,0xa2,0x68,0x22,0xe8,0xad,0x67,0x27,0xed,0xa8,0x62,
-        0x3c,0xf6,0xb3,0x79,0x39,0xf3,0xb6,0x7c,0x36,0xfc,0xb9,0x73,0x33,0xf9,0xbc,0x76,
-        0x50,0x9a,0xdf,0x15,0x55,0x9f,0xda,0x10,0x5a,0x90,0xd5,0x1f,0x5f,0x95,0xd0,0x1a,
-        0x44,0x8e,0xcb,0x01,0x41,0x8b,0xce,0x04,0x4e,0x84,0xc1,0x0b,0x4b,0x81,0xc4,0x0e,
-        0x78,0xb2,0xf7,0x3d,0x7d,0xb7,0xf2,0x38,0x72,0xb8,0xfd,0x37,0x77,0xbd,0xf8,0x32,
-        0x6c,0xa6,0xe3,0x29,0x69,0xa3,0xe6,0x2c,0x66,0xac,0xe9,0x23,0x63,0xa9,0xec,0x26,
-        0xa0,0x6a,0x2f,0xe5,0xa5,0x6f,0x2a,0xe0,0xaa,0x60,0x25,0xef,0xaf,0x65,0x20,0xea,
-        0xb4,0x7e,0x3b,0xf1,0xb1,0x7b,0x3e,0xf4,0xbe,0x74,0x31,0xfb,0xbb,0x71,0x34,0xfe,
-        0x88,0x42,0x07,0xcd,0x8d,0x47,0x02,0xc8,0x82,0x48,0x0d,0xc7,0x87,0x4d,0x08,0xc2,
-        0x9c,0x56,0x13,0xd9,0x99,0x53,0x16,0xdc,0x96,0x5c,0x19,0xd3,0x93,0x59,0x1c,0xd6,
-        0xf0,0x3a,0x7f,0xb5,0xf5,0x3f,0x7a,0xb0,0xfa,0x30,0x75,0xbf,0xff,0x35,0x70,0xba,
-        0xe4,0x2e,0x6b,0xa1,0xe1,0x2b,0x6e,0xa4,0xee,0x24,0x61,0xab,0xeb,0x21,0x64,0xae,
-        0xd8,0x12,0x57,0x9d,0xdd,0x17,0x52,0x98,0xd2,0x18,0x5d,0x97,0xd7,0x1d,0x58,0x92,
-        0xcc,0x06,0x43,0x89,0xc9,0x03,0x46,0x8c,0xc6,0x0c,0x49,0x83,0xc3,0x09,0x4c,0x86,
-    ),
-    ( # 203
-        0x00,0xcb,0x8d,0x46,0x01,0xca,0x8c,0x47,0x02,0xc9,0x8f,0x44,0x03,0xc8,0x8e,0x45,
-        0x04,0xcf,0x89,0x42,0x05,0xce,0x88,0x43,0x06,0xcd,0x8b,0x40,0x07,0xcc,0x8a,0x41,
-        0x08,0xc3,0x85,0x4e,0x09,0xc2,0x84,0x4f,0x0a,0xc1,0x87,0x4c,0x0b,0xc0,0x86,0x4d,
-        0x0c,0xc7,0x81,0x4a,0x0d,0xc6,0x80,0x4b,0x0e,0xc5,0x83,0x48,0x0f,0xc4,0x82,0x49,
-        0x10,0xdb,0x9d,0x56,0x11,0xda,0x9c,0x57,0x12,0xd9,0x9f,0x54,0x13,0xd8,0x9e,0x55,
-        0x14,0xdf,0x99,0x52,0x15,0xde,0x98,0x53,0x16,0xdd,0x9b,0x50,0x17,0xdc,0x9a,0x51,
-        0x18,0xd3,0x95,0x5e,0x19,0xd2,0x94,0x5f,0x1a,0xd1,0x97,0x5c,0x1b,0xd0,0x96,0x5d,
-        0x1c,0xd7,0x91,0x5a,0x1d,0xd6,0x90,0x5b,0x1e,0xd5,0x93,0x58,0x1f,0xd4,0x92,0x59,
-        0x20,0xeb,0xad,0x66,0x21,0xea,0xac,0x67,0x22,0xe9,0xaf,0x64,0x23,0xe8,0xae,0x65,
-        0x24,0xef,0xa9,0x62,0x25,0xee,0xa8,0x63,0x26,0xed,0xab,0x60,0x27,0xec,0xaa,0x61,
-        0x28,0xe3,0xa5,0x6e,0x29,0xe2,0xa4,0x6f,0x2a,0xe1,0xa7,0x6c,0x2b,0xe0,0xa6,0x6d,
-        0x2c,0xe7,0xa1,0x6a,0x2d,0xe6,0xa0,0x6b,0x2e,0xe5,0xa3,0x68,0x2f,0xe4,0xa2,0x69,
-        0x30,0xfb,0xbd,0x76,0x31,0xfa,0xbc,0x77,0x32,0xf9,0xbf,0x74,0x33,0xf8,0xbe,0x75,
-        0x34,0xff,0xb9,0x72,0x35,0xfe,0xb8,0x73,0x36,0xfd,0xbb,0x70,0x37,0xfc,0xba,0x71,
-        0x38,0xf3,0xb5,0x7e,0x39,0xf2,0xb4,0x7f,0x3a,0xf1,0xb7,0x7c,0x3b,0xf0,0xb6,0x7d,
-        0x3c,0xf7,0xb1,0x7a,0x3d,0xf6,0xb0,0x7b,0x3e,0xf5,0xb3,0x78,0x3f,0xf4,0xb2,0x79,
-    ),
-    ( # 204
-        0x00,0xcc,0x83,0x4f,0x1d,0xd1,0x9e,0x52,0x3a,0xf6,0xb9,0x75,0x27,0xeb,0xa4,0x68,
-        0x74,0xb8,0xf7,0x3b,0x69,0xa5,0xea,0x26,0x4e,0x82,0xcd,0x01,0x53,0x9f,0xd0,0x1c,
-        0xe8,0x24,0x6b,0xa7,0xf5,0x39,0x76,0xba,0xd2,0x1e,0x51,0x9d,0xcf,0x03,0x4c,0x80,
-        0x9c,0x50,0x1f,0xd3,0x81,0x4d,0x02,0xce,0xa6,0x6a,0x25,0xe9,0xbb,0x77,0x38,0xf4,
-        0xcb,0x07,0x48,0x84,0xd6,0x1a,0x55,0x99,0xf1,0x3d,0x72,0xbe,0xec,0x20,0x6f,0xa3,
-        0xbf,0x73,0x3c,0xf0,0xa2,0x6e,0x21,0xed,0x85,0x49,0x06,0xca,0x98,0x54,0x1b,0xd7,
-        0x23,0xef,0xa0,0x6c,0x3e,0xf2,0xbd,0x71,0x19,0xd5,0x9a,0x56,0x04,0xc8,0x87,0x4b,
-        0x57,0x9b,0xd4,0x18,0x4a,0x86,0xc9,0x05,0x6d,0xa1,0xee,0x22,0x70,0xbc,0xf3,0x3f,
-        0x8d,0x41,0x0e,0xc2,0x90,0x5c,0x13,0xdf,0xb7,0x7b,0x34,0xf8,0xaa,0x66,0x29,0xe5,
-        0xf9,0x35,0x7a,0xb6,0xe4,0x28,0x67,0xab,0xc3,0x0f,0x40,0x8c,0xde,0x12,0x5d,0x91,
-        0x65,0xa9,0xe6,0x2a,0x78,0xb4,0xfb,0x37,0x5f,0x93,0xdc,0x10,0x42,0x8e,0xc1,0x0d,
-        0x11,0xdd,0x92,0x5e,0x0c,0xc0,0x8f,0x43,0x2b,0xe7,0xa8,0x64,0x36,0xfa,0xb5,0x79,
-        0x46,0x8a,0xc5,0x09,0x5b,0x97,0xd8,0x14,0x7c,0xb0,0xff,0x33,0x61,0xad,0xe2,0x2e,
-        0x32,0xfe,0xb1,0x7d,0x2f,0xe3,0xac,0x60,0x08,0xc4,0x8b,0x47,0x15,0xd9,0x96,0x5a,
-        0xae,0x62,0x2d,0xe1,0xb3,0x7f,0x30,0xfc,0x94,0x58,0x17,0xdb,0x89,0x45,0x0a,0xc6,
-        0xda,0x16,0x59,0x95,0xc7,0x0b,0x44,0x88,0xe0,0x2c,0x63,0xaf,0xfd,0x31,0x7e,0xb2,
-    ),
-    ( # 205
-        0x00,0xcd,0x81,0x4c,0x19,0xd4,0x98,0x55,0x32,0xff,0xb3,0x7e,0x2b,0xe6,0xaa,0x67,
-        0x64,0xa9,0xe5,0x28,0x7d,0xb0,0xfc,0x31,0x56,0x9b,0xd7,0x1a,0x4f,0x82,0xce,0x03,
-        0xc8,0x05,0x49,0x84,0xd1,0x1c,0x50,0x9d,0xfa,0x37,0x7b,0xb6,0xe3,0x2e,0x62,0xaf,
-        0xac,0x61,0x2d,0xe0,0xb5,0x78,0x34,0xf9,0x9e,0x53,0x1f,0xd2,0x87,0x4a,0x06,0xcb,
-        0x8b,0x46,0x0a,0xc7,0x92,0x5f,0x13,0xde,0xb9,0x74,0x38,0xf5,0xa0,0x6d,0x21,0xec,
-        0xef,0x22,0x6e,0xa3,0xf6,0x3b,0x77,0xba,0xdd,0x10,0x5c,0x91,0xc4,0x09,0x45,0x88,
-        0x43,0x8e,0xc2,0x0f,0x5a,0x97,0xdb,0x16,0x71,0xbc,0xf0,0x3d,0x68,0xa5,0xe9,0x24,
-        0x27,0xea,0xa6,0x6b,0x3e,0xf3,0xbf,0x72,0x15,0xd8,0x94,0x59,0x0c,0xc1,0x8d,0x40,
-        0x0d,0xc0,0x8c,0x41,0x14,0xd9,0x95,0x58,0x3f,0xf2,0xbe,0x73,0x26,0xeb,0xa7,0x6a,
-        0x69,0xa4,0xe8,0x25,0x70,0xbd,0xf1,0x3c,0x5b,0x96,0xda,0x17,0x42,0x8f,0xc3,0x0e,
-        0xc5,0x08,0x44,0x89,0xdc,0x11,0x5d,0x90,0xf7,0x3a,0x76,0xbb,0xee,0x23,0x6f,0xa2,
-        0xa1,0x6c,0x20,0xed,0xb8,0x75,0x39,0xf4,0x93,0x5e,0x12,0xdf,0x8a,0x47,0x0b,0xc6,
-        0x86,0x4b,0x07,0xca,0x9f,0x52,0x1e,0xd3,0xb4,0x79,0x35,0xf8,0xad,0x60,0x2c,0xe1,
-        0xe2,0x2f,0x63,0xae,0xfb,0x36,0x7a,0xb7,0xd0,0x1d,0x51,0x9c,0xc9,0x04,0x48,0x85,
-        0x4e,0x83,0xcf,0x02,0x57,0x9a,0xd6,0x1b,0x7c,0xb1,0xfd,0x30,0x65,0xa8,0xe4,0x29,
-        0x2a,0xe7,0xab,0x66,0x33,0xfe,0xb2,0x7f,0x18,0xd5,0x99,0x54,0x01,0xcc,0x80,0x4d,
-    ),
-    ( # 206
-        0x00,0xce,0x87,0x49,0x15,0xdb,0x92,0x5c,0x2a,0xe4,0xad,0x63,0x3f,0xf1,0xb8,0x76,
-        0x54,0x9a,0xd3,0x1d,0x41,0x8f,0xc6,0x08,0x7e,0xb0,0xf9,0x37,0x6b,0xa5,0xec,0x22,
-        0xa8,0x66,0x2f,0xe1,0xbd,0x73,0x3a,0xf4,0x82,0x4c,0x05,0xcb,0x97,0x59,0x10,0xde,
-        0xfc,0x32,0x7b,0xb5,0xe9,0x27,0x6e,0xa0,0xd6,0x18,0x51,0x9f,0xc3,0x0d,0x44,0x8a,
-        0x4b,0x85,0xcc,0x02,0x5e,0x90,0xd9,0x17,0x61,0xaf,0xe6,0x28,0x74,0xba,0xf3,0x3d,
-        0x1f,0xd1,0x98,0x56,0x0a,0xc4,0x8d,0x43,0x35,0xfb,0xb2,0x7c,0x20,0xee,0xa7,0x69,
-        0xe3,0x2d,0x64,0xaa,0xf6,0x38,0x71,0xbf,0xc9,0x07,0x4e,0x80,0xdc,0x12,0x5b,0x95,
-        0xb7,0x79,0x30,0xfe,0xa2,0x6c,0x25,0xeb,0x9d,0x53,0x1a,0xd4,0x88,0x46,0x0f,0xc1,
-        0x96,0x58,0x11,0xdf,0x83,0x4d,0x04,0xca,0xbc,0x72,0x3b,0xf5,0xa9,0x67,0x2e,0xe0,
-        0xc2,0x0c,0x45,0x8b,0xd7,0x19,0x50,0x9e,0xe8,0x26,0x6f,0xa1,0xfd,0x33,0x7a,0xb4,
-        0x3e,0xf0,0xb9,0x77,0x2b,0xe5,0xac,0x62,0x14,0xda,0x93,0x5d,0x01,0xcf,0x86,0x48,
-        0x6a,0xa4,0xed,0x23,0x7f,0xb1,0xf8,0x36,0x40,0x8e,0xc7,0x09,0x55,0x9b,0xd2,0x1c,
-        0xdd,0x13,0x5a,0x94,0xc8,0x06,0x4f,0x81,0xf7,0x39,0x70,0xbe,0xe2,0x2c,0x65,0xab,
-        0x89,0x47,0x0e,0xc0,0x9c,0x52,0x1b,0xd5,0xa3,0x6d,0x24,0xea,0xb6,0x78,0x31,0xff,
-        0x75,0xbb,0xf2,0x3c,0x60,0xae,0xe7,0x29,0x5f,0x91,0xd8,0x16,0x4a,0x84,0xcd,0x03,
-        0x21,0xef,0xa6,0x68,0x34,0xfa,0xb3,0x7d,0x0b,0xc5,0x8c,0x42,0x1e,0xd0,0x99,0x57,
-    ),
-    ( # 207
-        0x00,0xcf,0x85,0x4a,0x11,0xde,0x94,0x5b,0x22,0xed,0xa7,0x68,0x33,0xfc,0xb6,0x79,
-        0x44,0x8b,0xc1,0x0e,0x55,0x9a,0xd0,0x1f,0x66,0xa9,0xe3,0x2c,0x77,0xb8,0xf2,0x3d,
-        0x88,0x47,0x0d,0xc2,0x99,0x56,0x1c,0xd3,0xaa,0x65,0x2f,0xe0,0xbb,0x74,0x3e,0xf1,
-        0xcc,0x03,0x49,0x86,0xdd,0x12,0x58,0x97,0xee,0x21,0x6b,0xa4,0xff,0x30,0x7a,0xb5,
-        0x0b,0xc4,0x8e,0x41,0x1a,0xd5,0x9f,0x50,0x29,0xe6,0xac,0x63,0x38,0xf7,0xbd,0x72,
-        0x4f,0x80,0xca,0x05,0x5e,0x91,0xdb,0x14,0x6d,0xa2,0xe8,0x27,0x7c,0xb3,0xf9,0x36,
-        0x83,0x4c,0x06,0xc9,0x92,0x5d,0x17,0xd8,0xa1,0x6e,0x24,0xeb,0xb0,0x7f,0x35,0xfa,
-        0xc7,0x08,0x42,0x8d,0xd6,0x19,0x53,0x9c,0xe5,0x2a,0x60,0xaf,0xf4,0x3b,0x71,0xbe,
-        0x16,0xd9,0x93,0x5c,0x07,0xc8,0x82,0x4d,0x34,0xfb,0xb1,0x7e,0x25,0xea,0xa0,0x6f,
-        0x52,0x9d,0xd7,0x18,0x43,0x8c,0xc6,0x09,0x70,0xbf,0xf5,0x3a,0x61,0xae,0xe4,0x2b,
-        0x9e,0x51,0x1b,0xd4,0x8f,0x40,0x0a,0xc5,0xbc,0x73,0x39,0xf6,0xad,0x62,0x28,0xe7,
-        0xda,0x15,0x5f,0x90,0xcb,0x04,0x4e,0x81,0xf8,0x37,0x7d,0xb2,0xe9,0x26,0x6c,0xa3,
-        0x1d,0xd2,0x98,0x57,0x0c,0xc3,0x89,0x46,0x3f,0xf0,0xba,0x75,0x2e,0xe1,0xab,0x64,
-        0x59,0x96,0xdc,0x13,0x48,0x87,0xcd,0x02,0x7b,0xb4,0xfe,0x31,0x6a,0xa5,0xef,0x20,
-        0x95,0x5a,0x10,0xdf,0x84,0x4b,0x01,0xce,0xb7,0x78,0x32,0xfd,0xa6,0x69,0x23,0xec,
-        0xd1,0x1e,0x54,0x9b,0xc0,0x0f,0x45,0x8a,0xf3,0x3c,0x76,0xb9,0xe2,0x2d,0x67,0xa8,
-    ),
-    ( # 208
-        0x00,0xd0,0xbb,0x6b,0x6d,0xbd,0xd6,0x06,0xda,0x0a,0x61,0xb1,0xb7,0x67,0x0c,0xdc,
-        0xaf,0x7f,0x14,0xc4,0xc2,0x12,0x79,0xa9,0x75,0xa5,0xce,0x1e,0x18,0xc8,0xa3,0x73,
-        0x45,0x95,0xfe,0x2e,0x28,0xf8,0x93,0x43,0x9f,0x4f,0x24,0xf4,0xf2,0x22,0x49,0x99,
-        0xea,0x3a,0x51,0x81,0x87,0x57,0x3c,0xec,0x30,0xe0,0x8b,0x5b,0x5d,0x8d,0xe6,0x36,
-        0x8a,0x5a,0x31,0xe1,0xe7,0x37,0x5c,0x8c,0x50,0x80,0xeb,0x3b,0x3d,0xed,0x86,0x56,
-        0x25,0xf5,0x9e,0x4e,0x48,0x98,0xf3,0x23,0xff,0x2f,0x44,0x94,0x92,0x42,0x29,0xf9,
-        0xcf,0x1f,0x74,0xa4,0xa2,0x72,0x19,0xc9,0x15,0xc5,0xae,0x7e,0x78,0xa8,0xc3,0x13,
-        0x60,0xb0,0xdb,0x0b,0x0d,0xdd,0xb6,0x66,0xba,0x6a,0x01,0xd1,0xd7,0x07,0x6c,0xbc,
-        0x0f,0xdf,0xb4,0x64,0x62,0xb2,0xd9,0x09,0xd5,0x05,0x6e,0xbe,0xb8,0x68,0x03,0xd3,
-        0xa0,0x70,0x1b,0xcb,0xcd,0x1d,0x76,0xa6,0x7a,0xaa,0xc1,0x11,0x17,0xc7,0xac,0x7c,
-        0x4a,0x9a,0xf1,0x21,0x27,0xf7,0x9c,0x4c,0x90,0x40,0x2b,0xfb,0xfd,0x2d,0x46,0x96,
-        0xe5,0x35,0x5e,0x8e,0x88,0x58,0x33,0xe3,0x3f,0xef,0x84,0x54,0x52,0x82,0xe9,0x39,
-        0x85,0x55,0x3e,0xee,0xe8,0x38,0x53,0x83,0x5f,0x8f,0xe4,0x34,0x32,0xe2,0x89,0x59,
-        0x2a,0xfa,0x91,0x41,0x47,0x97,0xfc,0x2c,0xf0,0x20,0x4b,0x9b,0x9d,0x4d,0x26,0xf6,
-        0xc0,0x10,0x7b,0xab,0xad,0x7d,0x16,0xc6,0x1a,0xca,0xa1,0x71,0x77,0xa7,0xcc,0x1c,
-        0x6f,0xbf,0xd4,0x04,0x02,0xd2,0xb9,0x69,0xb5,0x65,0x0e,0xde,0xd8,0x08,0x63,0xb3,
-    ),
-    ( # 209
-        0x00,0xd1,0xb9,0x68,0x69,0xb8,0xd0,0x01,0xd2,0x03,0x6b,0xba,0xbb,0x6a,0x02,0xd3,
-        0xbf,0x6e,0x06,0xd7,0xd6,0x07,0x6f,0xbe,0x6d,0xbc,0xd4,0x05,0x04,0xd5,0xbd,0x6c,
-        0x65,0xb4,0xdc,0x0d,0x0c,0xdd,0xb5,0x64,0xb7,0x66,0x0e,0xdf,0xde,0x0f,0x67,0xb6,
-        0xda,0x0b,0x63,0xb2,0xb3,0x62,0x0a,0xdb,0x08,0xd9,0xb1,0x60,0x61,0xb0,0xd8,0x09,
-        0xca,0x1b,0x73,0xa2,0xa3,0x72,0x1a,0xcb,0x18,0xc9,0xa1,0x70,0x71,0xa0,0xc8,0x19,
-        0x75,0xa4,0xcc,0x1d,0x1c,0xcd,0xa5,0x74,0xa7,0x76,0x1e,0xcf,0xce,0x1f,0x77,0xa6,
-        0xaf,0x7e,0x16,0xc7,0xc6,0x17,0x7f,0xae,0x7d,0xac,0xc4,0x15,0x14,0xc5,0xad,0x7c,
-        0x10,0xc1,0xa9,0x78,0x79,0xa8,0xc0,0x11,0xc2,0x13,0x7b,0xaa,0xab,0x7a,0x12,0xc3,
-        0x8f,0x5e,0x36,0xe7,0xe6,0x37,0x5f,0x8e,0x5d,0x8c,0xe4,0x35,0x34,0xe5,0x8d,0x5c,
-        0x30,0xe1,0x89,0x58,0x59,0x88,0xe0,0x31,0xe2,0x33,0x5b,0x8a,0x8b,0x5a,0x32,0xe3,
-        0xea,0x3b,0x53,0x82,0x83,0x52,0x3a,0xeb,0x38,0xe9,0x81,0x50,0x51,0x80,0xe8,0x39,
-        0x55,0x84,0xec,0x3d,0x3c,0xed,0x85,0x54,0x87,0x56,0x3e,0xef,0xee,0x3f,0x57,0x86,
-        0x45,0x94,0xfc,0x2d,0x2c,0xfd,0x95,0x44,0x97,0x46,0x2e,0xff,0xfe,0x2f,0x47,0x96,
-        0xfa,0x2b,0x43,0x92,0x93,0x42,0x2a,0xfb,0x28,0xf9,0x91,0x40,0x41,0x90,0xf8,0x29,
-        0x20,0xf1,0x99,0x48,0x49,0x98,0xf0,0x21,0xf2,0x23,0x4b,0x9a,0x9b,0x4a,0x22,0xf3,
-        0x9f,0x4e,0x26,0xf7,0xf6,0x27,0x4f,0x9e,0x4d,0x9c,0xf4,0x25,0x24,0xf5,0x9d,0x4c,
-    ),
-    ( # 210
-        0x00,0xd2,0xbf,0x6d,0x65,0xb7,0xda,0x08,0xca,0x18,0x75,0xa7,0xaf,0x7d,0x10,0xc2,
-        0x8f,0x5d,0x30,0xe2,0xea,0x38,0x55,0x87,0x45,0x97,0xfa,0x28,0x20,0xf2,0x9f,0x4d,
-        0x05,0xd7,0xba,0x68,0x60,0xb2,0xdf,0x0d,0xcf,0x1d,0x70,0xa2,0xaa,0x78,0x15,0xc7,
-        0x8a,0x58,0x35,0xe7,0xef,0x3d,0x50,0x82,0x40,0x92,0xff,0x2d,0x25,0xf7,0x9a,0x48,
-        0x0a,0xd8,0xb5,0x67,0x6f,0xbd,0xd0,0x02,0xc0,0x12,0x7f,0xad,0xa5,0x77,0x1a,0xc8,
-        0x85,0x57,0x3a,0xe8,0xe0,0x32,0x5f,0x8d,0x4f,0x9d,0xf0,0x22,0x2a,0xf8,0x95,0x47,
-        0x0f,0xdd,0xb0,0x62,0x6a,0xb8,0xd5,0x07,0xc5,0x17,0x7a,0xa8,0xa0,0x72,0x1f,0xcd,
-        0x80,0x52,0x3f,0xed,0xe5,0x37,0x5a,0x88,0x4a,0x98,0xf5,0x27,0x2f,0xfd,0x90,0x42,
-        0x14,0xc6,0xab,0x79,0x71,0xa3,0xce,0x1c,0xde,0x0c,0x61,0xb3,0xbb,0x69,0x04,0xd6,
-        0x9b,0x49,0x24,0xf6,0xfe,0x2c,0x41,0x93,0x51,0x83,0xee,0x3c,0x34,0xe6,0x8b,0x59,
-        0x11,0xc3,0xae,0x7c,0x74,0xa6,0xcb,0x19,0xdb,0x09,0x64,0xb6,0xbe,0x6c,0x01,0xd3,
-        0x9e,0x4c,0x21,0xf3,0xfb,0x29,0x44,0x96,0x54,0x86,0xeb,0x39,0x31,0xe3,0x8e,0x5c,
-        0x1e,0xcc,0xa1,0x73,0x7b,0xa9,0xc4,0x16,0xd4,0x06,0x6b,0xb9,0xb1,0x63,0x0e,0xdc,
-        0x91,0x43,0x2e,0xfc,0xf4,0x26,0x4b,0x99,0x5b,0x89,0xe4,0x36,0x3e,0xec,0x81,0x53,
-        0x1b,0xc9,0xa4,0x76,0x7e,0xac,0xc1,0x13,0xd1,0x03,0x6e,0xbc,0xb4,0x66,0x0b,0xd9,
-        0x94,0x46,0x2b,0xf9,0xf1,0x23,0x4e,0x9c,0x5e,0x8c,0xe1,0x33,0x3b,0xe9,0x84,0x56,
-    ),
-    ( # 211
-        0x00,0xd3,0xbd,0x6e,0x61,0xb2,0xdc,0x0f,0xc2,0x11,0x7f,0xac,0xa3,0x70,0x1e,0xcd,
-        0x9f,0x4c,0x22,0xf1,0xfe,0x2d,0x43,0x90,0x5d,0x8e,0xe0,0x33,0x3c,0xef,0x81,0x52,
-        0x25,0xf6,0x98,0x4b,0x44,0x97,0xf9,0x2a,0xe7,0x34,0x5a,0x89,0x86,0x55,0x3b,0xe8,
-        0xba,0x69,0x07,0xd4,0xdb,0x08,0x66,0xb5,0x78,0xab,0xc5,0x16,0x19,0xca,0xa4,0x77,
-        0x4a,0x99,0xf7,0x24,0x2b,0xf8,0x96,0x45,0x88,0x5b,0x35,0xe6,0xe9,0x3a,0x54,0x87,
-        0xd5,0x06,0x68,0xbb,0xb4,0x67,0x09,0xda,0x17,0xc4,0xaa,0x79,0x76,0xa5,0xcb,0x18,
-        0x6f,0xbc,0xd2,0x01,0x0e,0xdd,0xb3,0x60,0xad,0x7e,0x10,0xc3,0xcc,0x1f,0x71,0xa2,
-        0xf0,0x23,0x4d,0x9e,0x91,0x42,0x2c,0xff,0x32,0xe1,0x8f,0x5c,0x53,0x80,0xee,0x3d,
-        0x94,0x47,0x29,0xfa,0xf5,0x26,0x48,0x9b,0x56,0x85,0xeb,0x38,0x37,0xe4,0x8a,0x59,
-        0x0b,0xd8,0xb6,0x65,0x6a,0xb9,0xd7,0x04,0xc9,0x1a,0x74,0xa7,0xa8,0x7b,0x15,0xc6,
-        0xb1,0x62,0x0c,0xdf,0xd0,0x03,0x6d,0xbe,0x73,0xa0,0xce,0x1d,0x12,0xc1,0xaf,0x7c,
-        0x2e,0xfd,0x93,0x40,0x4f,0x9c,0xf2,0x21,0xec,0x3f,0x51,0x82,0x8d,0x5e,0x30,0xe3,
-        0xde,0x0d,0x63,0xb0,0xbf,0x6c,0x02,0xd1,0x1c,0xcf,0xa1,0x72,0x7d,0xae,0xc0,0x13,
-        0x41,0x92,0xfc,0x2f,0x20,0xf3,0x9d,0x4e,0x83,0x50,0x3e,0xed,0xe2,0x31,0x5f,0x8c,
-        0xfb,0x28,0x46,0x95,0x9a,0x49,0x27,0xf4,0x39,0xea,0x84,0x57,0x58,0x8b,0xe5,0x36,
-        0x64,0xb7,0xd9,0x0a,0x05,0xd6,0xb8,0x6b,0xa6,0x75,0x1b,0xc8,0xc7,0x14,0x7a,0xa9,
-    ),
-    ( # 212
-        0x00,0xd4,0xb3,0x67,0x7d,0xa9,0xce,0x1a,0xfa,0x2e,0x49,0x9d,0x87,0x53,0x34,0xe0,
-        0xef,0x3b,0x5c,0x88,0x92,0x46,0x21,0xf5,0x15,0xc1,0xa6,0x72,0x68,0xbc,0xdb,0x0f,
-        0xc5,0x11,0x76,0xa2,0xb8,0x6c,0x0b,0xdf,0x3f,0xeb,0x8c,0x58,0x42,0x96,0xf1,0x25,
-        0x2a,0xfe,0x99,0x4d,0x57,0x83,0xe4,0x30,0xd0,0x04,0x63,0xb7,0xad,0x79,0x1e,0xca,
-        0x91,0x45,0x22,0xf6,0xec,0x38,0x5f,0x8b,0x6b,0xbf,0xd8,0x0c,0x16,0xc2,0xa5,0x71,
-        0x7e,0xaa,0xcd,0x19,0x03,0xd7,0xb0,0x64,0x84,0x50,0x37,0xe3,0xf9,0x2d,0x4a,0x9e,
-        0x54,0x80,0xe7,0x33,0x29,0xfd,0x9a,0x4e,0xae,0x7a,0x1d,0xc9,0xd3,0x07,0x60,0xb4,
-        0xbb,0x6f,0x08,0xdc,0xc6,0x12,0x75,0xa1,0x41,0x95,0xf2,0x26,0x3c,0xe8,0x8f,0x5b,
-        0x39,0xed,0x8a,0x5e,0x44,0x90,0xf7,0x23,0xc3,0x17,0x70,0xa4,0xbe,0x6a,0x0d,0xd9,
-        0xd6,0x02,0x65,0xb1,0xab,0x7f,0x18,0xcc,0x2c,0xf8,0x9f,0x4b,0x51,0x85,0xe2,0x36,
-        0xfc,0x28,0x4f,0x9b,0x81,0x55,0x32,0xe6,0x06,0xd2,0xb5,0x61,0x7b,0xaf,0xc8,0x1c,
-        0x13,0xc7,0xa0,0x74,0x6e,0xba,0xdd,0x09,0xe9,0x3d,0x5a,0x8e,0x94,0x40,0x27,0xf3,
-        0xa8,0x7c,0x1b,0xcf,0xd5,0x01,0x66,0xb2,0x52,0x86,0xe1,0x35,0x2f,0xfb,0x9c,0x48,
-        0x47,0x93,0xf4,0x20,0x3a,0xee,0x89,0x5d,0xbd,0x69,0x0e,0xda,0xc0,0x14,0x73,0xa7,
-        0x6d,0xb9,0xde,0x0a,0x10,0xc4,0xa3,0x77,0x97,0x43,0x24,0xf0,0xea,0x3e,0x59,0x8d,
-        0x82,0x56,0x31,0xe5,0xff,0x2b,0x4c,0x98,0x78,0xac,0xcb,0x1f,0x05,0xd1,0xb6,0x62,
-    ),
-    ( # 213
-        0x00,0xd5,0xb1,0x64,0x79,0xac,0xc8,0x1d,0xf2,0x27,0x43,0x96,0x8b,0x5e,0x3a,0xef,
-        0xff,0x2a,0x4e,0x9b,0x86,0x53,0x37,0xe2,0x0d,0xd8,0xbc,0x69,0x74,0xa1,0xc5,0x10,
-        0xe5,0x30,0x54,0x81,0x9c,0x49,0x2d,0xf8,0x17,0xc2,0xa6,0x73,0x6e,0xbb,0xdf,0x0a,
-        0x1a,0xcf,0xab,0x7e,0x63,0xb6,0xd2,0x07,0xe8,0x3d,0x59,0x8c,0x91,0x44,0x20,0xf5,
-        0xd1,0x04,0x60,0xb5,0xa8,0x7d,0x19,0xcc,0x23,0xf6,0x92,0x47,0x5a,0x8f,0xeb,0x3e,
-        0x2e,0xfb,0x9f,0x4a,0x57,0x82,0xe6,0x33,0xdc,0x09,0x6d,0xb8,0xa5,0x70,0x14,0xc1,
-        0x34,0xe1,0x85,0x50,0x4d,0x98,0xfc,0x29,0xc6,0x13,0x77,0xa2,0xbf,0x6a,0x0e,0xdb,
-        0xcb,0x1e,0x7a,0xaf,0xb2,0x67,0x03,0xd6,0x39,0xec,0x88,0x5d,0x40,0x95,0xf1,0x24,
-        0xb9,0x6c,0x08,0xdd,0xc0,0x15,0x71,0xa4,0x4b,0x9e,0xfa,0x2f,0x32,0xe7,0x83,0x56,
-        0x46,0x93,0xf7,0x22,0x3f,0xea,0x8e,0x5b,0xb4,0x61,0x05,0xd0,0xcd,0x18,0x7c,0xa9,
-        0x5c,0x89,0xed,0x38,0x25,0xf0,0x94,0x41,0xae,0x7b,0x1f,0xca,0xd7,0x02,0x66,0xb3,
-        0xa3,0x76,0x12,0xc7,0xda,0x0f,0x6b,0xbe,0x51,0x84,0xe0,0x35,0x28,0xfd,0x99,0x4c,
-        0x68,0xbd,0xd9,0x0c,0x11,0xc4,0xa0,0x75,0x9a,0x4f,0x2b,0xfe,0xe3,0x36,0x52,0x87,
-        0x97,0x42,0x26,0xf3,0xee,0x3b,0x5f,0x8a,0x65,0xb0,0xd4,0x01,0x1c,0xc9,0xad,0x78,
-        0x8d,0x58,0x3c,0xe9,0xf4,0x21,0x45,0x90,0x7f,0xaa,0xce,0x1b,0x06,0xd3,0xb7,0x62,
-        0x72,0xa7,0xc3,0x16,0x0b,0xde,0xba,0x6f,0x80,0x55,0x31,0xe4,0xf9,0x2c,0x48,0x9d,
-    ),
-    ( # 214
-        0x00,0xd6,0xb7,0x61,0x75,0xa3,0xc2,0x14,0xea,0x3c,0x5d,0x8b,0x9f,0x49,0x28,0xfe,
-        0xcf,0x19,0x78,0xae,0xba,0x6c,0x0d,0xdb,0x25,0xf3,0x92,0x44,0x50,0x86,0xe7,0x31,
-        0x85,0x53,0x32,0xe4,0xf0,0x26,0x47,0x91,0x6f,0xb9,0xd8,0x0e,0x1a,0xcc,0xad,0x7b,
-        0x4a,0x9c,0xfd,0x2b,0x3f,0xe9,0x88,0x5e,0xa0,0x76,0x17,0xc1,0xd5,0x03,0x62,0xb4,
-        0x11,0xc7,0xa6,0x70,0x64,0xb2,0xd3,0x05,0xfb,0x2d,0x4c,0x9a,0x8e,0x58,0x39,0xef,
-        0xde,0x08,0x69,0xbf,0xab,0x7d,0x1c,0xca,0x34,0xe2,0x83,0x55,0x41,0x97,0xf6,0x20,
-        0x94,0x42,0x23,0xf5,0xe1,0x37,0x56,0x80,0x7e,0xa8,0xc9,0x1f,0x0b,0xdd,0xbc,0x6a,
-        0x5b,0x8d,0xec,0x3a,0x2e,0xf8,0x99,0x4f,0xb1,0x67,0x06,0xd0,0xc4,0x12,0x73,0xa5,
-        0x22,0xf4,0x95,0x43,0x57,0x81,0xe0,0x36,0xc8,0x1e,0x7f,0xa9,0xbd,0x6b,0x0a,0xdc,
-        0xed,0x3b,0x5a,0x8c,0x98,0x4e,0x2f,0xf9,0x07,0xd1,0xb0,0x66,0x72,0xa4,0xc5,0x13,
-        0xa7,0x71,0x10,0xc6,0xd2,0x04,0x65,0xb3,0x4d,0x9b,0xfa,0x2c,0x38,0xee,0x8f,0x59,
-        0x68,0xbe,0xdf,0x09,0x1d,0xcb,0xaa,0x7c,0x82,0x54,0x35,0xe3,0xf7,0x21,0x40,0x96,
-        0x33,0xe5,0x84,0x52,0x46,0x90,0xf1,0x27,0xd9,0x0f,0x6e,0xb8,0xac,0x7a,0x1b,0xcd,
-        0xfc,0x2a,0x4b,0x9d,0x89,0x5f,0x3e,0xe8,0x16,0xc0,0xa1,0x77,0x63,0xb5,0xd4,0x02,
-        0xb6,0x60,0x01,0xd7,0xc3,0x15,0x74,0xa2,0x5c,0x8a,0xeb,0x3d,0x29,0xff,0x9e,0x48,
-        0x79,0xaf,0xce,0x18,0x0c,0xda,0xbb,0x6d,0x93,0x45,0x24,0xf2,0xe6,0x30,0x51,0x87,
-    ),
-    ( # 215
-        0x00,0xd7,0xb5,0x62,0x71,0xa6,0xc4,0x13,0xe2,0x35,0x57,0x80,0x93,0x44,0x26,0xf1,
-        0xdf,0x08,0x6a,0xbd,0xae,0x79,0x1b,0xcc,0x3d,0xea,0x88,0x5f,0x4c,0x9b,0xf9,0x2e,
-        0xa5,0x72,0x10,0xc7,0xd4,0x03,0x61,0xb6,0x47,0x90,0xf2,0x25,0x36,0xe1,0x83,0x54,
-        0x7a,0xad,0xcf,0x18,0x0b,0xdc,0xbe,0x69,0x98,0x4f,0x2d,0xfa,0xe9,0x3e,0x5c,0x8b,
-        0x51,0x86,0xe4,0x33,0x20,0xf7,0x95,0x42,0xb3,0x64,0x06,0xd1,0xc2,0x15,0x77,0xa0,
-        0x8e,0x59,0x3b,0xec,0xff,0x28,0x4a,0x9d,0x6c,0xbb,0xd9,0x0e,0x1d,0xca,0xa8,0x7f,
-        0xf4,0x23,0x41,0x96,0x85,0x52,0x30,0xe7,0x16,0xc1,0xa3,0x74,0x67,0xb0,0xd2,0x05,
-        0x2b,0xfc,0x9e,0x49,0x5a,0x8d,0xef,0x38,0xc9,0x1e,0x7c,0xab,0xb8,0x6f,0x0d,0xda,
-        0xa2,0x75,0x17,0xc0,0xd3,0x04,0x66,0xb1,0x40,0x97,0xf5,0x22,0x31,0xe6,0x84,0x53,
-        0x7d,0xaa,0xc8,0x1f,0x0c,0xdb,0xb9,0x6e,0x9f,0x48,0x2a,0xfd,0xee,0x39,0x5b,0x8c,
-        0x07,0xd0,0xb2,0x65,0x76,0xa1,0xc3,0x14,0xe5,0x32,0x50,0x87,0x94,0x43,0x21,0xf6,
-        0xd8,0x0f,0x6d,0xba,0xa9,0x7e,0x1c,0xcb,0x3a,0xed,0x8f,0x58,0x4b,0x9c,0xfe,0x29,
-        0xf3,0x24,0x46,0x91,0x82,0x55,0x37,0xe0,0x11,0xc6,0xa4,0x73,0x60,0xb7,0xd5,0x02,
-        0x2c,0xfb,0x99,0x4e,0x5d,0x8a,0xe8,0x3f,0xce,0x19,0x7b,0xac,0xbf,0x68,0x0a,0xdd,
-        0x56,0x81,0xe3,0x34,0x27,0xf0,0x92,0x45,0xb4,0x63,0x01,0xd6,0xc5,0x12,0x70,0xa7,
-        0x89,0x5e,0x3c,0xeb,0xf8,0x2f,0x4d,0x9a,0x6b,0xbc,0xde,0x09,0x1a,0xcd,0xaf,0x78,
-    ),
-    ( # 216
-        0x00,0xd8,0xab,0x73,0x4d,0x95,0xe6,0x3e,0x9a,0x42,0x31,0xe9,0xd7,0x0f,0x7c,0xa4,
-        0x2f,0xf7,0x84,0x5c,0x62,0xba,0xc9,0x11,0xb5,0x6d,0x1e,0xc6,0xf8,0x20,0x53,0x8b,
-        0x5e,0x86,0xf5,0x2d,0x13,0xcb,0xb8,0x60,0xc4,0x1c,0x6f,0xb7,0x89,0x51,0x22,0xfa,
-        0x71,0xa9,0xda,0x02,0x3c,0xe4,0x97,0x4f,0xeb,0x33,0x40,0x98,0xa6,0x7e,0x0d,0xd5,
-        0xbc,0x64,0x17,0xcf,0xf1,0x29,0x5a,0x82,0x26,0xfe,0x8d,0x55,0x6b,0xb3,0xc0,0x18,
-        0x93,0x4b,0x38,0xe0,0xde,0x06,0x75,0xad,0x09,0xd1,0xa2,0x7a,0x44,0x9c,0xef,0x37,
-        0xe2,0x3a,0x49,0x91,0xaf,0x77,0x04,0xdc,0x78,0xa0,0xd3,0x0b,0x35,0xed,0x9e,0x46,
-        0xcd,0x15,0x66,0xbe,0x80,0x58,0x2b,0xf3,0x57,0x8f,0xfc,0x24,0x1a,0xc2,0xb1,0x69,
-        0x63,0xbb,0xc8,0x10,0x2e,0xf6,0x85,0x5d,0xf9,0x21,0x52,0x8a,0xb4,0x6c,0x1f,0xc7,
-        0x4c,0x94,0xe7,0x3f,0x01,0xd9,0xaa,0x72,0xd6,0x0e,0x7d,0xa5,0x9b,0x43,0x30,0xe8,
-        0x3d,0xe5,0x96,0x4e,0x70,0xa8,0xdb,0x03,0xa7,0x7f,0x0c,0xd4,0xea,0x32,0x41,0x99,
-        0x12,0xca,0xb9,0x61,0x5f,0x87,0xf4,0x2c,0x88,0x50,0x23,0xfb,0xc5,0x1d,0x6e,0xb6,
-        0xdf,0x07,0x74,0xac,0x92,0x4a,0x39,0xe1,0x45,0x9d,0xee,0x36,0x08,0xd0,0xa3,0x7b,
-        0xf0,0x28,0x5b,0x83,0xbd,0x65,0x16,0xce,0x6a,0xb2,0xc1,0x19,0x27,0xff,0x8c,0x54,
-        0x81,0x59,0x2a,0xf2,0xcc,0x14,0x67,0xbf,0x1b,0xc3,0xb0,0x68,0x56,0x8e,0xfd,0x25,
-        0xae,0x76,0x05,0xdd,0xe3,0x3b,0x48,0x90,0x34,0xec,0x9f,0x47,0x79,0xa1,0xd2,0x0a,
-    ),
-    ( # 217
-        0x00,0xd9,0xa9,0x70,0x49,0x90,0xe0,0x39,0x92,0x4b,0x3b,0xe2,0xdb,0x02,0x72,0xab,
-        0x3f,0xe6,0x96,0x4f,0x76,0xaf,0xdf,0x06,0xad,0x74,0x04,0xdd,0xe4,0x3d,0x4d,0x94,
-        0x7e,0xa7,0xd7,0x0e,0x37,0xee,0x9e,0x47,0xec,0x35,0x45,0x9c,0xa5,0x7c,0x0c,0xd5,
-        0x41,0x98,0xe8,0x31,0x08,0xd1,0xa1,0x78,0xd3,0x0a,0x7a,0xa3,0x9a,0x43,0x33,0xea,
-        0xfc,0x25,0x55,0x8c,0xb5,0x6c,0x1c,0xc5,0x6e,0xb7,0xc7,0x1e,0x27,0xfe,0x8e,0x57,
-        0xc3,0x1a,0x6a,0xb3,0x8a,0x53,0x23,0xfa,0x51,0x88,0xf8,0x21,0x18,0xc1,0xb1,0x68,
-        0x82,0x5b,0x2b,0xf2,0xcb,0x12,0x62,0xbb,0x10,0xc9,0xb9,0x60,0x59,0x80,0xf0,0x29,
-        0xbd,0x64,0x14,0xcd,0xf4,0x2d,0x5d,0x84,0x2f,0xf6,0x86,0x5f,0x66,0xbf,0xcf,0x16,
-        0xe3,0x3a,0x4a,0x93,0xaa,0x73,0x03,0xda,0x71,0xa8,0xd8,0x01,0x38,0xe1,0x91,0x48,
-        0xdc,0x05,0x75,0xac,0x95,0x4c,0x3c,0xe5,0x4e,0x97,0xe7,0x3e,0x07,0xde,0xae,0x77,
-        0x9d,0x44,0x34,0xed,0xd4,0x0d,0x7d,0xa4,0x0f,0xd6,0xa6,0x7f,0x46,0x9f,0xef,0x36,
-        0xa2,0x7b,0x0b,0xd2,0xeb,0x32,0x42,0x9b,0x30,0xe9,0x99,0x40,0x79,0xa0,0xd0,0x09,
-        0x1f,0xc6,0xb6,0x6f,0x56,0x8f,0xff,0x26,0x8d,0x54,0x24,0xfd,0xc4,0x1d,0x6d,0xb4,
-        0x20,0xf9,0x89,0x50,0x69,0xb0,0xc0,0x19,0xb2,0x6b,0x1b,0xc2,0xfb,0x22,0x52,0x8b,
-        0x61,0xb8,0xc8,0x11,0x28,0xf1,0x81,0x58,0xf3,0x2a,0x5a,0x83,0xba,0x63,0x13,0xca,
-        0x5e,0x87,0xf7,0x2e,0x17,0xce,0xbe,0x67,0xcc,0x15,0x65,0xbc,0x85,0x5c,0x2c,0xf5,
-    ),
-    ( # 218
-        0x00,0xda,0xaf,0x75,0x45,0x9f,0xea,0x30,0x8a,0x50,0x25,0xff,0xcf,0x15,0x60,0xba,
-        0x0f,0xd5,0xa0,0x7a,0x4a,0x90,0xe5,0x3f,0x85,0x5f,0x2a,0xf0,0xc0,0x1a,0x6f,0xb5,
-        0x1e,0xc4,0xb1,0x6b,0x5b,0x81,0xf4,0x2e,0x94,0x4e,0x3b,0xe1,0xd1,0x0b,0x7e,0xa4,
-        0x11,0xcb,0xbe,0x64,0x54,0x8e,0xfb,0x21,0x9b,0x41,0x34,0xee,0xde,0x04,0x71,0xab,
-        0x3c,0xe6,0x93,0x49,0x79,0xa3,0xd6,0x0c,0xb6,0x6c,0x19,0xc3,0xf3,0x29,0x5c,0x86,
-        0x33,0xe9,0x9c,0x46,0x76,0xac,0xd9,0x03,0xb9,0x63,0x16,0xcc,0xfc,0x26,0x53,0x89,
-        0x22,0xf8,0x8d,0x57,0x67,0xbd,0xc8,0x12,0xa8,0x72,0x07,0xdd,0xed,0x37,0x42,0x98,
-        0x2d,0xf7,0x82,0x58,0x68,0xb2,0xc7,0x1d,0xa7,0x7d,0x08,0xd2,0xe2,0x38,0x4d,0x97,
-        0x78,0xa2,0xd7,0x0d,0x3d,0xe7,0x92,0x48,0xf2,0x28,0x5d,0x87,0xb7,0x6d,0x18,0xc2,
-        0x77,0xad,0xd8,0x02,0x32,0xe8,0x9d,0x47,0xfd,0x27,0x52,0x88,0xb8,0x62,0x17,0xcd,
-        0x66,0xbc,0xc9,0x13,0x23,0xf9,0x8c,0x56,0xec,0x36,0x43,0x99,0xa9,0x73,0x06,0xdc,
-        0x69,0xb3,0xc6,0x1c,0x2c,0xf6,0x83,0x59,0xe3,0x39,0x4c,0x96,0xa6,0x7c,0x09,0xd3,
-        0x44,0x9e,0xeb,0x31,0x01,0xdb,0xae,0x74,0xce,0x14,0x61,0xbb,0x8b,0x51,0x24,0xfe,
-        0x4b,0x91,0xe4,0x3e,0x0e,0xd4,0xa1,0x7b,0xc1,0x1b,0x6e,0xb4,0x84,0x5e,0x2b,0xf1,
-        0x5a,0x80,0xf5,0x2f,0x1f,0xc5,0xb0,0x6a,0xd0,0x0a,0x7f,0xa5,0x95,0x4f,0x3a,0xe0,
-        0x55,0x8f,0xfa,0x20,0x10,0xca,0xbf,0x65,0xdf,0x05,0x70,0xaa,0x9a,0x40,0x35,0xef,
-    ),
-    ( # 219
-        0x00,0xdb,0xad,0x76,0x41,0x9a,0xec,0x37,0x82,0x59,0x2f,0xf4,0xc3,0x18,0x6e,0xb5,
-        0x1f,0xc4,0xb2,0x69,0x5e,0x85,0xf3,0x28,0x9d,0x46,0x30,0xeb,0xdc,0x07,0x71,0xaa,
-        0x3e,0xe5,0x93,0x48,0x7f,0xa4,0xd2,0x09,0xbc,0x67,0x11,0xca,0xfd,0x26,0x50,0x8b,
-        0x21,0xfa,0x8c,0x57,0x60,0xbb,0xcd,0x16,0xa3,0x78,0x0e,0xd5,0xe2,0x39,0x4f,0x94,
-        0x7c,0xa7,0xd1,0x0a,0x3d,0xe6,0x90,0x4b,0xfe,0x25,0x53,0x88,0xbf,0x64,0x12,0xc9,
-        0x63,0xb8,0xce,0x15,0x22,0xf9,0x8f,0x54,0xe1,0x3a,0x4c,0x97,0xa0,0x7b,0x0d,0xd6,
-        0x42,0x99,0xef,0x34,0x03,0xd8,0xae,0x75,0xc0,0x1b,0x6d,0xb6,0x81,0x5a,0x2c,0xf7,
-        0x5d,0x86,0xf0,0x2b,0x1c,0xc7,0xb1,0x6a,0xdf,0x04,0x72,0xa9,0x9e,0x45,0x33,0xe8,
-        0xf8,0x23,0x55,0x8e,0xb9,0x62,0x14,0xcf,0x7a,0xa1,0xd7,0x0c,0x3b,0xe0,0x96,0x4d,
-        0xe7,0x3c,0x4a,0x91,0xa6,0x7d,0x0b,0xd0,0x65,0xbe,0xc8,0x13,0x24,0xff,0x89,0x52,
-        0xc6,0x1d,0x6b,0xb0,0x87,0x5c,0x2a,0xf1,0x44,0x9f,0xe9,0x32,0x05,0xde,0xa8,0x73,
-        0xd9,0x02,0x74,0xaf,0x98,0x43,0x35,0xee,0x5b,0x80,0xf6,0x2d,0x1a,0xc1,0xb7,0x6c,
-        0x84,0x5f,0x29,0xf2,0xc5,0x1e,0x68,0xb3,0x06,0xdd,0xab,0x70,0x47,0x9c,0xea,0x31,
-        0x9b,0x40,0x36,0xed,0xda,0x01,0x77,0xac,0x19,0xc2,0xb4,0x6f,0x58,0x83,0xf5,0x2e,
-        0xba,0x61,0x17,0xcc,0xfb,0x20,0x56,0x8d,0x38,0xe3,0x95,0x4e,0x79,0xa2,0xd4,0x0f,
-        0xa5,0x7e,0x08,0xd3,0xe4,0x3f,0x49,0x92,0x27,0xfc,0x8a,0x51,0x66,0xbd,0xcb,0x10,
-    ),
-    ( # 220
-        0x00,0xdc,0xa3,0x7f,0x5d,0x81,0xfe,0x22,0xba,0x66,0x19,0xc5,0xe7,0x3b,0x44,0x98,
-        0x6f,0xb3,0xcc,0x10,0x32,0xee,0x91,0x4d,0xd5,0x09,0x76,0xaa,0x88,0x54,0x2b,0xf7,
-        0xde,0x02,0x7d,0xa1,0x83,0x5f,0x20,0xfc,0x64,0xb8,0xc7,0x1b,0x39,0xe5,0x9a,0x46,
-        0xb1,0x6d,0x12,0xce,0xec,0x30,0x4f,0x93,0x0b,0xd7,0xa8,0x74,0x56,0x8a,0xf5,0x29,
-        0xa7,0x7b,0x04,0xd8,0xfa,0x26,0x59,0x85,0x1d,0xc1,0xbe,0x62,0x40,0x9c,0xe3,0x3f,
-        0xc8,0x14,0x6b,0xb7,0x95,0x49,0x36,0xea,0x72,0xae,0xd1,0x0d,0x2f,0xf3,0x8c,0x50,
-        0x79,0xa5,0xda,0x06,0x24,0xf8,0x87,0x5b,0xc3,0x1f,0x60,0xbc,0x9e,0x42,0x3d,0xe1,
-        0x16,0xca,0xb5,0x69,0x4b,0x97,0xe8,0x34,0xac,0x70,0x0f,0xd3,0xf1,0x2d,0x52,0x8e,
-        0x55,0x89,0xf6,0x2a,0x08,0xd4,0xab,0x77,0xef,0x33,0x4c,0x90,0xb2,0x6e,0x11,0xcd,
-        0x3a,0xe6,0x99,0x45,0x67,0xbb,0xc4,0x18,0x80,0x5c,0x23,0xff,0xdd,0x01,0x7e,0xa2,
-        0x8b,0x57,0x28,0xf4,0xd6,0x0a,0x75,0xa9,0x31,0xed,0x92,0x4e,0x6c,0xb0,0xcf,0x13,
-        0xe4,0x38,0x47,0x9b,0xb9,0x65,0x1a,0xc6,0x5e,0x82,0xfd,0x21,0x03,0xdf,0xa0,0x7c,
-        0xf2,0x2e,0x51,0x8d,0xaf,0x73,0x0c,0xd0,0x48,0x94,0xeb,0x37,0x15,0xc9,0xb6,0x6a,
-        0x9d,0x41,0x3e,0xe2,0xc0,0x1c,0x63,0xbf,0x27,0xfb,0x84,0x58,0x7a,0xa6,0xd9,0x05,
-        0x2c,0xf0,0x8f,0x53,0x71,0xad,0xd2,0x0e,0x96,0x4a,0x35,0xe9,0xcb,0x17,0x68,0xb4,
-        0x43,0x9f,0xe0,0x3c,0x1e,0xc2,0xbd,0x61,0xf9,0x25,0x5a,0x86,0xa4,0x78,0x07,0xdb,
-    ),
-    ( # 221
-        0x00,0xdd,0xa1,0x7c,0x59,0x84,0xf8,0x25,0xb2,0x6f,0x13,0xce,0xeb,0x36,0x4a,0x97,
-        0x7f,0xa2,0xde,0x03,0x26,0xfb,0x87,0x5a,0xcd,0x10,0x6c,0xb1,0x94,0x49,0x35,0xe8,
-        0xfe,0x23,0x5f,0x82,0xa7,0x7a,0x06,0xdb,0x4c,0x91,0xed,0x30,0x15,0xc8,0xb4,0x69,
-        0x81,0x5c,0x20,0xfd,0xd8,0x05,0x79,0xa4,0x33,0xee,0x92,0x4f,0x6a,0xb7,0xcb,0x16,
-        0xe7,0x3a,0x46,0x9b,0xbe,0x63,0x1f,0xc2,0x55,0x88,0xf4,0x29,0x0c,0xd1,0xad,0x70,
-        0x98,0x45,0x39,0xe4,0xc1,0x1c,0x60,0xbd,0x2a,0xf7,0x8b,0x56,0x73,0xae,0xd2,0x0f,
-        0x19,0xc4,0xb8,0x65,0x40,0x9d,0xe1,0x3c,0xab,0x76,0x0a,0xd7,0xf2,0x2f,0x53,0x8e,
-        0x66,0xbb,0xc7,0x1a,0x3f,0xe2,0x9e,0x43,0xd4,0x09,0x75,0xa8,0x8d,0x50,0x2c,0xf1,
-        0xd5,0x08,0x74,0xa9,0x8c,0x51,0x2d,0xf0,0x67,0xba,0xc6,0x1b,0x3e,0xe3,0x9f,0x42,
-        0xaa,0x77,0x0b,0xd6,0xf3,0x2e,0x52,0x8f,0x18,0xc5,0xb9,0x64,0x41,0x9c,0xe0,0x3d,
-        0x2b,0xf6,0x8a,0x57,0x72,0xaf,0xd3,0x0e,0x99,0x44,0x38,0xe5,0xc0,0x1d,0x61,0xbc,
-        0x54,0x89,0xf5,0x28,0x0d,0xd0,0xac,0x71,0xe6,0x3b,0x47,0x9a,0xbf,0x62,0x1e,0xc3,
-        0x32,0xef,0x93,0x4e,0x6b,0xb6,0xca,0x17,0x80,0x5d,0x21,0xfc,0xd9,0x04,0x78,0xa5,
-        0x4d,0x90,0xec,0x31,0x14,0xc9,0xb5,0x68,0xff,0x22,0x5e,0x83,0xa6,0x7b,0x07,0xda,
-        0xcc,0x11,0x6d,0xb0,0x95,0x48,0x34,0xe9,0x7e,0xa3,0xdf,0x02,0x27,0xfa,0x86,0x5b,
-        0xb3,0x6e,0x12,0xcf,0xea,0x37,0x4b,0x96,0x01,0xdc,0xa0,0x7d,0x58,0x85,0xf9,0x24,
-    ),
-    ( # 222
-        0x00,0xde,0xa7,0x79,0x55,0x8b,0xf2,0x2c,0xaa,0x74,0x0d,0xd3,0xff,0x21,0x58,0x86,
-        0x4f,0x91,0xe8,0x36,0x1a,0xc4,0xbd,0x63,0xe5,0x3b,0x42,0x9c,0xb0,0x6e,0x17,0xc9,
-        0x9e,0x40,0x39,0xe7,0xcb,0x15,0x6c,0xb2,0x34,0xea,0x93,0x4d,0x61,0xbf,0xc6,0x18,
-        0xd1,0x0f,0x76,0xa8,0x84,0x5a,0x23,0xfd,0x7b,0xa5,0xdc,0x02,0x2e,0xf0,0x89,0x57,
-        0x27,0xf9,0x80,0x5e,0x72,0xac,0xd5,0x0b,0x8d,0x53,0x2a,0xf4,0xd8,0x06,0x7f,0xa1,
-        0x68,0xb6,0xcf,0x11,0x3d,0xe3,0x9a,0x44,0xc2,0x1c,0x65,0xbb,0x97,0x49,0x30,0xee,
-        0xb9,0x67,0x1e,0xc0,0xec,0x32,0x4b,0x95,0x13,0xcd,0xb4,0x6a,0x46,0x98,0xe1,0x3f,
-        0xf6,0x28,0x51,0x8f,0xa3,0x7d,0x04,0xda,0x5c,0x82,0xfb,0x25,0x09,0xd7,0xae,0x70,
-        0x4e,0x90,0xe9,0x37,0x1b,0xc5,0xbc,0x62,0xe4,0x3a,0x43,0x9d,0xb1,0x6f,0x16,0xc8,
-        0x01,0xdf,0xa6,0x78,0x54,0x8a,0xf3,0x2d,0xab,0x75,0x0c,0xd2,0xfe,0x20,0x59,0x87,
-        0xd0,0x0e,0x77,0xa9,0x85,0x5b,0x22,0xfc,0x7a,0xa4,0xdd,0x03,0x2f,0xf1,0x88,0x56,
-        0x9f,0x41,0x38,0xe6,0xca,0x14,0x6d,0xb3,0x35,0xeb,0x92,0x4c,0x60,0xbe,0xc7,0x19,
-        0x69,0xb7,0xce,0x10,0x3c,0xe2,0x9b,0x45,0xc3,0x1d,0x64,0xba,0x96,0x48,0x31,0xef,
-        0x26,0xf8,0x81,0x5f,0x73,0xad,0xd4,0x0a,0x8c,0x52,0x2b,0xf5,0xd9,0x07,0x7e,0xa0,
-        0xf7,0x29,0x50,0x8e,0xa2,0x7c,0x05,0xdb,0x5d,0x83,0xfa,0x24,0x08,0xd6,0xaf,0x71,
-        0xb8,0x66,0x1f,0xc1,0xed,0x33,0x4a,0x94,0x12,0xcc,0xb5,0x6b,0x47,0x99,0xe0,0x3e,
-    ),
-    ( # 223
-        0x00,0xdf,0xa5,0x7a,0x51,0x8e,0xf4,0x2b,0xa2,0x7d,0x07,0xd8,0xf3,0x2c,0x56,0x89,
-        0x5f,0x80,0xfa,0x25,0x0e,0xd1,0xab,0x74,0xfd,0x22,0x58,0x87,0xac,0x73,0x09,0xd6,
-        0xbe,0x61,0x1b,0xc4,0xef,0x30,0x4a,0x95,0x1c,0xc3,0xb9,0x66,0x4d,0x92,0xe8,0x37,
-        0xe1,0x3e,0x44,0x9b,0xb0,0x6f,0x15,0xca,0x43,0x9c,0xe6,0x39,0x12,0xcd,0xb7,0x68,
-        0x67,0xb8,0xc2,0x1d,0x36,0xe9,0x93,0x4c,0xc5,0x1a,0x60,0xbf,0x94,0x4b,0x31,0xee,
-        0x38,0xe7,0x9d,0x42,0x69,0xb6,0xcc,0x13,0x9a,0x45,0x3f,0xe0,0xcb,0x14,0x6e,0xb1,
-        0xd9,0x06,0x7c,0xa3,0x88,0x57,0x2d,0xf2,0x7b,0xa4,0xde,0x01,0x2a,0xf5,0x8f,0x50,
-        0x86,0x59,0x23,0xfc,0xd7,0x08,0x72,0xad,0x24,0xfb,0x81,0x5e,0x75,0xaa,0xd0,0x0f,
-        0xce,0x11,0x6b,0xb4,0x9f,0x40,0x3a,0xe5,0x6c,0xb3,0xc9,0x16,0x3d,0xe2,0x98,0x47,
-        0x91,0x4e,0x34,0xeb,0xc0,0x1f,0x65,0xba,0x33,0xec,0x96,0x49,0x62,0xbd,0xc7,0x18,
-        0x70,0xaf,0xd5,0x0a,0x21,0xfe,0x84,0x5b,0xd2,0x0d,0x77,0xa8,0x83,0x5c,0x26,0xf9,
-        0x2f,0xf0,0x8a,0x55,0x7e,0xa1,0xdb,0x04,0x8d,0x52,0x28,0xf7,0xdc,0x03,0x79,0xa6,
-        0xa9,0x76,0x0c,0xd3,0xf8,0x27,0x5d,0x82,0x0b,0xd4,0xae,0x71,0x5a,0x85,0xff,0x20,
-        0xf6,0x29,0x53,0x8c,0xa7,0x78,0x02,0xdd,0x54,0x8b,0xf1,0x2e,0x05,0xda,0xa0,0x7f,
-        0x17,0xc8,0xb2,0x6d,0x46,0x99,0xe3,0x3c,0xb5,0x6a,0x10,0xcf,0xe4,0x3b,0x41,0x9e,
-        0x48,0x97,0xed,0x32,0x19,0xc6,0xbc,0x63,0xea,0x35,0x4f,0x90,0xbb,0x64,0x1e,0xc1,
-    ),
-    ( # 224
-        0x00,0xe0,0xdb,0x3b,0xad,0x4d,0x76,0x96,0x41,0xa1,0x9a,0x7a,0xec,0x0c,0x37,0xd7,
-        0x82,0x62,0x59,0xb9,0x2f,0xcf,0xf4,0x14,0xc3,0x23,0x18,0xf8,0x6e,0x8e,0xb5,0x55,
-        0x1f,0xff,0xc4,0x24,0xb2,0x52,0x69,0x89,0x5e,0xbe,0x85,0x65,0xf3,0x13,0x28,0xc8,
-        0x9d,0x7d,0x46,0xa6,0x30,0xd0,0xeb,0x0b,0xdc,0x3c,0x07,0xe7,0x71,0x91,0xaa,0x4a,
-        0x3e,0xde,0xe5,0x05,0x93,0x73,0x48,0xa8,0x7f,0x9f,0xa4,0x44,0xd2,0x32,0x09,0xe9,
-        0xbc,0x5c,0x67,0x87,0x11,0xf1,0xca,0x2a,0xfd,0x1d,0x26,0xc6,0x50,0xb0,0x8b,0x6b,
-        0x21,0xc1,0xfa,0x1a,0x8c,0x6c,0x57,0xb7,0x60,0x80,0xbb,0x5b,0xcd,0x2d,0x16,0xf6,
-        0xa3,0x43,0x78,0x98,0x0e,0xee,0xd5,0x35,0xe2,0x02,0x39,0xd9,0x4f,0xaf,0x94,0x74,
-        0x7c,0x9c,0xa7,0x47,0xd1,0x31,0x0a,0xea,0x3d,0xdd,0xe6,0x06,0x90,0x70,0x4b,0xab,
-        0xfe,0x1e,0x25,0xc5,0x53,0xb3,0x88,0x68,0xbf,0x5f,0x64,0x84,0x12,0xf2,0xc9,0x29,
-        0x63,0x83,0xb8,0x58,0xce,0x2e,0x15,0xf5,0x22,0xc2,0xf9,0x19,0x8f,0x6f,0x54,0xb4,
-        0xe1,0x01,0x3a,0xda,0x4c,0xac,0x97,0x77,0xa0,0x40,0x7b,0x9b,0x0d,0xed,0xd6,0x36,
-        0x42,0xa2,0x99,0x79,0xef,0x0f,0x34,0xd4,0x03,0xe3,0xd8,0x38,0xae,0x4e,0x75,0x95,
-        0xc0,0x20,0x1b,0xfb,0x6d,0x8d,0xb6,0x56,0x81,0x61,0x5a,0xba,0x2c,0xcc,0xf7,0x17,
-        0x5d,0xbd,0x86,0x66,0xf0,0x10,0x2b,0xcb,0x1c,0xfc,0xc7,0x27,0xb1,0x51,0x6a,0x8a,
-        0xdf,0x3f,0x04,0xe4,0x72,0x92,0xa9,0x49,0x9e,0x7e,0x45,0xa5,0x33,0xd3,0xe8,0x08,
-    ),
-    ( # 225
-        0x00,0xe1,0xd9,0x38,0xa9,0x48,0x70,0x91,0x49,0xa8,0x90,0x71,0xe0,0x01,0x39,0xd8,
-        0x92,0x73,0x4b,0xaa,0x3b,0xda,0xe2,0x03,0xdb,0x3a,0x02,0xe3,0x72,0x93,0xab,0x4a,
-        0x3f,0xde,0xe6,0x07,0x96,0x77,0x4f,0xae,0x76,0x97,0xaf,0x4e,0xdf,0x3e,0x06,0xe7,
-        0xad,0x4c,0x74,0x95,0x04,0xe5,0xdd,0x3c,0xe4,0x05,0x3d,0xdc,0x4d,0xac,0x94,0x75,
-        0x7e,0x9f,0xa7,0x46,0xd7,0x36,0x0e,0xef,0x37,0xd6,0xee,0x0f,0x9e,0x7f,0x47,0xa6,
-        0xec,0x0d,0x35,0xd4,0x45,0xa4,0x9c,0x7d,0xa5,0x44,0x7c,0x9d,0x0c,0xed,0xd5,0x34,
-        0x41,0xa0,0x98,0x79,0xe8,0x09,0x31,0xd0,0x08,0xe9,0xd1,0x30,0xa1,0x40,0x78,0x99,
-        0xd3,0x32,0x0a,0xeb,0x7a,0x9b,0xa3,0x42,0x9a,0x7b,0x43,0xa2,0x33,0xd2,0xea,0x0b,
-        0xfc,0x1d,0x25,0xc4,0x55,0xb4,0x8c,0x6d,0xb5,0x54,0x6c,0x8d,0x1c,0xfd,0xc5,0x24,
-        0x6e,0x8f,0xb7,0x56,0xc7,0x26,0x1e,0xff,0x27,0xc6,0xfe,0x1f,0x8e,0x6f,0x57,0xb6,
-        0xc3,0x22,0x1a,0xfb,0x6a,0x8b,0xb3,0x52,0x8a,0x6b,0x53,0xb2,0x23,0xc2,0xfa,0x1b,
-        0x51,0xb0,0x88,0x69,0xf8,0x19,0x21,0xc0,0x18,0xf9,0xc1,0x20,0xb1,0x50,0x68,0x89,
-        0x82,0x63,0x5b,0xba,0x2b,0xca,0xf2,0x13,0xcb,0x2a,0x12,0xf3,0x62,0x83,0xbb,0x5a,
-        0x10,0xf1,0xc9,0x28,0xb9,0x58,0x60,0x81,0x59,0xb8,0x80,0x61,0xf0,0x11,0x29,0xc8,
-        0xbd,0x5c,0x64,0x85,0x14,0xf5,0xcd,0x2c,0xf4,0x15,0x2d,0xcc,0x5d,0xbc,0x84,0x65,
-        0x2f,0xce,0xf6,0x17,0x86,0x67,0x5f,0xbe,0x66,0x87,0xbf,0x5e,0xcf,0x2e,0x16,0xf7,
-    ),
-    ( # 226
-        0x00,0xe2,0xdf,0x3d,0xa5,0x47,0x7a,0x98,0x51,0xb3,0x8e,0x6c,0xf4,0x16,0x2b,0xc9,
-        0xa2,0x40,0x7d,0x9f,0x07,0xe5,0xd8,0x3a,0xf3,0x11,0x2c,0xce,0x56,0xb4,0x89,0x6b,
-        0x5f,0xbd,0x80,0x62,0xfa,0x18,0x25,0xc7,0x0e,0xec,0xd1,0x33,0xab,0x49,0x74,0x96,
-        0xfd,0x1f,0x22,0xc0,0x58,0xba,0x87,0x65,0xac,0x4e,0x73,0x91,0x09,0xeb,0xd6,0x34,
-        0xbe,0x5c,0x61,0x83,0x1b,0xf9,0xc4,0x26,0xef,0x0d,0x30,0xd2,0x4a,0xa8,0x95,0x77,
-        0x1c,0xfe,0xc3,0x21,0xb9,0x5b,0x66,0x84,0x4d,0xaf,0x92,0x70,0xe8,0x0a,0x37,0xd5,
-        0xe1,0x03,0x3e,0xdc,0x44,0xa6,0x9b,0x79,0xb0,0x52,0x6f,0x8d,0x15,0xf7,0xca,0x28,
-        0x43,0xa1,0x9c,0x7e,0xe6,0x04,0x39,0xdb,0x12,0xf0,0xcd,0x2f,0xb7,0x55,0x68,0x8a,
-        0x67,0x85,0xb8,0x5a,0xc2,0x20,0x1d,0xff,0x36,0xd4,0xe9,0x0b,0x93,0x71,0x4c,0xae,
-        0xc5,0x27,0x1a,0xf8,0x60,0x82,0xbf,0x5d,0x94,0x76,0x4b,0xa9,0x31,0xd3,0xee,0x0c,
-        0x38,0xda,0xe7,0x05,0x9d,0x7f,0x42,0xa0,0x69,0x8b,0xb6,0x54,0xcc,0x2e,0x13,0xf1,
-        0x9a,0x78,0x45,0xa7,0x3f,0xdd,0xe0,0x02,0xcb,0x29,0x14,0xf6,0x6e,0x8c,0xb1,0x53,
-        0xd9,0x3b,0x06,0xe4,0x7c,0x9e,0xa3,0x41,0x88,0x6a,0x57,0xb5,0x2d,0xcf,0xf2,0x10,
-        0x7b,0x99,0xa4,0x46,0xde,0x3c,0x01,0xe3,0x2a,0xc8,0xf5,0x17,0x8f,0x6d,0x50,0xb2,
-        0x86,0x64,0x59,0xbb,0x23,0xc1,0xfc,0x1e,0xd7,0x35,0x08,0xea,0x72,0x90,0xad,0x4f,
-        0x24,0xc6,0xfb,0x19,0x81,0x63,0x5e,0xbc,0x75,0x97,0xaa,0x48,0xd0,0x32,0x0f,0xed,
-    ),
-    ( # 227
-        0x00,0xe3,0xdd,0x3e,0xa1,0x42,0x7c,0x9f,0x59,0xba,0x84,0x67,0xf8,0x1b,0x25,0xc6,
-        0xb2,0x51,0x6f,0x8c,0x13,0xf0,0xce,0x2d,0xeb,0x08,0x36,0xd5,0x4a,0xa9,0x97,0x74,
-        0x7f,0x9c,0xa2,0x41,0xde,0x3d,0x03,0xe0,0x26,0xc5,0xfb,0x18,0x87,0x64,0x5a,0xb9,
-        0xcd,0x2e,0x10,0xf3,0x6c,0x8f,0xb1,0x52,0x94,0x77,0x49,0xaa,0x35,0xd6,0xe8,0x0b,
-        0xfe,0x1d,0x23,0xc0,0x5f,0xbc,0x82,0x61,0xa7,0x44,0x7a,0x99,0x06,0xe5,0xdb,0x38,
-        0x4c,0xaf,0x91,0x72,0xed,0x0e,0x30,0xd3,0x15,0xf6,0xc8,0x2b,0xb4,0x57,0x69,0x8a,
-        0x81,0x62,0x5c,0xbf,0x20,0xc3,0xfd,0x1e,0xd8,0x3b,0x05,0xe6,0x79,0x9a,0xa4,0x47,
-        0x33,0xd0,0xee,0x0d,0x92,0x71,0x4f,0xac,0x6a,0x89,0xb7,0x54,0xcb,0x28,0x16,0xf5,
-        0xe7,0x04,0x3a,0xd9,0x46,0xa5,0x9b,0x78,0xbe,0x5d,0x63,0x80,0x1f,0xfc,0xc2,0x21,
-        0x55,0xb6,0x88,0x6b,0xf4,0x17,0x29,0xca,0x0c,0xef,0xd1,0x32,0xad,0x4e,0x70,0x93,
-        0x98,0x7b,0x45,0xa6,0x39,0xda,0xe4,0x07,0xc1,0x22,0x1c,0xff,0x60,0x83,0xbd,0x5e,
-        0x2a,0xc9,0xf7,0x14,0x8b,0x68,0x56,0xb5,0x73,0x90,0xae,0x4d,0xd2,0x31,0x0f,0xec,
-        0x19,0xfa,0xc4,0x27,0xb8,0x5b,0x65,0x86,0x40,0xa3,0x9d,0x7e,0xe1,0x02,0x3c,0xdf,
-        0xab,0x48,0x76,0x95,0x0a,0xe9,0xd7,0x34,0xf2,0x11,0x2f,0xcc,0x53,0xb0,0x8e,0x6d,
-        0x66,0x85,0xbb,0x58,0xc7,0x24,0x1a,0xf9,0x3f,0xdc,0xe2,0x01,0x9e,0x7d,0x43,0xa0,
-        0xd4,0x37,0x09,0xea,0x75,0x96,0xa8,0x4b,0x8d,0x6e,0x50,0xb3,0x2c,0xcf,0xf1,0x12,
-    ),
-    ( # 228
-        0x00,0xe4,0xd3,0x37,0xbd,0x59,0x6e,0x8a,0x61,0x85,0xb2,0x56,0xdc,0x38,0x0f,0xeb,
-        0xc2,0x26,0x11,0xf5,0x7f,0x9b,0xac,0x48,0xa3,0x47,0x70,0x94,0x1e,0xfa,0xcd,0x29,
-        0x9f,0x7b,0x4c,0xa8,0x22,0xc6,0xf1,0x15,0xfe,0x1a,0x2d,0xc9,0x43,0xa7,0x90,0x74,
-        0x5d,0xb9,0x8e,0x6a,0xe0,0x04,0x33,0xd7,0x3c,0xd8,0xef,0x0b,0x81,0x65,0x52,0xb6,
-        0x25,0xc1,0xf6,0x12,0x98,0x7c,0x4b,0xaf,0x44,0xa0,0x97,0x73,0xf9,0x1d,0x2a,0xce,
-        0xe7,0x03,0x34,0xd0,0x5a,0xbe,0x89,0x6d,0x86,0x62,0x55,0xb1,0x3b,0xdf,0xe8,0x0c,
-        0xba,0x5e,0x69,0x8d,0x07,0xe3,0xd4,0x30,0xdb,0x3f,0x08,0xec,0x66,0x82,0xb5,0x51,
-        0x78,0x9c,0xab,0x4f,0xc5,0x21,0x16,0xf2,0x19,0xfd,0xca,0x2e,0xa4,0x40,0x77,0x93,
-        0x4a,0xae,0x99,0x7d,0xf7,0x13,0x24,0xc0,0x2b,0xcf,0xf8,0x1c,0x96,0x72,0x45,0xa1,
-        0x88,0x6c,0x5b,0xbf,0x35,0xd1,0xe6,0x02,0xe9,0x0d,0x3a,0xde,0x54,0xb0,0x87,0x63,
-        0xd5,0x31,0x06,0xe2,0x68,0x8c,0xbb,0x5f,0xb4,0x50,0x67,0x83,0x09,0xed,0xda,0x3e,
-        0x17,0xf3,0xc4,0x20,0xaa,0x4e,0x79,0x9d,0x76,0x92,0xa5,0x41,0xcb,0x2f,0x18,0xfc,
-        0x6f,0x8b,0xbc,0x58,0xd2,0x36,0x01,0xe5,0x0e,0xea,0xdd,0x39,0xb3,0x57,0x60,0x84,
-        0xad,0x49,0x7e,0x9a,0x10,0xf4,0xc3,0x27,0xcc,0x28,0x1f,0xfb,0x71,0x95,0xa2,0x46,
-        0xf0,0x14,0x23,0xc7,0x4d,0xa9,0x9e,0x7a,0x91,0x75,0x42,0xa6,0x2c,0xc8,0xff,0x1b,
-        0x32,0xd6,0xe1,0x05,0x8f,0x6b,0x5c,0xb8,0x53,0xb7,0x80,0x64,0xee,0x0a,0x3d,0xd9,
-    ),
-    ( # 229
-        0x00,0xe5,0xd1,0x34,0xb9,0x5c,0x68,0x8d,0x69,0x8c,0xb8,0x5d,0xd0,0x35,0x01,0xe4,
-        0xd2,0x37,0x03,0xe6,0x6b,0x8e,0xba,0x5f,0xbb,0x5e,0x6a,0x8f,0x02,0xe7,0xd3,0x36,
-        0xbf,0x5a,0x6e,0x8b,0x06,0xe3,0xd7,0x32,0xd6,0x33,0x07,0xe2,0x6f,0x8a,0xbe,0x5b,
-        0x6d,0x88,0xbc,0x59,0xd4,0x31,0x05,0xe0,0x04,0xe1,0xd5,0x30,0xbd,0x58,0x6c,0x89,
-        0x65,0x80,0xb4,0x51,0xdc,0x39,0x0d,0xe8,0x0c,0xe9,0xdd,0x38,0xb5,0x50,0x64,0x81,
-        0xb7,0x52,0x66,0x83,0x0e,0xeb,0xdf,0x3a,0xde,0x3b,0x0f,0xea,0x67,0x82,0xb6,0x53,
-        0xda,0x3f,0x0b,0xee,0x63,0x86,0xb2,0x57,0xb3,0x56,0x62,0x87,0x0a,0xef,0xdb,0x3e,
-        0x08,0xed,0xd9,0x3c,0xb1,0x54,0x60,0x85,0x61,0x84,0xb0,0x55,0xd8,0x3d,0x09,0xec,
-        0xca,0x2f,0x1b,0xfe,0x73,0x96,0xa2,0x47,0xa3,0x46,0x72,0x97,0x1a,0xff,0xcb,0x2e,
-        0x18,0xfd,0xc9,0x2c,0xa1,0x44,0x70,0x95,0x71,0x94,0xa0,0x45,0xc8,0x2d,0x19,0xfc,
-        0x75,0x90,0xa4,0x41,0xcc,0x29,0x1d,0xf8,0x1c,0xf9,0xcd,0x28,0xa5,0x40,0x74,0x91,
-        0xa7,0x42,0x76,0x93,0x1e,0xfb,0xcf,0x2a,0xce,0x2b,0x1f,0xfa,0x77,0x92,0xa6,0x43,
-        0xaf,0x4a,0x7e,0x9b,0x16,0xf3,0xc7,0x22,0xc6,0x23,0x17,0xf2,0x7f,0x9a,0xae,0x4b,
-        0x7d,0x98,0xac,0x49,0xc4,0x21,0x15,0xf0,0x14,0xf1,0xc5,0x20,0xad,0x48,0x7c,0x99,
-        0x10,0xf5,0xc1,0x24,0xa9,0x4c,0x78,0x9d,0x79,0x9c,0xa8,0x4d,0xc0,0x25,0x11,0xf4,
-        0xc2,0x27,0x13,0xf6,0x7b,0x9e,0xaa,0x4f,0xab,0x4e,0x7a,0x9f,0x12,0xf7,0xc3,0x26,
-    ),
-    ( # 230
-        0x00,0xe6,0xd7,0x31,0xb5,0x53,0x62,0x84,0x71,0x97,0xa6,0x40,0xc4,0x22,0x13,0xf5,
-        0xe2,0x04,0x35,0xd3,0x57,0xb1,0x80,0x66,0x93,0x75,0x44,0xa2,0x26,0xc0,0xf1,0x17,
-        0xdf,0x39,0x08,0xee,0x6a,0x8c,0xbd,0x5b,0xae,0x48,0x79,0x9f,0x1b,0xfd,0xcc,0x2a,
-        0x3d,0xdb,0xea,0x0c,0x88,0x6e,0x5f,0xb9,0x4c,0xaa,0x9b,0x7d,0xf9,0x1f,0x2e,0xc8,
-        0xa5,0x43,0x72,0x94,0x10,0xf6,0xc7,0x21,0xd4,0x32,0x03,0xe5,0x61,0x87,0xb6,0x50,
-        0x47,0xa1,0x90,0x76,0xf2,0x14,0x25,0xc3,0x36,0xd0,0xe1,0x07,0x83,0x65,0x54,0xb2,
-        0x7a,0x9c,0xad,0x4b,0xcf,0x29,0x18,0xfe,0x0b,0xed,0xdc,0x3a,0xbe,0x58,0x69,0x8f,
-        0x98,0x7e,0x4f,0xa9,0x2d,0xcb,0xfa,0x1c,0xe9,0x0f,0x3e,0xd8,0x5c,0xba,0x8b,0x6d,
-        0x51,0xb7,0x86,0x60,0xe4,0x02,0x33,0xd5,0x20,0xc6,0xf7,0x11,0x95,0x73,0x42,0xa4,
-        0xb3,0x55,0x64,0x82,0x06,0xe0,0xd1,0x37,0xc2,0x24,0x15,0xf3,0x77,0x91,0xa0,0x46,
-        0x8e,0x68,0x59,0xbf,0x3b,0xdd,0xec,0x0a,0xff,0x19,0x28,0xce,0x4a,0xac,0x9d,0x7b,
-        0x6c,0x8a,0xbb,0x5d,0xd9,0x3f,0x0e,0xe8,0x1d,0xfb,0xca,0x2c,0xa8,0x4e,0x7f,0x99,
-        0xf4,0x12,0x23,0xc5,0x41,0xa7,0x96,0x70,0x85,0x63,0x52,0xb4,0x30,0xd6,0xe7,0x01,
-        0x16,0xf0,0xc1,0x27,0xa3,0x45,0x74,0x92,0x67,0x81,0xb0,0x56,0xd2,0x34,0x05,0xe3,
-        0x2b,0xcd,0xfc,0x1a,0x9e,0x78,0x49,0xaf,0x5a,0xbc,0x8d,0x6b,0xef,0x09,0x38,0xde,
-        0xc9,0x2f,0x1e,0xf8,0x7c,0x9a,0xab,0x4d,0xb8,0x5e,0x6f,0x89,0x0d,0xeb,0xda,0x3c,
-    ),
-    ( # 231
-        0x00,0xe7,0xd5,0x32,0xb1,0x56,0x64,0x83,0x79,0x9e,0xac,0x4b,0xc8,0x2f,0x1d,0xfa,
-        0xf2,0x15,0x27,0xc0,0x43,0xa4,0x96,0x71,0x8b,0x6c,0x5e,0xb9,0x3a,0xdd,0xef,0x08,
-        0xff,0x18,0x2a,0xcd,0x4e,0xa9,0x9b,0x7c,0x86,0x61,0x53,0xb4,0x37,0xd0,0xe2,0x05,
-        0x0d,0xea,0xd8,0x3f,0xbc,0x5b,0x69,0x8e,0x74,0x93,0xa1,0x46,0xc5,0x22,0x10,0xf7,
-        0xe5,0x02,0x30,0xd7,0x54,0xb3,0x81,0x66,0x9c,0x7b,0x49,0xae,0x2d,0xca,0xf8,0x1f,
-        0x17,0xf0,0xc2,0x25,0xa6,0x41,0x73,0x94,0x6e,0x89,0xbb,0x5c,0xdf,0x38,0x0a,0xed,
-        0x1a,0xfd,0xcf,0x28,0xab,0x4c,0x7e,0x99,0x63,0x84,0xb6,0x51,0xd2,0x35,0x07,0xe0,
-        0xe8,0x0f,0x3d,0xda,0x59,0xbe,0x8c,0x6b,0x91,0x76,0x44,0xa3,0x20,0xc7,0xf5,0x12,
-        0xd1,0x36,0x04,0xe3,0x60,0x87,0xb5,0x52,0xa8,0x4f,0x7d,0x9a,0x19,0xfe,0xcc,0x2b,
-        0x23,0xc4,0xf6,0x11,0x92,0x75,0x47,0xa0,0x5a,0xbd,0x8f,0x68,0xeb,0x0c,0x3e,0xd9,
-        0x2e,0xc9,0xfb,0x1c,0x9f,0x78,0x4a,0xad,0x57,0xb0,0x82,0x65,0xe6,0x01,0x33,0xd4,
-        0xdc,0x3b,0x09,0xee,0x6d,0x8a,0xb8,0x5f,0xa5,0x42,0x70,0x97,0x14,0xf3,0xc1,0x26,
-        0x34,0xd3,0xe1,0x06,0x85,0x62,0x50,0xb7,0x4d,0xaa,0x98,0x7f,0xfc,0x1b,0x29,0xce,
-        0xc6,0x21,0x13,0xf4,0x77,0x90,0xa2,0x45,0xbf,0x58,0x6a,0x8d,0x0e,0xe9,0xdb,0x3c,
-        0xcb,0x2c,0x1e,0xf9,0x7a,0x9d,0xaf,0x48,0xb2,0x55,0x67,0x80,0x03,0xe4,0xd6,0x31,
-        0x39,0xde,0xec,0x0b,0x88,0x6f,0x5d,0xba,0x40,0xa7,0x95,0x72,0xf1,0x16,0x24,0xc3,
-    ),
-    ( # 232
-        0x00,0xe8,0xcb,0x23,0x8d,0x65,0x46,0xae,0x01,0xe9,0xca,0x22,0x8c,0x64,0x47,0xaf,
-        0x02,0xea,0xc9,0x21,0x8f,0x67,0x44,0xac,0x03,0xeb,0xc8,0x20,0x8e,0x66,0x45,0xad,
-        0x04,0xec,0xcf,0x27,0x89,0x61,0x42,0xaa,0x05,0xed,0xce,0x26,0x88,0x60,0x43,0xab,
-        0x06,0xee,0xcd,0x25,0x8b,0x63,0x40,0xa8,0x07,0xef,0xcc,0x24,0x8a,0x62,0x41,0xa9,
-        0x08,0xe0,0xc3,0x2b,0x85,0x6d,0x4e,0xa6,0x09,0xe1,0xc2,0x2a,0x84,0x6c,0x4f,0xa7,
-        0x0a,0xe2,0xc1,0x29,0x87,0x6f,0x4c,0xa4,0x0b,0xe3,0xc0,0x28,0x86,0x6e,0x4d,0xa5,
-        0x0c,0xe4,0xc7,0x2f,0x81,0x69,0x4a,0xa2,0x0d,0xe5,0xc6,0x2e,0x80,0x68,0x4b,0xa3,
-        0x0e,0xe6,0xc5,0x2d,0x83,0x6b,0x48,0xa0,0x0f,0xe7,0xc4,0x2c,0x82,0x6a,0x49,0xa1,
-        0x10,0xf8,0xdb,0x33,0x9d,0x75,0x56,0xbe,0x11,0xf9,0xda,0x32,0x9c,0x74,0x57,0xbf,
-        0x12,0xfa,0xd9,0x31,0x9f,0x77,0x54,0xbc,0x13,0xfb,0xd8,0x30,0x9e,0x76,0x55,0xbd,
-        0x14,0xfc,0xdf,0x37,0x99,0x71,0x52,0xba,0x15,0xfd,0xde,0x36,0x98,0x70,0x53,0xbb,
-        0x16,0xfe,0xdd,0x35,0x9b,0x73,0x50,0xb8,0x17,0xff,0xdc,0x34,0x9a,0x72,0x51,0xb9,
-        0x18,0xf0,0xd3,0x3b,0x95,0x7d,0x5e,0xb6,0x19,0xf1,0xd2,0x3a,0x94,0x7c,0x5f,0xb7,
-        0x1a,0xf2,0xd1,0x39,0x97,0x7f,0x5c,0xb4,0x1b,0xf3,0xd0,0x38,0x96,0x7e,0x5d,0xb5,
-        0x1c,0xf4,0xd7,0x3f,0x91,0x79,0x5a,0xb2,0x1d,0xf5,0xd6,0x3e,0x90,0x78,0x5b,0xb3,
-        0x1e,0xf6,0xd5,0x3d,0x93,0x7b,0x58,0xb0,0x1f,0xf7,0xd4,0x3c,0x92,0x7a,0x59,0xb1,
-    ),
-    ( # 233
-        0x00,0xe9,0xc9,0x20,0x89,0x60,0x40,0xa9,0x09,0xe0,0xc0,0x29,0x80,0x69,0x49,0xa0,
-        0x12,0xfb,0xdb,0x32,0x9b,0x72,0x52,0xbb,0x1b,0xf2,0xd2,0x3b,0x92,0x7b,0x5b,0xb2,
-        0x24,0xcd,0xed,0x04,0xad,0x44,0x64,0x8d,0x2d,0xc4,0xe4,0x0d,0xa4,0x4d,0x6d,0x84,
-        0x36,0xdf,0xff,0x16,0xbf,0x56,0x76,0x9f,0x3f,0xd6,0xf6,0x1f,0xb6,0x5f,0x7f,0x96,
-        0x48,0xa1,0x81,0x68,0xc1,0x28,0x08,0xe1,0x41,0xa8,0x88,0x61,0xc8,0x21,0x01,0xe8,
-        0x5a,0xb3,0x93,0x7a,0xd3,0x3a,0x1a,0xf3,0x53,0xba,0x9a,0x73,0xda,0x33,0x13,0xfa,
-        0x6c,0x85,0xa5,0x4c,0xe5,0x0c,0x2c,0xc5,0x65,0x8c,0xac,0x45,0xec,0x05,0x25,0xcc,
-        0x7e,0x97,0xb7,0x5e,0xf7,0x1e,0x3e,0xd7,0x77,0x9e,0xbe,0x57,0xfe,0x17,0x37,0xde,
-        0x90,0x79,0x59,0xb0,0x19,0xf0,0xd0,0x39,0x99,0x70,0x50,0xb9,0x10,0xf9,0xd9,0x30,
-        0x82,0x6b,0x4b,0xa2,0x0b,0xe2,0xc2,0x2b,0x8b,0x62,0x42,0xab,0x02,0xeb,0xcb,0x22,
-        0xb4,0x5d,0x7d,0x94,0x3d,0xd4,0xf4,0x1d,0xbd,0x54,0x74,0x9d,0x34,0xdd,0xfd,0x14,
-        0xa6,0x4f,0x6f,0x86,0x2f,0xc6,0xe6,0x0f,0xaf,0x46,0x66,0x8f,0x26,0xcf,0xef,0x06,
-        0xd8,0x31,0x11,0xf8,0x51,0xb8,0x98,0x71,0xd1,0x38,0x18,0xf1,0x58,0xb1,0x91,0x78,
-        0xca,0x23,0x03,0xea,0x43,0xaa,0x8a,0x63,0xc3,0x2a,0x0a,0xe3,0x4a,0xa3,0x83,0x6a,
-        0xfc,0x15,0x35,0xdc,0x75,0x9c,0xbc,0x55,0xf5,0x1c,0x3c,0xd5,0x7c,0x95,0xb5,0x5c,
-        0xee,0x07,0x27,0xce,0x67,0x8e,0xae,0x47,0xe7,0x0e,0x2e,0xc7,0x6e,0x87,0xa7,0x4e,
-    ),
-    ( # 234
-        0x00,0xea,0xcf,0x25,0x85,0x6f,0x4a,0xa0,0x11,0xfb,0xde,0x34,0x94,0x7e,0x5b,0xb1,
-        0x22,0xc8,0xed,0x07,0xa7,0x4d,0x68,0x82,0x33,0xd9,0xfc,0x16,0xb6,0x5c,0x79,0x93,
-        0x44,0xae,0x8b,0x61,0xc1,0x2b,0x0e,0xe4,0x55,0xbf,0x9a,0x70,0xd0,0x3a,0x1f,0xf5,
-        0x66,0x8c,0xa9,0x43,0xe3,0x09,0x2c,0xc6,0x77,0x9d,0xb8,0x52,0xf2,0x18,0x3d,0xd7,
-        0x88,0x62,0x47,0xad,0x0d,0xe7,0xc2,0x28,0x99,0x73,0x56,0xbc,0x1c,0xf6,0xd3,0x39,
-        0xaa,0x40,0x65,0x8f,0x2f,0xc5,0xe0,0x0a,0xbb,0x51,0x74,0x9e,0x3e,0xd4,0xf1,0x1b,
-        0xcc,0x26,0x03,0xe9,0x49,0xa3,0x86,0x6c,0xdd,0x37,0x12,0xf8,0x58,0xb2,0x97,0x7d,
-        0xee,0x04,0x21,0xcb,0x6b,0x81,0xa4,0x4e,0xff,0x15,0x30,0xda,0x7a,0x90,0xb5,0x5f,
-        0x0b,0xe1,0xc4,0x2e,0x8e,0x64,0x41,0xab,0x1a,0xf0,0xd5,0x3f,0x9f,0x75,0x50,0xba,
-        0x29,0xc3,0xe6,0x0c,0xac,0x46,0x63,0x89,0x38,0xd2,0xf7,0x1d,0xbd,0x57,0x72,0x98,
-        0x4f,0xa5,0x80,0x6a,0xca,0x20,0x05,0xef,0x5e,0xb4,0x91,0x7b,0xdb,0x31,0x14,0xfe,
-        0x6d,0x87,0xa2,0x48,0xe8,0x02,0x27,0xcd,0x7c,0x96,0xb3,0x59,0xf9,0x13,0x36,0xdc,
-        0x83,0x69,0x4c,0xa6,0x06,0xec,0xc9,0x23,0x92,0x78,0x5d,0xb7,0x17,0xfd,0xd8,0x32,
-        0xa1,0x4b,0x6e,0x84,0x24,0xce,0xeb,0x01,0xb0,0x5a,0x7f,0x95,0x35,0xdf,0xfa,0x10,
-        0xc7,0x2d,0x08,0xe2,0x42,0xa8,0x8d,0x67,0xd6,0x3c,0x19,0xf3,0x53,0xb9,0x9c,0x76,
-        0xe5,0x0f,0x2a,0xc0,0x60,0x8a,0xaf,0x45,0xf4,0x1e,0x3b,0xd1,0x71,0x9b,0xbe,0x54,
-    ),
-    ( # 235
-        0x00,0xeb,0xcd,0x26,0x81,0x6a,0x4c,0xa7,0x19,0xf2,0xd4,0x3f,0x98,0x73,0x55,0xbe,
-        0x32,0xd9,0xff,0x14,0xb3,0x58,0x7e,0x95,0x2b,0xc0,0xe6,0x0d,0xaa,0x41,0x67,0x8c,
-        0x64,0x8f,0xa9,0x42,0xe5,0x0e,0x28,0xc3,0x7d,0x96,0xb0,0x5b,0xfc,0x17,0x31,0xda,
-        0x56,0xbd,0x9b,0x70,0xd7,0x3c,0x1a,0xf1,0x4f,0xa4,0x82,0x69,0xce,0x25,0x03,0xe8,
-        0xc8,0x23,0x05,0xee,0x49,0xa2,0x84,0x6f,0xd1,0x3a,0x1c,0xf7,0x50,0xbb,0x9d,0x76,
-        0xfa,0x11,0x37,0xdc,0x7b,0x90,0xb6,0x5d,0xe3,0x08,0x2e,0xc5,0x62,0x89,0xaf,0x44,
-        0xac,0x47,0x61,0x8a,0x2d,0xc6,0xe0,0x0b,0xb5,0x5e,0x78,0x93,0x34,0xdf,0xf9,0x12,
-        0x9e,0x75,0x53,0xb8,0x1f,0xf4,0xd2,0x39,0x87,0x6c,0x4a,0xa1,0x06,0xed,0xcb,0x20,
-        0x8b,0x60,0x46,0xad,0x0a,0xe1,0xc7,0x2c,0x92,0x79,0x5f,0xb4,0x13,0xf8,0xde,0x35,
-        0xb9,0x52,0x74,0x9f,0x38,0xd3,0xf5,0x1e,0xa0,0x4b,0x6d,0x86,0x21,0xca,0xec,0x07,
-        0xef,0x04,0x22,0xc9,0x6e,0x85,0xa3,0x48,0xf6,0x1d,0x3b,0xd0,0x77,0x9c,0xba,0x51,
-        0xdd,0x36,0x10,0xfb,0x5c,0xb7,0x91,0x7a,0xc4,0x2f,0x09,0xe2,0x45,0xae,0x88,0x63,
-        0x43,0xa8,0x8e,0x65,0xc2,0x29,0x0f,0xe4,0x5a,0xb1,0x97,0x7c,0xdb,0x30,0x16,0xfd,
-        0x71,0x9a,0xbc,0x57,0xf0,0x1b,0x3d,0xd6,0x68,0x83,0xa5,0x4e,0xe9,0x02,0x24,0xcf,
-        0x27,0xcc,0xea,0x01,0xa6,0x4d,0x6b,0x80,0x3e,0xd5,0xf3,0x18,0xbf,0x54,0x72,0x99,
-        0x15,0xfe,0xd8,0x33,0x94,0x7f,0x59,0xb2,0x0c,0xe7,0xc1,0x2a,0x8d,0x66,0x40,0xab,
-    ),
-    ( # 236
-        0x00,0xec,0xc3,0x2f,0x9d,0x71,0x5e,0xb2,0x21,0xcd,0xe2,0x0e,0xbc,0x50,0x7f,0x93,
-        0x42,0xae,0x81,0x6d,0xdf,0x33,0x1c,0xf0,0x63,0x8f,0xa0,0x4c,0xfe,0x12,0x3d,0xd1,
-        0x84,0x68,0x47,0xab,0x19,0xf5,0xda,0x36,0xa5,0x49,0x66,0x8a,0x38,0xd4,0xfb,0x17,
-        0xc6,0x2a,0x05,0xe9,0x5b,0xb7,0x98,0x74,0xe7,0x0b,0x24,0xc8,0x7a,0x96,0xb9,0x55,
-        0x13,0xff,0xd0,0x3c,0x8e,0x62,0x4d,0xa1,0x32,0xde,0xf1,0x1d,0xaf,0x43,0x6c,0x80,
-        0x51,0xbd,0x92,0x7e,0xcc,0x20,0x0f,0xe3,0x70,0x9c,0xb3,0x5f,0xed,0x01,0x2e,0xc2,
-        0x97,0x7b,0x54,0xb8,0x0a,0xe6,0xc9,0x25,0xb6,0x5a,0x75,0x99,0x2b,0xc7,0xe8,0x04,
-        0xd5,0x39,0x16,0xfa,0x48,0xa4,0x8b,0x67,0xf4,0x18,0x37,0xdb,0x69,0x85,0xaa,0x46,
-        0x26,0xca,0xe5,0x09,0xbb,0x57,0x78,0x94,0x07,0xeb,0xc4,0x28,0x9a,0x76,0x59,0xb5,
-        0x64,0x88,0xa7,0x4b,0xf9,0x15,0x3a,0xd6,0x45,0xa9,0x86,0x6a,0xd8,0x34,0x1b,0xf7,
-        0xa2,0x4e,0x61,0x8d,0x3f,0xd3,0xfc,0x10,0x83,0x6f,0x40,0xac,0x1e,0xf2,0xdd,0x31,
-        0xe0,0x0c,0x23,0xcf,0x7d,0x91,0xbe,0x52,0xc1,0x2d,0x02,0xee,0x5c,0xb0,0x9f,0x73,
-        0x35,0xd9,0xf6,0x1a,0xa8,0x44,0x6b,0x87,0x14,0xf8,0xd7,0x3b,0x89,0x65,0x4a,0xa6,
-        0x77,0x9b,0xb4,0x58,0xea,0x06,0x29,0xc5,0x56,0xba,0x95,0x79,0xcb,0x27,0x08,0xe4,
-        0xb1,0x5d,0x72,0x9e,0x2c,0xc0,0xef,0x03,0x90,0x7c,0x53,0xbf,0x0d,0xe1,0xce,0x22,
-        0xf3,0x1f,0x30,0xdc,0x6e,0x82,0xad,0x41,0xd2,0x3e,0x11,0xfd,0x4f,0xa3,0x8c,0x60,
-    ),
-    ( # 237
-        0x00,0xed,0xc1,0x2c,0x99,0x74,0x58,0xb5,0x29,0xc4,0xe8,0x05,0xb0,0x5d,0x71,0x9c,
-        0x52,0xbf,0x93,0x7e,0xcb,0x26,0x0a,0xe7,0x7b,0x96,0xba,0x57,0xe2,0x0f,0x23,0xce,
-        0xa4,0x49,0x65,0x88,0x3d,0xd0,0xfc,0x11,0x8d,0x60,0x4c,0xa1,0x14,0xf9,0xd5,0x38,
-        0xf6,0x1b,0x37,0xda,0x6f,0x82,0xae,0x43,0xdf,0x32,0x1e,0xf3,0x46,0xab,0x87,0x6a,
-        0x53,0xbe,0x92,0x7f,0xca,0x27,0x0b,0xe6,0x7a,0x97,0xbb,0x56,0xe3,0x0e,0x22,0xcf,
-        0x01,0xec,0xc0,0x2d,0x98,0x75,0x59,0xb4,0x28,0xc5,0xe9,0x04,0xb1,0x5c,0x70,0x9d,
-        0xf7,0x1a,0x36,0xdb,0x6e,0x83,0xaf,0x42,0xde,0x33,0x1f,0xf2,0x47,0xaa,0x86,0x6b,
-        0xa5,0x48,0x64,0x89,0x3c,0xd1,0xfd,0x10,0x8c,0x61,0x4d,0xa0,0x15,0xf8,0xd4,0x39,
-        0xa6,0x4b,0x67,0x8a,0x3f,0xd2,0xfe,0x13,0x8f,0x62,0x4e,0xa3,0x16,0xfb,0xd7,0x3a,
-        0xf4,0x19,0x35,0xd8,0x6d,0x80,0xac,0x41,0xdd,0x30,0x1c,0xf1,0x44,0xa9,0x85,0x68,
-        0x02,0xef,0xc3,0x2e,0x9b,0x76,0x5a,0xb7,0x2b,0xc6,0xea,0x07,0xb2,0x5f,0x73,0x9e,
-        0x50,0xbd,0x91,0x7c,0xc9,0x24,0x08,0xe5,0x79,0x94,0xb8,0x55,0xe0,0x0d,0x21,0xcc,
-        0xf5,0x18,0x34,0xd9,0x6c,0x81,0xad,0x40,0xdc,0x31,0x1d,0xf0,0x45,0xa8,0x84,0x69,
-        0xa7,0x4a,0x66,0x8b,0x3e,0xd3,0xff,0x12,0x8e,0x63,0x4f,0xa2,0x17,0xfa,0xd6,0x3b,
-        0x51,0xbc,0x90,0x7d,0xc8,0x25,0x09,0xe4,0x78,0x95,0xb9,0x54,0xe1,0x0c,0x20,0xcd,
-        0x03,0xee,0xc2,0x2f,0x9a,0x77,0x5b,0xb6,0x2a,0xc7,0xeb,0x06,0xb3,0x5e,0x72,0x9f,
-    ),
-    ( # 238
-        0x00,0xee,0xc7,0x29,0x95,0x7b,0x52,0xbc,0x31,0xdf,0xf6,0x18,0xa4,0x4a,0x63,0x8d,
-        0x62,0x8c,0xa5,0x4b,0xf7,0x19,0x30,0xde,0x53,0xbd,0x94,0x7a,0xc6,0x28,0x01,0xef,
-        0xc4,0x2a,0x03,0xed,0x51,0xbf,0x96,0x78,0xf5,0x1b,0x32,0xdc,0x60,0x8e,0xa7,0x49,
-        0xa6,0x48,0x61,0x8f,0x33,0xdd,0xf4,0x1a,0x97,0x79,0x50,0xbe,0x02,0xec,0xc5,0x2b,
-        0x93,0x7d,0x54,0xba,0x06,0xe8,0xc1,0x2f,0xa2,0x4c,0x65,0x8b,0x37,0xd9,0xf0,0x1e,
-        0xf1,0x1f,0x36,0xd8,0x64,0x8a,0xa3,0x4d,0xc0,0x2e,0x07,0xe9,0x55,0xbb,0x92,0x7c,
-        0x57,0xb9,0x90,0x7e,0xc2,0x2c,0x05,0xeb,0x66,0x88,0xa1,0x4f,0xf3,0x1d,0x34,0xda,
-        0x35,0xdb,0xf2,0x1c,0xa0,0x4e,0x67,0x89,0x04,0xea,0xc3,0x2d,0x91,0x7f,0x56,0xb8,
-        0x3d,0xd3,0xfa,0x14,0xa8,0x46,0x6f,0x81,0x0c,0xe2,0xcb,0x25,0x99,0x77,0x5e,0xb0,
-        0x5f,0xb1,0x98,0x76,0xca,0x24,0x0d,0xe3,0x6e,0x80,0xa9,0x47,0xfb,0x15,0x3c,0xd2,
-        0xf9,0x17,0x3e,0xd0,0x6c,0x82,0xab,0x45,0xc8,0x26,0x0f,0xe1,0x5d,0xb3,0x9a,0x74,
-        0x9b,0x75,0x5c,0xb2,0x0e,0xe0,0xc9,0x27,0xaa,0x44,0x6d,0x83,0x3f,0xd1,0xf8,0x16,
-        0xae,0x40,0x69,0x87,0x3b,0xd5,0xfc,0x12,0x9f,0x71,0x58,0xb6,0x0a,0xe4,0xcd,0x23,
-        0xcc,0x22,0x0b,0xe5,0x59,0xb7,0x9e,0x70,0xfd,0x13,0x3a,0xd4,0x68,0x86,0xaf,0x41,
-        0x6a,0x84,0xad,0x43,0xff,0x11,0x38,0xd6,0x5b,0xb5,0x9c,0x72,0xce,0x20,0x09,0xe7,
-        0x08,0xe6,0xcf,0x21,0x9d,0x73,0x5a,0xb4,0x39,0xd7,0xfe,0x10,0xac,0x42,0x6b,0x85,
-    ),
-    ( # 239
-        0x00,0xef,0xc5,0x2a,0x91,0x7e,0x54,0xbb,0x39,0xd6,0xfc,0x13,0xa8,0x47,0x6d,0x82,
-        0x72,0x9d,0xb7,0x58,0xe3,0x0c,0x26,0xc9,0x4b,0xa4,0x8e,0x61,0xda,0x35,0x1f,0xf0,
-        0xe4,0x0b,0x21,0xce,0x75,0x9a,0xb0,0x5f,0xdd,0x32,0x18,0xf7,0x4c,0xa3,0x89,0x66,
-        0x96,0x79,0x53,0xbc,0x07,0xe8,0xc2,0x2d,0xaf,0x40,0x6a,0x85,0x3e,0xd1,0xfb,0x14,
-        0xd3,0x3c,0x16,0xf9,0x42,0xad,0x87,0x68,0xea,0x05,0x2f,0xc0,0x7b,0x94,0xbe,0x51,
-        0xa1,0x4e,0x64,0x8b,0x30,0xdf,0xf5,0x1a,0x98,0x77,0x5d,0xb2,0x09,0xe6,0xcc,0x23,
-        0x37,0xd8,0xf2,0x1d,0xa6,0x49,0x63,0x8c,0x0e,0xe1,0xcb,0x24,0x9f,0x70,0x5a,0xb5,
-        0x45,0xaa,0x80,0x6f,0xd4,0x3b,0x11,0xfe,0x7c,0x93,0xb9,0x56,0xed,0x02,0x28,0xc7,
-        0xbd,0x52,0x78,0x97,0x2c,0xc3,0xe9,0x06,0x84,0x6b,0x41,0xae,0x15,0xfa,0xd0,0x3f,
-        0xcf,0x20,0x0a,0xe5,0x5e,0xb1,0x9b,0x74,0xf6,0x19,0x33,0xdc,0x67,0x88,0xa2,0x4d,
-        0x59,0xb6,0x9c,0x73,0xc8,0x27,0x0d,0xe2,0x60,0x8f,0xa5,0x4a,0xf1,0x1e,0x34,0xdb,
-        0x2b,0xc4,0xee,0x01,0xba,0x55,0x7f,0x90,0x12,0xfd,0xd7,0x38,0x83,0x6c,0x46,0xa9,
-        0x6e,0x81,0xab,0x44,0xff,0x10,0x3a,0xd5,0x57,0xb8,0x92,0x7d,0xc6,0x29,0x03,0xec,
-        0x1c,0xf3,0xd9,0x36,0x8d,0x62,0x48,0xa7,0x25,0xca,0xe0,0x0f,0xb4,0x5b,0x71,0x9e,
-        0x8a,0x65,0x4f,0xa0,0x1b,0xf4,0xde,0x31,0xb3,0x5c,0x76,0x99,0x22,0xcd,0xe7,0x08,
-        0xf8,0x17,0x3d,0xd2,0x69,0x86,0xac,0x43,0xc1,0x2e,0x04,0xeb,0x50,0xbf,0x95,0x7a,
-    ),
-    ( # 240
-        0x00,0xf0,0xfb,0x0b,0xed,0x1d,0x16,0xe6,0xc1,0x31,0x3a,0xca,0x2c,0xdc,0xd7,0x27,
-        0x99,0x69,0x62,0x92,0x74,0x84,0x8f,0x7f,0x58,0xa8,0xa3,0x53,0xb5,0x45,0x4e,0xbe,
-        0x29,0xd9,0xd2,0x22,0xc4,0x34,0x3f,0xcf,0xe8,0x18,0x13,0xe3,0x05,0xf5,0xfe,0x0e,
-        0xb0,0x40,0x4b,0xbb,0x5d,0xad,0xa6,0x56,0x71,0x81,0x8a,0x7a,0x9c,0x6c,0x67,0x97,
-        0x52,0xa2,0xa9,0x59,0xbf,0x4f,0x44,0xb4,0x93,0x63,0x68,0x98,0x7e,0x8e,0x85,0x75,
-        0xcb,0x3b,0x30,0xc0,0x26,0xd6,0xdd,0x2d,0x0a,0xfa,0xf1,0x01,0xe7,0x17,0x1c,0xec,
-        0x7b,0x8b,0x80,0x70,0x96,0x66,0x6d,0x9d,0xba,0x4a,0x41,0xb1,0x57,0xa7,0xac,0x5c,
-        0xe2,0x12,0x19,0xe9,0x0f,0xff,0xf4,0x04,0x23,0xd3,0xd8,0x28,0xce,0x3e,0x35,0xc5,
-        0xa4,0x54,0x5f,0xaf,0x49,0xb9,0xb2,0x42,0x65,0x95,0x9e,0x6e,0x88,0x78,0x73,0x83,
-        0x3d,0xcd,0xc6,0x36,0xd0,0x20,0x2b,0xdb,0xfc,0x0c,0x07,0xf7,0x11,0xe1,0xea,0x1a,
-        0x8d,0x7d,0x76,0x86,0x60,0x90,0x9b,0x6b,0x4c,0xbc,0xb7,0x47,0xa1,0x51,0x5a,0xaa,
-        0x14,0xe4,0xef,0x1f,0xf9,0x09,0x02,0xf2,0xd5,0x25,0x2e,0xde,0x38,0xc8,0xc3,0x33,
-        0xf6,0x06,0x0d,0xfd,0x1b,0xeb,0xe0,0x10,0x37,0xc7,0xcc,0x3c,0xda,0x2a,0x21,0xd1,
-        0x6f,0x9f,0x94,0x64,0x82,0x72,0x79,0x89,0xae,0x5e,0x55,0xa5,0x43,0xb3,0xb8,0x48,
-        0xdf,0x2f,0x24,0xd4,0x32,0xc2,0xc9,0x39,0x1e,0xee,0xe5,0x15,0xf3,0x03,0x08,0xf8,
-        0x46,0xb6,0xbd,0x4d,0xab,0x5b,0x50,0xa0,0x87,0x77,0x7c,0x8c,0x6a,0x9a,0x91,0x61,
-    ),
-    ( # 241
-        0x00,0xf1,0xf9,0x08,0xe9,0x18,0x10,0xe1,0xc9,0x38,0x30,0xc1,0x20,0xd1,0xd9,0x28,
-        0x89,0x78,0x70,0x81,0x60,0x91,0x99,0x68,0x40,0xb1,0xb9,0x48,0xa9,0x58,0x50,0xa1,
-        0x09,0xf8,0xf0,0x01,0xe0,0x11,0x19,0xe8,0xc0,0x31,0x39,0xc8,0x29,0xd8,0xd0,0x21,
-        0x80,0x71,0x79,0x88,0x69,0x98,0x90,0x61,0x49,0xb8,0xb0,0x41,0xa0,0x51,0x59,0xa8,
-        0x12,0xe3,0xeb,0x1a,0xfb,0x0a,0x02,0xf3,0xdb,0x2a,0x22,0xd3,0x32,0xc3,0xcb,0x3a,
-        0x9b,0x6a,0x62,0x93,0x72,0x83,0x8b,0x7a,0x52,0xa3,0xab,0x5a,0xbb,0x4a,0x42,0xb3,
-        0x1b,0xea,0xe2,0x13,0xf2,0x03,0x0b,0xfa,0xd2,0x23,0x2b,0xda,0x3b,0xca,0xc2,0x33,
-        0x92,0x63,0x6b,0x9a,0x7b,0x8a,0x82,0x73,0x5b,0xaa,0xa2,0x53,0xb2,0x43,0x4b,0xba,
-        0x24,0xd5,0xdd,0x2c,0xcd,0x3c,0x34,0xc5,0xed,0x1c,0x14,0xe5,0x04,0xf5,0xfd,0x0c,
-        0xad,0x5c,0x54,0xa5,0x44,0xb5,0xbd,0x4c,0x64,0x95,0x9d,0x6c,0x8d,0x7c,0x74,0x85,
-        0x2d,0xdc,0xd4,0x25,0xc4,0x35,0x3d,0xcc,0xe4,0x15,0x1d,0xec,0x0d,0xfc,0xf4,0x05,
-        0xa4,0x55,0x5d,0xac,0x4d,0xbc,0xb4,0x45,0x6d,0x9c,0x94,0x65,0x84,0x75,0x7d,0x8c,
-        0x36,0xc7,0xcf,0x3e,0xdf,0x2e,0x26,0xd7,0xff,0x0e,0x06,0xf7,0x16,0xe7,0xef,0x1e,
-        0xbf,0x4e,0x46,0xb7,0x56,0xa7,0xaf,0x5e,0x76,0x87,0x8f,0x7e,0x9f,0x6e,0x66,0x97,
-        0x3f,0xce,0xc6,0x37,0xd6,0x27,0x2f,0xde,0xf6,0x07,0x0f,0xfe,0x1f,0xee,0xe6,0x17,
-        0xb6,0x47,0x4f,0xbe,0x5f,0xae,0xa6,0x57,0x7f,0x8e,0x86,0x77,0x96,0x67,0x6f,0x9e,
-    ),
-    ( # 242
-        0x00,0xf2,0xff,0x0d,0xe5,0x17,0x1a,0xe8,0xd1,0x23,0x2e,0xdc,0x34,0xc6,0xcb,0x39,
-        0xb9,0x4b,0x46,0xb4,0x5c,0xae,0xa3,0x51,0x68,0x9a,0x97,0x65,0x8d,0x7f,0x72,0x80,
-        0x69,0x9b,0x96,0x64,0x8c,0x7e,0x73,0x81,0xb8,0x4a,0x47,0xb5,0x5d,0xaf,0xa2,0x50,
-        0xd0,0x22,0x2f,0xdd,0x35,0xc7,0xca,0x38,0x01,0xf3,0xfe,0x0c,0xe4,0x16,0x1b,0xe9,
-        0xd2,0x20,0x2d,0xdf,0x37,0xc5,0xc8,0x3a,0x03,0xf1,0xfc,0x0e,0xe6,0x14,0x19,0xeb,
-        0x6b,0x99,0x94,0x66,0x8e,0x7c,0x71,0x83,0xba,0x48,0x45,0xb7,0x5f,0xad,0xa0,0x52,
-        0xbb,0x49,0x44,0xb6,0x5e,0xac,0xa1,0x53,0x6a,0x98,0x95,0x67,0x8f,0x7d,0x70,0x82,
-        0x02,0xf0,0xfd,0x0f,0xe7,0x15,0x18,0xea,0xd3,0x21,0x2c,0xde,0x36,0xc4,0xc9,0x3b,
-        0xbf,0x4d,0x40,0xb2,0x5a,0xa8,0xa5,0x57,0x6e,0x9c,0x91,0x63,0x8b,0x79,0x74,0x86,
-        0x06,0xf4,0xf9,0x0b,0xe3,0x11,0x1c,0xee,0xd7,0x25,0x28,0xda,0x32,0xc0,0xcd,0x3f,
-        0xd6,0x24,0x29,0xdb,0x33,0xc1,0xcc,0x3e,0x07,0xf5,0xf8,0x0a,0xe2,0x10,0x1d,0xef,
-        0x6f,0x9d,0x90,0x62,0x8a,0x78,0x75,0x87,0xbe,0x4c,0x41,0xb3,0x5b,0xa9,0xa4,0x56,
-        0x6d,0x9f,0x92,0x60,0x88,0x7a,0x77,0x85,0xbc,0x4e,0x43,0xb1,0x59,0xab,0xa6,0x54,
-        0xd4,0x26,0x2b,0xd9,0x31,0xc3,0xce,0x3c,0x05,0xf7,0xfa,0x08,0xe0,0x12,0x1f,0xed,
-        0x04,0xf6,0xfb,0x09,0xe1,0x13,0x1e,0xec,0xd5,0x27,0x2a,0xd8,0x30,0xc2,0xcf,0x3d,
-        0xbd,0x4f,0x42,0xb0,0x58,0xaa,0xa7,0x55,0x6c,0x9e,0x93,0x61,0x89,0x7b,0x76,0x84,
-    ),
-    ( # 243
-        0x00,0xf3,0xfd,0x0e,0xe1,0x12,0x1c,0xef,0xd9,0x2a,0x24,0xd7,0x38,0xcb,0xc5,0x36,
-        0xa9,0x5a,0x54,0xa7,0x48,0xbb,0xb5,0x46,0x70,0x83,0x8d,0x7e,0x91,0x62,0x6c,0x9f,
-        0x49,0xba,0xb4,0x47,0xa8,0x5b,0x55,0xa6,0x90,0x63,0x6d,0x9e,0x71,0x82,0x8c,0x7f,
-        0xe0,0x13,0x1d,0xee,0x01,0xf2,0xfc,0x0f,0x39,0xca,0xc4,0x37,0xd8,0x2b,0x25,0xd6,
-        0x92,0x61,0x6f,0x9c,0x73,0x80,0x8e,0x7d,0x4b,0xb8,0xb6,0x45,0xaa,0x59,0x57,0xa4,
-        0x3b,0xc8,0xc6,0x35,0xda,0x29,0x27,0xd4,0xe2,0x11,0x1f,0xec,0x03,0xf0,0xfe,0x0d,
-        0xdb,0x28,0x26,0xd5,0x3a,0xc9,0xc7,0x34,0x02,0xf1,0xff,0x0c,0xe3,0x10,0x1e,0xed,
-        0x72,0x81,0x8f,0x7c,0x93,0x60,0x6e,0x9d,0xab,0x58,0x56,0xa5,0x4a,0xb9,0xb7,0x44,
-        0x3f,0xcc,0xc2,0x31,0xde,0x2d,0x23,0xd0,0xe6,0x15,0x1b,0xe8,0x07,0xf4,0xfa,0x09,
-        0x96,0x65,0x6b,0x98,0x77,0x84,0x8a,0x79,0x4f,0xbc,0xb2,0x41,0xae,0x5d,0x53,0xa0,
-        0x76,0x85,0x8b,0x78,0x97,0x64,0x6a,0x99,0xaf,0x5c,0x52,0xa1,0x4e,0xbd,0xb3,0x40,
-        0xdf,0x2c,0x22,0xd1,0x3e,0xcd,0xc3,0x30,0x06,0xf5,0xfb,0x08,0xe7,0x14,0x1a,0xe9,
-        0xad,0x5e,0x50,0xa3,0x4c,0xbf,0xb1,0x42,0x74,0x87,0x89,0x7a,0x95,0x66,0x68,0x9b,
-        0x04,0xf7,0xf9,0x0a,0xe5,0x16,0x18,0xeb,0xdd,0x2e,0x20,0xd3,0x3c,0xcf,0xc1,0x32,
-        0xe4,0x17,0x19,0xea,0x05,0xf6,0xf8,0x0b,0x3d,0xce,0xc0,0x33,0xdc,0x2f,0x21,0xd2,
-        0x4d,0xbe,0xb0,0x43,0xac,0x5f,0x51,0xa2,0x94,0x67,0x69,0x9a,0x75,0x86,0x88,0x7b,
-    ),
-    ( # 244
-        0x00,0xf4,0xf3,0x07,0xfd,0x09,0x0e,0xfa,0xe1,0x15,0x12,0xe6,0x1c,0xe8,0xef,0x1b,
-        0xd9,0x2d,0x2a,0xde,0x24,0xd0,0xd7,0x23,0x38,0xcc,0xcb,0x3f,0xc5,0x31,0x36,0xc2,
-        0xa9,0x5d,0x5a,0xae,0x54,0xa0,0xa7,0x53,0x48,0xbc,0xbb,0x4f,0xb5,0x41,0x46,0xb2,
-        0x70,0x84,0x83,0x77,0x8d,0x79,0x7e,0x8a,0x91,0x65,0x62,0x96,0x6c,0x98,0x9f,0x6b,
-        0x49,0xbd,0xba,0x4e,0xb4,0x40,0x47,0xb3,0xa8,0x5c,0x5b,0xaf,0x55,0xa1,0xa6,0x52,
-        0x90,0x64,0x63,0x97,0x6d,0x99,0x9e,0x6a,0x71,0x85,0x82,0x76,0x8c,0x78,0x7f,0x8b,
-        0xe0,0x14,0x13,0xe7,0x1d,0xe9,0xee,0x1a,0x01,0xf5,0xf2,0x06,0xfc,0x08,0x0f,0xfb,
-        0x39,0xcd,0xca,0x3e,0xc4,0x30,0x37,0xc3,0xd8,0x2c,0x2b,0xdf,0x25,0xd1,0xd6,0x22,
-        0x92,0x66,0x61,0x95,0x6f,0x9b,0x9c,0x68,0x73,0x87,0x80,0x74,0x8e,0x7a,0x7d,0x89,
-        0x4b,0xbf,0xb8,0x4c,0xb6,0x42,0x45,0xb1,0xaa,0x5e,0x59,0xad,0x57,0xa3,0xa4,0x50,
-        0x3b,0xcf,0xc8,0x3c,0xc6,0x32,0x35,0xc1,0xda,0x2e,0x29,0xdd,0x27,0xd3,0xd4,0x20,
-        0xe2,0x16,0x11,0xe5,0x1f,0xeb,0xec,0x18,0x03,0xf7,0xf0,0x04,0xfe,0x0a,0x0d,0xf9,
-        0xdb,0x2f,0x28,0xdc,0x26,0xd2,0xd5,0x21,0x3a,0xce,0xc9,0x3d,0xc7,0x33,0x34,0xc0,
-        0x02,0xf6,0xf1,0x05,0xff,0x0b,0x0c,0xf8,0xe3,0x17,0x10,0xe4,0x1e,0xea,0xed,0x19,
-        0x72,0x86,0x81,0x75,0x8f,0x7b,0x7c,0x88,0x93,0x67,0x60,0x94,0x6e,0x9a,0x9d,0x69,
-        0xab,0x5f,0x58,0xac,0x56,0xa2,0xa5,0x51,0x4a,0xbe,0xb9,0x4d,0xb7,0x43,0x44,0xb0,
-    ),
-    ( # 245
-        0x00,0xf5,0xf1,0x04,0xf9,0x0c,0x08,0xfd,0xe9,0x1c,0x18,0xed,0x10,0xe5,0xe1,0x14,
-        0xc9,0x3c,0x38,0xcd,0x30,0xc5,0xc1,0x34,0x20,0xd5,0xd1,0x24,0xd9,0x2c,0x28,0xdd,
-        0x89,0x7c,0x78,0x8d,0x70,0x85,0x81,0x74,0x60,0x95,0x91,0x64,0x99,0x6c,0x68,0x9d,
-        0x40,0xb5,0xb1,0x44,0xb9,0x4c,0x48,0xbd,0xa9,0x5c,0x58,0xad,0x50,0xa5,0xa1,0x54,
-        0x09,0xfc,0xf8,0x0d,0xf0,0x05,0x01,0xf4,0xe0,0x15,0x11,0xe4,0x19,0xec,0xe8,0x1d,
-        0xc0,0x35,0x31,0xc4,0x39,0xcc,0xc8,0x3d,0x29,0xdc,0xd8,0x2d,0xd0,0x25,0x21,0xd4,
-        0x80,0x75,0x71,0x84,0x79,0x8c,0x88,0x7d,0x69,0x9c,0x98,0x6d,0x90,0x65,0x61,0x94,
-        0x49,0xbc,0xb8,0x4d,0xb0,0x45,0x41,0xb4,0xa0,0x55,0x51,0xa4,0x59,0xac,0xa8,0x5d,
-        0x12,0xe7,0xe3,0x16,0xeb,0x1e,0x1a,0xef,0xfb,0x0e,0x0a,0xff,0x02,0xf7,0xf3,0x06,
-        0xdb,0x2e,0x2a,0xdf,0x22,0xd7,0xd3,0x26,0x32,0xc7,0xc3,0x36,0xcb,0x3e,0x3a,0xcf,
-        0x9b,0x6e,0x6a,0x9f,0x62,0x97,0x93,0x66,0x72,0x87,0x83,0x76,0x8b,0x7e,0x7a,0x8f,
-        0x52,0xa7,0xa3,0x56,0xab,0x5e,0x5a,0xaf,0xbb,0x4e,0x4a,0xbf,0x42,0xb7,0xb3,0x46,
-        0x1b,0xee,0xea,0x1f,0xe2,0x17,0x13,0xe6,0xf2,0x07,0x03,0xf6,0x0b,0xfe,0xfa,0x0f,
-        0xd2,0x27,0x23,0xd6,0x2b,0xde,0xda,0x2f,0x3b,0xce,0xca,0x3f,0xc2,0x37,0x33,0xc6,
-        0x92,0x67,0x63,0x96,0x6b,0x9e,0x9a,0x6f,0x7b,0x8e,0x8a,0x7f,0x82,0x77,0x73,0x86,
-        0x5b,0xae,0xaa,0x5f,0xa2,0x57,0x53,0xa6,0xb2,0x47,0x43,0xb6,0x4b,0xbe,0xba,0x4f,
-    ),
-    ( # 246
-        0x00,0xf6,0xf7,0x01,0xf5,0x03,0x02,0xf4,0xf1,0x07,0x06,0xf0,0x04,0xf2,0xf3,0x05,
-        0xf9,0x0f,0x0e,0xf8,0x0c,0xfa,0xfb,0x0d,0x08,0xfe,0xff,0x09,0xfd,0x0b,0x0a,0xfc,
-        0xe9,0x1f,0x1e,0xe8,0x1c,0xea,0xeb,0x1d,0x18,0xee,0xef,0x19,0xed,0x1b,0x1a,0xec,
-        0x10,0xe6,0xe7,0x11,0xe5,0x13,0x12,0xe4,0xe1,0x17,0x16,0xe0,0x14,0xe2,0xe3,0x15,
-        0xc9,0x3f,0x3e,0xc8,0x3c,0xca,0xcb,0x3d,0x38,0xce,0xcf,0x39,0xcd,0x3b,0x3a,0xcc,
-        0x30,0xc6,0xc7,0x31,0xc5,0x33,0x32,0xc4,0xc1,0x37,0x36,0xc0,0x34,0xc2,0xc3,0x35,
-        0x20,0xd6,0xd7,0x21,0xd5,0x23,0x22,0xd4,0xd1,0x27,0x26,0xd0,0x24,0xd2,0xd3,0x25,
-        0xd9,0x2f,0x2e,0xd8,0x2c,0xda,0xdb,0x2d,0x28,0xde,0xdf,0x29,0xdd,0x2b,0x2a,0xdc,
-        0x89,0x7f,0x7e,0x88,0x7c,0x8a,0x8b,0x7d,0x78,0x8e,0x8f,0x79,0x8d,0x7b,0x7a,0x8c,
-        0x70,0x86,0x87,0x71,0x85,0x73,0x72,0x84,0x81,0x77,0x76,0x80,0x74,0x82,0x83,0x75,
-        0x60,0x96,0x97,0x61,0x95,0x63,0x62,0x94,0x91,0x67,0x66,0x90,0x64,0x92,0x93,0x65,
-        0x99,0x6f,0x6e,0x98,0x6c,0x9a,0x9b,0x6d,0x68,0x9e,0x9f,0x69,0x9d,0x6b,0x6a,0x9c,
-        0x40,0xb6,0xb7,0x41,0xb5,0x43,0x42,0xb4,0xb1,0x47,0x46,0xb0,0x44,0xb2,0xb3,0x45,
-        0xb9,0x4f,0x4e,0xb8,0x4c,0xba,0xbb,0x4d,0x48,0xbe,0xbf,0x49,0xbd,0x4b,0x4a,0xbc,
-        0xa9,0x5f,0x5e,0xa8,0x5c,0xaa,0xab,0x5d,0x58,0xae,0xaf,0x59,0xad,0x5b,0x5a,0xac,
-        0x50,0xa6,0xa7,0x51,0xa5,0x53,0x52,0xa4,0xa1,0x57,0x56,0xa0,0x54,0xa2,0xa3,0x55,
-    ),
-    ( # 247
-        0x00,0xf7,0xf5,0x02,0xf1,0x06,0x04,0xf3,0xf9,0x0e,0x0c,0xfb,0x08,0xff,0xfd,0x0a,
-        0xe9,0x1e,0x1c,0xeb,0x18,0xef,0xed,0x1a,0x10,0xe7,0xe5,0x12,0xe1,0x16,0x14,0xe3,
-        0xc9,0x3e,0x3c,0xcb,0x38,0xcf,0xcd,0x3a,0x30,0xc7,0xc5,0x32,0xc1,0x36,0x34,0xc3,
-        0x20,0xd7,0xd5,0x22,0xd1,0x26,0x24,0xd3,0xd9,0x2e,0x2c,0xdb,0x28,0xdf,0xdd,0x2a,
-        0x89,0x7e,0x7c,0x8b,0x78,0x8f,0x8d,0x7a,0x70,0x87,0x85,0x72,0x81,0x76,0x74,0x83,
-        0x60,0x97,0x95,0x62,0x91,0x66,0x64,0x93,0x99,0x6e,0x6c,0x9b,0x68,0x9f,0x9d,0x6a,
-        0x40,0xb7,0xb5,0x42,0xb1,0x46,0x44,0xb3,0xb9,0x4e,0x4c,0xbb,0x48,0xbf,0xbd,0x4a,
-        0xa9,0x5e,0x5c,0xab,0x58,0xaf,0xad,0x5a,0x50,0xa7,0xa5,0x52,0xa1,0x56,0x54,0xa3,
-        0x09,0xfe,0xfc,0x0b,0xf8,0x0f,0x0d,0xfa,0xf0,0x07,0x05,0xf2,0x01,0xf6,0xf4,0x03,
-        0xe0,0x17,0x15,0xe2,0x11,0xe6,0xe4,0x13,0x19,0xee,0xec,0x1b,0xe8,0x1f,0x1d,0xea,
-        0xc0,0x37,0x35,0xc2,0x31,0xc6,0xc4,0x33,0x39,0xce,0xcc,0x3b,0xc8,0x3f,0x3d,0xca,
-        0x29,0xde,0xdc,0x2b,0xd8,0x2f,0x2d,0xda,0xd0,0x27,0x25,0xd2,0x21,0xd6,0xd4,0x23,
-        0x80,0x77,0x75,0x82,0x71,0x86,0x84,0x73,0x79,0x8e,0x8c,0x7b,0x88,0x7f,0x7d,0x8a,
-        0x69,0x9e,0x9c,0x6b,0x98,0x6f,0x6d,0x9a,0x90,0x67,0x65,0x92,0x61,0x96,0x94,0x63,
-        0x49,0xbe,0xbc,0x4b,0xb8,0x4f,0x4d,0xba,0xb0,0x47,0x45,0xb2,0x41,0xb6,0xb4,0x43,
-        0xa0,0x57,0x55,0xa2,0x51,0xa6,0xa4,0x53,0x59,0xae,0xac,0x5b,0xa8,0x5f,0x5d,0xaa,
-    ),
-    ( # 248
-        0x00,0xf8,0xeb,0x13,0xcd,0x35,0x26,0xde,0x81,0x79,0x6a,0x92,0x4c,0xb4,0xa7,0x5f,
-        0x19,0xe1,0xf2,0x0a,0xd4,0x2c,0x3f,0xc7,0x98,0x60,0x73,0x8b,0x55,0xad,0xbe,0x46,
-        0x32,0xca,0xd9,0x21,0xff,0x07,0x14,0xec,0xb3,0x4b,0x58,0xa0,0x7e,0x86,0x95,0x6d,
-        0x2b,0xd3,0xc0,0x38,0xe6,0x1e,0x0d,0xf5,0xaa,0x52,0x41,0xb9,0x67,0x9f,0x8c,0x74,
-        0x64,0x9c,0x8f,0x77,0xa9,0x51,0x42,0xba,0xe5,0x1d,0x0e,0xf6,0x28,0xd0,0xc3,0x3b,
-        0x7d,0x85,0x96,0x6e,0xb0,0x48,0x5b,0xa3,0xfc,0x04,0x17,0xef,0x31,0xc9,0xda,0x22,
-        0x56,0xae,0xbd,0x45,0x9b,0x63,0x70,0x88,0xd7,0x2f,0x3c,0xc4,0x1a,0xe2,0xf1,0x09,
-        0x4f,0xb7,0xa4,0x5c,0x82,0x7a,0x69,0x91,0xce,0x36,0x25,0xdd,0x03,0xfb,0xe8,0x10,
-        0xc8,0x30,0x23,0xdb,0x05,0xfd,0xee,0x16,0x49,0xb1,0xa2,0x5a,0x84,0x7c,0x6f,0x97,
-        0xd1,0x29,0x3a,0xc2,0x1c,0xe4,0xf7,0x0f,0x50,0xa8,0xbb,0x43,0x9d,0x65,0x76,0x8e,
-        0xfa,0x02,0x11,0xe9,0x37,0xcf,0xdc,0x24,0x7b,0x83,0x90,0x68,0xb6,0x4e,0x5d,0xa5,
-        0xe3,0x1b,0x08,0xf0,0x2e,0xd6,0xc5,0x3d,0x62,0x9a,0x89,0x71,0xaf,0x57,0x44,0xbc,
-        0xac,0x54,0x47,0xbf,0x61,0x99,0x8a,0x72,0x2d,0xd5,0xc6,0x3e,0xe0,0x18,0x0b,0xf3,
-        0xb5,0x4d,0x5e,0xa6,0x78,0x80,0x93,0x6b,0x34,0xcc,0xdf,0x27,0xf9,0x01,0x12,0xea,
-        0x9e,0x66,0x75,0x8d,0x53,0xab,0xb8,0x40,0x1f,0xe7,0xf4,0x0c,0xd2,0x2a,0x39,0xc1,
-        0x87,0x7f,0x6c,0x94,0x4a,0xb2,0xa1,0x59,0x06,0xfe,0xed,0x15,0xcb,0x33,0x20,0xd8,
-    ),
-    ( # 249
-        0x00,0xf9,0xe9,0x10,0xc9,0x30,0x20,0xd9,0x89,0x70,0x60,0x99,0x40,0xb9,0xa9,0x50,
-        0x09,0xf0,0xe0,0x19,0xc0,0x39,0x29,0xd0,0x80,0x79,0x69,0x90,0x49,0xb0,0xa0,0x59,
-        0x12,0xeb,0xfb,0x02,0xdb,0x22,0x32,0xcb,0x9b,0x62,0x72,0x8b,0x52,0xab,0xbb,0x42,
-        0x1b,0xe2,0xf2,0x0b,0xd2,0x2b,0x3b,0xc2,0x92,0x6b,0x7b,0x82,0x5b,0xa2,0xb2,0x4b,
-        0x24,0xdd,0xcd,0x34,0xed,0x14,0x04,0xfd,0xad,0x54,0x44,0xbd,0x64,0x9d,0x8d,0x74,
-        0x2d,0xd4,0xc4,0x3d,0xe4,0x1d,0x0d,0xf4,0xa4,0x5d,0x4d,0xb4,0x6d,0x94,0x84,0x7d,
-        0x36,0xcf,0xdf,0x26,0xff,0x06,0x16,0xef,0xbf,0x46,0x56,0xaf,0x76,0x8f,0x9f,0x66,
-        0x3f,0xc6,0xd6,0x2f,0xf6,0x0f,0x1f,0xe6,0xb6,0x4f,0x5f,0xa6,0x7f,0x86,0x96,0x6f,
-        0x48,0xb1,0xa1,0x58,0x81,0x78,0x68,0x91,0xc1,0x38,0x28,0xd1,0x08,0xf1,0xe1,0x18,
-        0x41,0xb8,0xa8,0x51,0x88,0x71,0x61,0x98,0xc8,0x31,0x21,0xd8,0x01,0xf8,0xe8,0x11,
-        0x5a,0xa3,0xb3,0x4a,0x93,0x6a,0x7a,0x83,0xd3,0x2a,0x3a,0xc3,0x1a,0xe3,0xf3,0x0a,
-        0x53,0xaa,0xba,0x43,0x9a,0x63,0x73,0x8a,0xda,0x23,0x33,0xca,0x13,0xea,0xfa,0x03,
-        0x6c,0x95,0x85,0x7c,0xa5,0x5c,0x4c,0xb5,0xe5,0x1c,0x0c,0xf5,0x2c,0xd5,0xc5,0x3c,
-        0x65,0x9c,0x8c,0x75,0xac,0x55,0x45,0xbc,0xec,0x15,0x05,0xfc,0x25,0xdc,0xcc,0x35,
-        0x7e,0x87,0x97,0x6e,0xb7,0x4e,0x5e,0xa7,0xf7,0x0e,0x1e,0xe7,0x3e,0xc7,0xd7,0x2e,
-        0x77,0x8e,0x9e,0x67,0xbe,0x47,0x57,0xae,0xfe,0x07,0x17,0xee,0x37,0xce,0xde,0x27,
-    ),
-    ( # 250
-        0x00,0xfa,0xef,0x15,0xc5,0x3f,0x2a,0xd0,0x91,0x6b,0x7e,0x84,0x54,0xae,0xbb,0x41,
-        0x39,0xc3,0xd6,0x2c,0xfc,0x06,0x13,0xe9,0xa8,0x52,0x47,0xbd,0x6d,0x97,0x82,0x78,
-        0x72,0x88,0x9d,0x67,0xb7,0x4d,0x58,0xa2,0xe3,0x19,0x0c,0xf6,0x26,0xdc,0xc9,0x33,
-        0x4b,0xb1,0xa4,0x5e,0x8e,0x74,0x61,0x9b,0xda,0x20,0x35,0xcf,0x1f,0xe5,0xf0,0x0a,
-        0xe4,0x1e,0x0b,0xf1,0x21,0xdb,0xce,0x34,0x75,0x8f,0x9a,0x60,0xb0,0x4a,0x5f,0xa5,
-        0xdd,0x27,0x32,0xc8,0x18,0xe2,0xf7,0x0d,0x4c,0xb6,0xa3,0x59,0x89,0x73,0x66,0x9c,
-        0x96,0x6c,0x79,0x83,0x53,0xa9,0xbc,0x46,0x07,0xfd,0xe8,0x12,0xc2,0x38,0x2d,0xd7,
-        0xaf,0x55,0x40,0xba,0x6a,0x90,0x85,0x7f,0x3e,0xc4,0xd1,0x2b,0xfb,0x01,0x14,0xee,
-        0xd3,0x29,0x3c,0xc6,0x16,0xec,0xf9,0x03,0x42,0xb8,0xad,0x57,0x87,0x7d,0x68,0x92,
-        0xea,0x10,0x05,0xff,0x2f,0xd5,0xc0,0x3a,0x7b,0x81,0x94,0x6e,0xbe,0x44,0x51,0xab,
-        0xa1,0x5b,0x4e,0xb4,0x64,0x9e,0x8b,0x71,0x30,0xca,0xdf,0x25,0xf5,0x0f,0x1a,0xe0,
-        0x98,0x62,0x77,0x8d,0x5d,0xa7,0xb2,0x48,0x09,0xf3,0xe6,0x1c,0xcc,0x36,0x23,0xd9,
-        0x37,0xcd,0xd8,0x22,0xf2,0x08,0x1d,0xe7,0xa6,0x5c,0x49,0xb3,0x63,0x99,0x8c,0x76,
-        0x0e,0xf4,0xe1,0x1b,0xcb,0x31,0x24,0xde,0x9f,0x65,0x70,0x8a,0x5a,0xa0,0xb5,0x4f,
-        0x45,0xbf,0xaa,0x50,0x80,0x7a,0x6f,0x95,0xd4,0x2e,0x3b,0xc1,0x11,0xeb,0xfe,0x04,
-        0x7c,0x86,0x93,0x69,0xb9,0x43,0x56,0xac,0xed,0x17,0x02,0xf8,0x28,0xd2,0xc7,0x3d,
-    ),
-    ( # 251
-        0x00,0xfb,0xed,0x16,0xc1,0x3a,0x2c,0xd7,0x99,0x62,0x74,0x8f,0x58,0xa3,0xb5,0x4e,
-        0x29,0xd2,0xc4,0x3f,0xe8,0x13,0x05,0xfe,0xb0,0x4b,0x5d,0xa6,0x71,0x8a,0x9c,0x67,
-        0x52,0xa9,0xbf,0x44,0x93,0x68,0x7e,0x85,0xcb,0x30,0x26,0xdd,0x0a,0xf1,0xe7,0x1c,
-        0x7b,0x80,0x96,0x6d,0xba,0x41,0x57,0xac,0xe2,0x19,0x0f,0xf4,0x23,0xd8,0xce,0x35,
-        0xa4,0x5f,0x49,0xb2,0x65,0x9e,0x88,0x73,0x3d,0xc6,0xd0,0x2b,0xfc,0x07,0x11,0xea,
-        0x8d,0x76,0x60,0x9b,0x4c,0xb7,0xa1,0x5a,0x14,0xef,0xf9,0x02,0xd5,0x2e,0x38,0xc3,
-        0xf6,0x0d,0x1b,0xe0,0x37,0xcc,0xda,0x21,0x6f,0x94,0x82,0x79,0xae,0x55,0x43,0xb8,
-        0xdf,0x24,0x32,0xc9,0x1e,0xe5,0xf3,0x08,0x46,0xbd,0xab,0x50,0x87,0x7c,0x6a,0x91,
-        0x53,0xa8,0xbe,0x45,0x92,0x69,0x7f,0x84,0xca,0x31,0x27,0xdc,0x0b,0xf0,0xe6,0x1d,
-        0x7a,0x81,0x97,0x6c,0xbb,0x40,0x56,0xad,0xe3,0x18,0x0e,0xf5,0x22,0xd9,0xcf,0x34,
-        0x01,0xfa,0xec,0x17,0xc0,0x3b,0x2d,0xd6,0x98,0x63,0x75,0x8e,0x59,0xa2,0xb4,0x4f,
-        0x28,0xd3,0xc5,0x3e,0xe9,0x12,0x04,0xff,0xb1,0x4a,0x5c,0xa7,0x70,0x8b,0x9d,0x66,
-        0xf7,0x0c,0x1a,0xe1,0x36,0xcd,0xdb,0x20,0x6e,0x95,0x83,0x78,0xaf,0x54,0x42,0xb9,
-        0xde,0x25,0x33,0xc8,0x1f,0xe4,0xf2,0x09,0x47,0xbc,0xaa,0x51,0x86,0x7d,0x6b,0x90,
-        0xa5,0x5e,0x48,0xb3,0x64,0x9f,0x89,0x72,0x3c,0xc7,0xd1,0x2a,0xfd,0x06,0x10,0xeb,
-        0x8c,0x77,0x61,0x9a,0x4d,0xb6,0xa0,0x5b,0x15,0xee,0xf8,0x03,0xd4,0x2f,0x39,0xc2,
-    ),
-    ( # 252
-        0x00,0xfc,0xe3,0x1f,0xdd,0x21,0x3e,0xc2,0xa1,0x5d,0x42,0xbe,0x7c,0x80,0x9f,0x63,
-        0x59,0xa5,0xba,0x46,0x84,0x78,0x67,0x9b,0xf8,0x04,0x1b,0xe7,0x25,0xd9,0xc6,0x3a,
-        0xb2,0x4e,0x51,0xad,0x6f,0x93,0x8c,0x70,0x13,0xef,0xf0,0x0c,0xce,0x32,0x2d,0xd1,
-        0xeb,0x17,0x08,0xf4,0x36,0xca,0xd5,0x29,0x4a,0xb6,0xa9,0x55,0x97,0x6b,0x74,0x88,
-        0x7f,0x83,0x9c,0x60,0xa2,0x5e,0x41,0xbd,0xde,0x22,0x3d,0xc1,0x03,0xff,0xe0,0x1c,
-        0x26,0xda,0xc5,0x39,0xfb,0x07,0x18,0xe4,0x87,0x7b,0x64,0x98,0x5a,0xa6,0xb9,0x45,
-        0xcd,0x31,0x2e,0xd2,0x10,0xec,0xf3,0x0f,0x6c,0x90,0x8f,0x73,0xb1,0x4d,0x52,0xae,
-        0x94,0x68,0x77,0x8b,0x49,0xb5,0xaa,0x56,0x35,0xc9,0xd6,0x2a,0xe8,0x14,0x0b,0xf7,
-        0xfe,0x02,0x1d,0xe1,0x23,0xdf,0xc0,0x3c,0x5f,0xa3,0xbc,0x40,0x82,0x7e,0x61,0x9d,
-        0xa7,0x5b,0x44,0xb8,0x7a,0x86,0x99,0x65,0x06,0xfa,0xe5,0x19,0xdb,0x27,0x38,0xc4,
-        0x4c,0xb0,0xaf,0x53,0x91,0x6d,0x72,0x8e,0xed,0x11,0x0e,0xf2,0x30,0xcc,0xd3,0x2f,
-        0x15,0xe9,0xf6,0x0a,0xc8,0x34,0x2b,0xd7,0xb4,0x48,0x57,0xab,0x69,0x95,0x8a,0x76,
-        0x81,0x7d,0x62,0x9e,0x5c,0xa0,0xbf,0x43,0x20,0xdc,0xc3,0x3f,0xfd,0x01,0x1e,0xe2,
-        0xd8,0x24,0x3b,0xc7,0x05,0xf9,0xe6,0x1a,0x79,0x85,0x9a,0x66,0xa4,0x58,0x47,0xbb,
-        0x33,0xcf,0xd0,0x2c,0xee,0x12,0x0d,0xf1,0x92,0x6e,0x71,0x8d,0x4f,0xb3,0xac,0x50,
-        0x6a,0x96,0x89,0x75,0xb7,0x4b,0x54,0xa8,0xcb,0x37,0x28,0xd4,0x16,0xea,0xf5,0x09,
-    ),
-    ( # 253
-        0x00,0xfd,0xe1,0x1c,0xd9,0x24,0x38,0xc5,0xa9,0x54,0x48,0xb5,0x70,0x8d,0x91,0x6c,
-        0x49,0xb4,0xa8,0x55,0x90,0x6d,0x71,0x8c,0xe0,0x1d,0x01,0xfc,0x39,0xc4,0xd8,0x25,
-        0x92,0x6f,0x73,0x8e,0x4b,0xb6,0xaa,0x57,0x3b,0xc6,0xda,0x27,0xe2,0x1f,0x03,0xfe,
-        0xdb,0x26,0x3a,0xc7,0x02,0xff,0xe3,0x1e,0x72,0x8f,0x93,0x6e,0xab,0x56,0x4a,0xb7,
-        0x3f,0xc2,0xde,0x23,0xe6,0x1b,0x07,0xfa,0x96,0x6b,0x77,0x8a,0x4f,0xb2,0xae,0x53,
-        0x76,0x8b,0x97,0x6a,0xaf,0x52,0x4e,0xb3,0xdf,0x22,0x3e,0xc3,0x06,0xfb,0xe7,0x1a,
-        0xad,0x50,0x4c,0xb1,0x74,0x89,0x95,0x68,0x04,0xf9,0xe5,0x18,0xdd,0x20,0x3c,0xc1,
-        0xe4,0x19,0x05,0xf8,0x3d,0xc0,0xdc,0x21,0x4d,0xb0,0xac,0x51,0x94,0x69,0x75,0x88,
-        0x7e,0x83,0x9f,0x62,0xa7,0x5a,0x46,0xbb,0xd7,0x2a,0x36,0xcb,0x0e,0xf3,0xef,0x12,
-        0x37,0xca,0xd6,0x2b,0xee,0x13,0x0f,0xf2,0x9e,0x63,0x7f,0x82,0x47,0xba,0xa6,0x5b,
-        0xec,0x11,0x0d,0xf0,0x35,0xc8,0xd4,0x29,0x45,0xb8,0xa4,0x59,0x9c,0x61,0x7d,0x80,
-        0xa5,0x58,0x44,0xb9,0x7c,0x81,0x9d,0x60,0x0c,0xf1,0xed,0x10,0xd5,0x28,0x34,0xc9,
-        0x41,0xbc,0xa0,0x5d,0x98,0x65,0x79,0x84,0xe8,0x15,0x09,0xf4,0x31,0xcc,0xd0,0x2d,
-        0x08,0xf5,0xe9,0x14,0xd1,0x2c,0x30,0xcd,0xa1,0x5c,0x40,0xbd,0x78,0x85,0x99,0x64,
-        0xd3,0x2e,0x32,0xcf,0x0a,0xf7,0xeb,0x16,0x7a,0x87,0x9b,0x66,0xa3,0x5e,0x42,0xbf,
-        0x9a,0x67,0x7b,0x86,0x43,0xbe,0xa2,0x5f,0x33,0xce,0xd2,0x2f,0xea,0x17,0x0b,0xf6,
-    ),
-    ( # 254
-        0x00,0xfe,0xe7,0x19,0xd5,0x2b,0x32,0xcc,0xb1,0x4f,0x56,0xa8,0x64,0x9a,0x83,0x7d,
-        0x79,0x87,0x9e,0x60,0xac,0x52,0x4b,0xb5,0xc8,0x36,0x2f,0xd1,0x1d,0xe3,0xfa,0x04,
-        0xf2,0x0c,0x15,0xeb,0x27,0xd9,0xc0,0x3e,0x43,0xbd,0xa4,0x5a,0x96,0x68,0x71,0x8f,
-        0x8b,0x75,0x6c,0x92,0x5e,0xa0,0xb9,0x47,0x3a,0xc4,0xdd,0x23,0xef,0x11,0x08,0xf6,
-        0xff,0x01,0x18,0xe6,0x2a,0xd4,0xcd,0x33,0x4e,0xb0,0xa9,0x57,0x9b,0x65,0x7c,0x82,
-        0x86,0x78,0x61,0x9f,0x53,0xad,0xb4,0x4a,0x37,0xc9,0xd0,0x2e,0xe2,0x1c,0x05,0xfb,
-        0x0d,0xf3,0xea,0x14,0xd8,0x26,0x3f,0xc1,0xbc,0x42,0x5b,0xa5,0x69,0x97,0x8e,0x70,
-        0x74,0x8a,0x93,0x6d,0xa1,0x5f,0x46,0xb8,0xc5,0x3b,0x22,0xdc,0x10,0xee,0xf7,0x09,
-        0xe5,0x1b,0x02,0xfc,0x30,0xce,0xd7,0x29,0x54,0xaa,0xb3,0x4d,0x81,0x7f,0x66,0x98,
-        0x9c,0x62,0x7b,0x85,0x49,0xb7,0xae,0x50,0x2d,0xd3,0xca,0x34,0xf8,0x06,0x1f,0xe1,
-        0x17,0xe9,0xf0,0x0e,0xc2,0x3c,0x25,0xdb,0xa6,0x58,0x41,0xbf,0x73,0x8d,0x94,0x6a,
-        0x6e,0x90,0x89,0x77,0xbb,0x45,0x5c,0xa2,0xdf,0x21,0x38,0xc6,0x0a,0xf4,0xed,0x13,
-        0x1a,0xe4,0xfd,0x03,0xcf,0x31,0x28,0xd6,0xab,0x55,0x4c,0xb2,0x7e,0x80,0x99,0x67,
-        0x63,0x9d,0x84,0x7a,0xb6,0x48,0x51,0xaf,0xd2,0x2c,0x35,0xcb,0x07,0xf9,0xe0,0x1e,
-        0xe8,0x16,0x0f,0xf1,0x3d,0xc3,0xda,0x24,0x59,0xa7,0xbe,0x40,0x8c,0x72,0x6b,0x95,
-        0x91,0x6f,0x76,0x88,0x44,0xba,0xa3,0x5d,0x20,0xde,0xc7,0x39,0xf5,0x0b,0x12,0xec,
-    ),
-    ( # 255
-        0x00,0xff,0xe5,0x1a,0xd1,0x2e,0x34,0xcb,0xb9,0x46,0x5c,0xa3,0x68,0x97,0x8d,0x72,
-        0x69,0x96,0x8c,0x73,0xb8,0x47,0x5d,0xa2,0xd0,0x2f,0x35,0xca,0x01,0xfe,0xe4,0x1b,
-        0xd2,0x2d,0x37,0xc8,0x03,0xfc,0xe6,0x19,0x6b,0x94,0x8e,0x71,0xba,0x45,0x5f,0xa0,
-        0xbb,0x44,0x5e,0xa1,0x6a,0x95,0x8f,0x70,0x02,0xfd,0xe7,0x18,0xd3,0x2c,0x36,0xc9,
-        0xbf,0x40,0x5a,0xa5,0x6e,0x91,0x8b,0x74,0x06,0xf9,0xe3,0x1c,0xd7,0x28,0x32,0xcd,
-        0xd6,0x29,0x33,0xcc,0x07,0xf8,0xe2,0x1d,0x6f,0x90,0x8a,0x75,0xbe,0x41,0x5b,0xa4,
-        0x6d,0x92,0x88,0x77,0xbc,0x43,0x59,0xa6,0xd4,0x2b,0x31,0xce,0x05,0xfa,0xe0,0x1f,
-        0x04,0xfb,0xe1,0x1e,0xd5,0x2a,0x30,0xcf,0xbd,0x42,0x58,0xa7,0x6c,0x93,0x89,0x76,
-        0x65,0x9a,0x80,0x7f,0xb4,0x4b,0x51,0xae,0xdc,0x23,0x39,0xc6,0x0d,0xf2,0xe8,0x17,
-        0x0c,0xf3,0xe9,0x16,0xdd,0x22,0x38,0xc7,0xb5,0x4a,0x50,0xaf,0x64,0x9b,0x81,0x7e,
-        0xb7,0x48,0x52,0xad,0x66,0x99,0x83,0x7c,0x0e,0xf1,0xeb,0x14,0xdf,0x20,0x3a,0xc5,
-        0xde,0x21,0x3b,0xc4,0x0f,0xf0,0xea,0x15,0x67,0x98,0x82,0x7d,0xb6,0x49,0x53,0xac,
-        0xda,0x25,0x3f,0xc0,0x0b,0xf4,0xee,0x11,0x63,0x9c,0x86,0x79,0xb2,0x4d,0x57,0xa8,
-        0xb3,0x4c,0x56,0xa9,0x62,0x9d,0x87,0x78,0x0a,0xf5,0xef,0x10,0xdb,0x24,0x3e,0xc1,
-        0x08,0xf7,0xed,0x12,0xd9,0x26,0x3c,0xc3,0xb1,0x4e,0x54,0xab,0x60,0x9f,0x85,0x7a,
-        0x61,0x9e,0x84,0x7b,0xb0,0x4f,0x55,0xaa,0xd8,0x27,0x3d,0xc2,0x09,0xf6,0xec,0x13,
-    ),
-)
+MultTable = tuple(tuple(MultFlat[a << 8:(a + 1) << 8]) for a in range(256))
+InvTable = (None,) + tuple(InvFlat[1:])
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+from .AES import toBatch
+from .Exception import InvalidArgument, WhiteBoxError
+from .WhiteBoxedAES import WhiteBoxedAES
+import numpy as np
+
+__all__ = ["WhiteBoxedAESMultiBlock"]
+
+# default maximum number of blocks by invocation of the target
+MULTIBLOCK_MAX_BLOCKS = 4096
+
+class WhiteBoxedAESMultiBlock(WhiteBoxedAES):
+    # WhiteBoxedAES for a target that processes many blocks in one invocation:
+    # an ECB mode, a program that encrypts a file, ... One invocation with
+    # n blocks is often far cheaper than n invocations with one block.
+    #
+    # A child class implements applyBlocks (and applyFaultBlocks for the
+    # faults) in addition to getRoundNumber, isEncrypt and hasReverse. The
+    # batches (applyBatch, applyFaultBatch) are packed into invocations of at
+    # most getMaxBlocks() blocks, the results are split back by block:
+    # - applyBatch: all the blocks are packed together,
+    # - applyFaultBatch: the blocks with the same faults are packed together.
+    # apply and applyFault are invocations with one block.
+    #
+    # The bruteforce of Step1 (without applyReverse) uses applyBatch.
+
+    def getMaxBlocks(self):
+        # [optionnal]
+        # return the maximum number of blocks of one invocation
+        return MULTIBLOCK_MAX_BLOCKS
+
+    def applyBlocks(self, data):
+        # Apply the whitebox on each block of a buffer (ECB)
+        # [param] data  a buffer of 16 * n bytes (type bytes), with
+        #   1 <= n <= getMaxBlocks()
+        # return  16 * n bytes, the output of each block
+        raise NotImplementedError("WhiteBoxedAESMultiBlock.applyBlocks must be implemented for a given whitebox")
+
+    def applyFaultBlocks(self, data, faults):
+        # Apply the whitebox on each block of a buffer with the same faults
+        # injected in every block
+        # [param] data    a buffer of 16 * n bytes (type bytes), with
+        #   1 <= n <= getMaxBlocks()
+        # [param] faults  a list of faults (see WhiteBoxedAES.applyFault)
+        # return  16 * n bytes, the faulted output of each block
+        raise NotImplementedError("WhiteBoxedAESMultiBlock.applyFaultBlocks must be implemented for a given whitebox")
+
+    def _invoke(self, method, data, *args):
+        # data: array (N, 16), split in invocations of getMaxBlocks() blocks
+        maxBlocks = self.getMaxBlocks()
+        out = []
+        for begin in range(0, len(data), maxBlocks):
+            chunk = data[begin:begin + maxBlocks]
+            res = bytes(method(chunk.tobytes(), *args))
+            WhiteBoxError.check( len(res) == 16 * len(chunk),
+                f"The whitebox returns {len(res)} bytes for {len(chunk)} blocks")
+            out.append(res)
+        return np.frombuffer(b"".join(out), dtype=np.uint8).reshape(-1, 16)
+
+    def apply(self, data):
+        return self._invoke(self.applyBlocks, toBatch(bytes(data))).tobytes()
+
+    def applyFault(self, data, faults):
+        for fround, fbytes, fxorval in faults:
+            assert 0 <= fbytes and fbytes <= 15, "Invalid fbytes value"
+            assert 1 <= fxorval and fxorval <= 255, "Invalid fxorval value"
+        if len(faults) == 0:
+            return self.apply(data)
+        return self._invoke(self.applyFaultBlocks, toBatch(bytes(data)), faults).tobytes()
+
+    def applyBatch(self, data):
+        # [param] data  an array (N, 16) of uint8 or a buffer of 16 * N bytes
+        # return  an array (N, 16) of uint8
+        return self._invoke(self.applyBlocks, toBatch(data))
+
+    def applyFaultBatch(self, data, faults):
+        # [param] data    an array (N, 16) of uint8 or a buffer of 16 * N bytes
+        # [param] faults  a list of N lists of faults, one for each block
+        # return  an array (N, 16) of uint8
+        data = toBatch(data)
+        InvalidArgument.check( len(faults) == len(data),
+            f"{len(faults)} lists of faults for {len(data)} blocks")
+        out = np.empty_like(data)
+
+        # the blocks with the same faults, in the order of their first block
+        groups = {}
+        for index, blockFaults in enumerate(faults):
+            groups.setdefault(tuple(tuple(f) for f in blockFaults), []).append(index)
+
+        for blockFaults, indexes in groups.items():
+            if len(blockFaults) == 0:
+                out[indexes] = self._invoke(self.applyBlocks, data[indexes])
+            else:
+                out[indexes] = self._invoke(self.applyFaultBlocks, data[indexes], list(blockFaults))
+        return out
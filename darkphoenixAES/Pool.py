@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+from .AES import toBatch
+from .Exception import InvalidArgument, WhiteBoxError
+from .WhiteBoxedAES import WhiteBoxedAES, WhiteBoxedAESDynamic, WhiteBoxedAESAuto
+from concurrent.futures import ThreadPoolExecutor
+import multiprocessing as mp
+import numpy as np
+import os
+import threading
+import time
+
+__all__ = ["WhiteBoxedAESPool", "WhiteBoxedAESPoolDynamic", "WhiteBoxedAESPoolAuto", "createPool"]
+
+# A pool of distinct instances of the same whitebox (devices, emulators, ...)
+# seen by the attack as one WhiteBoxedAES.
+#
+# - Each query runs on the instance with the lowest latency (seconds by block,
+#   moving average of the last queries). The batches (applyBatch,
+#   applyFaultBatch, applyFaultSweep) are split between the instances in
+#   proportion to their speed, and run at the same time in threads.
+# - The fault positions are chosen by the first instance of the pool (the
+#   leader), and copied to the other instances with getFaultPosition and
+#   setFaultPosition. Without them, the same call (changeFaultPosition or
+#   prepareFaultPosition) is done on every instance: the instances must then
+#   choose the same positions.
+# - A query that fails (POOL_FAILURES) is run again on another instance. If it
+#   succeeds, the failure is counted for the first instance, otherwise the
+#   query itself is wrong (a fault that crashes the target, ...) and the
+#   exception is raised. An instance is retired after maxFailures consecutive
+#   failures. The last instance is never retired.
+#
+# The latencies and the retired instances are shared with the processes
+# forked by the attack (the workers of the steps).
+
+# weight of the last query in the latency of an instance
+POOL_LATENCY_DECAY = 0.2
+# number of consecutive failures before an instance is retired
+POOL_MAX_FAILURES = 3
+# exceptions raised by a failing instance
+POOL_FAILURES = (WhiteBoxError, OSError, EOFError)
+
+def _applyBatch(wb, data):
+    if hasattr(wb, "applyBatch") and callable(wb.applyBatch):
+        return np.asarray(wb.applyBatch(data), dtype=np.uint8).reshape(-1, 16)
+    return toBatch([wb.apply(x.tobytes()) for x in data])
+
+def _applyFaultBatch(wb, data, faults):
+    if hasattr(wb, "applyFaultBatch") and callable(wb.applyFaultBatch):
+        return np.asarray(wb.applyFaultBatch(data, faults), dtype=np.uint8).reshape(-1, 16)
+    return toBatch([wb.applyFault(x.tobytes(), f) for x, f in zip(data, faults)])
+
+def _applyFaultSweep(wb, data, fround, fbytes, values):
+    if hasattr(wb, "applyFaultSweep") and callable(wb.applyFaultSweep):
+        return [bytes(x) for x in wb.applyFaultSweep(data, fround, fbytes, values)]
+    return [bytes(wb.applyFault(data, [(fround, fbytes, v)])) for v in values]
+
+class WhiteBoxedAESPool(WhiteBoxedAES):
+    # Pool of whiteboxes with static fault positions. Use WhiteBoxedAESPoolDynamic
+    # or WhiteBoxedAESPoolAuto (or createPool) for dynamic fault positions.
+
+    def __init__(self, instances, maxFailures=POOL_MAX_FAILURES, failures=POOL_FAILURES):
+        # [param] instances    the whiteboxes, with the same key and encodings
+        # [param] maxFailures  consecutive failures before an instance is retired
+        # [param] failures     the exceptions that count as a failure
+        self.instances = list(instances)
+        InvalidArgument.check( len(self.instances) != 0, "A pool needs at least one instance")
+        self.roundNumber = self.instances[0].getRoundNumber()
+        self.encrypt = self.instances[0].isEncrypt()
+        for wb in self.instances:
+            InvalidArgument.check( wb.getRoundNumber() == self.roundNumber and wb.isEncrypt() == self.encrypt,
+                "The instances of a pool must have the same number of rounds and direction")
+        self.reverse = all([wb.hasReverse() for wb in self.instances])
+        lastRoundHasMC = set([getattr(wb, "lastRoundHasMC", None) for wb in self.instances])
+        if len(lastRoundHasMC) == 1 and None not in lastRoundHasMC:
+            self.lastRoundHasMC = lastRoundHasMC.pop()
+
+        self.maxFailures = maxFailures
+        self.failures = tuple(failures)
+        self.randomInput = []
+
+        # shared with the forked processes
+        self.latency = mp.RawArray('d', len(self.instances))
+        self.failureCount = mp.RawArray('i', len(self.instances))
+        self.retired = mp.RawArray('b', len(self.instances))
+
+        # state of the current process, see checkLocal
+        self.localPid = None
+
+    def getRoundNumber(self):
+        return self.roundNumber
+
+    def isEncrypt(self):
+        return self.encrypt
+
+    def hasReverse(self):
+        return self.reverse
+
+    def newThread(self):
+        for wb in self.instances:
+            if hasattr(wb, "newThread") and callable(wb.newThread):
+                wb.newThread()
+        self.localPid = None
+
+    def checkLocal(self):
+        # the threads and the locks don't exist in a forked process
+        if self.localPid != os.getpid():
+            self.localPid = os.getpid()
+            self.executor = ThreadPoolExecutor(max_workers=len(self.instances))
+            self.locks = [threading.Lock() for _ in self.instances]
+            self.pending = [0 for _ in self.instances]
+
+    def getActive(self):
+        # the indexes of the instances not retired
+        return [i for i in range(len(self.instances)) if not self.retired[i]]
+
+    def getLeader(self):
+        # the instance that chooses the fault positions
+        return self.getActive()[0]
+
+    def getCost(self, index):
+        # expected time of a query on an instance (the instances never used
+        # come first)
+        self.checkLocal()
+        return self.latency[index] * (self.pending[index] + 1)
+
+    def _choose(self, exclude=()):
+        candidates = [i for i in self.getActive() if i not in exclude]
+        WhiteBoxError.check( len(candidates) != 0, "No instance of the pool is available")
+        return min(candidates, key=self.getCost)
+
+    def _run(self, index, function, args, blocks):
+        self.checkLocal()
+        self.pending[index] += 1
+        try:
+            with self.locks[index]:
+                start = time.perf_counter()
+                res = function(self.instances[index], *args)
+                elapsed = (time.perf_counter() - start) / max(blocks, 1)
+        finally:
+            self.pending[index] -= 1
+        old = self.latency[index]
+        self.latency[index] = elapsed if old == 0 else old + POOL_LATENCY_DECAY * (elapsed - old)
+        self.failureCount[index] = 0
+        return res
+
+    def _call(self, function, args, blocks=1, index=None):
+        # run function(instance, *args) on the instance index (default: the
+        # best one), or on another one if it fails
+        if index is None:
+            index = self._choose()
+        try:
+            return self._run(index, function, args, blocks)
+        except self.failures as e:
+            if len(self.getActive()) <= 1:
+                raise
+            error = e
+        # raises if the query also fails on another instance
+        res = self._run(self._choose(exclude=[index]), function, args, blocks)
+        self._failure(index, error)
+        return res
+
+    def _failure(self, index, error, retire=False):
+        self.failureCount[index] += 1
+        if (retire or self.failureCount[index] >= self.maxFailures) and len(self.getActive()) > 1:
+            self.retired[index] = 1
+            print(f"Instance {index} of the pool retired after {self.failureCount[index]} failures: "
+                  f"{error.__class__.__name__}: {error}")
+
+    def _split(self, function, n, getArgs):
+        # run the n blocks on the instances in proportion to their speed,
+        # getArgs(begin, end) returns the arguments for the blocks [begin, end)
+        # return the results of the parts in order
+        active = self.getActive()
+        measured = [self.latency[i] for i in active if self.latency[i] > 0]
+        default = sum(measured) / len(measured) if len(measured) != 0 else 1
+        speed = [1 / (self.latency[i] if self.latency[i] > 0 else default) for i in active]
+        parts = []
+        begin = 0
+        total = 0
+        for index, s in zip(active, speed):
+            total += s
+            end = n if index == active[-1] else round(n * total / sum(speed))
+            if end > begin:
+                parts.append((index, begin, end))
+            begin = end
+
+        if len(parts) == 1:
+            index, begin, end = parts[0]
+            return [self._call(function, getArgs(begin, end), end - begin, index)]
+        self.checkLocal()
+        jobs = [self.executor.submit(self._call, function, getArgs(begin, end), end - begin, index)
+                for index, begin, end in parts]
+        return [job.result() for job in jobs]
+
+    def apply(self, data):
+        return self._call(lambda wb, x: wb.apply(x), (data,))
+
+    def applyReverse(self, data):
+        return self._call(lambda wb, x: wb.applyReverse(x), (data,))
+
+    def applyFault(self, data, faults):
+        return self._call(lambda wb, x, f: wb.applyFault(x, f), (data, faults))
+
+    def applyBatch(self, data):
+        data = toBatch(data)
+        if len(data) == 0:
+            return data
+        return np.concatenate(self._split(_applyBatch, len(data),
+                                          lambda begin, end: (data[begin:end],)))
+
+    def applyFaultBatch(self, data, faults):
+        data = toBatch(data)
+        if len(data) == 0:
+            return data
+        return np.concatenate(self._split(_applyFaultBatch, len(data),
+                                          lambda begin, end: (data[begin:end], faults[begin:end])))
+
+    def applyFaultSweep(self, data, fround, fbytes, values):
+        values = list(values)
+        if len(values) == 0:
+            return []
+        parts = self._split(_applyFaultSweep, len(values),
+                            lambda begin, end: (data, fround, fbytes, values[begin:end]))
+        return [out for part in parts for out in part]
+
+    def getRandomInput(self, n=0):
+        # the inputs of the leader, kept if it is retired
+        while len(self.randomInput) <= n:
+            leader = self.instances[self.getLeader()]
+            if hasattr(leader, "getRandomInput") and callable(leader.getRandomInput):
+                self.randomInput.append(leader.getRandomInput(len(self.randomInput)))
+            else:
+                self.randomInput.append(os.urandom(16))
+        return self.randomInput[n]
+
+    def _replicate(self, fround, fbytesList, function):
+        # copy the fault positions of the leader to the other instances, or
+        # call function on each of them
+        leader = self.getLeader()
+        try:
+            positions = [(fbytes, self.instances[leader].getFaultPosition(fround, fbytes))
+                         for fbytes in fbytesList]
+            function = lambda wb: [wb.setFaultPosition(fround, fbytes, position)
+                                   for fbytes, position in positions]
+        except (AttributeError, NotImplementedError):
+            pass
+        for index in self.getActive():
+            if index == leader:
+                continue
+            try:
+                function(self.instances[index])
+            except self.failures as e:
+                # the instance doesn't have the same positions anymore
+                self._failure(index, e, retire=True)
+
+class WhiteBoxedAESPoolDynamic(WhiteBoxedAESPool, WhiteBoxedAESDynamic):
+
+    def prepareFaultPosition(self, fround, reverseRoundMethod, reverseRoundMethod2=None):
+        self.instances[self.getLeader()].prepareFaultPosition(fround, reverseRoundMethod, reverseRoundMethod2)
+        self._replicate(fround, range(16),
+                        lambda wb: wb.prepareFaultPosition(fround, reverseRoundMethod, reverseRoundMethod2))
+
+class WhiteBoxedAESPoolAuto(WhiteBoxedAESPool, WhiteBoxedAESAuto):
+
+    def changeFaultPosition(self, fround, fbytes):
+        self.instances[self.getLeader()].changeFaultPosition(fround, fbytes)
+        self._replicate(fround, [fbytes], lambda wb: wb.changeFaultPosition(fround, fbytes))
+
+    def removeFaultPosition(self, fround, fbytes):
+        for index in self.getActive():
+            self.instances[index].removeFaultPosition(fround, fbytes)
+
+def createPool(instances, **kwargs):
+    # the pool class of the instances (WhiteBoxedAESPool, WhiteBoxedAESPoolDynamic
+    # or WhiteBoxedAESPoolAuto), the arguments are the ones of WhiteBoxedAESPool
+    instances = list(instances)
+    for poolClass, wbClass in [(WhiteBoxedAESPoolAuto, WhiteBoxedAESAuto),
+                               (WhiteBoxedAESPoolDynamic, WhiteBoxedAESDynamic)]:
+        if len(instances) != 0 and isinstance(instances[0], wbClass):
+            InvalidArgument.check( all([isinstance(wb, wbClass) for wb in instances]),
+                f"All the instances of the pool must inherit {wbClass.__name__}")
+            return poolClass(instances, **kwargs)
+    InvalidArgument.check( not any([isinstance(wb, (WhiteBoxedAESAuto, WhiteBoxedAESDynamic)) for wb in instances]),
+        "All the instances of the pool must have the same type of fault positions")
+    return WhiteBoxedAESPool(instances, **kwargs)
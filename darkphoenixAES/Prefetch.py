@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+from .ColumnSolver import INITIAL_EXTRA_FAULT
+from .MeetITM import chooseMidalpha
+from . import Step3, Step4, Step5
+import multiprocessing as mp
+import os
+
+__all__ = ["FaultPrefetch"]
+
+# Early collection of the faulted outputs of Step3, Step4 and Step5.
+#
+# Step3.1, Step4 and Step5 inject faults on mref at fixed rounds and positions.
+# Only the processing of the output (outputF) depends on the results of the
+# previous steps, the raw output of the whitebox doesn't. When the fault
+# positions are static (neither WhiteBoxedAESDynamic nor WhiteBoxedAESAuto),
+# these outputs are collected during Step1 and Step2 by low-priority worker
+# processes, that only use the CPU time left by the steps.
+#
+# The raw outputs are stored in the WhiteBoxedAESProxy (addRawFaults). When a
+# step requests a fault already collected, the whitebox isn't run again.
+# A collection still running when Step3 starts is stopped: each worker ends its
+# job after the current fault value and the outputs already collected are kept.
+# The steps compute the missing outputs themselves.
+#
+# Collected for mref:
+# - Step3.1: the 16 positions with the fault values 1 to 255,
+# - Step4 and Step5: the first position tried for each column, with the fault
+#   values of the first resolution of the column.
+
+# niceness of the prefetch workers
+PREFETCH_NICE = 19
+
+localWB = None
+localStop = None
+def init_localWB(wb, stop):
+    global localWB, localStop
+    try:
+        os.nice(PREFETCH_NICE)
+    except (AttributeError, OSError):
+        pass
+    wb.newThread()
+    localWB = wb
+    localStop = stop
+
+def prefetchRunner(data, faults):
+    # return the outputs of the first faults, until the prefetch is stopped
+    outputs = []
+    for fault in faults:
+        if localStop.is_set():
+            break
+        outputs.append(localWB.realWB.applyFault(data, [fault]))
+    return outputs
+
+def getPrefetchFaults(wb, state):
+    # return the list of the faults to collect, by job. One job is a position
+    # with all its fault values. The jobs of the next step come first.
+    jobs = []
+    if state <= 2:
+        fround = Step3.getFaultRound(wb)
+        for fpos in range(16):
+            jobs.append([(fround, fpos, fval) for fval in range(1, 256)])
+
+    if state <= 3:
+        # lambda of the column 0 is unknown, the other columns use the
+        # lambda found for column 0
+        for col in range(4):
+            alpha = chooseMidalpha(None if col == 0 else [1]*4) + INITIAL_EXTRA_FAULT
+            jobs.append([tuple(Step4.getInjectionParam(wb, col, fval))
+                         for fval in range(1, alpha + 1)])
+
+    if state <= 4:
+        alpha = chooseMidalpha([1]*4) + INITIAL_EXTRA_FAULT
+        nround = Step5.getInjectionParam(wb, 0, 0, 0)[0]
+        if not wb.lastRoundHasMC:
+            nround += 1
+        for roundN in range(nround):
+            for col in range(4):
+                jobs.append([tuple(Step5.getInjectionParam(wb, col, fval, roundN))
+                             for fval in range(1, alpha + 1)])
+    return jobs
+
+class FaultPrefetch:
+
+    def __init__(self, wb, mref, state, nprocess):
+        self.wb = wb
+        self.mref = mref
+        self.jobs = getPrefetchFaults(wb, state)
+        self.nprocess = nprocess
+        self.pool = None
+        self.stopEvent = None
+
+    def start(self):
+        if self.nprocess == 0 or len(self.jobs) == 0 or not self.wb.hasStaticFaultPosition():
+            return
+        self.stopEvent = mp.Event()
+        self.pool = mp.Pool(processes=self.nprocess, initializer=init_localWB,
+                            initargs=[self.wb, self.stopEvent])
+        for faults in self.jobs:
+            # the callback runs in a thread of this process
+            callback = lambda outputs, faults=faults: self.wb.addRawFaults(self.mref, faults, outputs)
+            self.pool.apply_async(prefetchRunner, (self.mref, faults), callback=callback)
+        self.pool.close()
+
+    def stop(self):
+        # stop the remaining jobs, the collected outputs are kept. The workers
+        # aren't terminated: a worker killed while it sends its outputs can
+        # block the pool.
+        if self.pool is not None:
+            self.stopEvent.set()
+            # the pool is already closed, the callbacks of the jobs are done
+            # when join returns
+            self.pool.join()
+            self.pool = None
+
+    def terminate(self):
+        # on an exception only, the outputs of the running jobs are lost
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
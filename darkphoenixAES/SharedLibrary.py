@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+from .Exception import InvalidArgument
+from .WhiteBoxedAES import WhiteBoxedAES
+from concurrent.futures import ThreadPoolExecutor
+import ctypes
+import numpy as np
+import os
+
+__all__ = ["WhiteBoxedAESLibrary"]
+
+# Whitebox interface for a shared library, with ctypes.
+#
+# The library provides the whitebox function and a fault hook, with one of the
+# layouts below (uint8_t *buffers of 16 * n bytes):
+#
+#   inplace  multiBlock  whitebox function         fault hook
+#   False    False       f(in, out)                h(in, out, fround, fbytes, value)
+#   True     False       f(state)                  h(state, fround, fbytes, value)
+#   False    True        f(in, out, n)             h(in, out, n, frounds, fbytes, values)
+#   True     True        f(state, n)               h(state, n, frounds, fbytes, values)
+#
+# fround and fbytes are int, value is an uint8_t (same meaning as applyFault).
+# In the multi-block layout, frounds and fbytes are int32_t[n] and values is an
+# uint8_t[n], the fault of each block: a value of 0 means no fault.
+# The optional reverse function has the same layout as the whitebox function.
+#
+# ctypes releases the GIL during the call. applyBatch and applyFaultBatch (on
+# arrays (N, 16) of uint8) split the blocks between nthread threads that call
+# the library at the same time, on views of the same arrays (no copy). The
+# functions must be thread-safe when nthread > 1. In the worker processes of
+# the attack (nprocess > 0), the batches use a single thread: the workers
+# already use every CPU.
+
+# minimum number of blocks by thread in a batch
+LIBRARY_MIN_CHUNK = 16
+
+_ptr = ctypes.c_void_p
+
+class WhiteBoxedAESLibrary(WhiteBoxedAES):
+
+    def __init__(self, library, symbol, faultSymbol, roundNumber, encrypt,
+                 reverseSymbol=None, inplace=False, multiBlock=False, nthread=None):
+        # [param] library  the path of the library, or a ctypes.CDLL
+        # [param] nthread  the number of threads of the batches
+        #                  (default: the number of CPU). Only used in the
+        #                  main process, a worker process uses one thread.
+        self.lib = ctypes.CDLL(library) if isinstance(library, str) else library
+        self.roundNumber = roundNumber
+        self.encrypt = encrypt
+        self.inplace = inplace
+        self.multiBlock = multiBlock
+        self.nthread = (os.cpu_count() or 1) if nthread is None else nthread
+        InvalidArgument.check( self.nthread >= 1, f"Invalid number of threads ({nthread})")
+
+        buffers = [_ptr] if inplace else [_ptr, _ptr]
+        count = [ctypes.c_size_t] if multiBlock else []
+        if multiBlock:
+            fault = [_ptr, _ptr, _ptr]
+        else:
+            fault = [ctypes.c_int, ctypes.c_int, ctypes.c_uint8]
+
+        self.function = self._getFunction(symbol, buffers + count)
+        self.faultFunction = self._getFunction(faultSymbol, buffers + count + fault)
+        self.reverseFunction = None
+        if reverseSymbol is not None:
+            self.reverseFunction = self._getFunction(reverseSymbol, buffers + count)
+
+        self.executor = None
+        self.executorPid = None
+
+    def _getFunction(self, symbol, argtypes):
+        InvalidArgument.check( hasattr(self.lib, symbol), f"Symbol {symbol} not found")
+        function = getattr(self.lib, symbol)
+        function.argtypes = argtypes
+        function.restype = None
+        return function
+
+    def getRoundNumber(self):
+        return self.roundNumber
+
+    def isEncrypt(self):
+        return self.encrypt
+
+    def hasReverse(self):
+        return self.reverseFunction is not None
+
+    def newThread(self):
+        # the threads of the executor don't exist in a forked process. The
+        # other workers run at the same time, one thread by worker.
+        self.executor = None
+        self.nthread = 1
+
+    def getExecutor(self):
+        if self.executor is None or self.executorPid != os.getpid():
+            self.executor = ThreadPoolExecutor(max_workers=self.nthread)
+            self.executorPid = os.getpid()
+        return self.executor
+
+    def _call(self, function, data, out, begin, end, faultArgs):
+        # call function on the blocks [begin, end) of data (array (N, 16)),
+        # the result is written in out
+        inAddr = data.ctypes.data + 16 * begin
+        outAddr = out.ctypes.data + 16 * begin
+        if self.inplace:
+            out[begin:end] = data[begin:end]
+            buffers = [outAddr]
+        else:
+            buffers = [inAddr, outAddr]
+
+        if self.multiBlock:
+            fault = [] if faultArgs is None else [a.ctypes.data + a.itemsize * begin for a in faultArgs]
+            function(*buffers, end - begin, *fault)
+            return
+
+        for index in range(end - begin):
+            blockBuffers = [addr + 16 * index for addr in buffers]
+            if faultArgs is None:
+                function(*blockBuffers)
+            else:
+                frounds, fbytes, values = faultArgs
+                i = begin + index
+                if values[i] == 0:
+                    self.function(*blockBuffers)
+                else:
+                    function(*blockBuffers, int(frounds[i]), int(fbytes[i]), int(values[i]))
+
+    @staticmethod
+    def _asBlocks(data):
+        # a view (N, 16) on a buffer (bytes, bytearray, array) without copy
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            data = np.frombuffer(data, dtype=np.uint8)
+        return np.ascontiguousarray(data, dtype=np.uint8).reshape(-1, 16)
+
+    def _batch(self, function, data, faultArgs=None, out=None):
+        data = self._asBlocks(data)
+        if out is None:
+            out = np.empty_like(data)
+        else:
+            InvalidArgument.check( not isinstance(out, np.ndarray) or out.flags.c_contiguous,
+                "out must be contiguous")
+            out = self._asBlocks(out)
+            InvalidArgument.check( out.shape == data.shape and out.flags.writeable,
+                "out must be a writable buffer of the size of data")
+        n = len(data)
+        chunk = max(LIBRARY_MIN_CHUNK, -(-n // self.nthread))
+        if self.nthread == 1 or n <= chunk:
+            self._call(function, data, out, 0, n, faultArgs)
+            return out
+
+        jobs = [self.getExecutor().submit(self._call, function, data, out, begin,
+                                          min(begin + chunk, n), faultArgs)
+                for begin in range(0, n, chunk)]
+        for job in jobs:
+            job.result()
+        return out
+
+    def _faultArrays(self, faults):
+        # one fault by block, see the fault hook
+        frounds = np.zeros(len(faults), dtype=np.int32)
+        fbytes = np.zeros(len(faults), dtype=np.int32)
+        values = np.zeros(len(faults), dtype=np.uint8)
+        for i, blockFaults in enumerate(faults):
+            InvalidArgument.check( len(blockFaults) <= 1,
+                "The fault hook of a library only applies one fault by block")
+            for fround, fbyte, fxorval in blockFaults:
+                InvalidArgument.check( 0 <= fbyte and fbyte <= 15, f"Invalid fbytes value {fbyte}")
+                InvalidArgument.check( 1 <= fxorval and fxorval <= 255, f"Invalid fxorval value {fxorval}")
+                frounds[i], fbytes[i], values[i] = fround, fbyte, fxorval
+        return frounds, fbytes, values
+
+    # data is an array (N, 16) of uint8 or a buffer of N * 16 bytes. The result
+    # is written in out (same types) if given, and returned as an array (N, 16)
+
+    def applyBatch(self, data, out=None):
+        return self._batch(self.function, data, out=out)
+
+    def applyReverseBatch(self, data, out=None):
+        InvalidArgument.check( self.hasReverse(), "No reverse function")
+        return self._batch(self.reverseFunction, data, out=out)
+
+    def applyFaultBatch(self, data, faults, out=None):
+        # faults: a list of N lists of faults, one for each block
+        return self._batch(self.faultFunction, data, self._faultArrays(faults), out)
+
+    # a single block is called without numpy, faster for one block
+
+    def _callOne(self, function, data, faultArgs=()):
+        if self.inplace:
+            out = ctypes.create_string_buffer(bytes(data), 16)
+            buffers = [out]
+        else:
+            out = ctypes.create_string_buffer(16)
+            buffers = [bytes(data), out]
+        count = [1] if self.multiBlock else []
+        function(*buffers, *count, *faultArgs)
+        return out.raw
+
+    def apply(self, data):
+        return self._callOne(self.function, data)
+
+    def applyReverse(self, data):
+        InvalidArgument.check( self.hasReverse(), "No reverse function")
+        return self._callOne(self.reverseFunction, data)
+
+    def applyFault(self, data, faults):
+        if len(faults) == 0:
+            return self.apply(data)
+        if self.multiBlock:
+            frounds, fbytes, values = self._faultArrays([faults])
+            return self._callOne(self.faultFunction, data,
+                                 [frounds.ctypes.data, fbytes.ctypes.data, values.ctypes.data])
+        InvalidArgument.check( len(faults) == 1,
+            "The fault hook of a library only applies one fault by block")
+        fround, fbytes, fxorval = faults[0]
+        InvalidArgument.check( 0 <= fbytes and fbytes <= 15, f"Invalid fbytes value {fbytes}")
+        InvalidArgument.check( 1 <= fxorval and fxorval <= 255, f"Invalid fxorval value {fxorval}")
+        return self._callOne(self.faultFunction, data, [fround, fbytes, fxorval])
@@ -17,8 +17,10 @@ import multiprocessing as mp
 import queue
 import tqdm
 import time
-from .AES import xor
+import numpy as np
+from .AES import xor, toBatch
 from .Exception import InvalidState, UnexpectedFailure
+from .Journal import Journal
 
 __all__ = ["compute", "verify"]
 
@@ -53,6 +55,15 @@ __all__ = ["compute", "verify"]
 # For the two last possibilities, computeAlone performs the computation in
 # a process alone, and computeMulti performs the same operation with multiple processes
 
+# The bruteforce gives the inputs to the whitebox by batches of STEP1_BATCH
+# consecutive values (applyBatch, a single invocation for a whitebox that
+# processes many blocks at once). The outputs with one (or two) common bytes in
+# a column are selected with numpy, only these are checked one by one.
+
+# The bruteforce records in the journal each input found, and periodically the
+# next value of each bruteforce range. After a restart, the inputs already
+# found are kept and each range restarts from its last recorded value.
+
 ########################
 # Validation of Step 1 #
 ########################
@@ -75,11 +86,12 @@ def verify(wb, Mref, M, r_s, noprogress):
     with tqdm.tqdm(total=256 * 16, desc="VerifyStep1", unit='input', disable=noprogress) as pbar:
 
         for index, mi in enumerate(M):
-            for xi, indata in enumerate(mi):
+            values = wb.applyBatch(toBatch(mi))
+            for xi, value in enumerate(values):
                 InvalidState.check(
-                    verifyOne(wb.apply(indata), value_ref, r_s[index], index, xi),
+                    verifyOne(value.tobytes(), value_ref, r_s[index], index, xi),
                     "Invalid Step1 state")
-                pbar.update(1)
+            pbar.update(256)
 
 ####################################
 # Bruteforce implementation common #
@@ -89,6 +101,29 @@ RS = [(0, 1, 2, 3),
       (0, 2, 3, 1),
       (0, 3, 1, 2)]
 
+# minimal time (in seconds) between two records of the bruteforce progress
+SCAN_RECORD_PERIOD = 5
+
+# number of inputs given at once to the whitebox by the bruteforce
+STEP1_BATCH = 256
+
+def getPosition(c, rindex, rs_index, value):
+    return (c*4+rindex)*256*len(RS) + rs_index*256 + value
+
+def journalKind(doubleRS):
+    # the inputs found depend on doubleRS
+    return "step1.double" if doubleRS else "step1"
+
+def getBatchInputs(startValue, n):
+    # the n consecutive inputs from startValue, as an array (n, 16)
+    return toBatch(b"".join([(startValue + i).to_bytes(16, 'big') for i in range(n)]))
+
+def getBatchCandidates(values, value_ref, doubleRS):
+    # the indexes of the outputs with at least one (or two with doubleRS)
+    # common bytes with value_ref in a column
+    common = (values == np.frombuffer(value_ref, dtype=np.uint8)).reshape(-1, 4, 4).sum(axis=2)
+    return np.nonzero((common >= (2 if doubleRS else 1)).any(axis=1))[0]
+
 def isCandidate(v, value_ref, r_s):
     if v[r_s[0]] != value_ref[r_s[0]] or v[r_s[1]] != value_ref[r_s[1]]:
         return False
@@ -103,8 +138,17 @@ def isCandidate2(v, value_ref, r_s):
 # Bruteforce implementation monothread #
 ########################################
 
-def computeAlone(wb, Mref, noprogress, doubleRS):
+def computeAloneReport(M, journal, kind, rs_index, c, rindex, data, value):
+    # same as computeRunnerReport, return True if the input is new
+    if M[c][rindex][rs_index][value[c*4+rindex]] is not None:
+        return False
+    M[c][rindex][rs_index][value[c*4+rindex]] = data
+    journal.record(kind, getPosition(c, rindex, rs_index, value[c*4+rindex]), data.hex())
+    return True
+
+def computeAlone(wb, Mref, noprogress, doubleRS, journal):
     M = [[[[None for _ in range(256)] for _ in range(len(RS)) ] for _ in range(4) ] for _ in range(4)]
+    kind = journalKind(doubleRS)
 
     value_ref = wb.apply(Mref)
     for c in range(4):
@@ -114,7 +158,12 @@ def computeAlone(wb, Mref, noprogress, doubleRS):
             M[c][b1][rs_index][value_ref[c*4+b1]] = Mref
             M[c][b2][rs_index][value_ref[c*4+b2]] = Mref
 
-    startValue = 0
+    for position, data in journal.get(kind).items():
+        b, rs_index, value = position // (256*len(RS)), (position // 256) % len(RS), position % 256
+        M[b // 4][b % 4][rs_index][value] = bytes.fromhex(data)
+
+    startValue = journal.get(kind + ".scan").get(0, 0)
+    lastRecord = time.monotonic()
 
     present = sum([max([sum([0 if v is None else 1 for v in mrsrow]) for mrsrow in mrow]) for mcol in M for mrow in mcol])
 
@@ -122,44 +171,30 @@ def computeAlone(wb, Mref, noprogress, doubleRS):
         with tqdm.tqdm(desc="WB Iteration", disable=noprogress, position=0) as pbarIt:
 
             while present != 256 * 16:
-                data = startValue.to_bytes(16, 'big')
-                startValue += 1
-                value = wb.apply(data)
+                inputs = getBatchInputs(startValue, STEP1_BATCH)
+                startValue += STEP1_BATCH
+                values = wb.applyBatch(inputs)
                 has_update = False
-                for c in range(4):
-                    for rs_index, (a1, a2, b1, b2) in enumerate(RS):
-                        if doubleRS:
-                            if isCandidate(value, value_ref, (c*4+a1, c*4+a2)):
-                                if M[c][b1][rs_index][value[c*4+b1]] is None:
-                                    M[c][b1][rs_index][value[c*4+b1]] = data
-                                    has_update = True
-                                if M[c][b2][rs_index][value[c*4+b2]] is None:
-                                    M[c][b2][rs_index][value[c*4+b2]] = data
-                                    has_update = True
-                            if isCandidate(value, value_ref, (c*4+b1, c*4+b2)):
-                                if M[c][b1][rs_index][value[c*4+a1]] is None:
-                                    M[c][b1][rs_index][value[c*4+a1]] = data
-                                    has_update = True
-                                if M[c][a2][rs_index][value[c*4+a2]] is None:
-                                    M[c][a2][rs_index][value[c*4+a2]] = data
-                                    has_update = True
-                        else:
-                            if isCandidate2(value, value_ref, c*4+a1):
-                                if M[c][b1][rs_index][value[c*4+b1]] is None:
-                                    M[c][b1][rs_index][value[c*4+b1]] = data
-                                    has_update = True
-                            if isCandidate2(value, value_ref, c*4+a2):
-                                if M[c][b2][rs_index][value[c*4+b2]] is None:
-                                    M[c][b2][rs_index][value[c*4+b2]] = data
-                                    has_update = True
-                            if isCandidate2(value, value_ref, c*4+b1):
-                                if M[c][a1][rs_index][value[c*4+a1]] is None:
-                                    M[c][a1][rs_index][value[c*4+a1]] = data
-                                    has_update = True
-                            if isCandidate2(value, value_ref, c*4+b2):
-                                if M[c][a2][rs_index][value[c*4+a2]] is None:
-                                    M[c][a2][rs_index][value[c*4+a2]] = data
-                                    has_update = True
+                for i in getBatchCandidates(values, value_ref, doubleRS):
+                    data, value = inputs[i].tobytes(), values[i].tobytes()
+                    for c in range(4):
+                        for rs_index, (a1, a2, b1, b2) in enumerate(RS):
+                            if doubleRS:
+                                if isCandidate(value, value_ref, (c*4+a1, c*4+a2)):
+                                    has_update |= computeAloneReport(M, journal, kind, rs_index, c, b1, data, value)
+                                    has_update |= computeAloneReport(M, journal, kind, rs_index, c, b2, data, value)
+                                if isCandidate(value, value_ref, (c*4+b1, c*4+b2)):
+                                    has_update |= computeAloneReport(M, journal, kind, rs_index, c, a1, data, value)
+                                    has_update |= computeAloneReport(M, journal, kind, rs_index, c, a2, data, value)
+                            else:
+                                if isCandidate2(value, value_ref, c*4+a1):
+                                    has_update |= computeAloneReport(M, journal, kind, rs_index, c, b1, data, value)
+                                if isCandidate2(value, value_ref, c*4+a2):
+                                    has_update |= computeAloneReport(M, journal, kind, rs_index, c, b2, data, value)
+                                if isCandidate2(value, value_ref, c*4+b1):
+                                    has_update |= computeAloneReport(M, journal, kind, rs_index, c, a1, data, value)
+                                if isCandidate2(value, value_ref, c*4+b2):
+                                    has_update |= computeAloneReport(M, journal, kind, rs_index, c, a2, data, value)
                 if has_update:
                     old_present = present
                     present = sum([max([sum([0 if v is None else 1 for v in mrsrow]) for mrsrow in mrow]) for mcol in M for mrow in mcol])
@@ -169,7 +204,11 @@ def computeAlone(wb, Mref, noprogress, doubleRS):
                         # should never happen
                         raise UnexpectedFailure("Lost a solution")
 
-                pbarIt.update(1)
+                if time.monotonic() - lastRecord > SCAN_RECORD_PERIOD:
+                    journal.record(kind + ".scan", 0, startValue)
+                    lastRecord = time.monotonic()
+
+                pbarIt.update(STEP1_BATCH)
 
     resM = []
     r_s = []
@@ -229,38 +268,43 @@ def readbuff(progress, buff, c, rindex, rs_index):
 
     return res
 
-def computeRunner(wb, value_ref, startValue, progress, buff, reportP, stopVal, doubleRS):
+def computeRunner(wb, value_ref, startValue, progress, buff, reportP, stopVal, doubleRS, scanP, rid):
+    # scanP[rid] is the number of inputs done by this runner
+    firstValue = startValue
     nb = 0
     reportNum = 256
     wb.newThread()
     while stopVal.value == 0:
-        data = startValue.to_bytes(16, 'big')
-        startValue += 1
-        value = wb.apply(data)
-        for c in range(4):
-            for rs_index, (a1, a2, b1, b2) in enumerate(RS):
-                if doubleRS:
-                    if isCandidate(value, value_ref, (c*4+a1, c*4+a2)):
-                        computeRunnerReport(progress, buff, rs_index, c, b1, data, value)
-                        computeRunnerReport(progress, buff, rs_index, c, b2, data, value)
-                    if isCandidate(value, value_ref, (c*4+b1, c*4+b2)):
-                        computeRunnerReport(progress, buff, rs_index, c, a1, data, value)
-                        computeRunnerReport(progress, buff, rs_index, c, a2, data, value)
-                else:
-                    if isCandidate2(value, value_ref, c*4+a1):
-                        computeRunnerReport(progress, buff, rs_index, c, b1, data, value)
-                    if isCandidate2(value, value_ref, c*4+a2):
-                        computeRunnerReport(progress, buff, rs_index, c, b2, data, value)
-                    if isCandidate2(value, value_ref, c*4+b1):
-                        computeRunnerReport(progress, buff, rs_index, c, a1, data, value)
-                    if isCandidate2(value, value_ref, c*4+b2):
-                        computeRunnerReport(progress, buff, rs_index, c, a2, data, value)
-        nb += 1
+        inputs = getBatchInputs(startValue, STEP1_BATCH)
+        startValue += STEP1_BATCH
+        values = wb.applyBatch(inputs)
+        for i in getBatchCandidates(values, value_ref, doubleRS):
+            data, value = inputs[i].tobytes(), values[i].tobytes()
+            for c in range(4):
+                for rs_index, (a1, a2, b1, b2) in enumerate(RS):
+                    if doubleRS:
+                        if isCandidate(value, value_ref, (c*4+a1, c*4+a2)):
+                            computeRunnerReport(progress, buff, rs_index, c, b1, data, value)
+                            computeRunnerReport(progress, buff, rs_index, c, b2, data, value)
+                        if isCandidate(value, value_ref, (c*4+b1, c*4+b2)):
+                            computeRunnerReport(progress, buff, rs_index, c, a1, data, value)
+                            computeRunnerReport(progress, buff, rs_index, c, a2, data, value)
+                    else:
+                        if isCandidate2(value, value_ref, c*4+a1):
+                            computeRunnerReport(progress, buff, rs_index, c, b1, data, value)
+                        if isCandidate2(value, value_ref, c*4+a2):
+                            computeRunnerReport(progress, buff, rs_index, c, b2, data, value)
+                        if isCandidate2(value, value_ref, c*4+b1):
+                            computeRunnerReport(progress, buff, rs_index, c, a1, data, value)
+                        if isCandidate2(value, value_ref, c*4+b2):
+                            computeRunnerReport(progress, buff, rs_index, c, a2, data, value)
+        nb += STEP1_BATCH
         if nb >= reportNum:
             l = reportP.get_lock()
             if l.acquire():
                 reportP.value += nb
                 l.release()
+                scanP[rid] = startValue - firstValue
                 nb = 0
             else:
                 reportNum += 16
@@ -270,12 +314,14 @@ def computeRunner(wb, value_ref, startValue, progress, buff, reportP, stopVal, d
         reportP.value += nb
 
 
-def computeMulti(wb, Mref, nprocess, noprogress, doubleRS):
+def computeMulti(wb, Mref, nprocess, noprogress, doubleRS, journal):
 
     reportP = mp.Value('Q', 0)
     stopVal = mp.Value('B', 0)
+    scanP = mp.Array('Q', nprocess)
     progress = mp.Array('B', 256 * 16 * len(RS))
     buff = mp.Array('B', 256 * 16 * len(RS) * 16)
+    kind = journalKind(doubleRS)
 
     value_ref = wb.apply(Mref)
     for c in range(4):
@@ -284,6 +330,18 @@ def computeMulti(wb, Mref, nprocess, noprogress, doubleRS):
             computeRunnerReport(progress, buff, rs_index, c, a2, Mref, value_ref)
             computeRunnerReport(progress, buff, rs_index, c, b1, Mref, value_ref)
             computeRunnerReport(progress, buff, rs_index, c, b2, Mref, value_ref)
+    known = progress[:]
+
+    for position, data in journal.get(kind).items():
+        progress[position] = 1
+        buff[position*16:(position+1)*16] = bytes.fromhex(data)
+        known[position] = 1
+
+    # each runner has a range of the inputs, restart from the last recorded
+    # value of the range
+    rangeStarts = [i * ((2**128) // nprocess) for i in range(nprocess)]
+    startValues = [journal.get(kind + ".scan").get(start, start) for start in rangeStarts]
+    lastRecord = time.monotonic()
 
     present = 0
     for i in range(16):
@@ -297,7 +355,7 @@ def computeMulti(wb, Mref, nprocess, noprogress, doubleRS):
 
             ps = []
             for i in range(nprocess):
-                ps.append( mp.Process(target=computeRunner, args=(wb, value_ref, i * ((2**128) // nprocess), progress, buff, reportP, stopVal, doubleRS)) )
+                ps.append( mp.Process(target=computeRunner, args=(wb, value_ref, startValues[i], progress, buff, reportP, stopVal, doubleRS, scanP, i)) )
                 ps[i].start()
 
             try:
@@ -318,6 +376,17 @@ def computeMulti(wb, Mref, nprocess, noprogress, doubleRS):
                     UnexpectedFailure.check(old_present <= present, "Lost a solution")
                     pbarFound.update(present - old_present)
 
+                    current = progress[:]
+                    for position in range(len(current)):
+                        if current[position] != known[position]:
+                            known[position] = 1
+                            journal.record(kind, position, bytes(buff[position*16:(position+1)*16]).hex())
+
+                    if time.monotonic() - lastRecord > SCAN_RECORD_PERIOD:
+                        for start, first, i in zip(rangeStarts, startValues, range(nprocess)):
+                            journal.record(kind + ".scan", start, first + scanP[i])
+                        lastRecord = time.monotonic()
+
             finally:
                 stopVal.value = 1
                 # close all process
@@ -402,11 +471,13 @@ def computeWithReverse(wb, Mref, noprogress):
 # Compute entry method #
 ########################
 
-def compute(wb, Mref, nprocess, noprogress, doubleRS):
+def compute(wb, Mref, nprocess, noprogress, doubleRS, journal=None):
+    if journal is None:
+        journal = Journal()
     if wb.hasReverse():
         return computeWithReverse(wb, Mref, noprogress)
     else:
         if nprocess == 0:
-            return computeAlone(wb, Mref, noprogress, doubleRS)
+            return computeAlone(wb, Mref, noprogress, doubleRS, journal)
         else:
-            return computeMulti(wb, Mref, nprocess, noprogress, doubleRS)
+            return computeMulti(wb, Mref, nprocess, noprogress, doubleRS, journal)
@@ -16,6 +16,7 @@
 from .AES import _AesShiftRow, _AesInvShiftRow
 from .Encoding import Encoding8, Encoding
 from .Exception import InvalidState, FaultPositionError, UnexpectedFailure
+from .Journal import Journal
 import multiprocessing as mp
 import tqdm
 
@@ -25,6 +26,24 @@ __all__ = ["compute"]
 # Shared implementation #
 #########################
 
+# Each (b, index) computed is recorded in the journal with the fault position
+# used for b, the S values and, for the index 0, the R values used by the
+# other indexes of b. After a restart, the recorded (b, index) are not
+# computed again.
+
+def recordS(journal, b, index, pos, Ri, Sb):
+    journal.record("step2", (b, index), [pos, Ri if index == 0 else None, bytes(Sb).hex()])
+
+def replayS(journal, SRes):
+    # return {b: (pos, R)} for the b whose index 0 is recorded
+    known = {}
+    for (b, index), (pos, Ri, Sb) in journal.get("step2").items():
+        for rval, xval in enumerate(bytes.fromhex(Sb)):
+            SRes[b][rval][index] = xval
+        if index == 0:
+            known[b] = (pos, Ri)
+    return known
+
 def getInjectionParam(wb, b, value, pos=0):
     # this should provide a good fault offset for the pos in [0, 1, 2, 3]
     # however, if this isn't good, we iterate on all values
@@ -69,8 +88,9 @@ def computeSRunner(wb, R, b, r_val, index, mval, pos):
     if not verifyDoubleValue(R, val, r, s, index):
         return (False, R, S, progress)
 
-    for fval in range(1, 256):
-        val = wb.applyFault(mval, [getInjectionParam(wb, b, fval, pos)])
+    fround, fbytes, _ = getInjectionParam(wb, b, 0, pos)
+    # a wrong position is detected with the first value, before the sweep
+    for val in wb.iterFaultSweep(mval, fround, fbytes, range(1, 256)):
         progress += 1
 
         if S[val[r]] != None:
@@ -88,11 +108,15 @@ def computeSRunner(wb, R, b, r_val, index, mval, pos):
 # Monothread implementation #
 #############################
 
-def computeSAlone(wb, M, r_s, noprogress):
+def computeSAlone(wb, M, r_s, noprogress, journal):
 
     SRes = [[[None for index in range(256)] for x in range(256)] for b in range(16)]
     R = [None for _ in range(16)]
     position = [None for _ in range(16)]
+    done = set(journal.get("step2"))
+    for b, (pos, Ri) in replayS(journal, SRes).items():
+        position[b] = pos
+        R[b] = Ri
 
     # The step 2 can use r_s to verify the fault injection position.
     # In order to detect a wrong position early, each position is used in a
@@ -102,7 +126,11 @@ def computeSAlone(wb, M, r_s, noprogress):
 
     with tqdm.tqdm(total=16 * 256 * 256, desc="Step2", unit='input', disable=noprogress) as pbar:
 
+        pbar.update(len(done) * 256)
+
         for b, (mi, r_val) in enumerate(zip(M, r_s)):
+            if (b, 0) in done:
+                continue
             goodPos = False
             for pos in range(16):
                 goodPos, Ri, Sb, progress = computeSRunner(wb, [None for _ in range(256)], b, r_val, 0, mi[0], pos)
@@ -118,6 +146,7 @@ def computeSAlone(wb, M, r_s, noprogress):
                             raise FaultPositionError(getInjectionParam(wb, 0, 0)[0])
 
                         SRes[b][rval][0] = xval
+                    recordS(journal, b, 0, pos, Ri, Sb)
                     break
 
             if not goodPos:
@@ -125,6 +154,8 @@ def computeSAlone(wb, M, r_s, noprogress):
 
         for index in range(1, 256):
             for b, (mi, r_val, pos) in enumerate(zip(M, r_s, position)):
+                if (b, index) in done:
+                    continue
                 goodPos, Ri, Sb, progress = computeSRunner(wb, R[b], b, r_val, index, mi[index], pos)
                 pbar.update(progress)
                 if not goodPos:
@@ -135,6 +166,7 @@ def computeSAlone(wb, M, r_s, noprogress):
                         raise FaultPositionError(getInjectionParam(wb, 0, 0)[0])
 
                     SRes[b][rval][index] = xval
+                recordS(journal, b, index, pos, Ri, Sb)
 
     UnexpectedFailure.check(
         all([x is not None for Sb in SRes for Sbr in Sb for x in Sbr]),
@@ -170,16 +202,37 @@ def computeSRunnerProxy(R, b, r_val, index, mval, pos):
 
     return result, b, index, pos, Ri, Sb, progress, 0
 
-def computeSMulti(wb, M, r_s, nprocess, noprogress):
+def computeSMulti(wb, M, r_s, nprocess, noprogress, journal):
     R = [None for _ in range(256)]
     SRes = [[[None for index in range(256)] for x in range(256)] for b in range(16)]
+    known = replayS(journal, SRes)
+    done = set(journal.get("step2"))
+
+    # try to mix the job
+    # we want to advance each column at the same time in order to detect
+    # early if a fault position isn't good
+    job_block = 16
 
     with tqdm.tqdm(total=16 * 256 * 256, desc="Step2", unit='input', disable=noprogress) as pbar:
+        pbar.update(len(done) * 256)
 
         with mp.Pool(processes=nprocess, initializer=init_localWB, initargs=[wb]) as pool:
             res = []
+
+            def schedule(b, index, pos, Ri):
+                # submit the indexes following index, up to the next block
+                for new_index in range(index + 1, min(256, index + job_block + 1)):
+                    if (b, new_index) not in done:
+                        res.append(pool.apply_async(computeSRunnerProxy,
+                            (Ri, b, r_s[b], new_index, M[b][new_index], pos)))
+                    elif new_index % job_block == 0:
+                        schedule(b, new_index, pos, Ri)
+
             for b in range(16):
-                res.append(pool.apply_async(computeSRunnerProxy, (R, b, r_s[b], 0, M[b][0], 0)))
+                if b in known:
+                    schedule(b, 0, *known[b])
+                else:
+                    res.append(pool.apply_async(computeSRunnerProxy, (R, b, r_s[b], 0, M[b][0], 0)))
 
             while len(res) > 0:
                 found = False
@@ -198,20 +251,15 @@ def computeSMulti(wb, M, r_s, nprocess, noprogress):
                 if not result:
                     raise FaultPositionError(getInjectionParam(wb, 0, 0)[0])
 
-                # try to mix the job
-                # we want to advance each column at the same time in order to detect
-                # early if a fault position isn't good
-                job_block = 16
-                if index % job_block == 0:
-                    for new_index in range(index + 1, min(256, index + job_block + 1)):
-                        res.append(pool.apply_async(computeSRunnerProxy,
-                            (Ri, b, r_s[b], new_index, M[b][new_index], pos)))
-
                 for rval, xval in enumerate(Sb):
                     if SRes[b][rval][index] is not None:
                         raise FaultPositionError(getInjectionParam(wb, 0, 0)[0])
 
                     SRes[b][rval][index] = xval
+                recordS(journal, b, index, pos, Ri, Sb)
+
+                if index % job_block == 0:
+                    schedule(b, index, pos, Ri)
 
 
     UnexpectedFailure.check(
@@ -247,13 +295,15 @@ def tolhuizen_algo(S_):
                     UnexpectedFailure.check(perm[m] == perm[k] ^ perm[i], "Fail Tolhuizen's Algorithm")
     return Encoding8(perm)
 
-def compute(wb, M, r_s, nprocess, noprogress):
+def compute(wb, M, r_s, nprocess, noprogress, journal=None):
+    if journal is None:
+        journal = Journal()
 
     wb.prepareFaultPosition(getInjectionParam(wb, 0, 0)[0])
 
     if nprocess == 0:
-        S = computeSAlone(wb, M, r_s, noprogress)
+        S = computeSAlone(wb, M, r_s, noprogress, journal)
     else:
-        S = computeSMulti(wb, M, r_s, nprocess, noprogress)
+        S = computeSMulti(wb, M, r_s, nprocess, noprogress, journal)
 
     return Encoding([tolhuizen_algo(Si) for Si in S])
@@ -14,15 +14,21 @@
 # -----------------------------------------------------------------------------
 
 from .Encoding import Encoding8, Encoding
-from .Utils import SageProcess
-from .MultTable import MultTable, InvTable
+from .Utils import getSageSession, prewarmSageSession
+from .GF256 import inv, div, mulArray, divArray
 from .Exception import FaultPositionError, UnexpectedFailure
+from .Journal import Journal
+import functools
 import json
+import multiprocessing as mp
+import numpy as np
 import os.path
 import subprocess
 import tqdm
 
-__all__ = ["compute"]
+__all__ = ["compute", "prewarm"]
+
+SAGE_RESOLVER = ("Step3_sage.py", ".Step3_sage", "ResolverStep3")
 
 def getFaultRound(wb):
     return wb.getRoundNumber() - (1 if wb.lastRoundHasMC else 2)
@@ -31,28 +37,19 @@ def getFaultRound(wb):
 # Step 3.1: First part of the algorithm 3 with fault injection #
 ################################################################
 
-def computeFaultCol(wb, gtilde_inv, mref, vref, fpos, pbar):
+def computeFaultCol(wb, gtilde_inv, mref, vref, fpos):
     Wc = []
     fround = getFaultRound(wb)
 
-    w1 = wb.applyFault(mref, fault=[(fround, fpos, 1)], outputF=[gtilde_inv])
-    pbar.update(1)
+    faults = wb.applyFaultSweep(mref, fround, fpos, range(1, 256), outputF=[gtilde_inv])
 
-    faultdiff = [0 if x == y else 1 for x, y in zip(vref, w1)]
+    faultdiff = [0 if x == y else 1 for x, y in zip(vref, faults[0])]
     FaultPositionError.check( sum(faultdiff) == 4, fround, fpos)
     col = faultdiff.index(1) // 4
-    FaultPositionError.check( faultdiff[col*4] == 1, fround, fpos)
-    FaultPositionError.check( faultdiff[col*4+1] == 1, fround, fpos)
-    FaultPositionError.check( faultdiff[col*4+2] == 1, fround, fpos)
-    FaultPositionError.check( faultdiff[col*4+3] == 1, fround, fpos)
 
     Wc.append(vref[4*col:4*col+4])
-    Wc.append(w1[4*col:4*col+4])
-
-    for fval in range(2, 256):
-        w = wb.applyFault(mref, fault=[(fround, fpos, fval)], outputF=[gtilde_inv])
-        pbar.update(1)
 
+    for w in faults:
         faultdiff = [0 if x == y else 1 for x, y in zip(vref, w)]
         FaultPositionError.check( sum(faultdiff) == 4, fround, fpos)
         FaultPositionError.check( faultdiff[col*4] == 1, fround, fpos)
@@ -62,9 +59,18 @@ def computeFaultCol(wb, gtilde_inv, mref, vref, fpos, pbar):
 
         Wc.append(w[4*col:4*col+4])
 
-    return col, Wc
+    return fpos, col, Wc
 
-def computeFault(wb, gtilde_inv, mref, noprogress):
+localWB = None
+def init_localWB(wb):
+    global localWB
+    wb.newThread()
+    localWB = wb
+
+def computeFaultColProxy(gtilde_inv, mref, vref, fpos):
+    return computeFaultCol(localWB, gtilde_inv, mref, vref, fpos)
+
+def computeFault(wb, gtilde_inv, mref, nprocess, noprogress, journal):
 
     wb.prepareFaultPosition(getFaultRound(wb), outputF=[gtilde_inv])
 
@@ -72,18 +78,39 @@ def computeFault(wb, gtilde_inv, mref, noprogress):
 
     W = [[] for i in range(4)]
     Fpos = [[] for i in range(4)]
-
-    with tqdm.tqdm(initial=1, total=1 + 255 * 16, desc="Step3.1", unit='input', disable=noprogress) as pbar:
-        for fpos in range(16):
-            col, Wc = computeFaultCol(wb, gtilde_inv, mref, vref, fpos, pbar)
-
-            UnexpectedFailure.check( 0 <= col and col < 4,
-                f"Invalid column number {col}")
-
-            FaultPositionError.check( len(W[col]) < 4, getFaultRound(wb), fpos)
-
-            W[col].append(Wc)
-            Fpos[col].append(fpos)
+    results = [None for fpos in range(16)]
+
+    # the faults of each position are recorded in the journal
+    for fpos, (col, Wc) in journal.get("step3").items():
+        results[fpos] = (fpos, col, [bytes.fromhex(w) for w in Wc])
+    todo = [fpos for fpos in range(16) if results[fpos] is None]
+
+    def record(fpos, col, Wc):
+        results[fpos] = (fpos, col, Wc)
+        journal.record("step3", fpos, [col, [bytes(w).hex() for w in Wc]])
+        pbar.update(255)
+
+    with tqdm.tqdm(initial=1 + 255 * (16 - len(todo)), total=1 + 255 * 16, desc="Step3.1",
+                   unit='input', disable=noprogress) as pbar:
+        if nprocess == 0:
+            for fpos in todo:
+                record(*computeFaultCol(wb, gtilde_inv, mref, vref, fpos))
+        else:
+            # each fault position is independent, the 16 positions are
+            # collected by the pool and sorted afterward
+            with mp.Pool(processes=nprocess, initializer=init_localWB, initargs=[wb]) as pool:
+                job = functools.partial(computeFaultColProxy, gtilde_inv, mref, vref)
+                for fpos, col, Wc in pool.imap_unordered(job, todo):
+                    record(fpos, col, Wc)
+
+    for fpos, col, Wc in results:
+        UnexpectedFailure.check( 0 <= col and col < 4,
+            f"Invalid column number {col}")
+
+        FaultPositionError.check( len(W[col]) < 4, getFaultRound(wb), fpos)
+
+        W[col].append(Wc)
+        Fpos[col].append(fpos)
 
     return W, Fpos
 
@@ -95,58 +122,64 @@ def computeGbar(wb, W, Fpos, noprogress, sageSubProc):
     Gbar = []
     associateCol = [[None for i in range(4)] for i in range(4)]
 
-    with tqdm.tqdm(total=16, desc="Step3.2", unit='input', disable=noprogress) as pbar:
-        with SageProcess("Step3_sage.py", ".Step3_sage", "ResolverStep3", sageSubProc) as sageP:
-            for b in range(16):
-                col = b // 4
-                p0 = b % 4
-                p1 = 2 * (p0 // 2) + ((p0+1) % 2)
+    # The 16 requests are independent, they are sent to Sage in one batch.
+    requests = []
+    requestPos = []
 
-                Gbari = None
+    for b in range(16):
+        col = b // 4
+        p0 = b % 4
+        p1 = 2 * (p0 // 2) + ((p0+1) % 2)
 
-                # The position can be the same for all rows
-                # however, in order to complete associateCol, we must hit each row at
-                # least one time. We use each row two times to validate the result
-                # for each row
-                FPos0, FPos1 = [(0, 1), (2, 3), (1, 3), (2, 0)][p0]
+        # The position can be the same for all rows
+        # however, in order to complete associateCol, we must hit each row at
+        # least one time. We use each row two times to validate the result
+        # for each row
+        FPos0, FPos1 = [(0, 1), (2, 3), (1, 3), (2, 0)][p0]
 
-                Fault0 = W[col][FPos0]
-                Fault1 = W[col][FPos1]
-                fposition = (Fpos[col][FPos0], Fpos[col][FPos1])
+        Fault0 = W[col][FPos0]
+        Fault1 = W[col][FPos1]
+        fposition = (Fpos[col][FPos0], Fpos[col][FPos1])
 
-                FaultPositionError.check( Fault0[0] == Fault1[0], getFaultRound(wb), fposition)
-                base = Fault0[0]
+        FaultPositionError.check( Fault0[0] == Fault1[0], getFaultRound(wb), fposition)
+        base = Fault0[0]
 
-                w01 = [None for _ in range(256)]
-                w10 = [None for _ in range(256)]
+        w01 = [None for _ in range(256)]
+        w10 = [None for _ in range(256)]
 
-                for f0, f1 in zip(Fault0, Fault1):
-                    FaultPositionError.check( w01[base[p0] ^ f0[p0]] is None, getFaultRound(wb), fposition)
-                    FaultPositionError.check( w10[base[p1] ^ f1[p1]] is None, getFaultRound(wb), fposition)
-                    w01[base[p0] ^ f0[p0]] = base[p1] ^ f0[p1]
-                    w10[base[p1] ^ f1[p1]] = base[p0] ^ f1[p0]
+        for f0, f1 in zip(Fault0, Fault1):
+            FaultPositionError.check( w01[base[p0] ^ f0[p0]] is None, getFaultRound(wb), fposition)
+            FaultPositionError.check( w10[base[p1] ^ f1[p1]] is None, getFaultRound(wb), fposition)
+            w01[base[p0] ^ f0[p0]] = base[p1] ^ f0[p1]
+            w10[base[p1] ^ f1[p1]] = base[p0] ^ f1[p0]
 
-                L01 = Encoding8(w10).combine(Encoding8(w01))
+        L01 = Encoding8(w10).combine(Encoding8(w01))
 
-                success, posFault, Gbari = sageP([L01[1<<x] for x in range(8)],
-                                                (p0, p1),
-                                                wb.isEncrypt())
-                FaultPositionError.check( success, getFaultRound(wb), fposition)
+        requests.append(([L01[1<<x] for x in range(8)], (p0, p1), wb.isEncrypt()))
+        requestPos.append((col, FPos0, FPos1, fposition))
 
-                if associateCol[col][FPos0] is None:
-                    FaultPositionError.check( posFault[0] not in associateCol[col], getFaultRound(wb), fposition)
-                    associateCol[col][FPos0] = posFault[0]
-                else:
-                    FaultPositionError.check( associateCol[col][FPos0] == posFault[0], getFaultRound(wb), fposition)
+    # the 16 requests are sent to Sage in a single batch
+    with tqdm.tqdm(total=1, desc="Step3.2", unit='batch', disable=noprogress) as pbar:
+        sageP = getSageSession(*SAGE_RESOLVER, sageSubProc)
+        results = sageP.batch(requests)
 
-                if associateCol[col][FPos1] is None:
-                    FaultPositionError.check( posFault[1] not in associateCol[col], getFaultRound(wb), fposition)
-                    associateCol[col][FPos1] = posFault[1]
-                else:
-                    FaultPositionError.check( associateCol[col][FPos1] == posFault[1], getFaultRound(wb), fposition)
+        for (success, posFault, Gbari), (col, FPos0, FPos1, fposition) in zip(results, requestPos):
+            FaultPositionError.check( success, getFaultRound(wb), fposition)
 
-                pbar.update(1)
-                Gbar.append(Encoding8(Gbari))
+            if associateCol[col][FPos0] is None:
+                FaultPositionError.check( posFault[0] not in associateCol[col], getFaultRound(wb), fposition)
+                associateCol[col][FPos0] = posFault[0]
+            else:
+                FaultPositionError.check( associateCol[col][FPos0] == posFault[0], getFaultRound(wb), fposition)
+
+            if associateCol[col][FPos1] is None:
+                FaultPositionError.check( posFault[1] not in associateCol[col], getFaultRound(wb), fposition)
+                associateCol[col][FPos1] = posFault[1]
+            else:
+                FaultPositionError.check( associateCol[col][FPos1] == posFault[1], getFaultRound(wb), fposition)
+
+            Gbar.append(Encoding8(Gbari))
+        pbar.update(1)
 
     UnexpectedFailure.check( all([x is not None for c in associateCol for x in c]),
                             "missing Column after Step 3.2")
@@ -171,38 +204,31 @@ def computeC(wb, W, Gbar_inv, associateCol, noprogress):
 
             col = b // 4
             # Wi is the fault of the first row for this column
-            Wi0 = W[col][associateCol[col].index(0)]
+            Wi0 = np.array([list(x) for x in W[col][associateCol[col].index(0)]], dtype=np.uint8)
 
             if wb.isEncrypt():
                 if b % 4 == 3:
-                    coef = MultTable[3][InvTable[2]]
+                    coef = div(3, 2)
                 else:
-                    coef = InvTable[2]
+                    coef = inv(2)
             else:
                 if b % 4 == 1:
-                    coef = MultTable[9][InvTable[14]]  # p9 * (p14 ** -1))
+                    coef = div(9, 14)
                 elif b % 4 == 2:
-                    coef = MultTable[13][InvTable[14]] # p13 * (p14 ** -1))
+                    coef = div(13, 14)
                 else:
-                    coef = MultTable[11][InvTable[14]] # p11 * (p14 ** -1))
-
-            ci = None
+                    coef = div(11, 14)
 
-            for p in range(256):
-                ti = Gbar_inv[b][Wi0[0][b % 4] ^ Wi0[p][b % 4]]
-                t0 = Gbar_inv[col*4][Wi0[0][0] ^ Wi0[p][0]]
+            # ci = t0 * coef / ti for each of the 256 faults with ti != 0
+            ti = Gbar_inv[b].encoded[Wi0[0, b % 4] ^ Wi0[:, b % 4]]
+            t0 = Gbar_inv[col*4].encoded[Wi0[0, 0] ^ Wi0[:, 0]]
+            ci = divArray(mulArray(t0, coef), ti)[ti != 0]
 
-                if ti == 0:
-                    pass
-                elif ci is None:
-                    ci = MultTable[InvTable[ti]][MultTable[t0][coef]]
-                else:
-                    UnexpectedFailure.check(ci == MultTable[InvTable[ti]][MultTable[t0][coef]],
-                        f"Step 3.3: Found a different value for C associated with byte {b}")
-
-            UnexpectedFailure.check( ci != None,
+            UnexpectedFailure.check( len(ci) != 0,
                 f"Step 3.3: Fail to compute a value for C associated with byte {b}")
-            C.append(ci)
+            UnexpectedFailure.check( (ci == ci[0]).all(),
+                f"Step 3.3: Found a different value for C associated with byte {b}")
+            C.append(int(ci[0]))
             pbar.update(1)
 
     return C
@@ -211,8 +237,14 @@ def computeC(wb, W, Gbar_inv, associateCol, noprogress):
 # Compute entry method #
 ########################
 
-def compute(wb, gtilde_inv, mref, noprogress, sageSubProc):
-    W, Fpos = computeFault(wb, gtilde_inv, mref, noprogress)
+def prewarm(sageSubProc):
+    # Start the resolver of Step 3.2 in the background
+    prewarmSageSession(*SAGE_RESOLVER, sageSubProc)
+
+def compute(wb, gtilde_inv, mref, nprocess, noprogress, sageSubProc, journal=None):
+    if journal is None:
+        journal = Journal()
+    W, Fpos = computeFault(wb, gtilde_inv, mref, nprocess, noprogress, journal)
     Gbar, associateCol = computeGbar(wb, W, Fpos, noprogress, sageSubProc)
     Gbar_inv = Gbar.getInverseEncoding()
 
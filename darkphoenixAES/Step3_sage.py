@@ -159,16 +159,39 @@ class ResolverStep3:
 
 if __name__ == "__main__":
     import json
+    import struct
     import sys
     resolver = ResolverStep3()
 
     if len(sys.argv) > 1:
         print(json.dumps(resolver(*json.loads(sys.argv[1]))), flush=True)
     else:
+        # length-prefixed frames, see Utils.SageProcess
+        header = struct.Struct(">I")
+        stdin = sys.stdin.buffer
+        stdout = sys.stdout.buffer
+
+        def readExact(size):
+            data = b""
+            while len(data) < size:
+                chunk = stdin.read(size - len(data))
+                if not chunk:
+                    return None
+                data += chunk
+            return data
+
         while True:
-            data = sys.stdin.readline()
-            if data == "stop\n":
+            data = readExact(header.size)
+            if data is None:
                 break
-            res = resolver(*json.loads(data))
-            print(json.dumps(res), flush=True)
-
+            size, = header.unpack(data)
+            if size == 0:
+                break
+            body = readExact(size)
+            if body is None:
+                break
+            requests = json.loads(body.decode())
+            res = json.dumps([resolver(*args) for args in requests],
+                             separators=(',', ':')).encode()
+            stdout.write(header.pack(len(res)) + res)
+            stdout.flush()
@@ -15,8 +15,10 @@
 
 from .AES import _AesShiftRow, _AesInvShiftRow, ShiftRow, InvShiftRow
 from .Encoding import Encoding8, Encoding
-from .MeetITM import MeetITM
+from .MeetITM import MeetITMPool
+from .ColumnSolver import ColumnSolver
 from .Exception import FaultPositionError, UnexpectedFailure, WhiteBoxError
+from .Journal import Journal
 import json
 import os.path
 import subprocess
@@ -35,125 +37,106 @@ def getInjectionParam(wb, col, value, pos=0):
     else:
         return [fround, _AesInvShiftRow[fpos], value]
 
-def computeFault(wb, mref, vref, perm, col, pbar, alpha):
+def computeFault(wb, mref, vref, perm, col, pbar, fvalues, positions=range(16)):
+    # return (pos, faults), faults[0] is the reference output of the column and
+    # faults[i] the output with the fault value fvalues[i-1]
     UnexpectedFailure.check( 0 <= col and col < 4, "Invalid column number")
 
-    for pos in range(16):
+    for pos in positions:
         Wc = [vref[4*col:4*col+4]]
 
         changePos = False
 
-        for fvalue in range(1, alpha+1):
-            fault = getInjectionParam(wb, col, fvalue, pos)
-
-            w1 = wb.applyFault(mref, fault=[fault],
-                    outputF=[perm], reverseMC=True)
+        fround, fbytes, _ = getInjectionParam(wb, col, 0, pos)
+        # a wrong position is detected with the first value, before the sweep
+        outputs = wb.iterFaultSweep(mref, fround, fbytes, fvalues,
+                outputF=[perm], reverseMC=True)
 
+        for fvalue, w1 in zip(fvalues, outputs):
             faultdiff = [0 if x == y else 1 for x, y in zip(vref, w1)]
-            FaultPositionError.check( sum(faultdiff) == 4, fault[0], fault[1])
+            FaultPositionError.check( sum(faultdiff) == 4, fround, fbytes)
             fcol = faultdiff.index(1) // 4
 
             if fcol != col:
-                WhiteBoxError.check( fvalue == 1,
+                WhiteBoxError.check( fvalue == fvalues[0],
                     "A fault injection position has changed when applying a different fault value")
                 changePos = True
                 break
 
-            FaultPositionError.check( faultdiff[col*4] == 1, fault[0], fault[1])
-            FaultPositionError.check( faultdiff[col*4+1] == 1, fault[0], fault[1])
-            FaultPositionError.check( faultdiff[col*4+2] == 1, fault[0], fault[1])
-            FaultPositionError.check( faultdiff[col*4+3] == 1, fault[0], fault[1])
+            FaultPositionError.check( faultdiff[col*4] == 1, fround, fbytes)
+            FaultPositionError.check( faultdiff[col*4+1] == 1, fround, fbytes)
+            FaultPositionError.check( faultdiff[col*4+2] == 1, fround, fbytes)
+            FaultPositionError.check( faultdiff[col*4+3] == 1, fround, fbytes)
 
             Wc.append(w1[4*col:4*col+4])
             pbar.update(1)
 
         if not changePos:
-            return Wc
+            return pos, Wc
 
-    raise FaultPositionError(fault[0])
+    raise FaultPositionError(fround)
 
-def compute(wb, gtilde_inv, Gbar_inv, C, mref, noprogress):
+def compute(wb, gtilde_inv, Gbar_inv, C, mref, nprocess, noprogress, journal=None):
     retry = 10
-    alpha = 16
-    midalpha = 4
+    if journal is None:
+        journal = Journal()
+    # the columns solved before a restart
+    solved = dict(journal.get("step4"))
     Cperm = Encoding.fromAffinParam(C, None)
-    resolver = MeetITM()
     permAes = Cperm.combine(Gbar_inv).combine(gtilde_inv)
 
     wb.prepareFaultPosition(getInjectionParam(wb, 0, 0)[0], outputF=[permAes], reverseMC=True)
 
-    with tqdm.tqdm(total=4*alpha+1, desc="Step4", unit='input', disable=noprogress) as pbar:
+    with tqdm.tqdm(total=1, desc="Step4", unit='input', disable=noprogress) as pbar, \
+            MeetITMPool(nprocess) as resolver:
 
         vref = wb.apply(mref, outputF=[permAes], reverseMC=True)
         pbar.update(1)
 
-        # do column 0 first.
-        # when we get the lambda,beta for the column 0, only the beta of column 1, 2
-        # and 3 should be computed
-
-        success = False
-        for r in range(retry):
-            if r == 0:
-                Fault0 = computeFault(wb, mref, vref, permAes, 0, pbar, alpha)
-            else:
-                pbar.total += 1 + alpha
-                mref2 = wb.getRandomInput(r)
-                vref2 = wb.apply(mref2, outputF=[permAes], reverseMC=True)
-                pbar.update(1)
-                Fault0 = computeFault(wb, mref2, vref2, permAes, 0, pbar, alpha)
-            success, lambdaCol0, betaCol0 = resolver(0, Fault0, midalpha, wb.isEncrypt())
-            if success:
-                break
-        UnexpectedFailure.check(success,
-            f"Fail to extract lambda and beta for column 0 after {retry} retries")
-
-        success = False
-        for r in range(retry):
-            if r == 0:
-                Fault1 = computeFault(wb, mref, vref, permAes, 1, pbar, alpha)
-            else:
-                pbar.total += 1 + alpha
-                mref2 = wb.getRandomInput(r)
-                vref2 = wb.apply(mref2, outputF=[permAes], reverseMC=True)
-                pbar.update(1)
-                Fault1 = computeFault(wb, mref2, vref2, permAes, 1, pbar, alpha)
-            success, lambdaCol1, betaCol1 = resolver(1, Fault1, midalpha, wb.isEncrypt(), lambdaCol0)
-            if success:
-                break
-        UnexpectedFailure.check(success,
-            f"Fail to extract beta for column 1 after {retry} retries")
-
-        success = False
-        for r in range(retry):
-            if r == 0:
-                Fault2 = computeFault(wb, mref, vref, permAes, 2, pbar, alpha)
-            else:
-                pbar.total += 1 + alpha
-                mref2 = wb.getRandomInput(r)
-                vref2 = wb.apply(mref2, outputF=[permAes], reverseMC=True)
-                pbar.update(1)
-                Fault2 = computeFault(wb, mref2, vref2, permAes, 2, pbar, alpha)
-            success, lambdaCol2, betaCol2 = resolver(2, Fault2, midalpha, wb.isEncrypt(), lambdaCol0)
-            if success:
-                break
-        UnexpectedFailure.check(success,
-            f"Fail to extract beta for column 2 after {retry} retries")
-
-        success = False
-        for r in range(retry):
-            if r == 0:
-                Fault3 = computeFault(wb, mref, vref, permAes, 3, pbar, alpha)
-            else:
-                pbar.total += 1 + alpha
+        # r -> (input, reference output), shared by the columns
+        refs = {0: (mref, vref)}
+
+        def collect(col, r, alpha, prev=None):
+            if r not in refs:
+                pbar.total += 1
                 mref2 = wb.getRandomInput(r)
-                vref2 = wb.apply(mref2, outputF=[permAes], reverseMC=True)
+                refs[r] = (mref2, wb.apply(mref2, outputF=[permAes], reverseMC=True))
                 pbar.update(1)
-                Fault3 = computeFault(wb, mref2, vref2, permAes, 3, pbar, alpha)
-            success, lambdaCol3, betaCol3 = resolver(3, Fault3, midalpha, wb.isEncrypt(), lambdaCol0)
-            if success:
-                break
-        UnexpectedFailure.check(success,
-            f"Fail to extract beta for column 3 after {retry} retries")
+            mref2, vref2 = refs[r]
+            if prev is None:
+                pbar.total += alpha
+                return computeFault(wb, mref2, vref2, permAes, col, pbar, range(1, alpha+1))
+
+            # more fault values at the position already found
+            pos, Wc = prev
+            pbar.total += alpha + 1 - len(Wc)
+            _, Wc2 = computeFault(wb, mref2, vref2, permAes, col, pbar,
+                                  range(len(Wc), alpha+1), [pos])
+            return pos, Wc + Wc2[1:]
+
+        # do column 0 first.
+        # when we get the lambda,beta for the column 0, only the beta of column 1, 2
+        # and 3 should be computed. These three columns are solved together.
+
+        def onSolved(col, lambdaCol, betaCol):
+            journal.record("step4", col, [lambdaCol, betaCol])
+
+        solver = ColumnSolver(resolver, collect, wb.isEncrypt(), retry, onSolved=onSolved)
+        cols = [col for col in [1, 2, 3] if col not in solved]
+
+        if 0 in solved:
+            lambdaCol0, betaCol0 = solved[0]
+        else:
+            lambdaCol0, betaCol0 = solver.solve([0], None,
+                    "Fail to extract lambda and beta for column {col} after {retry} retries",
+                    nextCols=cols)[0]
+
+        res = dict(solved)
+        res.update(solver.solve(cols, lambdaCol0,
+                "Fail to extract beta for column {col} after {retry} retries"))
+        lambdaCol1, betaCol1 = res[1]
+        lambdaCol2, betaCol2 = res[2]
+        lambdaCol3, betaCol3 = res[3]
 
     if wb.isEncrypt():
         lambdaCol = list(ShiftRow(lambdaCol0 + lambdaCol1 + lambdaCol2 + lambdaCol3))
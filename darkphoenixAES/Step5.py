@@ -16,8 +16,10 @@
 from .AES import _AesShiftRow, _AesInvShiftRow, ShiftRow, InvShiftRow
 from .AES import _AesInvSBox, _AesSBox, MC, InvMC, InvSBox, SBox
 from .Encoding import Encoding8, Encoding
-from .MeetITM import MeetITM
+from .MeetITM import MeetITMPool
+from .ColumnSolver import ColumnSolver, FailureRate
 from .Exception import FaultPositionError, UnexpectedFailure, WhiteBoxError
+from .Journal import Journal
 import json
 import os.path
 import subprocess
@@ -36,40 +38,42 @@ def getInjectionParam(wb, col, value, roundN, pos=0):
     else:
         return [fround, _AesInvShiftRow[fpos], value]
 
-def computeFault(wb, mref, vref, perm, roundN, col, pbar, alpha):
+def computeFault(wb, mref, vref, perm, roundN, col, pbar, fvalues, positions=range(16)):
+    # return (pos, faults), faults[0] is the reference output of the column and
+    # faults[i] the output with the fault value fvalues[i-1]
     UnexpectedFailure.check( 0 <= col and col < 4, "Invalid column number")
 
-    for pos in range(16):
+    for pos in positions:
         Wc = [vref[4*col:4*col+4]]
 
         changePos = False
 
-        for fvalue in range(1, alpha+1):
-            fault = getInjectionParam(wb, col, fvalue, roundN, pos)
-
-            w1 = wb.applyFault(mref, fault=[fault],
-                    outputF=perm, reverseMC=True)
+        fround, fbytes, _ = getInjectionParam(wb, col, 0, roundN, pos)
+        # a wrong position is detected with the first value, before the sweep
+        outputs = wb.iterFaultSweep(mref, fround, fbytes, fvalues,
+                outputF=perm, reverseMC=True)
 
+        for fvalue, w1 in zip(fvalues, outputs):
             faultdiff = [0 if x == y else 1 for x, y in zip(vref, w1)]
-            FaultPositionError.check( sum(faultdiff) == 4, fault[0], fault[1])
+            FaultPositionError.check( sum(faultdiff) == 4, fround, fbytes)
             fcol = faultdiff.index(1) // 4
 
             if fcol != col:
-                WhiteBoxError.check( fvalue == 1,
+                WhiteBoxError.check( fvalue == fvalues[0],
                     "A fault injection position has changed when applying a different fault value")
                 changePos = True
                 break
 
-            FaultPositionError.check( faultdiff[col*4] == 1, fault[0], fault[1])
-            FaultPositionError.check( faultdiff[col*4+1] == 1, fault[0], fault[1])
-            FaultPositionError.check( faultdiff[col*4+2] == 1, fault[0], fault[1])
-            FaultPositionError.check( faultdiff[col*4+3] == 1, fault[0], fault[1])
+            FaultPositionError.check( faultdiff[col*4] == 1, fround, fbytes)
+            FaultPositionError.check( faultdiff[col*4+1] == 1, fround, fbytes)
+            FaultPositionError.check( faultdiff[col*4+2] == 1, fround, fbytes)
+            FaultPositionError.check( faultdiff[col*4+3] == 1, fround, fbytes)
 
             Wc.append(w1[4*col:4*col+4])
             pbar.update(1)
 
         if not changePos:
-            return Wc
+            return pos, Wc
 
     raise FaultPositionError(getInjectionParam(wb, col, 1, roundN)[0])
 
@@ -99,11 +103,14 @@ def createPerm(gtilde_inv, Gbar_inv, C, LambdaRound, BetaRound, KeyPart, encrypt
 
     return perms
 
-def compute(wb, gtilde_inv, Gbar_inv, C, LambdaS4, BetaS4, mref, noprogress, allRound=True):
+def compute(wb, gtilde_inv, Gbar_inv, C, LambdaS4, BetaS4, mref, nprocess, noprogress, allRound=True, journal=None):
     retry = 10
-    alpha = 16
-    midalpha = 4
     Keypart = []
+    if journal is None:
+        journal = Journal()
+    # the round keys and the columns solved before a restart
+    keys = dict(journal.get("step5.key"))
+    solved = dict(journal.get("step5"))
 
     if allRound:
         nround = getInjectionParam(wb, 0, 0, 0)[0]
@@ -115,91 +122,68 @@ def compute(wb, gtilde_inv, Gbar_inv, C, LambdaS4, BetaS4, mref, noprogress, all
         nround = 2
 
     permsAes = createPerm(gtilde_inv, Gbar_inv, C, LambdaS4, BetaS4, [], wb.isEncrypt())
-    resolver = MeetITM()
-    for roundN in range(nround):
-
-        r = getInjectionParam(wb, 0, 0, roundN)[0]
-
-        wb.prepareFaultPosition(r, outputF=permsAes, reverseMC=True)
-
-        with tqdm.tqdm(total=4*alpha+1, desc=f"Step5 r{r+1}",
-                       unit='input', disable=noprogress) as pbar:
-
-            vref = wb.apply(mref, outputF=permsAes, reverseMC=True)
-            pbar.update(1)
-
-            success = False
-            for r in range(retry):
-                if r == 0:
-                    Fault0 = computeFault(wb, mref, vref, permsAes, roundN, 0, pbar, alpha)
-                else:
-                    pbar.total += 1 + alpha
-                    mref2 = wb.getRandomInput(r)
-                    vref2 = wb.apply(mref2, outputF=permsAes, reverseMC=True)
-                    pbar.update(1)
-                    Fault0 = computeFault(wb, mref2, vref2, permsAes, roundN, 0, pbar, alpha)
-                success, _, betaCol0 = resolver(0, Fault0, midalpha, wb.isEncrypt(), [1, 1, 1, 1])
-                if success:
-                    break
-            UnexpectedFailure.check(success,
-                f"Fail to extract beta for column 0 after {retry} retries")
-
-            success = False
-            for r in range(retry):
-                if r == 0:
-                    Fault1 = computeFault(wb, mref, vref, permsAes, roundN, 1, pbar, alpha)
-                else:
-                    pbar.total += 1 + alpha
-                    mref2 = wb.getRandomInput(r)
-                    vref2 = wb.apply(mref2, outputF=permsAes, reverseMC=True)
-                    pbar.update(1)
-                    Fault1 = computeFault(wb, mref2, vref2, permsAes, roundN, 1, pbar, alpha)
-                success, _, betaCol1 = resolver(1, Fault1, midalpha, wb.isEncrypt(), [1, 1, 1, 1])
-                if success:
-                    break
-            UnexpectedFailure.check(success,
-                f"Fail to extract beta for column 1 after {retry} retries")
-
-            success = False
-            for r in range(retry):
-                if r == 0:
-                    Fault2 = computeFault(wb, mref, vref, permsAes, roundN, 2, pbar, alpha)
-                else:
-                    pbar.total += 1 + alpha
-                    mref2 = wb.getRandomInput(r)
-                    vref2 = wb.apply(mref2, outputF=permsAes, reverseMC=True)
-                    pbar.update(1)
-                    Fault2 = computeFault(wb, mref2, vref2, permsAes, roundN, 2, pbar, alpha)
-                success, _, betaCol2 = resolver(2, Fault2, midalpha, wb.isEncrypt(), [1, 1, 1, 1])
-                if success:
-                    break
-            UnexpectedFailure.check(success,
-                f"Fail to extract beta for column 2 after {retry} retries")
-
-            success = False
-            for r in range(retry):
-                if r == 0:
-                    Fault3 = computeFault(wb, mref, vref, permsAes, roundN, 3, pbar, alpha)
-                else:
-                    pbar.total += 1 + alpha
-                    mref2 = wb.getRandomInput(r)
-                    vref2 = wb.apply(mref2, outputF=permsAes, reverseMC=True)
-                    pbar.update(1)
-                    Fault3 = computeFault(wb, mref2, vref2, permsAes, roundN, 3, pbar, alpha)
-                success, _, betaCol3 = resolver(3, Fault3, midalpha, wb.isEncrypt(), [1, 1, 1, 1])
-                if success:
-                    break
-            UnexpectedFailure.check(success,
-                f"Fail to extract beta for column 3 after {retry} retries")
-
-        betaRound = betaCol0 + betaCol1 + betaCol2 + betaCol3
-        if wb.isEncrypt():
-            rkey = list(MC(ShiftRow(betaRound)))
-        else:
-            rkey = list(InvShiftRow(betaRound))
-
-        permsAes.append(createKeyPartRound(rkey, wb.isEncrypt()))
-        Keypart.append(rkey)
+    # the failure rate of the previous rounds drives the speculation
+    failureRate = FailureRate()
+    with MeetITMPool(nprocess) as resolver:
+        for roundN in range(nround):
+
+            if roundN in keys:
+                permsAes.append(createKeyPartRound(keys[roundN], wb.isEncrypt()))
+                Keypart.append(keys[roundN])
+                continue
+
+            r = getInjectionParam(wb, 0, 0, roundN)[0]
+
+            wb.prepareFaultPosition(r, outputF=permsAes, reverseMC=True)
+
+            with tqdm.tqdm(total=1, desc=f"Step5 r{r+1}",
+                           unit='input', disable=noprogress) as pbar:
+
+                vref = wb.apply(mref, outputF=permsAes, reverseMC=True)
+                pbar.update(1)
+
+                # r -> (input, reference output), shared by the columns
+                refs = {0: (mref, vref)}
+
+                def collect(col, r, alpha, prev=None):
+                    if r not in refs:
+                        pbar.total += 1
+                        mref2 = wb.getRandomInput(r)
+                        refs[r] = (mref2, wb.apply(mref2, outputF=permsAes, reverseMC=True))
+                        pbar.update(1)
+                    mref2, vref2 = refs[r]
+                    if prev is None:
+                        pbar.total += alpha
+                        return computeFault(wb, mref2, vref2, permsAes, roundN, col, pbar, range(1, alpha+1))
+
+                    # more fault values at the position already found
+                    pos, Wc = prev
+                    pbar.total += alpha + 1 - len(Wc)
+                    _, Wc2 = computeFault(wb, mref2, vref2, permsAes, roundN, col, pbar,
+                                          range(len(Wc), alpha+1), [pos])
+                    return pos, Wc + Wc2[1:]
+
+                def onSolved(col, lambdaCol, betaCol):
+                    journal.record("step5", (roundN, col), [lambdaCol, betaCol])
+
+                # the four columns are independent
+                solver = ColumnSolver(resolver, collect, wb.isEncrypt(), retry, failureRate, onSolved)
+                res = {col: solved[(roundN, col)] for col in range(4) if (roundN, col) in solved}
+                res.update(solver.solve([col for col in range(4) if col not in res], [1, 1, 1, 1],
+                        "Fail to extract beta for column {col} after {retry} retries"))
+                betaCol0 = res[0][1]
+                betaCol1 = res[1][1]
+                betaCol2 = res[2][1]
+                betaCol3 = res[3][1]
+
+            betaRound = betaCol0 + betaCol1 + betaCol2 + betaCol3
+            if wb.isEncrypt():
+                rkey = list(MC(ShiftRow(betaRound)))
+            else:
+                rkey = list(InvShiftRow(betaRound))
+
+            permsAes.append(createKeyPartRound(rkey, wb.isEncrypt()))
+            Keypart.append(rkey)
+            journal.record("step5.key", roundN, rkey)
 
     return Keypart
-
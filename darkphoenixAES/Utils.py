@@ -14,15 +14,52 @@
 # -----------------------------------------------------------------------------
 
 import subprocess
+import atexit
+import struct
 import json
 import os
 import importlib
 from .Exception import UnexpectedFailure
 
+# The communication with the Sage subprocess uses length-prefixed frames: a
+# 4-byte big-endian length followed by a compact JSON payload. A request holds
+# the list of arguments of every call of the batch, the answer holds the list
+# of results in the same order. An empty frame stops the subprocess.
+
+FRAME_HEADER = struct.Struct(">I")
+
+def writeFrame(stream, payload):
+    stream.write(FRAME_HEADER.pack(len(payload)) + payload)
+    stream.flush()
+
+def readExact(stream, size):
+    data = b""
+    while len(data) < size:
+        chunk = stream.read(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+def readFrame(stream):
+    header = readExact(stream, FRAME_HEADER.size)
+    if header is None:
+        return None
+    size, = FRAME_HEADER.unpack(header)
+    return readExact(stream, size)
+
+def encodePayload(obj):
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def decodePayload(payload):
+    return json.loads(payload.decode())
+
 class SageProcess:
 
     def __init__(self, script, module, classname, useSubproc=False):
         self.useSubproc = useSubproc
+        self.pid = os.getpid()
+        self.isClose = False
         if self.useSubproc:
             pInput, sndPipe = os.pipe()
             rcvPipe, pOutput = os.pipe()
@@ -30,9 +67,8 @@ class SageProcess:
             self.p = subprocess.Popen(['sage', scriptPath], stdin=pInput, stdout=pOutput)
             os.close(pInput)
             os.close(pOutput)
-            self.sndPipe = os.fdopen(sndPipe, mode='w')
-            self.rcvPipe = os.fdopen(rcvPipe, mode='r')
-            self.isClose = False
+            self.sndPipe = os.fdopen(sndPipe, mode='wb')
+            self.rcvPipe = os.fdopen(rcvPipe, mode='rb')
         else:
             if module[0] == '.':
                 package = os.path.basename(os.path.dirname(__file__))
@@ -41,29 +77,48 @@ class SageProcess:
                 mod = importlib.import_module(module)
             self.target = getattr(mod, classname)()
 
+    def isAlive(self):
+        if self.isClose:
+            return False
+        if self.useSubproc:
+            return self.p.poll() is None
+        return True
 
     def __call__(self, *args):
-        if self.useSubproc:
-            UnexpectedFailure.check(not self.isClose, "Cannot call SageProcess after __exit__")
-            UnexpectedFailure.check(self.p.poll() is None, "SageProcess has been terminated")
-            self.sndPipe.write(json.dumps(args) + '\n')
-            self.sndPipe.flush()
-            resline = self.rcvPipe.readline()
-            while resline == "":
-                UnexpectedFailure.check(self.p.poll() is None, "SageProcess has been terminated")
-                resline = self.rcvPipe.readline()
-            return json.loads(resline)
-        else:
-            return self.target(*args)
+        return self.batch([args])[0]
+
+    def batch(self, argsList):
+        # Perform all the calls of argsList with a single exchange with the
+        # subprocess and return the list of results
+        UnexpectedFailure.check(not self.isClose, "Cannot call SageProcess after __exit__")
+        if not self.useSubproc:
+            return [self.target(*args) for args in argsList]
+
+        UnexpectedFailure.check(self.p.poll() is None, "SageProcess has been terminated")
+        try:
+            writeFrame(self.sndPipe, encodePayload([list(args) for args in argsList]))
+            payload = readFrame(self.rcvPipe)
+        except BaseException:
+            # the stream may be desynchronized, the process cannot be reused
+            self.close()
+            raise
+        if payload is None:
+            self.close()
+            raise UnexpectedFailure("SageProcess has been terminated")
+        res = decodePayload(payload)
+        UnexpectedFailure.check(len(res) == len(argsList),
+            f"SageProcess returns {len(res)} results for {len(argsList)} requests")
+        return res
 
     def close(self):
         if not self.useSubproc or self.isClose:
+            self.isClose = True
             return
         self.isClose = True
 
         try:
             if self.p.poll() is None:
-                self.sndPipe.write("stop\n")
+                writeFrame(self.sndPipe, b"")
             self.sndPipe.close()
         except BrokenPipeError:
             pass
@@ -73,12 +128,55 @@ class SageProcess:
         except BrokenPipeError:
             pass
 
-        self.p.wait(1)
+        try:
+            self.p.wait(1)
+        except subprocess.TimeoutExpired:
+            pass
         if self.p.poll() is None:
             self.p.kill()
+            self.p.wait()
 
     def __enter__(self):
         return self
 
     def __exit__(self, type, value, tb):
         self.close()
+
+#######################
+# Persistent sessions #
+#######################
+
+# Starting Sage and initializing a resolver takes many seconds. The sessions
+# are kept for the life of the process and reused by every attack (and every
+# retry of Attack.runAuto). A session is never shared with a forked process.
+
+_sessions = {}
+
+def getSageSession(script, module, classname, useSubproc=False):
+    key = (script, module, classname, useSubproc)
+    session = _sessions.get(key)
+    if session is None or session.pid != os.getpid() or not session.isAlive():
+        session = SageProcess(script, module, classname, useSubproc)
+        _sessions[key] = session
+    return session
+
+def prewarmSageSession(script, module, classname, useSubproc=False):
+    # Start the session ahead of its first use. The Sage subprocess starts and
+    # initializes the resolver while the caller continues its work. The
+    # library mode is not prewarmed: loading Sage in the main process would
+    # slow down the current computation and be copied in every forked worker.
+    if not useSubproc:
+        return None
+    try:
+        return getSageSession(script, module, classname, useSubproc)
+    except OSError:
+        # the error will be raised again when the session is really needed
+        return None
+
+def closeSageSessions():
+    for session in _sessions.values():
+        if session.pid == os.getpid():
+            session.close()
+    _sessions.clear()
+
+atexit.register(closeSageSessions)
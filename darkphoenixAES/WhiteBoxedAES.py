@@ -13,6 +13,11 @@
 # See LICENSE.txt for the text of the Apache license.
 # -----------------------------------------------------------------------------
 
+from collections import OrderedDict
+import numpy as np
+
+# number of (input, round) whose state is kept by WhiteBoxedAES.applyFault
+PREFIX_CACHE_SIZE = 64
 
 class WhiteBoxedAES:
     # This class is the interface with the whitebox (encrypt or decrypt).
@@ -55,6 +60,33 @@ class WhiteBoxedAES:
         # return  16 bytes of the decrypted/encrypted data
         raise NotImplementedError("WhiteBoxedAES.applyReverse must be implemented for a given whitebox")
 
+    def applyBatch(self, data):
+        # [optionnal]
+        # Apply the whitebox on many buffers
+        # [param] data  an array (N, 16) of uint8, one input by row
+        # return  an array (N, 16) of uint8, the result of apply for each row
+        # [note] This function is already implemented with apply. The
+        #   bruteforce of Step1 calls it on consecutive inputs, you can override
+        #   it if the whitebox can process many blocks at once (ECB mode, see
+        #   WhiteBoxedAESMultiBlock).
+        out = b"".join([bytes(self.apply(x.tobytes())) for x in data])
+        return np.frombuffer(out, dtype=np.uint8).reshape(-1, 16)
+
+    def applyFaultBatch(self, data, faults):
+        # [optionnal]
+        # Apply the whitebox on many buffers, with faults
+        # [param] data    an array (N, 16) of uint8, one input by row
+        # [param] faults  a list of N lists of faults (see applyFault), one
+        #   for each row
+        # return  an array (N, 16) of uint8, the result of applyFault for each
+        #   row with its faults
+        # [note] This function is already implemented with applyFault. The
+        #   default applyFaultSweep calls it on the same input repeated with
+        #   each fault value, you can override it if the whitebox can process
+        #   many blocks at once (ECB mode, see WhiteBoxedAESMultiBlock).
+        out = b"".join([bytes(self.applyFault(x.tobytes(), f)) for x, f in zip(data, faults)])
+        return np.frombuffer(out, dtype=np.uint8).reshape(-1, 16)
+
     def applyRound(self, data, roundN):
         # Apply a round of the whitebox on a buffer
         # [param] data    a buffer of 16 bytes (type bytes)
@@ -83,18 +115,134 @@ class WhiteBoxedAES:
         #   round. There is not consequence if the state is mixed as long as
         #   each value of fbytes targets a different byte.
 
-        state = data[:]
-        for roundN in range(self.getRoundNumber()):
+        # [note] The state before the first faulted round is cached for the
+        #   last inputs (see getPrefixState): the rounds before the fault are
+        #   only applied once by input and fault round. applyRound must not
+        #   depend on anything else than its arguments.
+
+        for fround, fbytes, fxorval in faults:
+            assert 0 <= fbytes and fbytes <= 15, "Invalid fbytes value"
+            assert 1 <= fxorval and fxorval <= 255, "Invalid fxorval value"
+
+        # a fault outside of the rounds is never injected
+        firstRound = max(0, min([fround for fround, _, _ in faults] + [self.getRoundNumber()]))
+        state = self.getPrefixState(bytes(data), firstRound)
+        for roundN in range(firstRound, self.getRoundNumber()):
             for fround, fbytes, fxorval in faults:
                 if fround != roundN:
                     continue
-                assert 0 <= fbytes and fbytes <= 15, "Invalid fbytes value"
-                assert 1 <= fxorval and fxorval <= 255, "Invalid fxorval value"
                 state = list(state)
                 state[fbytes] ^= fxorval
             state = self.applyRound(bytes(state), roundN)
         return bytes(state)
 
+    def getPrefixState(self, data, roundN):
+        # return the state before the round roundN, i.e. data after the rounds
+        # 0 to roundN - 1. The result is kept in a LRU cache of
+        # PREFIX_CACHE_SIZE entries.
+        cache = self.__dict__.setdefault("_prefixCache", OrderedDict())
+        key = (data, roundN)
+        state = cache.get(key)
+        if state is not None:
+            cache.move_to_end(key)
+            return state
+
+        state = data
+        for r in range(roundN):
+            state = self.applyRound(bytes(state), r)
+        state = bytes(state)
+
+        cache[key] = state
+        if len(cache) > PREFIX_CACHE_SIZE:
+            cache.popitem(last=False)
+        return state
+
+    def applyFaultSweep(self, data, fround, fbytes, values):
+        # [optionnal]
+        # Apply the whitebox on a buffer once for each fault value of a
+        # position
+        # [param] data    a buffer of 16 bytes (type bytes)
+        # [param] fround  the round to apply the fault (same as applyFault)
+        # [param] fbytes  the position of the byte to fault (same as applyFault)
+        # [param] values  a list of fault values (between 1 and 255)
+        # return  a list with, for each value v of values, the 16 bytes of
+        #   applyFault(data, [(fround, fbytes, v)])
+        # [note] This function is already implemented with applyFaultBatch if
+        #   it is overridden, then with applyPrefix and applySuffix if
+        #   available, otherwise with applyFault. You can override it if the
+        #   whitebox can compute the faults of a position at once (native loop
+        #   over the values after a single prefix, ...).
+        if type(self).applyFaultBatch is not WhiteBoxedAES.applyFaultBatch:
+            # all the values in one batch, on the same input
+            out = self.applyFaultBatch(np.tile(np.frombuffer(bytes(data), dtype=np.uint8), (len(values), 1)),
+                                       [[(fround, fbytes, v)] for v in values])
+            return [x.tobytes() for x in np.asarray(out, dtype=np.uint8).reshape(-1, 16)]
+        if self.hasSnapshot():
+            snapshot = self.applyPrefix(data, fround)
+            try:
+                return [self.applySuffix(snapshot, [(fround, fbytes, v)]) for v in values]
+            finally:
+                self.releaseSnapshot(snapshot)
+        return [self.applyFault(data, [(fround, fbytes, v)]) for v in values]
+
+    def hasSnapshot(self):
+        # [optionnal]
+        # Are the methods applyPrefix and applySuffix implemented?
+        return False
+
+    def applyPrefix(self, data, fround):
+        # [optionnal]
+        # Apply the whitebox on a buffer until the round fround and return a
+        # snapshot of the execution, before any fault of the round fround can
+        # be injected. The snapshot is opaque for the attack (the state of an
+        # emulator, a process stopped at this point, ...).
+        # [param] data    a buffer of 16 bytes (type bytes)
+        # [param] fround  the round of the faults that will be applied on the
+        #   snapshot
+        # return  a snapshot for applySuffix
+        #
+        # [note] The attack applies the 255 fault values of a position on the
+        #   same input. With a snapshot, the rounds before the fault are only
+        #   executed once for all of them.
+        # [note] A snapshot is only used with the current fault positions: the
+        #   attack takes a new snapshot after changeFaultPosition or
+        #   prepareFaultPosition.
+        raise NotImplementedError("WhiteBoxedAES.applyPrefix must be implemented if hasSnapshot returns True")
+
+    def applySuffix(self, snapshot, faults):
+        # [optionnal]
+        # Resume a snapshot returned by applyPrefix and inject the faults.
+        # [param] snapshot  a snapshot returned by applyPrefix
+        # [param] faults    a list of faults (same as applyFault), with a round
+        #   greater or equal to the fround of applyPrefix
+        # return  16 bytes of the faulted encrypted data, the same result as
+        #   applyFault(data, faults)
+        #
+        # [note] The same snapshot is resumed many times with different faults,
+        #   applySuffix must not modify it.
+        raise NotImplementedError("WhiteBoxedAES.applySuffix must be implemented if hasSnapshot returns True")
+
+    def releaseSnapshot(self, snapshot):
+        # [optionnal]
+        # The snapshot won't be used anymore, its resources can be freed.
+        pass
+
+    def getFaultPosition(self, fround, fbytes):
+        # [optionnal]
+        # Only for WhiteBoxedAESDynamic and WhiteBoxedAESAuto, used by
+        # WhiteBoxedAESPool to copy the fault positions of an instance to the
+        # other ones.
+        # [param] (fround, fbytes)  the parameter of the fault
+        # return  the position currently associated with (fround, fbytes), in
+        #   any form accepted by setFaultPosition
+        raise NotImplementedError("WhiteBoxedAES.getFaultPosition is not implemented")
+
+    def setFaultPosition(self, fround, fbytes, position):
+        # [optionnal]
+        # Associate a position returned by getFaultPosition (of another
+        # instance of the same whitebox) with (fround, fbytes).
+        raise NotImplementedError("WhiteBoxedAES.setFaultPosition is not implemented")
+
 class WhiteBoxedAESDynamic(WhiteBoxedAES):
     # This class is the interface with the whitebox (encrypt or decrypt).
     # This class should be used as a base class for the whitebox interface if
@@ -14,38 +14,104 @@
 # -----------------------------------------------------------------------------
 
 from .AES import InvShiftRow, ShiftRow, xor, _AesShiftRow, _AesInvShiftRow
-from .AES import MC, InvMC
+from .AES import _MC, _invMC
+from .GF256 import npMultTable
 from .Exception import InvalidArgument, WhiteBoxError, FaultPositionError, UnexpectedFailure
 from .WhiteBoxedAES import WhiteBoxedAESDynamic, WhiteBoxedAESAuto
 from .FaultPositionValidator import FaultPositionValidator
 from collections.abc import Iterable
+from contextlib import contextmanager
+import numpy as np
 import random
-import tqdm
+
+# The inverse of the last rounds is compiled into table lookups over a batch of
+# states (array (N, 16)):
+# - a ShiftRow is only a reordering of the bytes, it is merged with the lookup
+#   of the next stage,
+# - an encoding followed by a MixColumns (or the inverse) is merged into a
+#   T-table: for each byte position p, T[p][x] is the contribution of x to the
+#   output column of p (4 bytes packed in an uint32),
+# - the last encoding without MixColumns is a simple 256-entry table by byte.
+
+_npShiftRow = np.array(_AesShiftRow, dtype=np.intp)
+_npInvShiftRow = np.array(_AesInvShiftRow, dtype=np.intp)
+_npIdentity = np.arange(16, dtype=np.intp)
+
+def _compileTTable(table, matrix):
+    # T[p][x] = sum_j matrix[j][p % 4] * table[p][x] << (8 * j)
+    table = np.array(table, dtype=np.intp)
+    T = np.zeros((16, 256), dtype=np.uint32)
+    for p in range(16):
+        for j in range(4):
+            T[p] |= npMultTable[matrix[j][p % 4]][table[p]].astype(np.uint32) << np.uint32(8 * j)
+    return T
+
+# number of compiled WhiteBoxedReverseRound kept by WhiteBoxedAESProxy
+REVERSE_ROUND_CACHE_SIZE = 8
 
 class WhiteBoxedReverseRound:
 
     def __init__(self, encrypt, revertLastShift=True, outputF=None, reverseMC=False):
         self.encrypt = encrypt
         self.revertLastShift = revertLastShift
-        self.outputF = outputF
+        # copy the list, the caller may append new encodings to it
+        self.outputF = None if outputF is None else list(outputF)
         self.reverseMC = reverseMC
+        self.compile()
+
+    def compile(self):
+        # [(perm, table, isTTable)], perm is the reordering of the input bytes
+        self.stages = []
+        shift = _npInvShiftRow if self.encrypt else _npShiftRow
+        perm = shift if self.revertLastShift else _npIdentity
+        matrix = _invMC if self.encrypt else _MC
 
-    def __call__(self, data):
-        if self.revertLastShift:
-            if self.encrypt:
-                data = InvShiftRow(data)
-            else:
-                data = ShiftRow(data)
         if self.outputF is not None:
-            for num, perm in enumerate(self.outputF):
-                data = perm.encode(data)
+            for num, enc in enumerate(self.outputF):
                 if self.reverseMC or num < len(self.outputF) - 1:
-                    if self.encrypt:
-                        data = InvShiftRow(InvMC(data))
-                    else:
-                        data = ShiftRow(MC(data))
+                    self.stages.append((perm, _compileTTable(enc.table, matrix), True))
+                    perm = shift
+                else:
+                    self.stages.append((perm, enc.table, False))
+                    perm = _npIdentity
+        # the reordering after the last stage
+        self.finalPerm = perm
+
+        # the same tables as lists, faster than numpy for a single state
+        self.stagesOne = [(perm.tolist(), table.tolist(), isTTable)
+                          for perm, table, isTTable in self.stages]
+        self.finalPermOne = self.finalPerm.tolist()
+
+    def batch(self, data):
+        # [param] data  array (N, 16) of uint8, or a list of 16 bytes blocks
+        # return  array (N, 16) of uint8
+        data = np.asarray(data if isinstance(data, np.ndarray) else
+                          np.frombuffer(b"".join(data), dtype=np.uint8).reshape(-1, 16),
+                          dtype=np.uint8)
+        for perm, table, isTTable in self.stages:
+            data = data[:, perm]
+            if isTTable:
+                cols = table[_npIdentity, data].reshape(-1, 4, 4)
+                cols = cols[:, :, 0] ^ cols[:, :, 1] ^ cols[:, :, 2] ^ cols[:, :, 3]
+                data = np.ascontiguousarray(cols, dtype='<u4').view(np.uint8).reshape(-1, 16)
+            else:
+                data = table[_npIdentity, data]
+        if self.finalPerm is not _npIdentity:
+            data = data[:, self.finalPerm]
         return data
 
+    def __call__(self, data):
+        for perm, table, isTTable in self.stagesOne:
+            data = [data[i] for i in perm]
+            if isTTable:
+                data = b"".join([
+                    (table[p][data[p]] ^ table[p+1][data[p+1]] ^
+                     table[p+2][data[p+2]] ^ table[p+3][data[p+3]]).to_bytes(4, 'little')
+                    for p in range(0, 16, 4)])
+            else:
+                data = [t[x] for t, x in zip(table, data)]
+        return bytes([data[i] for i in self.finalPermOne])
+
 class WhiteBoxedAESProxy:
 
     def __init__(self, realWB, noprogress):
@@ -53,10 +119,20 @@ class WhiteBoxedAESProxy:
         self.enc = self.realWB.isEncrypt()
         self.roundNumber = self.realWB.getRoundNumber()
         self.useReverse = self.realWB.hasReverse()
+        self.useSnapshot = (hasattr(self.realWB, "hasSnapshot") and callable(self.realWB.hasSnapshot)
+                            and self.realWB.hasSnapshot())
+        self.useSweep = hasattr(self.realWB, "applyFaultSweep") and callable(self.realWB.applyFaultSweep)
+        self.useBatch = hasattr(self.realWB, "applyBatch") and callable(self.realWB.applyBatch)
         self.lastRoundHasMC = getattr(self.realWB, "lastRoundHasMC", None)
         self.random_input = []
         self.noprogress = noprogress
 
+        # compiled WhiteBoxedReverseRound, see getReverseRound
+        self.reverseRounds = {}
+
+        # (data, faults) -> raw output of the whitebox, see Prefetch.py
+        self.rawFaults = {}
+
         # auto mode variable
         self.autoAvailablePosition = {}
         self.lastFaultPosition = None
@@ -86,21 +162,130 @@ class WhiteBoxedAESProxy:
         out = self.realWB.applyReverse(data)
         return out
 
+    def getReverseRound(self, revertLastShift=True, outputF=None, reverseMC=False):
+        # The compilation is done once for the encodings of a step. The
+        # encodings are identified by their id, the WhiteBoxedReverseRound
+        # keeps a reference on them so an id cannot be reused while cached.
+        key = (revertLastShift, reverseMC,
+               None if outputF is None else tuple(id(e) for e in outputF))
+        reverseRound = self.reverseRounds.get(key)
+        if reverseRound is None:
+            if len(self.reverseRounds) >= REVERSE_ROUND_CACHE_SIZE:
+                self.reverseRounds.pop(next(iter(self.reverseRounds)))
+            reverseRound = WhiteBoxedReverseRound(self.enc,
+                                                  revertLastShift=revertLastShift,
+                                                  outputF=outputF,
+                                                  reverseMC=reverseMC)
+            self.reverseRounds[key] = reverseRound
+        return reverseRound
+
     def apply(self, data, revertLastShift=True, outputF=None, reverseMC=False):
         out = self.realWB.apply(data)
-        return WhiteBoxedReverseRound(self.enc,
-                                      revertLastShift=revertLastShift,
-                                      outputF=outputF,
-                                      reverseMC=reverseMC)(out)
+        return self.getReverseRound(revertLastShift, outputF, reverseMC)(out)
+
+    def applyBatch(self, data, revertLastShift=True, outputF=None, reverseMC=False):
+        # [param] data  array (N, 16) of uint8
+        # return  array (N, 16) of uint8, the output of apply for each row
+        if self.useBatch:
+            raw = np.asarray(self.realWB.applyBatch(data), dtype=np.uint8).reshape(-1, 16)
+        else:
+            raw = [bytes(self.realWB.apply(x.tobytes())) for x in data]
+        WhiteBoxError.check( len(raw) == len(data),
+            f"applyBatch returns {len(raw)} outputs for {len(data)} inputs")
+        return self.getReverseRound(revertLastShift, outputF, reverseMC).batch(raw)
 
     def applyFault(self, data, fault, revertLastShift=True, outputF=None, reverseMC=False):
+        return self.applySuffix((data, None), fault, revertLastShift, outputF, reverseMC)
+
+    @contextmanager
+    def prefix(self, data, fround):
+        # Snapshot of data before the round fround, for applySuffix. The
+        # snapshot of the whitebox is only taken if it implements applyPrefix,
+        # otherwise applySuffix runs applyFault.
+        #
+        #   with wb.prefix(data, fround) as snapshot:
+        #       for fval in range(1, 256):
+        #           out = wb.applySuffix(snapshot, [(fround, fbytes, fval)])
+        if not self.useSnapshot:
+            yield (data, None)
+            return
+        realSnapshot = self.realWB.applyPrefix(data, fround)
+        try:
+            yield (data, realSnapshot)
+        finally:
+            self.realWB.releaseSnapshot(realSnapshot)
+
+    def applySuffix(self, snapshot, fault, revertLastShift=True, outputF=None, reverseMC=False):
+        data, realSnapshot = snapshot
         for fround, _, _ in fault:
             self.lastFaultPosition = fround
-        out = self.realWB.applyFault(data, fault)
-        return WhiteBoxedReverseRound(self.enc,
-                                      revertLastShift=revertLastShift,
-                                      outputF=outputF,
-                                      reverseMC=reverseMC)(out)
+        out = None
+        if len(self.rawFaults) != 0:
+            out = self.rawFaults.get((data, tuple(tuple(f) for f in fault)))
+        if out is None:
+            if realSnapshot is None:
+                out = self.realWB.applyFault(data, fault)
+            else:
+                out = self.realWB.applySuffix(realSnapshot, fault)
+        return self.getReverseRound(revertLastShift, outputF, reverseMC)(out)
+
+    def applyFaultSweep(self, data, fround, fbytes, values, revertLastShift=True, outputF=None, reverseMC=False):
+        # return the list of the outputs of data with the fault
+        # (fround, fbytes, value) for each value of values
+        raw = self.applyFaultSweepRaw(data, fround, fbytes, values)
+        out = self.getReverseRound(revertLastShift, outputF, reverseMC).batch(raw)
+        return [x.tobytes() for x in out]
+
+    def iterFaultSweep(self, data, fround, fbytes, values, revertLastShift=True, outputF=None, reverseMC=False):
+        # same outputs as applyFaultSweep, but the first value is applied alone:
+        # the sweep of the other values only runs if the caller asks for the
+        # next output, after the first one has validated the position
+        values = list(values)
+        if len(values) == 0:
+            return
+        yield self.applyFault(data, [(fround, fbytes, values[0])], revertLastShift, outputF, reverseMC)
+        if len(values) > 1:
+            yield from self.applyFaultSweep(data, fround, fbytes, values[1:], revertLastShift, outputF, reverseMC)
+
+    def applyFaultSweepRaw(self, data, fround, fbytes, values):
+        self.lastFaultPosition = fround
+        values = list(values)
+        outputs = [None for _ in values]
+        if len(self.rawFaults) != 0:
+            outputs = [self.rawFaults.get((data, ((fround, fbytes, v),))) for v in values]
+        missing = [i for i, out in enumerate(outputs) if out is None]
+        if len(missing) == 0:
+            return outputs
+
+        missingValues = [values[i] for i in missing]
+        if self.useSweep:
+            res = self.realWB.applyFaultSweep(data, fround, fbytes, missingValues)
+        else:
+            # the realWB doesn't inherit WhiteBoxedAES
+            with self.prefix(data, fround) as (_, realSnapshot):
+                if realSnapshot is None:
+                    res = [self.realWB.applyFault(data, [(fround, fbytes, v)]) for v in missingValues]
+                else:
+                    res = [self.realWB.applySuffix(realSnapshot, [(fround, fbytes, v)]) for v in missingValues]
+
+        WhiteBoxError.check( len(res) == len(missingValues),
+            f"applyFaultSweep returns {len(res)} outputs for {len(missingValues)} values")
+        for i, out in zip(missing, res):
+            outputs[i] = bytes(out)
+        return outputs
+
+    def hasStaticFaultPosition(self):
+        # the fault positions don't depend on prepareFaultPosition, the raw
+        # outputs can be collected before the step that uses them
+        return not isinstance(self.realWB, WhiteBoxedAESDynamic) and not self.isAuto()
+
+    def addRawFaults(self, data, faults, outputs):
+        # [param] faults   a list of faults, each one applied alone on data
+        # [param] outputs  the output of realWB.applyFault for each fault
+        UnexpectedFailure.check( self.hasStaticFaultPosition(),
+            "Cannot store the faulted outputs of a whitebox with dynamic fault positions")
+        for fault, out in zip(faults, outputs):
+            self.rawFaults[(data, (tuple(fault),))] = out
 
     def getRandomInput(self, n=0):
         # allows the whitebox to choose mref and the retry input for step4 and
@@ -144,16 +329,13 @@ class WhiteBoxedAESProxy:
             self.lastRoundHasMC = True
 
     def prepareFaultPosition(self, fround, revertLastShift=True, outputF=None, reverseMC=False):
-        baseReverse = WhiteBoxedReverseRound(self.enc, revertLastShift=revertLastShift,
-                                             outputF=outputF, reverseMC=reverseMC)
+        baseReverse = self.getReverseRound(revertLastShift, outputF, reverseMC)
         if outputF is None:
             baseReverse2 = None
         elif len(outputF) >= 1 and reverseMC:
-            baseReverse2 = WhiteBoxedReverseRound(self.enc, revertLastShift=revertLastShift,
-                                                  outputF=outputF, reverseMC=False)
+            baseReverse2 = self.getReverseRound(revertLastShift, outputF, False)
         elif len(outputF) > 1:
-            baseReverse2 = WhiteBoxedReverseRound(self.enc, revertLastShift=revertLastShift,
-                                                  outputF=outputF[:-1], reverseMC=reverseMC)
+            baseReverse2 = self.getReverseRound(revertLastShift, outputF[:-1], reverseMC)
         else:
             baseReverse2 = None
 
@@ -182,6 +364,8 @@ class WhiteBoxedAESProxy:
         currentValidation = 0
         alreadyKnow = sum([1 for x in self.autoAvailablePosition[fround] if x])
 
+        import tqdm
+
         with tqdm.tqdm(desc=f"Position tested for round {fround}", disable=self.noprogress,
                        position=1, unit='pos') as pbarIt:
             with tqdm.tqdm(desc="WhiteBox iteration", unit='it', disable=self.noprogress, position=0) as pbarWbIt:
@@ -191,7 +375,8 @@ class WhiteBoxedAESProxy:
                 while firstLoop or currentValidation < self.validatePositionNumber:
                     firstLoop = False
                     committedPos = 0
-                    helper = FaultPositionValidator(self.realWB, fround, baseReverse, baseReverse2, pbarWbIt)
+                    helper = FaultPositionValidator(self.realWB, fround, baseReverse, baseReverse2, pbarWbIt,
+                                                    self.applyFaultSweepRaw)
 
                     # 1. commit the existing valid position
                     for fbytes in range(16):
@@ -16,14 +16,32 @@
 import sys
 from .test.test_AES import test_AES
 from .test.test_Encoding import test_Encoding
-from .test.test_WhiteBoxedAESProxy import test_WhiteBoxedAESProxy
+from .test.test_WhiteBoxedAESProxy import test_WhiteBoxedAESProxy, test_WhiteBoxedReverseRound, \
+    test_WhiteBoxedAESApplyFault, test_WhiteBoxedAESSnapshot
 from .test.test_Attack import test_Attack
+from .test.test_Import import test_Import
+from .test.test_Checkpoint import test_Checkpoint
+from .test.test_ForkServer import test_ForkServer
+from .test.test_SharedLibrary import test_SharedLibrary
+from .test.test_MultiBlock import test_MultiBlock
+from .test.test_Pool import test_Pool
+from .test.test_Step1 import test_Step1
 
 
 def test():
+    test_Import()
     test_AES()
     test_Encoding()
     test_WhiteBoxedAESProxy()
+    test_WhiteBoxedReverseRound()
+    test_WhiteBoxedAESApplyFault()
+    test_WhiteBoxedAESSnapshot()
+    test_Checkpoint()
+    test_ForkServer()
+    test_SharedLibrary()
+    test_MultiBlock()
+    test_Pool()
+    test_Step1()
     test_Attack()
 
 if len(sys.argv) > 1 and '--selftest' in sys.argv:
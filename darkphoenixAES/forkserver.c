@@ -0,0 +1,183 @@
+// -----------------------------------------------------------------------------
+// Copyright (C) Quarkslab. See README.md for details.
+//
+// This program is free software: you can redistribute it and/or modify
+// it under the terms of the Apache License as published by
+// the Apache Software Foundation, either version 2.0 of the License.
+//
+// This program is distributed in the hope that it will be useful,
+// but WITHOUT ANY WARRANTY; without even the implied warranty of
+// MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+// See LICENSE.txt for the text of the Apache license.
+// -----------------------------------------------------------------------------
+
+// Forkserver loaded with LD_PRELOAD in the target by ForkServer.py.
+//
+// The constructor runs once the target is loaded and relocated, before main.
+// It answers the requests of the attack: for each request, the process forks,
+// the child applies the memory patches (the fault), receives the input and
+// continues to main. The parent reports the pid and the exit status of the
+// child.
+//
+// DPHX_FORKSERVER="<control fd>,<status fd>" enables the forkserver, the target
+// runs normally without it.
+//
+// status fd:  hello (uint32 FORKSERVER_HELLO), then for each request the pid
+//             (int32) and the wait status (int32) of the child
+// control fd: for each request
+//             header  argIndex (uint32), inputLen (uint32), patchCount (uint32)
+//             input   inputLen bytes, written in argv[argIndex] or sent on the
+//                     stdin of the child if argIndex is 0
+//             patches patchCount * (offset uint64, count uint32, stride uint32,
+//                     value uint8, 7 bytes padding): the count bytes at
+//                     base + offset + i * stride are xored with value. base is
+//                     the load address of the executable (0 if not PIE).
+
+#define _GNU_SOURCE
+#include <link.h>
+#include <stdint.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/wait.h>
+#include <unistd.h>
+
+#define FORKSERVER_HELLO 0x58485044u
+
+struct header {
+    uint32_t argIndex;
+    uint32_t inputLen;
+    uint32_t patchCount;
+};
+
+struct patch {
+    uint64_t offset;
+    uint32_t count;
+    uint32_t stride;
+    uint8_t value;
+    uint8_t padding[7];
+};
+
+static int readAll(int fd, void *buf, size_t len) {
+    char *p = buf;
+    while (len > 0) {
+        ssize_t n = read(fd, p, len);
+        if (n <= 0)
+            return -1;
+        p += n;
+        len -= n;
+    }
+    return 0;
+}
+
+static int writeAll(int fd, const void *buf, size_t len) {
+    const char *p = buf;
+    while (len > 0) {
+        ssize_t n = write(fd, p, len);
+        if (n <= 0)
+            return -1;
+        p += n;
+        len -= n;
+    }
+    return 0;
+}
+
+static int firstObject(struct dl_phdr_info *info, size_t size, void *data) {
+    // the first object is the executable
+    *(uintptr_t *) data = info->dlpi_addr;
+    return 1;
+}
+
+static void applyPatch(uintptr_t base, const struct patch *p) {
+    long pageSize = sysconf(_SC_PAGESIZE);
+    uintptr_t begin, end;
+    uint32_t i;
+
+    if (p->count == 0)
+        return;
+    begin = base + p->offset;
+    end = begin + (uintptr_t) (p->count - 1) * p->stride + 1;
+    begin &= ~(uintptr_t) (pageSize - 1);
+    // the patch may target the code or a read-only table
+    if (mprotect((void *) begin, end - begin, PROT_READ | PROT_WRITE | PROT_EXEC) != 0 &&
+            mprotect((void *) begin, end - begin, PROT_READ | PROT_WRITE) != 0)
+        _exit(127);
+
+    for (i = 0; i < p->count; i++)
+        *(volatile uint8_t *) (base + p->offset + (uintptr_t) i * p->stride) ^= p->value;
+}
+
+static void setInput(char **argv, uint32_t argIndex, const char *input, uint32_t inputLen) {
+    int fds[2];
+
+    if (argIndex != 0) {
+        memcpy(argv[argIndex], input, inputLen);
+        return;
+    }
+    // the input is smaller than the buffer of a pipe
+    if (pipe(fds) != 0 || writeAll(fds[1], input, inputLen) != 0)
+        _exit(127);
+    close(fds[1]);
+    dup2(fds[0], 0);
+    close(fds[0]);
+}
+
+__attribute__((constructor))
+static void forkserver(int argc, char **argv, char **envp) {
+    const char *env = getenv("DPHX_FORKSERVER");
+    int controlFd, statusFd;
+    uint32_t hello = FORKSERVER_HELLO;
+    uintptr_t base = 0;
+
+    if (env == NULL || sscanf(env, "%d,%d", &controlFd, &statusFd) != 2)
+        return;
+    unsetenv("DPHX_FORKSERVER");
+    dl_iterate_phdr(firstObject, &base);
+
+    if (writeAll(statusFd, &hello, sizeof(hello)) != 0)
+        return;
+
+    for (;;) {
+        struct header header;
+        struct patch *patches;
+        char *input;
+        int32_t pid, status;
+        uint32_t i;
+
+        if (readAll(controlFd, &header, sizeof(header)) != 0)
+            _exit(0);
+        input = malloc(header.inputLen + 1);
+        patches = malloc(sizeof(struct patch) * header.patchCount + 1);
+        if (input == NULL || patches == NULL ||
+                readAll(controlFd, input, header.inputLen) != 0 ||
+                readAll(controlFd, patches, sizeof(struct patch) * header.patchCount) != 0)
+            _exit(1);
+        if (header.argIndex >= (uint32_t) argc)
+            _exit(1);
+
+        pid = fork();
+        if (pid < 0)
+            _exit(1);
+
+        if (pid == 0) {
+            close(controlFd);
+            close(statusFd);
+            for (i = 0; i < header.patchCount; i++)
+                applyPatch(base, &patches[i]);
+            setInput(argv, header.argIndex, input, header.inputLen);
+            free(input);
+            free(patches);
+            return;
+        }
+
+        free(input);
+        free(patches);
+        if (writeAll(statusFd, &pid, sizeof(pid)) != 0)
+            _exit(1);
+        if (waitpid(pid, &status, 0) < 0)
+            _exit(1);
+        if (writeAll(statusFd, &status, sizeof(status)) != 0)
+            _exit(1);
+    }
+}
@@ -43,6 +43,15 @@ class WhiteBoxedAESAutoTest(WhiteBoxedAESTest, WhiteBoxedAESAuto):
     def removeFaultPosition(self, fround, fbytes):
         self.faultPosition.pop((fround, fbytes), None)
 
+    def getFaultPosition(self, fround, fbytes):
+        return self.faultPosition.get((fround, fbytes))
+
+    def setFaultPosition(self, fround, fbytes, position):
+        if position is None:
+            self.faultPosition.pop((fround, fbytes), None)
+        else:
+            self.faultPosition[(fround, fbytes)] = list(position)
+
     def _get_random_position(self):
         fround = random.randrange(self.getRoundNumber())
         fbytes = random.randrange(16)
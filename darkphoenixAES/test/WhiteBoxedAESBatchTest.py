@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+from ..AES import toBatch
+from .AESEncoded import AESEncoded
+from .WhiteBoxedAESTest import WhiteBoxedAESTest
+from .WhiteBoxedAESAutoTest import WhiteBoxedAESAutoTest
+import numpy as np
+import random
+
+# Simulated encoded AES whitebox computed with numpy on batches of states.
+# It has the same encodings and round permutations as WhiteBoxedAESTest with
+# the same AESEncoded, and gives the same results. It is used to benchmark the
+# attack itself: most of the time should be spent outside of the whitebox.
+# The methods on a single state are the ones of WhiteBoxedAESTest, numpy is
+# slower for one state.
+#
+# It overrides the batch methods of WhiteBoxedAES (applyBatch, applyFaultBatch)
+# and adds applyReverseBatch.
+
+class WhiteBoxedAESBatchTest(WhiteBoxedAESTest):
+
+    def __init__(self, aesEncoded, enc=True, useReverse=True, fast=True):
+        super().__init__(aesEncoded, enc=enc, useReverse=useReverse, fast=fast)
+
+        roundNumber = self.aesEncoded.getRoundNumber()
+        # position of the byte fbytes of the whitebox round roundN in the
+        # encoded AES state
+        self.position = np.zeros((roundNumber, 16), dtype=np.intp)
+        for roundN in range(roundNumber):
+            if self.enc:
+                if roundN != 0:
+                    self.position[roundN] = self.aesEncoded.roundPerm[roundN-1]
+                else:
+                    self.position[roundN] = np.arange(16)
+            else:
+                AESroundN = roundNumber - 1 - roundN
+                if AESroundN + 1 != roundNumber:
+                    self.position[roundN] = self.aesEncoded.reverseRoundPerm[AESroundN]
+                else:
+                    self.position[roundN] = np.arange(16)
+
+    def _encrypt(self, state, masks):
+        state = self.aesEncoded.encoding[0].decodeBatch(state)
+        for roundN in range(self.getRoundNumber()):
+            if roundN in masks:
+                encoding = self.aesEncoded.encoding[roundN]
+                state = encoding.decodeBatch(encoding.encodeBatch(state) ^ masks[roundN])
+            state = self.aesEncoded.encrypt_round_batch(state, roundN)
+        return self.aesEncoded.encoding[self.getRoundNumber()].encodeBatch(state)
+
+    def _decrypt(self, state, masks):
+        state = self.aesEncoded.encoding[self.getRoundNumber()].decodeBatch(state)
+        for roundN in range(self.getRoundNumber()):
+            AESroundN = self.getRoundNumber() - 1 - roundN
+            if roundN in masks:
+                encoding = self.aesEncoded.encoding[AESroundN+1]
+                state = encoding.decodeBatch(encoding.encodeBatch(state) ^ masks[roundN])
+            state = self.aesEncoded.decrypt_round_batch(state, AESroundN)
+        return self.aesEncoded.encoding[0].encodeBatch(state)
+
+    def _faultMasks(self, n, faults):
+        # faults: a list of n lists of faults
+        # return: {roundN: array (n, 16)} the xor to apply on the encoded state
+        masks = {}
+        for index, stateFaults in enumerate(faults):
+            for fround, fbytes, fxorval in stateFaults:
+                assert 0 <= fbytes and fbytes <= 15, "Invalid fbytes value"
+                assert 1 <= fxorval and fxorval <= 255, "Invalid fxorval value"
+                if fround not in masks:
+                    masks[fround] = np.zeros((n, 16), dtype=np.uint8)
+                masks[fround][index, self.position[fround][fbytes]] ^= fxorval
+        return masks
+
+    def applyBatch(self, data):
+        if self.enc:
+            return self._encrypt(data, {})
+        else:
+            return self._decrypt(data, {})
+
+    def applyReverseBatch(self, data):
+        if not self.useReverse:
+            raise NotImplementedError("applyReverse must not be used if hasReverse returns False")
+        if self.enc:
+            return self._decrypt(data, {})
+        else:
+            return self._encrypt(data, {})
+
+    def applyFaultBatch(self, data, faults):
+        masks = self._faultMasks(len(data), faults)
+        if self.enc:
+            return self._encrypt(data, masks)
+        else:
+            return self._decrypt(data, masks)
+
+class WhiteBoxedAESBatchAutoTest(WhiteBoxedAESAutoTest, WhiteBoxedAESBatchTest):
+    # same fault position model as WhiteBoxedAESAutoTest
+
+    def applyFaultBatch(self, data, faults):
+        to_apply = []
+        for stateFaults in faults:
+            to_apply.append([])
+            for fround, fbytes, fxorval in stateFaults:
+                assert (fround, fbytes) in self.faultPosition, f"fault position for round {fround} byte {fbytes} is missing"
+
+                for (fround2, fbytes2) in self.faultPosition[(fround, fbytes)]:
+                    to_apply[-1].append((fround2, fbytes2, fxorval))
+
+        return super().applyFaultBatch(data, to_apply)
+
+# run with `python3 -m darkphoenixAES.test.WhiteBoxedAESBatchTest`
+
+def test():
+    for i in range(4):
+        for keylen in [16, 24, 32]:
+            key = random.randbytes(keylen)
+            aesEncoding = AESEncoded(key)
+
+            for enc in [True, False]:
+                wbRef = WhiteBoxedAESTest(aesEncoding, enc=enc)
+                wbBatch = WhiteBoxedAESBatchTest(aesEncoding, enc=enc)
+
+                data = [random.randbytes(16) for _ in range(16)]
+                faults = [[(random.randrange(aesEncoding.roundNumber), random.randrange(16),
+                            random.randrange(1, 256))] for _ in data]
+
+                assert wbBatch.applyBatch(toBatch(data)).tobytes() == b"".join([wbRef.apply(x) for x in data])
+                assert wbBatch.applyReverseBatch(toBatch(data)).tobytes() == \
+                        b"".join([wbRef.applyReverse(x) for x in data])
+                assert wbBatch.applyFaultBatch(toBatch(data), faults).tobytes() == \
+                        b"".join([wbRef.applyFault(x, f) for x, f in zip(data, faults)])
+                assert wbBatch.applyFault(data[0], faults[0]) == wbRef.applyFault(data[0], faults[0])
+
+    print("test OK")
+
+if __name__ == "__main__":
+    test()
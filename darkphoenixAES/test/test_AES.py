@@ -16,7 +16,7 @@
 # run with 'python3 -m darkphoenixAES.test.test_AES'
 
 import random
-from ..AES import AES, RoundType, expandKey, revertKey
+from ..AES import AES, RoundType, expandKey, revertKey, toBatch
 
 def test_AES():
     # test case : https://github.com/ircmaxell/quality-checker/blob/master/tmp/gh_18/PHP-PasswordLib-master/test/Data/Vectors/aes-ecb.test-vectors
@@ -50,6 +50,12 @@ def test_AES():
             for i in range(r):
                 assert c.decrypt_round(c.encrypt_round(bytes.fromhex(plain), i), i) == bytes.fromhex(plain)
 
+        for addExtraMC in [False, True]:
+            c = AES(random.randbytes(16), addExtraMC=addExtraMC, roundType=roundType)
+            data = [random.randbytes(16) for _ in range(16)]
+            assert c.encryptBatch(toBatch(data)).tobytes() == b"".join([c.encrypt(x) for x in data])
+            assert c.decryptBatch(toBatch(data)).tobytes() == b"".join([c.decrypt(x) for x in data])
+
     for l in [16, 24, 32]:
         for _ in range(16):
             key = random.randbytes(l)
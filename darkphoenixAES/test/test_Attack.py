@@ -16,16 +16,18 @@
 # run with 'python3 -m darkphoenixAES.test.test_Attack'
 
 from ..Attack import Attack
+from ..Pool import createPool
 from ..Exception import InvalidArgument, UnexpectedFailure, FaultPositionError, DarkPhoenixException
 from .AESEncoded import AESEncoded
 from .WhiteBoxedAESTest import WhiteBoxedAESTest
 from .WhiteBoxedAESAutoTest import WhiteBoxedAESAutoTest
+from .WhiteBoxedAESBatchTest import WhiteBoxedAESBatchTest, WhiteBoxedAESBatchAutoTest
 import argparse
 import os
 
 def test_Attack_core(key=None, encode=True, reverse=True, nprocess=None, doubleValue=False,
          beginFile=None, backupFile=None, seed=None, dynamic=False,
-         print_encoding=False):
+         print_encoding=False, batch=False, prefetch=False, pool=0):
 
     if key is None:
         key_len = 32
@@ -39,12 +41,19 @@ def test_Attack_core(key=None, encode=True, reverse=True, nprocess=None, doubleV
     aesEncoded = AESEncoded(key, encodingSeed=seed)
 
     if dynamic:
-        wb = WhiteBoxedAESAutoTest(aesEncoded, enc=encode, useReverse=reverse,
-                                   multiFault=(dynamic>1))
+        wbClass = WhiteBoxedAESBatchAutoTest if batch else WhiteBoxedAESAutoTest
+        newWB = lambda: wbClass(aesEncoded, enc=encode, useReverse=reverse, multiFault=(dynamic>1))
     else:
-        wb = WhiteBoxedAESTest(aesEncoded, enc=encode, useReverse=reverse)
+        wbClass = WhiteBoxedAESBatchTest if batch else WhiteBoxedAESTest
+        newWB = lambda: wbClass(aesEncoded, enc=encode, useReverse=reverse)
 
-    a = Attack(wb, nprocess=nprocess, step1DoubleValue=doubleValue)
+    if pool > 0:
+        # distinct instances of the same whitebox
+        wb = createPool([newWB() for _ in range(pool)])
+    else:
+        wb = newWB()
+
+    a = Attack(wb, nprocess=nprocess, step1DoubleValue=doubleValue, prefetch=prefetch)
 
     if beginFile is not None:
         a.restore(beginFile)
@@ -89,6 +98,11 @@ def test_Attack():
     parser.add_argument("--dynamic2", dest="dynamic", action='store_const', const=2)
     parser.add_argument("--static", dest="dynamic", action='store_false')
     parser.set_defaults(dynamic=False)
+    parser.add_argument("--batch", action='store_true')
+    parser.set_defaults(batch=False)
+    parser.add_argument("--prefetch", action='store_true')
+    parser.set_defaults(prefetch=False)
+    parser.add_argument("--pool", type=int, default=0)
     parser.add_argument("-p", "--process", type=int, default=None)
     parser.add_argument("-s", "--seed", type=int, default=None)
     parser.add_argument("--beginFile", type=str, default=None)
@@ -102,7 +116,8 @@ def test_Attack():
 
     test_Attack_core(key=args.key, encode=args.encode, reverse=args.reverse, nprocess=args.process,
          doubleValue=args.doubleValue, beginFile=args.beginFile, backupFile=args.backupFile,
-         seed=args.seed, dynamic=args.dynamic, print_encoding=args.print_encoding)
+         seed=args.seed, dynamic=args.dynamic, print_encoding=args.print_encoding,
+         batch=args.batch, prefetch=args.prefetch, pool=args.pool)
 
 if __name__ == "__main__":
     test_Attack()
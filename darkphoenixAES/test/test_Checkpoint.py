@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+# run with 'python3 -m darkphoenixAES.test.test_Checkpoint'
+
+from ..Checkpoint import encodeCheckpoint, decodeCheckpoint, writeCheckpoint, readCheckpoint
+from ..Journal import Journal
+from ..Exception import InvalidState
+import numpy as np
+import os
+import tempfile
+
+def test_Checkpoint():
+    arrays = {
+        "State": np.array(3, dtype=np.int64),
+        "r_s": np.array([[1, 2], [3, -1]], dtype=np.int8),
+        "M": np.random.randint(0, 256, size=(16, 256, 16), dtype=np.uint8),
+        "empty": np.zeros((0, 256), dtype=np.uint8),
+    }
+    data = encodeCheckpoint(arrays)
+    restored = decodeCheckpoint(data)
+    assert list(restored) == list(arrays)
+    for name in arrays:
+        assert restored[name].dtype == arrays[name].dtype
+        assert restored[name].shape == arrays[name].shape
+        assert np.array_equal(restored[name], arrays[name])
+
+    for corrupted in [data[:-1], data[:20], data[:-1] + bytes([data[-1] ^ 1])]:
+        try:
+            decodeCheckpoint(corrupted)
+            assert False, "a corrupted checkpoint was accepted"
+        except InvalidState:
+            pass
+    print("[OK] Checkpoint format")
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "backup")
+        writeCheckpoint(filename, arrays)
+        writeCheckpoint(filename, {"State": np.array(4, dtype=np.int64)})
+        assert os.listdir(directory) == ["backup"]
+        assert int(readCheckpoint(filename)["State"]) == 4
+    print("[OK] Checkpoint write")
+
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "backup.journal")
+        base = {"State": 1, "Mref": "00" * 16}
+        journal = Journal(filename)
+        journal.replay(base)
+        journal.record("step2", (3, 0), [0, None, "ab"])
+        journal.record("step3", 5, [1, ["0102"]])
+        journal.close()
+
+        # a crash during a write leaves a truncated record
+        with open(filename, 'ab') as f:
+            f.write(b"\x20\x00\x00\x00\x00")
+
+        journal = Journal(filename)
+        journal.replay(base)
+        assert journal.get("step2") == {(3, 0): [0, None, "ab"]}
+        assert journal.get("step3") == {5: [1, ["0102"]]}
+        journal.record("step3", 6, [2, ["0304"]])
+        journal.close()
+
+        journal = Journal(filename)
+        journal.replay(base)
+        assert len(journal.get("step3")) == 2
+
+        # another checkpoint, the entries are discarded
+        journal.replay({"State": 2, "Mref": "00" * 16})
+        assert journal.get("step3") == {}
+        journal.compact(base)
+        assert journal.get("step2") == {}
+        journal.close()
+    print("[OK] Journal")
+
+if __name__ == "__main__":
+    test_Checkpoint()
@@ -15,7 +15,8 @@
 
 # run with 'python3 -m darkphoenixAES.test.test_Encoding'
 
-from ..Encoding import Encoding8Random, EncodingGenerator, EncodeType
+from ..Encoding import Encoding8Random, Encoding8Affine, Encoding8, EncodingGenerator, EncodeType
+import numpy as np
 import random
 
 def test_Encoding():
@@ -43,5 +44,24 @@ def test_Encoding():
             assert obj1.encode(obj2.encode(data)) == obj12.encode(data)
     print("[OK] Encoding combine")
 
+    for _ in range(32):
+        obj = EncodingGenerator(16, EncodeType.RANDOM)
+        data = [random.randbytes(16) for _ in range(32)]
+        encoded = obj.encode(b"".join(data))
+        assert encoded == b"".join([obj.encode(x) for x in data])
+        assert obj.encodeBatch(np.frombuffer(b"".join(data), dtype=np.uint8).reshape(-1, 16)).tobytes() == encoded
+        assert obj.getInverseEncoding().encode(encoded) == b"".join(data)
+        assert obj.decode(encoded) == b"".join(data)
+    print("[OK] Encoding batch")
+
+    for _ in range(32):
+        obj1 = Encoding8Affine()
+        obj2 = Encoding8Affine()
+        obj12 = obj1.combine(obj2)
+        assert obj12.isAffine()
+        assert obj12.getEncodeTable() == Encoding8(obj1.getEncodeTable()).combine(obj2).getEncodeTable()
+        assert obj1.getInverseEncoding().combine(obj1).getEncodeTable() == list(range(256))
+    print("[OK] Encoding8Affine")
+
 if __name__ == '__main__':
     test_Encoding()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+# run with 'python3 -m darkphoenixAES.test.test_ForkServer'
+
+from ..ForkServer import WhiteBoxedAESForkServer
+from ..Exception import WhiteBoxError
+import multiprocessing as mp
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# A toy target: out[i] = tables[i][in[i]], with a random permutation by byte.
+# The fault (0, i) xors the table i, the output byte i is xored with the fault
+# value. The faults (1, 0) and (1, 1) set the flags crash and loop.
+TARGET_SOURCE = r"""
+#include <stdio.h>
+#include <string.h>
+
+const unsigned char tables[16][256] = { %s };
+volatile unsigned char crash = 0;
+volatile unsigned char loop = 0;
+
+int main(int argc, char **argv) {
+    char hex[33] = {0};
+    unsigned int i, x;
+    if (argc > 1)
+        strncpy(hex, argv[1], 32);
+    else if (fread(hex, 1, 32, stdin) != 32)
+        return 1;
+    if (crash)
+        *(volatile int *) 0 = 0;
+    while (loop)
+        ;
+    for (i = 0; i < 16; i++) {
+        sscanf(hex + 2 * i, "%%2x", &x);
+        printf("%%02x", tables[i][x]);
+    }
+    printf("\n");
+    return 0;
+}
+"""
+
+def getSymbol(executable, name):
+    out = subprocess.run(["nm", executable], stdout=subprocess.PIPE, check=True).stdout.decode()
+    for line in out.splitlines():
+        parts = line.split()
+        if len(parts) == 3 and parts[2] == name:
+            return int(parts[0], 16)
+    raise KeyError(name)
+
+localWB = None
+def init_localWB(wb):
+    global localWB
+    wb.newThread()
+    localWB = wb
+
+def applyProxy(data):
+    return localWB.apply(data)
+
+def test_ForkServer():
+    if not sys.platform.startswith("linux") or shutil.which("cc") is None or shutil.which("nm") is None:
+        print("[SKIP] ForkServer (needs Linux, cc and nm)")
+        return
+
+    tables = [random.sample(range(256), 256) for _ in range(16)]
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "target.c")
+        executable = os.path.join(directory, "target")
+        with open(source, 'w') as f:
+            f.write(TARGET_SOURCE % ", ".join(["{" + ", ".join(map(str, t)) + "}" for t in tables]))
+        subprocess.run(["cc", "-O1", "-o", executable, source], check=True)
+
+        offset = getSymbol(executable, "tables")
+        faultPatches = {(0, i): (offset + 256 * i, 256) for i in range(16)}
+        faultPatches[(1, 0)] = getSymbol(executable, "crash")
+        faultPatches[(1, 1)] = getSymbol(executable, "loop")
+
+        for args in [[executable], [executable, "{input}"]]:
+            wb = WhiteBoxedAESForkServer(args, 10, True, faultPatches, timeout=2)
+            for _ in range(16):
+                data = random.randbytes(16)
+                expect = bytes([t[x] for t, x in zip(tables, data)])
+                assert wb.apply(data) == expect
+                i, fval = random.randrange(16), random.randrange(1, 256)
+                faulted = bytearray(expect)
+                faulted[i] ^= fval
+                assert wb.applyFault(data, [(0, i, fval)]) == faulted
+            # the patch is only applied on one child
+            assert wb.apply(data) == expect
+
+            for fault in [(1, 0, 1), (1, 1, 1)]:
+                try:
+                    wb.applyFault(data, [fault])
+                    assert False, "the fault should fail"
+                except WhiteBoxError:
+                    pass
+            assert wb.apply(data) == expect
+
+            # each worker starts its own forkserver
+            inputs = [random.randbytes(16) for _ in range(8)]
+            with mp.Pool(processes=2, initializer=init_localWB, initargs=[wb]) as pool:
+                assert pool.map(applyProxy, inputs) == [wb.apply(x) for x in inputs]
+            wb.close()
+    print("[OK] ForkServer")
+
+if __name__ == "__main__":
+    test_ForkServer()
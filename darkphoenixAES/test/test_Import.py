@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+# run with 'python3 -m darkphoenixAES.test.test_Import'
+
+from ..GF256 import mul, inv, div, mulArray, invArray, divArray
+from ..MultTable import MultTable, InvTable
+import numpy as np
+import os
+import subprocess
+import sys
+
+# time budget (in seconds) for `import darkphoenixAES` in a new interpreter,
+# beyond the time of `import numpy` in the same interpreter. numpy takes most
+# of the time and depends on the machine. The budget can be changed with the
+# environment variable IMPORT_TIME_BUDGET_ENV.
+IMPORT_TIME_BUDGET = 0.25
+IMPORT_TIME_BUDGET_ENV = "DARKPHOENIX_IMPORT_BUDGET"
+
+# modules that must only be imported when the attack runs
+DEFERRED_MODULES = ["tqdm", "darkphoenixAES.Step1", "darkphoenixAES.Step2",
+                    "darkphoenixAES.Step3", "darkphoenixAES.Step4",
+                    "darkphoenixAES.Step5", "darkphoenixAES.MeetITM"]
+
+_IMPORT_SCRIPT = """
+import sys, time
+t = time.perf_counter()
+import numpy
+print(time.perf_counter() - t)
+t = time.perf_counter()
+import darkphoenixAES
+print(time.perf_counter() - t)
+print(",".join(m for m in {} if m in sys.modules))
+"""
+
+def _slowMult(x, y):
+    r = 0
+    while y:
+        if y & 1:
+            r ^= x
+        x = ((x << 1) ^ (0x1b if x & 0x80 else 0)) & 0xff
+        y >>= 1
+    return r
+
+def test_Import():
+    for x in range(256):
+        for y in range(256):
+            assert mul(x, y) == _slowMult(x, y), "GF256 mul error"
+    for x in range(1, 256):
+        assert mul(x, inv(x)) == 1, "GF256 inv error"
+        assert div(x, x) == 1, "GF256 div error"
+
+    x = np.arange(256, dtype=np.uint8)
+    assert (mulArray(x[:, None], x[None, :]) == np.array(MultTable)).all(), "GF256 mulArray error"
+    assert (mulArray(x[1:], invArray(x[1:])) == 1).all(), "GF256 invArray error"
+    assert (divArray(x[1:], x[1:]) == 1).all(), "GF256 divArray error"
+    assert InvTable[0] is None and list(InvTable[1:]) == invArray(x[1:]).tolist()
+    print("[OK] GF256")
+
+    script = _IMPORT_SCRIPT.format(DEFERRED_MODULES)
+    # first run to compile the modules
+    subprocess.run([sys.executable, "-c", script], check=True, capture_output=True)
+    res = subprocess.run([sys.executable, "-c", script], check=True, capture_output=True)
+    numpyTime, importTime, loaded = res.stdout.decode().splitlines()
+    numpyTime, importTime = float(numpyTime), float(importTime)
+
+    assert loaded == "", f"modules imported with the package: {loaded}"
+    budget = float(os.environ.get(IMPORT_TIME_BUDGET_ENV, IMPORT_TIME_BUDGET))
+    assert importTime < budget, \
+        f"import takes {importTime:.3f}s after numpy ({numpyTime:.3f}s), budget {budget:.3f}s"
+    print(f"[OK] Import ({importTime:.3f}s after numpy {numpyTime:.3f}s)")
+
+if __name__ == "__main__":
+    test_Import()
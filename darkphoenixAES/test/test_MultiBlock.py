@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+# run with 'python3 -m darkphoenixAES.test.test_MultiBlock'
+
+from ..AES import toBatch
+from ..MultiBlock import WhiteBoxedAESMultiBlock
+from ..WhiteBoxedAESProxy import WhiteBoxedAESProxy
+from .. import Step1
+from .AESEncoded import AESEncoded
+from .WhiteBoxedAESTest import WhiteBoxedAESTest
+from .WhiteBoxedAESBatchTest import WhiteBoxedAESBatchTest
+import random
+
+class WhiteBoxedAESMultiBlockTest(WhiteBoxedAESMultiBlock):
+    # an ECB target over WhiteBoxedAESBatchTest, that counts its invocations
+
+    def __init__(self, aesEncoded, enc=True, maxBlocks=64):
+        self.wb = WhiteBoxedAESBatchTest(aesEncoded, enc=enc, useReverse=False)
+        self.maxBlocks = maxBlocks
+        self.invocations = 0
+
+    def getRoundNumber(self):
+        return self.wb.getRoundNumber()
+
+    def isEncrypt(self):
+        return self.wb.isEncrypt()
+
+    def hasReverse(self):
+        return False
+
+    def getMaxBlocks(self):
+        return self.maxBlocks
+
+    def applyBlocks(self, data):
+        assert 1 <= len(data) // 16 <= self.maxBlocks
+        self.invocations += 1
+        return self.wb.applyBatch(toBatch(data)).tobytes()
+
+    def applyFaultBlocks(self, data, faults):
+        assert 1 <= len(data) // 16 <= self.maxBlocks
+        self.invocations += 1
+        return self.wb.applyFaultBatch(toBatch(data), [faults] * (len(data) // 16)).tobytes()
+
+def test_MultiBlock():
+    for keylen in [16, 32]:
+        aesEncoded = AESEncoded(random.randbytes(keylen))
+        for enc in [True, False]:
+            wbRef = WhiteBoxedAESTest(aesEncoded, enc=enc, useReverse=False)
+            wb = WhiteBoxedAESMultiBlockTest(aesEncoded, enc=enc)
+
+            data = [random.randbytes(16) for _ in range(150)]
+            assert wb.apply(data[0]) == wbRef.apply(data[0])
+            wb.invocations = 0
+            assert wb.applyBatch(toBatch(data)).tobytes() == b"".join([wbRef.apply(x) for x in data])
+            assert wb.invocations == 3
+
+            # 3 fault configurations and the blocks without fault
+            configs = [[], [(5, 3, 17)], [(7, 0, 1)], [(7, 0, 2)]]
+            faults = [random.choice(configs) for _ in data]
+            wb.invocations = 0
+            assert wb.applyFaultBatch(toBatch(data), faults).tobytes() == \
+                    b"".join([wbRef.applyFault(x, f) for x, f in zip(data, faults)])
+            assert wb.invocations == sum([-(-faults.count(c) // 64) for c in configs])
+            assert wb.applyFault(data[1], faults[1]) == wbRef.applyFault(data[1], faults[1])
+
+    # the bruteforce of Step1 with the packed invocations
+    proxy = WhiteBoxedAESProxy(wb, True)
+    mref = proxy.getRandomInput()
+    M, r_s = Step1.compute(proxy, mref, 0, True, False)
+    Step1.verify(proxy, mref, M, r_s, True)
+    print("[OK] MultiBlock")
+
+if __name__ == "__main__":
+    test_MultiBlock()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+# run with 'python3 -m darkphoenixAES.test.test_Pool'
+
+from ..AES import toBatch
+from ..Exception import WhiteBoxError
+from ..Pool import createPool, WhiteBoxedAESPool, WhiteBoxedAESPoolAuto
+from .AESEncoded import AESEncoded
+from .WhiteBoxedAESTest import WhiteBoxedAESTest
+from .WhiteBoxedAESAutoTest import WhiteBoxedAESAutoTest
+import multiprocessing as mp
+import random
+import time
+
+class WhiteBoxedAESPoolTest(WhiteBoxedAESTest):
+    # counts the queries, can be slow, broken, or crash with the fault value 255
+
+    def __init__(self, aesEncoded, delay=0):
+        super().__init__(aesEncoded, useReverse=False)
+        self.delay = delay
+        self.broken = False
+        self.queries = 0
+
+    def apply(self, data):
+        self.queries += 1
+        time.sleep(self.delay)
+        if self.broken:
+            raise WhiteBoxError("Device not available")
+        return super().apply(data)
+
+    def applyFault(self, data, faults):
+        if any([fxorval == 255 for _, _, fxorval in faults]):
+            raise WhiteBoxError("The target crashes")
+        self.queries += 1
+        time.sleep(self.delay)
+        if self.broken:
+            raise WhiteBoxError("Device not available")
+        return super().applyFault(data, faults)
+
+def breakInstance(pool, index):
+    # in another process: the failures retire the instance
+    pool.newThread()
+    pool.instances[index].broken = True
+    for _ in range(8):
+        pool.apply(bytes(16))
+
+def test_Pool():
+    aesEncoded = AESEncoded(random.randbytes(16))
+    wbRef = WhiteBoxedAESTest(aesEncoded, useReverse=False)
+    data = [random.randbytes(16) for _ in range(64)]
+
+    # the queries go to the fastest instance, the batches are split
+    instances = [WhiteBoxedAESPoolTest(aesEncoded, delay=d) for d in [0.004, 0, 0.001]]
+    pool = createPool(instances)
+    assert type(pool) is WhiteBoxedAESPool
+    for x in data:
+        assert pool.apply(x) == wbRef.apply(x)
+    assert instances[1].queries > 48
+    assert pool.applyBatch(toBatch(data)).tobytes() == b"".join([wbRef.apply(x) for x in data])
+    assert pool.applyFaultSweep(data[0], 7, 3, range(1, 255)) == \
+            [wbRef.applyFault(data[0], [(7, 3, v)]) for v in range(1, 255)]
+    assert all([wb.queries > 0 for wb in instances])
+
+    # a fault that crashes every instance isn't a failure of the instances
+    for _ in range(4):
+        try:
+            pool.applyFault(data[0], [(7, 3, 255)])
+            assert False, "the fault should fail"
+        except WhiteBoxError:
+            pass
+    assert pool.getActive() == [0, 1, 2]
+
+    # a broken instance is retired, its queries are done by the others
+    instances[1].broken = True
+    for x in data:
+        assert pool.applyFault(x, [(5, 1, 3)]) == wbRef.applyFault(x, [(5, 1, 3)])
+    assert pool.getActive() == [0, 2]
+
+    # the retirement is shared with the forked processes
+    p = mp.Process(target=breakInstance, args=(pool, 2))
+    p.start()
+    p.join()
+    assert pool.getActive() == [0]
+    # the last instance is never retired
+    instances[0].broken = True
+    for _ in range(4):
+        try:
+            pool.apply(data[0])
+            assert False, "the query should fail"
+        except WhiteBoxError:
+            pass
+    assert pool.getActive() == [0]
+
+    # the fault positions chosen by the leader are copied to the others
+    instances = [WhiteBoxedAESAutoTest(aesEncoded, useReverse=False) for _ in range(3)]
+    pool = createPool(instances)
+    assert type(pool) is WhiteBoxedAESPoolAuto
+    for fbytes in range(16):
+        pool.changeFaultPosition(8, fbytes)
+    assert all([wb.faultPosition == instances[0].faultPosition for wb in instances])
+    assert len(set([pool.applyFault(data[0], [(8, 4, 7)]) for _ in range(8)])) == 1
+    pool.removeFaultPosition(8, 4)
+    assert all([(8, 4) not in wb.faultPosition for wb in instances])
+    print("[OK] Pool")
+
+if __name__ == "__main__":
+    test_Pool()
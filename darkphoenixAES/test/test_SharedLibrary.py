@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+# run with 'python3 -m darkphoenixAES.test.test_SharedLibrary'
+
+from ..SharedLibrary import WhiteBoxedAESLibrary
+import numpy as np
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# A toy library: out[i] = tables[i][in[i]], with a random permutation by byte.
+# The fault (fround, fbytes, value) xors the output byte fbytes with value.
+LIBRARY_SOURCE = r"""
+#include <stddef.h>
+#include <stdint.h>
+#include <string.h>
+
+static const uint8_t tables[16][256] = { %s };
+
+static void block(const uint8_t *in, uint8_t *out, int fbytes, uint8_t value) {
+    uint8_t state[16];
+    int i;
+    for (i = 0; i < 16; i++)
+        state[i] = tables[i][in[i]];
+    if (fbytes >= 0)
+        state[fbytes] ^= value;
+    memcpy(out, state, 16);
+}
+
+void wb(const uint8_t *in, uint8_t *out) { block(in, out, -1, 0); }
+void wbFault(const uint8_t *in, uint8_t *out, int fround, int fbytes, uint8_t value) {
+    block(in, out, fbytes, value);
+}
+
+void wbInplace(uint8_t *state) { block(state, state, -1, 0); }
+void wbInplaceFault(uint8_t *state, int fround, int fbytes, uint8_t value) {
+    block(state, state, fbytes, value);
+}
+
+void wbMulti(const uint8_t *in, uint8_t *out, size_t n) {
+    size_t i;
+    for (i = 0; i < n; i++)
+        block(in + 16 * i, out + 16 * i, -1, 0);
+}
+void wbMultiFault(const uint8_t *in, uint8_t *out, size_t n,
+                  const int32_t *frounds, const int32_t *fbytes, const uint8_t *values) {
+    size_t i;
+    for (i = 0; i < n; i++)
+        block(in + 16 * i, out + 16 * i, values[i] == 0 ? -1 : fbytes[i], values[i]);
+}
+"""
+
+def test_SharedLibrary():
+    if not sys.platform.startswith("linux") or shutil.which("cc") is None:
+        print("[SKIP] SharedLibrary (needs Linux and cc)")
+        return
+
+    tables = [random.sample(range(256), 256) for _ in range(16)]
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "wb.c")
+        library = os.path.join(directory, "wb.so")
+        with open(source, 'w') as f:
+            f.write(LIBRARY_SOURCE % ", ".join(["{" + ", ".join(map(str, t)) + "}" for t in tables]))
+        subprocess.run(["cc", "-shared", "-fPIC", "-O1", "-o", library, source], check=True)
+
+        layouts = [("wb", "wbFault", False, False),
+                   ("wbInplace", "wbInplaceFault", True, False),
+                   ("wbMulti", "wbMultiFault", False, True)]
+        for symbol, faultSymbol, inplace, multiBlock in layouts:
+            wb = WhiteBoxedAESLibrary(library, symbol, faultSymbol, 10, True,
+                                      inplace=inplace, multiBlock=multiBlock, nthread=4)
+            data = [random.randbytes(16) for _ in range(200)]
+            expect = [bytes([t[x] for t, x in zip(tables, d)]) for d in data]
+            faults = [[(8, random.randrange(16), random.randrange(1, 256))] if i % 3 else []
+                      for i in range(len(data))]
+            faulted = []
+            for e, f in zip(expect, faults):
+                e = bytearray(e)
+                for _, fbytes, fval in f:
+                    e[fbytes] ^= fval
+                faulted.append(bytes(e))
+
+            assert [wb.apply(d) for d in data] == expect
+            assert [wb.applyFault(d, f) for d, f in zip(data, faults)] == faulted
+            assert wb.applyBatch(b"".join(data)).tobytes() == b"".join(expect)
+            assert wb.applyFaultBatch(b"".join(data), faults).tobytes() == b"".join(faulted)
+
+            # the result is written in the given buffer
+            out = bytearray(16 * len(data))
+            wb.applyBatch(bytearray(b"".join(data)), out=out)
+            assert bytes(out) == b"".join(expect)
+
+            sweep = wb.applyFaultSweep(data[0], 8, 5, range(1, 256))
+            assert sweep == [wb.applyFault(data[0], [(8, 5, v)]) for v in range(1, 256)]
+
+            # a worker process uses one thread
+            wb.newThread()
+            assert wb.nthread == 1
+            assert wb.applyBatch(b"".join(data)).tobytes() == b"".join(expect)
+    print("[OK] SharedLibrary")
+
+if __name__ == "__main__":
+    test_SharedLibrary()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+# -----------------------------------------------------------------------------
+# Copyright (C) Quarkslab. See README.md for details.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the Apache License as published by
+# the Apache Software Foundation, either version 2.0 of the License.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.txt for the text of the Apache license.
+# -----------------------------------------------------------------------------
+
+# run with 'python3 -m darkphoenixAES.test.test_Step1'
+
+from ..AES import toBatch
+from .. import Step1
+import random
+
+class WhiteBoxedAESPairTest:
+    # A fake whitebox for the doubleRS bruteforce. The input n (big endian) is
+    # mapped to the output ref, except in each column:
+    # - n in [0, 256): the rows 0 and 1 are (n, n ^ 0x55),
+    # - n in [256, 512): the rows 2 and 3 are (n, n ^ 0x55).
+    # The 512 first inputs are enough to fill every row of RS[0].
+
+    def __init__(self):
+        self.ref = random.randbytes(16)
+
+    def hasReverse(self):
+        return False
+
+    def apply(self, data):
+        n = int.from_bytes(data, 'big')
+        if n == MREF:
+            return self.ref
+        assert n < 512, "The bruteforce should have found every input"
+        out = bytearray(self.ref)
+        rows = (0, 1) if n < 256 else (2, 3)
+        for c in range(4):
+            out[c*4+rows[0]] = n % 256
+            out[c*4+rows[1]] = (n % 256) ^ 0x55
+        return bytes(out)
+
+    def applyBatch(self, data):
+        return toBatch(b"".join([self.apply(x.tobytes()) for x in data]))
+
+MREF = 1 << 64
+
+def test_Step1():
+    # the input of a (b1, b2) match fills the rows a1 and a2
+    wb = WhiteBoxedAESPairTest()
+    mref = MREF.to_bytes(16, 'big')
+    M, r_s = Step1.compute(wb, mref, 0, True, True)
+    Step1.verify(wb, mref, M, r_s, True)
+    print("[OK] Step1 doubleRS")
+
+if __name__ == "__main__":
+    test_Step1()
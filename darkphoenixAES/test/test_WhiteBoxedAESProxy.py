@@ -16,8 +16,11 @@
 # run with 'python3 -m darkphoenixAES.test.test_WhiteBoxedAESProxy'
 
 from .WhiteBoxedAESTest import WhiteBoxedAESTest
+from .WhiteBoxedAESBatchTest import WhiteBoxedAESBatchTest
 from .AESEncoded import AESEncoded
-from ..WhiteBoxedAESProxy import WhiteBoxedAESProxy
+from ..WhiteBoxedAESProxy import WhiteBoxedAESProxy, WhiteBoxedReverseRound
+from ..AES import InvShiftRow, ShiftRow, InvMC, MC, toBatch
+from ..Encoding import EncodingGenerator, EncodeType
 import random
 
 def test_WhiteBoxedAESProxy():
@@ -29,6 +32,111 @@ def test_WhiteBoxedAESProxy():
         WhiteBoxedAESProxy(WhiteBoxedAESTest(aesEncoded, enc=False), None).selfTest()
     print("[OK] WhiteBoxedAESProxy")
 
+def reverseRoundRef(encrypt, outputF, reverseMC, data):
+    data = InvShiftRow(data) if encrypt else ShiftRow(data)
+    for num, perm in enumerate(outputF):
+        data = perm.encode(data)
+        if reverseMC or num < len(outputF) - 1:
+            data = InvShiftRow(InvMC(data)) if encrypt else ShiftRow(MC(data))
+    return data
+
+def test_WhiteBoxedReverseRound():
+    outputF = [EncodingGenerator(16, EncodeType.RANDOM) for _ in range(3)]
+    for encrypt in [True, False]:
+        for reverseMC in [True, False]:
+            reverseRound = WhiteBoxedReverseRound(encrypt, outputF=outputF, reverseMC=reverseMC)
+            data = [random.randbytes(16) for _ in range(16)]
+            expect = [reverseRoundRef(encrypt, outputF, reverseMC, x) for x in data]
+
+            assert [reverseRound(x) for x in data] == expect
+            assert [x.tobytes() for x in reverseRound.batch(data)] == expect
+    print("[OK] WhiteBoxedReverseRound")
+
+def test_WhiteBoxedAESApplyFault():
+    # the default applyFault (with the cache of the prefix states) must match
+    # the fast implementation of the test whitebox
+    aesEncoded = AESEncoded(random.randbytes(16))
+    for encrypt in [True, False]:
+        fast = WhiteBoxedAESTest(aesEncoded, enc=encrypt, fast=True)
+        slow = WhiteBoxedAESTest(aesEncoded, enc=encrypt, fast=False)
+        rounds = []
+        applyRound = slow.applyRound
+        slow.applyRound = lambda data, roundN: rounds.append(roundN) or applyRound(data, roundN)
+
+        data = [random.randbytes(16) for _ in range(4)]
+        for _ in range(64):
+            faults = [(random.randrange(10), random.randrange(16), random.randrange(1, 256))]
+            x = random.choice(data)
+            assert slow.applyFault(x, faults) == fast.applyFault(x, faults)
+
+        rounds.clear()
+        for fval in range(1, 256):
+            slow.applyFault(data[0], [(8, 3, fval)])
+        assert len(rounds) <= 8 + 2 * 255
+    print("[OK] WhiteBoxedAES.applyFault")
+
+class WhiteBoxedAESSnapshotTest(WhiteBoxedAESTest):
+    # the snapshot is the state before the round, the suffix applies the
+    # next rounds
+
+    def __init__(self, aesEncoded, enc=True):
+        super().__init__(aesEncoded, enc=enc, fast=False)
+        self.openSnapshot = 0
+
+    def hasSnapshot(self):
+        return True
+
+    def applyPrefix(self, data, fround):
+        self.openSnapshot += 1
+        state = data
+        for roundN in range(fround):
+            state = self.applyRound(state, roundN)
+        return (fround, state)
+
+    def applySuffix(self, snapshot, faults):
+        fround, state = snapshot
+        for roundN in range(fround, self.getRoundNumber()):
+            state = list(state)
+            for fround2, fbytes, fxorval in faults:
+                assert fround2 >= fround, "fault before the snapshot"
+                if fround2 == roundN:
+                    state[fbytes] ^= fxorval
+            state = self.applyRound(bytes(state), roundN)
+        return bytes(state)
+
+    def releaseSnapshot(self, snapshot):
+        self.openSnapshot -= 1
+
+def test_WhiteBoxedAESSnapshot():
+    aesEncoded = AESEncoded(random.randbytes(16))
+    for encrypt in [True, False]:
+        realWB = WhiteBoxedAESSnapshotTest(aesEncoded, enc=encrypt)
+        ref = WhiteBoxedAESProxy(WhiteBoxedAESTest(aesEncoded, enc=encrypt), None)
+        wb = WhiteBoxedAESProxy(realWB, None)
+        data = random.randbytes(16)
+        with wb.prefix(data, 8) as snapshot:
+            for fval in range(1, 256):
+                fault = [(8, fval % 16, fval)]
+                assert wb.applySuffix(snapshot, fault) == ref.applyFault(data, fault)
+        expect = [ref.applyFault(data, [(8, 5, fval)]) for fval in range(1, 256)]
+        assert wb.applyFaultSweep(data, 8, 5, range(1, 256)) == expect
+        assert ref.applyFaultSweep(data, 8, 5, range(1, 256)) == expect
+        assert list(wb.iterFaultSweep(data, 8, 5, range(1, 256))) == expect
+        # the first value alone doesn't need the sweep
+        assert next(wb.iterFaultSweep(data, 8, 5, range(1, 256))) == expect[0]
+        assert realWB.openSnapshot == 0
+
+        # the default applyFaultBatch, and the sweep with an overridden one
+        refWB = WhiteBoxedAESTest(aesEncoded, enc=encrypt)
+        rawExpect = [refWB.applyFault(data, [(8, 5, fval)]) for fval in range(1, 256)]
+        assert refWB.applyFaultBatch(toBatch([data] * 255), [[(8, 5, fval)] for fval in range(1, 256)]).tobytes() == \
+                b"".join(rawExpect)
+        assert WhiteBoxedAESBatchTest(aesEncoded, enc=encrypt).applyFaultSweep(data, 8, 5, range(1, 256)) == rawExpect
+    print("[OK] WhiteBoxedAES snapshot and sweep")
+
 if __name__ == "__main__":
     test_WhiteBoxedAESProxy()
+    test_WhiteBoxedReverseRound()
+    test_WhiteBoxedAESApplyFault()
+    test_WhiteBoxedAESSnapshot()
 